@@ -3,18 +3,18 @@
 Análise detalhada da estrutura do PDF IBGE para identificar as tabelas
 """
 
-import PyPDF2
 import re
 
+from ibge_page_source import IBGEPageSource
+
 def analyze_pdf_structure():
     """Analisa a estrutura das tabelas no PDF"""
     pdf_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\taco-ibge-extractor\src\main\resources\META-INF\resources\taco\liv50002.pdf"
     
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
+    with IBGEPageSource(pdf_path) as page_source:
         
         print(f"=== ANÁLISE DA ESTRUTURA DO PDF IBGE ===")
-        print(f"Total de páginas: {len(pdf_reader.pages)}")
+        print(f"Total de páginas: {page_source.page_count}")
         
         # Analisar diferentes faixas de páginas
         page_ranges = [
@@ -33,9 +33,8 @@ def analyze_pdf_structure():
             sample_pages = [start, start + 5, start + 10]
             
             for page_num in sample_pages:
-                if page_num < len(pdf_reader.pages):
-                    page = pdf_reader.pages[page_num]
-                    text = page.extract_text()
+                if page_num < page_source.page_count:
+                    text = page_source.get_page_text(page_num)
                     
                     print(f"\n--- PÁGINA {page_num + 1} ---")
                     
@@ -61,8 +60,7 @@ def find_table_boundaries():
     """Encontra os limites exatos das tabelas"""
     pdf_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\taco-ibge-extractor\src\main\resources\META-INF\resources\taco\liv50002.pdf"
     
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
+    with IBGEPageSource(pdf_path) as page_source:
         
         print(f"\n{'='*50}")
         print(f"MAPEAMENTO DETALHADO DAS TABELAS")
@@ -70,9 +68,7 @@ def find_table_boundaries():
         
         table_info = {}
         
-        for page_num in range(30, min(250, len(pdf_reader.pages))):
-            page = pdf_reader.pages[page_num]
-            text = page.extract_text()
+        for page_num, text, error in page_source.iter_pages(30, 250):
             
             # Identificar início de tabelas
             table_matches = re.findall(r'Tabela (\d+)[^\n]*', text, re.IGNORECASE)
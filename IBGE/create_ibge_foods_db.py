@@ -4,9 +4,115 @@ Criador de base de dados com alimentos do IBGE
 Baseado na estrutura da Tabela de Composição Nutricional dos Alimentos Consumidos no Brasil
 """
 
-import json
+import hashlib
+import re
 import sqlite3
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ibge_json_stream import write_streamed_document
+
+# Pragmas da carga em massa: journal em memória (o ROLLBACK de uma carga com falha ainda restaura a base;
+# com journal_mode = OFF o resultado seria indefinido) e sem fsync
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA cache_size = -65536",  # 64 MB
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Colunas de nutrientes da tabela foods -> atributo nos nutrientes de IBGECompleteFood / IBGEFixedFood.
+# União das duas extrações: colunas que um extrator não tem ficam NULL.
+NUTRIENT_COLUMNS = (
+    ("energy_kcal", "energia_kcal"),
+    ("energy_kj", "energia_kj"),
+    ("protein_g", "proteina_g"),
+    ("lipids_g", "lipidios_g"),
+    ("carbohydrates_g", "carboidrato_g"),
+    ("available_carbohydrates_g", "carboidrato_disponivel_g"),
+    ("dietary_fiber_g", "fibra_alimentar_g"),
+    ("soluble_fiber_g", "fibra_solavel_g"),
+    ("insoluble_fiber_g", "fibra_insolavel_g"),
+    ("ash_g", "cinzas_g"),
+    ("cholesterol_mg", "colesterol_mg"),
+    ("saturated_fat_g", "acidos_saturados_g"),
+    ("monounsaturated_fat_g", "acidos_monoinsaturados_g"),
+    ("polyunsaturated_fat_g", "acidos_poliinsaturados_g"),
+    ("linoleic_acid_g", "acidos_linoleico_g"),
+    ("linolenic_acid_g", "acidos_linolenico_g"),
+    ("trans_fat_g", "acidos_trans_g"),
+    ("total_sugar_g", "acucar_total_g"),
+    ("added_sugar_g", "acucar_adicao_g"),
+    ("calcium_mg", "calcio_mg"),
+    ("magnesium_mg", "magnesio_mg"),
+    ("manganese_mg", "manganes_mg"),
+    ("phosphorus_mg", "fosforo_mg"),
+    ("iron_mg", "ferro_mg"),
+    ("sodium_mg", "sodio_mg"),
+    ("potassium_mg", "potassio_mg"),
+    ("copper_mg", "cobre_mg"),
+    ("zinc_mg", "zinco_mg"),
+    ("selenium_mcg", "selenio_mcg"),
+    ("retinol_mcg", "retinol_mcg"),
+    ("re_mcg", "re_mcg"),
+    ("vitamin_a_rae_mcg", "vitamina_a_rae_mcg"),
+    ("thiamine_mg", "tiamina_mg"),
+    ("riboflavin_mg", "riboflavina_mg"),
+    ("pyridoxine_mg", "piridoxina_mg"),
+    ("niacin_mg", "niacina_mg"),
+    ("vitamin_c_mg", "vitamina_c_mg"),
+    ("folate_mcg", "folato_mcg"),
+    ("vitamin_b12_mcg", "vitamina_b12_mcg"),
+    ("vitamin_d_mcg", "vitamina_d_mcg"),
+    ("vitamin_e_mg", "vitamina_e_mg"),
+)
+
+# Mesmo nutriente com outro nome em uma das extrações (o extrator corrigido usa rae_mcg)
+NUTRIENT_ALIASES = {"vitamina_a_rae_mcg": ("rae_mcg",)}
+
+# Linhas lidas do cursor por vez na exportação
+EXPORT_BATCH_SIZE = 500
+
+# Macronutrientes exportados no bloco "macronutrients" do JSON
+MACRONUTRIENT_COLUMNS = ("energy_kcal", "protein_g", "lipids_g", "carbohydrates_g", "dietary_fiber_g")
+
+# Busca textual: acentos removidos no índice e na consulta, prefixos de 2 a 4 letras indexados
+SEARCH_TOKENIZER = "unicode61 remove_diacritics 2"
+SEARCH_PREFIXES = "2 3 4"
+
+# Pesos do bm25 para (name, preparation, group_name)
+SEARCH_WEIGHTS = (10.0, 2.0, 1.0)
+
+# Dimensões do índice R*Tree de faixas de nutrientes (o módulo rtree aceita até 5)
+RANGE_INDEX_COLUMNS = ("energy_kcal", "protein_g", "lipids_g", "carbohydrates_g", "sodium_mg")
+
+# Valores ausentes ocupam a dimensão inteira no R*Tree (dentro do limite de float32)
+RANGE_UNBOUNDED = 3.0e38
+
+# Nutrientes agregados por grupo em food_group_stats (contagem, soma, mínimo e máximo; média = soma / contagem)
+STATS_COLUMNS = MACRONUTRIENT_COLUMNS
+
+# Gatilhos que mantêm food_group_stats e os índices foods_search / foods_ranges; removidos durante a carga em massa
+STATS_TRIGGERS = ("foods_stats_insert", "foods_stats_delete", "foods_stats_update")
+INDEX_TRIGGERS = ("foods_index_insert", "foods_index_delete", "foods_index_update")
+
+FOOD_COLUMNS = ("code", "preparation_code", "name", "preparation", "group_id") + tuple(
+    column for column, _ in NUTRIENT_COLUMNS) + ("content_hash",)
+
+# Upsert pela chave (code, preparation_code): só regrava a linha se o hash do conteúdo mudou,
+# preservando o id (e, com ele, as linhas dos índices textual e de faixas)
+UPSERT_FOOD_SQL = '''
+        INSERT INTO foods ({columns})
+        VALUES ({placeholders})
+        ON CONFLICT (code, preparation_code) DO UPDATE SET
+            {updates}
+        WHERE foods.content_hash IS NOT excluded.content_hash
+        '''.format(columns=', '.join(FOOD_COLUMNS), placeholders=', '.join('?' * len(FOOD_COLUMNS)),
+                   updates=',\n            '.join(f"{column} = excluded.{column}" for column in FOOD_COLUMNS[2:]))
 
 # Dados de exemplo baseados na tabela IBGE POF 2008-2009
 # Esta é uma amostra dos principais alimentos brasileiros
@@ -44,15 +150,235 @@ IBGE_FOODS_SAMPLE = [
     {"code": 90002, "name": "Amendoim torrado", "group": "Oleaginosas", "energy": 606, "protein": 27.2, "lipids": 50.2, "carbs": 11.7, "fiber": 8.0},
 ]
 
+@dataclass
+class FoodRecord:
+    """Alimento no formato de IBGECompleteFood / IBGEFixedFood; nutrients pode ser um dict"""
+    code: int
+    name: str
+    preparation_code: int = 0
+    preparation: str = ""
+    group: str = ""
+    nutrients: Any = None
+
+def sample_foods() -> List[FoodRecord]:
+    """Amostra IBGE_FOODS_SAMPLE no formato dos extratores (sem código de preparo)"""
+    return [
+        FoodRecord(code=food["code"], name=food["name"], group=food["group"], nutrients={
+            "energia_kcal": food["energy"],
+            "proteina_g": food["protein"],
+            "lipidios_g": food["lipids"],
+            "carboidrato_g": food["carbs"],
+            "fibra_alimentar_g": food["fiber"]
+        })
+        for food in IBGE_FOODS_SAMPLE
+    ]
+
+def nutrient_values(nutrients: Any) -> List[Optional[float]]:
+    """Valores na ordem de NUTRIENT_COLUMNS (NutrientRowView, IBGENutrients ou dict)"""
+    if isinstance(nutrients, dict):
+        get = nutrients.get
+    else:
+        get = lambda name, default=None: getattr(nutrients, name, default)
+    
+    values = []
+    for _, attribute in NUTRIENT_COLUMNS:
+        value = get(attribute, None)
+        for alias in NUTRIENT_ALIASES.get(attribute, ()):
+            if value is not None:
+                break
+            value = get(alias, None)
+        values.append(value)
+    return values
+
+def food_content_hash(group: str, values: Tuple) -> int:
+    """Hash de 64 bits (INTEGER do SQLite) de nome, preparo, grupo e nutrientes de um alimento"""
+    digest = hashlib.blake2b(repr((group, values)).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+def search_match_query(text: str) -> str:
+    """Texto livre -> consulta FTS5: cada palavra vira um prefixo ("pao frances" -> "pao"* "frances"*)"""
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', text))
+
+# Uma atribuição por linha nos UPDATE dos gatilhos
+STATS_SEPARATOR = ",\n    "
+
+def _stats_add_sql(row: str) -> str:
+    """Soma a linha row (NEW) às estatísticas do grupo"""
+    updates = [f"food_count = food_count + 1"]
+    for column in STATS_COLUMNS:
+        value = f"{row}.{column}"
+        updates += [
+            f"{column}_count = {column}_count + ({value} IS NOT NULL)",
+            f"{column}_sum = {column}_sum + COALESCE({value}, 0)",
+            f"{column}_min = CASE WHEN {value} IS NULL THEN {column}_min "
+            f"WHEN {column}_min IS NULL OR {value} < {column}_min THEN {value} ELSE {column}_min END",
+            f"{column}_max = CASE WHEN {value} IS NULL THEN {column}_max "
+            f"WHEN {column}_max IS NULL OR {value} > {column}_max THEN {value} ELSE {column}_max END",
+        ]
+    # Sem INSERT OR IGNORE: o OR REPLACE do comando que dispara o gatilho substituiria a cláusula
+    return (f"INSERT INTO food_group_stats (group_key) SELECT COALESCE({row}.group_id, 0) WHERE NOT EXISTS "
+            f"(SELECT 1 FROM food_group_stats WHERE group_key = COALESCE({row}.group_id, 0));\n"
+            f"UPDATE food_group_stats SET {STATS_SEPARATOR.join(updates)} WHERE group_key = COALESCE({row}.group_id, 0);")
+
+def _stats_remove_sql(row: str) -> str:
+    """Retira a linha row (OLD) das estatísticas; mínimo e máximo são recalculados só se ela era o extremo"""
+    updates = [f"food_count = food_count - 1"]
+    for column in STATS_COLUMNS:
+        value = f"{row}.{column}"
+        updates += [
+            f"{column}_count = {column}_count - ({value} IS NOT NULL)",
+            f"{column}_sum = {column}_sum - COALESCE({value}, 0)",
+            f"{column}_min = CASE WHEN {value} <= {column}_min "
+            f"THEN (SELECT MIN({column}) FROM foods WHERE group_id IS {row}.group_id) ELSE {column}_min END",
+            f"{column}_max = CASE WHEN {value} >= {column}_max "
+            f"THEN (SELECT MAX({column}) FROM foods WHERE group_id IS {row}.group_id) ELSE {column}_max END",
+        ]
+    return f"UPDATE food_group_stats SET {STATS_SEPARATOR.join(updates)} WHERE group_key = COALESCE({row}.group_id, 0);"
+
+def group_stats_trigger_sql() -> List[str]:
+    """CREATE TRIGGER de inserção, remoção e atualização de foods (na ordem de STATS_TRIGGERS)"""
+    bodies = (_stats_add_sql("NEW"), _stats_remove_sql("OLD"),
+              _stats_remove_sql("OLD") + "\n" + _stats_add_sql("NEW"))
+    events = ("INSERT", "DELETE", "UPDATE")
+    return [f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON foods BEGIN\n{body}\nEND"
+            for name, event, body in zip(STATS_TRIGGERS, events, bodies)]
+
+def _range_bounds(row: str) -> List[str]:
+    """Mínimo e máximo de cada dimensão de foods_ranges (NULL ocupa a dimensão inteira)"""
+    bounds = []
+    for column in RANGE_INDEX_COLUMNS:
+        bounds += [f"COALESCE({row}{column}, -{RANGE_UNBOUNDED})", f"COALESCE({row}{column}, {RANGE_UNBOUNDED})"]
+    return bounds
+
+def _index_add_sql(row: str) -> str:
+    return (f"INSERT INTO foods_search (rowid, name, preparation, group_name) VALUES ({row}.id, {row}.name, "
+            f"{row}.preparation, (SELECT name FROM food_groups WHERE id = {row}.group_id));\n"
+            f"INSERT INTO foods_ranges VALUES ({row}.id, {', '.join(_range_bounds(row + '.'))});")
+
+def _index_remove_sql(row: str) -> str:
+    return (f"DELETE FROM foods_search WHERE rowid = {row}.id;\n"
+            f"DELETE FROM foods_ranges WHERE id = {row}.id;")
+
+def index_trigger_sql() -> List[str]:
+    """CREATE TRIGGER que mantêm foods_search e foods_ranges (na ordem de INDEX_TRIGGERS)"""
+    bodies = (_index_add_sql("NEW"), _index_remove_sql("OLD"),
+              _index_remove_sql("OLD") + "\n" + _index_add_sql("NEW"))
+    events = ("INSERT", "DELETE", "UPDATE")
+    return [f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON foods BEGIN\n{body}\nEND"
+            for name, event, body in zip(INDEX_TRIGGERS, events, bodies)]
+
 class IBGEFoodsDatabase:
+    """Base SQLite de alimentos IBGE.
+    
+    Além da tabela foods, mantém:
+    - foods_search: índice FTS5 sem acentos e por prefixo (search_foods);
+    - food_group_stats: estatísticas por grupo mantidas por gatilhos (get_statistics);
+    - foods_ranges: índice R*Tree sobre RANGE_INDEX_COLUMNS para filtros por faixas de nutrientes
+      (find_foods_by_ranges, ex.: proteína >= 20 g, lipídios <= 5 g e sódio <= 200 mg por 100 g).
+      O R*Tree guarda float32 arredondado para fora, então serve só como pré-filtro: cada candidato
+      é conferido contra o valor exato em foods.
+    Estatísticas e índices são mantidos por gatilhos; a carga em massa desliga os gatilhos e recalcula
+    tudo uma vez no fim. insert_foods é incremental: upsert por (code, preparation_code) que só grava
+    alimentos cujo content_hash mudou.
+    """
+    
     def __init__(self, db_path: str = "alimentos_ibge.db"):
         self.db_path = db_path
+        self.conn: Optional[sqlite3.Connection] = None  # Conexão compartilhada (open/close ou with)
+        self.bulk_loading = False
+        self.loaded_sample = True
         
-    def create_database(self):
-        """Cria o banco de dados e as tabelas necessárias"""
+    def connect(self) -> sqlite3.Connection:
+        # recursive_triggers: um INSERT OR REPLACE externo também dispara os gatilhos de remoção
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA recursive_triggers = ON")
+        return conn
+        
+    def open(self) -> "IBGEFoodsDatabase":
+        """Abre uma conexão única usada por todos os métodos até close()"""
+        if self.conn is None:
+            self.conn = self.connect()
+        return self
+        
+    def close(self):
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+            
+    def __enter__(self) -> "IBGEFoodsDatabase":
+        return self.open()
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+    def get_connection(self) -> sqlite3.Connection:
+        """Conexão compartilhada, se houver; senão uma conexão própria do método, como antes"""
+        return self.conn if self.conn is not None else self.connect()
+        
+    def release_connection(self, conn: sqlite3.Connection, commit: bool = True):
+        """Confirma (exceto durante a carga em massa) e fecha a conexão se ela não for a compartilhada"""
+        if commit and not self.bulk_loading:
+            conn.commit()
+        if conn is not self.conn:
+            conn.close()
+            
+    @contextmanager
+    def bulk_load(self) -> Iterator[sqlite3.Connection]:
+        """Carga em massa: uma conexão, pragmas de carga, uma única transação e índices só depois dos dados.
+        Os gatilhos de estatísticas ficam desligados durante a carga; food_group_stats é recalculada no fim."""
+        opened_here = self.conn is None
+        self.open()
+        journal_mode = self.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+        for pragma in BULK_LOAD_PRAGMAS:
+            self.conn.execute(pragma)
+        
+        self.bulk_loading = True
+        self.conn.execute("BEGIN")
+        try:
+            self.drop_triggers(self.conn)
+            yield self.conn
+            self.create_indexes(self.conn)
+            self.rebuild_search_index(self.conn)
+            self.rebuild_range_index(self.conn)
+            self.rebuild_group_stats(self.conn)
+            self.create_triggers(self.conn)
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self.bulk_loading = False
+            if opened_here:
+                self.close()
+            else:
+                # A conexão continua aberta: gravações seguintes voltam ao journal e fsync de antes
+                self.conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+                self.conn.execute(f"PRAGMA synchronous = {synchronous}")
+        
+    def create_database(self, reset: bool = False):
+        """Cria o banco de dados e as tabelas necessárias (reset recria as tabelas do zero)"""
         print("Criando banco de dados SQLite...")
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
+        if reset:
+            conn.execute('DROP TABLE IF EXISTS foods_search')
+            conn.execute('DROP TABLE IF EXISTS foods_ranges')
+            conn.execute('DROP TABLE IF EXISTS food_group_stats')
+            conn.execute('DROP TABLE IF EXISTS foods')
+            conn.execute('DROP TABLE IF EXISTS food_groups')
+        self.create_tables(conn)
+        # Na carga em massa os índices e gatilhos são criados depois dos dados
+        if not self.bulk_loading:
+            self.create_indexes(conn)
+            self.create_triggers(conn)
+        self.release_connection(conn)
+        
+        print("Banco de dados criado com sucesso!")
+        
+    def create_tables(self, conn: sqlite3.Connection):
+        """Cria as tabelas (sem os índices secundários)"""
         cursor = conn.cursor()
         
         # Tabela de grupos de alimentos
@@ -68,27 +394,94 @@ class IBGEFoodsDatabase:
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS foods (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            code INTEGER UNIQUE NOT NULL,
+            code INTEGER NOT NULL,
+            preparation_code INTEGER NOT NULL DEFAULT 0,
             name TEXT NOT NULL,
+            preparation TEXT,
             group_id INTEGER,
-            energy_kcal REAL,
-            protein_g REAL,
-            lipids_g REAL,
-            carbohydrates_g REAL,
-            dietary_fiber_g REAL,
+            {nutrients},
+            content_hash INTEGER,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE (code, preparation_code),
             FOREIGN KEY (group_id) REFERENCES food_groups (id)
         )
+        '''.format(nutrients=',\n            '.join(f"{column} REAL" for column, _ in NUTRIENT_COLUMNS)))
+        
+        # Estatísticas por grupo (group_key = group_id, ou 0 sem grupo), mantidas pelos gatilhos
+        cursor.execute('''
+        CREATE TABLE IF NOT EXISTS food_group_stats (
+            group_key INTEGER PRIMARY KEY,
+            food_count INTEGER NOT NULL DEFAULT 0,
+            {nutrients}
+        )
+        '''.format(nutrients=',\n            '.join(
+            f"{column}_count INTEGER NOT NULL DEFAULT 0, {column}_sum REAL NOT NULL DEFAULT 0, "
+            f"{column}_min REAL, {column}_max REAL" for column in STATS_COLUMNS)))
+        
+        # Índice R*Tree de faixas de nutrientes; id = foods.id
+        cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS foods_ranges USING rtree(
+            id,
+            {dimensions}
+        )
+        '''.format(dimensions=',\n            '.join(f"{column}_min, {column}_max" for column in RANGE_INDEX_COLUMNS)))
+        
+        # Índice textual (FTS5) sobre nome, preparo e grupo; rowid = foods.id
+        cursor.execute(f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS foods_search USING fts5(
+            name, preparation, group_name,
+            tokenize = '{SEARCH_TOKENIZER}',
+            prefix = '{SEARCH_PREFIXES}'
+        )
         ''')
         
-        # Índices para melhor performance
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_foods_code ON foods (code)')
+    def create_indexes(self, conn: sqlite3.Connection):
+        """Índices para melhor performance (a busca por código usa o índice de UNIQUE (code, preparation_code))"""
+        cursor = conn.cursor()
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_foods_name ON foods (name)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_foods_group ON foods (group_id)')
         
-        conn.commit()
-        conn.close()
-        print("Banco de dados criado com sucesso!")
+    def create_triggers(self, conn: sqlite3.Connection):
+        for statement in group_stats_trigger_sql() + index_trigger_sql():
+            conn.execute(statement)
+            
+    def drop_triggers(self, conn: sqlite3.Connection):
+        for name in STATS_TRIGGERS + INDEX_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            
+    def rebuild_group_stats(self, conn: sqlite3.Connection):
+        """Recalcula food_group_stats inteira em uma passagem (após a carga em massa)"""
+        columns = ["group_key", "food_count"]
+        aggregates = ["COALESCE(group_id, 0)", "COUNT(*)"]
+        for column in STATS_COLUMNS:
+            columns += [f"{column}_count", f"{column}_sum", f"{column}_min", f"{column}_max"]
+            aggregates += [f"COUNT({column})", f"TOTAL({column})", f"MIN({column})", f"MAX({column})"]
+        
+        conn.execute('DELETE FROM food_group_stats')
+        conn.execute(f'''
+        INSERT INTO food_group_stats ({', '.join(columns)})
+        SELECT {', '.join(aggregates)}
+        FROM foods
+        GROUP BY COALESCE(group_id, 0)
+        ''')
+        
+    def rebuild_search_index(self, conn: sqlite3.Connection):
+        """Recarrega o índice textual a partir de foods (após a carga em massa)"""
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM foods_search')
+        cursor.execute('''
+        INSERT INTO foods_search (rowid, name, preparation, group_name)
+        SELECT f.id, f.name, f.preparation, g.name
+        FROM foods f
+        LEFT JOIN food_groups g ON f.group_id = g.id
+        ''')
+        cursor.execute("INSERT INTO foods_search (foods_search) VALUES ('optimize')")
+        
+    def rebuild_range_index(self, conn: sqlite3.Connection):
+        """Recarrega o R*Tree de faixas: cada alimento é um ponto (mínimo = máximo = valor)"""
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM foods_ranges')
+        cursor.execute(f'INSERT INTO foods_ranges SELECT id, {", ".join(_range_bounds(""))} FROM foods')
         
     def insert_food_groups(self):
         """Insere os grupos de alimentos"""
@@ -107,152 +500,275 @@ class IBGEFoodsDatabase:
             ("Bebidas", "Bebidas não alcoólicas"),
         ]
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.get_connection()
         cursor = conn.cursor()
         
         cursor.executemany('''
         INSERT OR IGNORE INTO food_groups (name, description) VALUES (?, ?)
         ''', groups)
         
-        conn.commit()
-        conn.close()
+        self.release_connection(conn)
         print(f"Inseridos {len(groups)} grupos de alimentos!")
         
-    def insert_foods(self):
-        """Insere os alimentos na base de dados"""
+    def insert_foods(self, foods: Optional[Iterable[Any]] = None) -> int:
+        """Insere os alimentos: saída de IBGECompleteExtractor / IBGEFixedExtractor ou, sem foods, a amostra.
+        Alimentos já presentes e sem alteração não são regravados; devolve o número de linhas gravadas."""
         print("Inserindo alimentos...")
         
-        conn = sqlite3.connect(self.db_path)
+        self.loaded_sample = foods is None
+        foods = sample_foods() if foods is None else list(foods)
+        
+        conn = self.get_connection()
         cursor = conn.cursor()
         
+        # Grupos vindos da extração que ainda não existem na tabela
+        cursor.executemany('''
+        INSERT OR IGNORE INTO food_groups (name) VALUES (?)
+        ''', [(group,) for group in dict.fromkeys(food.group for food in foods) if group])
+        
         # Primeiro, busca os IDs dos grupos
         group_ids = {}
         cursor.execute("SELECT id, name FROM food_groups")
         for group_id, group_name in cursor.fetchall():
             group_ids[group_name] = group_id
         
-        # Prepara os dados para inserção
-        foods_data = []
-        for food in IBGE_FOODS_SAMPLE:
-            group_id = group_ids.get(food["group"])
-            foods_data.append((
-                food["code"],
-                food["name"],
-                group_id,
-                food["energy"],
-                food["protein"],
-                food["lipids"],
-                food["carbs"],
-                food["fiber"]
-            ))
-        
-        # Insere os alimentos
-        cursor.executemany('''
-        INSERT OR REPLACE INTO foods 
-        (code, name, group_id, energy_kcal, protein_g, lipids_g, carbohydrates_g, dietary_fiber_g)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', foods_data)
-        
-        conn.commit()
-        conn.close()
-        print(f"Inseridos {len(foods_data)} alimentos na base de dados!")
-        
-    def export_to_json(self, output_file: str = "alimentos_ibge_completo.json"):
-        """Exporta toda a base de dados para JSON"""
-        print("Exportando dados para JSON...")
-        
-        conn = sqlite3.connect(self.db_path)
+        # Linhas geradas sob demanda para o executemany
+        def food_row(food: Any) -> Tuple:
+            values = (food.name, food.preparation, *nutrient_values(food.nutrients))
+            return (food.code, food.preparation_code, food.name, food.preparation, group_ids.get(food.group),
+                    *values[2:], food_content_hash(food.group, values))
+        
+        # Insere ou atualiza os alimentos (rowcount = linhas realmente gravadas)
+        cursor.executemany(UPSERT_FOOD_SQL, (food_row(food) for food in foods))
+        written = cursor.rowcount
+        
+        self.release_connection(conn)
+        print(f"Inseridos ou atualizados {written} de {len(foods)} alimentos na base de dados!")
+        return written
+        
+    def update_database(self, foods: Optional[Iterable[Any]] = None) -> int:
+        """Atualização incremental de uma base existente: só os alimentos novos ou alterados são gravados.
+        Uma base com o esquema antigo de foods (sem preparation_code/content_hash) é recriada por inteiro."""
+        with self:
+            if self.foods_schema_outdated(self.conn):
+                print("Tabela foods com esquema antigo: recriando a base em vez de atualizar")
+                with self.bulk_load():
+                    self.create_database(reset=True)
+                    self.insert_food_groups()
+                    return self.insert_foods(foods)
+            self.create_database()
+            self.insert_food_groups()
+            return self.insert_foods(foods)
+        
+    @staticmethod
+    def foods_schema_outdated(conn: sqlite3.Connection) -> bool:
+        """A tabela foods existe, mas sem as colunas que o upsert incremental usa"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(foods)")}
+        return bool(columns) and not {'preparation_code', 'content_hash'} <= columns
+        
+    def iter_foods(self, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+        """Alimentos com seus grupos, em ordem de código, lidos do cursor em lotes (fetchmany)"""
+        conn = self.get_connection()
         cursor = conn.cursor()
         
-        # Busca todos os alimentos com seus grupos
+        nutrient_names = [column for column, _ in NUTRIENT_COLUMNS]
         cursor.execute('''
         SELECT 
             f.code,
+            f.preparation_code,
             f.name,
+            f.preparation,
             g.name as group_name,
-            f.energy_kcal,
-            f.protein_g,
-            f.lipids_g,
-            f.carbohydrates_g,
-            f.dietary_fiber_g
+            {nutrients}
         FROM foods f
         LEFT JOIN food_groups g ON f.group_id = g.id
-        ORDER BY f.code
-        ''')
+        ORDER BY f.code, f.preparation_code
+        '''.format(nutrients=', '.join(f"f.{column}" for column in nutrient_names)))
+        
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    nutrients = dict(zip(nutrient_names, row[5:]))
+                    yield {
+                        "code": row[0],
+                        "preparation_code": row[1],
+                        "name": row[2],
+                        "preparation": row[3],
+                        "group": row[4],
+                        "macronutrients": {column: nutrients.pop(column) for column in MACRONUTRIENT_COLUMNS},
+                        "nutrients": {column: value for column, value in nutrients.items() if value is not None}
+                    }
+        finally:
+            cursor.close()
+            self.release_connection(conn, commit=False)
+        
+    def export_to_json(self, output_file: str = "alimentos_ibge_completo.json", compact: bool = False) -> Dict[str, Any]:
+        """Exporta toda a base de dados para JSON em fluxo (memória constante); devolve os metadados"""
+        print("Exportando dados para JSON...")
         
-        foods = []
-        for row in cursor.fetchall():
-            foods.append({
-                "code": row[0],
-                "name": row[1],
-                "group": row[2],
-                "macronutrients": {
-                    "energy_kcal": row[3],
-                    "protein_g": row[4],
-                    "lipids_g": row[5],
-                    "carbohydrates_g": row[6],
-                    "dietary_fiber_g": row[7]
-                }
-            })
-        
-        # Dados de metadados
-        output_data = {
-            "metadata": {
-                "source": "IBGE - Tabelas de Composição Nutricional dos Alimentos Consumidos no Brasil",
-                "description": "Amostra representativa dos principais alimentos brasileiros",
-                "total_foods": len(foods),
-                "created_at": datetime.now().isoformat(),
-                "note": "Esta é uma amostra dos principais alimentos da tabela IBGE. A tabela completa contém aproximadamente 1.971 alimentos."
-            },
-            "foods": foods
+        conn = self.get_connection()
+        total_foods = conn.execute("SELECT COUNT(*) FROM foods").fetchone()[0]
+        self.release_connection(conn, commit=False)
+        
+        # Dados de metadados (o total vem antes da lista, por isso é contado à parte)
+        metadata = {
+            "source": "IBGE - Tabelas de Composição Nutricional dos Alimentos Consumidos no Brasil",
+            "description": "Amostra representativa dos principais alimentos brasileiros" if self.loaded_sample
+                           else "Alimentos e preparações extraídos das tabelas IBGE",
+            "total_foods": total_foods,
+            "created_at": datetime.now().isoformat(),
+            **({"note": "Esta é uma amostra dos principais alimentos da tabela IBGE. A tabela completa contém aproximadamente 1.971 alimentos."}
+               if self.loaded_sample else {})
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        write_streamed_document(output_file, {"metadata": metadata}, "foods", self.iter_foods(),
+                                lambda total: {}, compact)
         
-        conn.close()
         print(f"Dados exportados para {output_file}")
-        return foods
+        return metadata
+        
+    def search_foods(self, text: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Busca por nome, preparo ou grupo, sem acentos e por prefixo, ordenada por relevância (bm25)"""
+        query = search_match_query(text)
+        if not query:
+            return []
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+        SELECT f.code, f.preparation_code, f.name, f.preparation, s.group_name, f.energy_kcal,
+               bm25(foods_search, ?, ?, ?) AS score
+        FROM foods_search s
+        JOIN foods f ON f.id = s.rowid
+        WHERE foods_search MATCH ?
+        ORDER BY score
+        LIMIT ?
+        ''', (*SEARCH_WEIGHTS, query, limit))
+        
+        results = [
+            {"code": row[0], "preparation_code": row[1], "name": row[2], "preparation": row[3],
+             "group": row[4], "energy_kcal": row[5], "score": row[6]}
+            for row in cursor.fetchall()
+        ]
+        self.release_connection(conn, commit=False)
+        return results
+        
+    def find_foods_by_ranges(self, ranges: Dict[str, Tuple[Optional[float], Optional[float]]],
+                             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Alimentos com cada nutriente dentro da faixa [mínimo, máximo] (None = sem limite).
+        Ex.: {"protein_g": (20, None), "lipids_g": (None, 5), "sodium_mg": (None, 200)}"""
+        nutrient_names = {column for column, _ in NUTRIENT_COLUMNS}
+        unknown = [column for column in ranges if column not in nutrient_names]
+        if unknown:
+            raise ValueError(f"Nutrientes desconhecidos: {', '.join(unknown)}")
+        
+        index_conditions = []
+        exact_conditions = []
+        params = []
+        index_params = []
+        for column, (low, high) in ranges.items():
+            if low is not None:
+                exact_conditions.append(f"f.{column} >= ?")
+                params.append(low)
+                if column in RANGE_INDEX_COLUMNS:
+                    index_conditions.append(f"r.{column}_max >= ?")
+                    index_params.append(low)
+            if high is not None:
+                exact_conditions.append(f"f.{column} <= ?")
+                params.append(high)
+                if column in RANGE_INDEX_COLUMNS:
+                    index_conditions.append(f"r.{column}_min <= ?")
+                    index_params.append(high)
+        
+        # O R*Tree (float32) pré-seleciona os candidatos; a conferência exata é feita em foods
+        source = "foods_ranges r JOIN foods f ON f.id = r.id" if index_conditions else "foods f"
+        conditions = index_conditions + exact_conditions
+        columns = list(ranges)
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+        SELECT f.code, f.preparation_code, f.name, f.preparation, g.name{values}
+        FROM {source}
+        LEFT JOIN food_groups g ON f.group_id = g.id
+        {where}
+        ORDER BY f.code, f.preparation_code
+        {limit}
+        '''.format(values=''.join(f", f.{column}" for column in columns), source=source,
+                   where=f"WHERE {' AND '.join(conditions)}" if conditions else "",
+                   limit="LIMIT ?" if limit is not None else ""),
+            (*index_params, *params, *((limit,) if limit is not None else ())))
+        
+        results = [
+            {"code": row[0], "preparation_code": row[1], "name": row[2], "preparation": row[3],
+             "group": row[4], "nutrients": dict(zip(columns, row[5:]))}
+            for row in cursor.fetchall()
+        ]
+        self.release_connection(conn, commit=False)
+        return results
         
     def get_statistics(self):
-        """Retorna estatísticas da base de dados"""
-        conn = sqlite3.connect(self.db_path)
+        """Retorna estatísticas da base de dados, lidas de food_group_stats (uma linha por grupo)"""
+        conn = self.get_connection()
         cursor = conn.cursor()
         
         # Total de alimentos
-        cursor.execute("SELECT COUNT(*) FROM foods")
+        cursor.execute("SELECT COALESCE(SUM(food_count), 0) FROM food_group_stats")
         total_foods = cursor.fetchone()[0]
         
-        # Alimentos por grupo
+        # Alimentos e nutrientes por grupo
         cursor.execute('''
-        SELECT g.name, COUNT(f.id) as count
+        SELECT g.name, COALESCE(s.food_count, 0) as count, {nutrients}
         FROM food_groups g
-        LEFT JOIN foods f ON g.id = f.group_id
-        GROUP BY g.id, g.name
-        ORDER BY count DESC
-        ''')
-        groups_stats = cursor.fetchall()
+        LEFT JOIN food_group_stats s ON s.group_key = g.id
+        ORDER BY count DESC, g.id
+        '''.format(nutrients=', '.join(
+            f"s.{column}_count, s.{column}_sum, s.{column}_min, s.{column}_max" for column in STATS_COLUMNS)))
+        
+        groups_stats = []
+        nutrients_stats = {}
+        for row in cursor.fetchall():
+            groups_stats.append((row[0], row[1]))
+            if not row[1]:
+                continue
+            nutrients_stats[row[0]] = {}
+            for index, column in enumerate(STATS_COLUMNS):
+                count, total, minimum, maximum = row[2 + index * 4:6 + index * 4]
+                nutrients_stats[row[0]][column] = {
+                    "min": minimum,
+                    "max": maximum,
+                    "mean": total / count if count else None,
+                    "sum": total
+                }
         
-        conn.close()
+        self.release_connection(conn, commit=False)
         
         return {
             "total_foods": total_foods,
-            "groups": groups_stats
+            "groups": groups_stats,
+            "nutrients": nutrients_stats
         }
         
-    def setup_complete_database(self):
-        """Executa o setup completo da base de dados"""
+    def setup_complete_database(self, foods: Optional[Iterable[Any]] = None):
+        """Executa o setup completo da base de dados (foods: saída de um extrator; sem foods, a amostra)"""
         print("=== Setup Base de Dados IBGE ===")
         
-        self.create_database()
-        self.insert_food_groups()
-        self.insert_foods()
-        
-        # Exporta para JSON
-        foods = self.export_to_json()
-        
-        # Mostra estatísticas
-        stats = self.get_statistics()
+        # Uma única conexão para toda a execução; a carga roda em uma transação só
+        with self:
+            with self.bulk_load():
+                self.create_database(reset=True)
+                self.insert_food_groups()
+                self.insert_foods(foods)
+            
+            # Exporta para JSON
+            self.export_to_json()
+            first_foods = list(islice(self.iter_foods(batch_size=5), 5))
+            
+            # Mostra estatísticas
+            stats = self.get_statistics()
         
         print(f"\n=== RESULTADOS ===")
         print(f"Total de alimentos: {stats['total_foods']}")
@@ -265,14 +781,32 @@ class IBGEFoodsDatabase:
                 print(f"  {group_name}: {count} alimentos")
         
         print(f"\nPrimeiros 5 alimentos:")
-        for i, food in enumerate(foods[:5]):
+        for i, food in enumerate(first_foods):
             print(f"  {i+1}. {food['name']} ({food['group']})")
             
-        print(f"\nNOTA: Esta é uma amostra representativa dos principais alimentos.")
-        print(f"A tabela IBGE completa contém aproximadamente 1.971 alimentos.")
+        if self.loaded_sample:
+            print(f"\nNOTA: Esta é uma amostra representativa dos principais alimentos.")
+            print(f"A tabela IBGE completa contém aproximadamente 1.971 alimentos.")
         
         return True
 
-if __name__ == "__main__":
+def main():
+    """create_ibge_foods_db.py [PDF] [--incremental] [--workers N]: com o PDF, carrega a extração completa;
+    sem ele, a amostra. --incremental atualiza a base existente em vez de recriá-la; --workers N extrai o PDF
+    em N processos (padrão: serial)."""
+    from ibge_parallel import pop_workers_option
+    args = [arg for arg in sys.argv[1:] if arg != '--incremental']
+    workers = pop_workers_option(args)
+    foods = None
+    if args:
+        from ibge_extractor_complete import IBGECompleteExtractor
+        foods = IBGECompleteExtractor(args[0]).extract_all_data(workers=workers)
+    
     db = IBGEFoodsDatabase()
-    db.setup_complete_database()
\ No newline at end of file
+    if '--incremental' in sys.argv[1:]:
+        db.update_database(foods)
+    else:
+        db.setup_complete_database(foods)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
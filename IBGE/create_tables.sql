@@ -1,5 +1,10 @@
 
 -- Script de criação das tabelas para alimentos IBGE
+-- Os gatilhos de food_group_stats e foods_ranges só veem a linha substituída por um INSERT OR REPLACE com
+-- recursive_triggers ligado. O PRAGMA vale só para a conexão que executa este script: toda conexão que grava
+-- em foods (sqlite3, importadores) precisa executá-lo antes (import_foods_data.sql já o faz).
+PRAGMA recursive_triggers = ON;
+
 CREATE TABLE IF NOT EXISTS food_groups (
     id INTEGER PRIMARY KEY,
     name TEXT UNIQUE NOT NULL,
@@ -9,28 +14,227 @@ CREATE TABLE IF NOT EXISTS food_groups (
 
 CREATE TABLE IF NOT EXISTS foods (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    code INTEGER UNIQUE NOT NULL,
+    code INTEGER NOT NULL,
+    preparation_code INTEGER NOT NULL DEFAULT 0,
     name TEXT NOT NULL,
+    preparation TEXT,
     group_id INTEGER,
     energy_kcal REAL,
+    energy_kj REAL,
     protein_g REAL,
     lipids_g REAL,
     carbohydrates_g REAL,
+    available_carbohydrates_g REAL,
     dietary_fiber_g REAL,
+    soluble_fiber_g REAL,
+    insoluble_fiber_g REAL,
+    ash_g REAL,
+    cholesterol_mg REAL,
+    saturated_fat_g REAL,
+    monounsaturated_fat_g REAL,
+    polyunsaturated_fat_g REAL,
+    linoleic_acid_g REAL,
+    linolenic_acid_g REAL,
+    trans_fat_g REAL,
+    total_sugar_g REAL,
+    added_sugar_g REAL,
+    calcium_mg REAL,
+    magnesium_mg REAL,
+    manganese_mg REAL,
+    phosphorus_mg REAL,
+    iron_mg REAL,
+    sodium_mg REAL,
+    potassium_mg REAL,
+    copper_mg REAL,
+    zinc_mg REAL,
+    selenium_mcg REAL,
+    retinol_mcg REAL,
+    re_mcg REAL,
+    vitamin_a_rae_mcg REAL,
+    thiamine_mg REAL,
+    riboflavin_mg REAL,
+    pyridoxine_mg REAL,
+    niacin_mg REAL,
+    vitamin_c_mg REAL,
+    folate_mcg REAL,
+    vitamin_b12_mcg REAL,
+    vitamin_d_mcg REAL,
+    vitamin_e_mg REAL,
+    content_hash INTEGER,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (code, preparation_code),
     FOREIGN KEY (group_id) REFERENCES food_groups (id)
 );
 
--- Índices
-CREATE INDEX IF NOT EXISTS idx_foods_code ON foods (code);
+-- Índices (a busca por código usa o índice de UNIQUE (code, preparation_code))
 CREATE INDEX IF NOT EXISTS idx_foods_name ON foods (name);
 CREATE INDEX IF NOT EXISTS idx_foods_group ON foods (group_id);
 
+-- Estatísticas por grupo (group_key = group_id, ou 0 sem grupo; média = soma / contagem)
+CREATE TABLE IF NOT EXISTS food_group_stats (
+    group_key INTEGER PRIMARY KEY,
+    food_count INTEGER NOT NULL DEFAULT 0,
+    energy_kcal_count INTEGER NOT NULL DEFAULT 0,
+    energy_kcal_sum REAL NOT NULL DEFAULT 0,
+    energy_kcal_min REAL,
+    energy_kcal_max REAL,
+    protein_g_count INTEGER NOT NULL DEFAULT 0,
+    protein_g_sum REAL NOT NULL DEFAULT 0,
+    protein_g_min REAL,
+    protein_g_max REAL,
+    lipids_g_count INTEGER NOT NULL DEFAULT 0,
+    lipids_g_sum REAL NOT NULL DEFAULT 0,
+    lipids_g_min REAL,
+    lipids_g_max REAL,
+    carbohydrates_g_count INTEGER NOT NULL DEFAULT 0,
+    carbohydrates_g_sum REAL NOT NULL DEFAULT 0,
+    carbohydrates_g_min REAL,
+    carbohydrates_g_max REAL,
+    dietary_fiber_g_count INTEGER NOT NULL DEFAULT 0,
+    dietary_fiber_g_sum REAL NOT NULL DEFAULT 0,
+    dietary_fiber_g_min REAL,
+    dietary_fiber_g_max REAL
+);
+
+-- Gatilhos que mantêm food_group_stats (use PRAGMA recursive_triggers = ON para cobrir INSERT OR REPLACE)
+CREATE TRIGGER IF NOT EXISTS foods_stats_insert AFTER INSERT ON foods BEGIN
+INSERT INTO food_group_stats (group_key) SELECT COALESCE(NEW.group_id, 0) WHERE NOT EXISTS (SELECT 1 FROM food_group_stats WHERE group_key = COALESCE(NEW.group_id, 0));
+UPDATE food_group_stats SET food_count = food_count + 1,
+    energy_kcal_count = energy_kcal_count + (NEW.energy_kcal IS NOT NULL),
+    energy_kcal_sum = energy_kcal_sum + COALESCE(NEW.energy_kcal, 0),
+    energy_kcal_min = CASE WHEN NEW.energy_kcal IS NULL THEN energy_kcal_min WHEN energy_kcal_min IS NULL OR NEW.energy_kcal < energy_kcal_min THEN NEW.energy_kcal ELSE energy_kcal_min END,
+    energy_kcal_max = CASE WHEN NEW.energy_kcal IS NULL THEN energy_kcal_max WHEN energy_kcal_max IS NULL OR NEW.energy_kcal > energy_kcal_max THEN NEW.energy_kcal ELSE energy_kcal_max END,
+    protein_g_count = protein_g_count + (NEW.protein_g IS NOT NULL),
+    protein_g_sum = protein_g_sum + COALESCE(NEW.protein_g, 0),
+    protein_g_min = CASE WHEN NEW.protein_g IS NULL THEN protein_g_min WHEN protein_g_min IS NULL OR NEW.protein_g < protein_g_min THEN NEW.protein_g ELSE protein_g_min END,
+    protein_g_max = CASE WHEN NEW.protein_g IS NULL THEN protein_g_max WHEN protein_g_max IS NULL OR NEW.protein_g > protein_g_max THEN NEW.protein_g ELSE protein_g_max END,
+    lipids_g_count = lipids_g_count + (NEW.lipids_g IS NOT NULL),
+    lipids_g_sum = lipids_g_sum + COALESCE(NEW.lipids_g, 0),
+    lipids_g_min = CASE WHEN NEW.lipids_g IS NULL THEN lipids_g_min WHEN lipids_g_min IS NULL OR NEW.lipids_g < lipids_g_min THEN NEW.lipids_g ELSE lipids_g_min END,
+    lipids_g_max = CASE WHEN NEW.lipids_g IS NULL THEN lipids_g_max WHEN lipids_g_max IS NULL OR NEW.lipids_g > lipids_g_max THEN NEW.lipids_g ELSE lipids_g_max END,
+    carbohydrates_g_count = carbohydrates_g_count + (NEW.carbohydrates_g IS NOT NULL),
+    carbohydrates_g_sum = carbohydrates_g_sum + COALESCE(NEW.carbohydrates_g, 0),
+    carbohydrates_g_min = CASE WHEN NEW.carbohydrates_g IS NULL THEN carbohydrates_g_min WHEN carbohydrates_g_min IS NULL OR NEW.carbohydrates_g < carbohydrates_g_min THEN NEW.carbohydrates_g ELSE carbohydrates_g_min END,
+    carbohydrates_g_max = CASE WHEN NEW.carbohydrates_g IS NULL THEN carbohydrates_g_max WHEN carbohydrates_g_max IS NULL OR NEW.carbohydrates_g > carbohydrates_g_max THEN NEW.carbohydrates_g ELSE carbohydrates_g_max END,
+    dietary_fiber_g_count = dietary_fiber_g_count + (NEW.dietary_fiber_g IS NOT NULL),
+    dietary_fiber_g_sum = dietary_fiber_g_sum + COALESCE(NEW.dietary_fiber_g, 0),
+    dietary_fiber_g_min = CASE WHEN NEW.dietary_fiber_g IS NULL THEN dietary_fiber_g_min WHEN dietary_fiber_g_min IS NULL OR NEW.dietary_fiber_g < dietary_fiber_g_min THEN NEW.dietary_fiber_g ELSE dietary_fiber_g_min END,
+    dietary_fiber_g_max = CASE WHEN NEW.dietary_fiber_g IS NULL THEN dietary_fiber_g_max WHEN dietary_fiber_g_max IS NULL OR NEW.dietary_fiber_g > dietary_fiber_g_max THEN NEW.dietary_fiber_g ELSE dietary_fiber_g_max END WHERE group_key = COALESCE(NEW.group_id, 0);
+END;
+
+CREATE TRIGGER IF NOT EXISTS foods_stats_delete AFTER DELETE ON foods BEGIN
+UPDATE food_group_stats SET food_count = food_count - 1,
+    energy_kcal_count = energy_kcal_count - (OLD.energy_kcal IS NOT NULL),
+    energy_kcal_sum = energy_kcal_sum - COALESCE(OLD.energy_kcal, 0),
+    energy_kcal_min = CASE WHEN OLD.energy_kcal <= energy_kcal_min THEN (SELECT MIN(energy_kcal) FROM foods WHERE group_id IS OLD.group_id) ELSE energy_kcal_min END,
+    energy_kcal_max = CASE WHEN OLD.energy_kcal >= energy_kcal_max THEN (SELECT MAX(energy_kcal) FROM foods WHERE group_id IS OLD.group_id) ELSE energy_kcal_max END,
+    protein_g_count = protein_g_count - (OLD.protein_g IS NOT NULL),
+    protein_g_sum = protein_g_sum - COALESCE(OLD.protein_g, 0),
+    protein_g_min = CASE WHEN OLD.protein_g <= protein_g_min THEN (SELECT MIN(protein_g) FROM foods WHERE group_id IS OLD.group_id) ELSE protein_g_min END,
+    protein_g_max = CASE WHEN OLD.protein_g >= protein_g_max THEN (SELECT MAX(protein_g) FROM foods WHERE group_id IS OLD.group_id) ELSE protein_g_max END,
+    lipids_g_count = lipids_g_count - (OLD.lipids_g IS NOT NULL),
+    lipids_g_sum = lipids_g_sum - COALESCE(OLD.lipids_g, 0),
+    lipids_g_min = CASE WHEN OLD.lipids_g <= lipids_g_min THEN (SELECT MIN(lipids_g) FROM foods WHERE group_id IS OLD.group_id) ELSE lipids_g_min END,
+    lipids_g_max = CASE WHEN OLD.lipids_g >= lipids_g_max THEN (SELECT MAX(lipids_g) FROM foods WHERE group_id IS OLD.group_id) ELSE lipids_g_max END,
+    carbohydrates_g_count = carbohydrates_g_count - (OLD.carbohydrates_g IS NOT NULL),
+    carbohydrates_g_sum = carbohydrates_g_sum - COALESCE(OLD.carbohydrates_g, 0),
+    carbohydrates_g_min = CASE WHEN OLD.carbohydrates_g <= carbohydrates_g_min THEN (SELECT MIN(carbohydrates_g) FROM foods WHERE group_id IS OLD.group_id) ELSE carbohydrates_g_min END,
+    carbohydrates_g_max = CASE WHEN OLD.carbohydrates_g >= carbohydrates_g_max THEN (SELECT MAX(carbohydrates_g) FROM foods WHERE group_id IS OLD.group_id) ELSE carbohydrates_g_max END,
+    dietary_fiber_g_count = dietary_fiber_g_count - (OLD.dietary_fiber_g IS NOT NULL),
+    dietary_fiber_g_sum = dietary_fiber_g_sum - COALESCE(OLD.dietary_fiber_g, 0),
+    dietary_fiber_g_min = CASE WHEN OLD.dietary_fiber_g <= dietary_fiber_g_min THEN (SELECT MIN(dietary_fiber_g) FROM foods WHERE group_id IS OLD.group_id) ELSE dietary_fiber_g_min END,
+    dietary_fiber_g_max = CASE WHEN OLD.dietary_fiber_g >= dietary_fiber_g_max THEN (SELECT MAX(dietary_fiber_g) FROM foods WHERE group_id IS OLD.group_id) ELSE dietary_fiber_g_max END WHERE group_key = COALESCE(OLD.group_id, 0);
+END;
+
+CREATE TRIGGER IF NOT EXISTS foods_stats_update AFTER UPDATE ON foods BEGIN
+UPDATE food_group_stats SET food_count = food_count - 1,
+    energy_kcal_count = energy_kcal_count - (OLD.energy_kcal IS NOT NULL),
+    energy_kcal_sum = energy_kcal_sum - COALESCE(OLD.energy_kcal, 0),
+    energy_kcal_min = CASE WHEN OLD.energy_kcal <= energy_kcal_min THEN (SELECT MIN(energy_kcal) FROM foods WHERE group_id IS OLD.group_id) ELSE energy_kcal_min END,
+    energy_kcal_max = CASE WHEN OLD.energy_kcal >= energy_kcal_max THEN (SELECT MAX(energy_kcal) FROM foods WHERE group_id IS OLD.group_id) ELSE energy_kcal_max END,
+    protein_g_count = protein_g_count - (OLD.protein_g IS NOT NULL),
+    protein_g_sum = protein_g_sum - COALESCE(OLD.protein_g, 0),
+    protein_g_min = CASE WHEN OLD.protein_g <= protein_g_min THEN (SELECT MIN(protein_g) FROM foods WHERE group_id IS OLD.group_id) ELSE protein_g_min END,
+    protein_g_max = CASE WHEN OLD.protein_g >= protein_g_max THEN (SELECT MAX(protein_g) FROM foods WHERE group_id IS OLD.group_id) ELSE protein_g_max END,
+    lipids_g_count = lipids_g_count - (OLD.lipids_g IS NOT NULL),
+    lipids_g_sum = lipids_g_sum - COALESCE(OLD.lipids_g, 0),
+    lipids_g_min = CASE WHEN OLD.lipids_g <= lipids_g_min THEN (SELECT MIN(lipids_g) FROM foods WHERE group_id IS OLD.group_id) ELSE lipids_g_min END,
+    lipids_g_max = CASE WHEN OLD.lipids_g >= lipids_g_max THEN (SELECT MAX(lipids_g) FROM foods WHERE group_id IS OLD.group_id) ELSE lipids_g_max END,
+    carbohydrates_g_count = carbohydrates_g_count - (OLD.carbohydrates_g IS NOT NULL),
+    carbohydrates_g_sum = carbohydrates_g_sum - COALESCE(OLD.carbohydrates_g, 0),
+    carbohydrates_g_min = CASE WHEN OLD.carbohydrates_g <= carbohydrates_g_min THEN (SELECT MIN(carbohydrates_g) FROM foods WHERE group_id IS OLD.group_id) ELSE carbohydrates_g_min END,
+    carbohydrates_g_max = CASE WHEN OLD.carbohydrates_g >= carbohydrates_g_max THEN (SELECT MAX(carbohydrates_g) FROM foods WHERE group_id IS OLD.group_id) ELSE carbohydrates_g_max END,
+    dietary_fiber_g_count = dietary_fiber_g_count - (OLD.dietary_fiber_g IS NOT NULL),
+    dietary_fiber_g_sum = dietary_fiber_g_sum - COALESCE(OLD.dietary_fiber_g, 0),
+    dietary_fiber_g_min = CASE WHEN OLD.dietary_fiber_g <= dietary_fiber_g_min THEN (SELECT MIN(dietary_fiber_g) FROM foods WHERE group_id IS OLD.group_id) ELSE dietary_fiber_g_min END,
+    dietary_fiber_g_max = CASE WHEN OLD.dietary_fiber_g >= dietary_fiber_g_max THEN (SELECT MAX(dietary_fiber_g) FROM foods WHERE group_id IS OLD.group_id) ELSE dietary_fiber_g_max END WHERE group_key = COALESCE(OLD.group_id, 0);
+INSERT INTO food_group_stats (group_key) SELECT COALESCE(NEW.group_id, 0) WHERE NOT EXISTS (SELECT 1 FROM food_group_stats WHERE group_key = COALESCE(NEW.group_id, 0));
+UPDATE food_group_stats SET food_count = food_count + 1,
+    energy_kcal_count = energy_kcal_count + (NEW.energy_kcal IS NOT NULL),
+    energy_kcal_sum = energy_kcal_sum + COALESCE(NEW.energy_kcal, 0),
+    energy_kcal_min = CASE WHEN NEW.energy_kcal IS NULL THEN energy_kcal_min WHEN energy_kcal_min IS NULL OR NEW.energy_kcal < energy_kcal_min THEN NEW.energy_kcal ELSE energy_kcal_min END,
+    energy_kcal_max = CASE WHEN NEW.energy_kcal IS NULL THEN energy_kcal_max WHEN energy_kcal_max IS NULL OR NEW.energy_kcal > energy_kcal_max THEN NEW.energy_kcal ELSE energy_kcal_max END,
+    protein_g_count = protein_g_count + (NEW.protein_g IS NOT NULL),
+    protein_g_sum = protein_g_sum + COALESCE(NEW.protein_g, 0),
+    protein_g_min = CASE WHEN NEW.protein_g IS NULL THEN protein_g_min WHEN protein_g_min IS NULL OR NEW.protein_g < protein_g_min THEN NEW.protein_g ELSE protein_g_min END,
+    protein_g_max = CASE WHEN NEW.protein_g IS NULL THEN protein_g_max WHEN protein_g_max IS NULL OR NEW.protein_g > protein_g_max THEN NEW.protein_g ELSE protein_g_max END,
+    lipids_g_count = lipids_g_count + (NEW.lipids_g IS NOT NULL),
+    lipids_g_sum = lipids_g_sum + COALESCE(NEW.lipids_g, 0),
+    lipids_g_min = CASE WHEN NEW.lipids_g IS NULL THEN lipids_g_min WHEN lipids_g_min IS NULL OR NEW.lipids_g < lipids_g_min THEN NEW.lipids_g ELSE lipids_g_min END,
+    lipids_g_max = CASE WHEN NEW.lipids_g IS NULL THEN lipids_g_max WHEN lipids_g_max IS NULL OR NEW.lipids_g > lipids_g_max THEN NEW.lipids_g ELSE lipids_g_max END,
+    carbohydrates_g_count = carbohydrates_g_count + (NEW.carbohydrates_g IS NOT NULL),
+    carbohydrates_g_sum = carbohydrates_g_sum + COALESCE(NEW.carbohydrates_g, 0),
+    carbohydrates_g_min = CASE WHEN NEW.carbohydrates_g IS NULL THEN carbohydrates_g_min WHEN carbohydrates_g_min IS NULL OR NEW.carbohydrates_g < carbohydrates_g_min THEN NEW.carbohydrates_g ELSE carbohydrates_g_min END,
+    carbohydrates_g_max = CASE WHEN NEW.carbohydrates_g IS NULL THEN carbohydrates_g_max WHEN carbohydrates_g_max IS NULL OR NEW.carbohydrates_g > carbohydrates_g_max THEN NEW.carbohydrates_g ELSE carbohydrates_g_max END,
+    dietary_fiber_g_count = dietary_fiber_g_count + (NEW.dietary_fiber_g IS NOT NULL),
+    dietary_fiber_g_sum = dietary_fiber_g_sum + COALESCE(NEW.dietary_fiber_g, 0),
+    dietary_fiber_g_min = CASE WHEN NEW.dietary_fiber_g IS NULL THEN dietary_fiber_g_min WHEN dietary_fiber_g_min IS NULL OR NEW.dietary_fiber_g < dietary_fiber_g_min THEN NEW.dietary_fiber_g ELSE dietary_fiber_g_min END,
+    dietary_fiber_g_max = CASE WHEN NEW.dietary_fiber_g IS NULL THEN dietary_fiber_g_max WHEN dietary_fiber_g_max IS NULL OR NEW.dietary_fiber_g > dietary_fiber_g_max THEN NEW.dietary_fiber_g ELSE dietary_fiber_g_max END WHERE group_key = COALESCE(NEW.group_id, 0);
+END;
+
+-- Faixas de nutrientes (R*Tree, float32): cada alimento é um ponto; NULL ocupa a dimensão inteira.
+-- Use só como pré-filtro e confira os valores exatos em foods.
+CREATE VIRTUAL TABLE IF NOT EXISTS foods_ranges USING rtree(
+    id,
+    energy_kcal_min, energy_kcal_max,
+    protein_g_min, protein_g_max,
+    lipids_g_min, lipids_g_max,
+    carbohydrates_g_min, carbohydrates_g_max,
+    sodium_mg_min, sodium_mg_max
+);
+
+-- Busca textual sem acentos e por prefixo (rowid = foods.id; mantida pelos gatilhos foods_index_*)
+CREATE VIRTUAL TABLE IF NOT EXISTS foods_search USING fts5(
+    name, preparation, group_name,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3 4'
+);
+
+-- Gatilhos que mantêm foods_search e foods_ranges
+CREATE TRIGGER IF NOT EXISTS foods_index_insert AFTER INSERT ON foods BEGIN
+INSERT INTO foods_search (rowid, name, preparation, group_name) VALUES (NEW.id, NEW.name, NEW.preparation, (SELECT name FROM food_groups WHERE id = NEW.group_id));
+INSERT INTO foods_ranges VALUES (NEW.id, COALESCE(NEW.energy_kcal, -3e+38), COALESCE(NEW.energy_kcal, 3e+38), COALESCE(NEW.protein_g, -3e+38), COALESCE(NEW.protein_g, 3e+38), COALESCE(NEW.lipids_g, -3e+38), COALESCE(NEW.lipids_g, 3e+38), COALESCE(NEW.carbohydrates_g, -3e+38), COALESCE(NEW.carbohydrates_g, 3e+38), COALESCE(NEW.sodium_mg, -3e+38), COALESCE(NEW.sodium_mg, 3e+38));
+END;
+
+CREATE TRIGGER IF NOT EXISTS foods_index_delete AFTER DELETE ON foods BEGIN
+DELETE FROM foods_search WHERE rowid = OLD.id;
+DELETE FROM foods_ranges WHERE id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS foods_index_update AFTER UPDATE ON foods BEGIN
+DELETE FROM foods_search WHERE rowid = OLD.id;
+DELETE FROM foods_ranges WHERE id = OLD.id;
+INSERT INTO foods_search (rowid, name, preparation, group_name) VALUES (NEW.id, NEW.name, NEW.preparation, (SELECT name FROM food_groups WHERE id = NEW.group_id));
+INSERT INTO foods_ranges VALUES (NEW.id, COALESCE(NEW.energy_kcal, -3e+38), COALESCE(NEW.energy_kcal, 3e+38), COALESCE(NEW.protein_g, -3e+38), COALESCE(NEW.protein_g, 3e+38), COALESCE(NEW.lipids_g, -3e+38), COALESCE(NEW.lipids_g, 3e+38), COALESCE(NEW.carbohydrates_g, -3e+38), COALESCE(NEW.carbohydrates_g, 3e+38), COALESCE(NEW.sodium_mg, -3e+38), COALESCE(NEW.sodium_mg, 3e+38));
+END;
+
 -- Views úteis
 CREATE VIEW IF NOT EXISTS v_foods_complete AS
 SELECT 
     f.code,
+    f.preparation_code,
     f.name,
+    f.preparation,
     g.name as group_name,
     f.energy_kcal,
     f.protein_g,
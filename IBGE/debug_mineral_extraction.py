@@ -4,25 +4,26 @@ Debug específico para extração de minerais
 Foca no peito bovino para entender o problema
 """
 
-import PyPDF2
 import re
 
+from ibge_page_source import IBGEPageSource
+
 def debug_peito_bovino():
     """Debug específico do peito bovino"""
     pdf_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\taco-ibge-extractor\src\main\resources\META-INF\resources\taco\liv50002.pdf"
     
     print("=== DEBUG PEITO BOVINO - MINERAIS ===")
     
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
+    with IBGEPageSource(pdf_path) as page_source:
         
         # Buscar nas páginas de minerais (158-218)
         peito_bovino_found = False
-        for page_num in range(157, 218):  # 0-indexed
+        for page_num, text, error in page_source.iter_pages(157, 218):  # 0-indexed
+            if error is not None:
+                print(f"Erro na página {page_num + 1}: {error}")
+                continue
+            
             try:
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                
                 if "Peito bovino" in text or "7101101" in text:
                     print(f"\nENCONTRADO NA PAGINA {page_num + 1}")
                     print("─" * 80)
@@ -90,17 +91,11 @@ def debug_peito_bovino():
         
         for range_info in ranges:
             found_in_range = False
-            for page_num in range(range_info['start'] - 1, min(range_info['end'], len(pdf_reader.pages))):
-                try:
-                    page = pdf_reader.pages[page_num]
-                    text = page.extract_text()
-                    
-                    if "Peito bovino" in text or "7101101" in text:
-                        found_in_range = True
-                        print(f"  {range_info['name']}: Pagina {page_num + 1}")
-                        break
-                except:
-                    continue
+            for page_num, text, error in page_source.iter_pages(range_info['start'] - 1, range_info['end']):
+                if "Peito bovino" in text or "7101101" in text:
+                    found_in_range = True
+                    print(f"  {range_info['name']}: Pagina {page_num + 1}")
+                    break
             
             if not found_in_range:
                 print(f"  {range_info['name']}: NAO ENCONTRADO")
@@ -3,23 +3,22 @@
 Script para debug do PDF IBGE - examinar formato das páginas
 """
 
-import PyPDF2
 import re
 
+from ibge_page_source import IBGEPageSource
+
 def debug_pdf_pages():
     """Debug das páginas específicas do PDF"""
     pdf_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\taco-ibge-extractor\src\main\resources\META-INF\resources\taco\liv50002.pdf"
     
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
+    with IBGEPageSource(pdf_path) as page_source:
         
         # Examinar páginas específicas
         test_pages = [45, 50, 60, 80, 100]
         
         for page_num in test_pages:
-            if page_num < len(pdf_reader.pages):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
+            if page_num < page_source.page_count:
+                text = page_source.get_page_text(page_num)
                 
                 print(f"\n{'='*50}")
                 print(f"PÁGINA {page_num + 1}")
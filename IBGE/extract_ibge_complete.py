@@ -4,14 +4,15 @@ Extrator completo de dados IBGE do PDF oficial
 Extrai dados completos com minerais e vitaminas dos 1971 alimentos
 """
 
-import PyPDF2
 import re
 import json
 import sys
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 import os
 
+from ibge_page_source import IBGEPageSource
+
 @dataclass
 class NutrientData:
     """Estrutura para dados nutricionais completos"""
@@ -92,33 +93,31 @@ class IBGEExtractor:
             "Bebidas": "Bebidas"
         }
         
-    def extract_text_from_pdf(self) -> str:
-        """Extrai texto completo do PDF"""
+    def iter_page_texts(self) -> Iterator[Tuple[int, str]]:
+        """Gera o texto do PDF uma página por vez, sem montar o documento inteiro"""
         try:
-            with open(self.pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                
-                print(f"📄 Extraindo texto do PDF ({len(pdf_reader.pages)} páginas)...")
+            with IBGEPageSource(self.pdf_path) as page_source:
+                print(f"📄 Extraindo texto do PDF ({page_source.page_count} páginas)...")
                 
-                for page_num, page in enumerate(pdf_reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        text += f"\\n--- PÁGINA {page_num + 1} ---\\n"
-                        text += page_text
-                        
-                        if page_num % 50 == 0:
-                            print(f"   Processando página {page_num + 1}...")
-                            
-                    except Exception as e:
-                        print(f"   ⚠️  Erro na página {page_num + 1}: {str(e)}")
+                for page_num, page_text, error in page_source.iter_pages():
+                    if error is not None:
+                        print(f"   ⚠️  Erro na página {page_num + 1}: {error}")
                         continue
-                
-                return text
+                    
+                    if page_num % 50 == 0:
+                        print(f"   Processando página {page_num + 1}...")
+                    
+                    yield page_num, page_text
                 
         except Exception as e:
             print(f"❌ Erro ao ler PDF: {str(e)}")
-            return ""
+    
+    def extract_text_from_pdf(self) -> str:
+        """Extrai texto completo do PDF (prefira iter_page_texts para processar em fluxo)"""
+        return "".join(
+            f"\\n--- PÁGINA {page_num + 1} ---\\n{page_text}"
+            for page_num, page_text in self.iter_page_texts()
+        )
     
     def parse_food_tables(self, text: str) -> List[IBGEFood]:
         """Parseia as tabelas de alimentos do texto extraído"""
@@ -4,10 +4,11 @@ Encontra onde estão os 886 alimentos faltantes do PDF IBGE
 Analisa todo o PDF para identificar padrões não capturados
 """
 
-import PyPDF2
 import re
 import json
 
+from ibge_page_source import IBGEPageSource
+
 def analyze_full_pdf():
     """Analisa todo o PDF para encontrar padrões de alimentos"""
     pdf_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\taco-ibge-extractor\src\main\resources\META-INF\resources\taco\liv50002.pdf"
@@ -15,37 +16,33 @@ def analyze_full_pdf():
     food_codes_found = set()
     page_food_count = {}
     
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
-        total_pages = len(pdf_reader.pages)
+    # Leitura em fluxo: apenas a página atual fica em memória
+    with IBGEPageSource(pdf_path) as page_source:
+        total_pages = page_source.page_count
         
         print(f"=== ANÁLISE COMPLETA DO PDF IBGE ===")
         print(f"Total de páginas: {total_pages}")
         
         # Analisar todas as páginas
-        for page_num in range(total_pages):
-            try:
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
+        for page_num, text, error in page_source.iter_pages():
+            if error is not None:
+                print(f"Erro na página {page_num + 1}: {error}")
+                continue
                 
-                if text:
-                    # Buscar códigos de 7 dígitos (padrão IBGE)
-                    codes = re.findall(r'\b(\d{7})\b', text)
-                    
-                    # Filtrar códigos que parecem ser de alimentos (começam com 6, 7, 8)
-                    food_codes = [code for code in codes if code.startswith(('6', '7', '8'))]
-                    
-                    if food_codes:
-                        page_food_count[page_num + 1] = len(food_codes)
-                        food_codes_found.update(food_codes)
-                        
-                        # Mostrar progresso a cada 25 páginas
-                        if (page_num + 1) % 25 == 0:
-                            print(f"Página {page_num + 1}: {len(food_codes_found)} códigos únicos encontrados até agora")
+            if text:
+                # Buscar códigos de 7 dígitos (padrão IBGE)
+                codes = re.findall(r'\b(\d{7})\b', text)
                 
-            except Exception as e:
-                print(f"Erro na página {page_num + 1}: {str(e)}")
-                continue
+                # Filtrar códigos que parecem ser de alimentos (começam com 6, 7, 8)
+                food_codes = [code for code in codes if code.startswith(('6', '7', '8'))]
+                
+                if food_codes:
+                    page_food_count[page_num + 1] = len(food_codes)
+                    food_codes_found.update(food_codes)
+                    
+                    # Mostrar progresso a cada 25 páginas
+                    if (page_num + 1) % 25 == 0:
+                        print(f"Página {page_num + 1}: {len(food_codes_found)} códigos únicos encontrados até agora")
     
     print(f"\n=== RESULTADOS ===")
     print(f"Total de códigos únicos encontrados: {len(food_codes_found)}")
@@ -130,16 +127,14 @@ def analyze_missing_patterns():
         r'^(\d{7})',  # Qualquer código de 7 dígitos no início da linha
     ]
     
-    with open(pdf_path, 'rb') as file:
-        pdf_reader = PyPDF2.PdfReader(file)
+    with IBGEPageSource(pdf_path) as page_source:
         
         # Testar em algumas páginas específicas
         test_pages = [50, 100, 150, 200, 250, 300]
         
         for page_num in test_pages:
-            if page_num < len(pdf_reader.pages):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
+            if page_num < page_source.page_count:
+                text = page_source.get_page_text(page_num)
                 
                 print(f"\nTeste na página {page_num + 1}:")
                 
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Diferença entre duas gerações de saída da extração IBGE
+Indexa os alimentos por 'codigo' e gera um conjunto de mudanças compacto
+(adicionados, removidos e alterados, com a variação de cada nutriente)
+"""
+
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# 'id' é posicional (7000 + índice) e muda sempre que um alimento entra ou sai da lista
+IGNORED_FIELDS = ('id',)
+
+# Marca campos ausentes na versão base (distinto de um valor null)
+_MISSING = object()
+
+
+def iter_output_foods(path: str) -> Iterator[Dict[str, Any]]:
+    """Lê os alimentos de um JSON do sistema ({"alimentos": [...]}) ou de um NDJSON, em ordem"""
+    if path.endswith('.ndjson'):
+        with open(path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    record = json.loads(line)
+                    if 'metadata' not in record:
+                        yield record
+        return
+
+    with open(path, 'r', encoding='utf-8') as file:
+        yield from json.load(file)['alimentos']
+
+
+def index_by_code(foods: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Índice codigo -> alimento; códigos repetidos são um erro da saída"""
+    index = {}
+    for food in foods:
+        code = food['codigo']
+        if code in index:
+            raise ValueError(f"Código repetido na saída: {code}")
+        index[code] = food
+    return index
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+@dataclass
+class FoodChange:
+    """Alteração de um alimento: valores novos dos campos alterados e variação dos numéricos"""
+    codigo: str
+    campos: Dict[str, Any] = field(default_factory=dict)
+    deltas: Dict[str, float] = field(default_factory=dict)
+    campos_removidos: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.campos or self.campos_removidos)
+
+
+@dataclass
+class DatasetDiff:
+    """Conjunto de mudanças da saída base para a saída nova"""
+    adicionados: List[Dict[str, Any]] = field(default_factory=list)
+    removidos: List[str] = field(default_factory=list)
+    alterados: List[FoodChange] = field(default_factory=list)
+    inalterados: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.adicionados or self.removidos or self.alterados)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "resumo": {
+                "adicionados": len(self.adicionados),
+                "removidos": len(self.removidos),
+                "alterados": len(self.alterados),
+                "inalterados": self.inalterados
+            },
+            "adicionados": self.adicionados,
+            "removidos": self.removidos,
+            "alterados": [
+                {"codigo": change.codigo, "campos": change.campos, "deltas": change.deltas,
+                 **({"campos_removidos": change.campos_removidos} if change.campos_removidos else {})}
+                for change in self.alterados
+            ]
+        }
+
+
+def compare_food(old: Dict[str, Any], new: Dict[str, Any],
+                 ignored_fields: Tuple[str, ...] = IGNORED_FIELDS) -> FoodChange:
+    """Campos diferentes entre duas versões do mesmo alimento"""
+    change = FoodChange(codigo=new['codigo'])
+    for name, value in new.items():
+        if name in ignored_fields:
+            continue
+        previous = old.get(name, _MISSING)
+        if previous != value:
+            change.campos[name] = value
+            if _is_number(previous) and _is_number(value):
+                change.deltas[name] = value - previous
+    change.campos_removidos = [name for name in old if name not in new and name not in ignored_fields]
+    return change
+
+
+def diff_datasets(old_foods: Iterable[Dict[str, Any]], new_foods: Iterable[Dict[str, Any]],
+                  ignored_fields: Tuple[str, ...] = IGNORED_FIELDS) -> DatasetDiff:
+    """Compara as saídas em tempo linear: um índice da base e uma passagem pela saída nova"""
+    old_index = index_by_code(old_foods)
+    seen = set()
+    diff = DatasetDiff()
+
+    for new in new_foods:
+        code = new['codigo']
+        if code in seen:
+            raise ValueError(f"Código repetido na saída: {code}")
+        seen.add(code)
+
+        old = old_index.get(code)
+        if old is None:
+            diff.adicionados.append(new)
+            continue
+
+        change = compare_food(old, new, ignored_fields)
+        if change:
+            diff.alterados.append(change)
+        else:
+            diff.inalterados += 1
+
+    diff.removidos = [code for code in old_index if code not in seen]
+    return diff
+
+
+def apply_diff(foods: Iterable[Dict[str, Any]], changeset: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Aplica um conjunto de mudanças (DatasetDiff.to_dict) a um índice codigo -> alimento"""
+    index = {food['codigo']: dict(food) for food in foods}
+    for code in changeset['removidos']:
+        index.pop(code, None)
+    for change in changeset['alterados']:
+        food = index[change['codigo']]
+        food.update(change['campos'])
+        for name in change.get('campos_removidos', ()):
+            food.pop(name, None)
+    for food in changeset['adicionados']:
+        index[food['codigo']] = food
+    return index
+
+
+def main():
+    """Função principal: ibge_dataset_diff.py BASE NOVA [SAIDA]"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    args = sys.argv[1:]
+    old_path = args[0] if len(args) > 0 else os.path.join(base_dir, 'ibge_fixed_validated.json')
+    new_path = args[1] if len(args) > 1 else os.path.join(base_dir, 'ibge_complete_fixed.json')
+    output_path = args[2] if len(args) > 2 else os.path.join(base_dir, 'ibge_changeset.json')
+
+    print("=== DIFERENÇA ENTRE SAÍDAS IBGE ===")
+    print(f"Base: {old_path}")
+    print(f"Nova: {new_path}")
+
+    diff = diff_datasets(iter_output_foods(old_path), iter_output_foods(new_path))
+    changeset = diff.to_dict()
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(changeset, f, ensure_ascii=False, separators=(',', ':'))
+
+    summary = changeset['resumo']
+    print(f"\nAdicionados: {summary['adicionados']}")
+    print(f"Removidos: {summary['removidos']}")
+    print(f"Alterados: {summary['alterados']}")
+    print(f"Inalterados: {summary['inalterados']}")
+    print(f"Conjunto de mudanças: {output_path}")
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,14 @@ import json
 import re
 import requests
 from typing import List, Dict, Optional
-import PyPDF2
 from io import BytesIO
 
+from ibge_numeric import DecimalParser
+from ibge_page_source import IBGEPageSource
+
+# Marcadores e valores inválidos ficam como None (sem dado)
+OPTIONAL_DECIMAL_PARSER = DecimalParser(default=None)
+
 class IBGEFoodExtractor:
     def __init__(self):
         self.pdf_url = "https://biblioteca.ibge.gov.br/visualizacao/livros/liv50002.pdf"
@@ -29,19 +34,19 @@ class IBGEFoodExtractor:
         foods = []
         
         try:
-            pdf_reader = PyPDF2.PdfReader(pdf_stream)
-            
-            # Páginas que contêm as tabelas de alimentos (aproximadamente páginas 40-200)
-            for page_num in range(40, min(200, len(pdf_reader.pages))):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                
-                # Processa o texto da página para extrair alimentos
-                page_foods = self.parse_food_data(text, page_num)
-                foods.extend(page_foods)
-                
-                if page_num % 20 == 0:
-                    print(f"Processada página {page_num}, {len(foods)} alimentos encontrados...")
+            with IBGEPageSource(pdf_stream) as page_source:
+                # Páginas que contêm as tabelas de alimentos (aproximadamente páginas 40-200)
+                for page_num, text, error in page_source.iter_pages(40, 200):
+                    if error is not None:
+                        print(f"Erro na página {page_num}: {error}")
+                        continue
+                    
+                    # Processa o texto da página para extrair alimentos
+                    page_foods = self.parse_food_data(text, page_num)
+                    foods.extend(page_foods)
+                    
+                    if page_num % 20 == 0:
+                        print(f"Processada página {page_num}, {len(foods)} alimentos encontrados...")
                     
         except Exception as e:
             print(f"Erro ao processar PDF: {e}")
@@ -91,15 +96,7 @@ class IBGEFoodExtractor:
         
     def parse_number(self, value: str) -> Optional[float]:
         """Converte string para número, lidando com vírgulas decimais"""
-        if not value or value.strip() == '-' or value.strip() == 'tr':
-            return None
-            
-        try:
-            # Substitui vírgula por ponto para decimais brasileiros
-            clean_value = value.replace(',', '.').strip()
-            return float(clean_value)
-        except (ValueError, AttributeError):
-            return None
+        return OPTIONAL_DECIMAL_PARSER.parse(value)
             
     def extract_preparation(self, description: str) -> str:
         """Extrai o modo de preparo da descrição do alimento"""
@@ -4,16 +4,26 @@ Extrator COMPLETO IBGE - Todas as 4 tabelas nutricionais
 Extrai dados de macronutrientes, gorduras, minerais e vitaminas
 """
 
-import PyPDF2
-import re
-import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Any
+from collections import Counter
+from dataclasses import dataclass, fields
 import os
+import sys
+
+from ibge_food_key import pack_food_key
+from ibge_food_pack import write_food_pack
+from ibge_json_stream import SYSTEM_JSON_KEYS, write_ndjson, write_streamed_document
+from ibge_line_filter import LINE_FILTER_STATS
+from ibge_numeric import DECIMAL_PARSER
+from ibge_nutrient_matrix import NutrientMatrix, NutrientRowView
+from ibge_page_source import IBGEPageSource
+from ibge_parallel import (PageRecords, ParallelPageRunner, extract_page_chunk, iter_page_records,
+                           pop_workers_option)
+from ibge_table_schema import FoodRow, TableSchema
 
 @dataclass
 class CompleteNutrientData:
-    """Dados nutricionais completos de todas as tabelas"""
+    """Dados nutricionais completos de todas as tabelas (define as colunas da NutrientMatrix)"""
     # Tabela 1: Macronutrientes
     energia_kcal: float = 0.0
     energia_kj: float = 0.0
@@ -58,66 +68,87 @@ class CompleteNutrientData:
     vitamina_d_mcg: float = 0.0
     vitamina_e_mg: float = 0.0
 
+# Colunas da matriz de nutrientes, na ordem de CompleteNutrientData
+NUTRIENT_COLUMNS = tuple(field.name for field in fields(CompleteNutrientData))
+
 @dataclass 
 class IBGECompleteFood:
-    """Alimento IBGE com dados completos"""
+    """Alimento IBGE com dados completos; os nutrientes ficam em uma linha da NutrientMatrix"""
     code: int
     name: str
     preparation_code: int = 0
     preparation: str = ""
     group: str = ""
-    nutrients: CompleteNutrientData = None
+    nutrients: NutrientRowView = None
     
     def __post_init__(self):
         if self.nutrients is None:
-            self.nutrients = CompleteNutrientData()
+            # Alimento avulso: matriz própria de uma linha
+            matrix = NutrientMatrix(NUTRIENT_COLUMNS)
+            self.nutrients = matrix.view(matrix.add_row())
+
+# Colunas de cada tabela na ordem do PDF, mapeadas para colunas da matriz de nutrientes
+TABLE_SCHEMAS = {
+    'macronutrients': TableSchema(
+        name='Tabela 1 - Macronutrientes',
+        columns=('energia_kcal', 'proteina_g', 'lipidios_g', 'carboidrato_g', 'fibra_alimentar_g'),
+        creates_foods=True,
+        derived=(('energia_kj', 'energia_kcal', 4.184),)
+    ),
+    'fats': TableSchema(
+        name='Tabela 2 - Gorduras e açúcar',
+        columns=('colesterol_mg', 'acidos_saturados_g', 'acidos_monoinsaturados_g', 'acidos_poliinsaturados_g',
+                 'acidos_linoleico_g', 'acidos_linolenico_g', 'acidos_trans_g', 'acucar_total_g', None)
+    ),
+    'minerals': TableSchema(
+        name='Tabela 3 - Minerais',
+        columns=('calcio_mg', 'magnesio_mg', 'manganes_mg', 'fosforo_mg', 'ferro_mg',
+                 'sodio_mg', 'potassio_mg', 'cobre_mg', 'zinco_mg')
+    ),
+    'vitamins': TableSchema(
+        name='Tabela 4 - Vitaminas',
+        columns=('retinol_mcg', 'vitamina_a_rae_mcg', 'tiamina_mg', 'riboflavina_mg',
+                 'piridoxina_mg', 'niacina_mg', 'vitamina_c_mg', 'folato_mcg')
+    )
+}
+
+def parse_table_page(text: str, table_name: str) -> List[FoodRow]:
+    """Interpreta as linhas de alimentos de uma página, sem alterar os alimentos (também nos processos do pool)"""
+    return TABLE_SCHEMAS[table_name].parse_page(text, DECIMAL_PARSER.parse_row)
 
 class IBGECompleteExtractor:
     """Extrator completo de todas as 4 tabelas IBGE"""
     
     def __init__(self, pdf_path: str):
         self.pdf_path = pdf_path
-        self.foods_data = {}  # Usar dict para facilitar merge de dados
+        self.matrix = NutrientMatrix(NUTRIENT_COLUMNS)  # Nutrientes de todos os alimentos, uma linha por alimento
+        self.foods: List[IBGECompleteFood] = []  # Alimentos na ordem das linhas da matriz
+        self.row_index: Dict[int, int] = {}  # pack_food_key(código, preparo) -> linha, comum às 4 tabelas
+        self.page_source = IBGEPageSource(pdf_path)  # PDF aberto uma vez por execução
         
         # Definição das tabelas e suas faixas de páginas
         self.tables = {
             'macronutrients': {
                 'start': 35, 'end': 96, 
-                'name': 'Tabela 1 - Macronutrientes'
+                'name': TABLE_SCHEMAS['macronutrients'].name
             },
             'fats': {
                 'start': 97, 'end': 157,
-                'name': 'Tabela 2 - Gorduras e açúcar'  
+                'name': TABLE_SCHEMAS['fats'].name
             },
             'minerals': {
                 'start': 158, 'end': 218,
-                'name': 'Tabela 3 - Minerais'
+                'name': TABLE_SCHEMAS['minerals'].name
             },
             'vitamins': {
                 'start': 219, 'end': 280,
-                'name': 'Tabela 4 - Vitaminas'
+                'name': TABLE_SCHEMAS['vitamins'].name
             }
         }
         
     def parse_numeric_value(self, value: str) -> float:
         """Converte string para valor numérico"""
-        if not value or not isinstance(value, str):
-            return 0.0
-            
-        value = value.strip()
-        if value in ['Tr', 'tr', '-', 'nd', 'NA', '']:
-            return 0.0
-            
-        try:
-            # Substitui vírgula por ponto
-            value = value.replace(',', '.')
-            # Remove caracteres não numéricos exceto ponto
-            value = re.sub(r'[^\d.-]', '', value)
-            if value:
-                return float(value)
-            return 0.0
-        except (ValueError, AttributeError):
-            return 0.0
+        return DECIMAL_PARSER.parse(value)
     
     def determine_group_by_code(self, code: int) -> str:
         """Determina grupo correto pelo código IBGE"""
@@ -151,217 +182,108 @@ class IBGECompleteExtractor:
         prefix = code_str[:2]
         return code_groups.get(prefix, "Diversos")
     
-    def extract_macronutrients(self, text: str) -> List[IBGECompleteFood]:
-        """Extrai macronutrientes da Tabela 1"""
-        foods = []
-        lines = text.split('\n')
+    def parse_page(self, text: str, table_name: str) -> List[FoodRow]:
+        return parse_table_page(text, table_name)
+    
+    def apply_records(self, table_name: str, records: List[FoodRow]):
+        """Grava em lote as colunas do esquema da tabela na linha de cada alimento"""
+        schema = TABLE_SCHEMAS[table_name]
+        column_ids = self.matrix.column_ids(schema.fields)
+        write_row = self.matrix.write_row
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Padrão: CÓDIGO7DIGITOS NOME PREP_CODE PREP_DESC ENERGIA PROTEINA LIPIDIOS CARBOIDRATO FIBRA
-            pattern = r'^(\d{7})\s+([^0-9]+?)\s+(\d{1,2})\s+([^0-9]+?)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)'
-            match = re.match(pattern, line)
+        for code, name, prep_code, preparation, values in records:
+            key = pack_food_key(code, prep_code)
+            row = self.row_index.get(key)
             
-            if match:
-                code = int(match.group(1))
-                name = match.group(2).strip()
-                prep_code = int(match.group(3))
-                preparation = match.group(4).strip()
-                
+            if row is None:
+                if not schema.creates_foods:
+                    continue
                 # Criar alimento único
-                unique_key = f"{code}_{prep_code}"
-                
-                if unique_key not in self.foods_data:
-                    food = IBGECompleteFood(
-                        code=code,
-                        name=name,
-                        preparation_code=prep_code,
-                        preparation=preparation,
-                        group=self.determine_group_by_code(code)
-                    )
-                    self.foods_data[unique_key] = food
-                
-                # Adicionar dados de macronutrientes
-                food = self.foods_data[unique_key]
-                food.nutrients.energia_kcal = self.parse_numeric_value(match.group(5))
-                food.nutrients.energia_kj = food.nutrients.energia_kcal * 4.184
-                food.nutrients.proteina_g = self.parse_numeric_value(match.group(6))
-                food.nutrients.lipidios_g = self.parse_numeric_value(match.group(7))
-                food.nutrients.carboidrato_g = self.parse_numeric_value(match.group(8))
-                food.nutrients.fibra_alimentar_g = self.parse_numeric_value(match.group(9))
-                
-        return list(self.foods_data.values())
-    
-    def extract_fats_data(self, text: str):
-        """Extrai dados de gorduras da Tabela 2"""
-        lines = text.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Padrão similar mas com dados de gorduras
-            pattern = r'^(\d{7})\s+([^0-9]+?)\s+(\d{1,2})\s+([^0-9]+?)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)'
-            match = re.match(pattern, line)
+                row = self.matrix.add_row()
+                self.foods.append(IBGECompleteFood(
+                    code=code,
+                    name=name,
+                    preparation_code=prep_code,
+                    preparation=preparation,
+                    group=self.determine_group_by_code(code),
+                    nutrients=self.matrix.view(row)
+                ))
+                self.row_index[key] = row
             
-            if match:
-                code = int(match.group(1))
-                prep_code = int(match.group(3))
-                unique_key = f"{code}_{prep_code}"
-                
-                if unique_key in self.foods_data:
-                    food = self.foods_data[unique_key]
-                    # Mapear valores de gorduras (ordem pode variar)
-                    values = [match.group(i) for i in range(5, 14)]
-                    
-                    if len(values) >= 4:
-                        food.nutrients.colesterol_mg = self.parse_numeric_value(values[0])
-                        food.nutrients.acidos_saturados_g = self.parse_numeric_value(values[1])
-                        food.nutrients.acidos_monoinsaturados_g = self.parse_numeric_value(values[2])
-                        food.nutrients.acidos_poliinsaturados_g = self.parse_numeric_value(values[3])
-                    
-                    if len(values) >= 8:
-                        food.nutrients.acidos_linoleico_g = self.parse_numeric_value(values[4])
-                        food.nutrients.acidos_linolenico_g = self.parse_numeric_value(values[5])
-                        food.nutrients.acidos_trans_g = self.parse_numeric_value(values[6])
-                        food.nutrients.acucar_total_g = self.parse_numeric_value(values[7])
+            write_row(row, column_ids, values)
     
-    def extract_minerals_data(self, text: str):
-        """Extrai dados de minerais da Tabela 3"""
-        lines = text.split('\n')
+    def process_table(self, table_name: str, table_info: Dict,
+                      page_results: Optional[Iterator[PageRecords]] = None) -> int:
+        """Processa uma tabela específica (page_results vem do pool no modo paralelo)"""
+        print(f"Processando {table_info['name']}...")
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Padrão para minerais
-            pattern = r'^(\d{7})\s+([^0-9]+?)\s+(\d{1,2})\s+([^0-9]+?)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)'
-            match = re.match(pattern, line)
-            
-            if match:
-                code = int(match.group(1))
-                prep_code = int(match.group(3))
-                unique_key = f"{code}_{prep_code}"
-                
-                if unique_key in self.foods_data:
-                    food = self.foods_data[unique_key]
-                    values = [match.group(i) for i in range(5, 14)]
-                    
-                    # Mapear minerais (ordem baseada na tabela IBGE)
-                    if len(values) >= 9:
-                        food.nutrients.calcio_mg = self.parse_numeric_value(values[0])
-                        food.nutrients.magnesio_mg = self.parse_numeric_value(values[1])
-                        food.nutrients.manganes_mg = self.parse_numeric_value(values[2])
-                        food.nutrients.fosforo_mg = self.parse_numeric_value(values[3])
-                        food.nutrients.ferro_mg = self.parse_numeric_value(values[4])
-                        food.nutrients.sodio_mg = self.parse_numeric_value(values[5])
-                        food.nutrients.potassio_mg = self.parse_numeric_value(values[6])
-                        food.nutrients.cobre_mg = self.parse_numeric_value(values[7])
-                        food.nutrients.zinco_mg = self.parse_numeric_value(values[8])
-    
-    def extract_vitamins_data(self, text: str):
-        """Extrai dados de vitaminas da Tabela 4"""
-        lines = text.split('\n')
+        start_page = table_info['start']
+        if page_results is None:
+            page_results = iter_page_records(self.page_source, start_page, table_info['end'],
+                                             self.parse_page, table_name)
         
-        for line in lines:
-            line = line.strip()
-            if not line:
+        for page_num, records, error in page_results:
+            if error is not None:
+                print(f"  Erro na página {page_num + 1}: {error}")
                 continue
-                
-            # Padrão para vitaminas
-            pattern = r'^(\d{7})\s+([^0-9]+?)\s+(\d{1,2})\s+([^0-9]+?)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)\s+([\d,.-]+)'
-            match = re.match(pattern, line)
             
-            if match:
-                code = int(match.group(1))
-                prep_code = int(match.group(3))
-                unique_key = f"{code}_{prep_code}"
+            try:
+                self.apply_records(table_name, records)
                 
-                if unique_key in self.foods_data:
-                    food = self.foods_data[unique_key]
-                    values = [match.group(i) for i in range(5, 13)]
+                # Progress update
+                if (page_num - start_page + 1) % 10 == 0:
+                    current_count = len(self.foods)
+                    print(f"  Página {page_num + 1}: {current_count} alimentos")
                     
-                    # Mapear vitaminas
-                    if len(values) >= 8:
-                        food.nutrients.retinol_mcg = self.parse_numeric_value(values[0])
-                        food.nutrients.vitamina_a_rae_mcg = self.parse_numeric_value(values[1])
-                        food.nutrients.tiamina_mg = self.parse_numeric_value(values[2])
-                        food.nutrients.riboflavina_mg = self.parse_numeric_value(values[3])
-                        food.nutrients.piridoxina_mg = self.parse_numeric_value(values[4])
-                        food.nutrients.niacina_mg = self.parse_numeric_value(values[5])
-                        food.nutrients.vitamina_c_mg = self.parse_numeric_value(values[6])
-                        food.nutrients.folato_mcg = self.parse_numeric_value(values[7])
-    
-    def process_table(self, table_name: str, table_info: Dict) -> int:
-        """Processa uma tabela específica"""
-        print(f"Processando {table_info['name']}...")
+            except Exception as e:
+                print(f"  Erro na página {page_num + 1}: {str(e)}")
+                continue
         
-        with open(self.pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            foods_count = 0
-            start_page = table_info['start']
-            end_page = min(table_info['end'], len(pdf_reader.pages))
-            
-            for page_num in range(start_page, end_page):
-                try:
-                    page = pdf_reader.pages[page_num]
-                    text = page.extract_text()
-                    
-                    if text:
-                        # Processar baseado no tipo de tabela
-                        if table_name == 'macronutrients':
-                            self.extract_macronutrients(text)
-                        elif table_name == 'fats':
-                            self.extract_fats_data(text)
-                        elif table_name == 'minerals':
-                            self.extract_minerals_data(text)
-                        elif table_name == 'vitamins':
-                            self.extract_vitamins_data(text)
-                    
-                    # Progress update
-                    if (page_num - start_page + 1) % 10 == 0:
-                        current_count = len(self.foods_data)
-                        print(f"  Página {page_num + 1}: {current_count} alimentos")
-                        
-                except Exception as e:
-                    print(f"  Erro na página {page_num + 1}: {str(e)}")
-                    continue
-            
-            return len(self.foods_data)
+        # Campos calculados (ex.: energia_kj) de uma vez, sobre a coluna inteira
+        for target, source, factor in TABLE_SCHEMAS[table_name].derived:
+            self.matrix.derive_column(target, source, factor)
+        
+        return len(self.foods)
     
-    def extract_all_data(self) -> List[IBGECompleteFood]:
-        """Extrai dados de todas as 4 tabelas"""
+    def extract_all_data(self, workers: int = 1) -> List[IBGECompleteFood]:
+        """Extrai dados de todas as 4 tabelas (workers > 1 usa um pool de processos)"""
         print("=== EXTRATOR COMPLETO IBGE - 4 TABELAS ===")
+        LINE_FILTER_STATS.reset()
         
-        # Processar cada tabela em sequência
-        for table_name, table_info in self.tables.items():
-            self.process_table(table_name, table_info)
+        # Processar cada tabela em sequência, com o PDF aberto uma única vez
+        with self.page_source:
+            if workers > 1:
+                # Todas as tabelas são agendadas de uma vez; a junção segue a ordem serial
+                with ParallelPageRunner(self.page_source, workers) as runner:
+                    scheduled = [
+                        (table_name, table_info,
+                         runner.submit_range(extract_page_chunk, table_info['start'], table_info['end'],
+                                             parse_table_page, table_name))
+                        for table_name, table_info in self.tables.items()
+                    ]
+                    for table_name, table_info, futures in scheduled:
+                        self.process_table(table_name, table_info, runner.iter_results(futures))
+            else:
+                for table_name, table_info in self.tables.items():
+                    self.process_table(table_name, table_info)
         
-        foods_list = list(self.foods_data.values())
+        foods_list = list(self.foods)
         
         print(f"\nEXTRAÇÃO COMPLETA:")
         print(f"Total de alimentos únicos: {len(foods_list)}")
+        print(f"Pré-filtro de linhas: {LINE_FILTER_STATS.summary()}")
         
         return foods_list
     
-    def generate_system_json(self, foods: List[IBGECompleteFood]) -> Dict[str, Any]:
-        """Gera JSON compatível com o sistema"""
-        
-        # Estatísticas por grupo
-        group_stats = {}
-        for food in foods:
-            group = food.group
-            group_stats[group] = group_stats.get(group, 0) + 1
-        
-        # Converter alimentos para formato do sistema
-        system_foods = []
+    def group_counts(self, foods: List[IBGECompleteFood]) -> Dict[str, int]:
+        """Alimentos por grupo, na ordem em que cada grupo aparece"""
+        return dict(Counter(food.group for food in foods))
+    
+    def iter_system_foods(self, foods: List[IBGECompleteFood]) -> Iterator[Dict[str, Any]]:
+        """Converte os alimentos para o formato do sistema um a um, lendo colunas inteiras da matriz"""
+        columns = self.matrix.column_lists()
         for i, food in enumerate(foods):
+            row = food.nutrients.row
             # Nome único combinando alimento + preparação
             full_name = f"{food.name}"
             if food.preparation and food.preparation.lower() not in ['não se aplica', 'n/a']:
@@ -378,71 +300,105 @@ class IBGECompleteExtractor:
                 
                 # Macronutrientes
                 "umidade_g": 0.0,
-                "energia_kcal": food.nutrients.energia_kcal,
-                "energia_kj": food.nutrients.energia_kj, 
-                "proteina_g": food.nutrients.proteina_g,
-                "lipidios_g": food.nutrients.lipidios_g,
-                "carboidrato_g": food.nutrients.carboidrato_g,
-                "carboidrato_disponivel_g": food.nutrients.carboidrato_g,
-                "fibra_alimentar_g": food.nutrients.fibra_alimentar_g,
+                "energia_kcal": columns['energia_kcal'][row],
+                "energia_kj": columns['energia_kj'][row], 
+                "proteina_g": columns['proteina_g'][row],
+                "lipidios_g": columns['lipidios_g'][row],
+                "carboidrato_g": columns['carboidrato_g'][row],
+                "carboidrato_disponivel_g": columns['carboidrato_g'][row],
+                "fibra_alimentar_g": columns['fibra_alimentar_g'][row],
                 "fibra_solavel_g": 0.0,
                 "fibra_insolavel_g": 0.0,
                 "cinzas_g": 0.0,
                 
                 # Minerais
-                "calcio_mg": food.nutrients.calcio_mg,
-                "magnesio_mg": food.nutrients.magnesio_mg,
-                "manganes_mg": food.nutrients.manganes_mg,
-                "fosforo_mg": food.nutrients.fosforo_mg,
-                "ferro_mg": food.nutrients.ferro_mg,
-                "sodio_mg": food.nutrients.sodio_mg,
-                "potassio_mg": food.nutrients.potassio_mg,
-                "cobre_mg": food.nutrients.cobre_mg,
-                "zinco_mg": food.nutrients.zinco_mg,
+                "calcio_mg": columns['calcio_mg'][row],
+                "magnesio_mg": columns['magnesio_mg'][row],
+                "manganes_mg": columns['manganes_mg'][row],
+                "fosforo_mg": columns['fosforo_mg'][row],
+                "ferro_mg": columns['ferro_mg'][row],
+                "sodio_mg": columns['sodio_mg'][row],
+                "potassio_mg": columns['potassio_mg'][row],
+                "cobre_mg": columns['cobre_mg'][row],
+                "zinco_mg": columns['zinco_mg'][row],
                 
                 # Vitaminas
-                "retinol_mcg": food.nutrients.retinol_mcg,
-                "re_mcg": food.nutrients.vitamina_a_rae_mcg,
-                "rae_mcg": food.nutrients.vitamina_a_rae_mcg,
-                "tiamina_mg": food.nutrients.tiamina_mg,
-                "riboflavina_mg": food.nutrients.riboflavina_mg,
-                "piridoxina_mg": food.nutrients.piridoxina_mg,
-                "niacina_mg": food.nutrients.niacina_mg,
-                "vitamina_c_mg": food.nutrients.vitamina_c_mg,
-                "folato_mcg": food.nutrients.folato_mcg,
-                "vitamina_b12_mcg": food.nutrients.vitamina_b12_mcg,
-                "vitamina_d_mcg": food.nutrients.vitamina_d_mcg,
-                "vitamina_e_mg": food.nutrients.vitamina_e_mg,
+                "retinol_mcg": columns['retinol_mcg'][row],
+                "re_mcg": columns['vitamina_a_rae_mcg'][row],
+                "rae_mcg": columns['vitamina_a_rae_mcg'][row],
+                "tiamina_mg": columns['tiamina_mg'][row],
+                "riboflavina_mg": columns['riboflavina_mg'][row],
+                "piridoxina_mg": columns['piridoxina_mg'][row],
+                "niacina_mg": columns['niacina_mg'][row],
+                "vitamina_c_mg": columns['vitamina_c_mg'][row],
+                "folato_mcg": columns['folato_mcg'][row],
+                "vitamina_b12_mcg": columns['vitamina_b12_mcg'][row],
+                "vitamina_d_mcg": columns['vitamina_d_mcg'][row],
+                "vitamina_e_mg": columns['vitamina_e_mg'][row],
                 
                 # Ácidos graxos
-                "acidos_saturados_g": food.nutrients.acidos_saturados_g,
-                "acidos_monoinsaturados_g": food.nutrients.acidos_monoinsaturados_g,
-                "acidos_poliinsaturados_g": food.nutrients.acidos_poliinsaturados_g,
-                "colesterol_mg": food.nutrients.colesterol_mg
+                "acidos_saturados_g": columns['acidos_saturados_g'][row],
+                "acidos_monoinsaturados_g": columns['acidos_monoinsaturados_g'][row],
+                "acidos_poliinsaturados_g": columns['acidos_poliinsaturados_g'][row],
+                "colesterol_mg": columns['colesterol_mg'][row]
             }
-            system_foods.append(system_food)
-        
-        # Estrutura final
+            yield system_food
+    
+    def system_json_header(self) -> Dict[str, Any]:
+        """Campos fixos do JSON do sistema"""
         return {
             "version": "4.0-complete-fixed",
             "source": "IBGE - Pesquisa de Orçamentos Familiares",
             "description": "Tabelas COMPLETAS de Composição Nutricional - 4 tabelas processadas",
             "lastUpdated": "2025-08-24",
-            "totalFoods": len(system_foods),
-            "extractionMethod": "Multi-table PDF parsing - Complete data",
+            "extractionMethod": "Multi-table PDF parsing - Complete data"
+        }
+    
+    def system_json_summary(self, group_stats: Dict[str, int], total: int) -> Dict[str, Any]:
+        """Totais e grupos (group_stats de group_counts)"""
+        return {
+            "totalFoods": total,
             "grupos": [
                 {"id": self.get_group_id(group), "nome": group, "cor": self.get_group_color(group)}
                 for group in sorted(group_stats.keys())
             ],
             "categorias": sorted(list(group_stats.keys())),
-            "alimentos": system_foods,
             "estatisticas": {
-                "total_alimentos": len(system_foods),
+                "total_alimentos": total,
                 "grupos_count": len(group_stats),
                 "alimentos_por_grupo": group_stats
             }
         }
     
+    def generate_system_json(self, foods: List[IBGECompleteFood]) -> Dict[str, Any]:
+        """Gera JSON compatível com o sistema (documento inteiro em memória)"""
+        group_stats = self.group_counts(foods)
+        system_foods = list(self.iter_system_foods(foods))
+        document = {**self.system_json_header(), **self.system_json_summary(group_stats, len(system_foods)),
+                    "alimentos": system_foods}
+        return {key: document[key] for key in SYSTEM_JSON_KEYS}
+    
+    def write_system_json(self, foods: List[IBGECompleteFood], output_path: str, compact: bool = False) -> Dict[str, Any]:
+        """Grava o JSON do sistema em fluxo, um alimento por vez; devolve o resumo gravado no final"""
+        group_stats = self.group_counts(foods)
+        return write_streamed_document(output_path, self.system_json_header(), "alimentos",
+                                       self.iter_system_foods(foods),
+                                       lambda total: self.system_json_summary(group_stats, total), compact)
+    
+    def write_system_ndjson(self, foods: List[IBGECompleteFood], output_path: str) -> Dict[str, Any]:
+        """Grava um alimento por linha (NDJSON); a última linha traz cabeçalho e resumo em 'metadata'"""
+        group_stats = self.group_counts(foods)
+        return write_ndjson(output_path, self.iter_system_foods(foods),
+                            lambda total: {**self.system_json_header(), **self.system_json_summary(group_stats, total)})
+    
+    def write_food_pack(self, foods: List[IBGECompleteFood], output_path: str, dtype: str = 'd') -> int:
+        """Grava o pacote binário (ibge_food_pack) com as linhas da matriz de nutrientes"""
+        return write_food_pack(output_path, NUTRIENT_COLUMNS, (
+            (pack_food_key(food.code, food.preparation_code), food.name, food.preparation, food.group,
+             self.matrix.row_list(food.nutrients.row))
+            for food in foods
+        ), dtype)
+    
     def get_group_id(self, group: str) -> int:
         """Retorna ID do grupo"""
         group_ids = {
@@ -482,7 +438,7 @@ class IBGECompleteExtractor:
         return colors.get(group, "#6B7280")
 
 def main():
-    """Função principal"""
+    """Função principal (--workers N extrai o PDF em N processos; padrão: serial)"""
     pdf_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\taco-ibge-extractor\src\main\resources\META-INF\resources\taco\liv50002.pdf"
     
     if not os.path.exists(pdf_path):
@@ -491,7 +447,7 @@ def main():
     
     # Executar extração completa
     extractor = IBGECompleteExtractor(pdf_path)
-    foods = extractor.extract_all_data()
+    foods = extractor.extract_all_data(workers=pop_workers_option(sys.argv[1:]))
     
     if not foods:
         print("Nenhum alimento foi extraído")
@@ -499,13 +455,16 @@ def main():
     
     # Gerar JSON do sistema
     print(f"\nGerando JSON do sistema...")
-    system_data = extractor.generate_system_json(foods)
-    
-    # Salvar resultado
+    # Salvar resultado em fluxo
     output_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\ibge_complete_fixed.json"
+    system_data = extractor.write_system_json(foods, output_path)
+    
+    # Um alimento por linha, para importação incremental
+    extractor.write_system_ndjson(foods, os.path.splitext(output_path)[0] + '.ndjson')
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(system_data, f, ensure_ascii=False, indent=2)
+    # Pacote binário para carga rápida via mmap
+    pack_path = os.path.splitext(output_path)[0] + '.pack'
+    extractor.write_food_pack(foods, pack_path)
     
     print("\n=== EXTRAÇÃO COMPLETA FINALIZADA ===")
     print(f"Arquivo salvo: {output_path}")
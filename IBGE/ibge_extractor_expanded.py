@@ -4,12 +4,105 @@ Extrator IBGE EXPANDIDO - Páginas 36-340
 Captura TODOS os alimentos do PDF incluindo preparações múltiplas
 """
 
-import PyPDF2
 import re
-import json
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List
+from collections import Counter
+from dataclasses import dataclass, fields
 import os
+import sys
+
+from ibge_food_key import pack_food_key
+from ibge_food_pack import write_food_pack
+from ibge_json_stream import SYSTEM_JSON_KEYS, write_ndjson, write_streamed_document
+from ibge_line_filter import LINE_FILTER_STATS
+from ibge_numeric import DECIMAL_PARSER
+from ibge_page_source import IBGEPageSource, overlapping_pages
+from ibge_parallel import (PageRecords, ParallelPageRunner, extract_page_chunk, iter_page_records,
+                           pop_workers_option)
+
+# Padrão principal: CÓDIGO7 NOME PREP_CODE PREP_DESC VALORES...
+FOOD_LINE = re.compile(r'^(\d{7})\s+([^0-9\n]+?)\s+(\d{1,2})\s+([^0-9\n]+?)\s+(.*)')
+
+# Grupo do alimento pelos 2 primeiros dígitos do código: mapeamento expandido baseado na análise do PDF
+CODE_GROUPS = {
+    # Faixa 63-64: Cereais
+    '63': 'Cereais e Produtos de Cereais',
+    '64': 'Cereais e Produtos de Cereais',
+    
+    # Faixa 65-66: Leguminosas/Cereais
+    '65': 'Cereais e Produtos de Cereais',
+    '66': 'Leguminosas',
+    
+    # Faixa 67-68: Hortaliças 
+    '67': 'Hortaliças',
+    '68': 'Frutas e Produtos de Frutas',
+    
+    # Faixa 69-70: Açúcares/Óleos
+    '69': 'Açúcares e Produtos de Confeitaria',
+    '70': 'Óleos e Gorduras',
+    
+    # Faixa 71-72: Carnes/Peixes
+    '71': 'Carnes e Produtos Cárneus',
+    '72': 'Peixes e Frutos do Mar',
+    
+    # Faixa 73-74: Ovos/Laticínios
+    '73': 'Ovos e Derivados', 
+    '74': 'Leite e Produtos Lácteos',
+    
+    # Faixa 75-79: Frutas/Laticínios
+    '75': 'Frutas e Produtos de Frutas',
+    '76': 'Frutas e Produtos de Frutas',
+    '77': 'Hortaliças',
+    '78': 'Leite e Produtos Lácteos',
+    '79': 'Leite e Produtos Lácteos',
+    
+    # Faixa 80-85: Bebidas/Diversos
+    '80': 'Açúcares e Produtos de Confeitaria',
+    '81': 'Bebidas',
+    '82': 'Bebidas', 
+    '83': 'Bebidas',
+    '84': 'Diversos',
+    '85': 'Ovos e Derivados'
+}
+
+def determine_group_by_code(code: int) -> str:
+    """Determina grupo pelo código IBGE (expandido)"""
+    return CODE_GROUPS.get(str(code)[:2], "Diversos")
+
+def extract_food_data_flexible(text: str, table_num: int) -> List[Dict]:
+    """Extração flexível baseada na tabela (função do módulo, usada também nos processos do pool)"""
+    foods_data = []
+    
+    # Só linhas com pelo menos 20 caracteres iniciadas por código de 7 dígitos chegam ao padrão
+    for match in LINE_FILTER_STATS.match_lines(text, FOOD_LINE, min_length=20):
+        code = int(match.group(1))
+        name = match.group(2).strip()
+        prep_code = int(match.group(3))
+        preparation = match.group(4).strip()
+        values_str = match.group(5)
+        
+        # Extrair valores numéricos
+        values = re.findall(r'[\d,.-]+', values_str)
+        parsed_values = DECIMAL_PARSER.parse_row(values)
+        
+        # Criar chave única
+        unique_key = pack_food_key(code, prep_code)
+        
+        food_data = {
+            'key': unique_key,
+            'code': code,
+            'name': name,
+            'prep_code': prep_code,
+            'preparation': preparation,
+            'group': determine_group_by_code(code),
+            'values': parsed_values,
+            'table': table_num,
+            'line': match.string  # Para debug
+        }
+        
+        foods_data.append(food_data)
+    
+    return foods_data
 
 @dataclass
 class ExpandedNutrientData:
@@ -53,6 +146,9 @@ class ExpandedNutrientData:
     vitamina_d_mcg: float = 0.0
     vitamina_e_mg: float = 0.0
 
+# Colunas do pacote binário, na ordem de ExpandedNutrientData
+NUTRIENT_COLUMNS = tuple(field.name for field in fields(ExpandedNutrientData))
+
 @dataclass
 class IBGEExpandedFood:
     """Alimento IBGE expandido"""
@@ -73,7 +169,7 @@ class IBGEExpandedExtractor:
     
     def __init__(self, pdf_path: str):
         self.pdf_path = pdf_path
-        self.foods_data = {}  # key: codigo_preparacao
+        self.foods_data = {}  # key: pack_food_key(código, preparo)
         
         # Configuração expandida de páginas
         self.processing_ranges = [
@@ -92,119 +188,14 @@ class IBGEExpandedExtractor:
         
     def parse_numeric_value(self, value: str) -> float:
         """Parse robusto de valores numéricos"""
-        if not value or not isinstance(value, str):
-            return 0.0
-            
-        value = value.strip()
-        
-        # Casos especiais IBGE
-        if value in ['Tr', 'tr', '-', 'nd', 'NA', '', 'n.d.', 'n/d']:
-            return 0.0
-            
-        try:
-            # Limpar e converter
-            value = value.replace(',', '.')
-            # Remover caracteres não numéricos exceto ponto e menos
-            value = re.sub(r'[^\d.-]', '', value)
-            if value and value != '-':
-                return float(value)
-            return 0.0
-        except (ValueError, AttributeError):
-            return 0.0
+        return DECIMAL_PARSER.parse(value)
     
     def determine_group_by_code(self, code: int) -> str:
-        """Determina grupo pelo código IBGE (expandido)"""
-        code_str = str(code)
-        prefix = code_str[:2]
-        
-        # Mapeamento expandido baseado na análise do PDF
-        code_groups = {
-            # Faixa 63-64: Cereais
-            '63': 'Cereais e Produtos de Cereais',
-            '64': 'Cereais e Produtos de Cereais',
-            
-            # Faixa 65-66: Leguminosas/Cereais
-            '65': 'Cereais e Produtos de Cereais',
-            '66': 'Leguminosas',
-            
-            # Faixa 67-68: Hortaliças 
-            '67': 'Hortaliças',
-            '68': 'Frutas e Produtos de Frutas',
-            
-            # Faixa 69-70: Açúcares/Óleos
-            '69': 'Açúcares e Produtos de Confeitaria',
-            '70': 'Óleos e Gorduras',
-            
-            # Faixa 71-72: Carnes/Peixes
-            '71': 'Carnes e Produtos Cárneus',
-            '72': 'Peixes e Frutos do Mar',
-            
-            # Faixa 73-74: Ovos/Laticínios
-            '73': 'Ovos e Derivados', 
-            '74': 'Leite e Produtos Lácteos',
-            
-            # Faixa 75-79: Frutas/Laticínios
-            '75': 'Frutas e Produtos de Frutas',
-            '76': 'Frutas e Produtos de Frutas',
-            '77': 'Hortaliças',
-            '78': 'Leite e Produtos Lácteos',
-            '79': 'Leite e Produtos Lácteos',
-            
-            # Faixa 80-85: Bebidas/Diversos
-            '80': 'Açúcares e Produtos de Confeitaria',
-            '81': 'Bebidas',
-            '82': 'Bebidas', 
-            '83': 'Bebidas',
-            '84': 'Diversos',
-            '85': 'Ovos e Derivados'
-        }
-        
-        return code_groups.get(prefix, "Diversos")
-    
+        return determine_group_by_code(code)
+
     def extract_food_data_flexible(self, text: str, table_num: int) -> List[Dict]:
-        """Extração flexível baseada na tabela"""
-        foods_data = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 20:
-                continue
-            
-            # Padrão principal: CÓDIGO7 NOME PREP_CODE PREP_DESC VALORES...
-            pattern = r'^(\d{7})\s+([^0-9\n]+?)\s+(\d{1,2})\s+([^0-9\n]+?)\s+(.*)'
-            match = re.match(pattern, line)
-            
-            if match:
-                code = int(match.group(1))
-                name = match.group(2).strip()
-                prep_code = int(match.group(3))
-                preparation = match.group(4).strip()
-                values_str = match.group(5)
-                
-                # Extrair valores numéricos
-                values = re.findall(r'[\d,.-]+', values_str)
-                parsed_values = [self.parse_numeric_value(v) for v in values]
-                
-                # Criar chave única
-                unique_key = f"{code}_{prep_code}"
-                
-                food_data = {
-                    'key': unique_key,
-                    'code': code,
-                    'name': name,
-                    'prep_code': prep_code,
-                    'preparation': preparation,
-                    'group': self.determine_group_by_code(code),
-                    'values': parsed_values,
-                    'table': table_num,
-                    'line': line  # Para debug
-                }
-                
-                foods_data.append(food_data)
-        
-        return foods_data
-    
+        return extract_food_data_flexible(text, table_num)
+
     def merge_nutritional_data(self, food_data: Dict, table_num: int):
         """Mescla dados nutricionais baseado na tabela"""
         unique_key = food_data['key']
@@ -255,64 +246,77 @@ class IBGEExpandedExtractor:
             food.nutrients.vitamina_c_mg = values[4] if len(values) > 4 else 0.0
             food.nutrients.niacina_mg = values[5] if len(values) > 5 else 0.0
     
-    def process_expanded_ranges(self) -> List[IBGEExpandedFood]:
-        """Processa todas as faixas expandidas"""
-        print("=== EXTRATOR IBGE EXPANDIDO ===")
-        print("Processando páginas 36-340...")
+    def process_range(self, range_info: Dict, page_results: Iterator[PageRecords], total_pages: int):
+        """Mescla os registros de uma faixa de páginas, na ordem das páginas"""
+        start = range_info['start'] - 1  # Converter para índice 0
+        end = min(range_info['end'], total_pages)
+        table_num = range_info['table']
         
-        with open(self.pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            total_pages = len(pdf_reader.pages)
+        print(f"\nProcessando {range_info['name']} (páginas {start+1}-{end}, tabela {table_num})...")
+        
+        range_foods = 0
+        for page_num, page_foods, error in page_results:
+            if error is not None:
+                print(f"  Erro na página {page_num + 1}: {error}")
+                continue
             
-            for range_info in self.processing_ranges:
-                start = range_info['start'] - 1  # Converter para índice 0
-                end = min(range_info['end'], total_pages) 
-                table_num = range_info['table']
+            try:
+                # Mesclar com dados existentes
+                for food_data in page_foods:
+                    self.merge_nutritional_data(food_data, table_num)
                 
-                print(f"\nProcessando {range_info['name']} (páginas {start+1}-{end}, tabela {table_num})...")
+                range_foods += len(page_foods)
                 
-                range_foods = 0
-                for page_num in range(start, end):
-                    try:
-                        page = pdf_reader.pages[page_num]
-                        text = page.extract_text()
-                        
-                        if text:
-                            # Extrair dados da página
-                            page_foods = self.extract_food_data_flexible(text, table_num)
-                            
-                            # Mesclar com dados existentes
-                            for food_data in page_foods:
-                                self.merge_nutritional_data(food_data, table_num)
-                            
-                            range_foods += len(page_foods)
-                        
-                        # Progress
-                        if (page_num - start + 1) % 20 == 0:
-                            print(f"  Página {page_num + 1}: {len(self.foods_data)} alimentos únicos")
-                            
-                    except Exception as e:
-                        print(f"  Erro na página {page_num + 1}: {str(e)}")
-                        continue
-                
-                print(f"  {range_info['name']}: +{range_foods} novos registros")
+                # Progress
+                if (page_num - start + 1) % 20 == 0:
+                    print(f"  Página {page_num + 1}: {len(self.foods_data)} alimentos únicos")
+                    
+            except Exception as e:
+                print(f"  Erro na página {page_num + 1}: {str(e)}")
+                continue
+        
+        print(f"  {range_info['name']}: +{range_foods} novos registros")
+    
+    def process_expanded_ranges(self, workers: int = 1) -> List[IBGEExpandedFood]:
+        """Processa todas as faixas expandidas (workers > 1 usa um pool de processos)"""
+        print("=== EXTRATOR IBGE EXPANDIDO ===")
+        print("Processando páginas 36-340...")
+        LINE_FILTER_STATS.reset()
+        
+        # Só as páginas de faixas sobrepostas ficam em memória para a segunda leitura
+        with IBGEPageSource(self.pdf_path, keep_pages=overlapping_pages(
+                (range_info['start'] - 1, range_info['end']) for range_info in self.processing_ranges)) as page_source:
+            total_pages = page_source.page_count
+            
+            if workers > 1:
+                # Todas as faixas são agendadas de uma vez; a junção segue a ordem serial
+                with ParallelPageRunner(page_source, workers) as runner:
+                    scheduled = [
+                        runner.submit_range(extract_page_chunk, range_info['start'] - 1, range_info['end'],
+                                            extract_food_data_flexible, range_info['table'])
+                        for range_info in self.processing_ranges
+                    ]
+                    for range_info, futures in zip(self.processing_ranges, scheduled):
+                        self.process_range(range_info, runner.iter_results(futures), total_pages)
+            else:
+                for range_info in self.processing_ranges:
+                    page_results = iter_page_records(page_source, range_info['start'] - 1, range_info['end'],
+                                                     self.extract_food_data_flexible, range_info['table'])
+                    self.process_range(range_info, page_results, total_pages)
         
         foods_list = list(self.foods_data.values())
         print(f"\nEXTRACAO EXPANDIDA COMPLETA:")
         print(f"Total de alimentos únicos: {len(foods_list)}")
+        print(f"Pré-filtro de linhas: {LINE_FILTER_STATS.summary()}")
         
         return foods_list
     
-    def generate_system_json(self, foods: List[IBGEExpandedFood]) -> Dict:
-        """Gera JSON para o sistema"""
-        # Contar por grupos
-        group_stats = {}
-        for food in foods:
-            group = food.group
-            group_stats[group] = group_stats.get(group, 0) + 1
-        
-        # Converter para formato do sistema
-        system_foods = []
+    def group_counts(self, foods: List[IBGEExpandedFood]) -> Dict[str, int]:
+        """Alimentos por grupo, na ordem em que cada grupo aparece"""
+        return dict(Counter(food.group for food in foods))
+    
+    def iter_system_foods(self, foods: List[IBGEExpandedFood]) -> Iterator[Dict[str, Any]]:
+        """Converte os alimentos para o formato do sistema um a um"""
         for i, food in enumerate(foods):
             # Nome completo com preparação
             full_name = food.name
@@ -372,28 +376,63 @@ class IBGEExpandedExtractor:
                 "acidos_poliinsaturados_g": food.nutrients.acidos_poliinsaturados_g,
                 "colesterol_mg": food.nutrients.colesterol_mg
             }
-            system_foods.append(system_food)
-        
+            yield system_food
+    
+    def system_json_header(self) -> Dict[str, Any]:
+        """Campos fixos do JSON do sistema"""
         return {
             "version": "6.0-expanded-complete",
-            "source": "IBGE - Pesquisa de Orçamentos Familiares", 
+            "source": "IBGE - Pesquisa de Orçamentos Familiares",
             "description": "Tabelas COMPLETAS - Páginas 36-340 processadas",
             "lastUpdated": "2025-08-24",
-            "totalFoods": len(system_foods),
-            "extractionMethod": "Expanded multi-table parsing (pages 36-340)",
+            "extractionMethod": "Expanded multi-table parsing (pages 36-340)"
+        }
+    
+    def system_json_summary(self, group_stats: Dict[str, int], total: int) -> Dict[str, Any]:
+        """Totais e grupos (group_stats de group_counts)"""
+        return {
+            "totalFoods": total,
             "grupos": [
                 {"id": self.get_group_id(group), "nome": group, "cor": self.get_group_color(group)}
                 for group in sorted(group_stats.keys())
             ],
             "categorias": sorted(list(group_stats.keys())),
-            "alimentos": system_foods,
             "estatisticas": {
-                "total_alimentos": len(system_foods),
+                "total_alimentos": total,
                 "grupos_count": len(group_stats),
                 "alimentos_por_grupo": group_stats
             }
         }
     
+    def generate_system_json(self, foods: List[IBGEExpandedFood]) -> Dict[str, Any]:
+        """Gera JSON compatível com o sistema (documento inteiro em memória)"""
+        group_stats = self.group_counts(foods)
+        system_foods = list(self.iter_system_foods(foods))
+        document = {**self.system_json_header(), **self.system_json_summary(group_stats, len(system_foods)),
+                    "alimentos": system_foods}
+        return {key: document[key] for key in SYSTEM_JSON_KEYS}
+    
+    def write_system_json(self, foods: List[IBGEExpandedFood], output_path: str, compact: bool = False) -> Dict[str, Any]:
+        """Grava o JSON do sistema em fluxo, um alimento por vez; devolve o resumo gravado no final"""
+        group_stats = self.group_counts(foods)
+        return write_streamed_document(output_path, self.system_json_header(), "alimentos",
+                                       self.iter_system_foods(foods),
+                                       lambda total: self.system_json_summary(group_stats, total), compact)
+    
+    def write_food_pack(self, foods: List[IBGEExpandedFood], output_path: str, dtype: str = 'd') -> int:
+        """Grava o pacote binário (ibge_food_pack) com os nutrientes de cada alimento"""
+        return write_food_pack(output_path, NUTRIENT_COLUMNS, (
+            (pack_food_key(food.code, food.preparation_code), food.name, food.preparation, food.group,
+             [getattr(food.nutrients, column) for column in NUTRIENT_COLUMNS])
+            for food in foods
+        ), dtype)
+    
+    def write_system_ndjson(self, foods: List[IBGEExpandedFood], output_path: str) -> Dict[str, Any]:
+        """Grava um alimento por linha (NDJSON); a última linha traz cabeçalho e resumo em 'metadata'"""
+        group_stats = self.group_counts(foods)
+        return write_ndjson(output_path, self.iter_system_foods(foods),
+                            lambda total: {**self.system_json_header(), **self.system_json_summary(group_stats, total)})
+    
     def get_group_id(self, group: str) -> int:
         group_ids = {
             "Cereais e Produtos de Cereais": 1,
@@ -429,7 +468,7 @@ class IBGEExpandedExtractor:
         return colors.get(group, "#6B7280")
 
 def main():
-    """Função principal"""
+    """Função principal (--workers N extrai o PDF em N processos; padrão: serial)"""
     pdf_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\taco-ibge-extractor\src\main\resources\META-INF\resources\taco\liv50002.pdf"
     
     if not os.path.exists(pdf_path):
@@ -438,7 +477,7 @@ def main():
     
     # Executar extração expandida
     extractor = IBGEExpandedExtractor(pdf_path)
-    foods = extractor.process_expanded_ranges()
+    foods = extractor.process_expanded_ranges(workers=pop_workers_option(sys.argv[1:]))
     
     if not foods:
         print("Nenhum alimento foi extraído")
@@ -446,13 +485,16 @@ def main():
     
     # Gerar JSON do sistema
     print(f"\nGerando JSON expandido...")
-    system_data = extractor.generate_system_json(foods)
-    
-    # Salvar resultado
+    # Salvar resultado em fluxo
     output_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\ibge_expanded_complete.json"
+    system_data = extractor.write_system_json(foods, output_path)
+    
+    # Um alimento por linha, para importação incremental
+    extractor.write_system_ndjson(foods, os.path.splitext(output_path)[0] + '.ndjson')
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(system_data, f, ensure_ascii=False, indent=2)
+    # Pacote binário para carga rápida via mmap
+    pack_path = os.path.splitext(output_path)[0] + '.pack'
+    extractor.write_food_pack(foods, pack_path)
     
     print("\n=== EXTRAÇÃO EXPANDIDA FINALIZADA ===")
     print(f"Arquivo: {output_path}")
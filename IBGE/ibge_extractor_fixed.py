@@ -4,11 +4,95 @@ Extrator IBGE CORRIGIDO - Versão com validação rigorosa
 Resolve problemas de códigos inseridos como valores nutricionais
 """
 
-import PyPDF2
 import re
 import json
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, List
+from collections import Counter
+from dataclasses import dataclass, fields
+import os
+import sys
+
+from ibge_food_key import pack_food_key
+from ibge_food_pack import write_food_pack
+from ibge_json_stream import write_ndjson
+from ibge_line_filter import LINE_FILTER_STATS
+from ibge_numeric import DECIMAL_PARSER
+from ibge_nutrient_matrix import NutrientMatrix, NutrientRowView
+from ibge_page_source import IBGEPageSource, overlapping_pages
+from ibge_parallel import (PageRecords, ParallelPageRunner, extract_page_chunk, iter_page_records,
+                           pop_workers_option)
+
+# Padrão principal: CÓDIGO7 NOME PREP_CODE PREP_DESC VALORES...
+FOOD_LINE = re.compile(r'^(\d{7})\s+([^0-9\n]+?)\s+(\d{1,2})\s+([^0-9\n]+?)\s+(.*)')
+
+# Grupo do alimento pelos 2 primeiros dígitos do código
+CODE_GROUPS = {
+    '63': 'Cereais e Produtos de Cereais',
+    '64': 'Hortaliças', 
+    '65': 'Leguminosas',
+    '66': 'Óleos e Gorduras',
+    '67': 'Frutas e Produtos de Frutas',
+    '68': 'Açúcares e Produtos de Confeitaria',
+    '69': 'Carnes e Produtos Cárneus',
+    '70': 'Carnes e Produtos Cárneus',
+    '71': 'Carnes e Produtos Cárneus',
+    '72': 'Peixes e Frutos do Mar',
+    '73': 'Peixes e Frutos do Mar',
+    '74': 'Leite e Produtos Lácteos',
+    '75': 'Leite e Produtos Lácteos',
+    '76': 'Leite e Produtos Lácteos',
+    '77': 'Leite e Produtos Lácteos',
+    '78': 'Leite e Produtos Lácteos',
+    '79': 'Leite e Produtos Lácteos',
+    '80': 'Açúcares e Produtos de Confeitaria',
+    '81': 'Bebidas',
+    '82': 'Bebidas',
+    '83': 'Bebidas', 
+    '84': 'Diversos',
+    '85': 'Ovos e Derivados'
+}
+
+def determine_group_by_code(code: int) -> str:
+    """Determina grupo baseado no código"""
+    return CODE_GROUPS.get(str(code)[:2], "Diversos")
+
+def extract_food_data_validated(text: str, table_num: int) -> List[Dict]:
+    """Extração com validação rigorosa (função do módulo, usada também nos processos do pool)"""
+    foods_data = []
+    
+    # Só linhas com pelo menos 20 caracteres iniciadas por código de 7 dígitos chegam ao padrão
+    for match in LINE_FILTER_STATS.match_lines(text, FOOD_LINE, min_length=20):
+        code = int(match.group(1))
+        name = match.group(2).strip()
+        prep_code = int(match.group(3))
+        preparation = match.group(4).strip()
+        values_str = match.group(5)
+        
+        # Extrair apenas valores numéricos válidos
+        raw_values = re.findall(r'[\d,.-]+', values_str)
+        
+        # Filtrar valores que são códigos e converter a linha de uma vez
+        valid_values = DECIMAL_PARSER.parse_row(
+            [val for val in raw_values if len(val) != 7 or not val.isdigit()]
+        )
+        
+        # Criar dados do alimento
+        unique_key = pack_food_key(code, prep_code)
+        
+        food_data = {
+            'key': unique_key,
+            'code': code,
+            'name': name,
+            'prep_code': prep_code,
+            'preparation': preparation,
+            'group': determine_group_by_code(code),
+            'values': valid_values,
+            'table': table_num
+        }
+        
+        foods_data.append(food_data)
+    
+    return foods_data
 
 @dataclass
 class IBGENutrients:
@@ -55,20 +139,31 @@ class IBGENutrients:
     acidos_poliinsaturados_g: float = 0.0
     colesterol_mg: float = 0.0
 
+# Contagens de validação: proteína, carboidratos, energia, minerais e vitaminas acima de zero
+VALIDATION_FIELDS = ('protein', 'carbs', 'energy', 'minerals', 'vitamins')
+
+# Ordem das chaves do JSON validado
+VALIDATED_JSON_KEYS = ("version", "source", "description", "lastUpdated", "totalFoods", "extractionMethod",
+                       "validationStats", "grupos", "categorias", "alimentos")
+
+# Colunas do pacote binário, na ordem de IBGENutrients
+NUTRIENT_COLUMNS = tuple(field.name for field in fields(IBGENutrients))
+
 @dataclass
 class IBGEFixedFood:
-    """Alimento IBGE com dados validados"""
+    """Alimento IBGE com dados validados; nutrients é a linha do alimento na matriz do extrator"""
     code: int
     name: str
     preparation_code: int
     preparation: str
     group: str
-    nutrients: IBGENutrients
+    nutrients: NutrientRowView
 
 class IBGEFixedExtractor:
     def __init__(self):
         self.pdf_path = r"C:\Users\andre\OneDrive\Área de Trabalho\Sistema Nutricional\taco-ibge-extractor\src\main\resources\META-INF\resources\taco\liv50002.pdf"
-        self.foods_data = {}
+        self.foods_data = {}  # key: pack_food_key(código, preparo)
+        self.matrix = NutrientMatrix(NUTRIENT_COLUMNS)  # Nutrientes de todos os alimentos, uma linha por alimento
         
         # Ranges de processamento otimizados
         self.processing_ranges = [
@@ -136,102 +231,16 @@ class IBGEFixedExtractor:
     
     def parse_numeric_value(self, value_str: str) -> float:
         """Parse com validação melhorada"""
-        if not value_str or value_str.strip() in ['-', 'n.d.', 'n.a.', '']:
-            return 0.0
-        
-        try:
-            # Limpar e converter
-            cleaned = value_str.replace(',', '.').strip()
-            
-            # Verificar se é um código (apenas dígitos, 7 caracteres)
-            if len(cleaned) == 7 and cleaned.isdigit():
-                return 0.0  # Ignorar códigos
-                
-            return float(cleaned)
-        except (ValueError, AttributeError):
-            return 0.0
+        # Verificar se é um código (apenas dígitos, 7 caracteres)
+        if value_str and len(value_str.strip()) == 7 and value_str.strip().isdigit():
+            return 0.0  # Ignorar códigos
+        return DECIMAL_PARSER.parse(value_str)
 
     def determine_group_by_code(self, code: int) -> str:
-        """Determina grupo baseado no código"""
-        prefix = str(code)[:2]
-        
-        code_groups = {
-            '63': 'Cereais e Produtos de Cereais',
-            '64': 'Hortaliças', 
-            '65': 'Leguminosas',
-            '66': 'Óleos e Gorduras',
-            '67': 'Frutas e Produtos de Frutas',
-            '68': 'Açúcares e Produtos de Confeitaria',
-            '69': 'Carnes e Produtos Cárneus',
-            '70': 'Carnes e Produtos Cárneus',
-            '71': 'Carnes e Produtos Cárneus',
-            '72': 'Peixes e Frutos do Mar',
-            '73': 'Peixes e Frutos do Mar',
-            '74': 'Leite e Produtos Lácteos',
-            '75': 'Leite e Produtos Lácteos',
-            '76': 'Leite e Produtos Lácteos',
-            '77': 'Leite e Produtos Lácteos',
-            '78': 'Leite e Produtos Lácteos',
-            '79': 'Leite e Produtos Lácteos',
-            '80': 'Açúcares e Produtos de Confeitaria',
-            '81': 'Bebidas',
-            '82': 'Bebidas',
-            '83': 'Bebidas', 
-            '84': 'Diversos',
-            '85': 'Ovos e Derivados'
-        }
-        
-        return code_groups.get(prefix, "Diversos")
+        return determine_group_by_code(code)
 
     def extract_food_data_validated(self, text: str, table_num: int) -> List[Dict]:
-        """Extração com validação rigorosa"""
-        foods_data = []
-        lines = text.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line or len(line) < 20:
-                continue
-            
-            # Padrão principal: CÓDIGO7 NOME PREP_CODE PREP_DESC VALORES...
-            pattern = r'^(\d{7})\s+([^0-9\n]+?)\s+(\d{1,2})\s+([^0-9\n]+?)\s+(.*)'
-            match = re.match(pattern, line)
-            
-            if match:
-                code = int(match.group(1))
-                name = match.group(2).strip()
-                prep_code = int(match.group(3))
-                preparation = match.group(4).strip()
-                values_str = match.group(5)
-                
-                # Extrair apenas valores numéricos válidos
-                raw_values = re.findall(r'[\d,.-]+', values_str)
-                
-                # Filtrar valores que são códigos
-                valid_values = []
-                for val in raw_values:
-                    parsed = self.parse_numeric_value(val)
-                    # Não incluir códigos como valores
-                    if len(val) != 7 or not val.isdigit():
-                        valid_values.append(parsed)
-                
-                # Criar dados do alimento
-                unique_key = f"{code}_{prep_code}"
-                
-                food_data = {
-                    'key': unique_key,
-                    'code': code,
-                    'name': name,
-                    'prep_code': prep_code,
-                    'preparation': preparation,
-                    'group': self.determine_group_by_code(code),
-                    'values': valid_values,
-                    'table': table_num
-                }
-                
-                foods_data.append(food_data)
-        
-        return foods_data
+        return extract_food_data_validated(text, table_num)
 
     def apply_nutrients_to_food(self, food_data: Dict):
         """Aplica nutrientes com validação"""
@@ -245,7 +254,7 @@ class IBGEFixedExtractor:
                 preparation_code=food_data['prep_code'],
                 preparation=food_data['preparation'],
                 group=food_data['group'],
-                nutrients=IBGENutrients()
+                nutrients=self.matrix.view(self.matrix.add_row())
             )
             self.foods_data[unique_key] = food
         else:
@@ -309,79 +318,85 @@ class IBGEFixedExtractor:
             if len(values) >= 12:
                 food.nutrients.vitamina_c_mg = self.validate_nutritional_value(values[11], 'vitamina_c_mg')
 
-    def process_fixed_extraction(self) -> List[IBGEFixedFood]:
-        """Processa extração corrigida"""
+    def process_range(self, range_info: Dict, page_results: Iterator[PageRecords]):
+        """Aplica os registros de uma faixa de páginas, na ordem das páginas"""
+        print(f"\nProcessando {range_info['name']} (páginas {range_info['start']}-{range_info['end']}, tabela {range_info['table']})...")
+        
+        range_foods = 0
+        for page_num, foods_from_page, error in page_results:
+            if error is not None:
+                print(f"  Erro na página {page_num + 1}: {error}")
+                continue
+            
+            try:
+                # Aplicar nutrientes
+                for food_data in foods_from_page:
+                    self.apply_nutrients_to_food(food_data)
+                    range_foods += 1
+            
+            except Exception as e:
+                print(f"  Erro na página {page_num + 1}: {str(e)}")
+                continue
+        
+        print(f"  {range_info['name']}: +{range_foods} registros processados")
+        print(f"  Total único acumulado: {len(self.foods_data)} alimentos")
+
+    def process_fixed_extraction(self, workers: int = 1) -> List[IBGEFixedFood]:
+        """Processa extração corrigida (workers > 1 usa um pool de processos)"""
         print("=== EXTRATOR IBGE CORRIGIDO ===")
         print("Aplicando validacao rigorosa...")
+        LINE_FILTER_STATS.reset()
         
-        with open(self.pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            
-            for range_info in self.processing_ranges:
-                print(f"\nProcessando {range_info['name']} (páginas {range_info['start']}-{range_info['end']}, tabela {range_info['table']})...")
-                
-                range_foods = 0
-                for page_num in range(range_info['start'] - 1, range_info['end']):
-                    try:
-                        if page_num >= len(pdf_reader.pages):
-                            continue
-                            
-                        page = pdf_reader.pages[page_num]
-                        text = page.extract_text()
-                        
-                        if text:
-                            # Extrair dados da página
-                            foods_from_page = self.extract_food_data_validated(text, range_info['table'])
-                            
-                            # Aplicar nutrientes
-                            for food_data in foods_from_page:
-                                self.apply_nutrients_to_food(food_data)
-                                range_foods += 1
-                    
-                    except Exception as e:
-                        print(f"  Erro na página {page_num + 1}: {str(e)}")
-                        continue
-                
-                print(f"  {range_info['name']}: +{range_foods} registros processados")
-                print(f"  Total único acumulado: {len(self.foods_data)} alimentos")
+        # Só as páginas de faixas sobrepostas ficam em memória para a segunda leitura
+        with IBGEPageSource(self.pdf_path, keep_pages=overlapping_pages(
+                (range_info['start'] - 1, range_info['end']) for range_info in self.processing_ranges)) as page_source:
+            if workers > 1:
+                # Todas as faixas são agendadas de uma vez; a junção segue a ordem serial
+                with ParallelPageRunner(page_source, workers) as runner:
+                    scheduled = [
+                        runner.submit_range(extract_page_chunk, range_info['start'] - 1, range_info['end'],
+                                            extract_food_data_validated, range_info['table'])
+                        for range_info in self.processing_ranges
+                    ]
+                    for range_info, futures in zip(self.processing_ranges, scheduled):
+                        self.process_range(range_info, runner.iter_results(futures))
+            else:
+                for range_info in self.processing_ranges:
+                    page_results = iter_page_records(page_source, range_info['start'] - 1, range_info['end'],
+                                                     self.extract_food_data_validated, range_info['table'])
+                    self.process_range(range_info, page_results)
         
         foods_list = list(self.foods_data.values())
         print(f"\nEXTRACAO CORRIGIDA COMPLETA:")
         print(f"Total de alimentos únicos: {len(foods_list)}")
+        print(f"Pré-filtro de linhas: {LINE_FILTER_STATS.summary()}")
         
         return foods_list
 
-    def generate_validated_json(self, foods: List[IBGEFixedFood]) -> Dict:
-        """Gera JSON validado para o sistema"""
-        # Estatísticas de validação
-        valid_protein = sum(1 for f in foods if f.nutrients.proteina_g > 0)
-        valid_carbs = sum(1 for f in foods if f.nutrients.carboidrato_g > 0)
-        valid_energy = sum(1 for f in foods if f.nutrients.energia_kcal > 0)
-        valid_minerals = sum(1 for f in foods if f.nutrients.calcio_mg > 0 or f.nutrients.ferro_mg > 0)
-        valid_vitamins = sum(1 for f in foods if f.nutrients.vitamina_c_mg > 0 or f.nutrients.tiamina_mg > 0)
-        
-        print(f"\n=== ESTATISTICAS DE VALIDACAO ===")
-        print(f"Alimentos com proteína válida: {valid_protein}/{len(foods)} ({valid_protein/len(foods)*100:.1f}%)")
-        print(f"Alimentos com carboidratos válidos: {valid_carbs}/{len(foods)} ({valid_carbs/len(foods)*100:.1f}%)")
-        print(f"Alimentos com energia válida: {valid_energy}/{len(foods)} ({valid_energy/len(foods)*100:.1f}%)")
-        print(f"Alimentos com minerais válidos: {valid_minerals}/{len(foods)} ({valid_minerals/len(foods)*100:.1f}%)")
-        print(f"Alimentos com vitaminas válidas: {valid_vitamins}/{len(foods)} ({valid_vitamins/len(foods)*100:.1f}%)")
-        
-        # Contar por grupos
-        group_stats = {}
-        for food in foods:
-            group = food.group
-            group_stats[group] = group_stats.get(group, 0) + 1
-        
-        # Converter para formato do sistema
-        system_foods = []
+    def collect_validation_stats(self, foods: List[IBGEFixedFood]) -> Dict[str, Any]:
+        """Grupos e contagens de validação, calculados sobre colunas inteiras da matriz de nutrientes"""
+        rows = [food.nutrients.row for food in foods]
+        count = lambda *names: self.matrix.count_positive(names, rows)
+        return {
+            'grupos': dict(Counter(food.group for food in foods)),
+            'validacao': {
+                'protein': count('proteina_g'),
+                'carbs': count('carboidrato_g'),
+                'energy': count('energia_kcal'),
+                'minerals': count('calcio_mg', 'ferro_mg'),
+                'vitamins': count('vitamina_c_mg', 'tiamina_mg')
+            }
+        }
+    
+    def iter_validated_foods(self, foods: List[IBGEFixedFood]) -> Iterator[Dict]:
+        """Converte os alimentos um a um para o formato do sistema"""
         for idx, food in enumerate(foods):
-            nutrients_dict = asdict(food.nutrients)
+            nutrients_dict = food.nutrients.as_dict()
             
             # Garantir que umidade está presente (requerido pelo sistema)
             nutrients_dict['umidade_g'] = 0.0
             
-            system_food = {
+            yield {
                 "id": 7000 + idx,
                 "codigo": f"IBGE{food.code}_{food.preparation_code}",
                 "fonte": "IBGE",
@@ -391,22 +406,35 @@ class IBGEFixedExtractor:
                 "grupoId": self.get_group_id(food.group),
                 **nutrients_dict
             }
-            system_foods.append(system_food)
-        
-        # Estrutura JSON final
+    
+    def print_validation_stats(self, stats: Dict[str, Any], total: int):
+        """Exibe as contagens de validação de collect_validation_stats"""
+        validation = stats['validacao']
+        print(f"\n=== ESTATISTICAS DE VALIDACAO ===")
+        print(f"Alimentos com proteína válida: {validation['protein']}/{total} ({validation['protein']/total*100:.1f}%)")
+        print(f"Alimentos com carboidratos válidos: {validation['carbs']}/{total} ({validation['carbs']/total*100:.1f}%)")
+        print(f"Alimentos com energia válida: {validation['energy']}/{total} ({validation['energy']/total*100:.1f}%)")
+        print(f"Alimentos com minerais válidos: {validation['minerals']}/{total} ({validation['minerals']/total*100:.1f}%)")
+        print(f"Alimentos com vitaminas válidas: {validation['vitamins']}/{total} ({validation['vitamins']/total*100:.1f}%)")
+    
+    def validated_json_header(self) -> Dict[str, Any]:
+        """Campos fixos do JSON validado"""
         return {
             "version": "7.0-validated-fixed",
             "source": "IBGE - Pesquisa de Orçamentos Familiares",
             "description": "Dados CORRIGIDOS com validação rigorosa",
             "lastUpdated": "2025-08-24",
-            "totalFoods": len(foods),
-            "extractionMethod": "Fixed parser with nutritional validation",
+            "extractionMethod": "Fixed parser with nutritional validation"
+        }
+    
+    def validated_json_summary(self, stats: Dict[str, Any], total: int) -> Dict[str, Any]:
+        """Totais, validação e grupos (stats de collect_validation_stats)"""
+        validation = stats['validacao']
+        return {
+            "totalFoods": total,
             "validationStats": {
-                "validProtein": f"{valid_protein}/{len(foods)} ({valid_protein/len(foods)*100:.1f}%)",
-                "validCarbs": f"{valid_carbs}/{len(foods)} ({valid_carbs/len(foods)*100:.1f}%)",
-                "validEnergy": f"{valid_energy}/{len(foods)} ({valid_energy/len(foods)*100:.1f}%)",
-                "validMinerals": f"{valid_minerals}/{len(foods)} ({valid_minerals/len(foods)*100:.1f}%)",
-                "validVitamins": f"{valid_vitamins}/{len(foods)} ({valid_vitamins/len(foods)*100:.1f}%)"
+                f"valid{field.capitalize()}": f"{validation[field]}/{total} ({validation[field]/total*100:.1f}%)"
+                for field in VALIDATION_FIELDS
             },
             "grupos": [
                 {"id": 1, "nome": "Cereais e Produtos de Cereais", "cor": "#F59E0B"},
@@ -422,10 +450,29 @@ class IBGEFixedExtractor:
                 {"id": 11, "nome": "Leguminosas", "cor": "#059669"},
                 {"id": 12, "nome": "Diversos", "cor": "#6B7280"}
             ],
-            "categorias": list(group_stats.keys()),
-            "alimentos": system_foods
+            "categorias": list(stats['grupos'].keys())
         }
     
+    def generate_validated_json(self, foods: List[IBGEFixedFood]) -> Dict:
+        """Gera JSON validado para o sistema"""
+        stats = self.collect_validation_stats(foods)
+        system_foods = list(self.iter_validated_foods(foods))
+        self.print_validation_stats(stats, len(foods))
+        
+        # Estrutura JSON final
+        document = {**self.validated_json_header(), **self.validated_json_summary(stats, len(foods)),
+                    "alimentos": system_foods}
+        return {key: document[key] for key in VALIDATED_JSON_KEYS}
+    
+    def write_validated_ndjson(self, foods: List[IBGEFixedFood], output_path: str) -> Dict[str, Any]:
+        """Grava um alimento por linha (NDJSON); a última linha traz cabeçalho, validação e grupos em 'metadata'"""
+        stats = self.collect_validation_stats(foods)
+        
+        def metadata(total: int) -> Dict[str, Any]:
+            return {**self.validated_json_header(), **self.validated_json_summary(stats, total)}
+        
+        return write_ndjson(output_path, self.iter_validated_foods(foods), metadata)
+    
     def get_group_id(self, group_name: str) -> int:
         """Mapeia nome do grupo para ID"""
         group_mapping = {
@@ -444,13 +491,21 @@ class IBGEFixedExtractor:
         }
         return group_mapping.get(group_name, 12)
 
+    def write_food_pack(self, foods: List[IBGEFixedFood], output_path: str, dtype: str = 'd') -> int:
+        """Grava o pacote binário (ibge_food_pack) com os nutrientes de cada alimento"""
+        return write_food_pack(output_path, NUTRIENT_COLUMNS, (
+            (pack_food_key(food.code, food.preparation_code), food.name, food.preparation, food.group,
+             self.matrix.row_list(food.nutrients.row))
+            for food in foods
+        ), dtype)
+
 def main():
-    """Função principal"""
+    """Função principal (--workers N extrai o PDF em N processos; padrão: serial)"""
     extractor = IBGEFixedExtractor()
     
     try:
         # Processar extração corrigida
-        foods = extractor.process_fixed_extraction()
+        foods = extractor.process_fixed_extraction(workers=pop_workers_option(sys.argv[1:]))
         
         # Gerar JSON validado
         print("\nGerando JSON validado...")
@@ -461,6 +516,13 @@ def main():
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(json_data, f, indent=2, ensure_ascii=False)
         
+        # Um alimento por linha, para importação incremental
+        extractor.write_validated_ndjson(foods, os.path.splitext(output_path)[0] + '.ndjson')
+        
+        # Pacote binário para carga rápida via mmap
+        pack_path = os.path.splitext(output_path)[0] + '.pack'
+        extractor.write_food_pack(foods, pack_path)
+        
         print(f"\n=== EXTRACAO CORRIGIDA FINALIZADA ===")
         print(f"Arquivo: {output_path}")
         print(f"Total: {len(foods)} alimentos validados")
@@ -0,0 +1,20 @@
+"""
+Chave inteira única dos alimentos IBGE
+Combina o código de 7 dígitos e o código de preparo (1 ou 2 dígitos) em um único int
+"""
+
+from typing import Tuple
+
+# O código de preparo tem no máximo 2 dígitos
+PREP_CODE_RADIX = 100
+
+
+def pack_food_key(code: int, prep_code: int) -> int:
+    """(6704101, 10) -> 670410110"""
+    return code * PREP_CODE_RADIX + prep_code
+
+
+def unpack_food_key(key: int) -> Tuple[int, int]:
+    """670410110 -> (6704101, 10)"""
+    return divmod(key, PREP_CODE_RADIX)
+
@@ -0,0 +1,187 @@
+"""
+Pacote binário de alimentos IBGE ("food pack")
+Matriz de nutrientes de largura fixa, tabela de textos por offsets e índice código -> linha,
+lido via mmap: abrir o arquivo não interpreta nada além do cabeçalho
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ibge_food_key import pack_food_key, unpack_food_key
+
+PACK_MAGIC = b'IBGEPACK'
+PACK_VERSION = 1
+
+# Seções na ordem em que aparecem no arquivo, cada uma alinhada em 8 bytes
+PACK_SECTIONS = ('columns', 'matrix', 'row_keys', 'lookup_keys', 'lookup_rows', 'string_index', 'strings')
+
+# magic, versão, tipo dos valores ('f' = float32, 'd' = float64), linhas, colunas, offset de cada seção, tamanho total
+PACK_HEADER = struct.Struct('<8sHcxII' + 'Q' * len(PACK_SECTIONS) + 'Q')
+
+# Textos gravados por alimento, na ordem da tabela de offsets
+PACK_TEXT_FIELDS = ('name', 'preparation', 'group')
+
+# (chave pack_food_key, nome, preparo, grupo, valores na ordem das colunas)
+PackRow = Tuple[int, str, str, str, Sequence[float]]
+
+
+def _little_endian(data: array) -> bytes:
+    if sys.byteorder != 'little':
+        data = array(data.typecode, data)
+        data.byteswap()
+    return data.tobytes()
+
+
+def _padding(size: int) -> bytes:
+    return b'\0' * (-size % 8)
+
+
+def write_food_pack(output_path: str, columns: Sequence[str], rows: Iterable[PackRow], dtype: str = 'd') -> int:
+    """Grava o pacote; dtype 'f' (float32) reduz a matriz à metade com ~7 dígitos de precisão"""
+    if dtype not in ('f', 'd'):
+        raise ValueError(f"dtype deve ser 'f' ou 'd', não {dtype!r}")
+
+    width = len(columns)
+    matrix = array(dtype)
+    row_keys = array('q')
+    string_index = array('I', [0])
+    strings = bytearray()
+
+    for key, name, preparation, group, values in rows:
+        if len(values) != width:
+            raise ValueError(f"Alimento {key}: {len(values)} valores para {width} colunas")
+        matrix.fromlist(list(values))
+        row_keys.append(key)
+        for text in (name, preparation, group):
+            strings += (text or "").encode('utf-8')
+            string_index.append(len(strings))
+
+    # Índice ordenado por chave para busca binária direto no arquivo
+    lookup = sorted(range(len(row_keys)), key=row_keys.__getitem__)
+    sections = {
+        'columns': '\n'.join(columns).encode('utf-8'),
+        'matrix': _little_endian(matrix),
+        'row_keys': _little_endian(row_keys),
+        'lookup_keys': _little_endian(array('q', (row_keys[row] for row in lookup))),
+        'lookup_rows': _little_endian(array('I', lookup)),
+        'string_index': _little_endian(string_index),
+        'strings': bytes(strings)
+    }
+
+    offsets = []
+    position = PACK_HEADER.size + len(_padding(PACK_HEADER.size))
+    for name in PACK_SECTIONS:
+        offsets.append(position)
+        position += len(sections[name]) + len(_padding(len(sections[name])))
+
+    with open(output_path, 'wb') as file:
+        header = PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, dtype.encode('ascii'), len(row_keys), width,
+                                  *offsets, position)
+        file.write(header + _padding(len(header)))
+        for name in PACK_SECTIONS:
+            file.write(sections[name] + _padding(len(sections[name])))
+
+    return len(row_keys)
+
+
+class FoodPack:
+    """Leitor do pacote via mmap; cada consulta lê só os bytes do alimento pedido"""
+
+    def __init__(self, pack_path: str):
+        if sys.byteorder != 'little':
+            raise ValueError("O pacote de alimentos é little-endian e não pode ser mapeado nesta plataforma")
+
+        self.pack_path = pack_path
+        self._file = open(pack_path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, dtype, rows, width, *offsets, size = PACK_HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"{pack_path} não é um pacote de alimentos IBGE v{PACK_VERSION}")
+        if size != len(self._mmap):
+            actual = len(self._mmap)
+            self.close()
+            raise ValueError(f"{pack_path} está truncado ({actual} de {size} bytes)")
+
+        self.dtype = dtype.decode('ascii')
+        self.row_count = rows
+        self.width = width
+        self._view = memoryview(self._mmap)
+        offsets = dict(zip(PACK_SECTIONS, offsets))
+
+        def section(name: str, typecode: str, count: int) -> memoryview:
+            start = offsets[name]
+            return self._view[start:start + count * struct.calcsize(typecode)].cast(typecode)
+
+        columns_text = bytes(self._view[offsets['columns']:offsets['matrix']]).rstrip(b'\0').decode('utf-8')
+        self.columns = tuple(columns_text.split('\n')) if width else ()
+        self.column_index = {name: index for index, name in enumerate(self.columns)}
+        self._matrix = section('matrix', self.dtype, rows * width)
+        self._row_keys = section('row_keys', 'q', rows)
+        self._lookup_keys = section('lookup_keys', 'q', rows)
+        self._lookup_rows = section('lookup_rows', 'I', rows)
+        self._string_index = section('string_index', 'I', rows * len(PACK_TEXT_FIELDS) + 1)
+        self._strings_offset = offsets['strings']
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __enter__(self) -> "FoodPack":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Libera as visões antes de fechar o mmap (exigido pelo buffer protocol)"""
+        for name in ('_matrix', '_row_keys', '_lookup_keys', '_lookup_rows', '_string_index', '_view'):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def find_row(self, code: int, preparation_code: int) -> Optional[int]:
+        """Linha do alimento por busca binária no índice, ou None"""
+        key = pack_food_key(code, preparation_code)
+        position = bisect_left(self._lookup_keys, key)
+        if position < self.row_count and self._lookup_keys[position] == key:
+            return self._lookup_rows[position]
+        return None
+
+    def _text(self, row: int, field: int) -> str:
+        slot = row * len(PACK_TEXT_FIELDS) + field
+        start = self._strings_offset + self._string_index[slot]
+        end = self._strings_offset + self._string_index[slot + 1]
+        return bytes(self._view[start:end]).decode('utf-8')
+
+    def value(self, row: int, column: str) -> float:
+        return self._matrix[row * self.width + self.column_index[column]]
+
+    def values(self, row: int) -> List[float]:
+        base = row * self.width
+        return self._matrix[base:base + self.width].tolist()
+
+    def food(self, row: int) -> Dict[str, Any]:
+        """Um alimento completo (textos e nutrientes) a partir do número da linha"""
+        if not 0 <= row < self.row_count:
+            raise IndexError(f"Linha {row} fora do pacote ({self.row_count} alimentos)")
+        code, preparation_code = unpack_food_key(self._row_keys[row])
+        food = {'code': code, 'preparation_code': preparation_code}
+        for field, name in enumerate(PACK_TEXT_FIELDS):
+            food[name] = self._text(row, field)
+        food['nutrients'] = dict(zip(self.columns, self.values(row)))
+        return food
+
+    def get(self, code: int, preparation_code: int) -> Optional[Dict[str, Any]]:
+        row = self.find_row(code, preparation_code)
+        return None if row is None else self.food(row)
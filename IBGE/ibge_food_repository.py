@@ -0,0 +1,187 @@
+"""
+Camada de consulta da base SQLite de alimentos IBGE (gerada por create_ibge_foods_db.py)
+Consultas fixas (preparadas uma vez por conexão), cache LRU de resultados invalidado quando a base
+muda (PRAGMA data_version) e um pool de conexões somente leitura para leitores concorrentes
+"""
+
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+from create_ibge_foods_db import NUTRIENT_COLUMNS
+
+FOOD_SELECT = '''
+SELECT f.code, f.preparation_code, f.name, f.preparation, g.name, {nutrients}
+FROM foods f
+LEFT JOIN food_groups g ON f.group_id = g.id
+'''.format(nutrients=', '.join(f"f.{column}" for column, _ in NUTRIENT_COLUMNS))
+
+# SQL constante: o cache de statements do sqlite3 reaproveita a preparação em cada conexão
+SQL_BY_KEY = FOOD_SELECT + 'WHERE f.code = ? AND f.preparation_code = ?'
+SQL_BY_CODE = FOOD_SELECT + 'WHERE f.code = ? ORDER BY f.preparation_code'
+SQL_BY_GROUP = FOOD_SELECT + 'WHERE g.name = ? ORDER BY f.code, f.preparation_code'
+# Faixa [prefixo, prefixo + U+10FFFF) usa o índice idx_foods_name (diferencia maiúsculas e acentos)
+SQL_BY_NAME_PREFIX = FOOD_SELECT + 'WHERE f.name >= ? AND f.name < ? ORDER BY f.name, f.code, f.preparation_code LIMIT ?'
+
+# Resultado imutável: tupla de alimentos (dicts compartilhados pelo cache; não modifique)
+FoodResult = Tuple[Dict[str, Any], ...]
+
+# Marca de ausência no cache (None pode ser um valor guardado)
+_MISSING = object()
+
+
+def row_to_food(row: tuple) -> Dict[str, Any]:
+    return {
+        "code": row[0],
+        "preparation_code": row[1],
+        "name": row[2],
+        "preparation": row[3],
+        "group": row[4],
+        "nutrients": {column: value for (column, _), value in zip(NUTRIENT_COLUMNS, row[5:]) if value is not None}
+    }
+
+
+class LRUCache:
+    """Cache de tamanho limitado; descarta o resultado usado há mais tempo"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Valor guardado em key, ou default se não houver (um None guardado conta como acerto)"""
+        value = self.entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class ReadOnlyConnectionPool:
+    """Conexões mode=ro abertas sob demanda (até size); cada uma atende uma thread por vez"""
+
+    def __init__(self, db_path: str, size: int = 4):
+        self.db_path = db_path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        # as_uri escapa '?', '#' e '%' do caminho, que a URI do SQLite interpretaria
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Conexão livre do pool; abre uma nova se nenhuma estiver livre e o limite permitir, senão espera"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            conn = self.connect() if can_open else self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        """Fecha as conexões livres (chamar quando não houver consultas em andamento)"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._opened -= 1
+
+
+class FoodRepository:
+    """Consultas de leitura sobre foods: por código/preparo, por grupo e por prefixo do nome"""
+
+    def __init__(self, db_path: str = "alimentos_ibge.db", pool_size: int = 4, cache_size: int = 1024):
+        self.db_path = db_path
+        self.pool = ReadOnlyConnectionPool(db_path, pool_size)
+        self.cache = LRUCache(cache_size)
+        self._cache_lock = threading.Lock()
+        # data_version só é comparável na mesma conexão: uma conexão dedicada observa as escritas
+        self._version_conn = self.pool.connect()
+        self._data_version = self._read_data_version()
+
+    def __enter__(self) -> "FoodRepository":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.pool.close()
+        if self._version_conn is not None:
+            self._version_conn.close()
+            self._version_conn = None
+
+    def _read_data_version(self) -> int:
+        return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def invalidate(self):
+        with self._cache_lock:
+            self.cache.clear()
+
+    def _cached(self, key: Hashable, sql: str, params: tuple) -> FoodResult:
+        """Resultado do cache se a base não mudou desde a última consulta; senão consulta o pool"""
+        with self._cache_lock:
+            version = self._read_data_version()
+            if version != self._data_version:
+                # Outra conexão gravou na base: todos os resultados em cache podem estar velhos
+                self.cache.clear()
+                self._data_version = version
+            result = self.cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        with self.pool.acquire() as conn:
+            result = tuple(row_to_food(row) for row in conn.execute(sql, params))
+
+        with self._cache_lock:
+            if self._data_version == version:
+                self.cache.put(key, result)
+        return result
+
+    def get(self, code: int, preparation_code: int) -> Optional[Dict[str, Any]]:
+        """Um alimento por (código, código de preparo), ou None"""
+        result = self._cached(('key', code, preparation_code), SQL_BY_KEY, (code, preparation_code))
+        return result[0] if result else None
+
+    def by_code(self, code: int) -> FoodResult:
+        """Todas as preparações de um código"""
+        return self._cached(('code', code), SQL_BY_CODE, (code,))
+
+    def by_group(self, group: str) -> FoodResult:
+        return self._cached(('group', group), SQL_BY_GROUP, (group,))
+
+    def by_name_prefix(self, prefix: str, limit: int = 20) -> FoodResult:
+        """Alimentos cujo nome começa com prefix (comparação exata; para busca sem acentos use search_foods)"""
+        return self._cached(('prefix', prefix, limit), SQL_BY_NAME_PREFIX, (prefix, prefix + '\U0010ffff', limit))
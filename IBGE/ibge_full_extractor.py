@@ -4,7 +4,6 @@ Extrator completo de dados IBGE do PDF oficial
 Extrai TODOS os ~1971 alimentos do PDF liv50002.pdf
 """
 
-import PyPDF2
 import re
 import json
 import sys
@@ -12,6 +11,10 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 import os
 
+from ibge_line_filter import LINE_FILTER_STATS, is_food_line
+from ibge_numeric import DECIMAL_PARSER
+from ibge_page_source import IBGEPageSource
+
 @dataclass
 class IBGEFood:
     """Estrutura para alimento IBGE completo"""
@@ -78,25 +81,7 @@ class IBGEPDFExtractor:
         
     def parse_numeric_value(self, value: str) -> float:
         """Converte string para valor numérico, tratando casos especiais"""
-        if not value or not isinstance(value, str):
-            return 0.0
-            
-        value = value.strip()
-        
-        # Casos especiais
-        if value in ['Tr', 'tr', '-', 'nd', 'NA', '']:
-            return 0.0
-            
-        try:
-            # Substitui vírgula por ponto (padrão brasileiro)
-            value = value.replace(',', '.')
-            # Remove caracteres não numéricos exceto ponto
-            value = re.sub(r'[^\d.]', '', value)
-            if value:
-                return float(value)
-            return 0.0
-        except (ValueError, AttributeError):
-            return 0.0
+        return DECIMAL_PARSER.parse(value)
     
     def identify_food_group(self, text: str) -> Optional[str]:
         """Identifica grupo alimentar no texto"""
@@ -136,6 +121,7 @@ class IBGEPDFExtractor:
         pattern = r'^(\d{7})\s+([^0-9]+?)\s+(\d{1,2})\s+([^0-9]+?)\s+([\d,.\-]+(?:\s+[\d,.\-]+)*)'
         
         match = re.match(pattern, line.strip())
+        LINE_FILTER_STATS.record_match(match is not None)
         if not match:
             return None
             
@@ -174,22 +160,14 @@ class IBGEPDFExtractor:
             preparation=preparation
         )
         
-        # Mapear valores nutricionais (conforme tabela IBGE)
-        if len(values) >= 1:
-            food.energy_kcal = self.parse_numeric_value(values[0])
-            food.energy_kj = food.energy_kcal * 4.184  # Conversão kcal -> kJ
-            
-        if len(values) >= 2:
-            food.protein_g = self.parse_numeric_value(values[1])
-            
-        if len(values) >= 3:
-            food.lipids_g = self.parse_numeric_value(values[2])
-            
-        if len(values) >= 4:
-            food.carbohydrates_g = self.parse_numeric_value(values[3])
-            
-        if len(values) >= 5:
-            food.dietary_fiber_g = self.parse_numeric_value(values[4])
+        # Mapear valores nutricionais (conforme tabela IBGE), convertidos em lote
+        energy_kcal, protein_g, lipids_g, carbohydrates_g, dietary_fiber_g = DECIMAL_PARSER.parse_row(values[:5])
+        food.energy_kcal = energy_kcal
+        food.energy_kj = food.energy_kcal * 4.184  # Conversão kcal -> kJ
+        food.protein_g = protein_g
+        food.lipids_g = lipids_g
+        food.carbohydrates_g = carbohydrates_g
+        food.dietary_fiber_g = dietary_fiber_g
             
         return food
         
@@ -230,34 +208,42 @@ class IBGEPDFExtractor:
         """Processa texto de uma página e extrai alimentos"""
         foods = []
         lines = page_text.split('\n')
+        candidates = 0
         
         for line in lines:
             line = line.strip()
             if not line:
                 continue
                 
-            # Detectar cabeçalhos de grupo
-            group_detected = self.identify_food_group(line)
-            if group_detected and len(line.split()) <= 6:  # Cabeçalhos são geralmente curtos
-                self.current_group = group_detected
+            # Detectar cabeçalhos de grupo (curtos; o tamanho é testado antes das buscas por regex)
+            if len(line.split()) <= 6:
+                group_detected = self.identify_food_group(line)
+                if group_detected:
+                    self.current_group = group_detected
+                    continue
+            
+            # Pré-filtro: só linhas iniciadas por código de 7 dígitos chegam ao padrão completo
+            if not is_food_line(line):
                 continue
+            candidates += 1
                 
             # Tentar extrair alimento da linha
             food = self.extract_food_from_line(line, page_num)
             if food:
                 foods.append(food)
-                
+        
+        LINE_FILTER_STATS.record_lines(len(lines), candidates)
         return foods
     
     def extract_all_foods(self) -> List[IBGEFood]:
         """Extrai todos os alimentos do PDF"""
         print("Iniciando extração completa do PDF IBGE...")
         print(f"Arquivo: {self.pdf_path}")
+        LINE_FILTER_STATS.reset()
         
         try:
-            with open(self.pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
+            with IBGEPageSource(self.pdf_path) as page_source:
+                total_pages = page_source.page_count
                 
                 print(f"Total de páginas: {total_pages}")
                 print("Processando páginas 40-200 (tabelas nutricionais)...")
@@ -268,11 +254,12 @@ class IBGEPDFExtractor:
                 start_page = 39  # Página 40 (índice 39)
                 end_page = min(200, total_pages)  # Página 200 ou última página
                 
-                for page_num in range(start_page, end_page):
+                for page_num, page_text, error in page_source.iter_pages(start_page, end_page):
+                    if error is not None:
+                        print(f"   Erro na página {page_num + 1}: {error}")
+                        continue
+                    
                     try:
-                        page = pdf_reader.pages[page_num]
-                        page_text = page.extract_text()
-                        
                         if page_text:
                             page_foods = self.process_page(page_text, page_num + 1)
                             all_foods.extend(page_foods)
@@ -286,6 +273,7 @@ class IBGEPDFExtractor:
                         continue
                 
                 print(f"Extração completa: {len(all_foods)} alimentos encontrados")
+                print(f"Pré-filtro de linhas: {LINE_FILTER_STATS.summary()}")
                 return all_foods
                 
         except Exception as e:
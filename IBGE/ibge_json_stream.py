@@ -0,0 +1,99 @@
+"""
+Escrita de JSON em fluxo para os arquivos do sistema
+Cada alimento é gravado no arquivo assim que é gerado, sem montar o documento inteiro em memória
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, TextIO
+
+# Ordem das chaves do JSON do sistema gerado em memória
+SYSTEM_JSON_KEYS = ("version", "source", "description", "lastUpdated", "totalFoods", "extractionMethod",
+                    "grupos", "categorias", "alimentos", "estatisticas")
+
+
+class JSONStreamWriter:
+    """Escreve um objeto JSON de primeiro nível membro a membro, com uma lista gravada item a item"""
+
+    def __init__(self, file: TextIO, compact: bool = False, indent: int = 2):
+        self.file = file
+        # Modo compacto: sem quebras de linha nem espaços (mesmo conteúdo, arquivo menor)
+        self.indent = None if compact else indent
+        self.separators = (',', ':') if compact else (',', ': ')
+        self._newline = '' if compact else '\n'
+        self._members = 0
+        self._items = 0
+        self.file.write('{')
+
+    def _pad(self, level: int) -> str:
+        return self._newline + (' ' * (self.indent * level) if self.indent else '')
+
+    def _encode(self, value: Any, level: int) -> str:
+        """Mesmo texto de json.dump(indent=...), deslocado para o nível de aninhamento"""
+        text = json.dumps(value, ensure_ascii=False, indent=self.indent, separators=self.separators)
+        if self.indent:
+            text = text.replace('\n', self._pad(level))
+        return text
+
+    def _begin_member(self, key: str):
+        if self._members:
+            self.file.write(',')
+        self._members += 1
+        self.file.write(self._pad(1) + json.dumps(key, ensure_ascii=False) + self.separators[1])
+
+    def write_member(self, key: str, value: Any):
+        self._begin_member(key)
+        self.file.write(self._encode(value, 1))
+
+    def begin_array(self, key: str):
+        self._begin_member(key)
+        self.file.write('[')
+        self._items = 0
+
+    def write_item(self, item: Any):
+        if self._items:
+            self.file.write(',')
+        self._items += 1
+        self.file.write(self._pad(2) + self._encode(item, 2))
+
+    def end_array(self):
+        self.file.write((self._pad(1) if self._items else '') + ']')
+
+    def close(self):
+        self.file.write((self._pad(0) if self._members else '') + '}')
+
+
+def write_streamed_document(output_path: str, header: Dict[str, Any], items_key: str, items: Iterable[Any],
+                            summarize: Callable[[int], Dict[str, Any]], compact: bool = False) -> Dict[str, Any]:
+    """Grava {cabeçalho, items_key: [...], resumo}; o resumo é montado depois da lista, com o total de itens"""
+    with open(output_path, 'w', encoding='utf-8') as file:
+        writer = JSONStreamWriter(file, compact)
+        for key, value in header.items():
+            writer.write_member(key, value)
+
+        writer.begin_array(items_key)
+        total = 0
+        for item in items:
+            writer.write_item(item)
+            total += 1
+        writer.end_array()
+
+        summary = summarize(total)
+        for key, value in summary.items():
+            writer.write_member(key, value)
+        writer.close()
+
+    return summary
+
+
+def write_ndjson(output_path: str, items: Iterable[Any], metadata: Callable[[int], Dict[str, Any]]) -> Dict[str, Any]:
+    """Grava um item JSON por linha e, na última linha, {"metadata": {...}} montado com o total de itens"""
+    with open(output_path, 'w', encoding='utf-8') as file:
+        total = 0
+        for item in items:
+            file.write(json.dumps(item, ensure_ascii=False, separators=(',', ':')) + '\n')
+            total += 1
+
+        summary = metadata(total)
+        file.write(json.dumps({"metadata": summary}, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    return summary
@@ -0,0 +1,80 @@
+"""
+Pré-filtro barato das linhas de texto do PDF IBGE
+Descarta cabeçalhos, rodapés e texto corrido antes de aplicar o padrão completo de alimento
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Match, Pattern
+
+
+def is_food_line(line: str) -> bool:
+    """Equivale a ^\\d{7}\\s em uma linha já sem espaços nas pontas, sem usar regex"""
+    return line[:7].isdecimal() and line[7:8].isspace()
+
+
+@dataclass
+class LineFilterStats:
+    """Contadores de linhas descartadas em cada estágio da extração"""
+    lines: int = 0
+    prefilter_rejected: int = 0
+    pattern_rejected: int = 0
+    matched: int = 0
+
+    def candidate_lines(self, text: str, min_length: int = 8) -> List[str]:
+        """Linhas (sem espaços nas pontas) que começam com código de 7 dígitos e espaço"""
+        lines = text.split('\n')
+        candidates = []
+        for line in lines:
+            line = line.strip()
+            if len(line) >= min_length and is_food_line(line):
+                candidates.append(line)
+        self.lines += len(lines)
+        self.prefilter_rejected += len(lines) - len(candidates)
+        return candidates
+
+    def match_lines(self, text: str, pattern: Pattern, min_length: int = 8) -> List[Match]:
+        """Aplica o padrão completo apenas às linhas candidatas"""
+        match_line = pattern.match
+        matches = []
+        candidates = self.candidate_lines(text, min_length)
+        for line in candidates:
+            match = match_line(line)
+            if match:
+                matches.append(match)
+        self.matched += len(matches)
+        self.pattern_rejected += len(candidates) - len(matches)
+        return matches
+
+    def record_lines(self, lines: int, candidates: int):
+        """Contabiliza linhas filtradas fora de candidate_lines"""
+        self.lines += lines
+        self.prefilter_rejected += lines - candidates
+
+    def record_match(self, matched: bool):
+        """Contabiliza o resultado do padrão completo para uma linha candidata"""
+        if matched:
+            self.matched += 1
+        else:
+            self.pattern_rejected += 1
+
+    def reset(self):
+        self.lines = self.prefilter_rejected = self.pattern_rejected = self.matched = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        """Cópia dos contadores (enviada pelos processos do pool ao processo principal)"""
+        return asdict(self)
+
+    def merge(self, counters: Dict[str, int]):
+        """Soma os contadores de outro processo"""
+        self.lines += counters['lines']
+        self.prefilter_rejected += counters['prefilter_rejected']
+        self.pattern_rejected += counters['pattern_rejected']
+        self.matched += counters['matched']
+
+    def summary(self) -> str:
+        return (f"Linhas: {self.lines} | descartadas no pré-filtro: {self.prefilter_rejected} | "
+                f"descartadas pelo padrão: {self.pattern_rejected} | alimentos: {self.matched}")
+
+
+# Contadores do processo atual; os extratores zeram no início e exibem no final
+LINE_FILTER_STATS = LineFilterStats()
@@ -0,0 +1,77 @@
+"""
+Conversão rápida de valores numéricos no padrão brasileiro (vírgula decimal)
+Converte uma linha inteira de tokens por chamada, sem expressões regulares
+"""
+
+from array import array
+from math import isfinite
+from typing import Iterable, List, Optional, Sequence
+
+# Marcadores das tabelas IBGE/TACO que representam ausência de valor (traço, não determinado etc.)
+NULL_TOKENS = frozenset(['Tr', 'tr', 'TR', '-', 'nd', 'NA', 'n.d.', 'n/d', 'n.a.', ''])
+
+# Caracteres mantidos na limpeza de tokens com ruído (ex.: '12,5*' -> '12.5')
+NUMERIC_CHARS = frozenset('0123456789,.-')
+
+
+class DecimalParser:
+    """Converte tokens como '12,50', 'Tr' ou '-' em float"""
+
+    def __init__(self, null_tokens: Iterable[str] = NULL_TOKENS, default: Optional[float] = 0.0):
+        # Valor usado para marcadores e tokens inválidos (None para manter a ausência)
+        self.default = default
+        self.null_values = dict.fromkeys(null_tokens, default)
+
+    def parse(self, token: str) -> Optional[float]:
+        """Converte um único token"""
+        try:
+            value = float(token.replace(',', '.'))
+        except (ValueError, AttributeError):
+            return self._parse_slow(token)
+        return value if isfinite(value) else self.default
+
+    def _parse_slow(self, token) -> Optional[float]:
+        """Caminho para marcadores e tokens com caracteres estranhos"""
+        if not isinstance(token, str):
+            return self.default
+
+        token = token.strip()
+        if token in self.null_values:
+            return self.null_values[token]
+
+        cleaned = ''.join(char for char in token if char in NUMERIC_CHARS).replace(',', '.')
+        try:
+            value = float(cleaned)
+        except ValueError:
+            return self.default
+        return value if isfinite(value) else self.default
+
+    def parse_row(self, tokens: Sequence[str]) -> List[Optional[float]]:
+        """Converte todos os tokens de uma linha de uma vez"""
+        # Caminho rápido: uma única troca de vírgulas e um map(float) para a linha toda
+        parts = ' '.join(tokens).replace(',', '.').split()
+        if len(parts) == len(tokens):
+            try:
+                values = list(map(float, parts))
+            except ValueError:
+                pass
+            else:
+                if isfinite(sum(values)):
+                    return values
+
+        # Linha com marcadores ou ruído: conversão token a token
+        parse = self.parse
+        return [parse(token) for token in tokens]
+
+    def fill_row(self, tokens: Sequence[str], row: array, offset: int = 0) -> int:
+        """Grava os valores da linha em um array('d') pré-alocado a partir de offset"""
+        values = self.parse_row(tokens)
+        end = offset + len(values)
+        if end > len(row):
+            raise IndexError(f"Linha com {len(values)} valores não cabe no array a partir de {offset}")
+        row[offset:end] = array(row.typecode, values)
+        return len(values)
+
+
+# Instância padrão: marcadores e valores inválidos viram 0.0
+DECIMAL_PARSER = DecimalParser()
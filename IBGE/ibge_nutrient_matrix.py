@@ -0,0 +1,137 @@
+"""
+Armazenamento colunar dos nutrientes dos alimentos IBGE
+Uma única matriz float64 contígua (alimentos × nutrientes) com índice de colunas e linhas numeradas
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class NutrientMatrix:
+    """Matriz de nutrientes em um array('d') linha a linha; cada alimento é um número de linha"""
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = tuple(columns)
+        self.column_index = {name: index for index, name in enumerate(self.columns)}
+        self.width = len(self.columns)
+        self.data = array('d')
+        self.row_count = 0
+        self._zero_row = array('d', [0.0]) * self.width
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def add_row(self) -> int:
+        """Acrescenta uma linha zerada e devolve seu número"""
+        self.data.extend(self._zero_row)
+        self.row_count += 1
+        return self.row_count - 1
+
+    def column_ids(self, names: Iterable[str]) -> Tuple[int, ...]:
+        """Posições das colunas, resolvidas uma vez para gravações em lote"""
+        return tuple(self.column_index[name] for name in names)
+
+    def write_row(self, row: int, column_ids: Sequence[int], values: Iterable[float]):
+        """Grava vários valores de uma linha de uma só vez"""
+        data = self.data
+        base = row * self.width
+        for column, value in zip(column_ids, values):
+            data[base + column] = value
+
+    def get(self, row: int, name: str) -> float:
+        return self.data[row * self.width + self.column_index[name]]
+
+    def set(self, row: int, name: str, value: float):
+        self.data[row * self.width + self.column_index[name]] = value
+
+    def row_values(self, row: int) -> Dict[str, float]:
+        """Todos os nutrientes de uma linha, por nome"""
+        return dict(zip(self.columns, self.row_list(row)))
+
+    def row_list(self, row: int) -> List[float]:
+        """Todos os nutrientes de uma linha, na ordem das colunas"""
+        base = row * self.width
+        return self.data[base:base + self.width].tolist()
+
+    def column(self, name: str, rows: Optional[Sequence[int]] = None) -> array:
+        """Cópia da coluna inteira (um valor por linha), ou só das linhas em rows, nessa ordem"""
+        values = self.data[self.column_index[name]::self.width]
+        if rows is None:
+            return values
+        return array('d', [values[row] for row in rows])
+
+    def count_positive(self, names: Sequence[str], rows: Optional[Sequence[int]] = None) -> int:
+        """Quantas linhas têm ao menos uma das colunas acima de zero, percorrendo colunas inteiras"""
+        columns = [self.column(name, rows) for name in names]
+        if len(columns) == 1:
+            return sum(value > 0 for value in columns[0])
+        return sum(any(value > 0 for value in values) for values in zip(*columns))
+
+    def set_column(self, name: str, values: Sequence[float]):
+        """Substitui a coluna inteira; values deve ter um valor por linha"""
+        self.data[self.column_index[name]::self.width] = array('d', values)
+
+    def derive_column(self, target: str, source: str, factor: float):
+        """Calcula target = source * factor para todas as linhas"""
+        self.set_column(target, [value * factor for value in self.column(source)])
+
+    def column_lists(self, names: Iterable[str] = None) -> Dict[str, List[float]]:
+        """Colunas como listas, para serializar sem acessar célula por célula na matriz"""
+        names = self.columns if names is None else names
+        return {name: self.column(name).tolist() for name in names}
+
+    def view(self, row: int) -> "NutrientRowView":
+        return NutrientRowView(self, row)
+
+
+class NutrientRowView:
+    """Acesso por atributo (ex.: view.proteina_g) a uma linha da matriz, sem copiar os valores"""
+    __slots__ = ('matrix', 'row')
+
+    def __init__(self, matrix: NutrientMatrix, row: int):
+        object.__setattr__(self, 'matrix', matrix)
+        object.__setattr__(self, 'row', row)
+
+    def __getattr__(self, name: str) -> float:
+        # Só é chamado para nomes que não são slots definidos; slots ainda vazios (cópia, unpickle)
+        # e nomes especiais não são nutrientes e não podem consultar self.matrix
+        if name.startswith('_') or name in NutrientRowView.__slots__:
+            raise AttributeError(name)
+        try:
+            return self.matrix.get(self.row, name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: float):
+        if name not in self.matrix.column_index:
+            raise AttributeError(name)
+        self.matrix.set(self.row, name, value)
+
+    def as_dict(self) -> Dict[str, float]:
+        return self.matrix.row_values(self.row)
+
+    def __eq__(self, other) -> bool:
+        """Igualdade por valor: mesmas colunas e mesmos valores, em qualquer matriz ou linha"""
+        if not isinstance(other, NutrientRowView):
+            return NotImplemented
+        return (self.matrix.columns == other.matrix.columns
+                and self.matrix.row_list(self.row) == other.matrix.row_list(other.row))
+
+    __hash__ = None  # Mutável, como o dataclass que substitui
+
+    def __reduce__(self):
+        # Pickle leva a matriz junto; em uma lista de alimentos ela é gravada uma única vez
+        return NutrientRowView, (self.matrix, self.row)
+
+    def __copy__(self) -> "NutrientRowView":
+        return NutrientRowView(self.matrix, self.row)
+
+    def __deepcopy__(self, memo) -> "NutrientRowView":
+        """Cópia independente só desta linha (em uma matriz de uma linha), sem copiar a matriz inteira"""
+        matrix = NutrientMatrix(self.matrix.columns)
+        row = matrix.add_row()
+        matrix.write_row(row, range(matrix.width), self.matrix.row_list(self.row))
+        return NutrientRowView(matrix, row)
+
+    def __repr__(self) -> str:
+        return f"NutrientRowView(row={self.row})"
@@ -0,0 +1,137 @@
+"""
+Fonte compartilhada de texto das páginas do PDF IBGE
+Abre o PDF uma única vez por execução e extrai o texto de cada página no máximo uma vez (cache em disco);
+em memória fica só a página atual, mais as que uma faixa sobreposta vai ler de novo
+"""
+
+import PyPDF2
+from collections import Counter
+from typing import BinaryIO, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Union
+
+from ibge_text_cache import DEFAULT_CACHE_PATH, PageTextCache, file_sha256
+
+
+# (página, texto da página, mensagem de erro ou None)
+PageText = Tuple[int, str, Optional[str]]
+
+
+def overlapping_pages(ranges: Iterable[Tuple[int, int]]) -> FrozenSet[int]:
+    """Páginas lidas por mais de uma das faixas [início, fim): as únicas que vale manter em memória"""
+    reads = Counter(page for start, end in ranges for page in range(start, end))
+    return frozenset(page for page, count in reads.items() if count > 1)
+
+
+class IBGEPageSource:
+    """Entrega o texto das páginas do PDF para todas as passagens de tabela"""
+
+    def __init__(self, pdf_path: Union[str, BinaryIO], use_cache: bool = True,
+                 cache_path: str = DEFAULT_CACHE_PATH, cache_writable: bool = True, memoize: bool = False,
+                 pdf_sha256: Optional[str] = None, page_count: Optional[int] = None, keep_pages: Iterable[int] = ()):
+        self.pdf_path = pdf_path  # Caminho do PDF ou stream binário já aberto
+        self.use_cache = use_cache
+        # Sem memorização, a leitura em fluxo mantém apenas a página atual em memória;
+        # keep_pages memoriza só as páginas indicadas (ver overlapping_pages)
+        self.memoize = memoize
+        self.keep_pages = frozenset(keep_pages)
+        self.cache_path = cache_path
+        # Sem escrita (processos do pool), o texto novo fica em new_texts para o processo principal gravar
+        self.cache_writable = cache_writable
+        self.new_texts: Dict[int, str] = {}
+        self._file = None
+        self._reader: Optional[PyPDF2.PdfReader] = None
+        self._cache: Optional[PageTextCache] = None
+        # Hash e total de páginas já conhecidos (processos do pool recebem os do processo principal)
+        self._pdf_sha256: Optional[str] = pdf_sha256
+        self._known_page_count = page_count
+        self._page_count: Optional[int] = page_count
+        self._texts: Dict[int, str] = {}
+
+    def open(self) -> "IBGEPageSource":
+        """Prepara o cache em disco; o PDF só é lido quando uma página não está no cache"""
+        if self.use_cache and self._cache is None:
+            if self._pdf_sha256 is None:
+                self._pdf_sha256 = file_sha256(self.pdf_path)
+            self._cache = PageTextCache(self.cache_path)
+        return self
+
+    def _get_reader(self) -> PyPDF2.PdfReader:
+        """Abre o PDF e monta o leitor (apenas na primeira chamada)"""
+        if self._reader is None:
+            if isinstance(self.pdf_path, str):
+                self._file = open(self.pdf_path, 'rb')
+                self._reader = PyPDF2.PdfReader(self._file)
+            else:
+                self._reader = PyPDF2.PdfReader(self.pdf_path)
+        return self._reader
+
+    def close(self):
+        """Fecha o PDF, grava o cache e descarta o texto memorizado"""
+        if self._file is not None:
+            self._file.close()
+        if self._cache is not None:
+            self._cache.close()
+        self._file = None
+        self._reader = None
+        self._cache = None
+        self._page_count = self._known_page_count
+        self._texts.clear()
+        self.new_texts = {}
+
+    def __enter__(self) -> "IBGEPageSource":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def pdf_sha256(self) -> Optional[str]:
+        """SHA-256 do PDF (chave do cache), ou None sem cache"""
+        self.open()
+        return self._pdf_sha256
+
+    @property
+    def page_count(self) -> int:
+        """Total de páginas do PDF"""
+        if self._page_count is None:
+            self.open()
+            if self._cache is not None:
+                self._page_count = self._cache.get_page_count(self._pdf_sha256)
+            if self._page_count is None:
+                self._page_count = len(self._get_reader().pages)
+                if self._cache is not None and self.cache_writable:
+                    self._cache.set_page_count(self._pdf_sha256, self._page_count)
+        return self._page_count
+
+    def get_page_text(self, page_num: int) -> str:
+        """Retorna o texto da página (índice 0), extraindo-o só na primeira vez"""
+        text = self._texts.get(page_num)
+        if text is None:
+            self.open()
+            if self._cache is not None:
+                text = self._cache.get(self._pdf_sha256, page_num)
+            if text is None:
+                text = self._get_reader().pages[page_num].extract_text() or ""
+                if self.cache_writable:
+                    self.store_page_text(page_num, text)
+                else:
+                    self.new_texts[page_num] = text
+            if self.memoize or page_num in self.keep_pages:
+                self._texts[page_num] = text
+        return text
+
+    def iter_pages(self, start: int = 0, end: Optional[int] = None) -> Iterator[PageText]:
+        """Gera (página, texto, erro) uma página por vez para as páginas [start, end)"""
+        end = self.page_count if end is None else min(end, self.page_count)
+        for page_num in range(start, end):
+            try:
+                text = self.get_page_text(page_num)
+            except Exception as e:
+                yield page_num, "", str(e)
+                continue
+            yield page_num, text, None
+
+    def store_page_text(self, page_num: int, text: str):
+        """Grava o texto da página no cache em disco"""
+        self.open()
+        if self._cache is not None:
+            self._cache.put(self._pdf_sha256, page_num, text)
@@ -0,0 +1,111 @@
+"""
+Extração paralela das páginas do PDF IBGE
+Divide as faixas de páginas entre processos e devolve os registros na ordem original
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ibge_line_filter import LINE_FILTER_STATS
+from ibge_page_source import IBGEPageSource
+
+# (página, registros extraídos da página, mensagem de erro ou None)
+PageRecords = Tuple[int, List[Any], Optional[str]]
+
+# Fonte de páginas do processo do pool, criada uma vez pelo inicializador e usada por todos os blocos
+_worker_page_source: Optional[IBGEPageSource] = None
+
+
+def init_page_worker(pdf_path: str, use_cache: bool, cache_path: str, pdf_sha256: Optional[str],
+                     page_count: Optional[int]):
+    """Inicializador dos processos do pool: um leitor por processo, com hash e total de páginas já resolvidos"""
+    global _worker_page_source
+    _worker_page_source = IBGEPageSource(pdf_path, use_cache=use_cache, cache_path=cache_path,
+                                         cache_writable=False, pdf_sha256=pdf_sha256,
+                                         page_count=page_count).open()
+
+
+def iter_page_records(page_source: IBGEPageSource, start: int, end: int,
+                      parse_page: Callable[..., List[Any]], *args) -> Iterator[PageRecords]:
+    """Extrai e interpreta as páginas [start, end) em sequência"""
+    for page_num, text, error in page_source.iter_pages(start, end):
+        if error is not None:
+            yield page_num, [], error
+            continue
+        try:
+            records = parse_page(text, *args) if text else []
+        except Exception as e:
+            yield page_num, [], str(e)
+            continue
+        yield page_num, records, None
+
+
+def extract_page_chunk(pdf_path: str, start: int, end: int, parse_page: Callable[..., List[Any]],
+                       *args) -> Tuple[List[PageRecords], Dict[int, str], Dict[str, int]]:
+    """Executado em um processo do pool: interpreta um bloco de páginas com o leitor do processo"""
+    # O processo é reaproveitado entre blocos: os contadores e textos devolvidos são só deste bloco
+    LINE_FILTER_STATS.reset()
+    if _worker_page_source is None or _worker_page_source.pdf_path != pdf_path:
+        raise RuntimeError("extract_page_chunk roda só em processos criados pelo ParallelPageRunner")
+    page_source = _worker_page_source
+    page_source.new_texts = {}
+    results = list(iter_page_records(page_source, start, end, parse_page, *args))
+    return results, page_source.new_texts, LINE_FILTER_STATS.snapshot()
+
+
+def pop_workers_option(args: List[str]) -> int:
+    """Retira '--workers N' de args e devolve N; sem a opção a extração é serial (1)"""
+    if '--workers' not in args:
+        return 1
+    position = args.index('--workers')
+    try:
+        workers = int(args[position + 1])
+    except (IndexError, ValueError):
+        workers = 0
+    if workers < 1:
+        raise SystemExit("--workers precisa de um número inteiro positivo")
+    del args[position:position + 2]
+    return workers
+
+
+def split_page_range(start: int, end: int, chunk_pages: int) -> List[Tuple[int, int]]:
+    """Divide [start, end) em blocos contíguos de até chunk_pages páginas"""
+    return [(chunk_start, min(chunk_start + chunk_pages, end))
+            for chunk_start in range(start, end, chunk_pages)]
+
+
+class ParallelPageRunner:
+    """Distribui blocos de páginas em um ProcessPoolExecutor e junta os resultados em ordem"""
+
+    def __init__(self, page_source: IBGEPageSource, workers: int, chunk_pages: int = 8):
+        self.page_source = page_source
+        self.workers = workers
+        self.chunk_pages = chunk_pages
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelPageRunner":
+        # Hash e total de páginas resolvidos (e gravados no cache) uma vez, aqui, e repassados aos processos
+        source = self.page_source
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=init_page_worker,
+            initargs=(source.pdf_path, source.use_cache, source.cache_path, source.pdf_sha256, source.page_count))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.executor.shutdown(cancel_futures=exc_type is not None)
+        self.executor = None
+
+    def submit_range(self, worker: Callable[..., Tuple[List[PageRecords], Dict[int, str], Dict[str, int]]],
+                     start: int, end: int, *args) -> List[Future]:
+        """Agenda a faixa [start, end); worker(pdf_path, start, end, *args) roda em outro processo"""
+        return [self.executor.submit(worker, self.page_source.pdf_path, chunk_start, chunk_end, *args)
+                for chunk_start, chunk_end in split_page_range(start, end, self.chunk_pages)]
+
+    def iter_results(self, futures: List[Future]) -> Iterator[PageRecords]:
+        """Entrega os registros na ordem das páginas, gravando no cache o texto extraído pelos processos"""
+        for future in futures:
+            results, new_texts, line_stats = future.result()
+            for page_num, text in new_texts.items():
+                self.page_source.store_page_text(page_num, text)
+            LINE_FILTER_STATS.merge(line_stats)
+            yield from results
@@ -0,0 +1,57 @@
+"""
+Esquemas declarativos das tabelas nutricionais IBGE
+Cada tabela é declarada como uma lista ordenada de colunas mapeadas para campos de nutrientes
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Pattern, Sequence, Tuple
+
+from ibge_line_filter import LINE_FILTER_STATS, LineFilterStats
+
+# Padrão: CÓDIGO7DIGITOS NOME PREP_CODE PREP_DESC seguido das colunas de valores da tabela
+FOOD_LINE_PATTERN = r'^(\d{7})\s+([^0-9]+?)\s+(\d{1,2})\s+([^0-9]+?)'
+VALUE_COLUMN_PATTERN = r'\s+([\d,.-]+)'
+
+# (código, nome, código de preparo, preparo, valores das colunas mapeadas)
+FoodRow = Tuple[int, str, int, str, List[float]]
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """Declaração de uma tabela IBGE: colunas na ordem do PDF e campos de destino"""
+    name: str
+    # Campo de destino de cada coluna de valor, na ordem do PDF (None = coluna ignorada)
+    columns: Tuple[Optional[str], ...]
+    # Só a tabela principal cria alimentos; as demais completam alimentos já existentes
+    creates_foods: bool = False
+    # Campos calculados sobre a coluna inteira ao fim da tabela: (campo, campo de origem, fator)
+    derived: Tuple[Tuple[str, str, float], ...] = ()
+    pattern: Pattern = field(init=False, repr=False, compare=False)
+    fields: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    value_groups: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Padrão compilado uma única vez por tabela, reaproveitado em todas as linhas
+        object.__setattr__(self, 'pattern', re.compile(FOOD_LINE_PATTERN + VALUE_COLUMN_PATTERN * len(self.columns)))
+        mapped = [(index + 5, column) for index, column in enumerate(self.columns) if column is not None]
+        object.__setattr__(self, 'value_groups', tuple(group for group, _ in mapped))
+        object.__setattr__(self, 'fields', tuple(column for _, column in mapped))
+
+    def parse_page(self, text: str, parse_row: Callable[[Sequence[str]], List[float]],
+                   line_stats: LineFilterStats = LINE_FILTER_STATS) -> List[FoodRow]:
+        """Interpreta as linhas de alimentos de uma página; só as linhas candidatas chegam ao padrão"""
+        rows = []
+        value_groups = self.value_groups
+
+        for match in line_stats.match_lines(text, self.pattern):
+            raw_values = match.group(*value_groups) if len(value_groups) > 1 else (match.group(value_groups[0]),)
+            rows.append((
+                int(match.group(1)),
+                match.group(2).strip(),
+                int(match.group(3)),
+                match.group(4).strip(),
+                parse_row(raw_values)
+            ))
+
+        return rows
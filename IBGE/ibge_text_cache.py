@@ -0,0 +1,104 @@
+"""
+Cache persistente do texto extraído das páginas do PDF IBGE
+Guarda o texto comprimido por (SHA-256 do PDF, página, versão do extrator) em SQLite
+"""
+
+import hashlib
+import os
+import sqlite3
+import zlib
+from typing import BinaryIO, Optional, Union
+
+import PyPDF2
+
+# Incrementar quando a forma de extrair o texto mudar, invalidando o cache
+TEXT_CACHE_VERSION = 1
+EXTRACTOR_VERSION = f"PyPDF2-{PyPDF2.__version__}/v{TEXT_CACHE_VERSION}"
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ibge_text_cache.sqlite")
+
+# Páginas novas gravadas por commit: uma extração interrompida perde no máximo este tanto do cache
+COMMIT_EVERY_PAGES = 16
+
+
+def file_sha256(path: Union[str, BinaryIO], chunk_size: int = 1 << 20) -> str:
+    """Calcula o SHA-256 do conteúdo do arquivo (caminho ou stream binário)"""
+    if isinstance(path, str):
+        with open(path, 'rb') as file:
+            return file_sha256(file, chunk_size)
+
+    digest = hashlib.sha256()
+    position = path.tell()
+    path.seek(0)
+    for chunk in iter(lambda: path.read(chunk_size), b''):
+        digest.update(chunk)
+    path.seek(position)
+    return digest.hexdigest()
+
+
+class PageTextCache:
+    """Armazena o texto das páginas para que novas execuções pulem o PyPDF2"""
+
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH, extractor_version: str = EXTRACTOR_VERSION):
+        self.cache_path = cache_path
+        self.extractor_version = extractor_version
+        self.pending_pages = 0
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS page_text (
+            pdf_sha256 TEXT NOT NULL,
+            page_num INTEGER NOT NULL,
+            extractor_version TEXT NOT NULL,
+            text BLOB NOT NULL,
+            PRIMARY KEY (pdf_sha256, page_num, extractor_version)
+        ) WITHOUT ROWID
+        ''')
+        self.conn.execute('''
+        CREATE TABLE IF NOT EXISTS documents (
+            pdf_sha256 TEXT PRIMARY KEY,
+            page_count INTEGER NOT NULL
+        )
+        ''')
+
+    def get_page_count(self, pdf_sha256: str) -> Optional[int]:
+        """Total de páginas conhecido para o PDF, ou None"""
+        row = self.conn.execute(
+            "SELECT page_count FROM documents WHERE pdf_sha256 = ?", (pdf_sha256,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_page_count(self, pdf_sha256: str, page_count: int):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO documents (pdf_sha256, page_count) VALUES (?, ?)",
+            (pdf_sha256, page_count)
+        )
+        self.flush()
+
+    def get(self, pdf_sha256: str, page_num: int) -> Optional[str]:
+        """Texto da página em cache, ou None se ainda não foi extraído"""
+        row = self.conn.execute(
+            "SELECT text FROM page_text WHERE pdf_sha256 = ? AND page_num = ? AND extractor_version = ?",
+            (pdf_sha256, page_num, self.extractor_version)
+        ).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode('utf-8')
+
+    def put(self, pdf_sha256: str, page_num: int, text: str):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO page_text (pdf_sha256, page_num, extractor_version, text) VALUES (?, ?, ?, ?)",
+            (pdf_sha256, page_num, self.extractor_version, zlib.compress(text.encode('utf-8')))
+        )
+        self.pending_pages += 1
+        if self.pending_pages >= COMMIT_EVERY_PAGES:
+            self.flush()
+
+    def flush(self):
+        """Grava no disco as páginas ainda não confirmadas"""
+        self.conn.commit()
+        self.pending_pages = 0
+
+    def close(self):
+        """Grava as páginas novas e fecha o arquivo de cache"""
+        self.flush()
+        self.conn.close()
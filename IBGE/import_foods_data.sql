@@ -1,3 +1,6 @@
+-- INSERT OR REPLACE só atualiza food_group_stats e foods_ranges com recursive_triggers ligado
+PRAGMA recursive_triggers = ON;
+
 -- Inserção dos grupos de alimentos
 INSERT OR IGNORE INTO food_groups (id, name, description) VALUES (1, 'Açúcares e Produtos de Confeitaria', 'Açúcar, mel, doces e produtos açucarados');
 INSERT OR IGNORE INTO food_groups (id, name, description) VALUES (2, 'Cereais e Produtos de Cereais', 'Arroz, trigo, aveia, milho e derivados');
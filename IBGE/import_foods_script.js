@@ -39,6 +39,9 @@ class IBGEFoodsImporter {
         }
 
         const sqlStatements = [];
+
+        // INSERT OR REPLACE só atualiza food_group_stats e foods_ranges com recursive_triggers ligado
+        sqlStatements.push('PRAGMA recursive_triggers = ON;\n');
         
         // Inserir grupos de alimentos
         sqlStatements.push('-- Inserção dos grupos de alimentos');
@@ -1,423 +1,424 @@
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','1','Arroz, integral, cozido','0,3','0,4','0,3','','Tr','0,25','0,02','Tr','Tr','Tr','','','0,36','Tr','0,31','0,01','','','Tr','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','2','Arroz, integral, cru','0,3','0,5','0,4','','0,01','0,24','0,02','0,01','Tr','Tr','','Tr','0,45','Tr','0,38','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','3','Arroz, tipo 1, cozido','0,2','Tr','Tr','','Tr','0,16','0,01','','','','','','0,04','','0,06','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','4','Arroz, tipo 1, cru','0,1','0,1','0,1','Tr','Tr','0,06','0,01','Tr','Tr','Tr','','','0,06','','0,08','Tr','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','5','Arroz, tipo 2, cozido','0,1','0,1','0,1','','Tr','0,12','0,02','','','','','Tr','0,12','Tr','0,09','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','6','Arroz, tipo 2, cru','0,1','0,1','0,1','','Tr','0,06','0,01','Tr','Tr','Tr','','','0,09','Tr','0,09','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','7','Aveia, flocos, crua','1,5','3,2','3,0','','0,02','1,37','0,14','Tr','','0,02','','Tr','3,10','0,05','2,95','0,06','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','8','Biscoito, doce, maisena','3,9','3,7','2,2','0,03','0,07','2,76','0,94','0,03','0,02','0,01','','0,02','3,70','0,02','2,13','0,10','','','','','1,36','0,22','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','9','Biscoito, doce, recheado com chocolate','6,2','6,6','1,7','0,19','0,13','3,11','2,55','0,07','0,07','0,02','','0,02','6,55','0,04','1,68','0,06','','','','','3,84','0,37','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','10','Biscoito, doce, recheado com morango','6,1','6,5','1,7','0,07','0,07','3,35','2,41','0,06','','','','0,04','6,40','0,02','1,61','0,06','','','','','4,21','0,32','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','11','Biscoito, doce, wafer, recheado de chocolate','6,5','8,1','1,9','','0,02','3,21','3,02','0,09','0,12','0,02','0,02','0,02','8,07','0,02','1,84','0,09','','','','','6,63','0,42','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','12','Biscoito, doce, wafer, recheado de morango','6,7','8,9','1,8','','0,03','3,32','3,10','0,10','0,10','0,03','','0,03','8,83','0,03','1,77','0,08','','','','','7,24','0,56','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','13','Biscoito, salgado, cream cracker','4,4','4,6','2,9','0,01','0,07','2,99','1,24','0,04','0,03','0,01','','0,06','4,52','0,03','2,79','0,01','','','','','1,57','0,23','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','14','Bolo, mistura para','2,1','1,9','0,8','0,01','0,03','1,03','0,97','0,02','0,02','0,01','','0,01','1,88','0,01','0,78','0,03','','','','','0,93','0,15','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','15','Bolo, pronto, aipim','5,0','3,9','1,1','0,98','0,48','1,88','1,28','0,04','0,04','0,01','','0,06','3,80','0,02','1,00','0,06','0,04','','','','1,99','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','16','Bolo, pronto, chocolate','5,5','6,2','3,0','','0,06','2,97','2,33','0,07','0,06','0,02','','0,06','6,15','0,04','2,83','0,04','0,02','','','','2,49','0,42','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','17','Bolo, pronto, coco','4,9','3,0','1,8','1,00','0,48','1,82','1,24','0,03','0,03','0,01','','0,05','2,92','0,03','1,69','0,06','0,02','','','','0,89','0,19','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','18','Bolo, pronto, milho','4,5','3,9','1,5','0,79','0,37','1,79','1,19','0,04','0,05','0,01','','0,06','3,79','0,03','1,34','0,08','0,04','','','','1,82','0,17','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','19','Canjica, branca, crua','0,3','0,2','0,4','','','0,27','0,03','Tr','','Tr','','Tr','0,24','Tr','0,38','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','20','Canjica, com leite integral','0,6','0,4','0,1','0,01','0,08','0,37','0,15','Tr','','','','0,02','0,35','','0,15','Tr','','','','','0,02','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','21','Cereais, milho, flocos, com sal','0,5','0,6','0,9','','Tr','0,39','0,05','0,01','Tr','0,01','','Tr','0,60','0,01','0,89','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','22','Cereais, milho, flocos, sem sal','0,3','0,3','0,6','','Tr','0,27','0,03','0,01','Tr','Tr','','Tr','0,33','Tr','0,60','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','23','Cereais, mingau, milho, infantil','0,3','0,3','0,5','','Tr','0,26','0,03','Tr','Tr','','','','0,28','Tr','0,45','0,01','','','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','24','Cereais, mistura para vitamina, trigo, cevada e aveia','0,5','0,4','1,0','','Tr','0,43','0,03','Tr','Tr','Tr','','Tr','0,34','0,02','0,93','0,06','','','','','','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','25','Cereal matinal, milho','0,4','0,3','0,3','','','0,32','0,04','Tr','Tr','Tr','','Tr','0,32','','0,31','Tr','','Tr','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','26','Cereal matinal, milho, açúcar','0,2','0,3','0,3','','','0,20','0,03','Tr','Tr','Tr','','Tr','0,29','','0,33','Tr','','Tr','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','27','Creme de arroz, pó','0,4','0,3','0,4','','0,01','0,37','0,03','Tr','','0,01','','Tr','0,31','Tr','0,43','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','28','Creme de milho, pó','0,3','0,5','0,8','','','0,29','0,04','0,01','','Tr','','Tr','0,45','Tr','0,75','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','29','Curau, milho verde','0,8','0,5','0,2','0,01','0,11','0,48','0,19','Tr','','','Tr','0,03','0,44','','0,17','Tr','','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','30','Curau, milho verde, mistura para','3,0','4,9','1,4','','0,01','1,55','1,30','0,05','0,06','0,03','',' ','4,85','0,03','1,38','0,03','','','','','2,81','0,63','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','31','Farinha, de arroz, enriquecida','0,2','0,1','0,2','Tr','Tr','0,18','0,01','Tr','Tr','Tr','','Tr','0,08','Tr','0,17','0,01','','','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','32','Farinha, de centeio, integral','0,3','0,3','0,8','','Tr','0,31','0,02','Tr','Tr','','','Tr','0,26','0,01','0,73','','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','33','Farinha, de milho, amarela','0,4','0,4','0,6','Tr','Tr','0,30','0,04','0,01','','','','Tr','0,38','Tr','0,63','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','34','Farinha, de rosca','0,6','0,4','0,8','0,01','0,02','0,44','0,07','Tr','','','','0,01','0,37','0,01','0,74','0,05','','','','','0,02','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','35','Farinha, de trigo','0,3','0,2','0,4','','Tr','0,30','0,01','Tr','Tr','Tr','','Tr','0,13','','0,43','0,01','','Tr','Tr','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','36','Farinha, láctea, de cereais','3,3','1,4','0,6','0,12','0,50','1,73','0,58','0,01','0,01','','0,03','0,11','1,20','','0,59','0,03','','','','','0,13','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','37','Lasanha, massa fresca, cozida','0,6','0,4','0,1','','','0,48','0,10','','','','','0,02','0,40','Tr','0,10','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','38','Lasanha, massa fresca, crua','0,5','0,4','0,4','','','0,39','0,08','','','','','0,01','0,39','Tr','0,38','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','41','Macarrão, trigo, cru, com ovos','0,5','0,4','0,8','','','0,46','0,07','Tr','Tr','Tr','','Tr','0,38','Tr','0,73','0,03','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','43','Milho, fubá, cru','0,4','0,9','1,3','','','0,35','0,07','0,02','Tr','Tr','','Tr','0,89','Tr','1,29','0,03','','','Tr','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','44','Milho, verde, cru','0,2','0,2','0,6','','','0,16','0,01','Tr','Tr','Tr','','Tr','0,23','Tr','0,53','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','45','Milho, verde, enlatado, drenado','0,6','0,8','0,9','','','0,49','0,06','0,01','','','','Tr','0,78','Tr','0,88','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','46','Mingau tradicional, pó','0,1','Tr','0,1','Tr','','0,12','0,01','','','','','','0,05','','0,13','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','47','Pamonha, barra para cozimento, pré-cozida','0,5','0,7','1,4','','0,01','0,37','0,12','0,01','0,01','0,01','',' ','0,65','0,02','1,32','0,09','','','','','0,07','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','48','Pão, aveia, forma','1,1','1,0','1,6','Tr','0,01','0,62','0,40','0,01','0,01','','','0,01','0,94','0,02','1,06','0,59','','','','','0,11','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','49','Pão, de soja','0,7','0,6','1,6','','0,01','0,52','0,16','0,01','0,01','','','0,01','0,62','0,01','1,41','0,14','','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','50','Pão, glúten, forma','0,5','0,6','0,7','','Tr','0,39','0,08','0,01','0,01','','','0,01','0,56','0,01','0,69','0,04','','','','','0,11','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','51','Pão, milho, forma','0,6','0,6','1,0','0,01','0,01','0,47','0,11','0,01','0,01','','','0,01','0,62','0,01','0,98','0,03','','','','','0,07','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','52','Pão, trigo, forma, integral','0,7','0,8','1,1','Tr','0,01','0,50','0,19','0,01','0,01','','','0,02','0,74','0,01','0,98','0,08','','','','','0,21','0,07','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','53','Pão, trigo, francês','1,0','0,9','0,7','Tr','0,01','0,65','0,29','0,01','0,01','','','Tr','0,85','0,01','0,70','0,04','','','','','0,35','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','54','Pão, trigo, sovado','0,8','0,7','0,7','0,01','0,01','0,66','0,14','','','','','0,02','0,62','0,01','0,68','0,04','','','','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','55','Pastel, de carne, cru','3,7','2,9','1,1','0,07','0,12','2,47','1,00','0,03','0,01','0,01','0,01','0,05','2,82','0,01','1,06','0,04','','','','','0,52','0,07','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','56','Pastel, de carne, frito','4,8','5,9','7,6','','0,12','2,73','1,70','0,06','0,10','0,04','','0,08','5,74','0,04','6,97','0,59','0,02','','','','0,54','0,15','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','59','Pastel, massa, crua','2,1','1,7','0,9','0,02','0,03','1,50','0,49','0,02','0,02','0,01','','0,01','1,66','0,01','0,91','0,03','','','','','0,47','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','60','Pastel, massa, frita','6,9','10,1','21,2','','0,04','4,92','1,48','0,16','0,20','0,08','','Tr','9,75','0,33','19,61','1,32','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','61','Pipoca, com óleo de soja, sem sal','2,4','3,7','9,2','','','1,77','0,46','0,05','0,06','0,03','','','3,67','0,03','8,48','0,69','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Cereais e derivados','63','Torrada, pão francês','0,9','0,8','1,0','','0,01','0,63','0,19','0,01','0,01','0,01','','0,01','0,76','0,01','0,99','0,05','','','','','0,38','0,07','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','64','Abóbora, cabotian, cozida','0,1','0,2','0,2','','Tr','0,12','0,02','Tr','','','','Tr','0,22','Tr','0,15','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','65','Abóbora, cabotian, crua','0,1','0,1','0,0','','','0,11','0,01','','','','','','0,08','','0,04','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','68','Abóbora, moranga, refogada','0,1','0,2','0,4','','','0,09','0,03','Tr','Tr','','','','0,19','','0,40','0,05','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','70','Abobrinha, italiana, cozida','0,1','Tr','0,1','','','0,05','Tr','Tr','Tr','Tr','','','Tr','','0,03','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','72','Abobrinha, italiana, refogada','0,1','0,2','0,5','','','0,10','0,03','Tr','Tr','Tr','','','0,18','','0,40','0,06','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','81','Alfavaca, crua','0,1','Tr','0,2','Tr','Tr','0,11','0,02','Tr','Tr','Tr','','0,01','0,01','','0,04','0,16','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','85','Almeirão, refogado','0,8','1,1','2,6','','','0,53','0,19','0,02','0,02','Tr','','Tr','1,11','0,03','2,30','0,35','','','','','','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','90','Batata, frita, tipo chips, industrializada','12,9','11,9','4,0','0,10','0,25','10,98','1,30','0,11','0,02','0,02','','0,04','11,83','0,05','3,85','0,09','','','','','0,02','0,09','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','93','Batata, inglesa, frita','2,1','3,4','6,6','','0,01','1,41','0,52','0,05','0,06','0,01','','0,01','3,31','0,06','6,29','0,30','','','','','','0,07','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','94','Batata, inglesa, sauté','0,3','0,2','0,4','0,02','0,01','0,19','0,07','Tr','Tr','','','','0,20','','0,33','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','99','Biscoito, polvilho doce','2,4','4,3','0,6','','0,03','1,48','0,80','0,05','0,05','0,02','',' ','4,25','0,01','0,56','','','','','','4,05','0,40','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','100','Brócolis, cozido','0,1','Tr','0,2','','Tr','0,08','0,01','Tr','Tr','Tr','Tr','0,01','0,02','','0,06','0,10','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','101','Brócolis, cru','0,1','0,1','0,2','','','0,12','0,02','Tr','','Tr','','0,02','0,04','','0,07','0,12','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','104','Caruru, cru','0,1','Tr','0,3','Tr','Tr','0,13','0,01','','Tr','Tr','','0,02','0,03','','0,09','0,17','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','105','Catalonha, crua','0,1','Tr','0,1','Tr','','0,06','Tr','Tr','Tr','Tr','','Tr','Tr','','0,04','0,10','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','106','Catalonha, refogada','0,7','1,1','3,0','','','0,51','0,15','0,02','0,02','0,01','','0,01','1,04','0,02','2,48','0,48','','','','','','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','109','Cenoura, cozida','Tr','Tr','0,1','','','0,03','Tr','','','','',' ','Tr','','0,12','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','115','Couve, manteiga, crua','0,1','Tr','0,1','','','0,10','0,02','','','','','0,02','0,02','','0,05','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','116','Couve, manteiga, refogada ','1,0','1,6','3,6','','','0,70','0,25','0,03','0,03','0,01','','','1,52','0,04','3,16','0,38','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','118','Couve-flor, cozida','0,1','Tr','0,1','','','0,06','Tr','Tr','','','','Tr','0,02','','0,06','0,06','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','120','Espinafre, Nova Zelândia, refogado','0,9','1,3','2,9','','','0,60','0,22','0,02','0,03','0,02','','Tr','1,27','0,04','2,55','0,38','','','','','','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','121','Farinha, de mandioca, crua','0,1','0,1','Tr','Tr','Tr','0,08','0,02','Tr','Tr','Tr','Tr','Tr','0,08','Tr','0,03','0,01','','','','','Tr','0,10','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','122','Farinha, de mandioca, torrada','0,1','0,1','Tr','Tr','0,03','0,09','0,01','','','','','','0,08','','0,03','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','123','Farinha, de puba','0,2','0,2','Tr','','','0,20','0,02','','','','','','0,19','','0,04','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','126','Inhame, cru','0,1','Tr','0,1','','','0,08','Tr','Tr','Tr','Tr','','','0,04','','0,08','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','127','Jiló, cru','0,1','0,1','0,2','','','0,05','0,02','Tr','Tr','Tr','','Tr','0,05','','0,20','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','128','Jurubeba, crua','0,5','0,5','2,1','','','0,29','0,13','0,01','0,01','0,01','','0,03','0,48','Tr','2,09','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','129','Mandioca, cozida','0,1','0,1','0,1','','','0,07','Tr','','','','','','0,10','','0,05','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','130','Mandioca, crua','0,1','0,1','Tr','','','0,06','Tr','Tr','Tr','Tr','','Tr','0,12','Tr','0,04','Tr','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','131','Mandioca, farofa, temperada','1,9','2,4','2,5','Tr','0,03','1,26','0,54','0,03','0,02','0,01','','0,04','2,38','0,02','2,29','0,19','','','','','0,49','0,14','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','132','Mandioca, frita','1,7','2,8','6,2','','','1,20','0,38','0,03','0,05','0,02','','','2,73','0,05','5,58','0,57','','','','','','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','133','Manjericão, cru','0,1','Tr','0,3','','','0,11','0,02','Tr','','','','0,02','0,01','','0,05','0,21','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','136','Nhoque, batata, cozido','0,6','0,5','0,8','0,02','0,01','0,40','0,15','Tr','Tr','Tr','','0,01','0,47','Tr','0,72','0,05','Tr','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','138','Palmito, Juçara, em conserva','0,1','Tr','0,1','Tr','Tr','0,07','Tr','Tr','Tr','0,01','','','0,03','','0,09','0,01','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','141','Pão, de queijo, cru','3,4','3,0','4,1','0,08','0,29','2,00','0,74','0,03','0,03','','0,03','0,08','2,92',' ','3,67','0,36','','','','','0,63','0,12','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','151','Repolho, roxo, refogado','0,2','0,3','0,7','','','0,15','0,04','Tr','Tr','Tr','','','0,28','Tr','0,61','0,07','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','153','Salsa, crua','0,1','Tr','0,2','','','0,08','Tr','Tr','Tr','Tr','','Tr','0,02','','0,11','0,09','','','Tr','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','154','Seleta de legumes, enlatada','0,1','0,2','0,2','','','0,10','0,03','Tr','Tr','Tr','','','0,22','','0,20','0,01','','','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','155','Serralha, crua','0,1','0,1','0,3','Tr','Tr','0,13','0,02','0,02','0,02','Tr','',' ','0,04','','0,07','0,26','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','156','Taioba, crua','0,2','0,1','0,4','Tr','Tr','0,18','0,04','0,02','Tr','0,01','','0,02','0,05','','0,12','0,25','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','159','Tomate, molho industrializado','0,1','0,1','0,2','Tr','Tr','0,06','0,02','Tr','Tr','Tr','','Tr','0,09','Tr','0,17','0,02','','','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','163','Abacate, cru','2,3','4,3','1,4','','0,01','2,20','0,10','0,02','','','','0,20','4,12','0,02','1,29','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','166','Abiu, cru','0,3','0,1','0,1','','','0,30','0,03','','','','','','0,11','','0,10','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','167','Açaí, polpa, com xarope de guaraná e glucose','0,7','1,9','0,3','','Tr','0,58','0,07','Tr','','','','0,07','1,88','Tr','0,30','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','168','Açaí, polpa, congelada','0,7','2,0','0,4','','Tr','0,66','0,07','Tr','','','','0,08','1,93','','0,35','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','173','Ameixa, em calda, enlatada, drenada ','0,1','Tr','0,1','','','0,07','0,02','0,01','','','','','0,03','0,01','0,07','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','174','Atemóia, crua','0,1','Tr','0,1','','','0,09','0,03','Tr','Tr','Tr','','','0,01','','0,06','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','191','Ciriguela, crua','0,2','Tr','0,1','','0,01','0,11','0,02','','Tr','Tr','','','0,02','','0,07','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','192','Cupuaçu, cru','0,4','0,2','0,1','','Tr','0,37','0,04','Tr','Tr','Tr','','0,01','0,20','','0,03','0,09','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','193','Cupuaçu, polpa, congelada','0,3','0,1','Tr','','Tr','0,26','0,03','Tr','Tr','Tr','','Tr','0,13','Tr','0,01','0,03','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','196','Fruta-pão, crua','0,1','Tr','Tr','','','0,08','Tr','Tr','Tr','Tr','','','0,02','','0,01','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','197','Goiaba, branca, com casca, crua','0,1','Tr','0,2','','','0,04','0,02','Tr','','Tr','','','0,03','','0,23','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','200','Goiaba, vermelha, com casca, crua','0,1','Tr','0,3','','','0,04','0,02','Tr','','Tr','','','0,04','','0,26','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','201','Graviola, crua','Tr','0,1','Tr','','','0,05','Tr','','','','','','0,08','','0,01','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','204','Jaca, crua','0,1','0,1','Tr','','','0,09','Tr','Tr','Tr','Tr','','Tr','0,07','','Tr','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','207','Kiwi, cru','0,1','0,1','0,3','','','0,04','0,02','Tr','','','','Tr','0,10','','0,06','0,29','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','221','Maçã, Argentina, com casca, crua','0,1','Tr','Tr','','Tr','0,04','0,02','Tr','Tr','Tr','','Tr','0,02','','0,04','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','223','Macaúba, crua','7,1','25,3','6,5','','0,04','6,01','0,97','0,05','','','','0,67','24,57','0,04','6,18','0,30','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','228','Manga, Haden, crua','0,1','0,1','Tr','Tr','Tr','0,07','Tr','Tr','Tr','Tr','','0,04','0,05','Tr','0,02','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','230','Manga, polpa, congelada','0,1','0,1','Tr','','0,01','0,07','Tr','','','','','0,03','0,05','','0,01','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','231','Manga, Tommy Atkins, crua','0,1','0,1','Tr','Tr','0,03','0,05','Tr','Tr','Tr','Tr','','0,04','0,04','Tr','Tr','0,04','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','232','Maracujá, cru','0,2','0,3','0,9','','','0,17','0,05','Tr','','','','Tr','0,28','','0,92','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','242','Pêra, Park, crua','0,1','Tr','0,1','','Tr','0,05','0,01','0,01','0,01','0,01','','Tr','0,02','Tr','0,05','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','246','Pinha, crua','0,1','Tr','0,1','','','0,08','0,01','','Tr','Tr','','','0,03','','0,08','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','250','Tamarindo, cru','0,1','0,2','Tr','','Tr','0,09','0,01','Tr','Tr','Tr','','Tr','0,18','Tr','0,02','0,02','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Frutos e derivados','253','Tucumã, cru','4,7','9,7','0,9','','0,02','3,18','1,19','0,25','0,02','0,02','','','9,62','0,06','0,30','0,58','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','259','Azeite, de dendê','43,1','40,1','16,6','0,28','0,79','36,77','4,61','0,35','0,10','0,08','','0,14','39,86','0,24','15,69','0,83','','','','','','0,14','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','260','Azeite, de oliva, extra virgem','14,9','75,5','9,5','','','11,30','2,96','0,38','0,12','0,05','','1,09','74,01','0,25','8,74','0,75','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','261','Manteiga, com sal','49,2','20,4','1,2','2,09','8,06','23,01','9,30','0,15','','','0,81','0,98','17,94','0,13','0,89','0,27','','','','','2,50','0,80','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','262','Manteiga, sem sal','51,5','21,9','1,5','2,11','7,96','23,87','9,64','0,14','','','0,78','0,98','19,80','0,12','1,22','0,27','','','','','2,31','0,51','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','263','Margarina, com óleo hidrogenado, com sal (65% de lipídeos)','14,9','18,2','21,4','0,06','0,11','8,29','5,75','0,23','0,28','0,09','','0,05','17,87','0,28','19,48','1,74','','','','','8,69','1,30','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','265','Margarina, com óleo interesterificado, com sal (65%de lipídeos)','21,9','15,0','27,6','2,50','1,00','12,91','4,35','0,21','0,20','0,08','','0,06','14,70','0,26','24,85','2,64','','','','','0,09','0,24','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','266','Margarina, com óleo interesterificado, sem sal (65% de lipídeos)','20,9','14,4','26,5','2,35','0,94','12,41','4,15','0,20','0,19','0,08','','0,05','14,07','0,25','23,79','2,58','','','','','0,12','0,20','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','267','Óleo, de babaçu','50,9','18,6','30,2','25,03','7,92','9,46','3,14','0,17','0,21','0,07','','','18,51','0,25','27,17','2,86','','','','','','0,19','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','268','Óleo, de canola','7,9','62,6','28,4','','0,06','4,59','2,21','0,57','0,30','0,15','','0,20','61,14','1,11','20,87','6,78','','','','','','0,37','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','269','Óleo, de girassol','10,8','25,4','62,6','','0,07','6,10','3,42','0,26','0,67','0,25','','0,08','25,15','0,18','62,22','0,39','','','','','','1,14','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','270','Óleo, de milho','15,2','33,4','50,9','','','12,12','2,18','0,49','0,18','0,19','','0,12','33,04','0,23','49,94','0,96','','','','','','0,48','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','271','Óleo, de pequi','39,9','55,8','4,2','','0,09','37,37','2,08','0,19','0,05','0,06','','0,83','54,73','0,14','3,74','0,51','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Gorduras e óleos','272','Óleo, de soja','15,2','23,3','60,0','','0,08','10,83','3,36','0,33','0,43','0,14','','0,09','22,98','0,60','53,85','5,72','','','','','','0,50','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','273','Abadejo, filé, congelado, assado','0,6','0,3','0,1','','0,01','0,44','0,11','','','','','0,02','0,29','0,02','0,02','Tr','Tr','0,06','Tr','0,07','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','274','Abadejo, filé, congelado,cozido','0,4','0,3','0,2','','Tr','0,29','0,08','','','','','0,01','0,22','0,02','0,03','','Tr','0,06','Tr','0,08','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','275','Abadejo, filé, congelado, cru','0,1','Tr','0,1','Tr','Tr','0,06','0,02','','','','','Tr','0,04','Tr','Tr','','0,01','0,01','Tr','0,08','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','276','Abadejo, filé, congelado, grelhado','0,6','0,3','0,6','','0,01','0,42','0,11','','','','','0,01','0,27','0,02','0,02','0,02','Tr','0,10','','0,42','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','277','Atum, conserva em óleo','1,0','1,3','3,2','','0,02','0,70','0,26','0,02','0,02','','','0,02','1,27','0,02','2,68','0,29','0,03','0,03','','0,19','','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','278','Atum, fresco, cru','0,5','0,2','Tr','','0,01','0,27','0,17','Tr','Tr','Tr','','0,02','0,18','Tr','0,01','0,01','Tr','Tr','','0,01','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','279','Bacalhau, salgado, cru','0,6','0,3','0,2','Tr','0,03','0,43','0,14','','Tr','Tr','','0,03','0,28','Tr','0,02','0,08','0,03','0,02','','0,06','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','280','Bacalhau, salgado, refogado','0,9','1,1','1,2','','0,02','0,65','0,23','0,02','0,02','Tr','','0,02','1,01','0,03','1,08','0,07','Tr','0,04','','0,04','0,03','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','281','Cação, posta, com farinha de trigo, frita','1,5','2,2','5,2','','0,01','1,03','0,37','0,03','0,04','0,02','','0,01','2,17','0,03','4,62','0,47','0,02','0,01','0,02','0,07','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','282','Cação, posta, cozida','0,2','0,1','0,2','','','0,07','0,12','','','','','Tr','0,08','0,01','Tr','','0,03','0,01','0,01','0,12','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','283','Cação, posta, crua','0,1','0,1','0,2','Tr','Tr','0,07','0,07','','','','','Tr','0,06','0,01','Tr','','0,02','0,02','0,02','0,10','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','284','Camarão, Rio Grande, grande, cozido','0,4','0,2','0,2','','0,01','0,23','0,14','0,01','0,01','Tr','','0,05','0,16','0,01','0,03','Tr','0,04','0,08','0,01','0,09','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','285','Camarão, Rio Grande, grande, cru','0,1','0,1','0,2','','Tr','0,08','0,04','Tr','','','','0,02','0,06','Tr','0,02','Tr','0,02','0,08','0,01','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','286','Camarão, Sete Barbas, sem cabeça, com casca, frito','2,5','3,6','8,8','','','1,69','0,59','0,05','0,08','0,03','','0,05','3,54','','7,76','0,82','0,05','0,08','','0,10','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','287','Caranguejo, cozido','0,2','0,2','Tr','','','0,10','0,09','0,01','0,01','','','0,01','0,14','','0,03','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','288','Corimba, cru','2,5','2,3','0,3','','0,30','1,57','0,31','0,01','0,02','','','1,21','1,02','0,01','0,09','0,12','0,03','0,04','0,01','0,03','0,04','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','289','Corimbatá, assado','4,8','6,4','2,6','','0,51','3,25','0,83','','','','','2,91','3,22','0,26','0,43','0,17','0,16','0,84','0,33','0,26','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','290','Corimbatá, cozido','4,5','6,5','2,3','','0,52','3,15','0,68','','','','','3,12','3,11','0,24','0,21','0,17','0,16','0,89','0,36','0,29','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','291','Corvina de água doce, crua','1,2','0,7','0,1','','0,04','0,75','0,26','0,01','0,01','0,01','','0,18','0,49','Tr','0,04','0,03','0,02','0,01','Tr','Tr','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','292','Corvina do mar, crua','0,7','0,5','0,1','','0,05','0,46','0,13','0,01','Tr','0,01','','0,20','0,27','0,02','0,01','0,02','0,02','0,03','0,03','0,04','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','293','Corvina grande, assada','1,5','1,2','0,3','','0,12','0,99','0,32','0,02','0,01','Tr','0,01','0,42','0,69','0,03','0,03','','0,04','0,05','0,04','0,05','0,02','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','294','Corvina grande, cozida','0,7','0,6','0,6','','0,06','0,49','0,17','','','','','0,23','0,33','0,03','0,02','0,01','0,09','0,17','0,10','0,20','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','295','Dourada de água doce, fresca','3,0','1,4','0,4','0,01','0,19','1,85','0,66','0,03','0,05','0,04','','0,29','1,05','0,07','0,14','','0,06','0,02','0,03','0,04','0,02','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','296','Lambari, congelado, cru','2,0','2,2','1,2','0,02','0,16','1,24','0,47','0,02','0,04','','','0,34','1,82','0,02','0,49','0,17','0,21','0,13','0,06','0,18','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','297','Lambari, congelado, frito','5,5','7,0','8,1','','0,22','3,40','1,39','0,09','0,12','0,04','0,04','0,02','6,72','0,11','6,43','0,78','0,34','0,03','0,08','0,23','0,04','0,06','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','298','Lambari, fresco,cru','3,4','3,3','1,1','0,03','0,15','2,11','0,88','0,04','0,03','0,04','','0,39','2,84','0,05','0,57','','0,12','0,10','0,05','0,12','0,08','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','299','Manjuba, com farinha de trigo, frita','5,5','5,4','10,4','','0,28','3,74','1,08','0,09','0,11','0,04','','0,30','4,90','0,09','7,53','0,84','0,09','0,44','0,17','1,16','','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','300','Manjuba, frita','5,3','6,0','11,7','','0,21','3,59','1,17','0,09','0,13','0,06','','0,23','5,53','0,15','8,92','0,87','0,08','0,35','0,14','1,13','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','301','Merluza, filé, assado','0,2','0,1','0,3','','','0,12','0,06','','','Tr','','Tr','0,10','Tr','0,02','','0,02','0,03','Tr','0,23','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','302','Merluza, filé, cru','0,9','0,5','0,4','','0,17','0,59','0,08','Tr','','0,02','','0,15','0,35','Tr','0,03','0,05','0,02','0,03','0,02','0,11','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','303','Merluza, filé, frito','1,4','2,1','4,3','','0,08','1,03','0,26','','0,03','','','0,14','1,77','0,10','3,07','0,36','','0,19','Tr','0,60','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','304','Pescada, branca, crua','0,8','2,4','0,9','','0,04','0,40','0,22','0,02','0,01','0,01','','0,75','1,61','Tr','0,04','0,05','0,05','0,18','0,13','0,43','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','305','Pescada, branca, frita','2,3','3,2','5,2','','0,14','1,55','0,48','0,04','0,05','0,02','','0,16','2,78','0,19','4,21','0,41','0,02','0,01','0,03','0,45','0,01','0,06','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','306','Pescada, filé, com farinha de trigo, frito','2,2','4,4','9,1','','','1,55','0,53','0,04','0,06','','','0,46','3,91','0,07','6,63','0,75','0,05','0,22','0,08','0,54','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','307','Pescada, filé, cru','0,9','2,3','0,3','','0,05','0,47','0,24','0,02','0,01','0,01','','0,77','1,51','Tr','0,03','0,04','0,02','0,06','0,04','0,13','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','308','Pescada, filé, frito','1,0','1,1','1,2','','0,06','0,64','0,23','0,02','0,01','Tr','','0,10','0,98','0,04','0,87','0,07','0,02','0,02','0,01','0,12','0,02','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','309','Pescada, filé, molho escabeche','1,3','2,9','4,3','','','0,96','0,28','0,03','0,03','','','0,09','2,82','0,04','3,75','0,41','','0,03','0,02','0,10','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','310','Pescadinha, crua','0,3','0,2','0,4','','0,02','0,19','0,05','','','Tr','','0,03','0,15','0,01','0,01','0,01','0,01','0,09','0,01','0,23','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','311','Pintado, assado','1,8','1,3','0,3','Tr','0,16','1,05','0,46','0,02','0,01','','0,02','0,18','0,97','0,06','0,12','0,06','0,04','0,01','','0,02','Tr','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','312','Pintado, cru','0,6','0,4','0,1','','0,03','0,40','0,12','Tr','Tr','Tr','','0,12','0,32','Tr','0,02','0,02','0,01','0,01','0,01','0,01','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','313','Pintado, grelhado','1,1','0,7','0,2','Tr','0,04','0,61','0,34','0,01','0,01','','0,01','0,09','0,50','0,03','0,09','0,02','0,02','0,01','Tr','Tr','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','314','Porquinho, cru','0,4','0,1','Tr','Tr','0,01','0,19','0,14','Tr','Tr','Tr','','0,01','0,11','Tr','0,02','Tr','Tr','Tr','','Tr','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','315','Salmão, filé, com pele, fresco,  grelhado','3,1','4,4','7,0','','0,51','2,02','0,61','','','','','0,69','3,37','0,23','2,99','0,40','0,09','1,21','0,59','1,22','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','316','Salmão, sem pele, fresco, cru','2,5','2,9','3,1','0,01','0,30','1,39','0,49','0,04','0,12','0,07','','0,36','2,26','0,19','1,73','0,03','0,04','0,43','0,22','0,46','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','317','Salmão, sem pele, fresco, grelhado','3,6','4,1','5,0','0,01','0,42','2,00','0,73','0,05','0,17','0,10','','0,54','3,18','0,29','2,43','0,33','0,07','0,72','0,36','0,75','0,02','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','318','Sardinha, assada','1,7','0,5','0,3','','0,16','1,07','0,36','0,03','0,02','0,01','Tr','0,11','0,33','0,02','0,04','0,02','0,02','0,05','Tr','0,18','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','319','Sardinha, conserva em óleo','4,1','5,5','11,9','','0,32','2,66','0,84','0,11','0,11','0,04','','0,33','5,03','0,09','9,78','0,99','0,09','0,44','0,06','0,46','','0,07','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','320','Sardinha, frita','2,6','3,1','6,1','','0,07','1,71','0,62','0,06','0,07','0,02','','0,06','2,92','0,04','5,13','0,43','0,03','0,09','0,01','0,36','','0,09','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','321','Sardinha, inteira, crua','1,7','0,5','0,2','Tr','0,21','1,00','0,27','0,02','0,01','0,01','','0,13','0,28','0,02','0,03','0,02','0,01','0,03','Tr','0,06','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Pescados e frutos do mar','322','Tucunaré, filé, congelado, cru','0,6','0,4','0,4','Tr','0,03','0,37','0,17','0,01','0,02','Tr','','0,08','0,26','0,01','0,09','0,02','0,10','','0,02','0,12','0,01','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','323','Apresuntado','1,9','2,6','1,1','','0,07','1,23','0,61','','','','','0,13','2,39','0,04','1,00','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','324','Caldo de carne, tablete','7,8','2,5','0,1','','0,14','3,91','3,64','0,05','0,02','','','0,03','2,47','','0,13','','','','','','5,32','0,10','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','325','Caldo de galinha, tablete','9,4','3,2','0,2','0,09','0,12','3,98','5,07','0,07','0,05','0,02','','0,04','3,14',' ','0,25','','','','','','6,19','0,11','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','326','Carne, bovina, acém, moído, cozido','4,8','4,6','0,3','','0,27','2,50','1,83','0,01','0,01','','','0,33','4,17','0,03','0,22','0,02','0,02','','','','0,22','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','327','Carne, bovina, acém, moído, cru','2,7','2,4','0,1','','0,14','1,35','1,09','0,01','0,01','','','0,18','2,22','0,01','0,12','0,01','0,01','','','','0,10','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','328','Carne, bovina, acém, sem gordura, cozido','5,5','3,7','0,3','0,01','0,36','2,68','2,16','0,01','0,01','','','0,33','3,32','0,04','0,22','0,03','0,01','','','','0,28','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','329','Carne, bovina, acém, sem gordura, cru','2,8','2,3','0,2','','0,14','1,33','1,19','0,01','','','','0,16','2,12','0,01','0,14','0,02','0,02','0,01','','','0,17','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','330','Carne, bovina, almôndegas, cruas','3,9','3,5','0,9','0,01','0,25','2,10','1,42','0,02','0,02','','','0,29','3,22','0,02','0,81','0,09','0,02','','','','0,25','0,11','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','331','Carne, bovina, almôndegas, fritas','4,2','5,0','5,5','','0,17','2,47','1,40','0,05','0,06','0,02','0,05','0,27','4,59','0,05','4,89','0,52','0,03','','','','0,17','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','332','Carne, bovina, bucho, cozido','2,4','1,4','0,1','','0,11','1,08','1,10','0,01','','0,01','','0,09','1,29','','0,07','0,01','0,01','','','','0,13','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','333','Carne, bovina, bucho, cru','3,3','1,4','0,1','0,01','0,07','1,52','1,49','0,01','','0,02','','0,14','1,26','0,01','0,09','0,01','0,01','','','','0,07','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','334','Carne, bovina, capa de contra-filé, com gordura, crua','6,9','6,2','0,1','0,01','0,53','3,82','2,03','0,01','','','','0,73','5,33','0,01','0,14','','0,01','','','','0,28','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','335','Carne, bovina, capa de contra-filé, com gordura, grelhada','8,8','8,7','0,3','','0,53','4,93','2,82','0,02','','','','0,88','7,67','0,04','0,22','','0,04','0,02','','','0,28','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','336','Carne, bovina, capa de contra-filé, sem gordura, crua','1,9','1,9','0,1','','0,12','1,05','0,58','Tr','Tr','Tr','','0,20','1,66','0,01','0,07','Tr','0,01','','','','0,06','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','337','Carne, bovina, capa de contra-filé, sem gordura, grelhada','4,3','4,3','0,2','0,01','0,27','2,42','1,29','0,01','0,01','','','0,44','3,85','','0,16','0,04','0,04','','','','0,14','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','338','Carne, bovina, charque, cozido','4,8','5,4','0,4','','0,31','2,61','1,73','0,01','0,02','','0,10','0,50','4,68','0,02','0,19','0,05','0,06','0,02','0,04','','0,32','0,08','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','339','Carne, bovina, charque, cru','8,7','6,6','0,2','','0,80','4,45','3,14','','','','','0,54','5,70',' ','0,16','','','','','','0,80','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','340','Carne, bovina, contra-filé, à milanesa','7,2','8,1','6,9','','0,33','4,21','2,35','0,05','0,06','0,02','0,09','0,45','7,36','0,03','6,22','0,61','0,05','','0,02','','0,36','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','341','Carne, bovina, contra-filé de costela, cru','6,7','4,6','0,1','0,01','0,40','3,15','2,85','0,02','0,01','','','0,35','4,21','0,02','0,13','','','','','','0,24','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','342','Carne, bovina, contra-filé de costela, grelhado','8,8','5,6','0,2','0,02','0,59','4,28','3,53','0,02','','','','0,47','5,06','','0,17','0,03','0,02','','','','0,23','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','343','Carne, bovina, contra-filé, com gordura, cru','5,6','5,5','0,2','0,01','0,41','3,21','1,57','0,01','0,01','','','0,62','4,81','0,01','0,15','0,05','0,02','','','','0,17','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','344','Carne, bovina, contra-filé, com gordura, grelhado','7,4','6,3','0,2','0,01','0,50','4,24','2,24','0,01','','','','0,63','5,58','','0,14','0,03','0,01','','','','0,19','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','345','Carne, bovina, contra-filé, sem gordura, cru','2,7','2,6','0,1','','0,15','1,48','0,89','0,01','','','','0,22','2,32','0,01','0,09','','0,02','0,01','','','0,08','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','346','Carne, bovina, contra-filé, sem gordura, grelhado','2,0','1,9','0,1','','0,09','1,12','0,68','','','0,01','','0,16','1,75','','0,07','0,01','0,01','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','347','Carne, bovina, costela, assada','11,8','12,1','0,3','0,03','0,89','6,32','3,76','0,03','','','','1,17','10,64','0,08','0,13','0,15','0,03','','','','0,76','0,10','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','348','Carne, bovina, costela, crua','14,9','12,7','0,3','0,03','1,11','7,76','5,15','0,03','','','','1,31','11,05','0,12','0,15','0,12','','','','','0,76','0,15','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','349','Carne, bovina, coxão duro, sem gordura, cozido','3,5','4,1','0,2','','0,20','1,99','1,14','0,01','0,01','','','0,45','3,59','0,01','0,11','0,02','0,02','','','','0,16','0,08','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','350','Carne, bovina, coxão duro, sem gordura, cru','2,9','2,4','0,1','','0,21','1,66','0,98','0,01','','','','0,22','2,12','','0,05','0,01','0,01','','','','0,10','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','351','Carne, bovina, coxão mole, sem gordura, cozido','4,3','3,4','0,2','','0,26','2,36','1,46','0,01','','','','0,28','3,10','0,01','0,14','0,01','0,02','','','','0,15','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','352','Carne, bovina, coxão mole, sem gordura, cru','3,9','3,7','0,1','','0,29','2,34','1,06','0,01','','','','0,45','3,23','','0,08','0,01','0,01','','','','0,12','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','353','Carne, bovina, cupim, assado','5,5','5,4','0,2','0,02','0,40','3,07','1,65','0,01','0,01','','','0,61','4,71','0,02','0,16','0,03','0,02','','','','0,22','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','354','Carne, bovina, cupim, cru','6,8','6,4','0,2','0,01','0,46','3,80','2,06','0,01','0,01','','','0,71','5,56','0,04','0,15','0,06','','','','','0,30','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','355','Carne, bovina, fígado, cru','2,8','1,5','0,1','Tr','0,18','1,28','1,44','0,01','0,01','Tr','','0,09','1,43','0,01','0,05','Tr','Tr','','Tr','','0,16','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','356','Carne, bovina, fígado, grelhado','4,7','2,2','1,1','','0,14','2,30','1,86','0,01','0,12','0,02','','0,23','1,89','','0,37','0,10','0,31','0,07','0,16','0,04','0,09','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','357','Carne, bovina, filé mingnon, sem gordura, cru','2,9','1,9','0,2','','0,17','1,44','1,16','0,01','0,01','','','0,15','1,69','0,01','0,11','0,02','0,03','0,01','','','0,10','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','358','Carne, bovina, filé mingnon, sem gordura, grelhado','4,5','3,1','0,2','','0,25','2,21','1,76','0,01','','0,01','','0,23','2,87','','0,16','0,02','0,02','','','','0,14','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','359','Carne, bovina, flanco, sem gordura, cozido','3,9','2,8','0,1','','0,27','2,07','1,40','0,01','','','','0,28','2,49','0,01','0,08','0,01','','','','','0,16','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','360','Carne, bovina, flanco, sem gordura, cru','3,1','2,3','0,1','','0,19','1,65','1,13','0,01','','','','0,18','2,09','','0,07','0,01','0,01','','','','0,11','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','361','Carne, bovina, fraldinha, com gordura, cozida','12,1','10,4','0,5','0,02','0,95','6,35','3,98','0,02','','','','1,10','9,07','0,07','0,29','0,12','0,05','','','','0,50','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','362','Carne, bovina, fraldinha, com gordura, crua','7,3','6,5','0,3','0,01','0,59','3,77','2,39','0,01','','','','0,71','5,63','0,06','0,16','0,09','0,01','','','','0,43','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','363','Carne, bovina, lagarto, cozido','3,9','4,0','0,2','','0,22','2,22','1,25','0,01','0,02','','','0,42','3,54','0,01','0,12','0,02','0,01','','','','0,15','0,07','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','364','Carne, bovina, lagarto, cru','2,3','2,3','0,1','','0,14','1,36','0,66','','Tr','','','0,25','1,98','','0,06','0,01','Tr','','','','0,08','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','365','Carne, bovina, língua, cozida','11,2','10,3','0,5','','0,68','5,54','4,20','0,02','0,02','','','0,77','9,31','','0,43','0,09','0,02','','','','0,41','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','366','Carne, bovina, língua, crua','6,8','6,8','0,3','0,01','0,41','3,40','2,63','0,01','','','','0,48','6,11','0,06','0,26','0,04','0,01','','0,01','','0,29','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','367','Carne, bovina, maminha, crua','3,1','3,1','0,1','0,01','0,21','1,71','0,93','0,01','','','','0,32','2,70','0,01','0,09','0,01','0,01','','','','0,08','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','368','Carne, bovina, maminha, grelhada','9,7','7,7','0,2','0,02','0,63','4,96','3,49','0,04','0,02','','','0,77','6,79','0,04','0,19','0,04','0,02','','','','0,42','0,06','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','369','Carne, bovina, miolo de alcatra, sem gordura, cru','3,4','3,3','0,1','','0,20','1,79','1,10','0,01','0,01','','','0,36','2,85','0,02','','0,04','0,03','0,01','','','0,16','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','370','Carne, bovina, miolo de alcatra, sem gordura, grelhado','5,1','4,9','0,3','','0,32','2,82','1,61','0,01','0,01','','','0,52','4,28','0,03','0,16','0,04','0,04','0,01','','','0,21','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','371','Carne, bovina, músculo, sem gordura, cozido','2,9','2,8','0,1','','0,13','1,64','0,99','0,01','0,01','0,01','','0,26','2,48','0,01','0,09','0,03','0,01','','','','0,13','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','372','Carne, bovina, músculo, sem gordura, cru','2,2','2,6','0,1','','0,12','1,27','0,71','0,01','0,01','','','0,21','2,35','0,01','0,07','0,01','0,01','','','','0,08','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','373','Carne, bovina, paleta, com gordura, crua','3,5','2,9','0,2','0,01','0,19','1,72','1,38','0,01','','','','0,24','2,60','0,02','0,12','0,01','0,01','','','','0,20','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','374','Carne, bovina, paleta, sem gordura, cozida','3,4','3,0','0,2','0,01','0,18','1,68','1,31','0,01','0,01','0,01','','0,23','2,69','0,02','0,16','0,01','0,01','','','','0,15','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','375','Carne, bovina, paleta, sem gordura, crua','2,7','2,1','0,1','0,01','0,15','1,33','1,11','0,01','','','','0,16','1,90','0,01','0,11','','0,01','','','','0,15','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','376','Carne, bovina, patinho, sem gordura, cru','2,0','1,9','0,2','','0,11','1,08','0,66','','0,01','','','0,17','1,65','0,01','0,10','0,02','0,03','','','','0,07','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','377','Carne, bovina, patinho, sem gordura, grelhado','3,1','3,1','0,3','0,01','0,15','1,59','1,13','0,01','0,01','0,01','','0,25','2,81','0,04','0,17','0,03','0,05','0,01','0,03','','0,11','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','378','Carne, bovina, peito, sem gordura, cozido','11,7','11,5','0,4','0,02','0,86','6,10','4,08','0,02','','','','1,09','10,21','0,07','0,32','0,10','0,02','','','','0,67','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','379','Carne, bovina, peito, sem gordura, cru','8,2','9,2','0,5','','0,56','4,40','2,62','0,02','','','','0,95','8,03','0,04','0,26','0,15','0,02','','','','0,54','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','380','Carne, bovina, picanha, com gordura, crua','6,1','6,7','0,3','','0,42','3,46','1,83','0,01','0,01','','','0,73','5,86','0,01','0,22','0,05','0,03','','','','0,22','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','381','Carne, bovina, picanha, com gordura, grelhada','7,9','9,2','0,4','','0,59','4,59','2,15','0,02','0,02','','','1,01','8,04','0,03','0,25','0,07','0,05','0,02','','','0,23','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','382','Carne, bovina, picanha, sem gordura, crua','2,0','2,1','0,1','Tr','0,15','1,18','0,61','Tr','Tr','Tr','','0,22','1,83','0,01','0,08','Tr','0,01','','','','0,04','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','383','Carne, bovina, picanha, sem gordura, grelhada','4,5','5,2','0,3','0,01','0,32','2,48','1,36','0,01','0,01','0,01','','0,51','4,64','','0,22','','0,04','','','','0,11','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','384','Carne, bovina, seca, cozida','10,5','8,3','0,4','0,03','0,68','5,11','4,42','0,04','','','0,12','0,59','7,52','0,03','0,24','0,08','0,05','','0,05','','0,71','0,22','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','385','Carne, bovina, seca, crua','8,7','7,5','0,3','0,02','0,70','4,45','3,05','0,03','','','0,18','0,40','6,76','0,04','0,18','0,10','0,03','','0,05','','0,59','0,07','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','386','Coxinha de frango, frita','2,6','3,4','4,7','0,01','0,03','1,76','0,65','0,05','0,06','0,02','','0,02','3,32','0,07','4,33','0,32','0,01','','','','0,45','0,13','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','388','Croquete, de carne, frito','5,1','7,4','11,5','','0,13','3,13','1,51','0,08','0,10','0,04','','0,16','7,10','0,07','10,47','1,04','','','','','0,27','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','390','Empada, de frango, pré-cozida','5,4','5,2','1,4','','0,03','2,62','2,56','0,08','0,08','0,03','','0,04','5,12','0,03','1,22','0,07','','','','','6,21','0,96','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','391','Frango, asa, com pele, crua','4,4','6,6','3,0','','0,09','3,36','0,93','','0,03','','','0,80','5,75','','2,96','0,01','0,06','','','','0,03','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','392','Frango, caipira, inteiro, com pele, cozido','4,4','7,5','2,3','','0,09','3,23','1,00','0,01','Tr','','','0,69','6,73','0,03','2,18','0,09','Tr','','Tr','Tr','0,03','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','393','Frango, caipira, inteiro, sem pele, cozido','2,2','3,4','1,2','','0,04','1,57','0,59','0,01','Tr','Tr','','0,26','3,14','0,02','1,16','0,04','Tr','','Tr','Tr','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','394','Frango, coração, cru','4,9','6,3','3,4','','0,12','3,49','1,16','0,01','0,01','','','0,66','5,56','0,06','3,15','0,13','0,09','','','','0,09','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','395','Frango, coração, grelhado','3,5','4,3','1,6','','0,06','2,33','1,03','0,02','0,02','0,01','0,01','0,37','0,08','0,04','1,41','0,04','0,08','','0,01','','0,08','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','396','Frango, coxa, com pele, assada','3,1','3,8','2,2','','0,06','2,28','0,76','0,02','Tr','','0,01','0,38','3,35','0,02','2,11','0,09','Tr','Tr','','','0,12','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','397','Frango, coxa, com pele, crua','3,0','4,1','2,2','','0,05','2,24','0,68','0,01','0,02','','','0,45','3,61','0,02','2,00','0,09','0,05','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','398','Frango, coxa, sem pele, cozida','2,0','2,1','1,1','','0,12','1,31','0,50','0,01','Tr','','0,01','0,20','1,84','0,01','1,10','0,05','Tr','Tr','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','399','Frango, coxa, sem pele, crua','1,6','2,1','0,8','','0,03','1,19','0,40','Tr','0,01','','','0,24','1,82','0,01','0,80','0,02','0,03','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','400','Frango, fígado, cru','1,3','0,7','0,6','Tr','0,02','0,69','0,58','0,01','0,01','0,01','','0,05','0,58','0,01','0,38','0,01','0,13','','0,03','0,02','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','401','Frango, filé, à milanesa','1,6','2,4','3,3','','0,02','1,09','0,44','0,03','0,04','0,02','','0,05','2,24','0,03','3,01','0,23','0,04','0,02','','','0,02','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','402','Frango, inteiro, com pele, cru','5,2','7,2','3,9','','0,11','3,94','1,01','0,02','0,03','','','0,88','6,31','0,03','3,57','0,20','0,07','','','','0,07','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','403','Frango, inteiro, sem pele, assado','2,1','2,6','1,8','','0,04','1,48','0,57','0,01','Tr','Tr','0,01','0,19','2,36','0,02','1,73','0,09','Tr','Tr','','','0,10','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','404','Frango, inteiro, sem pele, cozido','2,2','2,5','1,5','','0,04','1,58','0,55','0,01','Tr','','0,01','0,23','2,26','0,02','1,42','0,07','Tr','Tr','','','0,09','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','405','Frango, inteiro, sem pele, cru','1,4','1,9','1,0','','0,03','1,04','0,31','Tr','0,01','','','0,23','1,63','0,01','0,92','0,04','0,05','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','406','Frango, peito, com pele, assado','2,2','2,7','1,8','','0,04','1,53','0,56','0,01','Tr','Tr','0,01','0,22','2,45','0,02','1,70','0,10','Tr','Tr','Tr','','0,10','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','407','Frango, peito, com pele, cru','2,2','3,2','0,9','','0,06','1,66','0,46','0,01','0,01','','','0,44','2,75','0,03','0,80','0,03','0,03','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','408','Frango, peito, sem pele, cozido','1,1','1,1','0,6','','0,02','0,74','0,33','0,01','Tr','Tr','','0,07','0,98','0,01','0,53','0,02','Tr','Tr','','','0,04','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','409','Frango, peito, sem pele, cru','1,1','1,3','Tr','','0,03','0,79','0,25','Tr','0,01','','','0,16','1,16','0,01','Tr','0,01','0,02','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','410','Frango, peito, sem pele, grelhado','0,9','0,9','0,3','','0,02','0,65','0,27','Tr','Tr','Tr','','0,07','0,80','0,01','0,31','0,01','Tr','Tr','','','0,04','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','411','Frango, sobrecoxa, com pele, assada','4,2','5,4','3,9','','0,07','3,08','1,02','0,01','Tr','','0,02','0,50','4,80','0,04','3,64','0,21','Tr','Tr','','','0,19','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','412','Frango, sobrecoxa, com pele, crua','6,5','9,6','3,6','','0,12','4,96','1,31','0,02','0,02','','','1,13','8,44','0,02','3,41','0,12','0,08','','','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','413','Frango, sobrecoxa, sem pele, assada','3,3','4,2','3,1','','0,06','2,41','0,82','0,01','Tr','','0,01','0,42','3,76','0,03','2,86','0,17','Tr','Tr','','','0,14','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','414','Frango, sobrecoxa, sem pele, crua','3,0','4,5','1,6','','0,06','2,30','0,61','0,01','0,02','','','0,57','3,87','0,02','1,45','0,04','0,05','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','415','Hambúrguer, bovino, cru','5,7','5,8','0,8','0,02','0,39','3,06','1,97','0,02','','','0,12','0,58','4,96','0,03','0,68','0,08','0,03','','','0,01','0,81','0,19','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','416','Hambúrguer, bovino, frito','5,9','6,0','3,7','','0,29','3,18','2,19','0,03','0,03','0,02','0,07','0,41','5,37','0,07','3,28','0,29','0,03','','0,02','','0,33','0,11','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','417','Hambúrguer, bovino, grelhado','5,1','4,8','1,2','','0,26','2,72','2,01','0,02','0,01','','0,05','0,42','4,25','0,02','1,08','0,10','0,04','0,02','','','0,30','0,06','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','418','Lingüiça, frango, crua','5,2','7,3','3,5','0,01','0,16','3,59','1,35','0,02','','','0,01','0,52','6,70','0,08','3,08','0,17','','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','419','Lingüiça, frango, frita','5,0','7,2','4,3','','0,14','3,46','1,33','0,03','','','','0,45','6,60','0,10','3,85','0,25','0,09','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','420','Lingüiça, frango, grelhada','4,7','6,8','3,4','','0,14','3,26','1,26','0,02','','','','0,44','6,20','0,09','3,00','0,17','0,09','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','421','Lingüiça, porco, crua','4,0','5,0','1,7','0,01','0,15','2,52','1,24','0,02','','','','0,25','4,66','0,08','1,48','0,05','0,06','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','422','Lingüiça, porco, frita','6,5','8,2','2,7','','0,25','4,17','2,01','0,03','','','','0,29','7,66','0,13','2,43','0,11','0,09','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','423','Lingüiça, porco, grelhada','7,0','8,7','2,6','','0,27','4,47','2,17','0,03','','','','0,44','8,07','0,13','2,35','0,10','0,10','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','424','Mortadela','6,1','8,1','4,7','','0,17','4,15','1,74','','','','','0,60','7,36','0,12','4,41','0,28','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','425','Peru, congelado, assado','1,6','1,2','1,4','','0,03','1,10','0,47','0,02','Tr','Tr','','0,11','1,60','0,01','1,41','0,03','Tr','Tr','','','0,02','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','426','Peru, congelado, cru','0,4','0,4','0,7','0,01','0,01','0,26','0,14','Tr','0,01','','','0,03','0,41','Tr','0,63','0,03','0,06','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','427','Porco, bisteca, crua','3,5','3,9','1,2','0,01','0,13','2,17','1,12','0,02','','','','0,21','3,37','0,06','1,12','0,05','0,05','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','428','Porco, bisteca, frita','6,0','6,6','4,6','0,05','0,31','3,58','1,94','0,04','0,02','0,02','','0,25','6,17','0,11','4,07','0,32','0,07','','0,02','','0,16','0,05','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','429','Porco, bisteca, grelhada','7,5','7,7','1,2','0,02','0,27','4,27','2,82','0,03','','','','0,31','7,14','0,13','1,03','0,03','0,03','','','','0,09','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','430','Porco, costela, assada','11,8','13,9','3,1','','0,34','7,10','4,16','0,06','','','','0,63','12,90','0,23','2,75','0,12','0,09','','','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','431','Porco, costela, crua','7,4','8,3','2,3','0,02','0,28','4,59','2,42','0,03','','','','0,45','7,64','0,12','2,11','0,09','0,08','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','432','Porco, lombo, assado','2,6','2,9','0,7','','0,08','1,54','0,97','0,01','','','','0,11','2,63','0,16','0,55','0,07','0,02','','','','0,02','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','433','Porco, lombo, cru','3,3','3,7','1,0','0,01','0,12','2,08','1,00','0,02','','','','0,22','3,39','0,06','0,88','0,04','0,05','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','434','Porco, orelha, salgada, crua','7,3','11,2','2,8','0,02','0,33','4,99','1,84','0,03','','','','0,90','10,15','0,19','2,58','0,11','0,09','','','','',' ','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','435','Porco, pernil, assado','4,8','6,4','1,9','','0,15','2,96','1,59','0,03','','','','0,29','5,91','0,11','1,66','0,05','0,11','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','436','Porco, pernil, cru','4,2','5,0','1,7','0,01','0,16','2,58','1,29','0,02','0,02','','','0,26','4,64','0,09','1,51','0,06','0,08','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','437','Porco, rabo, salgado, cru','11,6','16,7','4,3','','0,37','7,37','3,58','0,07','','','','0,78','15,49','0,30','3,85','0,16','0,07','','','','0,07','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','438','Presunto, com capa de gordura','1,9','2,6','1,0','','0,06','1,22','0,63','0,01','','','','0,13','2,39','0,05','0,87','0,04','0,04','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','439','Presunto, sem capa de gordura','0,9','1,1','0,5','','0,03','0,55','0,27','','','','','0,07','1,04','0,02','0,38','0,01','0,04','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','440','Quibe, assado','1,2','0,9','0,3','','0,08','0,68','0,43','','','','','0,06','0,87','','0,25','0,02','','','Tr','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','441','Quibe, cru','0,7','0,7','0,3','','0,03','0,35','0,24','','','','','0,06','0,63','0,01','0,21','0,03','0,02','0,01','0,01','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','442','Quibe, frito','4,6','5,0','5,0','','0,16','2,50','1,68','0,04','0,05','0,03','0,03','0,17','4,75','0,05','4,55','0,41','0,03','','','','0,18','0,08','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','443','Salame','9,6','12,1','4,7','','0,34','5,78','3,09','0,05','','','','0,55','11,21','0,23','4,23','0,19','0,03','','','','0,10','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','444','Toucinho, cru','17,7','20,1','10,1','0,06','0,75','11,42','5,21','0,09','','','','0,98','18,82','0,28','9,32','0,68','0,15','','','','0,21','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Carnes e derivados','445','Toucinho, frito','20,0','26,2','14,6','','0,64','12,89','6,17','0,12','0,07','','','1,02','24,55','0,45','12,93','0,86','','','0,06','','0,33','0,25','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','446','Bebida láctea, pêssego','1,1','0,6','Tr','0,05','0,19','0,54','0,25','Tr','Tr','','0,01','0,02','0,53','0,01','0,03','0,02','Tr','','','','0,06','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','447','Creme de Leite','11,8','5,1','0,5','0,49','1,91','5,58','2,38','0,04','','','0,18','0,36','4,50','','0,33','0,07','','','','','0,63','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','448','Iogurte, natural','1,8','0,9','0,1','0,07','0,30','0,91','0,40','0,01','Tr','Tr','0,02','0,04','0,83','0,01','0,06','0,03','Tr','','Tr','Tr','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','449','Iogurte, natural, desnatado','0,2','0,1',' ','0,01','0,03','0,10','0,05','','','','',' ','0,09',' ','Tr','','','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','451','Iogurte, sabor morango','1,4','0,7','0,1','0,07','0,26','0,70','0,29','Tr','','','0,01','0,03','0,62','Tr','0,05','0,02','Tr','','Tr','Tr','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','452','Iogurte, sabor pêssego','1,4','0,6','0,1','0,06','0,25','0,70','0,29','Tr','Tr','','0,01','0,03','0,59','Tr','0,04','0,02','Tr','','','','0,06','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','453','Leite, condensado','4,2','1,7','0,2','0,17','0,73','2,10','0,82','0,01','','','','0,14','1,47','0,02','0,10','0,04','','','','','0,20','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','454','Leite, de cabra','2,4','0,8','0,1','0,10','0,29','1,00','0,60','0,01','Tr','','','0,03','0,79',' ','0,11','0,01','0,01','','','','0,10','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','455','Leite, de vaca, achocolatado','1,1','0,6','0,1','0,03','0,14','0,53','0,29','0,01','Tr','Tr','0,01','0,03','0,56','Tr','0,11','0,01','Tr','','','','0,19','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','456','Leite, de vaca, desnatado, pó','0,6','0,2','Tr','0,02','0,09','0,29','0,12','Tr','0,01','Tr','0,01','0,02','0,20','','0,03','Tr','Tr','','','','0,02','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','458','Leite, de vaca, integral','1,4','0,7','0,1','0,06','0,25','0,71','0,29','','',' ','0,01','0,03','0,65','','0,04','0,02','','','Tr','Tr','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','459','Leite, de vaca, integral, pó','16,3','7,1','0,5','0,58','2,62','8,11','3,48','0,05','','0,03','0,15','0,56','6,25','0,05','0,41','0,10','','','','','0,84','0,10','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','461','Queijo, minas, frescal','11,4','5,8','0,4','0,41','1,73','5,78','2,53','0,04','0,02','0,02','0,16','0,39','5,14','0,04','0,28','0,06','0,02','','','','0,54','0,12','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','462','Queijo, minas, meia cura','13,2','5,6','0,3','0,55','2,13','6,15','2,59','0,05','','','0,23','0,46','4,82','','0,24','0,10','','','','','0,99','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','463','Queijo, mozarela','14,2','6,0','0,5','0,61','2,37','6,66','3,02','','','','0,22','0,43','5,22','','0,31','0,08','','','','','0,86','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','464','Queijo, parmesão','19,7','8,7','0,4','0,70','3,26','10,07','4,24','0,06','0,03','0,03','0,32','0,63','7,67','0,03','0,29','0,11','0,03','','','','1,01','0,16','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','465','Queijo, pasteurizado','15,9','7,3','0,4','0,58','2,58','8,05','3,38','0,05','','','0,23','0,49','6,45','0,05','0,33','0,08','','','','','0,85','0,18','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','466','Queijo, petit suisse, morango','1,6','0,8','Tr','0,05','0,23','0,81','0,40','0,01','','','0,02','0,05','0,76',' ','0,04','0,01','','','','','0,09','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','467','Queijo, prato','16,3','6,8','0,5','0,71','2,67','7,59','3,16','','','','0,27','0,51','5,91','','0,42','0,11','','','','','0,87','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','468','Queijo, requeijão, cremoso','13,7','6,4','0,3','0,52','2,26','7,16','2,72','0,04','0,04','0,02','0,24','0,50','5,54','0,04','0,24','0,07','','','','','0,55','0,11','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leite e derivados','469','Queijo, ricota','4,5','2,4','0,2','0,15','0,66','2,28','1,06','0,02','0,02','0,02','0,06','0,15','2,16','0,02','0,14','0,02','0,01','','','','0,21','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Ovos e derivados','484','Omelete, de queijo','6,4','7,0','6,2','0,08','0,42','4,20','1,56','0,04','0,05','0,02','0,04','0,26','6,61','0,05','5,53','0,44','0,15','','','0,04','0,15','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Ovos e derivados','485','Ovo, de codorna, inteiro, cru','8,9','12,1','2,7','Tr','0,13','6,39','2,31','0,01','0,03','','0,03','1,07','11,01','0,03','2,20','0,10','0,44','','','','0,04','0,07','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Ovos e derivados','487','Ovo, de galinha, gema, cozida/10minutos','9,2','12,1','4,0','','0,08','6,56','2,43','','0,03','','','0,67','11,29','0,07','3,25','0,05','0,44','','','0,10','0,05','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Ovos e derivados','488','Ovo, de galinha, inteiro, cozido/10minutos','2,9','3,8','1,1','','0,02','2,07','0,76','','0,01','','','0,21','3,51','0,02','0,94','0,02','0,12','','','0,02','0,02','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Ovos e derivados','489','Ovo, de galinha, inteiro, cru','2,6','3,6','1,2','','0,02','1,87','0,69','','0,01','0,01','','0,23','3,33','0,01','0,88','0,02','0,14','','0,05','0,04','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Ovos e derivados','490','Ovo, de galinha, inteiro, frito','4,1','5,7','4,9','','0,03','2,95','1,05','0,02','0,03','0,02','','0,23','5,45','0,04','4,34','0,33','0,17','','','0,03','0,02','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','491','Achocolatado, pó','1,1','0,6','0,3','Tr','0,02','0,51','0,55','0,02','0,01','Tr','','0,01','0,62','','0,29','0,03','','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','495','Chocolate, ao leite','17,5','10,0','0,9','0,09','0,34','7,46','9,12','0,26','0,03','','','0,14','9,75','0,06','0,91','0,03','','','','','0,17','0,10','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','496','Chocolate, ao leite, com castanha do Pará','14,1','9,3','3,2','0,10','0,33','6,24','6,73','0,20','0,04','0,02','','0,09','9,14','','3,09','0,07','','','','','0,20','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','497','Chocolate, ao leite, dietético','19,2','11,4','1,5','0,06','0,22','8,08','10,29','0,31','0,06','0,03','','0,10','11,32','','1,41','0,10','','','','','0,18','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','498','Chocolate, meio amargo','13,1','8,1','1,0','0,01','0,06','5,61','7,08','0,21','0,04','0,02','','0,05','8,03','0,01','0,94','0,06','','','','','0,14','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','499','Cocada branca','8,4','0,4','0,1','4,56','1,56','0,61','0,20','','','','','','0,36','','0,07','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','500','Doce, de abóbora, cremoso','Tr','Tr','Tr','Tr','Tr','0,02','Tr','Tr','','Tr','','','0,02','','0,01','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','501','Doce, de leite, cremoso','1,3','3,9','2,0','','','0,73','0,17','0,08','0,20','0,13','','','3,74','0,11','1,94','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','502','Geléia, mocotó, natural','Tr','Tr','Tr','','','Tr','Tr','','','','','','Tr','','Tr','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Produtos açucarados','509','Quindim','11,3','4,8','4,7','4,10','1,60','2,97','1,47','0,04','0,04','','','0,16','4,55','0,04','4,19','0,35','0,11','','','','0,05','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Miscelâneas','511','Café, pó, torrado','5,3','1,1','4,9','','0,01','4,04','0,95','0,29','0,06','','','0,01','1,11','0,02','4,82','0,11','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Miscelâneas','512','Capuccino, pó','4,0','1,6','0,1','0,27','0,59','1,73','0,95','0,02','0,02','','0,05','0,10','1,50',' ','0,11','0,04','','','','','0,55','0,04','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Miscelâneas','518','Shoyu','Tr','Tr','Tr','Tr','Tr','Tr','Tr','','Tr','','','','0,01','','0,01','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Outros alimentos industrializados','520','Azeitona, preta, conserva','3,5','11,0','3,0','','','2,87','0,47','0,08','0,02','0,01','','0,29','10,57','0,04','2,77','0,19','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Outros alimentos industrializados','521','Azeitona, verde, conserva','2,3','8,3','1,0','','','1,93','0,29','0,05','0,01','0,01','','0,18','8,07','0,03','0,91','0,13','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Outros alimentos industrializados','522','Chantilly, spray, com gordura vegetal','25,9','0,1','0,1','10,70','3,64','2,63','7,46','0,08','','0,03','',' ','0,05','Tr','0,08','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Outros alimentos industrializados','523','Leite, de coco','15,6','0,9','0,2','8,25','2,99','1,33','0,51','0,01','','','','','0,92','','0,17','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Outros alimentos industrializados','524','Maionese, tradicional com ovos','4,1','6,4','15,4','','0,02','2,84','0,37','0,08','0,11','0,04','','0,04','6,24','0,14','13,86','1,43','','','','','','0,17','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','525','Acarajé','9,1','7,8','2,1','0,10','0,16','7,71','1,05','0,07','0,02','','','','7,81','','2,01','0,12','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','526','Arroz carreteiro','3,2','3,0','0,2','','0,19','1,61','1,29','0,01','','','0,04','0,24','2,64','0,01','0,16','0,03','0,01','','0,01','','0,18','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','527','Baião de dois, arroz e feijão-de-corda','0,6','1,0','1,5','','Tr','0,42','0,13','0,01','0,01','Tr','','0,02','0,95','Tr','1,36','0,13','Tr','Tr','','Tr','','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','528','Barreado','3,3','4,3','1,4','','0,12','2,05','1,11','Tr','','','','0,20','3,96','0,05','1,24','0,06','0,05','Tr','0,02','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','529','Bife à cavalo, com contra filé','7,9','8,2','3,3','','0,38','4,59','2,63','0,03','0,03','','0,10','0,57','7,32','0,05','2,88','0,26','0,07','','0,02','0,02','0,40','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','530','Bolinho de arroz','1,8','2,5','3,5','','0,02','1,26','0,44','0,02','0,03','0,02','','0,05','2,39','0,05','3,22','0,24','0,04','','Tr','Tr','Tr','0,06','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','531','Camarão à baiana','1,6','0,9','1,5','1,35','0,62','0,72','0,27','0,02','0,02','','','0,01','0,89','','1,33','0,13','0,01','0,03','','0,03','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','532','Charuto, de repolho','0,5','0,5','0,1','','0,02','0,24','0,20','','','','','0,03','0,44','','0,08','0,02','','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','533','Cuscuz, de milho, cozido com sal','0,2','0,2','0,3','','','0,15','0,02','Tr','','','',' ','0,22','','0,26','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','534','Cuscuz, paulista','1,8','1,8','0,8','0,03','0,15','1,12','0,41','0,01','0,02','0,01','0,01','0,07','1,64','','0,69','0,10','Tr','','','','0,04','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','535','Cuxá, molho','0,6','1,3','1,5','','0,00','0,37','0,18','0,02','0,01','0,00','','0,01','1,25','0,01','1,44','0,06','Tr','0,02','','0,02','','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','536','Dobradinha','2,5','1,2','0,1','Tr','0,11','1,06','1,19','0,02','0,02','0,01','Tr','0,09','1,11','Tr','0,07','0,01','0,03','','0,02','','0,18','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','537','Estrogonofe de carne','5,3','3,3','0,9','0,12','0,65','2,81','1,57','0,02','0,02','','0,04','0,19','3,00','0,02','0,74','0,08','0,02','','0,01','','0,26','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','538','Estrogonofe de frango','3,7','2,2','1,0','0,12','0,54','2,09','0,93','0,02','0,01','Tr','0,03','0,10','2,05','0,02','0,91','0,07','0,04','','Tr','','0,19','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','539','Feijão tropeiro mineiro','2,2','2,9','1,5','','0,06','1,39','0,67','','','','','0,13','2,69','0,04','1,25','0,19','0,05','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','540','Feijoada','1,9','2,6','1,6','','0,07','1,25','0,58','','','','','0,13','2,41','0,04','1,35','0,18','0,02','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','541','Frango, com açafrão','1,6','2,5','1,8','','0,03','1,24','0,34','Tr','Tr','','Tr','0,26','2,23','0,02','1,57','0,11','0,03','','Tr','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','542','Macarrão, molho bolognesa','0,3','0,3','0,3','','Tr','0,21','0,07','Tr','Tr','','','0,01','0,25','Tr','0,28','0,01','','Tr','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','543','Maniçoba','2,9','3,7','1,7','','0,08','1,73','1,01','0,02','0,01','','','0,16','3,42','0,08','1,41','0,16','0,04','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','544','Quibebe','1,0','1,1','0,2','','0,08','0,61','0,32','Tr','','Tr','0,03','0,11','0,95','Tr','0,18','0,06','Tr','Tr','Tr','','0,06','Tr','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','545','Salada, de legumes, com maionese','1,1','1,8','3,8','','','0,79','0,26','0,02','0,03','Tr','','Tr','1,75','0,02','3,46','0,36','','','','','','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','546','Salada, de legumes, cozida no vapor','0,1','Tr','0,2','','','0,05','0,01','Tr','','','','Tr','0,02','','0,07','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','547','Salpicão, de frango','1,3','2,1','4,0','','Tr','0,93','0,34','0,02','0,04','0,02','','0,04','2,02','0,02','3,60','0,36','0,04','','','','','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','548','Sarapatel','1,4','1,1','0,7','','0,02','0,76','0,56','0,02','0,01','0,02','','0,03','1,04','0,01','0,61','0,03','0,04','Tr','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','549','Tabule','0,2','0,8','0,2','','','0,18','0,03','','','','','0,01','0,82','','0,20','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','550','Tacacá','0,2','0,1','Tr','','0,00','0,10','0,05','0,00','0,01','','','0,01','0,12','Tr','0,03','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','551','Tapioca, com manteiga','6,0','3,0','0,2','0,25','1,08','3,38','1,38','0,02','','','0,08','0,18','2,64','0,02','0,17','0,02','','','','','0,30','0,03','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','552','Tucupi, com pimenta-de-cheiro','0,1','0,1','Tr','','','0,06','Tr','','Tr','','','','0,15','Tr','0,04','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','553','Vaca atolada','4,1','3,2','1,2','','0,29','2,10','1,57','0,02','Tr','','0,04','0,21','2,81','0,02','1,11','0,12','','','','','0,21','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','554','Vatapá','7,5','9,7','4,7','0,04','0,34','4,60','2,42','0,04','','','','0,34','9,07','0,17','4,21','0,30','0,06','','','','0,15','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','555','Virado à paulista','8,3','10,6','5,1','0,05','0,37','5,12','2,64','0,05','','','','0,44','9,85','0,19','4,57','0,32','0,07','','','','0,17','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Alimentos preparados','556','Yakisoba','0,6','0,9','1,0','','Tr','0,39','0,19','Tr','','','','0,03','0,84','Tr','0,94','0,05','','Tr','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','557','Amendoim, grão, cru','8,7','17,2','16,2','','','4,85','1,21','0,56','1,36','0,66','','0,03','16,67','0,45','16,17','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','558','Amendoim, torrado, salgado','9,7','29,1','14,2','','0,04','5,28','1,28','0,63','1,52','0,94','','','28,15','0,79','14,18','0,06','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','559','Ervilha, em vagem','Tr','0,1','0,3','','Tr','','0,02','Tr','Tr','0,01','','Tr','0,08','Tr','0,27','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','560','Ervilha, enlatada, drenada','0,1','0,1','0,2','','Tr','0,06','0,02','Tr','Tr','Tr','','','0,10','Tr','0,15','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','561','Feijão, carioca, cozido','0,1','0,1','0,3','','','0,11','0,02','Tr','Tr','0,01','','Tr','0,08',' ','0,16','0,14','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','562','Feijão, carioca, cru','0,2','0,1','0,9','','','0,14','0,03','Tr','0,01','0,01','','','0,11','','0,40','0,49','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','563','Feijão, fradinho, cozido','0,2','0,1','0,3','','Tr','0,18','0,03','0,01','0,02','0,01','','Tr','0,05','Tr','0,21','0,10','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','564','Feijão, fradinho, cru','0,7','0,2','0,9','Tr','Tr','0,50','0,08','0,02','0,04','0,03','','','0,15','0,01','0,58','0,28','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','565','Feijão, jalo, cozido','0,1','0,1','0,3','','Tr','0,10','0,01','Tr','Tr','0,01','','Tr','0,06','','0,11','0,20','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','566','Feijão, jalo, cru','0,3','0,2','0,6','','Tr','0,25','0,03','Tr','0,01','0,01','','Tr','0,15','','0,23','0,41','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','567','Feijão, preto, cozido','0,1','0,1','0,3','','','0,11','0,02','Tr','0,01','0,01','','','0,09','','0,16','0,11','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','568','Feijão, preto, cru','0,2','0,1','0,8','','Tr','0,15','0,03','0,01','0,01','0,01','Tr','Tr','0,13','','0,38','0,47','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','569','Feijão, rajado, cozido','0,1','Tr','0,2','','Tr','0,10','0,02','Tr','Tr','Tr','','Tr','0,03','','0,09','0,13','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','570','Feijão, rajado, cru','0,4','0,1','0,8','','Tr','0,30','0,04','0,01','0,01','0,01','','Tr','0,14','','0,29','0,46','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','571','Feijão, rosinha, cozido','0,2','Tr','0,2','','Tr','0,12','0,02','0,01','0,02','0,01','','Tr','0,04','Tr','0,16','0,07','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','572','Feijão, rosinha, cru','0,6','0,1','0,7','','Tr','0,28','0,05','0,01','0,03','0,02','','','0,09','0,01','0,33','0,14','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','573','Feijão, roxo, cozido','0,1','0,1','0,3','','Tr','0,10','0,01','Tr','Tr','Tr','','Tr','0,06','Tr','0,14','0,19','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','574','Feijão, roxo, cru','0,3','0,2','0,8','','Tr','0,27','0,03','Tr','0,01','0,01','','Tr','0,16','','0,34','0,46','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','575','Grão-de-bico, cru','0,9','1,4','2,8','','0,01','0,57','0,20','0,05','0,02','0,01','','0,01','1,42','0,02','2,71','0,13','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','576','Guandu, cru','0,6','0,2','0,9','','Tr','0,44','0,08','0,02','0,02','0,02','','Tr','0,13','Tr','0,86','0,06','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','577','Lentilha, cozida','0,1','0,1','0,3','','Tr','0,08','0,01','Tr','Tr','Tr','','Tr','0,14','Tr','0,21','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','578','Lentilha, crua','0,1','0,2','0,4','','0,01','0,10','0,01','0,01','Tr','Tr','Tr','Tr','0,16','0,01','0,33','0,09','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','579','Paçoca, amendoim','4,1','10,0','7,3','','','2,24','0,56','0,27','0,65','0,34','','0,01','9,73','0,26','7,25','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','580','Pé-de-moleque, amendoim','5,1','14,4','8,3','','','2,70','0,64','0,35','0,84','0,51','','0,02','13,91','0,41','8,25','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','582','Soja, extrato solúvel, natural, fluido','0,2','0,3','0,6','','Tr','0,12','0,05','Tr','0,01','Tr','','Tr','0,25','0,01','0,58','0,06','','','','','','0,01','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','583','Soja, extrato solúvel, pó','3,3','6,4','12,9','','0,02','2,53','0,57','0,06','0,09','0,03','','0,02','6,30','0,05','11,67','1,23','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','584','Soja, queijo (tofu)','0,4','0,5','1,7','','0,01','0,27','0,10','0,01','0,01','Tr','','Tr','0,51','Tr','1,48','0,20','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','585','Tremoço, cru','1,2','5,4','1,7','','','0,61','0,19','0,10','0,26','0,05','','0,02','4,89','0,33','1,08','0,57','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Leguminosas e derivados','586','Tremoço, em conserva','0,4','1,9','0,6','','','0,20','0,06','0,03','0,09','0,02','','Tr','1,82','0,12','0,40','0,22','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','587','Amêndoa, torrada, salgada','4,8','32,3','16,2','','0,04','3,91','0,77','0,04','0,02','','','0,22','31,95','0,03','16,17','0,03','','','','','0,10','0,02','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','588','Castanha-de-caju, torrada, salgada','7,7','26,5','8,1','','','3,95','3,42','0,23','0,06','0,06','','0,13','26,27','0,08','8,00','0,08','','','','','0,11','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','589','Castanha-do-Brasil, crua','15,3','27,4','21,0','','0,04','0,04','6,14','0,16','0,03','','','0,18','27,14','0,04','20,97','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','590','Coco, cru','30,0','1,5','0,3','15,37','6,12','2,74','0,97','','','','','','1,47','','0,32','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','591','Coco, verde, cru','3,1','1,1','0,3','1,24','0,80','0,77','0,14','Tr','Tr','0,01','','Tr','1,15','Tr','0,28','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','593','Gergelim, semente','7,8','19,9','22,5','','0,03','4,86','2,58','0,26','','0,04','','0,07','19,72','0,09','22,39','0,16','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','594','Linhaça, semente','4,2','7,1','25,3','','0,03','2,49','1,62','0,06','','0,04','','0,03','7,06','0,04','5,42','19,81','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','595','Pinhão, cozido','0,3','0,1','0,2','','','0,18','0,04','0,03','0,02','','','','0,09','','0,22','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','596','Pupunha, cozida','3,1','6,8','0,4','','','2,77','0,26','0,03','','','','0,32','6,45','0,01','0,28','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
-INSERT INTO AGtaco3 (id, categoria, numeroAlimento, descricaoAlimento, saturados, monoinsaturados, poliinsaturados, 12_0, 14_0, 16_0, 18_0, 20_0, 22_0, 24_0, 14_1, 16_1, 18_1, 20_1, 18_2N_6, 18_3N_3, 20_4, 20_5, 22_5, 22_6, 18_1t, 18_2t, created_at, updated_at) VALUES ('','Nozes e sementes','597','Noz, crua','5,6','8,7','44,1','','','4,26','1,34','','','','','','8,66','0,09','35,30','8,82','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
+INSERT INTO `AGtaco3` (`categoria`, `numeroAlimento`, `descricaoAlimento`, `saturados`, `monoinsaturados`, `poliinsaturados`, `12_0`, `14_0`, `16_0`, `18_0`, `20_0`, `22_0`, `24_0`, `14_1`, `16_1`, `18_1`, `20_1`, `18_2N_6`, `18_3N_3`, `20_4`, `20_5`, `22_5`, `22_6`, `18_1t`, `18_2t`, `created_at`, `updated_at`) VALUES
+('Cereais e derivados','1','Arroz, integral, cozido','0,3','0,4','0,3','','Tr','0,25','0,02','Tr','Tr','Tr','','','0,36','Tr','0,31','0,01','','','Tr','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','2','Arroz, integral, cru','0,3','0,5','0,4','','0,01','0,24','0,02','0,01','Tr','Tr','','Tr','0,45','Tr','0,38','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','3','Arroz, tipo 1, cozido','0,2','Tr','Tr','','Tr','0,16','0,01','','','','','','0,04','','0,06','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','4','Arroz, tipo 1, cru','0,1','0,1','0,1','Tr','Tr','0,06','0,01','Tr','Tr','Tr','','','0,06','','0,08','Tr','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','5','Arroz, tipo 2, cozido','0,1','0,1','0,1','','Tr','0,12','0,02','','','','','Tr','0,12','Tr','0,09','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','6','Arroz, tipo 2, cru','0,1','0,1','0,1','','Tr','0,06','0,01','Tr','Tr','Tr','','','0,09','Tr','0,09','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','7','Aveia, flocos, crua','1,5','3,2','3,0','','0,02','1,37','0,14','Tr','','0,02','','Tr','3,10','0,05','2,95','0,06','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','8','Biscoito, doce, maisena','3,9','3,7','2,2','0,03','0,07','2,76','0,94','0,03','0,02','0,01','','0,02','3,70','0,02','2,13','0,10','','','','','1,36','0,22','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','9','Biscoito, doce, recheado com chocolate','6,2','6,6','1,7','0,19','0,13','3,11','2,55','0,07','0,07','0,02','','0,02','6,55','0,04','1,68','0,06','','','','','3,84','0,37','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','10','Biscoito, doce, recheado com morango','6,1','6,5','1,7','0,07','0,07','3,35','2,41','0,06','','','','0,04','6,40','0,02','1,61','0,06','','','','','4,21','0,32','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','11','Biscoito, doce, wafer, recheado de chocolate','6,5','8,1','1,9','','0,02','3,21','3,02','0,09','0,12','0,02','0,02','0,02','8,07','0,02','1,84','0,09','','','','','6,63','0,42','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','12','Biscoito, doce, wafer, recheado de morango','6,7','8,9','1,8','','0,03','3,32','3,10','0,10','0,10','0,03','','0,03','8,83','0,03','1,77','0,08','','','','','7,24','0,56','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','13','Biscoito, salgado, cream cracker','4,4','4,6','2,9','0,01','0,07','2,99','1,24','0,04','0,03','0,01','','0,06','4,52','0,03','2,79','0,01','','','','','1,57','0,23','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','14','Bolo, mistura para','2,1','1,9','0,8','0,01','0,03','1,03','0,97','0,02','0,02','0,01','','0,01','1,88','0,01','0,78','0,03','','','','','0,93','0,15','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','15','Bolo, pronto, aipim','5,0','3,9','1,1','0,98','0,48','1,88','1,28','0,04','0,04','0,01','','0,06','3,80','0,02','1,00','0,06','0,04','','','','1,99','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','16','Bolo, pronto, chocolate','5,5','6,2','3,0','','0,06','2,97','2,33','0,07','0,06','0,02','','0,06','6,15','0,04','2,83','0,04','0,02','','','','2,49','0,42','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','17','Bolo, pronto, coco','4,9','3,0','1,8','1,00','0,48','1,82','1,24','0,03','0,03','0,01','','0,05','2,92','0,03','1,69','0,06','0,02','','','','0,89','0,19','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','18','Bolo, pronto, milho','4,5','3,9','1,5','0,79','0,37','1,79','1,19','0,04','0,05','0,01','','0,06','3,79','0,03','1,34','0,08','0,04','','','','1,82','0,17','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','19','Canjica, branca, crua','0,3','0,2','0,4','','','0,27','0,03','Tr','','Tr','','Tr','0,24','Tr','0,38','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','20','Canjica, com leite integral','0,6','0,4','0,1','0,01','0,08','0,37','0,15','Tr','','','','0,02','0,35','','0,15','Tr','','','','','0,02','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','21','Cereais, milho, flocos, com sal','0,5','0,6','0,9','','Tr','0,39','0,05','0,01','Tr','0,01','','Tr','0,60','0,01','0,89','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','22','Cereais, milho, flocos, sem sal','0,3','0,3','0,6','','Tr','0,27','0,03','0,01','Tr','Tr','','Tr','0,33','Tr','0,60','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','23','Cereais, mingau, milho, infantil','0,3','0,3','0,5','','Tr','0,26','0,03','Tr','Tr','','','','0,28','Tr','0,45','0,01','','','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','24','Cereais, mistura para vitamina, trigo, cevada e aveia','0,5','0,4','1,0','','Tr','0,43','0,03','Tr','Tr','Tr','','Tr','0,34','0,02','0,93','0,06','','','','','','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','25','Cereal matinal, milho','0,4','0,3','0,3','','','0,32','0,04','Tr','Tr','Tr','','Tr','0,32','','0,31','Tr','','Tr','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','26','Cereal matinal, milho, açúcar','0,2','0,3','0,3','','','0,20','0,03','Tr','Tr','Tr','','Tr','0,29','','0,33','Tr','','Tr','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','27','Creme de arroz, pó','0,4','0,3','0,4','','0,01','0,37','0,03','Tr','','0,01','','Tr','0,31','Tr','0,43','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','28','Creme de milho, pó','0,3','0,5','0,8','','','0,29','0,04','0,01','','Tr','','Tr','0,45','Tr','0,75','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','29','Curau, milho verde','0,8','0,5','0,2','0,01','0,11','0,48','0,19','Tr','','','Tr','0,03','0,44','','0,17','Tr','','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','30','Curau, milho verde, mistura para','3,0','4,9','1,4','','0,01','1,55','1,30','0,05','0,06','0,03','',' ','4,85','0,03','1,38','0,03','','','','','2,81','0,63','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','31','Farinha, de arroz, enriquecida','0,2','0,1','0,2','Tr','Tr','0,18','0,01','Tr','Tr','Tr','','Tr','0,08','Tr','0,17','0,01','','','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','32','Farinha, de centeio, integral','0,3','0,3','0,8','','Tr','0,31','0,02','Tr','Tr','','','Tr','0,26','0,01','0,73','','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','33','Farinha, de milho, amarela','0,4','0,4','0,6','Tr','Tr','0,30','0,04','0,01','','','','Tr','0,38','Tr','0,63','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','34','Farinha, de rosca','0,6','0,4','0,8','0,01','0,02','0,44','0,07','Tr','','','','0,01','0,37','0,01','0,74','0,05','','','','','0,02','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','35','Farinha, de trigo','0,3','0,2','0,4','','Tr','0,30','0,01','Tr','Tr','Tr','','Tr','0,13','','0,43','0,01','','Tr','Tr','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','36','Farinha, láctea, de cereais','3,3','1,4','0,6','0,12','0,50','1,73','0,58','0,01','0,01','','0,03','0,11','1,20','','0,59','0,03','','','','','0,13','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','37','Lasanha, massa fresca, cozida','0,6','0,4','0,1','','','0,48','0,10','','','','','0,02','0,40','Tr','0,10','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','38','Lasanha, massa fresca, crua','0,5','0,4','0,4','','','0,39','0,08','','','','','0,01','0,39','Tr','0,38','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','41','Macarrão, trigo, cru, com ovos','0,5','0,4','0,8','','','0,46','0,07','Tr','Tr','Tr','','Tr','0,38','Tr','0,73','0,03','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','43','Milho, fubá, cru','0,4','0,9','1,3','','','0,35','0,07','0,02','Tr','Tr','','Tr','0,89','Tr','1,29','0,03','','','Tr','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','44','Milho, verde, cru','0,2','0,2','0,6','','','0,16','0,01','Tr','Tr','Tr','','Tr','0,23','Tr','0,53','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','45','Milho, verde, enlatado, drenado','0,6','0,8','0,9','','','0,49','0,06','0,01','','','','Tr','0,78','Tr','0,88','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','46','Mingau tradicional, pó','0,1','Tr','0,1','Tr','','0,12','0,01','','','','','','0,05','','0,13','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','47','Pamonha, barra para cozimento, pré-cozida','0,5','0,7','1,4','','0,01','0,37','0,12','0,01','0,01','0,01','',' ','0,65','0,02','1,32','0,09','','','','','0,07','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','48','Pão, aveia, forma','1,1','1,0','1,6','Tr','0,01','0,62','0,40','0,01','0,01','','','0,01','0,94','0,02','1,06','0,59','','','','','0,11','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','49','Pão, de soja','0,7','0,6','1,6','','0,01','0,52','0,16','0,01','0,01','','','0,01','0,62','0,01','1,41','0,14','','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','50','Pão, glúten, forma','0,5','0,6','0,7','','Tr','0,39','0,08','0,01','0,01','','','0,01','0,56','0,01','0,69','0,04','','','','','0,11','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','51','Pão, milho, forma','0,6','0,6','1,0','0,01','0,01','0,47','0,11','0,01','0,01','','','0,01','0,62','0,01','0,98','0,03','','','','','0,07','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','52','Pão, trigo, forma, integral','0,7','0,8','1,1','Tr','0,01','0,50','0,19','0,01','0,01','','','0,02','0,74','0,01','0,98','0,08','','','','','0,21','0,07','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','53','Pão, trigo, francês','1,0','0,9','0,7','Tr','0,01','0,65','0,29','0,01','0,01','','','Tr','0,85','0,01','0,70','0,04','','','','','0,35','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','54','Pão, trigo, sovado','0,8','0,7','0,7','0,01','0,01','0,66','0,14','','','','','0,02','0,62','0,01','0,68','0,04','','','','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','55','Pastel, de carne, cru','3,7','2,9','1,1','0,07','0,12','2,47','1,00','0,03','0,01','0,01','0,01','0,05','2,82','0,01','1,06','0,04','','','','','0,52','0,07','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','56','Pastel, de carne, frito','4,8','5,9','7,6','','0,12','2,73','1,70','0,06','0,10','0,04','','0,08','5,74','0,04','6,97','0,59','0,02','','','','0,54','0,15','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','59','Pastel, massa, crua','2,1','1,7','0,9','0,02','0,03','1,50','0,49','0,02','0,02','0,01','','0,01','1,66','0,01','0,91','0,03','','','','','0,47','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','60','Pastel, massa, frita','6,9','10,1','21,2','','0,04','4,92','1,48','0,16','0,20','0,08','','Tr','9,75','0,33','19,61','1,32','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','61','Pipoca, com óleo de soja, sem sal','2,4','3,7','9,2','','','1,77','0,46','0,05','0,06','0,03','','','3,67','0,03','8,48','0,69','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Cereais e derivados','63','Torrada, pão francês','0,9','0,8','1,0','','0,01','0,63','0,19','0,01','0,01','0,01','','0,01','0,76','0,01','0,99','0,05','','','','','0,38','0,07','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','64','Abóbora, cabotian, cozida','0,1','0,2','0,2','','Tr','0,12','0,02','Tr','','','','Tr','0,22','Tr','0,15','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','65','Abóbora, cabotian, crua','0,1','0,1','0,0','','','0,11','0,01','','','','','','0,08','','0,04','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','68','Abóbora, moranga, refogada','0,1','0,2','0,4','','','0,09','0,03','Tr','Tr','','','','0,19','','0,40','0,05','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','70','Abobrinha, italiana, cozida','0,1','Tr','0,1','','','0,05','Tr','Tr','Tr','Tr','','','Tr','','0,03','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','72','Abobrinha, italiana, refogada','0,1','0,2','0,5','','','0,10','0,03','Tr','Tr','Tr','','','0,18','','0,40','0,06','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','81','Alfavaca, crua','0,1','Tr','0,2','Tr','Tr','0,11','0,02','Tr','Tr','Tr','','0,01','0,01','','0,04','0,16','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','85','Almeirão, refogado','0,8','1,1','2,6','','','0,53','0,19','0,02','0,02','Tr','','Tr','1,11','0,03','2,30','0,35','','','','','','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','90','Batata, frita, tipo chips, industrializada','12,9','11,9','4,0','0,10','0,25','10,98','1,30','0,11','0,02','0,02','','0,04','11,83','0,05','3,85','0,09','','','','','0,02','0,09','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','93','Batata, inglesa, frita','2,1','3,4','6,6','','0,01','1,41','0,52','0,05','0,06','0,01','','0,01','3,31','0,06','6,29','0,30','','','','','','0,07','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','94','Batata, inglesa, sauté','0,3','0,2','0,4','0,02','0,01','0,19','0,07','Tr','Tr','','','','0,20','','0,33','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','99','Biscoito, polvilho doce','2,4','4,3','0,6','','0,03','1,48','0,80','0,05','0,05','0,02','',' ','4,25','0,01','0,56','','','','','','4,05','0,40','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','100','Brócolis, cozido','0,1','Tr','0,2','','Tr','0,08','0,01','Tr','Tr','Tr','Tr','0,01','0,02','','0,06','0,10','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','101','Brócolis, cru','0,1','0,1','0,2','','','0,12','0,02','Tr','','Tr','','0,02','0,04','','0,07','0,12','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','104','Caruru, cru','0,1','Tr','0,3','Tr','Tr','0,13','0,01','','Tr','Tr','','0,02','0,03','','0,09','0,17','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','105','Catalonha, crua','0,1','Tr','0,1','Tr','','0,06','Tr','Tr','Tr','Tr','','Tr','Tr','','0,04','0,10','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','106','Catalonha, refogada','0,7','1,1','3,0','','','0,51','0,15','0,02','0,02','0,01','','0,01','1,04','0,02','2,48','0,48','','','','','','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','109','Cenoura, cozida','Tr','Tr','0,1','','','0,03','Tr','','','','',' ','Tr','','0,12','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','115','Couve, manteiga, crua','0,1','Tr','0,1','','','0,10','0,02','','','','','0,02','0,02','','0,05','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','116','Couve, manteiga, refogada ','1,0','1,6','3,6','','','0,70','0,25','0,03','0,03','0,01','','','1,52','0,04','3,16','0,38','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','118','Couve-flor, cozida','0,1','Tr','0,1','','','0,06','Tr','Tr','','','','Tr','0,02','','0,06','0,06','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','120','Espinafre, Nova Zelândia, refogado','0,9','1,3','2,9','','','0,60','0,22','0,02','0,03','0,02','','Tr','1,27','0,04','2,55','0,38','','','','','','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','121','Farinha, de mandioca, crua','0,1','0,1','Tr','Tr','Tr','0,08','0,02','Tr','Tr','Tr','Tr','Tr','0,08','Tr','0,03','0,01','','','','','Tr','0,10','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','122','Farinha, de mandioca, torrada','0,1','0,1','Tr','Tr','0,03','0,09','0,01','','','','','','0,08','','0,03','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','123','Farinha, de puba','0,2','0,2','Tr','','','0,20','0,02','','','','','','0,19','','0,04','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','126','Inhame, cru','0,1','Tr','0,1','','','0,08','Tr','Tr','Tr','Tr','','','0,04','','0,08','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','127','Jiló, cru','0,1','0,1','0,2','','','0,05','0,02','Tr','Tr','Tr','','Tr','0,05','','0,20','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','128','Jurubeba, crua','0,5','0,5','2,1','','','0,29','0,13','0,01','0,01','0,01','','0,03','0,48','Tr','2,09','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','129','Mandioca, cozida','0,1','0,1','0,1','','','0,07','Tr','','','','','','0,10','','0,05','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','130','Mandioca, crua','0,1','0,1','Tr','','','0,06','Tr','Tr','Tr','Tr','','Tr','0,12','Tr','0,04','Tr','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','131','Mandioca, farofa, temperada','1,9','2,4','2,5','Tr','0,03','1,26','0,54','0,03','0,02','0,01','','0,04','2,38','0,02','2,29','0,19','','','','','0,49','0,14','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','132','Mandioca, frita','1,7','2,8','6,2','','','1,20','0,38','0,03','0,05','0,02','','','2,73','0,05','5,58','0,57','','','','','','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','133','Manjericão, cru','0,1','Tr','0,3','','','0,11','0,02','Tr','','','','0,02','0,01','','0,05','0,21','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','136','Nhoque, batata, cozido','0,6','0,5','0,8','0,02','0,01','0,40','0,15','Tr','Tr','Tr','','0,01','0,47','Tr','0,72','0,05','Tr','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','138','Palmito, Juçara, em conserva','0,1','Tr','0,1','Tr','Tr','0,07','Tr','Tr','Tr','0,01','','','0,03','','0,09','0,01','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','141','Pão, de queijo, cru','3,4','3,0','4,1','0,08','0,29','2,00','0,74','0,03','0,03','','0,03','0,08','2,92',' ','3,67','0,36','','','','','0,63','0,12','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','151','Repolho, roxo, refogado','0,2','0,3','0,7','','','0,15','0,04','Tr','Tr','Tr','','','0,28','Tr','0,61','0,07','','','','','','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','153','Salsa, crua','0,1','Tr','0,2','','','0,08','Tr','Tr','Tr','Tr','','Tr','0,02','','0,11','0,09','','','Tr','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','154','Seleta de legumes, enlatada','0,1','0,2','0,2','','','0,10','0,03','Tr','Tr','Tr','','','0,22','','0,20','0,01','','','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','155','Serralha, crua','0,1','0,1','0,3','Tr','Tr','0,13','0,02','0,02','0,02','Tr','',' ','0,04','','0,07','0,26','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','156','Taioba, crua','0,2','0,1','0,4','Tr','Tr','0,18','0,04','0,02','Tr','0,01','','0,02','0,05','','0,12','0,25','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Verduras, hortaliças e derivados','159','Tomate, molho industrializado','0,1','0,1','0,2','Tr','Tr','0,06','0,02','Tr','Tr','Tr','','Tr','0,09','Tr','0,17','0,02','','','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','163','Abacate, cru','2,3','4,3','1,4','','0,01','2,20','0,10','0,02','','','','0,20','4,12','0,02','1,29','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','166','Abiu, cru','0,3','0,1','0,1','','','0,30','0,03','','','','','','0,11','','0,10','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','167','Açaí, polpa, com xarope de guaraná e glucose','0,7','1,9','0,3','','Tr','0,58','0,07','Tr','','','','0,07','1,88','Tr','0,30','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','168','Açaí, polpa, congelada','0,7','2,0','0,4','','Tr','0,66','0,07','Tr','','','','0,08','1,93','','0,35','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','173','Ameixa, em calda, enlatada, drenada ','0,1','Tr','0,1','','','0,07','0,02','0,01','','','','','0,03','0,01','0,07','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','174','Atemóia, crua','0,1','Tr','0,1','','','0,09','0,03','Tr','Tr','Tr','','','0,01','','0,06','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','191','Ciriguela, crua','0,2','Tr','0,1','','0,01','0,11','0,02','','Tr','Tr','','','0,02','','0,07','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','192','Cupuaçu, cru','0,4','0,2','0,1','','Tr','0,37','0,04','Tr','Tr','Tr','','0,01','0,20','','0,03','0,09','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','193','Cupuaçu, polpa, congelada','0,3','0,1','Tr','','Tr','0,26','0,03','Tr','Tr','Tr','','Tr','0,13','Tr','0,01','0,03','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','196','Fruta-pão, crua','0,1','Tr','Tr','','','0,08','Tr','Tr','Tr','Tr','','','0,02','','0,01','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','197','Goiaba, branca, com casca, crua','0,1','Tr','0,2','','','0,04','0,02','Tr','','Tr','','','0,03','','0,23','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','200','Goiaba, vermelha, com casca, crua','0,1','Tr','0,3','','','0,04','0,02','Tr','','Tr','','','0,04','','0,26','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','201','Graviola, crua','Tr','0,1','Tr','','','0,05','Tr','','','','','','0,08','','0,01','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','204','Jaca, crua','0,1','0,1','Tr','','','0,09','Tr','Tr','Tr','Tr','','Tr','0,07','','Tr','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','207','Kiwi, cru','0,1','0,1','0,3','','','0,04','0,02','Tr','','','','Tr','0,10','','0,06','0,29','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','221','Maçã, Argentina, com casca, crua','0,1','Tr','Tr','','Tr','0,04','0,02','Tr','Tr','Tr','','Tr','0,02','','0,04','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','223','Macaúba, crua','7,1','25,3','6,5','','0,04','6,01','0,97','0,05','','','','0,67','24,57','0,04','6,18','0,30','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','228','Manga, Haden, crua','0,1','0,1','Tr','Tr','Tr','0,07','Tr','Tr','Tr','Tr','','0,04','0,05','Tr','0,02','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','230','Manga, polpa, congelada','0,1','0,1','Tr','','0,01','0,07','Tr','','','','','0,03','0,05','','0,01','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','231','Manga, Tommy Atkins, crua','0,1','0,1','Tr','Tr','0,03','0,05','Tr','Tr','Tr','Tr','','0,04','0,04','Tr','Tr','0,04','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','232','Maracujá, cru','0,2','0,3','0,9','','','0,17','0,05','Tr','','','','Tr','0,28','','0,92','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','242','Pêra, Park, crua','0,1','Tr','0,1','','Tr','0,05','0,01','0,01','0,01','0,01','','Tr','0,02','Tr','0,05','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','246','Pinha, crua','0,1','Tr','0,1','','','0,08','0,01','','Tr','Tr','','','0,03','','0,08','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','250','Tamarindo, cru','0,1','0,2','Tr','','Tr','0,09','0,01','Tr','Tr','Tr','','Tr','0,18','Tr','0,02','0,02','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Frutos e derivados','253','Tucumã, cru','4,7','9,7','0,9','','0,02','3,18','1,19','0,25','0,02','0,02','','','9,62','0,06','0,30','0,58','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','259','Azeite, de dendê','43,1','40,1','16,6','0,28','0,79','36,77','4,61','0,35','0,10','0,08','','0,14','39,86','0,24','15,69','0,83','','','','','','0,14','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','260','Azeite, de oliva, extra virgem','14,9','75,5','9,5','','','11,30','2,96','0,38','0,12','0,05','','1,09','74,01','0,25','8,74','0,75','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','261','Manteiga, com sal','49,2','20,4','1,2','2,09','8,06','23,01','9,30','0,15','','','0,81','0,98','17,94','0,13','0,89','0,27','','','','','2,50','0,80','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','262','Manteiga, sem sal','51,5','21,9','1,5','2,11','7,96','23,87','9,64','0,14','','','0,78','0,98','19,80','0,12','1,22','0,27','','','','','2,31','0,51','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','263','Margarina, com óleo hidrogenado, com sal (65% de lipídeos)','14,9','18,2','21,4','0,06','0,11','8,29','5,75','0,23','0,28','0,09','','0,05','17,87','0,28','19,48','1,74','','','','','8,69','1,30','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','265','Margarina, com óleo interesterificado, com sal (65%de lipídeos)','21,9','15,0','27,6','2,50','1,00','12,91','4,35','0,21','0,20','0,08','','0,06','14,70','0,26','24,85','2,64','','','','','0,09','0,24','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','266','Margarina, com óleo interesterificado, sem sal (65% de lipídeos)','20,9','14,4','26,5','2,35','0,94','12,41','4,15','0,20','0,19','0,08','','0,05','14,07','0,25','23,79','2,58','','','','','0,12','0,20','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','267','Óleo, de babaçu','50,9','18,6','30,2','25,03','7,92','9,46','3,14','0,17','0,21','0,07','','','18,51','0,25','27,17','2,86','','','','','','0,19','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','268','Óleo, de canola','7,9','62,6','28,4','','0,06','4,59','2,21','0,57','0,30','0,15','','0,20','61,14','1,11','20,87','6,78','','','','','','0,37','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','269','Óleo, de girassol','10,8','25,4','62,6','','0,07','6,10','3,42','0,26','0,67','0,25','','0,08','25,15','0,18','62,22','0,39','','','','','','1,14','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','270','Óleo, de milho','15,2','33,4','50,9','','','12,12','2,18','0,49','0,18','0,19','','0,12','33,04','0,23','49,94','0,96','','','','','','0,48','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','271','Óleo, de pequi','39,9','55,8','4,2','','0,09','37,37','2,08','0,19','0,05','0,06','','0,83','54,73','0,14','3,74','0,51','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Gorduras e óleos','272','Óleo, de soja','15,2','23,3','60,0','','0,08','10,83','3,36','0,33','0,43','0,14','','0,09','22,98','0,60','53,85','5,72','','','','','','0,50','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','273','Abadejo, filé, congelado, assado','0,6','0,3','0,1','','0,01','0,44','0,11','','','','','0,02','0,29','0,02','0,02','Tr','Tr','0,06','Tr','0,07','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','274','Abadejo, filé, congelado,cozido','0,4','0,3','0,2','','Tr','0,29','0,08','','','','','0,01','0,22','0,02','0,03','','Tr','0,06','Tr','0,08','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','275','Abadejo, filé, congelado, cru','0,1','Tr','0,1','Tr','Tr','0,06','0,02','','','','','Tr','0,04','Tr','Tr','','0,01','0,01','Tr','0,08','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','276','Abadejo, filé, congelado, grelhado','0,6','0,3','0,6','','0,01','0,42','0,11','','','','','0,01','0,27','0,02','0,02','0,02','Tr','0,10','','0,42','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','277','Atum, conserva em óleo','1,0','1,3','3,2','','0,02','0,70','0,26','0,02','0,02','','','0,02','1,27','0,02','2,68','0,29','0,03','0,03','','0,19','','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','278','Atum, fresco, cru','0,5','0,2','Tr','','0,01','0,27','0,17','Tr','Tr','Tr','','0,02','0,18','Tr','0,01','0,01','Tr','Tr','','0,01','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','279','Bacalhau, salgado, cru','0,6','0,3','0,2','Tr','0,03','0,43','0,14','','Tr','Tr','','0,03','0,28','Tr','0,02','0,08','0,03','0,02','','0,06','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','280','Bacalhau, salgado, refogado','0,9','1,1','1,2','','0,02','0,65','0,23','0,02','0,02','Tr','','0,02','1,01','0,03','1,08','0,07','Tr','0,04','','0,04','0,03','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','281','Cação, posta, com farinha de trigo, frita','1,5','2,2','5,2','','0,01','1,03','0,37','0,03','0,04','0,02','','0,01','2,17','0,03','4,62','0,47','0,02','0,01','0,02','0,07','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','282','Cação, posta, cozida','0,2','0,1','0,2','','','0,07','0,12','','','','','Tr','0,08','0,01','Tr','','0,03','0,01','0,01','0,12','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','283','Cação, posta, crua','0,1','0,1','0,2','Tr','Tr','0,07','0,07','','','','','Tr','0,06','0,01','Tr','','0,02','0,02','0,02','0,10','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','284','Camarão, Rio Grande, grande, cozido','0,4','0,2','0,2','','0,01','0,23','0,14','0,01','0,01','Tr','','0,05','0,16','0,01','0,03','Tr','0,04','0,08','0,01','0,09','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','285','Camarão, Rio Grande, grande, cru','0,1','0,1','0,2','','Tr','0,08','0,04','Tr','','','','0,02','0,06','Tr','0,02','Tr','0,02','0,08','0,01','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','286','Camarão, Sete Barbas, sem cabeça, com casca, frito','2,5','3,6','8,8','','','1,69','0,59','0,05','0,08','0,03','','0,05','3,54','','7,76','0,82','0,05','0,08','','0,10','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','287','Caranguejo, cozido','0,2','0,2','Tr','','','0,10','0,09','0,01','0,01','','','0,01','0,14','','0,03','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','288','Corimba, cru','2,5','2,3','0,3','','0,30','1,57','0,31','0,01','0,02','','','1,21','1,02','0,01','0,09','0,12','0,03','0,04','0,01','0,03','0,04','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','289','Corimbatá, assado','4,8','6,4','2,6','','0,51','3,25','0,83','','','','','2,91','3,22','0,26','0,43','0,17','0,16','0,84','0,33','0,26','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','290','Corimbatá, cozido','4,5','6,5','2,3','','0,52','3,15','0,68','','','','','3,12','3,11','0,24','0,21','0,17','0,16','0,89','0,36','0,29','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','291','Corvina de água doce, crua','1,2','0,7','0,1','','0,04','0,75','0,26','0,01','0,01','0,01','','0,18','0,49','Tr','0,04','0,03','0,02','0,01','Tr','Tr','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','292','Corvina do mar, crua','0,7','0,5','0,1','','0,05','0,46','0,13','0,01','Tr','0,01','','0,20','0,27','0,02','0,01','0,02','0,02','0,03','0,03','0,04','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','293','Corvina grande, assada','1,5','1,2','0,3','','0,12','0,99','0,32','0,02','0,01','Tr','0,01','0,42','0,69','0,03','0,03','','0,04','0,05','0,04','0,05','0,02','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','294','Corvina grande, cozida','0,7','0,6','0,6','','0,06','0,49','0,17','','','','','0,23','0,33','0,03','0,02','0,01','0,09','0,17','0,10','0,20','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','295','Dourada de água doce, fresca','3,0','1,4','0,4','0,01','0,19','1,85','0,66','0,03','0,05','0,04','','0,29','1,05','0,07','0,14','','0,06','0,02','0,03','0,04','0,02','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','296','Lambari, congelado, cru','2,0','2,2','1,2','0,02','0,16','1,24','0,47','0,02','0,04','','','0,34','1,82','0,02','0,49','0,17','0,21','0,13','0,06','0,18','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','297','Lambari, congelado, frito','5,5','7,0','8,1','','0,22','3,40','1,39','0,09','0,12','0,04','0,04','0,02','6,72','0,11','6,43','0,78','0,34','0,03','0,08','0,23','0,04','0,06','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','298','Lambari, fresco,cru','3,4','3,3','1,1','0,03','0,15','2,11','0,88','0,04','0,03','0,04','','0,39','2,84','0,05','0,57','','0,12','0,10','0,05','0,12','0,08','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','299','Manjuba, com farinha de trigo, frita','5,5','5,4','10,4','','0,28','3,74','1,08','0,09','0,11','0,04','','0,30','4,90','0,09','7,53','0,84','0,09','0,44','0,17','1,16','','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','300','Manjuba, frita','5,3','6,0','11,7','','0,21','3,59','1,17','0,09','0,13','0,06','','0,23','5,53','0,15','8,92','0,87','0,08','0,35','0,14','1,13','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','301','Merluza, filé, assado','0,2','0,1','0,3','','','0,12','0,06','','','Tr','','Tr','0,10','Tr','0,02','','0,02','0,03','Tr','0,23','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','302','Merluza, filé, cru','0,9','0,5','0,4','','0,17','0,59','0,08','Tr','','0,02','','0,15','0,35','Tr','0,03','0,05','0,02','0,03','0,02','0,11','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','303','Merluza, filé, frito','1,4','2,1','4,3','','0,08','1,03','0,26','','0,03','','','0,14','1,77','0,10','3,07','0,36','','0,19','Tr','0,60','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','304','Pescada, branca, crua','0,8','2,4','0,9','','0,04','0,40','0,22','0,02','0,01','0,01','','0,75','1,61','Tr','0,04','0,05','0,05','0,18','0,13','0,43','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','305','Pescada, branca, frita','2,3','3,2','5,2','','0,14','1,55','0,48','0,04','0,05','0,02','','0,16','2,78','0,19','4,21','0,41','0,02','0,01','0,03','0,45','0,01','0,06','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','306','Pescada, filé, com farinha de trigo, frito','2,2','4,4','9,1','','','1,55','0,53','0,04','0,06','','','0,46','3,91','0,07','6,63','0,75','0,05','0,22','0,08','0,54','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','307','Pescada, filé, cru','0,9','2,3','0,3','','0,05','0,47','0,24','0,02','0,01','0,01','','0,77','1,51','Tr','0,03','0,04','0,02','0,06','0,04','0,13','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','308','Pescada, filé, frito','1,0','1,1','1,2','','0,06','0,64','0,23','0,02','0,01','Tr','','0,10','0,98','0,04','0,87','0,07','0,02','0,02','0,01','0,12','0,02','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','309','Pescada, filé, molho escabeche','1,3','2,9','4,3','','','0,96','0,28','0,03','0,03','','','0,09','2,82','0,04','3,75','0,41','','0,03','0,02','0,10','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','310','Pescadinha, crua','0,3','0,2','0,4','','0,02','0,19','0,05','','','Tr','','0,03','0,15','0,01','0,01','0,01','0,01','0,09','0,01','0,23','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','311','Pintado, assado','1,8','1,3','0,3','Tr','0,16','1,05','0,46','0,02','0,01','','0,02','0,18','0,97','0,06','0,12','0,06','0,04','0,01','','0,02','Tr','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','312','Pintado, cru','0,6','0,4','0,1','','0,03','0,40','0,12','Tr','Tr','Tr','','0,12','0,32','Tr','0,02','0,02','0,01','0,01','0,01','0,01','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','313','Pintado, grelhado','1,1','0,7','0,2','Tr','0,04','0,61','0,34','0,01','0,01','','0,01','0,09','0,50','0,03','0,09','0,02','0,02','0,01','Tr','Tr','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','314','Porquinho, cru','0,4','0,1','Tr','Tr','0,01','0,19','0,14','Tr','Tr','Tr','','0,01','0,11','Tr','0,02','Tr','Tr','Tr','','Tr','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','315','Salmão, filé, com pele, fresco,  grelhado','3,1','4,4','7,0','','0,51','2,02','0,61','','','','','0,69','3,37','0,23','2,99','0,40','0,09','1,21','0,59','1,22','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','316','Salmão, sem pele, fresco, cru','2,5','2,9','3,1','0,01','0,30','1,39','0,49','0,04','0,12','0,07','','0,36','2,26','0,19','1,73','0,03','0,04','0,43','0,22','0,46','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','317','Salmão, sem pele, fresco, grelhado','3,6','4,1','5,0','0,01','0,42','2,00','0,73','0,05','0,17','0,10','','0,54','3,18','0,29','2,43','0,33','0,07','0,72','0,36','0,75','0,02','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','318','Sardinha, assada','1,7','0,5','0,3','','0,16','1,07','0,36','0,03','0,02','0,01','Tr','0,11','0,33','0,02','0,04','0,02','0,02','0,05','Tr','0,18','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','319','Sardinha, conserva em óleo','4,1','5,5','11,9','','0,32','2,66','0,84','0,11','0,11','0,04','','0,33','5,03','0,09','9,78','0,99','0,09','0,44','0,06','0,46','','0,07','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','320','Sardinha, frita','2,6','3,1','6,1','','0,07','1,71','0,62','0,06','0,07','0,02','','0,06','2,92','0,04','5,13','0,43','0,03','0,09','0,01','0,36','','0,09','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','321','Sardinha, inteira, crua','1,7','0,5','0,2','Tr','0,21','1,00','0,27','0,02','0,01','0,01','','0,13','0,28','0,02','0,03','0,02','0,01','0,03','Tr','0,06','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Pescados e frutos do mar','322','Tucunaré, filé, congelado, cru','0,6','0,4','0,4','Tr','0,03','0,37','0,17','0,01','0,02','Tr','','0,08','0,26','0,01','0,09','0,02','0,10','','0,02','0,12','0,01','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','323','Apresuntado','1,9','2,6','1,1','','0,07','1,23','0,61','','','','','0,13','2,39','0,04','1,00','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','324','Caldo de carne, tablete','7,8','2,5','0,1','','0,14','3,91','3,64','0,05','0,02','','','0,03','2,47','','0,13','','','','','','5,32','0,10','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','325','Caldo de galinha, tablete','9,4','3,2','0,2','0,09','0,12','3,98','5,07','0,07','0,05','0,02','','0,04','3,14',' ','0,25','','','','','','6,19','0,11','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','326','Carne, bovina, acém, moído, cozido','4,8','4,6','0,3','','0,27','2,50','1,83','0,01','0,01','','','0,33','4,17','0,03','0,22','0,02','0,02','','','','0,22','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','327','Carne, bovina, acém, moído, cru','2,7','2,4','0,1','','0,14','1,35','1,09','0,01','0,01','','','0,18','2,22','0,01','0,12','0,01','0,01','','','','0,10','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','328','Carne, bovina, acém, sem gordura, cozido','5,5','3,7','0,3','0,01','0,36','2,68','2,16','0,01','0,01','','','0,33','3,32','0,04','0,22','0,03','0,01','','','','0,28','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','329','Carne, bovina, acém, sem gordura, cru','2,8','2,3','0,2','','0,14','1,33','1,19','0,01','','','','0,16','2,12','0,01','0,14','0,02','0,02','0,01','','','0,17','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','330','Carne, bovina, almôndegas, cruas','3,9','3,5','0,9','0,01','0,25','2,10','1,42','0,02','0,02','','','0,29','3,22','0,02','0,81','0,09','0,02','','','','0,25','0,11','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','331','Carne, bovina, almôndegas, fritas','4,2','5,0','5,5','','0,17','2,47','1,40','0,05','0,06','0,02','0,05','0,27','4,59','0,05','4,89','0,52','0,03','','','','0,17','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','332','Carne, bovina, bucho, cozido','2,4','1,4','0,1','','0,11','1,08','1,10','0,01','','0,01','','0,09','1,29','','0,07','0,01','0,01','','','','0,13','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','333','Carne, bovina, bucho, cru','3,3','1,4','0,1','0,01','0,07','1,52','1,49','0,01','','0,02','','0,14','1,26','0,01','0,09','0,01','0,01','','','','0,07','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','334','Carne, bovina, capa de contra-filé, com gordura, crua','6,9','6,2','0,1','0,01','0,53','3,82','2,03','0,01','','','','0,73','5,33','0,01','0,14','','0,01','','','','0,28','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','335','Carne, bovina, capa de contra-filé, com gordura, grelhada','8,8','8,7','0,3','','0,53','4,93','2,82','0,02','','','','0,88','7,67','0,04','0,22','','0,04','0,02','','','0,28','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','336','Carne, bovina, capa de contra-filé, sem gordura, crua','1,9','1,9','0,1','','0,12','1,05','0,58','Tr','Tr','Tr','','0,20','1,66','0,01','0,07','Tr','0,01','','','','0,06','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','337','Carne, bovina, capa de contra-filé, sem gordura, grelhada','4,3','4,3','0,2','0,01','0,27','2,42','1,29','0,01','0,01','','','0,44','3,85','','0,16','0,04','0,04','','','','0,14','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','338','Carne, bovina, charque, cozido','4,8','5,4','0,4','','0,31','2,61','1,73','0,01','0,02','','0,10','0,50','4,68','0,02','0,19','0,05','0,06','0,02','0,04','','0,32','0,08','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','339','Carne, bovina, charque, cru','8,7','6,6','0,2','','0,80','4,45','3,14','','','','','0,54','5,70',' ','0,16','','','','','','0,80','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','340','Carne, bovina, contra-filé, à milanesa','7,2','8,1','6,9','','0,33','4,21','2,35','0,05','0,06','0,02','0,09','0,45','7,36','0,03','6,22','0,61','0,05','','0,02','','0,36','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','341','Carne, bovina, contra-filé de costela, cru','6,7','4,6','0,1','0,01','0,40','3,15','2,85','0,02','0,01','','','0,35','4,21','0,02','0,13','','','','','','0,24','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','342','Carne, bovina, contra-filé de costela, grelhado','8,8','5,6','0,2','0,02','0,59','4,28','3,53','0,02','','','','0,47','5,06','','0,17','0,03','0,02','','','','0,23','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','343','Carne, bovina, contra-filé, com gordura, cru','5,6','5,5','0,2','0,01','0,41','3,21','1,57','0,01','0,01','','','0,62','4,81','0,01','0,15','0,05','0,02','','','','0,17','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','344','Carne, bovina, contra-filé, com gordura, grelhado','7,4','6,3','0,2','0,01','0,50','4,24','2,24','0,01','','','','0,63','5,58','','0,14','0,03','0,01','','','','0,19','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','345','Carne, bovina, contra-filé, sem gordura, cru','2,7','2,6','0,1','','0,15','1,48','0,89','0,01','','','','0,22','2,32','0,01','0,09','','0,02','0,01','','','0,08','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','346','Carne, bovina, contra-filé, sem gordura, grelhado','2,0','1,9','0,1','','0,09','1,12','0,68','','','0,01','','0,16','1,75','','0,07','0,01','0,01','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','347','Carne, bovina, costela, assada','11,8','12,1','0,3','0,03','0,89','6,32','3,76','0,03','','','','1,17','10,64','0,08','0,13','0,15','0,03','','','','0,76','0,10','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','348','Carne, bovina, costela, crua','14,9','12,7','0,3','0,03','1,11','7,76','5,15','0,03','','','','1,31','11,05','0,12','0,15','0,12','','','','','0,76','0,15','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','349','Carne, bovina, coxão duro, sem gordura, cozido','3,5','4,1','0,2','','0,20','1,99','1,14','0,01','0,01','','','0,45','3,59','0,01','0,11','0,02','0,02','','','','0,16','0,08','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','350','Carne, bovina, coxão duro, sem gordura, cru','2,9','2,4','0,1','','0,21','1,66','0,98','0,01','','','','0,22','2,12','','0,05','0,01','0,01','','','','0,10','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','351','Carne, bovina, coxão mole, sem gordura, cozido','4,3','3,4','0,2','','0,26','2,36','1,46','0,01','','','','0,28','3,10','0,01','0,14','0,01','0,02','','','','0,15','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','352','Carne, bovina, coxão mole, sem gordura, cru','3,9','3,7','0,1','','0,29','2,34','1,06','0,01','','','','0,45','3,23','','0,08','0,01','0,01','','','','0,12','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','353','Carne, bovina, cupim, assado','5,5','5,4','0,2','0,02','0,40','3,07','1,65','0,01','0,01','','','0,61','4,71','0,02','0,16','0,03','0,02','','','','0,22','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','354','Carne, bovina, cupim, cru','6,8','6,4','0,2','0,01','0,46','3,80','2,06','0,01','0,01','','','0,71','5,56','0,04','0,15','0,06','','','','','0,30','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','355','Carne, bovina, fígado, cru','2,8','1,5','0,1','Tr','0,18','1,28','1,44','0,01','0,01','Tr','','0,09','1,43','0,01','0,05','Tr','Tr','','Tr','','0,16','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','356','Carne, bovina, fígado, grelhado','4,7','2,2','1,1','','0,14','2,30','1,86','0,01','0,12','0,02','','0,23','1,89','','0,37','0,10','0,31','0,07','0,16','0,04','0,09','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','357','Carne, bovina, filé mingnon, sem gordura, cru','2,9','1,9','0,2','','0,17','1,44','1,16','0,01','0,01','','','0,15','1,69','0,01','0,11','0,02','0,03','0,01','','','0,10','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','358','Carne, bovina, filé mingnon, sem gordura, grelhado','4,5','3,1','0,2','','0,25','2,21','1,76','0,01','','0,01','','0,23','2,87','','0,16','0,02','0,02','','','','0,14','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','359','Carne, bovina, flanco, sem gordura, cozido','3,9','2,8','0,1','','0,27','2,07','1,40','0,01','','','','0,28','2,49','0,01','0,08','0,01','','','','','0,16','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','360','Carne, bovina, flanco, sem gordura, cru','3,1','2,3','0,1','','0,19','1,65','1,13','0,01','','','','0,18','2,09','','0,07','0,01','0,01','','','','0,11','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','361','Carne, bovina, fraldinha, com gordura, cozida','12,1','10,4','0,5','0,02','0,95','6,35','3,98','0,02','','','','1,10','9,07','0,07','0,29','0,12','0,05','','','','0,50','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','362','Carne, bovina, fraldinha, com gordura, crua','7,3','6,5','0,3','0,01','0,59','3,77','2,39','0,01','','','','0,71','5,63','0,06','0,16','0,09','0,01','','','','0,43','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','363','Carne, bovina, lagarto, cozido','3,9','4,0','0,2','','0,22','2,22','1,25','0,01','0,02','','','0,42','3,54','0,01','0,12','0,02','0,01','','','','0,15','0,07','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','364','Carne, bovina, lagarto, cru','2,3','2,3','0,1','','0,14','1,36','0,66','','Tr','','','0,25','1,98','','0,06','0,01','Tr','','','','0,08','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','365','Carne, bovina, língua, cozida','11,2','10,3','0,5','','0,68','5,54','4,20','0,02','0,02','','','0,77','9,31','','0,43','0,09','0,02','','','','0,41','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','366','Carne, bovina, língua, crua','6,8','6,8','0,3','0,01','0,41','3,40','2,63','0,01','','','','0,48','6,11','0,06','0,26','0,04','0,01','','0,01','','0,29','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','367','Carne, bovina, maminha, crua','3,1','3,1','0,1','0,01','0,21','1,71','0,93','0,01','','','','0,32','2,70','0,01','0,09','0,01','0,01','','','','0,08','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','368','Carne, bovina, maminha, grelhada','9,7','7,7','0,2','0,02','0,63','4,96','3,49','0,04','0,02','','','0,77','6,79','0,04','0,19','0,04','0,02','','','','0,42','0,06','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','369','Carne, bovina, miolo de alcatra, sem gordura, cru','3,4','3,3','0,1','','0,20','1,79','1,10','0,01','0,01','','','0,36','2,85','0,02','','0,04','0,03','0,01','','','0,16','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','370','Carne, bovina, miolo de alcatra, sem gordura, grelhado','5,1','4,9','0,3','','0,32','2,82','1,61','0,01','0,01','','','0,52','4,28','0,03','0,16','0,04','0,04','0,01','','','0,21','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','371','Carne, bovina, músculo, sem gordura, cozido','2,9','2,8','0,1','','0,13','1,64','0,99','0,01','0,01','0,01','','0,26','2,48','0,01','0,09','0,03','0,01','','','','0,13','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','372','Carne, bovina, músculo, sem gordura, cru','2,2','2,6','0,1','','0,12','1,27','0,71','0,01','0,01','','','0,21','2,35','0,01','0,07','0,01','0,01','','','','0,08','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','373','Carne, bovina, paleta, com gordura, crua','3,5','2,9','0,2','0,01','0,19','1,72','1,38','0,01','','','','0,24','2,60','0,02','0,12','0,01','0,01','','','','0,20','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','374','Carne, bovina, paleta, sem gordura, cozida','3,4','3,0','0,2','0,01','0,18','1,68','1,31','0,01','0,01','0,01','','0,23','2,69','0,02','0,16','0,01','0,01','','','','0,15','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','375','Carne, bovina, paleta, sem gordura, crua','2,7','2,1','0,1','0,01','0,15','1,33','1,11','0,01','','','','0,16','1,90','0,01','0,11','','0,01','','','','0,15','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','376','Carne, bovina, patinho, sem gordura, cru','2,0','1,9','0,2','','0,11','1,08','0,66','','0,01','','','0,17','1,65','0,01','0,10','0,02','0,03','','','','0,07','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','377','Carne, bovina, patinho, sem gordura, grelhado','3,1','3,1','0,3','0,01','0,15','1,59','1,13','0,01','0,01','0,01','','0,25','2,81','0,04','0,17','0,03','0,05','0,01','0,03','','0,11','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','378','Carne, bovina, peito, sem gordura, cozido','11,7','11,5','0,4','0,02','0,86','6,10','4,08','0,02','','','','1,09','10,21','0,07','0,32','0,10','0,02','','','','0,67','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','379','Carne, bovina, peito, sem gordura, cru','8,2','9,2','0,5','','0,56','4,40','2,62','0,02','','','','0,95','8,03','0,04','0,26','0,15','0,02','','','','0,54','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','380','Carne, bovina, picanha, com gordura, crua','6,1','6,7','0,3','','0,42','3,46','1,83','0,01','0,01','','','0,73','5,86','0,01','0,22','0,05','0,03','','','','0,22','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','381','Carne, bovina, picanha, com gordura, grelhada','7,9','9,2','0,4','','0,59','4,59','2,15','0,02','0,02','','','1,01','8,04','0,03','0,25','0,07','0,05','0,02','','','0,23','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','382','Carne, bovina, picanha, sem gordura, crua','2,0','2,1','0,1','Tr','0,15','1,18','0,61','Tr','Tr','Tr','','0,22','1,83','0,01','0,08','Tr','0,01','','','','0,04','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','383','Carne, bovina, picanha, sem gordura, grelhada','4,5','5,2','0,3','0,01','0,32','2,48','1,36','0,01','0,01','0,01','','0,51','4,64','','0,22','','0,04','','','','0,11','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','384','Carne, bovina, seca, cozida','10,5','8,3','0,4','0,03','0,68','5,11','4,42','0,04','','','0,12','0,59','7,52','0,03','0,24','0,08','0,05','','0,05','','0,71','0,22','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','385','Carne, bovina, seca, crua','8,7','7,5','0,3','0,02','0,70','4,45','3,05','0,03','','','0,18','0,40','6,76','0,04','0,18','0,10','0,03','','0,05','','0,59','0,07','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','386','Coxinha de frango, frita','2,6','3,4','4,7','0,01','0,03','1,76','0,65','0,05','0,06','0,02','','0,02','3,32','0,07','4,33','0,32','0,01','','','','0,45','0,13','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','388','Croquete, de carne, frito','5,1','7,4','11,5','','0,13','3,13','1,51','0,08','0,10','0,04','','0,16','7,10','0,07','10,47','1,04','','','','','0,27','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','390','Empada, de frango, pré-cozida','5,4','5,2','1,4','','0,03','2,62','2,56','0,08','0,08','0,03','','0,04','5,12','0,03','1,22','0,07','','','','','6,21','0,96','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','391','Frango, asa, com pele, crua','4,4','6,6','3,0','','0,09','3,36','0,93','','0,03','','','0,80','5,75','','2,96','0,01','0,06','','','','0,03','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','392','Frango, caipira, inteiro, com pele, cozido','4,4','7,5','2,3','','0,09','3,23','1,00','0,01','Tr','','','0,69','6,73','0,03','2,18','0,09','Tr','','Tr','Tr','0,03','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','393','Frango, caipira, inteiro, sem pele, cozido','2,2','3,4','1,2','','0,04','1,57','0,59','0,01','Tr','Tr','','0,26','3,14','0,02','1,16','0,04','Tr','','Tr','Tr','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','394','Frango, coração, cru','4,9','6,3','3,4','','0,12','3,49','1,16','0,01','0,01','','','0,66','5,56','0,06','3,15','0,13','0,09','','','','0,09','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','395','Frango, coração, grelhado','3,5','4,3','1,6','','0,06','2,33','1,03','0,02','0,02','0,01','0,01','0,37','0,08','0,04','1,41','0,04','0,08','','0,01','','0,08','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','396','Frango, coxa, com pele, assada','3,1','3,8','2,2','','0,06','2,28','0,76','0,02','Tr','','0,01','0,38','3,35','0,02','2,11','0,09','Tr','Tr','','','0,12','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','397','Frango, coxa, com pele, crua','3,0','4,1','2,2','','0,05','2,24','0,68','0,01','0,02','','','0,45','3,61','0,02','2,00','0,09','0,05','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','398','Frango, coxa, sem pele, cozida','2,0','2,1','1,1','','0,12','1,31','0,50','0,01','Tr','','0,01','0,20','1,84','0,01','1,10','0,05','Tr','Tr','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','399','Frango, coxa, sem pele, crua','1,6','2,1','0,8','','0,03','1,19','0,40','Tr','0,01','','','0,24','1,82','0,01','0,80','0,02','0,03','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','400','Frango, fígado, cru','1,3','0,7','0,6','Tr','0,02','0,69','0,58','0,01','0,01','0,01','','0,05','0,58','0,01','0,38','0,01','0,13','','0,03','0,02','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','401','Frango, filé, à milanesa','1,6','2,4','3,3','','0,02','1,09','0,44','0,03','0,04','0,02','','0,05','2,24','0,03','3,01','0,23','0,04','0,02','','','0,02','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','402','Frango, inteiro, com pele, cru','5,2','7,2','3,9','','0,11','3,94','1,01','0,02','0,03','','','0,88','6,31','0,03','3,57','0,20','0,07','','','','0,07','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','403','Frango, inteiro, sem pele, assado','2,1','2,6','1,8','','0,04','1,48','0,57','0,01','Tr','Tr','0,01','0,19','2,36','0,02','1,73','0,09','Tr','Tr','','','0,10','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','404','Frango, inteiro, sem pele, cozido','2,2','2,5','1,5','','0,04','1,58','0,55','0,01','Tr','','0,01','0,23','2,26','0,02','1,42','0,07','Tr','Tr','','','0,09','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','405','Frango, inteiro, sem pele, cru','1,4','1,9','1,0','','0,03','1,04','0,31','Tr','0,01','','','0,23','1,63','0,01','0,92','0,04','0,05','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','406','Frango, peito, com pele, assado','2,2','2,7','1,8','','0,04','1,53','0,56','0,01','Tr','Tr','0,01','0,22','2,45','0,02','1,70','0,10','Tr','Tr','Tr','','0,10','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','407','Frango, peito, com pele, cru','2,2','3,2','0,9','','0,06','1,66','0,46','0,01','0,01','','','0,44','2,75','0,03','0,80','0,03','0,03','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','408','Frango, peito, sem pele, cozido','1,1','1,1','0,6','','0,02','0,74','0,33','0,01','Tr','Tr','','0,07','0,98','0,01','0,53','0,02','Tr','Tr','','','0,04','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','409','Frango, peito, sem pele, cru','1,1','1,3','Tr','','0,03','0,79','0,25','Tr','0,01','','','0,16','1,16','0,01','Tr','0,01','0,02','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','410','Frango, peito, sem pele, grelhado','0,9','0,9','0,3','','0,02','0,65','0,27','Tr','Tr','Tr','','0,07','0,80','0,01','0,31','0,01','Tr','Tr','','','0,04','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','411','Frango, sobrecoxa, com pele, assada','4,2','5,4','3,9','','0,07','3,08','1,02','0,01','Tr','','0,02','0,50','4,80','0,04','3,64','0,21','Tr','Tr','','','0,19','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','412','Frango, sobrecoxa, com pele, crua','6,5','9,6','3,6','','0,12','4,96','1,31','0,02','0,02','','','1,13','8,44','0,02','3,41','0,12','0,08','','','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','413','Frango, sobrecoxa, sem pele, assada','3,3','4,2','3,1','','0,06','2,41','0,82','0,01','Tr','','0,01','0,42','3,76','0,03','2,86','0,17','Tr','Tr','','','0,14','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','414','Frango, sobrecoxa, sem pele, crua','3,0','4,5','1,6','','0,06','2,30','0,61','0,01','0,02','','','0,57','3,87','0,02','1,45','0,04','0,05','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','415','Hambúrguer, bovino, cru','5,7','5,8','0,8','0,02','0,39','3,06','1,97','0,02','','','0,12','0,58','4,96','0,03','0,68','0,08','0,03','','','0,01','0,81','0,19','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','416','Hambúrguer, bovino, frito','5,9','6,0','3,7','','0,29','3,18','2,19','0,03','0,03','0,02','0,07','0,41','5,37','0,07','3,28','0,29','0,03','','0,02','','0,33','0,11','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','417','Hambúrguer, bovino, grelhado','5,1','4,8','1,2','','0,26','2,72','2,01','0,02','0,01','','0,05','0,42','4,25','0,02','1,08','0,10','0,04','0,02','','','0,30','0,06','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','418','Lingüiça, frango, crua','5,2','7,3','3,5','0,01','0,16','3,59','1,35','0,02','','','0,01','0,52','6,70','0,08','3,08','0,17','','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','419','Lingüiça, frango, frita','5,0','7,2','4,3','','0,14','3,46','1,33','0,03','','','','0,45','6,60','0,10','3,85','0,25','0,09','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','420','Lingüiça, frango, grelhada','4,7','6,8','3,4','','0,14','3,26','1,26','0,02','','','','0,44','6,20','0,09','3,00','0,17','0,09','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','421','Lingüiça, porco, crua','4,0','5,0','1,7','0,01','0,15','2,52','1,24','0,02','','','','0,25','4,66','0,08','1,48','0,05','0,06','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','422','Lingüiça, porco, frita','6,5','8,2','2,7','','0,25','4,17','2,01','0,03','','','','0,29','7,66','0,13','2,43','0,11','0,09','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','423','Lingüiça, porco, grelhada','7,0','8,7','2,6','','0,27','4,47','2,17','0,03','','','','0,44','8,07','0,13','2,35','0,10','0,10','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','424','Mortadela','6,1','8,1','4,7','','0,17','4,15','1,74','','','','','0,60','7,36','0,12','4,41','0,28','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','425','Peru, congelado, assado','1,6','1,2','1,4','','0,03','1,10','0,47','0,02','Tr','Tr','','0,11','1,60','0,01','1,41','0,03','Tr','Tr','','','0,02','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','426','Peru, congelado, cru','0,4','0,4','0,7','0,01','0,01','0,26','0,14','Tr','0,01','','','0,03','0,41','Tr','0,63','0,03','0,06','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','427','Porco, bisteca, crua','3,5','3,9','1,2','0,01','0,13','2,17','1,12','0,02','','','','0,21','3,37','0,06','1,12','0,05','0,05','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','428','Porco, bisteca, frita','6,0','6,6','4,6','0,05','0,31','3,58','1,94','0,04','0,02','0,02','','0,25','6,17','0,11','4,07','0,32','0,07','','0,02','','0,16','0,05','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','429','Porco, bisteca, grelhada','7,5','7,7','1,2','0,02','0,27','4,27','2,82','0,03','','','','0,31','7,14','0,13','1,03','0,03','0,03','','','','0,09','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','430','Porco, costela, assada','11,8','13,9','3,1','','0,34','7,10','4,16','0,06','','','','0,63','12,90','0,23','2,75','0,12','0,09','','','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','431','Porco, costela, crua','7,4','8,3','2,3','0,02','0,28','4,59','2,42','0,03','','','','0,45','7,64','0,12','2,11','0,09','0,08','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','432','Porco, lombo, assado','2,6','2,9','0,7','','0,08','1,54','0,97','0,01','','','','0,11','2,63','0,16','0,55','0,07','0,02','','','','0,02','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','433','Porco, lombo, cru','3,3','3,7','1,0','0,01','0,12','2,08','1,00','0,02','','','','0,22','3,39','0,06','0,88','0,04','0,05','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','434','Porco, orelha, salgada, crua','7,3','11,2','2,8','0,02','0,33','4,99','1,84','0,03','','','','0,90','10,15','0,19','2,58','0,11','0,09','','','','',' ','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','435','Porco, pernil, assado','4,8','6,4','1,9','','0,15','2,96','1,59','0,03','','','','0,29','5,91','0,11','1,66','0,05','0,11','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','436','Porco, pernil, cru','4,2','5,0','1,7','0,01','0,16','2,58','1,29','0,02','0,02','','','0,26','4,64','0,09','1,51','0,06','0,08','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','437','Porco, rabo, salgado, cru','11,6','16,7','4,3','','0,37','7,37','3,58','0,07','','','','0,78','15,49','0,30','3,85','0,16','0,07','','','','0,07','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','438','Presunto, com capa de gordura','1,9','2,6','1,0','','0,06','1,22','0,63','0,01','','','','0,13','2,39','0,05','0,87','0,04','0,04','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','439','Presunto, sem capa de gordura','0,9','1,1','0,5','','0,03','0,55','0,27','','','','','0,07','1,04','0,02','0,38','0,01','0,04','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','440','Quibe, assado','1,2','0,9','0,3','','0,08','0,68','0,43','','','','','0,06','0,87','','0,25','0,02','','','Tr','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','441','Quibe, cru','0,7','0,7','0,3','','0,03','0,35','0,24','','','','','0,06','0,63','0,01','0,21','0,03','0,02','0,01','0,01','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','442','Quibe, frito','4,6','5,0','5,0','','0,16','2,50','1,68','0,04','0,05','0,03','0,03','0,17','4,75','0,05','4,55','0,41','0,03','','','','0,18','0,08','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','443','Salame','9,6','12,1','4,7','','0,34','5,78','3,09','0,05','','','','0,55','11,21','0,23','4,23','0,19','0,03','','','','0,10','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','444','Toucinho, cru','17,7','20,1','10,1','0,06','0,75','11,42','5,21','0,09','','','','0,98','18,82','0,28','9,32','0,68','0,15','','','','0,21','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Carnes e derivados','445','Toucinho, frito','20,0','26,2','14,6','','0,64','12,89','6,17','0,12','0,07','','','1,02','24,55','0,45','12,93','0,86','','','0,06','','0,33','0,25','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','446','Bebida láctea, pêssego','1,1','0,6','Tr','0,05','0,19','0,54','0,25','Tr','Tr','','0,01','0,02','0,53','0,01','0,03','0,02','Tr','','','','0,06','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','447','Creme de Leite','11,8','5,1','0,5','0,49','1,91','5,58','2,38','0,04','','','0,18','0,36','4,50','','0,33','0,07','','','','','0,63','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','448','Iogurte, natural','1,8','0,9','0,1','0,07','0,30','0,91','0,40','0,01','Tr','Tr','0,02','0,04','0,83','0,01','0,06','0,03','Tr','','Tr','Tr','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','449','Iogurte, natural, desnatado','0,2','0,1',' ','0,01','0,03','0,10','0,05','','','','',' ','0,09',' ','Tr','','','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','451','Iogurte, sabor morango','1,4','0,7','0,1','0,07','0,26','0,70','0,29','Tr','','','0,01','0,03','0,62','Tr','0,05','0,02','Tr','','Tr','Tr','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','452','Iogurte, sabor pêssego','1,4','0,6','0,1','0,06','0,25','0,70','0,29','Tr','Tr','','0,01','0,03','0,59','Tr','0,04','0,02','Tr','','','','0,06','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','453','Leite, condensado','4,2','1,7','0,2','0,17','0,73','2,10','0,82','0,01','','','','0,14','1,47','0,02','0,10','0,04','','','','','0,20','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','454','Leite, de cabra','2,4','0,8','0,1','0,10','0,29','1,00','0,60','0,01','Tr','','','0,03','0,79',' ','0,11','0,01','0,01','','','','0,10','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','455','Leite, de vaca, achocolatado','1,1','0,6','0,1','0,03','0,14','0,53','0,29','0,01','Tr','Tr','0,01','0,03','0,56','Tr','0,11','0,01','Tr','','','','0,19','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','456','Leite, de vaca, desnatado, pó','0,6','0,2','Tr','0,02','0,09','0,29','0,12','Tr','0,01','Tr','0,01','0,02','0,20','','0,03','Tr','Tr','','','','0,02','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','458','Leite, de vaca, integral','1,4','0,7','0,1','0,06','0,25','0,71','0,29','','',' ','0,01','0,03','0,65','','0,04','0,02','','','Tr','Tr','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','459','Leite, de vaca, integral, pó','16,3','7,1','0,5','0,58','2,62','8,11','3,48','0,05','','0,03','0,15','0,56','6,25','0,05','0,41','0,10','','','','','0,84','0,10','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','461','Queijo, minas, frescal','11,4','5,8','0,4','0,41','1,73','5,78','2,53','0,04','0,02','0,02','0,16','0,39','5,14','0,04','0,28','0,06','0,02','','','','0,54','0,12','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','462','Queijo, minas, meia cura','13,2','5,6','0,3','0,55','2,13','6,15','2,59','0,05','','','0,23','0,46','4,82','','0,24','0,10','','','','','0,99','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','463','Queijo, mozarela','14,2','6,0','0,5','0,61','2,37','6,66','3,02','','','','0,22','0,43','5,22','','0,31','0,08','','','','','0,86','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','464','Queijo, parmesão','19,7','8,7','0,4','0,70','3,26','10,07','4,24','0,06','0,03','0,03','0,32','0,63','7,67','0,03','0,29','0,11','0,03','','','','1,01','0,16','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','465','Queijo, pasteurizado','15,9','7,3','0,4','0,58','2,58','8,05','3,38','0,05','','','0,23','0,49','6,45','0,05','0,33','0,08','','','','','0,85','0,18','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','466','Queijo, petit suisse, morango','1,6','0,8','Tr','0,05','0,23','0,81','0,40','0,01','','','0,02','0,05','0,76',' ','0,04','0,01','','','','','0,09','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','467','Queijo, prato','16,3','6,8','0,5','0,71','2,67','7,59','3,16','','','','0,27','0,51','5,91','','0,42','0,11','','','','','0,87','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','468','Queijo, requeijão, cremoso','13,7','6,4','0,3','0,52','2,26','7,16','2,72','0,04','0,04','0,02','0,24','0,50','5,54','0,04','0,24','0,07','','','','','0,55','0,11','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leite e derivados','469','Queijo, ricota','4,5','2,4','0,2','0,15','0,66','2,28','1,06','0,02','0,02','0,02','0,06','0,15','2,16','0,02','0,14','0,02','0,01','','','','0,21','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Ovos e derivados','484','Omelete, de queijo','6,4','7,0','6,2','0,08','0,42','4,20','1,56','0,04','0,05','0,02','0,04','0,26','6,61','0,05','5,53','0,44','0,15','','','0,04','0,15','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Ovos e derivados','485','Ovo, de codorna, inteiro, cru','8,9','12,1','2,7','Tr','0,13','6,39','2,31','0,01','0,03','','0,03','1,07','11,01','0,03','2,20','0,10','0,44','','','','0,04','0,07','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Ovos e derivados','487','Ovo, de galinha, gema, cozida/10minutos','9,2','12,1','4,0','','0,08','6,56','2,43','','0,03','','','0,67','11,29','0,07','3,25','0,05','0,44','','','0,10','0,05','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Ovos e derivados','488','Ovo, de galinha, inteiro, cozido/10minutos','2,9','3,8','1,1','','0,02','2,07','0,76','','0,01','','','0,21','3,51','0,02','0,94','0,02','0,12','','','0,02','0,02','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Ovos e derivados','489','Ovo, de galinha, inteiro, cru','2,6','3,6','1,2','','0,02','1,87','0,69','','0,01','0,01','','0,23','3,33','0,01','0,88','0,02','0,14','','0,05','0,04','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Ovos e derivados','490','Ovo, de galinha, inteiro, frito','4,1','5,7','4,9','','0,03','2,95','1,05','0,02','0,03','0,02','','0,23','5,45','0,04','4,34','0,33','0,17','','','0,03','0,02','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','491','Achocolatado, pó','1,1','0,6','0,3','Tr','0,02','0,51','0,55','0,02','0,01','Tr','','0,01','0,62','','0,29','0,03','','','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','495','Chocolate, ao leite','17,5','10,0','0,9','0,09','0,34','7,46','9,12','0,26','0,03','','','0,14','9,75','0,06','0,91','0,03','','','','','0,17','0,10','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','496','Chocolate, ao leite, com castanha do Pará','14,1','9,3','3,2','0,10','0,33','6,24','6,73','0,20','0,04','0,02','','0,09','9,14','','3,09','0,07','','','','','0,20','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','497','Chocolate, ao leite, dietético','19,2','11,4','1,5','0,06','0,22','8,08','10,29','0,31','0,06','0,03','','0,10','11,32','','1,41','0,10','','','','','0,18','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','498','Chocolate, meio amargo','13,1','8,1','1,0','0,01','0,06','5,61','7,08','0,21','0,04','0,02','','0,05','8,03','0,01','0,94','0,06','','','','','0,14','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','499','Cocada branca','8,4','0,4','0,1','4,56','1,56','0,61','0,20','','','','','','0,36','','0,07','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','500','Doce, de abóbora, cremoso','Tr','Tr','Tr','Tr','Tr','0,02','Tr','Tr','','Tr','','','0,02','','0,01','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','501','Doce, de leite, cremoso','1,3','3,9','2,0','','','0,73','0,17','0,08','0,20','0,13','','','3,74','0,11','1,94','0,01','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','502','Geléia, mocotó, natural','Tr','Tr','Tr','','','Tr','Tr','','','','','','Tr','','Tr','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Produtos açucarados','509','Quindim','11,3','4,8','4,7','4,10','1,60','2,97','1,47','0,04','0,04','','','0,16','4,55','0,04','4,19','0,35','0,11','','','','0,05','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Miscelâneas','511','Café, pó, torrado','5,3','1,1','4,9','','0,01','4,04','0,95','0,29','0,06','','','0,01','1,11','0,02','4,82','0,11','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Miscelâneas','512','Capuccino, pó','4,0','1,6','0,1','0,27','0,59','1,73','0,95','0,02','0,02','','0,05','0,10','1,50',' ','0,11','0,04','','','','','0,55','0,04','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Miscelâneas','518','Shoyu','Tr','Tr','Tr','Tr','Tr','Tr','Tr','','Tr','','','','0,01','','0,01','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Outros alimentos industrializados','520','Azeitona, preta, conserva','3,5','11,0','3,0','','','2,87','0,47','0,08','0,02','0,01','','0,29','10,57','0,04','2,77','0,19','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Outros alimentos industrializados','521','Azeitona, verde, conserva','2,3','8,3','1,0','','','1,93','0,29','0,05','0,01','0,01','','0,18','8,07','0,03','0,91','0,13','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Outros alimentos industrializados','522','Chantilly, spray, com gordura vegetal','25,9','0,1','0,1','10,70','3,64','2,63','7,46','0,08','','0,03','',' ','0,05','Tr','0,08','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Outros alimentos industrializados','523','Leite, de coco','15,6','0,9','0,2','8,25','2,99','1,33','0,51','0,01','','','','','0,92','','0,17','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Outros alimentos industrializados','524','Maionese, tradicional com ovos','4,1','6,4','15,4','','0,02','2,84','0,37','0,08','0,11','0,04','','0,04','6,24','0,14','13,86','1,43','','','','','','0,17','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','525','Acarajé','9,1','7,8','2,1','0,10','0,16','7,71','1,05','0,07','0,02','','','','7,81','','2,01','0,12','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','526','Arroz carreteiro','3,2','3,0','0,2','','0,19','1,61','1,29','0,01','','','0,04','0,24','2,64','0,01','0,16','0,03','0,01','','0,01','','0,18','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','527','Baião de dois, arroz e feijão-de-corda','0,6','1,0','1,5','','Tr','0,42','0,13','0,01','0,01','Tr','','0,02','0,95','Tr','1,36','0,13','Tr','Tr','','Tr','','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','528','Barreado','3,3','4,3','1,4','','0,12','2,05','1,11','Tr','','','','0,20','3,96','0,05','1,24','0,06','0,05','Tr','0,02','','0,06','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','529','Bife à cavalo, com contra filé','7,9','8,2','3,3','','0,38','4,59','2,63','0,03','0,03','','0,10','0,57','7,32','0,05','2,88','0,26','0,07','','0,02','0,02','0,40','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','530','Bolinho de arroz','1,8','2,5','3,5','','0,02','1,26','0,44','0,02','0,03','0,02','','0,05','2,39','0,05','3,22','0,24','0,04','','Tr','Tr','Tr','0,06','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','531','Camarão à baiana','1,6','0,9','1,5','1,35','0,62','0,72','0,27','0,02','0,02','','','0,01','0,89','','1,33','0,13','0,01','0,03','','0,03','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','532','Charuto, de repolho','0,5','0,5','0,1','','0,02','0,24','0,20','','','','','0,03','0,44','','0,08','0,02','','','','','0,03','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','533','Cuscuz, de milho, cozido com sal','0,2','0,2','0,3','','','0,15','0,02','Tr','','','',' ','0,22','','0,26','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','534','Cuscuz, paulista','1,8','1,8','0,8','0,03','0,15','1,12','0,41','0,01','0,02','0,01','0,01','0,07','1,64','','0,69','0,10','Tr','','','','0,04','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','535','Cuxá, molho','0,6','1,3','1,5','','0,00','0,37','0,18','0,02','0,01','0,00','','0,01','1,25','0,01','1,44','0,06','Tr','0,02','','0,02','','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','536','Dobradinha','2,5','1,2','0,1','Tr','0,11','1,06','1,19','0,02','0,02','0,01','Tr','0,09','1,11','Tr','0,07','0,01','0,03','','0,02','','0,18','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','537','Estrogonofe de carne','5,3','3,3','0,9','0,12','0,65','2,81','1,57','0,02','0,02','','0,04','0,19','3,00','0,02','0,74','0,08','0,02','','0,01','','0,26','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','538','Estrogonofe de frango','3,7','2,2','1,0','0,12','0,54','2,09','0,93','0,02','0,01','Tr','0,03','0,10','2,05','0,02','0,91','0,07','0,04','','Tr','','0,19','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','539','Feijão tropeiro mineiro','2,2','2,9','1,5','','0,06','1,39','0,67','','','','','0,13','2,69','0,04','1,25','0,19','0,05','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','540','Feijoada','1,9','2,6','1,6','','0,07','1,25','0,58','','','','','0,13','2,41','0,04','1,35','0,18','0,02','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','541','Frango, com açafrão','1,6','2,5','1,8','','0,03','1,24','0,34','Tr','Tr','','Tr','0,26','2,23','0,02','1,57','0,11','0,03','','Tr','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','542','Macarrão, molho bolognesa','0,3','0,3','0,3','','Tr','0,21','0,07','Tr','Tr','','','0,01','0,25','Tr','0,28','0,01','','Tr','','','Tr','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','543','Maniçoba','2,9','3,7','1,7','','0,08','1,73','1,01','0,02','0,01','','','0,16','3,42','0,08','1,41','0,16','0,04','','','','0,04','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','544','Quibebe','1,0','1,1','0,2','','0,08','0,61','0,32','Tr','','Tr','0,03','0,11','0,95','Tr','0,18','0,06','Tr','Tr','Tr','','0,06','Tr','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','545','Salada, de legumes, com maionese','1,1','1,8','3,8','','','0,79','0,26','0,02','0,03','Tr','','Tr','1,75','0,02','3,46','0,36','','','','','','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','546','Salada, de legumes, cozida no vapor','0,1','Tr','0,2','','','0,05','0,01','Tr','','','','Tr','0,02','','0,07','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','547','Salpicão, de frango','1,3','2,1','4,0','','Tr','0,93','0,34','0,02','0,04','0,02','','0,04','2,02','0,02','3,60','0,36','0,04','','','','','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','548','Sarapatel','1,4','1,1','0,7','','0,02','0,76','0,56','0,02','0,01','0,02','','0,03','1,04','0,01','0,61','0,03','0,04','Tr','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','549','Tabule','0,2','0,8','0,2','','','0,18','0,03','','','','','0,01','0,82','','0,20','0,03','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','550','Tacacá','0,2','0,1','Tr','','0,00','0,10','0,05','0,00','0,01','','','0,01','0,12','Tr','0,03','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','551','Tapioca, com manteiga','6,0','3,0','0,2','0,25','1,08','3,38','1,38','0,02','','','0,08','0,18','2,64','0,02','0,17','0,02','','','','','0,30','0,03','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','552','Tucupi, com pimenta-de-cheiro','0,1','0,1','Tr','','','0,06','Tr','','Tr','','','','0,15','Tr','0,04','Tr','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','553','Vaca atolada','4,1','3,2','1,2','','0,29','2,10','1,57','0,02','Tr','','0,04','0,21','2,81','0,02','1,11','0,12','','','','','0,21','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','554','Vatapá','7,5','9,7','4,7','0,04','0,34','4,60','2,42','0,04','','','','0,34','9,07','0,17','4,21','0,30','0,06','','','','0,15','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','555','Virado à paulista','8,3','10,6','5,1','0,05','0,37','5,12','2,64','0,05','','','','0,44','9,85','0,19','4,57','0,32','0,07','','','','0,17','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Alimentos preparados','556','Yakisoba','0,6','0,9','1,0','','Tr','0,39','0,19','Tr','','','','0,03','0,84','Tr','0,94','0,05','','Tr','','','0,01','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','557','Amendoim, grão, cru','8,7','17,2','16,2','','','4,85','1,21','0,56','1,36','0,66','','0,03','16,67','0,45','16,17','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','558','Amendoim, torrado, salgado','9,7','29,1','14,2','','0,04','5,28','1,28','0,63','1,52','0,94','','','28,15','0,79','14,18','0,06','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','559','Ervilha, em vagem','Tr','0,1','0,3','','Tr','','0,02','Tr','Tr','0,01','','Tr','0,08','Tr','0,27','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','560','Ervilha, enlatada, drenada','0,1','0,1','0,2','','Tr','0,06','0,02','Tr','Tr','Tr','','','0,10','Tr','0,15','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','561','Feijão, carioca, cozido','0,1','0,1','0,3','','','0,11','0,02','Tr','Tr','0,01','','Tr','0,08',' ','0,16','0,14','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','562','Feijão, carioca, cru','0,2','0,1','0,9','','','0,14','0,03','Tr','0,01','0,01','','','0,11','','0,40','0,49','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','563','Feijão, fradinho, cozido','0,2','0,1','0,3','','Tr','0,18','0,03','0,01','0,02','0,01','','Tr','0,05','Tr','0,21','0,10','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','564','Feijão, fradinho, cru','0,7','0,2','0,9','Tr','Tr','0,50','0,08','0,02','0,04','0,03','','','0,15','0,01','0,58','0,28','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','565','Feijão, jalo, cozido','0,1','0,1','0,3','','Tr','0,10','0,01','Tr','Tr','0,01','','Tr','0,06','','0,11','0,20','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','566','Feijão, jalo, cru','0,3','0,2','0,6','','Tr','0,25','0,03','Tr','0,01','0,01','','Tr','0,15','','0,23','0,41','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','567','Feijão, preto, cozido','0,1','0,1','0,3','','','0,11','0,02','Tr','0,01','0,01','','','0,09','','0,16','0,11','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','568','Feijão, preto, cru','0,2','0,1','0,8','','Tr','0,15','0,03','0,01','0,01','0,01','Tr','Tr','0,13','','0,38','0,47','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','569','Feijão, rajado, cozido','0,1','Tr','0,2','','Tr','0,10','0,02','Tr','Tr','Tr','','Tr','0,03','','0,09','0,13','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','570','Feijão, rajado, cru','0,4','0,1','0,8','','Tr','0,30','0,04','0,01','0,01','0,01','','Tr','0,14','','0,29','0,46','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','571','Feijão, rosinha, cozido','0,2','Tr','0,2','','Tr','0,12','0,02','0,01','0,02','0,01','','Tr','0,04','Tr','0,16','0,07','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','572','Feijão, rosinha, cru','0,6','0,1','0,7','','Tr','0,28','0,05','0,01','0,03','0,02','','','0,09','0,01','0,33','0,14','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','573','Feijão, roxo, cozido','0,1','0,1','0,3','','Tr','0,10','0,01','Tr','Tr','Tr','','Tr','0,06','Tr','0,14','0,19','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','574','Feijão, roxo, cru','0,3','0,2','0,8','','Tr','0,27','0,03','Tr','0,01','0,01','','Tr','0,16','','0,34','0,46','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','575','Grão-de-bico, cru','0,9','1,4','2,8','','0,01','0,57','0,20','0,05','0,02','0,01','','0,01','1,42','0,02','2,71','0,13','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','576','Guandu, cru','0,6','0,2','0,9','','Tr','0,44','0,08','0,02','0,02','0,02','','Tr','0,13','Tr','0,86','0,06','','','','','Tr','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','577','Lentilha, cozida','0,1','0,1','0,3','','Tr','0,08','0,01','Tr','Tr','Tr','','Tr','0,14','Tr','0,21','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','578','Lentilha, crua','0,1','0,2','0,4','','0,01','0,10','0,01','0,01','Tr','Tr','Tr','Tr','0,16','0,01','0,33','0,09','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','579','Paçoca, amendoim','4,1','10,0','7,3','','','2,24','0,56','0,27','0,65','0,34','','0,01','9,73','0,26','7,25','0,02','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','580','Pé-de-moleque, amendoim','5,1','14,4','8,3','','','2,70','0,64','0,35','0,84','0,51','','0,02','13,91','0,41','8,25','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','582','Soja, extrato solúvel, natural, fluido','0,2','0,3','0,6','','Tr','0,12','0,05','Tr','0,01','Tr','','Tr','0,25','0,01','0,58','0,06','','','','','','0,01','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','583','Soja, extrato solúvel, pó','3,3','6,4','12,9','','0,02','2,53','0,57','0,06','0,09','0,03','','0,02','6,30','0,05','11,67','1,23','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','584','Soja, queijo (tofu)','0,4','0,5','1,7','','0,01','0,27','0,10','0,01','0,01','Tr','','Tr','0,51','Tr','1,48','0,20','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','585','Tremoço, cru','1,2','5,4','1,7','','','0,61','0,19','0,10','0,26','0,05','','0,02','4,89','0,33','1,08','0,57','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Leguminosas e derivados','586','Tremoço, em conserva','0,4','1,9','0,6','','','0,20','0,06','0,03','0,09','0,02','','Tr','1,82','0,12','0,40','0,22','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','587','Amêndoa, torrada, salgada','4,8','32,3','16,2','','0,04','3,91','0,77','0,04','0,02','','','0,22','31,95','0,03','16,17','0,03','','','','','0,10','0,02','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','588','Castanha-de-caju, torrada, salgada','7,7','26,5','8,1','','','3,95','3,42','0,23','0,06','0,06','','0,13','26,27','0,08','8,00','0,08','','','','','0,11','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','589','Castanha-do-Brasil, crua','15,3','27,4','21,0','','0,04','0,04','6,14','0,16','0,03','','','0,18','27,14','0,04','20,97','0,04','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','590','Coco, cru','30,0','1,5','0,3','15,37','6,12','2,74','0,97','','','','','','1,47','','0,32','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','591','Coco, verde, cru','3,1','1,1','0,3','1,24','0,80','0,77','0,14','Tr','Tr','0,01','','Tr','1,15','Tr','0,28','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','593','Gergelim, semente','7,8','19,9','22,5','','0,03','4,86','2,58','0,26','','0,04','','0,07','19,72','0,09','22,39','0,16','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','594','Linhaça, semente','4,2','7,1','25,3','','0,03','2,49','1,62','0,06','','0,04','','0,03','7,06','0,04','5,42','19,81','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','595','Pinhão, cozido','0,3','0,1','0,2','','','0,18','0,04','0,03','0,02','','','','0,09','','0,22','','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','596','Pupunha, cozida','3,1','6,8','0,4','','','2,77','0,26','0,03','','','','0,32','6,45','0,01','0,28','0,08','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00'),
+('Nozes e sementes','597','Noz, crua','5,6','8,7','44,1','','','4,26','1,34','','','','','','8,66','0,09','35,30','8,82','','','','','','','28/05/18 21:32:00','28/05/18 21:32:00');
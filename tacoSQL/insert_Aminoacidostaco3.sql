@@ -1,26 +1,27 @@
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','56','Pastel, de carne, frito','0,1183050267','0,3031989653','0,4135465533','0,810920604','0,388287692','0,18852964','0,0713222709','0,495830348','0,3601486373','0,5030959613','0,4131210373','0,1760102067','0,311139036','0,5385353653','3,37078144','0,296063612','1,18154504','0,4748382253','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','80','Alface, roxa, crua','0,0018633333','0,02571357','0,0315562667','0,0600108','0,0547562','0,0066751767','0,001647932','0,03706084','0,03601852','0,0421474533','0,0629505667','0,0160788467','0,0471910667','0,0525546','0,1055033667','0,0367836333','0,02978567','0,0309138467','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','83','Alho-poró, cru','0,0078','0,0328974','0,0387558','0,070596','0,0756393','0,0095217','0,00367458','0,0485967','0,055215','0,0507012','0,0828765','0,0222054','0,0645276','0,0542148','0,181962','0,0468639','0,033579','0,043446','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','123','Farinha, de puba','0','0,0069359333','0,0266146667','0,0411616667','0,024508','0,0006184233','0,01982','0,023054','0,0041225333','0,0175573333','0,0230516667','0,0372646667','0,0398293333','0,088487','0,3187','0,0085613','0,0619173333','0,0106003333','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','147','Quiabo, cru','0,0056539','0,04983903','0,0448729883','0,07650692','0,0666375483','0,0092928183','0,0036762498','0,0485867667','0,0253791817','0,0588560483','0,10873415','0,0230059883','0,0669360033','0,27017565','0,3281363333','0,0491528133','0,0406427417','0,05564856','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','151','Repolho, roxo, refogado','0,0082871333','0,0325478213','0,059697648','0,0721001633','0,0673950067','0,0095627629','0,0037528515','0,0473990373','0,0443975807','0,071167966','0,067015986','0,0434136413','0,0954871267','0,16896918','0,5256776867','0,060605026','0,083623906','0,0810098833','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','176','Banana, doce em barra','0,00448392','0,0078680487','0,0187660844','0,0385252252','0,0036774243','0,0035635734','0,0203064428','0,0124261732','0,0143186512','0,0265711824','0,0112001288','0,0280754936','0,0207231836','0,0801219356','0,0889517412','0,000832576','0,0047515485','0,0272758612','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','185','Cajá, polpa, congelada','0','0,020361912','0,021099584','0,035445648','0,034838848','0,0056871592','0,003402508','0,018780952','0,01698056','0,026299696','0,033677728','0,0068286648','0,061835544','0,065947024','0,081717264','0,021965176','0,022443072','0,024876832','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','224',' Mamão, doce em calda, drenado','0','0,012533972','0,0074503385','0,0092284198','0,0016085011','0,0054419767','0,013722005','0,0038950307','0,0162253603','0,002445548','0,0198240136','0,0343453055','0,0055344674','0,0366581848','0,0214634503','0,0015072431','0,0041123687','0,0288450668','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','227',' Mamão verde, doce em calda, drenado','0','0,0168082432','0,0010672583','0,0040342435','0,003966701','0,0055191358','0,0115146904','0,005893187','0,0189543376','0,0099244552','0,0187855048','0,0368688496','0,0070878567','0,0069911032','0,0063391634','0,0138198712','0,0068152027','0,032525728','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','229','Manga, Palmer, crua','0,0235264667','0,0142184397','0,0166035253','0,028223896','0,0234432393','0,005896034','0,0012275901','0,0171351317','0,0086131115','0,0188216321','0,0223999487','0,0095451266','0,0288536713','0,0319488107','0,044689146','0,0223973273','0,015840062','0,021417604','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','248','Pitanga, polpa, congelada','0,00173166','0,009742649','0,011527775','0,021266567','0,018141599','0,0025258961','0,0022449203','0,011219348','0,011638697','0,014792792','0,015674981','0,0030653042','0,01623797','0,02960846','0,039889892','0,013588211','0,012141836','0,012444278','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','323','Apresuntado','0,1605788282','0,6715948003','0,7419811285','1,1573778607','1,260165379','0,4456848012','0,24165122','0,6935835096','0,5904080754','0,7917058283','1,1870023893','0,7687371207','0,8634192374','1,3552252033','2,5419009265','0,7637044217','0,6668581424','0,6410515234','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','424','Mortadela','0,1350237387','0,5746493017','0,608747166','0,9377777239','1,0547513812','0,385067251','0,2958110767','0,5928567313','0,5225895401','0,6637498569','1,0772642714','0,4772352307','0,8780891704','1,1794541183','2,1555141301','0,998797685','0,7402798506','0,6041650494','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','438','Presunto, com capa de gordura','0,1108285307','0,7300569126','0,7100863393','1,1699801134','1,347728405','0,4710915599','0,2288046925','0,6715207169','0,57746543','0,7378413606','1,2217202008','0,9115853485','0,9040658163','1,4075891796','2,3941966359','0,8137091611','0,7039423313','0,6813939238','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','439','Presunto, sem capa de gordura','0,1504161878','0,7080174658','0,6856551637','1,1502603559','1,2775905715','0,4772202824','0,2171323249','0,6331220689','0,5493728799','0,7246797484','1,2009887424','0,8932680987','0,8839943993','1,3668432275','2,3582561913','0,7284231782','0,6472291704','0,6791153295','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','441','Quibe, cru','0,017','0,351526','0,3956665','0,784193','0,931889','0,2349774','0,04195855','0,4638195','0,453509','0,47736','0,853145','0,4987715','0,6483885','0,9982315','2,1646525','0,514505','0,474844','0,4465305','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','443','Salame','0,2830652836','1,2196391289','1,2115977255','2,0173148118','0,0725678843','0,7906223735','0,3488523728','1,0832243411','0,9672284109','1,2991071155','1,9607359179','1,3001845585','1,6122751037','2,3382088543','4,2426286693','1,5544873714','1,3834892931','1,1500520825','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','463','Queijo, mozarela','0,3805000345','1,0489899309','1,3862102901','2,3820808564','2,0589843508','0,8516192265','0,358081355','1,2720015193','1,613751768','1,7700756906','1,1273228315','0,863990953','0,7940768094','1,7614646271','5,9081724862','0,5524905373','2,7559676796','1,4979831768','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','467','Queijo, prato','0,480480363','1,0062956381','1,20948952','2,188081979','1,9366979703','0,8177352903','0,3604317643','1,1343334761','1,4312490001','1,4711281732','1,1356962938','0,8389371588','0,8100722335','1,6619449896','5,3250425233','0,5558821609','2,7557513957','1,5432681451','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','468','Maria mole','0','0,0329707898','0,0546367101','0,1032656607','0,1045813833','0,0200170227','0,0185840521','0,0627933948','0,0162961271','0,0673650005','0,3270472733','0,0300398584','0,4109007193','0,227113362','0,4387696353','0,9878795933','0,5840880207','0,090036812','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','501','Doce, de leite, cremoso','0,0253935','0,2265343875','0,28408914','0,559793295','0,3365651925','0,1183284518','0,0176766975','0,227923335','0,2086819875','0,3405973725','0,1751548725','0,069861879','0,22217517','0,4438796625','1,28488545','0,0905021775','0,57259008','0,2806687125','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','506','Marmelada','0,19681283','0,0204958547','0,0019266436','0,0080020583','0,0055052649','0,0071083481','0,0141967856','0,0072803609','0,0242544278','0,0119647784','0,02297057','0,0415487031','0,0103731879','0,0504827807','0,0104782858','0,01661933','0,0089842322','0,0370090787','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','509','Quindim','0,0719648','0,212978675','0,226273335','0,42154846','0,32652982','0,10317744','0,0254593785','0,19525682','0,1607702','0,263516165','0,481439805','0,0614642675','0,313452205','0,359277465','0,75361685','0,15521071','0,22471218','0,35835437','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','510','Rapadura','0,0224375','0,022748125','0,0032325','0,008774','0,0109515625','0,00767375','0,02406875','0,0115631875','0,03488375','0,0076214375','0,03308125','0,062460625','0,00284295','0,160428125','0,0388159375','0,02391125','0,0181229688','0,0536546875','28/05/18 21:43:00','28/05/18 21:43:00');
-INSERT INTO Aminoacidostaco3 (id, numeroAlimento, descricaoAlimento, triptofano, treonina, isoleucina, leucina, lisina, metionina, cistina, fenilalanina, tirosina, valina, arginina, histidina, alanina, acidoAspartico, acidoClutamico, glicina, prolina, serina, created_at, updated_at) VALUES ('','580','Pé-de-moleque, amendoim','0,06871578','0,335118','0,504511854','0,97174266','0,476507934','0,14191086','0,0908498262','0,754350618','0,537061434','0,581436366','1,87029024','0,254178708','0,62700246','1,79765922','3,08809578','0,910598556','0,618860088','0,685130502','28/05/18 21:43:00','28/05/18 21:43:00');
+INSERT INTO `Aminoacidostaco3` (`numeroAlimento`, `descricaoAlimento`, `triptofano`, `treonina`, `isoleucina`, `leucina`, `lisina`, `metionina`, `cistina`, `fenilalanina`, `tirosina`, `valina`, `arginina`, `histidina`, `alanina`, `acidoAspartico`, `acidoClutamico`, `glicina`, `prolina`, `serina`, `created_at`, `updated_at`) VALUES
+('56','Pastel, de carne, frito','0,1183050267','0,3031989653','0,4135465533','0,810920604','0,388287692','0,18852964','0,0713222709','0,495830348','0,3601486373','0,5030959613','0,4131210373','0,1760102067','0,311139036','0,5385353653','3,37078144','0,296063612','1,18154504','0,4748382253','28/05/18 21:43:00','28/05/18 21:43:00'),
+('80','Alface, roxa, crua','0,0018633333','0,02571357','0,0315562667','0,0600108','0,0547562','0,0066751767','0,001647932','0,03706084','0,03601852','0,0421474533','0,0629505667','0,0160788467','0,0471910667','0,0525546','0,1055033667','0,0367836333','0,02978567','0,0309138467','28/05/18 21:43:00','28/05/18 21:43:00'),
+('83','Alho-poró, cru','0,0078','0,0328974','0,0387558','0,070596','0,0756393','0,0095217','0,00367458','0,0485967','0,055215','0,0507012','0,0828765','0,0222054','0,0645276','0,0542148','0,181962','0,0468639','0,033579','0,043446','28/05/18 21:43:00','28/05/18 21:43:00'),
+('123','Farinha, de puba','0','0,0069359333','0,0266146667','0,0411616667','0,024508','0,0006184233','0,01982','0,023054','0,0041225333','0,0175573333','0,0230516667','0,0372646667','0,0398293333','0,088487','0,3187','0,0085613','0,0619173333','0,0106003333','28/05/18 21:43:00','28/05/18 21:43:00'),
+('147','Quiabo, cru','0,0056539','0,04983903','0,0448729883','0,07650692','0,0666375483','0,0092928183','0,0036762498','0,0485867667','0,0253791817','0,0588560483','0,10873415','0,0230059883','0,0669360033','0,27017565','0,3281363333','0,0491528133','0,0406427417','0,05564856','28/05/18 21:43:00','28/05/18 21:43:00'),
+('151','Repolho, roxo, refogado','0,0082871333','0,0325478213','0,059697648','0,0721001633','0,0673950067','0,0095627629','0,0037528515','0,0473990373','0,0443975807','0,071167966','0,067015986','0,0434136413','0,0954871267','0,16896918','0,5256776867','0,060605026','0,083623906','0,0810098833','28/05/18 21:43:00','28/05/18 21:43:00'),
+('176','Banana, doce em barra','0,00448392','0,0078680487','0,0187660844','0,0385252252','0,0036774243','0,0035635734','0,0203064428','0,0124261732','0,0143186512','0,0265711824','0,0112001288','0,0280754936','0,0207231836','0,0801219356','0,0889517412','0,000832576','0,0047515485','0,0272758612','28/05/18 21:43:00','28/05/18 21:43:00'),
+('185','Cajá, polpa, congelada','0','0,020361912','0,021099584','0,035445648','0,034838848','0,0056871592','0,003402508','0,018780952','0,01698056','0,026299696','0,033677728','0,0068286648','0,061835544','0,065947024','0,081717264','0,021965176','0,022443072','0,024876832','28/05/18 21:43:00','28/05/18 21:43:00'),
+('224',' Mamão, doce em calda, drenado','0','0,012533972','0,0074503385','0,0092284198','0,0016085011','0,0054419767','0,013722005','0,0038950307','0,0162253603','0,002445548','0,0198240136','0,0343453055','0,0055344674','0,0366581848','0,0214634503','0,0015072431','0,0041123687','0,0288450668','28/05/18 21:43:00','28/05/18 21:43:00'),
+('227',' Mamão verde, doce em calda, drenado','0','0,0168082432','0,0010672583','0,0040342435','0,003966701','0,0055191358','0,0115146904','0,005893187','0,0189543376','0,0099244552','0,0187855048','0,0368688496','0,0070878567','0,0069911032','0,0063391634','0,0138198712','0,0068152027','0,032525728','28/05/18 21:43:00','28/05/18 21:43:00'),
+('229','Manga, Palmer, crua','0,0235264667','0,0142184397','0,0166035253','0,028223896','0,0234432393','0,005896034','0,0012275901','0,0171351317','0,0086131115','0,0188216321','0,0223999487','0,0095451266','0,0288536713','0,0319488107','0,044689146','0,0223973273','0,015840062','0,021417604','28/05/18 21:43:00','28/05/18 21:43:00'),
+('248','Pitanga, polpa, congelada','0,00173166','0,009742649','0,011527775','0,021266567','0,018141599','0,0025258961','0,0022449203','0,011219348','0,011638697','0,014792792','0,015674981','0,0030653042','0,01623797','0,02960846','0,039889892','0,013588211','0,012141836','0,012444278','28/05/18 21:43:00','28/05/18 21:43:00'),
+('323','Apresuntado','0,1605788282','0,6715948003','0,7419811285','1,1573778607','1,260165379','0,4456848012','0,24165122','0,6935835096','0,5904080754','0,7917058283','1,1870023893','0,7687371207','0,8634192374','1,3552252033','2,5419009265','0,7637044217','0,6668581424','0,6410515234','28/05/18 21:43:00','28/05/18 21:43:00'),
+('424','Mortadela','0,1350237387','0,5746493017','0,608747166','0,9377777239','1,0547513812','0,385067251','0,2958110767','0,5928567313','0,5225895401','0,6637498569','1,0772642714','0,4772352307','0,8780891704','1,1794541183','2,1555141301','0,998797685','0,7402798506','0,6041650494','28/05/18 21:43:00','28/05/18 21:43:00'),
+('438','Presunto, com capa de gordura','0,1108285307','0,7300569126','0,7100863393','1,1699801134','1,347728405','0,4710915599','0,2288046925','0,6715207169','0,57746543','0,7378413606','1,2217202008','0,9115853485','0,9040658163','1,4075891796','2,3941966359','0,8137091611','0,7039423313','0,6813939238','28/05/18 21:43:00','28/05/18 21:43:00'),
+('439','Presunto, sem capa de gordura','0,1504161878','0,7080174658','0,6856551637','1,1502603559','1,2775905715','0,4772202824','0,2171323249','0,6331220689','0,5493728799','0,7246797484','1,2009887424','0,8932680987','0,8839943993','1,3668432275','2,3582561913','0,7284231782','0,6472291704','0,6791153295','28/05/18 21:43:00','28/05/18 21:43:00'),
+('441','Quibe, cru','0,017','0,351526','0,3956665','0,784193','0,931889','0,2349774','0,04195855','0,4638195','0,453509','0,47736','0,853145','0,4987715','0,6483885','0,9982315','2,1646525','0,514505','0,474844','0,4465305','28/05/18 21:43:00','28/05/18 21:43:00'),
+('443','Salame','0,2830652836','1,2196391289','1,2115977255','2,0173148118','0,0725678843','0,7906223735','0,3488523728','1,0832243411','0,9672284109','1,2991071155','1,9607359179','1,3001845585','1,6122751037','2,3382088543','4,2426286693','1,5544873714','1,3834892931','1,1500520825','28/05/18 21:43:00','28/05/18 21:43:00'),
+('463','Queijo, mozarela','0,3805000345','1,0489899309','1,3862102901','2,3820808564','2,0589843508','0,8516192265','0,358081355','1,2720015193','1,613751768','1,7700756906','1,1273228315','0,863990953','0,7940768094','1,7614646271','5,9081724862','0,5524905373','2,7559676796','1,4979831768','28/05/18 21:43:00','28/05/18 21:43:00'),
+('467','Queijo, prato','0,480480363','1,0062956381','1,20948952','2,188081979','1,9366979703','0,8177352903','0,3604317643','1,1343334761','1,4312490001','1,4711281732','1,1356962938','0,8389371588','0,8100722335','1,6619449896','5,3250425233','0,5558821609','2,7557513957','1,5432681451','28/05/18 21:43:00','28/05/18 21:43:00'),
+('468','Maria mole','0','0,0329707898','0,0546367101','0,1032656607','0,1045813833','0,0200170227','0,0185840521','0,0627933948','0,0162961271','0,0673650005','0,3270472733','0,0300398584','0,4109007193','0,227113362','0,4387696353','0,9878795933','0,5840880207','0,090036812','28/05/18 21:43:00','28/05/18 21:43:00'),
+('501','Doce, de leite, cremoso','0,0253935','0,2265343875','0,28408914','0,559793295','0,3365651925','0,1183284518','0,0176766975','0,227923335','0,2086819875','0,3405973725','0,1751548725','0,069861879','0,22217517','0,4438796625','1,28488545','0,0905021775','0,57259008','0,2806687125','28/05/18 21:43:00','28/05/18 21:43:00'),
+('506','Marmelada','0,19681283','0,0204958547','0,0019266436','0,0080020583','0,0055052649','0,0071083481','0,0141967856','0,0072803609','0,0242544278','0,0119647784','0,02297057','0,0415487031','0,0103731879','0,0504827807','0,0104782858','0,01661933','0,0089842322','0,0370090787','28/05/18 21:43:00','28/05/18 21:43:00'),
+('509','Quindim','0,0719648','0,212978675','0,226273335','0,42154846','0,32652982','0,10317744','0,0254593785','0,19525682','0,1607702','0,263516165','0,481439805','0,0614642675','0,313452205','0,359277465','0,75361685','0,15521071','0,22471218','0,35835437','28/05/18 21:43:00','28/05/18 21:43:00'),
+('510','Rapadura','0,0224375','0,022748125','0,0032325','0,008774','0,0109515625','0,00767375','0,02406875','0,0115631875','0,03488375','0,0076214375','0,03308125','0,062460625','0,00284295','0,160428125','0,0388159375','0,02391125','0,0181229688','0,0536546875','28/05/18 21:43:00','28/05/18 21:43:00'),
+('580','Pé-de-moleque, amendoim','0,06871578','0,335118','0,504511854','0,97174266','0,476507934','0,14191086','0,0908498262','0,754350618','0,537061434','0,581436366','1,87029024','0,254178708','0,62700246','1,79765922','3,08809578','0,910598556','0,618860088','0,685130502','28/05/18 21:43:00','28/05/18 21:43:00');
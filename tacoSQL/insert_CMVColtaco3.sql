@@ -1,597 +1,599 @@
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','1','Arroz, integral, cozido','70,13866666666670000000','123,53489250000000000000','516,86999022000000000000','2,58825000000000000000','1,00033333333333000000','NA','25,80975000000000000000','2,74933333333333000000','0,46300000000000000000','5,20400000000000000000','58,70200000000000000000','0,62733333333333300000','105,85300000000000000000','0,26200000000000000000','1,24466666666667000000','75,15166666666670000000','0,02033333333333330000','0,68266666666666700000','NA','','','0,08000000000000000000','Tr','0,08000000000000000000','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','2','Arroz, integral, cru','12,17983333333330000000','359,67800203260900000000','1504,89276050444000000000','7,32328586956522000000','1,86483333333333000000','NA','77,45071413043480000000','4,81916666666667000000','1,18133333333333000000','7,81800000000000000000','109,71000000000000000000','2,99333333333333000000','250,86500000000000000000','0,94833333333333300000','1,64566666666667000000','173,34000000000000000000','0,07483333333333330000','1,39516666666667000000','NA','','','0,26166666666666700000','Tr','0,17500000000000000000','4,18333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','3','Arroz, tipo 1, cozido','69,11366666666670000000','128,25848566666700000000','536,63350402933300000000','2,52081666666667000000','0,22700000000000000000','NA','28,05985000000000000000','1,56100000000000000000','0,07866666666666670000','3,54433333333333000000','2,25333333333333000000','0,29666666666666700000','17,94500000000000000000','0,07666666666666670000','1,20066666666667000000','14,67366666666670000000','0,01500000000000000000','0,49133333333333300000','NA','','','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','4','Arroz, tipo 1, cru','13,22450000000000000000','357,78927311594200000000','1496,99031871710000000000','7,15853985507246000000','0,33500000000000000000','NA','78,75954347826090000000','1,63916666666667000000','0,52241666666666700000','4,41433333333333000000','30,38366666666670000000','1,03233333333333000000','104,20758333333300000000','0,67774750000000000000','1,01916666666667000000','62,49941666666670000000','0,11483333333333300000','1,22483333333333000000','NA','','','0,16333333333333300000','Tr','0,06916666666666670000','1,11666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','5','Arroz, tipo 2, cozido','68,72766666666670000000','130,11964833333300000000','544,42060862666700000000','2,56841666666667000000','0,36166666666666700000','NA','28,19258333333330000000','1,06966666666667000000','0,14966666666666700000','3,33366666666667000000','6,05333333333333000000','0,37100000000000000000','21,52133333333330000000','0,05033333333333330000','1,95966666666667000000','20,20333333333330000000','0,04100000000000000000','0,54933333333333300000','NA','','','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','6','Arroz, tipo 2, cru','13,16475000000000000000','358,11676145652200000000','1498,36052993409000000000','7,24188297101449000000','0,27550000000000000000','NA','78,88145036231880000000','1,71983333333333000000','0,43641666666666700000','4,83350000000000000000','29,23908333333330000000','0,82800000000000000000','82,04391666666670000000','0,59783333333333300000','0,56883333333333300000','57,28458333333330000000','0,05200000000000000000','1,27208333333333000000','NA','','','0,16333333333333300000','Tr','0,04916666666666670000','0,91833333333333300000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','7','Aveia, flocos, crua','9,13333333333333000000','393,82268944927500000000','1647,75413265577000000000','13,92102608695650000000','8,49666666666667000000','NA','66,63564057971020000000','9,13000000000000000000','1,81333333333333000000','47,89000000000000000000','118,76233333333300000000','1,89466666666667000000','153,39666666666700000000','4,44666666666667000000','4,62666666666667000000','336,33333333333300000000','0,44000000000000000000','2,63000000000000000000','NA','','','0,55333333333333300000','0,03000000000000000000','Tr','4,47000000000000000000','1,35000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','8','Biscoito, doce, maisena','3,21666666666667000000','442,81939014492800000000','1852,75632836638000000000','8,07252173913043000000','11,96666666666670000000','NA','75,23414492753620000000','2,10000000000000000000','1,51000000000000000000','54,45000000000000000000','37,14333333333330000000','0,77833333333333300000','166,10333333333300000000','1,76000000000000000000','352,02666666666700000000','141,64000000000000000000','0,17000000000000000000','1,03000000000000000000','NA','','','1,01000000000000000000','0,41666666666666700000','0,23000000000000000000','3,90666666666667000000','6,21666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','9','Biscoito, doce, recheado com chocolate','2,18333333333333000000','471,82477971014500000000','1974,11487830725000000000','6,39721739130435000000','19,58333333333330000000','Tr','70,54944927536230000000','2,95666666666667000000','1,28666666666667000000','27,23000000000000000000','47,97666666666670000000','0,58800000000000000000','139,45000000000000000000','2,27000000000000000000','239,20000000000000000000','232,40000000000000000000','0,27333333333333300000','0,99333333333333300000','Tr',' ',' ','0,31666666666666700000','0,39333333333333300000','0,45666666666666700000','2,52333333333333000000','3,52666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','10','Biscoito, doce, recheado com morango','2,73333333333333000000','471,17473623188400000000','1971,39509639420000000000','5,71982608695652000000','19,57333333333330000000','Tr','71,01350724637680000000','1,53333333333333000000','0,96000000000000000000','35,78000000000000000000','27,10000000000000000000','0,65900000000000000000','137,74333333333300000000','1,48000000000000000000','229,81666666666700000000','113,01333333333300000000','0,12666666666666700000','0,72666666666666700000','Tr',' ',' ','0,89666666666666700000','0,42000000000000000000','0,21000000000000000000','1,49666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','11','Biscoito, doce, wafer, recheado de chocolate','1,17000000000000000000','502,45685797101400000000','2102,27949375072000000000','5,56452173913044000000','24,67333333333330000000','Tr','67,53547826086960000000','1,80333333333333000000','1,05666666666667000000','23,34333333333330000000','47,85333333333330000000','0,43500000000000000000','124,20333333333300000000','2,44333333333333000000','137,24000000000000000000','240,45333333333300000000','0,26333333333333300000','0,87333333333333300000','Tr',' ',' ','0,36666666666666700000','0,03000000000000000000','0,29666666666666700000','1,12000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','12','Biscoito, doce, wafer, recheado de morango','1,17333333333333000000','513,44618260869600000000','2148,25882803478000000000','4,51704347826087000000','26,40000000000000000000','1,26733333333333000000','67,35295652173910000000','0,82000000000000000000','0,55666666666666700000','13,70666666666670000000','18,54000000000000000000','0,27966666666666700000','73,16333333333330000000','1,09333333333333000000','119,90000000000000000000','74,84333333333330000000','0,08333333333333330000','0,51333333333333300000','Tr',' ',' ','0,35666666666666700000','Tr','0,94000000000000000000','0,37333333333333300000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','13','Biscoito, salgado, cream cracker','4,05666666666667000000','431,73228115942000000000','1806,36786437101000000000','10,05513043478260000000','14,43666666666670000000','NA','68,73153623188410000000','2,51000000000000000000','2,72000000000000000000','20,00333333333330000000','39,74666666666670000000','0,68966666666666700000','148,26000000000000000000','2,20000000000000000000','854,35666666666700000000','180,61333333333300000000','0,18000000000000000000','1,13666666666667000000','NA','','','0,71000000000000000000','0,13000000000000000000','0,17000000000000000000','7,13666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','14','Bolo, mistura para','1,00000000000000000000','418,63333333333300000000','1751,56186666667000000000','6,15942028985507000000','6,12666666666667000000','Tr','84,71391304347830000000','1,70333333333333000000','2,00000000000000000000','58,87900000000000000000','27,92200000000000000000','0,46266666666666700000','332,65766666666700000000','1,21066666666667000000','462,88000000000000000000','75,36300000000000000000','0,15333333333333300000','0,58266666666666700000','NA','','','0,17666666666666700000','Tr','1,50333333333333000000','1,51666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','15','Bolo, pronto, aipim','34,13366666666670000000','323,85166666666700000000','1354,99537333333000000000','4,41666666666667000000','12,74766666666670000000','73,20400000000000000000','47,86400000000000000000','0,69066666666666700000','0,83800000000000000000','85,02233333333330000000','10,34400000000000000000','0,10700000000000000000','122,19400000000000000000','0,48900000000000000000','111,00833333333300000000','134,82266666666700000000','0,05166666666666670000','0,41566666666666700000','Tr',' ',' ','0,13000000000000000000','0,07000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','16','Bolo, pronto, chocolate','19,27633333333330000000','410,01366666666700000000','1715,49718133333000000000','6,22291666666667000000','18,47233333333330000000','76,79766666666670000000','54,71775000000000000000','1,43000000000000000000','1,31066666666667000000','74,58466666666670000000','27,68666666666670000000','0,37933333333333300000','196,97666666666700000000','2,13233333333333000000','283,30000000000000000000','211,76333333333300000000','0,04633333333333330000','0,71366666666666700000','Tr',' ',' ','0,13333333333333300000','0,09333333333333330000','0,05000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','17','Bolo, pronto, coco','29,32033333333330000000','333,43766666666700000000','1395,10319733333000000000','5,66666666666667000000','11,29633333333330000000','63,20766666666670000000','52,27600000000000000000','1,05500000000000000000','1,44066666666667000000','57,10533333333330000000','16,25166666666670000000','0,39900000000000000000','303,39633333333300000000','0,84800000000000000000','190,33866666666700000000','143,29400000000000000000','0,08900000000000000000','0,67566666666666700000','Tr','Tr','Tr','0,15333333333333300000','0,05666666666666670000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','18','Bolo, pronto, milho','36,68833333333330000000','311,38700000000000000000','1302,84320800000000000000','4,80416666666667000000','12,41500000000000000000','81,68733333333330000000','45,10883333333330000000','0,71000000000000000000','0,98366666666666700000','82,58466666666670000000','10,24900000000000000000','0,10766666666666700000','128,19633333333300000000','0,65000000000000000000','133,81100000000000000000','118,42733333333300000000','0,04000000000000000000','0,43500000000000000000','56,88666666666670000000','','','0,11000000000000000000','0,05000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','19','Canjica, branca, crua','13,55700000000000000000','357,60259000000000000000','1496,20923656000000000000','7,20000000000000000000','0,97100000000000000000','NA','78,06100000000000000000','5,49933333333333000000','0,21100000000000000000','1,96466666666667000000','12,32500000000000000000','0,08633333333333330000','48,49800000000000000000','0,32166666666666700000','0,78966666666666700000','92,94733333333330000000','0,04500000000000000000','0,36233333333333300000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','20','Canjica, com leite integral','72,49400000000000000000','112,45677722046500000000','470,51915589042700000000','2,36060004234314000000','1,24433333333333000000','1,35066666666667000000','23,62773329099020000000','1,21666666666667000000','0,27333333333333300000','42,56266666666670000000','5,83833333333333000000','0,02000000000000000000','40,58333333333330000000','0,05600000000000000000','27,58666666666670000000','69,80900000000000000000','0,02566666666666670000','0,27800000000000000000','Tr','','','Tr','0,04000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','21','Cereais, milho, flocos, com sal','9,29333333333334000000','369,59975000000000000000','1546,40535400000000000000','7,29166666666667000000','1,60333333333333000000','NA','80,83500000000000000000','5,29333333333333000000','0,97666666666666700000','1,81366666666667000000','20,09600000000000000000','Tr','90,77033333333330000000','0,52433333333333300000','271,73766666666700000000','68,66000000000000000000','Tr','0,61100000000000000000','NA','','','0,12000000000000000000','Tr','0,06000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','22','Cereais, milho, flocos, sem sal','11,22333333333330000000','363,33831666666700000000','1520,20751693333000000000','6,87500000000000000000','1,18333333333333000000','NA','80,44833333333330000000','1,83666666666667000000','0,27000000000000000000','1,97466666666667000000','16,54866666666670000000','Tr','58,35966666666670000000','1,69333333333333000000','30,97033333333330000000','28,69733333333330000000','0,24033333333333300000','0,32566666666666700000','NA','','','0,05000000000000000000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','23','Cereais, mingau, milho, infantil','4,70333333333333000000','394,42752173913000000000','1650,28475095652000000000','6,43115942028986000000','1,09333333333333000000','NA','87,26550724637680000000','3,21333333333333000000','0,50666666666666700000','218,80666666666700000000','16,03000000000000000000','0,10633333333333300000','169,16333333333300000000','3,03000000000000000000','399,40333333333300000000','82,01666666666670000000','0,04333333333333330000','0,36333333333333300000','21,41666666666670000000','','','3,72333333333333000000','0,46666666666666700000','5,07666666666667000000','24,16333333333330000000','109,36666666666700000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','24','Cereais, mistura para vitamina, trigo, cevada e aveia','4,36666666666667000000','381,13333333333300000000','1594,66186666667000000000','8,89583333333333000000','2,12000000000000000000','NA','81,61750000000000000000','4,98333333333333000000','3,00000000000000000000','584,25133333333300000000','72,26800000000000000000','2,28400000000000000000','515,03600000000000000000','12,64133333333330000000','1163,25700000000000000000','244,36100000000000000000','0,20633333333333300000','2,02233333333333000000','Tr','','','0,76000000000000000000','0,87666666666666700000','1,48666666666667000000','7,45666666666667000000','13,10666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','25','Cereal matinal, milho','5,52666666666667000000','365,35416376811600000000','1528,64182120580000000000','7,15579710144928000000','0,95666666666666700000','NA','83,82420289855070000000','4,11666666666667000000','2,53666666666667000000','142,92333333333300000000','10,93333333333330000000','0,05900000000000000000','100,80000000000000000000','3,05000000000000000000','654,54333333333300000000','83,08666666666670000000','0,06000000000000000000','7,63000000000000000000','NA','30,91666666666670000000','15,45833333333330000000','0,76000000000000000000','1,02000000000000000000','2,24666666666667000000','11,04000000000000000000','17,29333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','26','Cereal matinal, milho, açúcar','4,26666666666667000000','376,55525362318800000000','1575,50718115942000000000','4,74275362318841000000','0,66666666666666700000','NA','88,84057971014490000000','2,10666666666667000000','1,48333333333333000000','56,42333333333330000000','7,94000000000000000000','0,13433333333333300000','43,18000000000000000000','3,90333333333333000000','405,31333333333300000000','51,59666666666670000000','0,04000000000000000000','8,48000000000000000000','NA','30,91666666666670000000','15,45833333333330000000','0,72666666666666700000','1,11000000000000000000','0,78666666666666700000','10,13333333333330000000','14,55000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','27','Creme de arroz, pó','7,33300000000000000000','386,00119033639800000000','1615,02898036749000000000','7,02694977474213000000','1,22600000000000000000','NA','83,86938355859120000000','1,07133333333333000000','0,54466666666666700000','7,08533333333333000000','50,50333333333330000000','1,23733333333333000000','153,02000000000000000000','0,63233333333333300000','1,03033333333333000000','114,68033333333300000000','0,03800000000000000000','1,86366666666667000000','NA','','','0,21666666666666700000','Tr','0,05333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','28','Creme de milho, pó','5,65200000000000000000','333,03419267054400000000','1393,41506213356000000000','4,82083333333333000000','1,63933333333333000000','NA','86,14850000000000000000','3,72233333333333000000','1,73933333333333000000','323,16333333333300000000','30,06233333333330000000','0,20000000000000000000','303,26666666666700000000','4,25700000000000000000','593,79366666666700000000','165,72366666666700000000','0,04266666666666670000','0,78066666666666700000','NA','','','0,74000000000000000000','Tr','2,05333333333333000000','Tr','96,34000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','29','Curau, milho verde','81,56466666666670000000','78,43381831365590000000','328,16709582433600000000','2,36060004234314000000','1,63700000000000000000','4,74200000000000000000','13,94439995765690000000','0,45666666666666700000','0,49333333333333300000','52,59600000000000000000','15,96133333333330000000','0,05566666666666670000','74,65633333333330000000','0,44933333333333300000','20,51200000000000000000','161,84233333333300000000','0,02533333333333330000','0,40000000000000000000','12,07000000000000000000','20,07000000000000000000','16,07000000000000000000','0,03666666666666670000','0,07000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','30','Curau, milho verde, mistura para','3,91633333333333000000','402,28657743531500000000','1683,16703998936000000000','2,22291666666667000000','13,37133333333330000000','NA','79,81641666666670000000','2,52266666666667000000','0,67300000000000000000','30,87800000000000000000','8,50066666666667000000','0,05466666666666670000','44,61900000000000000000','0,86266666666666700000','222,92566666666700000000','55,33533333333330000000','0,02933333333333330000','0,24066666666666700000','NA','','','0,13333333333333300000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','31','Farinha, de arroz, enriquecida','12,69333333333330000000','363,05648018122300000000','1519,02831307824000000000','1,26933329264323000000','0,30000000000000000000','NA','85,50400004069010000000','0,58000000000000000000','0,23333333333333300000','1,12266666666667000000','4,30000000000000000000','0,04233333333333330000','35,95866666666670000000','31,38333333333330000000','17,10166666666670000000','12,54066666666670000000','Tr','8,48000000000000000000','NA','','','3,23333333333333000000','Tr','3,46666666666667000000','24,42333333333330000000','173,58666666666700000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','32','Farinha, de centeio, integral','10,77666666666670000000','335,77766279932700000000','1404,89374115238000000000','12,51506650288900000000','1,75333333333333000000','NA','73,29826683044430000000','15,48000000000000000000','1,65666666666667000000','33,91666666666670000000','120,23333333333300000000','3,85666666666667000000','339,98666666666700000000','4,73000000000000000000','41,37666666666670000000','333,62000000000000000000','0,56333333333333300000','2,66333333333333000000','NA','','','0,28666666666666700000','0,03000000000000000000','0,08000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','33','Farinha, de milho, amarela','11,77333333333330000000','350,58693322738000000000','1466,85572862336000000000','7,18750000000000000000','1,46666666666667000000','NA','79,07916666666670000000','5,49000000000000000000','0,49333333333333300000','1,28500000000000000000','30,95500000000000000000','Tr','84,22133333333330000000','2,25266666666667000000','44,93233333333330000000','57,85366666666670000000','0,26666666666666700000','0,59833333333333300000','NA','18,00000000000000000000','9,00000000000000000000','0,25333333333333300000','Tr','0,25333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','34','Farinha, de rosca','9,80666666666667000000','370,57809666666700000000','1550,49875645333000000000','11,38099961916610000000','1,46333333333333000000','NA','75,78566666666670000000','4,82333333333333000000','1,56333333333333000000','35,29933333333330000000','56,87966666666670000000','1,62066666666667000000','194,95833333333300000000','6,73366666666667000000','332,50000000000000000000','212,14400000000000000000','0,26300000000000000000','1,67133333333333000000','NA','','','0,25333333333333300000','Tr','0,09000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','35','Farinha, de trigo','12,98000000000000000000','360,47297855072500000000','1508,21894225623000000000','9,79078260869565000000','1,36666666666667000000','NA','75,09255072463770000000','2,34666666666667000000','0,77000000000000000000','17,86333333333330000000','31,00333333333330000000','0,46033333333333300000','114,74000000000000000000','0,95000000000000000000','0,73666666666666700000','151,36666666666700000000','0,15000000000000000000','0,82666666666666700000','NA','','','0,31333333333333300000','Tr','Tr','0,89000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','36','Farinha, láctea, de cereais','2,69666666666667000000','414,85051739130400000000','1735,73456476522000000000','11,87913043478260000000','5,79000000000000000000','11,27180000000000000000','77,77086956521740000000','1,94000000000000000000','1,86333333333333000000','196,06333333333300000000','57,68666666666670000000','1,48900000000000000000','296,44333333333300000000','8,72333333333333000000','125,07333333333300000000','365,60333333333300000000','0,19333333333333300000','1,72666666666667000000','492,24666666666700000000','','','1,43000000000000000000','1,13333333333333000000','1,13666666666667000000','9,50000000000000000000','24,31000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','37','Lasanha, massa fresca, cozida','59,64633333333330000000','163,76366666666700000000','685,18718133333300000000','5,81250000000000000000','1,15833333333333000000','NA','32,52216666666670000000','1,63633333333333000000','0,86066666666666700000','9,97166666666667000000','3,53900000000000000000','0,19500000000000000000','42,38400000000000000000','1,18866666666667000000','206,76933333333300000000','53,91466666666670000000','0,07066666666666670000','0,40500000000000000000','NA','','','0,04000000000000000000','Tr','Tr','3,96000000000000000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','38','Lasanha, massa fresca, crua','44,98566666666670000000','220,30566666666700000000','921,75890933333300000000','7,00833333333333000000','1,33766666666667000000','NA','45,05833333333330000000','1,60633333333333000000','1,61000000000000000000','16,54566666666670000000','12,59166666666670000000','0,34466666666666700000','81,96133333333330000000','1,87233333333333000000','666,71033333333300000000','136,60700000000000000000','0,09766666666666670000','0,75566666666666700000','NA','','','0,08000000000000000000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','39','Macarrão, instantâneo','5,97333333333333000000','435,86478053333300000000','1823,65824175147000000000','8,79168000000000000000','17,23666666666670000000','NA','62,43165333333330000000','5,61000000000000000000','5,56666666666667000000','17,62666666666670000000','19,36666666666670000000','0,25300000000000000000','112,15000000000000000000','0,80000000000000000000','1515,52666666667000000000','147,92000000000000000000','0,10333333333333300000','0,50333333333333300000','NA','','','1,18000000000000000000','0,04000000000000000000','0,53333333333333300000','9,36666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','40','Macarrão, trigo, cru','10,24333333333330000000','371,12261304347800000000','1552,77701297391000000000','9,99565217391304000000','1,30333333333333000000','NA','77,94434782608700000000','2,92666666666667000000','0,51333333333333300000','17,30000000000000000000','27,69000000000000000000','0,52833333333333300000','99,81000000000000000000','0,88000000000000000000','7,17000000000000000000','147,06000000000000000000','0,15000000000000000000','0,77666666666666700000','NA','','','0,17666666666666700000','0,02000000000000000000','Tr','3,56666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','41','Macarrão, trigo, cru, com ovos','10,56333333333330000000','370,56711333333300000000','1550,45280218667000000000','10,32080000000000000000','1,97000000000000000000','17,56800000000000000000','76,62253333333340000000','2,29666666666667000000','0,52333333333333300000','19,45333333333330000000','Tr','0,39700000000000000000','118,47666666666700000000','0,91666666666666700000','14,74000000000000000000','134,09666666666700000000','0,13666666666666700000','0,81333333333333300000','Tr','','','0,10666666666666700000','0,05000000000000000000','0,03000000000000000000','4,37000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','42','Milho, amido, cru','12,18333000000000000000','361,36682387826100000000','1511,95879110664000000000','0,59782608695652200000','Tr','NA','87,14884391304350000000','0,74333330000000000000','0,07000000000000000000','1,05766666666667000000','3,02766666666667000000','0,01833333333333330000','12,60300000000000000000','0,12766666666666700000','8,08300000000000000000','8,53500000000000000000','0,01533333333333330000','0,07966666666666670000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','43','Milho, fubá, cru','11,45333333333330000000','353,48226811594200000000','1478,96980979710000000000','7,21376811594203000000','1,90333333333333000000','NA','78,87289855072460000000','4,71333333333333000000','0,55666666666666700000','2,66666666666667000000','41,23000000000000000000','0,33866666666666700000','107,83666666666700000000','0,85000000000000000000','Tr','168,33333333333300000000','0,08000000000000000000','1,09333333333333000000','NA','26,00000000000000000000','13,00000000000000000000','0,25333333333333300000','Tr','Tr','0,74666666666666700000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','44','Milho, verde, cru','63,53833333333330000000','138,16656500000000000000','578,08890796000000000000','6,58958333333333000000','0,60900000000000000000','NA','28,55575000000000000000','3,91800000000000000000','0,70733333333333300000','1,61233333333333000000','32,57500000000000000000','0,11800000000000000000','112,70500000000000000000','0,41100000000000000000','1,11566666666667000000','184,82233333333300000000','0,05033333333333330000','0,51766666666666700000','NA','32,00000000000000000000','16,00000000000000000000','0,30000000000000000000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','45','Milho, verde, enlatado, drenado','76,22333333333330000000','97,56489420289850000000','408,21151734492700000000','3,22826086956522000000','2,35333333333333000000','NA','17,13507246376810000000','4,64333333333333000000','1,06000000000000000000','2,16733333333333000000','20,37633333333330000000','0,09300000000000000000','61,30733333333330000000','0,58566666666666700000','260,34990000000000000000','162,02333333333300000000','0,04566666666666670000','0,49833333333333300000','NA','48,00000000000000000000','24,00000000000000000000','Tr','0,05000000000000000000','Tr','3,73666666666667000000','1,74333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','46','Mingau tradicional, pó','8,14333333333333000000','373,42146666666700000000','1562,39541653333000000000','0,58333333333333300000','0,37000000000000000000','NA','89,33666666666670000000','0,88000000000000000000','1,56666666666667000000','522,04666666666700000000','4,28066666666667000000','Tr','273,31900000000000000000','41,99133333333330000000','14,85533333333330000000','Tr','Tr','15,20933333333330000000','1533,24333333333000000000','','','3,40666666666667000000','Tr','3,11000000000000000000','19,39333333333330000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','47','Pamonha, barra para cozimento, pré-cozida','61,30733333333330000000','171,21911166666700000000','716,38076321333300000000','2,55208333333333000000','4,84966666666667000000','NA','30,68491666666670000000','2,37100000000000000000','0,60600000000000000000','4,16433333333333000000','15,34700000000000000000','0,12466666666666700000','54,58500000000000000000','0,35666666666666700000','131,99300000000000000000','125,34933333333300000000','0,03400000000000000000','0,42366666666666700000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','48','Pão, aveia, forma','19,91666666666670000000','343,08536666666700000000','1435,46917413333000000000','12,35000000000000000000','5,69333333333333000000','Tr','59,56666666666670000000','5,98000000000000000000','2,47333333333333000000','108,69100000000000000000','56,68033333333330000000','1,08200000000000000000','182,19766666666700000000','4,73200000000000000000','605,76300000000000000000','210,08333333333300000000','0,13566666666666700000','1,73066666666667000000','Tr',' ',' ','0,08666666666666670000','0,03000000000000000000','0,08333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','49','Pão, de soja','26,03333333333330000000','308,72632333333300000000','1291,71093682667000000000','11,34300000000000000000','3,58000000000000000000','NA','56,51033333333330000000','5,70666666666667000000','2,53333333333333000000','90,23733333333330000000','48,31833333333330000000','0,56933333333333300000','153,18000000000000000000','3,33033333333333000000','662,54133333333300000000','296,34800000000000000000','0,16266666666666700000','1,45866666666667000000','NA','','','0,07000000000000000000','0,04000000000000000000','0,79333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','50','Pão, glúten, forma','40,67333333333330000000','252,99403000000000000000','1058,52702152000000000000','11,95099960009260000000','2,72666666666667000000','NA','44,11900000000000000000','2,48000000000000000000','0,53000000000000000000','155,72100000000000000000','24,24366666666670000000','0,51000000000000000000','105,26066666666700000000','5,71033333333333000000','22,04533333333330000000','64,73233333333330000000','0,06200000000000000000','1,28433333333333000000','NA','','','0,04333333333333330000','0,03000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','51','Pão, milho, forma','30,41666666666670000000','292,01349000000000000000','1221,78444216000000000000','8,30300000000000000000','3,11000000000000000000','5,68500000000000000000','56,39700000000000000000','4,29666666666667000000','1,77333333333333000000','77,84866666666670000000','29,41566666666670000000','0,36600000000000000000','110,09800000000000000000','3,04433333333333000000','506,64400000000000000000','89,02466666666670000000','0,09966666666666670000','0,81766666666666700000','Tr','','','0,08000000000000000000','Tr','0,08333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','52','Pão, trigo, forma, integral','34,72333333333330000000','253,19361833333300000000','1059,36209910667000000000','9,42516666666667000000','3,65333333333333000000','NA','49,94150000000000000000','6,88333333333333000000','2,25666666666667000000','131,75966666666700000000','60,42833333333330000000','1,61633333333333000000','193,43900000000000000000','2,98533333333333000000','506,10333333333300000000','162,87100000000000000000','0,14600000000000000000','1,58566666666667000000','NA','','','0,07666666666666670000','0,04000000000000000000','0,14666666666666700000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','53','Pão, trigo, francês','28,48333333333330000000','299,81015043478300000000','1254,40566941913000000000','7,95356521739130000000','3,10333333333333000000','NA','58,64643478260870000000','2,30666666666667000000','1,81333333333333000000','15,75333333333330000000','25,46333333333330000000','0,46333333333333300000','94,74000000000000000000','1,00000000000000000000','647,67333333333300000000','142,20000000000000000000','0,13000000000000000000','0,76333333333333300000','2,98666666666667000000','','','0,38666666666666700000','0,67000000000000000000','0,60000000000000000000','2,33666666666667000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','54','Pão, trigo, sovado','25,76333333333330000000','310,96494000000000000000','1301,07730896000000000000','8,39800000000000000000','2,84000000000000000000','16,56200000000000000000','61,45200000000000000000','2,43333333333333000000','1,54666666666667000000','51,61800000000000000000','22,22033333333330000000','0,31366666666666700000','100,66266666666700000000','2,26866666666667000000','430,79200000000000000000','91,16600000000000000000','Tr','2,66166666666667000000','Tr',' ',' ','0,08000000000000000000','0,04333333333333330000','0,14666666666666700000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','55','Pastel, de carne, cru','34,39833333333330000000','288,70207151599000000000','1207,92946722290000000000','10,74069964059190000000','8,79300000000000000000','18,20066666666670000000','42,01663369274140000000','1,04000000000000000000','4,05133333333333000000','16,69166666666670000000','17,70500000000000000000','0,34333333333333300000','117,37666666666700000000','1,99100000000000000000','1309,26500000000000000000','165,61033333333300000000','0,11000000000000000000','1,65900000000000000000','Tr','','','0,06000000000000000000','0,03000000000000000000','Tr','1,58000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','56','Pastel, de carne, frito','22,92333333333330000000','388,37465162496800000000','1624,95954239886000000000','10,10419966189070000000','20,13666666666670000000','25,33600000000000000000','43,76780033810930000000','0,98666666666666700000','3,06800000000000000000','12,55466666666670000000','14,44466666666670000000','0,21566666666666700000','90,03200000000000000000','2,50766666666667000000','1039,88866666667000000000','155,64300000000000000000','0,11600000000000000000','1,15000000000000000000','Tr','','','0,06333333333333330000','0,05000000000000000000','Tr','1,83000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','57','Pastel, de queijo, cru','31,28333333333330000000','308,47443388737400000000','1290,65703138477000000000','9,85339967028300000000','9,63466666666667000000','14,34900000000000000000','45,94793366305030000000','1,10666666666667000000','3,28066666666667000000','154,69800000000000000000','15,80533333333330000000','0,24466666666666700000','168,12333333333300000000','0,99066666666666700000','984,56966666666700000000','102,57833333333300000000','0,09933333333333330000','0,96633333333333300000','Tr','','','0,07333333333333340000','0,03333333333333330000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','58','Pastel, de queijo, frito','17,54100000000000000000','422,11208003931900000000','1766,11694288451000000000','8,70959970855713000000','22,67033333333330000000','15,37633333333330000000','48,13273362477620000000','0,94333333333333300000','2,94633333333333000000','126,12766666666700000000','14,73833333333330000000','0,20066666666666700000','123,80966666666700000000','1,34233333333333000000','821,38233333333300000000','123,75466666666700000000','0,09933333333333330000','0,76233333333333300000','17,58333333333330000000','','','0,09000000000000000000','0,04000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','59','Pastel, massa, crua','27,06600000000000000000','310,20251433333300000000','1297,88731997067000000000','6,90270000000000000000','5,47700000000000000000','NA','57,37963333333330000000','1,41333333333333000000','3,17466666666667000000','12,61400000000000000000','14,43066666666670000000','0,38266666666666700000','72,55100000000000000000','1,05533333333333000000','1344,20133333333000000000','166,68166666666700000000','0,10533333333333300000','0,60733333333333300000','NA','','','0,14666666666666700000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','60','Pastel, massa, frita','0,96900000000000000000','569,67245933333300000000','2383,50956985067000000000','6,01920000000000000000','40,86033333333330000000','NA','49,34313333333330000000','1,30933333333333000000','2,80833333333333000000','11,26566666666670000000','12,74033333333330000000','0,35633333333333300000','62,36233333333330000000','1,44666666666667000000','1174,66700000000000000000','142,55400000000000000000','0,07933333333333330000','0,52166666666666700000','NA','','','0,16333333333333300000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','61','Pipoca, com óleo de soja, sem sal','2,81900000000000000000','448,33426184719800000000','1875,83055156868000000000','9,92708333333334000000','15,94100000000000000000','NA','70,31258333333330000000','14,33666666666670000000','1,00033333333333000000','2,82533333333333000000','90,75733333333340000000','0,65366666666666700000','225,13466666666700000000','1,15733333333333000000','4,32033333333333000000','255,95666666666700000000','0,46066666666666700000','2,04633333333333000000','NA','','','0,03333333333333330000','0,03000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','62','Polenta, pré-cozida','72,74000000000000000000','102,74116666666700000000','429,86904133333300000000','2,29166666666667000000','0,30333333333333300000','NA','23,31166666666670000000','2,40333333333333000000','1,35333333333333000000','1,09400000000000000000','4,42900000000000000000','Tr','16,78600000000000000000','Tr','441,88933333333300000000','99,63700000000000000000','0,04400000000000000000','0,05066666666666670000','NA','','','0,04333333333333330000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Cereais e derivados','63','Torrada, pão francês','9,04700000000000000000','377,42228300000000000000','1579,13483207200000000000','10,52410000000000000000','3,30100000000000000000','NA','74,55590000000000000000','3,39500000000000000000','2,57200000000000000000','18,74466666666670000000','31,59733333333330000000','0,55333333333333300000','113,91666666666700000000','1,23866666666667000000','829,49233333333300000000','189,48933333333300000000','0,16100000000000000000','0,90500000000000000000','NA','','','0,37666666666666700000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','64','Abóbora, cabotian, cozida','86,35400000000000000000','48,04374250000000000000','201,01501862000000000000','1,44375000000000000000','0,72933333333333300000','NA','10,76091666666670000000','2,46266666666667000000','0,71200000000000000000','7,62566666666667000000','9,11100000000000000000','0,26066666666666700000','32,59500000000000000000','0,34533333333333300000','1,45166666666667000000','199,10233333333300000000','0,06133333333333330000','0,28633333333333300000','NA','','','0,07666666666666670000','Tr','0,07000000000000000000','Tr','7,46333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','65','Abóbora, cabotian, crua','88,52000000000000000000','38,59929420289860000000','161,49944694492800000000','1,74637681159420000000','0,53666666666666700000','NA','8,36028985507247000000','2,16666666666667000000','0,83666666666666700000','17,96333333333330000000','8,82000000000000000000','0,11000000000000000000','25,76666666666670000000','0,37333333333333300000','Tr','350,56000000000000000000','0,06000000000000000000','0,32000000000000000000','NA','446,00000000000000000000','223,00000000000000000000','Tr','Tr','0,10000000000000000000','Tr','5,09000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','66','Abóbora, menina brasileira, crua','95,69000000000000000000','13,60567391304350000000','56,92613965217390000000','0,60869565217391300000','Tr','NA','3,30130434782609000000','1,17000000000000000000','0,36000000000000000000','8,74000000000000000000','4,09000000000000000000','0,01000000000000000000','11,62000000000000000000','0,15000000000000000000','Tr','164,60000000000000000000','0,02000000000000000000','Tr','NA','1108,00000000000000000000','554,00000000000000000000','0,07000000000000000000','Tr','0,04000000000000000000','Tr','1,50000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','67','Abóbora, moranga, crua','95,87000000000000000000','12,36443623188400000000','51,73280119420280000000','0,96014492753623200000','0,06000000000000000000','NA','2,66652173913043000000','1,70333333333333000000','0,44333333333333300000','3,04766666666667000000','1,84766666666667000000','0,01000000000000000000','7,91466666666667000000','Tr','Tr','124,86533333333300000000','0,05000000000000000000','0,07000000000000000000','NA','278,00000000000000000000','139,00000000000000000000','Tr','Tr','0,06333333333333330000','Tr','9,64666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','68','Abóbora, moranga, refogada','92,45733333333330000000','29,00382203175620000000','121,35199138086800000000','0,39375000000000000000','0,79900000000000000000','NA','5,98191666666666000000','1,54666666666667000000','0,36800000000000000000','19,08000000000000000000','7,49233333333333000000','0,01600000000000000000','11,65066666666670000000','0,11300000000000000000','3,02766666666667000000','183,19333333333300000000','0,04266666666666670000','0,08266666666666670000','NA','95,33333333333330000000','47,66666666666670000000','0,05333333333333330000','Tr','0,05000000000000000000','Tr','6,72666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','69','Abóbora, pescoço, crua','92,49300000000000000000','24,46626794970040000000','102,36686510154600000000','0,67083333333333300000','0,11600000000000000000','NA','6,12283333333334000000','2,30033333333333000000','0,59733333333333300000','8,80800000000000000000','7,42100000000000000000','0,07133333333333330000','31,61933333333330000000','0,27500000000000000000','0,74500000000000000000','263,87600000000000000000','0,09133333333333330000','0,17666666666666700000','NA','','','Tr','Tr','0,06000000000000000000','Tr','2,09000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','70','Abobrinha, italiana, cozida','95,28233333333330000000','15,03852000000000000000','62,92116768000010000000','1,12500000000000000000','0,19900000000000000000','NA','2,97700000000001000000','1,58800000000000000000','0,41666666666666700000','16,72566666666670000000','16,85966666666670000000','0,10600000000000000000','22,48733333333330000000','0,15966666666666700000','0,83266666666666700000','125,87900000000000000000','0,01233333333333330000','0,25733333333333300000','NA','','','0,05000000000000000000','Tr','0,06000000000000000000','Tr','2,13000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','71','Abobrinha, italiana, crua','93,86333333333340000000','19,27912608695650000000','80,66386354782590000000','1,14130434782609000000','0,14000000000000000000','NA','4,29202898550724000000','1,35333333333333000000','0,56333333333333300000','15,12666666666670000000','19,94666666666670000000','0,09000000000000000000','32,01666666666670000000','0,24333333333333300000','Tr','253,38000000000000000000','0,04666666666666670000','0,16666666666666700000','NA','40,50000000000000000000','20,25000000000000000000','Tr','0,05666666666666670000','0,03000000000000000000','Tr','6,87333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','72','Abobrinha, italiana, refogada','93,49166666666670000000','24,42960218765340000000','102,21345555314200000000','1,06875000000000000000','0,82133333333333300000','NA','4,18691666666666000000','1,38000000000000000000','0,43133333333333300000','20,67200000000000000000','12,66700000000000000000','0,13533333333333300000','31,82833333333330000000','0,35800000000000000000','2,20900000000000000000','193,62666666666700000000','0,02266666666666670000','0,27200000000000000000','NA','41,58333333333330000000','20,79166666666670000000','0,04333333333333330000','Tr','Tr','Tr','7,53000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','73','Abobrinha, paulista, crua','90,85066666666670000000','30,81070222881630000000','128,91197812536800000000','0,63958333333333300000','0,13900000000000000000','NA','7,86742000000000000000','2,60500000000000000000','0,50333000000000000000','18,67000000000000000000','9,39000000000000000000','0,11100000000000000000','32,74566666666670000000','0,17000000000000000000','0,50066666666666700000','212,87133333333300000000','0,09566666666666670000','0,17700000000000000000','NA','','','Tr','Tr','0,03333333333333330000','Tr','17,54666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','74','Acelga, crua','93,18566666666670000000','20,94234249999990000000','87,62276101999980000000','1,44375000000000000000','0,10600000000000000000','NA','4,63091666666666000000','1,12200000000000000000','0,63366666666666700000','42,98500000000000000000','10,39533333333330000000','0,10700000000000000000','40,02600000000000000000','0,26933333333333300000','1,18066666666667000000','239,81666666666700000000','0,10433333333333300000','0,30633333333333300000','NA','','','0,04000000000000000000','Tr','0,15666666666666700000','Tr','22,55000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','75','Agrião, cru','93,94333333333330000000','16,57880144927530000000','69,36570526376800000000','2,68840579710145000000','0,23666666666666700000','NA','2,25159420289854000000','2,13666666666667000000','0,88000000000000000000','132,53000000000000000000','18,16333333333330000000','0,28000000000000000000','50,58666666666670000000','3,10666666666667000000','7,46233333333333000000','217,66000000000000000000','0,10333333333333300000','0,72333333333333300000','NA','458,00000000000000000000','229,00000000000000000000','0,10666666666666700000','0,23000000000000000000','0,09333333333333330000','1,19333333333333000000','60,10000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','76','Aipo, cru','93,82800000000000000000','19,09145664497060000000','79,87865460255710000000','0,75833333333333300000','0,06900000000000000000','NA','4,27233333333334000000','0,95700000000000000000','1,07233333333333000000','65,22466666666670000000','8,86033333333333000000','0,17800000000000000000','28,04566666666670000000','0,72033333333333300000','9,51566666666667000000','273,60366666666700000000','0,31433333333333300000','0,14266666666666700000','NA','916,00000000000000000000','458,00000000000000000000','Tr','Tr','0,18000000000000000000','Tr','5,88000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','77','Alface, americana, crua','97,16866666666660000000','8,79490323686605000000','36,79787514304760000000','0,60833333333333300000','0,12900000000000000000','NA','1,74533333333335000000','1,02166666666667000000','0,34866666666666700000','14,44466666666670000000','5,73666666666667000000','0,11766666666666700000','19,37700000000000000000','0,26666666666666700000','7,30833333333333000000','136,00300000000000000000','0,02166666666666670000','0,22633333333333300000','NA','','','0,03000000000000000000','Tr','0,03666666666666670000','Tr','10,96000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','78','Alface, crespa, crua','96,09333333333330000000','10,68085652173920000000','44,68870368695690000000','1,34782608695652000000','0,16000000000000000000','NA','1,69550724637683000000','1,82666666666667000000','0,70333333333333300000','37,98000000000000000000','10,97000000000000000000','0,20000000000000000000','25,80666666666670000000','0,39666666666666700000','3,38000000000000000000','267,13333333333300000000','0,03000000000000000000','0,25333333333333300000','NA','234,00000000000000000000','117,00000000000000000000','0,11000000000000000000','0,12333333333333300000','Tr','1,09333333333333000000','15,57666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','79','Alface, lisa, crua','95,00000000000000000000','13,82090144927530000000','57,82665166376800000000','1,68840579710145000000','0,12333333333333300000','NA','2,42826086956522000000','2,33000000000000000000','0,76000000000000000000','27,51333333333330000000','9,10666666666667000000','0,33366666666666700000','26,13333333333330000000','0,61000000000000000000','4,23333333333333000000','348,71000000000000000000','0,03333333333333330000','0,34666666666666700000','NA','368,00000000000000000000','184,00000000000000000000','0,08666666666666670000','0,08333333333333330000','0,07000000000000000000','0,75000000000000000000','21,39000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','80','Alface, roxa, crua','95,72833333333330000000','12,71699736346800000000','53,20791696875010000000','0,90625000000000000000','0,19166666666666700000','NA','2,49341666666666000000','2,01333333333333000000','0,68033333333333300000','33,82833333333330000000','9,31100000000000000000','0,11633333333333300000','51,12933333333330000000','2,47700000000000000000','7,12433333333333000000','308,43533333333300000000','0,03666666666666670000','0,23466666666666700000','NA','312,41666666666700000000','156,20833333333300000000','Tr','Tr','Tr','Tr','13,47333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','81','Alfavaca, crua','90,20766666666670000000','29,18361308105790000000','122,10423713114600000000','2,65833333333333000000','0,47633333333333300000','NA','5,24100000000000000000','4,14033333333333000000','1,41666666666667000000','258,49766666666700000000','84,23833333333330000000','0,14533333333333300000','49,74300000000000000000','1,25633333333333000000','4,55033333333333000000','260,71766666666700000000','0,15166666666666700000','0,70600000000000000000','NA','','','Tr','0,12000000000000000000','0,55666666666666700000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','82','Alho, cru','67,54666666666670000000','113,12987826087000000000','473,33541064347800000000','7,01086956521739000000','0,22000000000000000000','NA','23,90579710144930000000','4,32333333333333000000','1,31666666666667000000','13,56000000000000000000','21,29333333333330000000','0,24000000000000000000','149,09000000000000000000','0,80000000000000000000','5,36000000000000000000','534,88666666666700000000','0,15000000000000000000','0,82000000000000000000','NA','','','0,18333333333333300000','Tr','0,44333333333333300000','Tr','*','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','83','Alho-poró, cru','90,95200000000000000000','31,50791935324670000000','131,82913457398400000000','1,41250000000000000000','0,13966666666666700000','NA','6,87816666666667000000','2,50666666666667000000','0,61766666666666700000','33,61633333333330000000','10,69466666666670000000','0,10233333333333300000','36,48633333333330000000','0,64066666666666700000','1,76233333333333000000','224,46633333333300000000','0,28800000000000000000','0,24066666666666700000','NA','16,16666666666670000000','8,08333333333333000000','0,06333333333333330000','Tr','0,08333333333333330000','0,34000000000000000000','14,14666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','84','Almeirão, cru','93,67000000000000000000','18,03442898550720000000','75,45605087536230000000','1,76811594202899000000','0,21666666666666700000','NA','3,33521739130435000000','2,58666666666667000000','1,01000000000000000000','19,49533333333330000000','21,11000000000000000000','0,16666666666666700000','39,66000000000000000000','0,74333333333333300000','2,35066666666667000000','369,12000000000000000000','0,10000000000000000000','0,28666666666666700000','NA','566,00000000000000000000','283,00000000000000000000','0,09666666666666670000','0,17666666666666700000','Tr','0,62666666666666700000','1,68666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','85','Almeirão, refogado','86,54466666666670000000','65,08191082886850000000','272,30271490798600000000','1,70416666666667000000','4,84700000000000000000','NA','5,70149999999999000000','3,42766666666667000000','1,20266666666667000000','63,40366666666670000000','17,28400000000000000000','0,27866666666666700000','30,87166666666670000000','1,55066666666667000000','14,51500000000000000000','315,35566666666700000000','0,05800000000000000000','0,19100000000000000000','NA','','','0,03000000000000000000','0,06000000000000000000','0,04666666666666670000','4,03333333333333000000','1,47000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','86','Batata, baroa, cozida','79,26066666666670000000','80,11976250000000000000','335,22108630000000000000','0,85208333333333300000','0,16633333333333300000','NA','18,94758333333330000000','1,75800000000000000000','0,77333333333333300000','11,85000000000000000000','7,57600000000000000000','0,21800000000000000000','29,47500000000000000000','0,42366666666666700000','2,09800000000000000000','258,32666666666700000000','0,14700000000000000000','0,37866666666666700000','NA','','','0,06000000000000000000','Tr','Tr','1,98000000000000000000','17,10000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','87','Batata, baroa, crua','73,69000000000000000000','100,98492318840600000000','422,52091862029000000000','1,04710144927536000000','0,17000000000000000000','NA','23,98289855072460000000','2,06333333333333000000','1,11000000000000000000','17,12666666666670000000','11,99333333333330000000','0,06666666666666670000','45,20000000000000000000','0,30333333333333300000','Tr','505,18333333333300000000','0,04666666666666670000','0,20333333333333300000','NA','24,50000000000000000000','12,25000000000000000000','0,04666666666666670000','Tr','0,12333333333333300000','Tr','7,55000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','88','Batata, doce, cozida','80,42500000000000000000','76,75961050343520000000','321,16221034637300000000','0,64166666666666700000','0,08766666666666670000','NA','18,42233333333330000000','2,21200000000000000000','0,42333333333333300000','17,15300000000000000000','11,15966666666670000000','0,13933333333333300000','15,39400000000000000000','0,18700000000000000000','2,69900000000000000000','148,44000000000000000000','0,06000000000000000000','0,12333333333333300000','NA','','','0,08333333333333330000','Tr','0,05000000000000000000','2,57333333333333000000','23,78666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','89','Batata, doce, crua','69,51333333333330000000','118,24137536231900000000','494,72191451594200000000','1,25724637681159000000','0,13333333333333300000','NA','28,19608695652170000000','2,57333333333333000000','0,90000000000000000000','21,11000000000000000000','16,89333333333330000000','0,17666666666666700000','36,46000000000000000000','0,38666666666666700000','8,77333333333333000000','340,20333333333300000000','0,11000000000000000000','0,20000000000000000000','NA','','','0,05666666666666670000','Tr','0,10000000000000000000','Tr','16,48000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','90','Batata, frita, tipo chips, industrializada','2,69733333333333000000','542,73467338419000000000','2270,80187343945000000000','5,58333333333333000000','36,61500000000000000000','NA','51,22233333333330000000','2,45566666666667000000','3,88200000000000000000','11,59766666666670000000','24,23933333333330000000','0,23133333333333300000','96,49833333333330000000','0,69566666666666700000','607,39933333333300000000','1014,32500000000000000000','0,12100000000000000000','0,58766666666666700000','NA','','','0,19666666666666700000','Tr','0,13000000000000000000','2,61333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','91','Batata, inglesa, cozida','86,35966666666670000000','51,58847663627070000000','215,84618624615600000000','1,16458333333333000000','Tr','NA','11,94375000000000000000','1,34333333333333000000','0,50600000000000000000','3,52000000000000000000','5,42500000000000000000','0,06633333333333330000','24,34233333333330000000','0,19400000000000000000','2,29366666666667000000','161,33166666666700000000','0,05766666666666670000','0,18766666666666700000','NA','','','0,05000000000000000000','Tr','0,08333333333333330000','Tr','3,76000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','92','Batata, inglesa, crua','82,87000000000000000000','64,37022608695650000000','269,32502594782600000000','1,77173913043478000000','Tr','NA','14,68826086956520000000','1,16333333333333000000','0,64000000000000000000','3,55000000000000000000','14,58000000000000000000','0,10000000000000000000','38,53666666666670000000','0,36000000000000000000','Tr','302,05333333333300000000','0,09333333333333330000','0,24000000000000000000','NA','','','0,10000000000000000000','Tr','0,15000000000000000000','Tr','31,08333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','93','Batata, inglesa, frita','44,12100000000000000000','267,15742250204100000000','1117,78665574854000000000','4,96666666666667000000','13,10866666666670000000','NA','35,64033333333330000000','8,05933333333333000000','2,16333333333333000000','6,27633333333333000000','14,11433333333330000000','0,14766666666666700000','69,66766666666670000000','0,44433333333333300000','1,91300000000000000000','488,94166666666700000000','0,10333333333333300000','0,37600000000000000000','NA','','','0,17333333333333300000','Tr','0,10333333333333300000','2,50666666666667000000','16,34333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','94','Batata, inglesa, sauté','83,09100000000000000000','67,88793615063030000000','284,04312485423700000000','1,29166666666667000000','0,89633333333333300000','NA','14,09300000000000000000','1,37700000000000000000','0,62800000000000000000','4,18100000000000000000','6,45633333333333000000','0,08433333333333330000','31,96800000000000000000','0,25000000000000000000','8,18200000000000000000','199,48166666666700000000','0,05066666666666670000','0,20833333333333300000','NA','','','0,06666666666666670000','Tr','0,09333333333333330000','1,38333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','95','Berinjela, cozida','94,43166666666670000000','18,84528555681310000000','78,84867476970590000000','0,67708333333333300000','0,14833333333333300000','NA','4,46825000000000000000','2,52433333333333000000','0,27466666666666700000','10,77133333333330000000','8,81566666666667000000','0,11100000000000000000','15,02666666666670000000','0,22033333333333300000','1,32500000000000000000','105,48000000000000000000','0,04366666666666670000','0,13233333333333300000','NA','','','0,04000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','96','Berinjela, crua','93,80333333333330000000','19,62775362318840000000','82,12252115942020000000','1,22101449275362000000','0,10000000000000000000','NA','4,42898550724637000000','2,87333333333333000000','0,44666666666666700000','9,22000000000000000000','12,91333333333330000000','0,10000000000000000000','20,46333333333330000000','0,24666666666666700000','Tr','204,54666666666700000000','0,06333333333333330000','0,12000000000000000000','NA','24,00000000000000000000','12,00000000000000000000','0,04333333333333330000','0,04666666666666670000','Tr','Tr','3,01000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','97','Beterraba, cozida','90,57333333333330000000','32,15432433140280000000','134,53369300258900000000','1,29375000000000000000','0,09266666666666670000','NA','7,23491666666666000000','1,87866666666667000000','0,80533333333333300000','15,25533333333330000000','16,54166666666670000000','0,18866666666666700000','30,13066666666670000000','0,23866666666666700000','22,76166666666670000000','245,48333333333300000000','0,03900000000000000000','0,35366666666666700000','NA','','','0,09000000000000000000','Tr','Tr','Tr','1,24000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','98','Beterraba, crua','85,98333333333330000000','48,82850869565220000000','204,29848038260900000000','1,94565217391304000000','0,09000000000000000000','NA','11,11101449275360000000','3,37333333333333000000','0,87000000000000000000','18,11333333333330000000','24,43333333333330000000','1,23000000000000000000','19,38666666666670000000','0,32000000000000000000','9,72000000000000000000','375,07333333333300000000','0,07666666666666670000','0,51666666666666700000','NA','','','0,04000000000000000000','Tr','0,04333333333333330000','Tr','3,11666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','99','Biscoito, polvilho doce','5,43733333333333000000','437,54900000000000000000','1830,70501600000000000000','1,29166666666667000000','12,24900000000000000000','9,38500000000000000000','80,53533333333330000000','1,15900000000000000000','0,48666666666666700000','30,45433333333330000000','5,84500000000000000000','0,08133333333333330000','23,31900000000000000000','1,76633333333333000000','97,80133333333330000000','53,57933333333330000000','0,03500000000000000000','0,14500000000000000000','Tr','','','Tr','0,03000000000000000000','0,06666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','100','Brócolis, cozido','92,61700000000000000000','24,63616311136880000000','103,07770645796700000000','2,13333333333333000000','0,45900000000000000000','NA','4,36666666666666000000','3,41666666666667000000','0,42400000000000000000','50,75400000000000000000','14,54666666666670000000','0,11833333333333300000','33,15933333333330000000','0,53500000000000000000','2,12200000000000000000','118,54333333333300000000','0,07533333333333330000','0,23900000000000000000','NA','','','0,04333333333333330000','0,03000000000000000000','Tr','Tr','42,00333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','101','Brócolis, cru','91,22000000000000000000','25,49513188405800000000','106,67163180289900000000','3,64492753623188000000','0,26666666666666700000','NA','4,02507246376812000000','2,88000000000000000000','0,84333333333333300000','85,87000000000000000000','29,56666666666670000000','0,26000000000000000000','78,46000000000000000000','0,61000000000000000000','3,33333333333333000000','322,11000000000000000000','0,05666666666666670000','0,47666666666666700000','NA','279,33333333333300000000','139,66666666666700000000','0,11666666666666700000','0,18333333333333300000','0,07666666666666670000','1,39000000000000000000','34,28333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','102','Cará, cozido','78,88466666666670000000','77,58491333333340000000','324,61527738666700000000','1,52916666666667000000','0,11233333333333300000','NA','18,85250000000000000000','2,63466666666667000000','0,62133333333333300000','5,16833333333333000000','14,83866666666670000000','0,02166666666666670000','27,80133333333330000000','0,30833333333333300000','1,00633333333333000000','203,25233333333300000000','0,11266666666666700000','0,23766666666666700000','NA','','','0,11666666666666700000','Tr','0,12000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','103','Cará, cru','73,69333333333330000000','95,63313478260870000000','400,12903593043500000000','2,28260869565217000000','0,13666666666666700000','NA','22,95405797101450000000','7,27333333333333000000','0,93333333333333300000','3,91133333333333000000','11,46666666666670000000','0,01000000000000000000','34,72000000000000000000','0,21333333333333300000','Tr','211,66566666666700000000','0,06000000000000000000','0,18000000000000000000','NA','','','0,11333333333333300000','Tr','0,02000000000000000000','Tr','8,78666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','104','Caruru, cru','87,61833333333330000000','34,03162971735000000000','142,38833873739200000000','3,20000000000000000000','0,58500000000000000000','NA','5,97399999999999000000','4,46900000000000000000','2,62266666666667000000','455,30366666666700000000','197,43566666666700000000','0,89433333333333300000','77,26133333333330000000','4,46233333333333000000','13,66500000000000000000','278,97966666666700000000','0,37133333333333300000','6,03400000000000000000','NA','1906,00000000000000000000','953,00000000000000000000','Tr','0,10000000000000000000','0,11000000000000000000','Tr','5,35666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','105','Catalonha, crua','91,76266666666670000000','23,88841225737330000000','99,94911688484990000000','1,86875000000000000000','0,28233333333333300000','NA','4,75224999999999000000','2,04833333333333000000','1,33400000000000000000','56,79533333333330000000','17,29566666666670000000','0,33666666666666700000','32,00133333333330000000','3,07666666666667000000','9,39366666666667000000','411,79233333333300000000','0,27333333333333300000','0,48100000000000000000','NA','','','Tr','0,03000000000000000000','0,36000000000000000000','1,53666666666667000000','7,33333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','106','Catalonha, refogada','87,43266666666670000000','63,44926914882660000000','265,47174211869100000000','1,95000000000000000000','4,80566666666667000000','NA','4,80933333333334000000','3,65000000000000000000','1,00233333333333000000','63,22466666666670000000','16,34566666666670000000','0,63933333333333300000','35,36166666666670000000','1,17633333333333000000','24,71933333333330000000','452,28133333333300000000','0,17833333333333300000','0,44033333333333300000','NA','850,00000000000000000000','425,00000000000000000000','0,04333333333333330000','Tr','0,03000000000000000000','0,60000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','107','Cebola, crua','88,92000000000000000000','39,42004637681160000000','164,93347404058000000000','1,71014492753623000000','0,08000000000000000000','NA','8,85318840579710000000','2,18666666666667000000','0,43666666666666700000','14,00000000000000000000','11,91666667000000000000','0,13000000000000000000','37,86666666666670000000','0,20333333333333300000','0,59666666666666700000','176,11666666666700000000','0,05000000000000000000','0,17333333333333300000','NA','','','0,04333333333333330000','Tr','0,14333333333333300000','Tr','4,66666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','108','Cebolinha, crua','93,88000000000000000000','19,51588550724640000000','81,65446496231910000000','1,86594202898551000000','0,35000000000000000000','NA','3,37072463768116000000','3,55000000000000000000','0,53333333333333300000','79,85333333333330000000','24,59333333333330000000','0,12666666666666700000','26,89000000000000000000','0,64666666666666700000','1,60333333333333000000','206,43666666666700000000','0,04333333333333330000','0,30333333333333300000','NA','134,41666666666700000000','67,20833333333330000000','0,03333333333333330000','0,04333333333333330000','0,08333333333333330000','Tr','31,78000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','109','Cenoura, cozida','91,66300000000000000000','29,86177771015960000000','124,94167793930800000000','0,84791666666666700000','0,21833333333333300000','NA','6,68674999999999000000','2,62900000000000000000','0,58400000000000000000','25,61700000000000000000','14,47533333333330000000','0,04500000000000000000','26,74400000000000000000','0,09366666666666670000','7,88100000000000000000','175,50900000000000000000','0,01500000000000000000','0,23200000000000000000','NA','612,00000000000000000000','306,00000000000000000000','0,07000000000000000000','Tr','0,06000000000000000000','2,68333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','110','Cenoura, crua','90,08333333333330000000','34,13538840579710000000','142,82246508985500000000','1,32246376811594000000','0,17333333333333300000','NA','7,66000000000000000000','3,18333333333333000000','0,86666666666666700000','22,54000000000000000000','11,22666666666670000000','0,05000000000000000000','27,85000000000000000000','0,18333333333333300000','3,33333333333333000000','314,81333333333300000000','0,04666666666666670000','0,22333333333333300000','NA','1326,00000000000000000000','663,00000000000000000000','Tr','Tr','0,05000000000000000000','Tr','5,11666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','111','Chicória, crua','95,13666666666670000000','13,83712028985510000000','57,89451129275370000000','1,13768115942029000000','0,14333333333333300000','NA','2,85333333333334000000','2,20000000000000000000','0,82000000000000000000','44,82666666666670000000','14,13666666666670000000','0,13333333333333300000','13,37766666666670000000','0,45333333333333300000','13,52233333333330000000','424,89666666666700000000','0,04000000000000000000','0,09033333333333330000','NA','','','0,03000000000000000000','0,10333333333333300000','Tr','0,68333333333333300000','6,54333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','112','Chuchu, cozido','94,56166666666670000000','18,53979053137700000000','77,57048358328140000000','0,41458333333333300000','Tr','NA','4,79341666666667000000','1,03966666666667000000','0,18066666666666700000','7,82733333333333000000','6,93200000000000000000','0,06533333333333330000','12,80500000000000000000','0,06200000000000000000','1,80733333333333000000','54,35266666666670000000','Tr','0,09333333333333330000','NA','','','0,03000000000000000000','Tr','Tr','Tr','5,56666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','113','Chuchu, cru','94,83666666666670000000','16,97891884057970000000','71,03979642898560000000','0,69927536231884100000','0,06000000000000000000','NA','4,13739130434783000000','1,28000000000000000000','0,26666666666666700000','11,50666666666670000000','7,22666666666667000000','0,08000000000000000000','17,74333333333330000000','0,17000000000000000000','Tr','125,99000000000000000000','0,03000000000000000000','0,10333333333333300000','NA',' ',' ','Tr','Tr','Tr','Tr','10,61333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','114','Coentro, folhas desidratadas','10,63000000000000000000','309,07074680447600000000','1293,15200462993000000000','20,87500000000000000000','10,38666666666670000000','NA','47,95500000000000000000','37,29000000000000000000','10,15333333333330000000','783,81366666666700000000','392,78833333333300000000','10,47966666666670000000','388,06366666666700000000','81,43133333333340000000','18,25533333333330000000','3222,76566666667000000000','4,09333333333333000000','4,70066666666667000000','NA','','','0,09666666666666670000','0,11333333333333300000','0,09333333333333330000','Tr','40,77333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','115','Couve, manteiga, crua','90,90000000000000000000','27,05669710144930000000','113,20522067246400000000','2,87318840579710000000','0,54666666666666700000','NA','4,33347826086956000000','3,12000000000000000000','1,34666666666667000000','130,86600000000000000000','34,65666666666670000000','1,01666666666667000000','48,66700000000000000000','0,45366666666666700000','6,17100000000000000000','403,44666666666700000000','0,06000000000000000000','0,39666666666666700000','NA','496,00000000000000000000','248,00000000000000000000','0,20000000000000000000','0,31000000000000000000','0,06333333333333330000','2,29000000000000000000','96,68333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','116','Couve, manteiga, refogada ','81,52733333333330000000','90,34481542611120000000','378,00270774284900000000','1,66666666666667000000','6,59400000000000000000','NA','8,70766666666667000000','5,73633333333333000000','1,50433333333333000000','177,33233333333300000000','26,20466666666670000000','0,12333333333333300000','33,40666666666670000000','0,49533333333333300000','11,44666666666670000000','314,88900000000000000000','0,02033333333333330000','0,19366666666666700000','NA','384,00000000000000000000','192,00000000000000000000','Tr','0,05000000000000000000','0,07000000000000000000','Tr','76,94333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','117','Couve-flor, crua','92,77000000000000000000','22,56334927536230000000','94,40505336811580000000','1,90579710144928000000','0,21333333333333300000','NA','4,51753623188406000000','2,35000000000000000000','0,59333333333333300000','17,82000000000000000000','11,99333333333330000000','0,16000000000000000000','57,08000000000000000000','0,53333333333333300000','3,43666666666667000000','256,01333333333300000000','0,03000000000000000000','0,31333333333333300000','NA','2,00000000000000000000','1,00000000000000000000','0,03000000000000000000','0,09333333333333330000','0,10000000000000000000','Tr','36,05000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','118','Couve-flor, cozida','94,33833333333330000000','19,11414061472820000000','79,97356433202270000000','1,23958333333333000000','0,26933333333333300000','NA','3,87541666666668000000','2,13033333333333000000','0,27733333333333300000','16,14433333333330000000','5,44466666666667000000','0,10200000000000000000','25,43166666666670000000','0,13033333333333300000','1,78766666666667000000','80,49200000000000000000','Tr','0,25900000000000000000','NA','','','0,03666666666666670000','Tr','Tr','Tr','23,69666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','119','Espinafre, Nova Zelândia, cru','94,03000000000000000000','16,09569420289850000000','67,34438454492740000000','1,99637681159420000000','0,24333333333333300000','NA','2,57362318840580000000','2,10000000000000000000','1,15666666666667000000','97,50666666666670000000','81,64333333333330000000','0,71000000000000000000','25,43333333333330000000','0,35733333333333300000','17,09483333333330000000','336,00666666666700000000','0,06000000000000000000','0,27333333333333300000','NA','484,00000000000000000000','242,00000000000000000000','0,09666666666666670000','0,20666666666666700000','0,06000000000000000000','Tr','2,42000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','120','Espinafre, Nova Zelândia, refogado','86,57300000000000000000','67,25365175066400000000','281,38927892477800000000','2,71875000000000000000','5,43466666666667000000','NA','4,23858333333334000000','2,51833333333333000000','1,03500000000000000000','112,38233333333300000000','122,71233333333300000000','0,61333333333333300000','33,50566666666670000000','0,64933333333333300000','47,02433333333330000000','149,22566666666700000000','0,03666666666666670000','0,59266666666666700000','NA','623,83333333333300000000','311,91666666666700000000','0,08333333333333330000','0,12666666666666700000','0,13333333333333300000','Tr','5,26666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','121','Farinha, de mandioca, crua','9,38666666666667000000','360,86969855072500000000','1509,87881873623000000000','1,55434782608696000000','0,27666666666666700000','NA','87,89898550724640000000','6,39000000000000000000','0,88333333333333300000','64,87333333333330000000','37,00000000000000000000','Tr','41,61000000000000000000','1,09333333333333000000','1,02333333333333000000','340,13000000000000000000','0,08000000000000000000','0,39333333333333300000','NA','','','0,13666666666666700000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','122','Farinha, de mandioca, torrada','8,34000000000000000000','365,26897500000000000000','1528,28539140000000000000','1,22916666666667000000','0,28666666666666700000','NA','89,19416666666670000000','6,54000000000000000000','0,95000000000000000000','75,52733333333330000000','40,01266666666670000000','0,36633333333333300000','38,62600000000000000000','1,19366666666667000000','10,31000000000000000000','327,73500000000000000000','Tr','0,36000000000000000000','NA','','','Tr','Tr','0,80666666666666700000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','123','Farinha, de puba','9,80100000000000000000','360,17977487993200000000','1506,99217809764000000000','1,61666666666667000000','0,46900000000000000000','NA','87,28533333333340000000','4,24000000000000000000','0,82800000000000000000','41,39566666666670000000','27,48666666666670000000','0,16266666666666700000','32,63966666666670000000','1,43300000000000000000','3,60766666666667000000','337,76433333333300000000','0,06966666666666670000','0,33700000000000000000','NA','','','0,09333333333333330000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','124','Fécula, de mandioca','17,76666666666670000000','330,85055833333300000000','1384,27873606667000000000','0,52083333333333300000','0,28333333333333300000','NA','81,14916666666670000000','0,64666666666666700000','0,28000000000000000000','11,88900000000000000000','3,01700000000000000000','Tr','60,38500000000000000000','0,10700000000000000000','2,44900000000000000000','48,12700000000000000000','Tr','Tr','NA','','','0,03000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','125','Feijão, broto, cru','87,48133333333330000000','38,72323637541130000000','162,01802099472100000000','4,16666666666667000000','0,10266666666666700000','NA','7,75833333333333000000','1,96600000000000000000','0,49100000000000000000','14,48266666666670000000','25,12600000000000000000','0,18700000000000000000','74,75233333333330000000','0,82033333333333400000','1,79300000000000000000','189,21533333333300000000','0,17233333333333300000','0,57133333333333300000','NA','','','Tr','0,03666666666666670000','0,14666666666666700000','Tr','12,00000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','126','Inhame, cru','73,31333333333330000000','96,69983188405800000000','404,59209660289800000000','2,05072463768116000000','0,21333333333333300000','NA','23,23260869565220000000','1,65333333333333000000','1,19000000000000000000','11,79666666666670000000','28,76333333333330000000','0,15333333333333300000','64,72333333333330000000','0,36000000000000000000','Tr','567,74333333333300000000','0,17000000000000000000','0,30000000000000000000','NA','','','0,08000000000000000000','Tr','0,10666666666666700000','Tr','5,62333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','127','Jiló, cru','91,63000000000000000000','27,36514347826090000000','114,49576031304300000000','1,40217391304348000000','0,22000000000000000000','NA','6,19115942028986000000','4,82666666666667000000','0,55666666666666700000','19,97000000000000000000','20,62666666666670000000','0,14000000000000000000','29,02000000000000000000','0,33666666666666700000','Tr','212,95000000000000000000','0,07000000000000000000','0,14000000000000000000','NA','12,66666666666670000000','6,33333333333333000000','0,07000000000000000000','0,04000000000000000000','Tr','Tr','6,79333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','128','Jurubeba, crua','66,63533333333330000000','125,81163500000000000000','526,39588084000000000000','4,41250000000000000000','3,90966666666667000000','NA','23,05916666666670000000','23,92133333333330000000','1,98333333333333000000','151,01700000000000000000','65,32300000000000000000','0,52200000000000000000','155,12266666666700000000','0,94600000000000000000','0,77100000000000000000','619,39700000000000000000','1,16200000000000000000','0,63366666666666700000','NA','','','0,13000000000000000000','0,02000000000000000000','0,20333333333333300000','Tr','13,83333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','129','Mandioca, cozida','68,68666666666670000000','125,35825000000000000000','524,49891800000000000000','0,57500000000000000000','0,29833333333333300000','NA','30,09000000000000000000','1,55666666666667000000','0,35000000000000000000','18,62833333333330000000','26,81566666666670000000','0,06366666666666670000','22,41033333333330000000','0,07466666666666670000','0,90666666666666700000','100,36233333333300000000','0,01400000000000000000','0,17433333333333300000','NA','','','0,06000000000000000000','Tr','0,03000000000000000000','Tr','11,06666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','130','Mandioca, crua','61,84333333333330000000','151,41695652173900000000','633,52854608695600000000','1,13043478260870000000','0,30000000000000000000','NA','36,16956521739130000000','1,87666666666667000000','0,55666666666666700000','15,19000000000000000000','44,49666666666670000000','0,05000000000000000000','29,42666666666670000000','0,27000000000000000000','2,15000000000000000000','208,06000000000000000000','0,06666666666666670000','0,20333333333333300000','NA','','','Tr','Tr','0,04000000000000000000','Tr','16,52666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','131','Mandioca, farofa, temperada','6,42000000000000000000','405,69394166666700000000','1697,42345193333000000000','2,06250000000000000000','9,12000000000000000000','NA','80,30416666666670000000','7,81666666666667000000','2,09333333333333000000','65,69233333333330000000','34,33566666666670000000','0,28900000000000000000','44,51566666666670000000','1,35633333333333000000','574,50800000000000000000','201,37666666666700000000','Tr','0,17200000000000000000','NA','','','0,10000000000000000000','Tr','0,15333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','132','Mandioca, frita','36,56566666666670000000','300,05524338914900000000','1255,43113834020000000000','1,38125000000000000000','11,19500000000000000000','NA','50,25141666666670000000','1,87000000000000000000','0,60666666666666700000','23,05333333333330000000','94,86666666666670000000','0,18166666666666700000','56,54366666666670000000','0,32033333333333300000','8,93600000000000000000','176,06400000000000000000','0,12100000000000000000','0,43700000000000000000','NA','','','0,05333333333333330000','Tr','0,03666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','133','Manjericão, cru','92,95666666666670000000','21,14767681159420000000','88,48187977971020000000','1,98550724637681000000','0,39333333333333300000','NA','3,64449275362319000000','3,30666666666667000000','1,02000000000000000000','210,91666666666700000000','57,81333333333330000000','0,17333333333333300000','39,92333333333330000000','0,97333333333333300000','3,88666666666667000000','251,54666666666700000000','0,16333333333333300000','0,46333333333333300000','NA','1034,83333333333000000000','517,41666666666700000000','0,06000000000000000000','0,21000000000000000000','0,06000000000000000000','0,89666666666666700000','2,33666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','134','Maxixe, cru','95,06000000000000000000','13,74723608695650000000','57,51843578782610000000','1,39130434782609000000','0,07300000000000000000','NA','2,72869565217391000000','2,19300000000000000000','0,74700000000000000000','20,86700000000000000000','9,61300000000000000000','0,07000000000000000000','24,98300000000000000000','0,35000000000000000000','10,99300000000000000000','327,69700000000000000000','0,02000000000000000000','0,18000000000000000000','NA','5,50000000000000000000','2,75000000000000000000','0,05700000000000000000','0,02000000000000000000','0,04000000000000000000','Tr','9,63300000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','135','Mostarda, folha, crua','93,43000000000000000000','18,10738905217250000000','75,76131579428970000000','2,11041666666667000000','0,16766666666666700000','NA','3,23658333333333000000','1,89100000000000000000','1,05533333333333000000','68,17833333333330000000','15,61833333333330000000','0,13866666666666700000','58,39833333333330000000','1,09700000000000000000','2,87933333333333000000','363,56633333333300000000','0,04833333333333330000','0,28400000000000000000','NA','','','0,04666666666666670000','0,04000000000000000000','0,05000000000000000000','Tr','38,55333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','136','Nhoque, batata, cozido','54,95400000000000000000','180,77527399341300000000','756,36374638843800000000','5,85833333333333000000','1,94333333333333000000','15,07766666666670000000','36,78000000000000000000','1,78000000000000000000','0,46433333333333300000','11,42133333333330000000','17,89800000000000000000','0,29800000000000000000','68,37233333333330000000','1,64966666666667000000','7,06800000000000000000','163,70033333333300000000','0,10366666666666700000','0,48033333333333300000','15,47333333333330000000','','','0,07666666666666670000','Tr','0,03666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','137','Nabo, cru','93,84333333333330000000','18,18662463768120000000','76,09283748405820000000','1,20289855072464000000','0,05333333333333330000','NA','4,14710144927538000000','2,64333333333333000000','0,75333333333333300000','42,39333333333330000000','14,60000000000000000000','4,41666666666667000000','16,56666666666670000000','0,22333333333333300000','2,46000000000000000000','279,65333333333300000000','0,02000000000000000000','0,19000000000000000000','NA','','','0,06666666666666670000','Tr','0,03000000000000000000','Tr','9,55000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','138','Palmito, juçara, em conserva','91,36666666666670000000','23,19971643408130000000','97,06761356019640000000','1,79166666666667000000','0,40333333333333300000','NA','4,32833333333333000000','3,15000000000000000000','2,11000000000000000000','58,28900000000000000000','33,70266666666670000000','10,81900000000000000000','40,26466666666670000000','0,30333333333333300000','513,82033333333300000000','243,96933333333300000000','0,22733333333333300000','0,73166666666666700000','NA','','','0,06000000000000000000','0,04000000000000000000','Tr','Tr','1,98000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','139','Palmito, pupunha, em conserva','89,44400000000000000000','29,43196333333330000000','123,14333458666700000000','2,45833333333333000000','0,45000000000000000000','NA','5,50900000000000000000','2,55000000000000000000','2,13866666666667000000','32,43900000000000000000','25,49233333333330000000','0,14133333333333300000','54,96200000000000000000','0,17766666666666700000','562,68533333333300000000','206,41600000000000000000','0,07966666666666670000','0,35600000000000000000','NA','','','0,03000000000000000000','Tr','Tr','Tr','8,66333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','140','Pão, de queijo, assado','33,73600000000000000000','363,07791333333300000000','1519,11798938667000000000','5,12083333333333000000','24,56733333333330000000','67,72666666666670000000','34,24150000000000000000','0,55833333333333300000','2,33433333333333000000','102,49366666666700000000','8,23900000000000000000','0,03266666666666670000','93,73666666666670000000','0,27666666666666700000','773,49333333333300000000','93,09300000000000000000','0,00566666666666667000','0,63000000000000000000','61,31000000000000000000','','','0,03666666666666670000','0,09666666666666670000','0,03666666666666670000','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','141','Pão, de queijo, cru','41,83700000000000000000','294,53800000000000000000','1232,34699200000000000000','3,64800000000000000000','13,98866666666670000000','63,05433333333330000000','38,51200000000000000000','0,97633333333333300000','2,01433333333333000000','87,56366666666670000000','6,82566666666667000000','Tr','78,84266666666670000000','0,28766666666666700000','404,99400000000000000000','58,08033333333330000000','Tr','0,42666666666666700000','47,50333333333330000000','','','Tr','0,07666666666666670000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','142','Pepino, cru','96,78666666666670000000','9,53369130434782000000','39,88896441739130000000','0,86956521739130400000','Tr','NA','2,03710144927535000000','1,12000000000000000000','0,29000000000000000000','9,61666666666667000000','9,34000000000000000000','0,08333333333333330000','12,32333333333330000000','0,14666666666666700000','Tr','153,69333333333300000000','0,03666666666666670000','0,12666666666666700000','NA','3,58333333333333000000','1,79166666666667000000','Tr','0,03000000000000000000','Tr','Tr','4,98666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','143','Pimentão, amarelo, cru','91,87666666666670000000','27,92745942028980000000','116,84849021449300000000','1,22463768115942000000','0,43666666666666700000','NA','5,96202898550725000000','1,92000000000000000000','0,50000000000000000000','9,61000000000000000000','10,90000000000000000000','0,08333333333333330000','22,38333333333330000000','0,41333333333333300000','Tr','221,33333333333300000000','0,04000000000000000000','0,15000000000000000000','NA','40,00000000000000000000','20,00000000000000000000','0,04000000000000000000','0,03000000000000000000','0,06000000000000000000','Tr','201,36000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','144','Pimentão, verde, cru','93,52000000000000000000','21,28588115942030000000','89,06012677101450000000','1,05072463768116000000','0,15000000000000000000','NA','4,89260869565218000000','2,56333333333333000000','0,38666666666666700000','8,76333333333333000000','7,79000000000000000000','0,14333333333333300000','16,51333333333330000000','0,41000000000000000000','Tr','174,33000000000000000000','0,07000000000000000000','0,14000000000000000000','NA','46,00000000000000000000','23,00000000000000000000','Tr','Tr','Tr','Tr','100,21000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','145','Pimentão, vermelho, cru','92,90333333333330000000','23,28136376811600000000','97,40922600579740000000','1,03985507246377000000','0,14666666666666700000','NA','5,46681159420291000000','1,59333333333333000000','0,44333333333333300000','6,37000000000000000000','11,13000000000000000000','0,06333333333333330000','19,96000000000000000000','0,33333333333333300000','Tr','210,91666666666700000000','0,04333333333333330000','0,15333333333333300000','NA','86,00000000000000000000','43,00000000000000000000','0,04666666666666670000','0,05666666666666670000','0,02000000000000000000','Tr','158,21000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','146','Polvilho, doce','12,58333333333330000000','351,22673333333300000000','1469,53265226667000000000','0,43000000000000000000','Tr','NA','86,77333333333330000000','0,23666666666666700000','0,17333333333333300000','27,41333333333330000000','4,10000000000000000000','0,08766666666666670000','8,38000000000000000000','0,51000000000000000000','1,57666666666667000000','37,63333333333330000000','Tr','Tr','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','147','Quiabo, cru','90,57533333333330000000','29,93926215006910000000','125,26587283588900000000','1,91875000000000000000','0,29900000000000000000','NA','6,37391666666667000000','4,55333333333333000000','0,83300000000000000000','112,15966666666700000000','49,96900000000000000000','0,46400000000000000000','55,82500000000000000000','0,36900000000000000000','0,89100000000000000000','248,80433333333300000000','0,16666666666666700000','0,58900000000000000000','NA','49,30555555555560000000','24,65277777777780000000','0,10333333333333300000','Tr','0,03000000000000000000','Tr','5,59666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','148','Rabanete, cru','95,06333333333330000000','13,73812608695650000000','57,48031954782600000000','1,39130434782609000000','0,07333333333333340000','NA','2,72536231884058000000','2,19333333333333000000','0,74666666666666700000','20,86666666666670000000','9,61333333333333000000','0,07000000000000000000','24,98333333333330000000','0,35000000000000000000','10,99333333333330000000','327,69666666666700000000','0,02000000000000000000','0,18000000000000000000','NA','','','0,05666666666666670000','0,02000000000000000000','0,04000000000000000000','Tr','9,63333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','149','Repolho, branco, cru','94,72000000000000000000','17,11880289855070000000','71,62507132753620000000','0,87681159420289800000','0,14333333333333300000','NA','3,85985507246377000000','1,89000000000000000000','0,40000000000000000000','34,54666666666670000000','8,51333333333333000000','0,12666666666666700000','14,20000000000000000000','0,15000000000000000000','3,64333333333333000000','150,09000000000000000000','0,01666666666666670000','0,15000000000000000000','NA','6,00000000000000000000','3,00000000000000000000','Tr','0,03000000000000000000','0,05666666666666670000','Tr','18,71666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','150','Repolho, roxo, cru','90,08433333333330000000','30,90750295432410000000','129,31699236089200000000','1,90833333333333000000','0,06366666666666670000','NA','7,20400000000000000000','1,97333333333333000000','0,73966666666666700000','43,67033333333330000000','18,02433333333330000000','0,25266666666666700000','57,71233333333330000000','0,51633333333333300000','2,33766666666667000000','328,06866666666700000000','0,90166666666666700000','0,25466666666666700000','NA','','','0,07000000000000000000','Tr','0,09333333333333330000','Tr','43,20000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','151','Repolho, roxo, refogado','88,69900000000000000000','41,77352528971430000000','174,78042981216500000000','1,80208333333333000000','1,24033333333333000000','NA','7,56158333333333000000','1,75000000000000000000','0,69700000000000000000','42,58800000000000000000','17,24800000000000000000','0,26100000000000000000','59,38300000000000000000','0,46633333333333300000','3,41666666666667000000','321,45300000000000000000','0,02233333333333330000','0,25633333333333300000','NA','','','0,06666666666666670000','Tr','0,07333333333333340000','0,62600000000000000000','40,52000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','152','Rúcula, crua','94,81566666666670000000','13,13325660729410000000','54,94954564491840000000','1,76666666666667000000','0,10733333333333300000','NA','2,21966666666666000000','1,74000000000000000000','1,09066666666667000000','116,56333333333300000000','17,79066666666670000000','0,23566666666666700000','25,16566666666670000000','0,93900000000000000000','9,41800000000000000000','233,40033333333300000000','0,04100000000000000000','0,22866666666666700000','NA','532,75000000000000000000','266,37500000000000000000','0,04333333333333330000','Tr','Tr','0,35000000000000000000','46,29333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','153','Salsa, crua','88,65000000000000000000','33,42411159420290000000','139,84648291014500000000','3,25724637681159000000','0,61000000000000000000','NA','5,70608695652174000000','1,85000000000000000000','1,77666666666667000000','179,41333333333300000000','20,89666666700000000000','1,87666666666667000000','49,35000000000000000000','3,18000000000000000000','2,30000000000000000000','711,29666666666700000000','0,20000000000000000000','1,32333333333333000000','NA','1743,25000000000000000000','871,62500000000000000000','0,11666666666666700000','0,15000000000000000000','0,46666666666666700000','0,72000000000000000000','51,69333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','154','Seleta de legumes, enlatada','82,14666666666670000000','56,53377246376820000000','236,53730398840600000000','3,42028985507246000000','0,35333333333333300000','NA','12,66971014492750000000','3,09000000000000000000','1,41000000000000000000','16,15666666666670000000','15,61333333333330000000','0,13100000000000000000','49,03333333333330000000','1,06000000000000000000','398,13666666666700000000','122,21333333333300000000','0,08333333333333330000','0,52666666666666700000','NA','244,16666666666700000000','122,08333333333300000000','0,03000000000000000000','Tr','Tr','3,71666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','155','Serralha, crua','90,24833333333330000000','30,39793416666660000000','127,18495655333300000000','2,67291666666667000000','0,74266666666666700000','NA','4,94675000000000000000','3,51850000000000000000','1,38933333333333000000','126,02366666666700000000','29,55166666666670000000','0,23000000000000000000','48,25600000000000000000','1,26933333333333000000','19,34700000000000000000','265,26633333333300000000','0,20266666666666700000','1,33166666666667000000','NA','1134,00000000000000000000','567,00000000000000000000','Tr','0,11333333333333300000','0,08000000000000000000','Tr','1,51000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','156','Taioba, crua','89,24300000000000000000','34,20891833333330000000','143,13011430666700000000','2,89583333333333000000','0,92666666666666700000','NA','5,43049999999999000000','4,45366666666667000000','1,50400000000000000000','141,08700000000000000000','37,92266666666670000000','0,66166666666666700000','52,76333333333330000000','1,90666666666667000000','1,16066666666667000000','290,31966666666700000000','0,15866666666666700000','0,60633333333333300000','NA','1160,00000000000000000000','580,00000000000000000000','Tr','0,10333333333333300000','0,09666666666666670000','Tr','17,94000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','157','Tomate, com semente, cru','95,12666666666670000000','15,33515652173920000000','64,16229488695670000000','1,09782608695652000000','0,17333333333333300000','NA','3,13884057971015000000','1,17333333333333000000','0,46333333333333300000','6,94000000000000000000','10,54000000000000000000','0,06666666666666670000','20,19333333333330000000','0,23666666666666700000','1,02000000000000000000','222,38666666666700000000','0,03666666666666670000','0,13666666666666700000','NA','54,00000000000000000000','27,00000000000000000000','0,11666666666666700000','Tr','0,02333333333333330000','Tr','21,21333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','158','Tomate, extrato','79,66330000000000000000','60,93343365217390000000','254,94548640069600000000','2,43478260869565000000','0,19000000000000000000','NA','14,95861739130430000000','2,80333000000000000000','2,75330000000000000000','29,07660000000000000000','29,32660000000000000000','0,17700000000000000000','47,15666666666670000000','2,09333333333333000000','497,93333333333300000000','679,91000000000000000000','0,20333333333333300000','0,36666666666666700000','NA','166,00000000000000000000','83,00000000000000000000','Tr','Tr','0,11000000000000000000','2,42000000000000000000','18,01000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','159','Tomate, molho industrializado','88,13666666666670000000','38,44654946049060000000','160,86036294269300000000','1,37500000000000000000','0,90333333333333300000','NA','7,71166666666668000000','3,11666666666667000000','1,87333333333333000000','11,72933333333330000000','16,78933333333330000000','0,08266666666666670000','27,21033333333330000000','1,57733333333333000000','418,28066666666700000000','388,19500000000000000000','0,07766666666666670000','0,12900000000000000000','NA','76,00000000000000000000','38,00000000000000000000','Tr','Tr','0,06333333333333330000','Tr','2,70666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','160','Tomate, purê','90,79333333333330000000','27,93687971014490000000','116,88790470724600000000','1,36231884057971000000','Tr','NA','6,89434782608695000000','1,02666666666667000000','0,95000000000000000000','13,24333333333330000000','15,43666666666670000000',' ','30,01000000000000000000','1,25000000000000000000','103,93000000000000000000','308,24333333333300000000','0,09333333333333330000','0,33333333333333300000','NA','90,00000000000000000000','45,00000000000000000000','Tr','Tr','0,07000000000000000000','1,18000000000000000000','5,38333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','161','Tomate, salada','93,63200000000000000000','20,54690916666660000000','85,96826795333320000000','0,81041666666666700000','Tr','NA','5,11791666666666000000','2,26833333333333000000','0,40400000000000000000','6,94633333333333000000','9,50366666666667000000','0,04400000000000000000','23,37766666666670000000','0,29033333333333300000','5,24300000000000000000','161,15500000000000000000','0,07200000000000000000','0,17300000000000000000','NA','','','0,05733333333333330000','0,04233333333333330000','0,05000000000000000000','Tr','12,80400000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Verduras, hortaliças e derivados','162','Vagem, crua','92,16666666666670000000','24,89835797101450000000','104,17472975072500000000','1,78623188405797000000','0,17333333333333300000','NA','5,34710144927536000000','2,38333333333333000000','0,52666666666666700000','41,10000000000000000000','17,83333333333330000000','0,50000000000000000000','27,99000000000000000000','0,43000000000000000000','Tr','208,20333333333300000000','0,05666666666666670000','0,33000000000000000000','NA','32,08333333333330000000','16,04166666666670000000','Tr','0,08000000000000000000','Tr','Tr','1,15333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','163','Abacate, cru','83,78666666666670000000','96,15470869565220000000','402,31130118260900000000','1,23913043478261000000','8,39666666666667000000','NA','6,03086956521740000000','6,31333333333333000000','0,54666666666666700000','7,91666666666667000000','14,68333333333330000000','0,17333333333333300000','21,95333333333330000000','0,20666666666666700000','Tr','206,25666666666700000000','0,14666666666666700000','0,21666666666666700000','NA','','','Tr','0,04333333333333330000','Tr','Tr','8,66000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','164','Abacaxi, cru','86,31666666666670000000','48,32221304347820000000','202,18013937391300000000','0,85869565217391300000','0,12333333333333300000','NA','12,33463768115940000000','0,98666666666666700000','0,36666666666666700000','22,43333333333330000000','18,44000000000000000000','1,62333333333333000000','12,78000000000000000000','0,25666666666666700000','Tr','131,34000000000000000000','0,10666666666666700000','0,14333333333333300000','NA','','','0,17333333333333300000','0,02000000000000000000','Tr','Tr','34,62333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','165','Abacaxi, polpa, congelada','91,29466666666670000000','30,59179919433590000000','127,99608782910200000000','0,46666666666666700000','0,11333333333333300000','NA','7,79866666666666000000','0,32666666666666700000','0,32666666666666700000','13,53800000000000000000','10,07133333333330000000','1,02066666666667000000','7,62600000000000000000','0,35733333333333300000','1,23633333333333000000','106,68433333333300000000','0,03900000000000000000','0,06033333333333330000','NA','2,25555555555556000000','1,12777777777778000000','0,04666666666666670000','Tr','Tr','Tr','1,24666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','166','Abiu, cru','83,14433333333330000000','62,42409840854010000000','261,18242774133200000000','0,83333333333333300000','0,70333333333333300000','NA','14,92700000000000000000','1,69600000000000000000','0,39200000000000000000','5,78000000000000000000','9,29633333333334000000','0,08033333333333330000','20,28833333333330000000','0,15866666666666700000','Tr','128,33900000000000000000','0,09300000000000000000','0,09866666666666670000','NA','','','Tr','0,03666666666666670000','0,05000000000000000000','Tr','10,28333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','167','Açaí, polpa, com xarope de guaraná e glucose','73,87866666666670000000','110,29759000000000000000','461,48511656000000000000','0,72083333333333300000','3,66033333333333000000','NA','21,45516666666670000000','1,72333333333333000000','0,28500000000000000000','22,15900000000000000000','12,72633333333330000000','3,28566666666667000000','10,79233333333330000000','0,26833333333333300000','15,09866666666670000000','75,49433333333330000000','0,13966666666666700000','0,19400000000000000000','NA','','','Tr','Tr','0,07333333333333340000','Tr','10,27000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','168','Açaí, polpa, congelada','88,70033333333330000000','58,04536887282130000000','242,86182336388400000000','0,79791666666666700000','3,94433333333333000000','NA','6,20841666666667000000','2,55333333333333000000','0,34900000000000000000','35,18000000000000000000','17,04000000000000000000','6,16000000000000000000','16,42833333333330000000','0,43233333333333300000','5,17700000000000000000','123,61666666666700000000','0,18266666666666700000','0,26533333333333300000','NA','','','Tr','0,04000000000000000000','0,07000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','169','Acerola, crua','90,53066666666670000000','33,46227000000000000000','140,00613768000000000000','0,90625000000000000000','0,20766666666666700000','NA','7,96641666666667000000','1,51133333333333000000','0,38900000000000000000','12,55233333333330000000','13,13333333333330000000','0,07266666666666670000','9,23700000000000000000','0,22200000000000000000','Tr','164,98866666666700000000','0,06700000000000000000','0,14533333333333300000','NA','247,00000000000000000000','123,50000000000000000000','Tr','0,04100000000000000000','Tr','1,38333333333333000000','941,36966666666700000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','170','Acerola, polpa, congelada','93,60966666666670000000','21,93680000000000000000','91,78357119999990000000','0,59166666666666700000','Tr','NA','5,54133333333333000000','0,70333333333333300000','0,25733333333333300000','7,59333333333333000000','8,65800000000000000000','0,03366666666666670000','12,85700000000000000000','0,16733333333333300000','1,28000000000000000000','111,98566666666700000000','0,03933333333333330000','0,07266666666666670000','NA','192,00000000000000000000','96,00000000000000000000','Tr','0,09600000000000000000','Tr','Tr','623,23933333333300000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','171','Ameixa, calda, enlatada ','52,17400000000000000000','182,84662000000000000000','765,03025808000000000000','0,40833333333333300000','Tr','NA','46,89266666666670000000','0,51700000000000000000','0,52500000000000000000','13,15100000000000000000','9,96433333333333000000','0,10333333333333300000','20,93700000000000000000','2,15333333333333000000','2,70433333333333000000','221,19300000000000000000','0,02700000000000000000','0,13633333333333300000','NA','','','Tr','0,23300000000000000000','0,37000000000000000000','Tr','4,26966666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','172','Ameixa, crua','84,77000000000000000000','52,54248260869560000000','219,83774723478300000000','0,77173913043478300000','Tr','NA','13,85159420289860000000','2,43333333333333000000','0,59666666666666700000','5,72000000000000000000','5,47666666666667000000','0,03000000000000000000','13,91666666666670000000','0,10333333333333300000','Tr','134,05333333333300000000','0,05666666666666670000','0,05000000000000000000','NA','27,20833333333330000000','13,60416666666670000000','0,07000000000000000000','Tr','0,03000000000000000000','Tr','7,63000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','173','Ameixa, em calda, enlatada, drenada ','50,33933333333330000000','177,35918531537100000000','742,07083135951000000000','1,02500000000000000000','0,28033333333333300000','NA','47,65800000000000000000','4,54666666666667000000','0,69733333333333300000','39,23700000000000000000','14,49100000000000000000','0,19733333333333300000','26,07366666666670000000','2,69766666666667000000','2,79033333333333000000','263,26133333333300000000','0,16066666666666700000','0,20133333333333300000','NA','','','Tr','0,22333333333333300000','0,08333333333333330000','Tr','5,15166666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','174','Atemóia, crua','72,73600000000000000000','96,97158744792140000000','405,72912188210300000000','0,97083333333333300000','0,30033333333333300000','NA','25,33216666666670000000','2,13533333333333000000','0,66066666666666700000','22,76600000000000000000','24,83533333333330000000','0,15933333333333300000','23,36466666666670000000','0,16416666666666700000','0,78500000000000000000','300,01266666666700000000','0,17300000000000000000','0,18766666666666700000','NA','','','0,09333333333333330000','0,07000000000000000000','0,07000000000000000000','1,58000000000000000000','10,14666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','175','Banana, da terra, crua','63,87666666666670000000','128,02445217391300000000','535,65430789565200000000','1,43478260869565000000','0,24000000000000000000','NA','33,66521739130440000000','1,52666666666667000000','0,78333333333333300000','4,15100000000000000000','23,78666666666670000000','0,16333333333333300000','25,51666666666670000000','0,29333333333333300000','Tr','328,03000000000000000000','0,05333333333333330000','0,16000000000000000000','NA','238,83333333333300000000','119,41666666666700000000','0,03000000000000000000','0,02000000000000000000','0,14000000000000000000','Tr','15,74666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','176','Banana, doce em barra','21,12600000000000000000','280,10519255063900000000','1171,96012563188000000000','2,16875000000000000000','0,05000000000000000000','NA','75,66658333333330000000','3,83333333333333000000','0,98866666666666700000','11,95033333333330000000','49,19400000000000000000','0,83933333333333300000','36,87600000000000000000','0,61300000000000000000','9,88233333333333000000','518,25000000000000000000','0,16466666666666700000','0,30200000000000000000','NA','27,35555555555560000000','13,67777777777780000000','0,03000000000000000000','Tr','0,05666666666666670000','1,41000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','177','Banana, figo, crua','70,07400000000000000000','105,08265000000000000000','439,66580760000000000000','1,13125000000000000000','0,14166666666666700000','NA','27,80441666666670000000','2,80000000000000000000','0,84866666666666600000','6,35633333333333000000','30,16133333333330000000','0,21366666666666700000','15,82166666666670000000','0,19800000000000000000','Tr','386,59166666666700000000','0,06400000000000000000','0,12266666666666700000','NA','','','0,09000000000000000000','Tr','0,03000000000000000000','Tr','17,49666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','178','Banana, maçã, crua','75,23000000000000000000','86,80533043478260000000','363,19350253913000000000','1,75362318840580000000','0,06000000000000000000','NA','22,33637681159420000000','2,59333333333333000000','0,62000000000000000000','3,22000000000000000000','23,68666666666670000000','0,59666666666666700000','28,68333333333330000000','0,20333333333333300000','Tr','264,38666666666700000000','0,11000000000000000000','0,12000000000000000000','NA','6,41666666666667000000','3,20833333333333000000','Tr','Tr','0,14333333333333300000','Tr','10,46666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','179','Banana, nanica, crua','73,79666666666670000000','91,52884782608700000000','382,95669930434800000000','1,39855072463768000000','0,11666666666666700000','NA','23,84811594202900000000','1,94666666666667000000','0,84000000000000000000','3,41666666666667000000','27,79666666666670000000','0,14000000000000000000','26,72000000000000000000','0,34666666666666700000','Tr','376,47000000000000000000','0,10333333333333300000','0,17666666666666700000','NA','13,62500000000000000000','6,81250000000000000000','Tr','0,02000000000000000000','0,14333333333333300000','Tr','5,86000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','180','Banana, ouro, crua','68,17666666666670000000','112,36604782608700000000','470,13954410434800000000','1,48188405797101000000','0,21000000000000000000','NA','29,34144927536230000000','1,95333333333333000000','0,79000000000000000000','3,18666666666667000000','28,38333333333330000000','0,09000000000000000000','22,27000000000000000000','0,33666666666666700000','Tr','354,81000000000000000000','0,07666666666666670000','0,25666666666666700000','NA','49,70833333333330000000','24,85416666666670000000','Tr','Tr','0,14333333333333300000','Tr','7,55666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','181','Banana, pacova, crua','77,71066666666670000000','77,90952792507410000000','325,97346483851000000000','1,22708333333333000000','0,07900000000000000000','NA','20,31258333333330000000','2,03033333333333000000','0,67066666666666700000','5,49033333333333000000','30,41233333333330000000','0,40733333333333300000','19,75300000000000000000','0,37466666666666700000','0,93866666666666700000','267,35000000000000000000','0,06433333333333330000','0,13533333333333300000','NA','','','0,05000000000000000000','0,03000000000000000000','0,17000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','182','Banana, prata, crua','71,86333333333330000000','98,24970217391310000000','411,07675389565200000000','1,26811594202899000000','0,06500000000000000000','NA','25,95688405797100000000','2,04333333333333000000','0,84666666666666700000','7,56333333333333000000','26,29000000000000000000','0,41666666666666700000','22,19666666666670000000','0,38000000000000000000','Tr','357,67666666666700000000','0,05333333333333330000','0,14666666666666700000','NA','32,41666666666670000000','16,20833333333330000000','Tr','0,02000000000000000000','0,10000000000000000000','Tr','21,59000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','183','Cacau, cru','79,20866666666670000000','74,29148000000000000000','310,83555232000000000000','0,95416666666666600000','0,14400000000000000000','NA','19,41116666666670000000','2,18900000000000000000','0,28200000000000000000','12,10466666666670000000','24,61633333333330000000','0,03500000000000000000','9,33733333333333000000','0,25833333333333300000','0,70033333333333300000','71,64400000000000000000','0,14666666666666700000','0,58766666666666700000','NA','','','0,24666666666666700000','Tr','0,04000000000000000000','Tr','13,56333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','184','Cajá-Manga, cru','86,89433333333330000000','45,58096877372270000000','190,71077334925600000000','1,27916666666667000000','Tr','NA','11,43416666666670000000','2,57533333333333000000','0,37800000000000000000','12,74400000000000000000','11,28400000000000000000','0,04966666666666670000','24,46966666666670000000','0,15433333333333300000','1,43866666666667000000','119,39900000000000000000','0,02433333333333330000','0,18100000000000000000','NA','','','0,11000000000000000000','Tr','0,05000000000000000000','Tr','26,69666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','185','Cajá, polpa, congelada','92,44366666666670000000','26,33226931105060000000','110,17421479743600000000','0,58958333333333300000','0,16766666666666700000','NA','6,37441666666666000000','1,36000000000000000000','0,42466666666666700000','9,16066666666667000000','7,17133333333333000000','0,07000000000000000000','25,65500000000000000000','0,32233333333333300000','6,94500000000000000000','148,07500000000000000000','0,09866666666666670000','0,05400000000000000000','NA','106,00000000000000000000','53,00000000000000000000','0,04000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','186','Caju, cru','88,11333000000000000000','43,06506852173910000000','180,18424669495600000000','0,97101449275362300000','0,33000000000000000000','NA','10,28898884057970000000','1,68000000000000000000','0,29666666666666700000','1,41666666666667000000','10,11000000000000000000','0,12000000000000000000','15,63666666666670000000','0,15333333333333300000','2,96666666666667000000','123,86000000000000000000','0,07333333333333340000','0,09000000000000000000','NA','14,66600000000000000000','7,33300000000000000000','Tr','Tr','Tr','Tr','219,33333333333300000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','187','Caju, polpa, congelada','89,81700000000000000000','36,56868000000000000000','153,00335712000000000000','0,48125000000000000000','0,15400000000000000000','NA','9,35074999999999000000','0,81466666666666700000','0,19700000000000000000','0,83933333333333300000','7,07166666666667000000','0,05366666666666670000','9,77333333333333000000','0,14666666666666700000','4,16166666666667000000','87,66333333333330000000','0,06666666666666670000','0,08366666666666670000','NA','22,00000000000000000000','11,00000000000000000000','Tr','0,02300000000000000000','Tr','2,24666666666667000000','119,71933333333300000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','188','Caju, suco concentrado, envasado','88,36866666666670000000','45,10862666666670000000','188,73449397333300000000','0,40416666666666700000','0,20000000000000000000','NA','10,73383333333330000000','0,62600000000000000000','0,29333333333333300000','0,97566666666666700000','8,44700000000000000000','0,06466666666666670000','11,40033333333330000000','0,14600000000000000000','45,04433333333330000000','106,98700000000000000000','0,03766666666666670000','0,06500000000000000000','NA','10,00000000000000000000','5,00000000000000000000','Tr','0,03200000000000000000','Tr','Tr','138,69533333333300000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','189','Caqui, chocolate, cru','79,72400000000000000000','71,35001811164620000000','298,52847577912800000000','0,35625000000000000000','0,06933333333333330000','NA','19,32575000000000000000','6,51766666666667000000','0,52466666666666700000','17,84833333333330000000','8,54733333333333000000','0,39000000000000000000','18,42966666666670000000','0,09900000000000000000','2,18333333333333000000','163,54633333333300000000','Tr','0,18700000000000000000','NA','','','Tr','Tr','0,03000000000000000000','Tr','29,61333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','190','Carambola, crua','87,09600000000000000000','45,74088879342870000000','191,37987871170600000000','0,87083333333333300000','0,17700000000000000000','NA','11,48150000000000000000','2,03133333333333000000','0,37466666666666700000','4,78833333333333000000','7,36100000000000000000','0,12633333333333300000','10,74900000000000000000','0,19833333333333300000','4,09466666666667000000','132,57633333333300000000','0,07733333333333330000','0,24000000000000000000','NA','','','0,11666666666666700000','Tr','Tr','Tr','60,86666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','191','Ciriguela, crua','78,68500000000000000000','75,59411000000000000000','316,28575624000000000000','1,39791666666667000000','0,35966666666666700000','NA','18,85741666666670000000','3,90200000000000000000','0,70000000000000000000','27,41400000000000000000','17,96333333333330000000','0,05666666666666670000','48,59933333333330000000','0,35733333333333300000','1,68233333333333000000','248,01466666666700000000','0,12433333333333300000','0,53133333333333300000','NA','','','0,14333333333333300000','Tr','Tr','Tr','27,02666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','192','Cupuaçu, cru','86,23066666666670000000','49,42255877437190000000','206,78398591197200000000','1,16041666666667000000','0,95133333333333300000','NA','10,43358333333330000000','3,11600000000000000000','1,22400000000000000000','13,12033333333330000000','18,17133333333330000000','0,06700000000000000000','21,28150000000000000000','0,48566666666666700000','3,19600000000000000000','331,03333333333300000000','0,07400000000000000000','0,33666666666666700000','NA','','','0,36633333333333300000','0,03660000000000000000','0,07333333333333340000','4,34333333333333000000','24,51300000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','193','Cupuaçu, polpa, congelada','86,55300000000000000000','48,79689000000000000000','204,16618776000000000000','0,84375000000000000000','0,59366666666666700000','NA','11,38691666666670000000','1,59100000000000000000','0,62266666666666700000','5,49066666666667000000','13,91133333333330000000','0,16966666666666700000','14,19633333333330000000','0,25900000000000000000','0,68900000000000000000','291,09233333333300000000','0,13966666666666700000','0,15100000000000000000','NA','','','0,06666666666666670000','0,07100000000000000000','0,05000000000000000000','Tr','10,48900000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','194','Figo, cru','88,18666666666670000000','41,44712608695650000000','173,41477554782600000000','0,96739130434782600000','0,15666666666666700000','NA','10,24594202898550000000','1,79333333333333000000','0,44333333333333300000','27,39000000000000000000','11,31000000000000000000','0,06000000000000000000','14,57000000000000000000','0,20333333333333300000','Tr','174,42000000000000000000','0,13000000000000000000','0,09000000000000000000','NA','','','0,05000000000000000000','Tr','Tr','Tr','0,79000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','195','Figo, enlatado, em calda','48,77000000000000000000','184,36071739130400000000','771,36524156521700000000','0,56159420289855100000','0,15000000000000000000','NA','50,33840579710150000000','1,97666666666667000000','0,18000000000000000000','32,61666666666670000000','6,85000000000000000000','0,16033333333333300000','6,25333333333333000000','0,50333333333333300000','6,87000000000000000000','39,35000000000000000000','0,25000000000000000000','0,09000000000000000000','NA','','','Tr','Tr','Tr','Tr','5,24333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','196','Fruta-pão, crua','80,86900000000000000000','67,04562000000000000000','280,51887408000000000000','1,08125000000000000000','0,18933333333333300000','NA','17,17441666666670000000','5,54533333333333000000','0,68600000000000000000','33,67566666666670000000','24,03300000000000000000','0,04400000000000000000','27,39366666666670000000','0,23066666666666700000','0,79933333333333300000','188,12633333333300000000','0,07166666666666670000','0,12600000000000000000','NA','','','0,03000000000000000000','Tr','Tr','Tr','9,86666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','197','Goiaba, branca, com casca, crua','85,69000000000000000000','51,73774782608700000000','216,47073690434800000000','0,89855072463768100000','0,48666666666666700000','NA','12,40144927536230000000','6,33000000000000000000','0,52333333333333300000','5,00733333333333000000','7,04333333333333000000','0,07333333333333340000','16,40333333333330000000','0,17000000000000000000','Tr','219,77000000000000000000','0,04333333333333330000','0,15666666666666700000','NA','','','Tr','Tr','0,02666666666666670000','Tr','99,19500000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','198','Goiaba, doce em pasta','24,78000000000000000000','268,95982608695700000000','1125,32791234783000000000','0,57971014492753600000','0,00000000000000000000','NA','74,12362318840580000000','3,73333333333333000000','0,51666666666666700000','10,06000000000000000000','6,48666666666667000000','0,10833333333333300000','53,57000000000000000000','0,40000000000000000000','3,70000000000000000000','164,80666666666700000000','0,06000000000000000000','0,09000000000000000000','NA','136,41666666666700000000','68,20833333333330000000','0,07000000000000000000','Tr','Tr','Tr','23,05666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','199','Goiaba, doce, cascão','20,26066666666670000000','285,58779243900400000000','1194,89932356479000000000','0,41458333333333300000','0,10333333333333300000','NA','78,70275000000000000000','4,36666666666667000000','0,51866666666666700000','14,69900000000000000000','9,66833333333334000000','0,15866666666666700000','28,20433333333330000000','0,40233333333333300000','11,02933333333330000000','250,72333333333300000000','0,07866666666666670000','0,14000000000000000000','NA','50,33333333333330000000','25,16666666666670000000','Tr','Tr','Tr','1,40666666666667000000','34,32666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','200','Goiaba, vermelha, com casca, crua','84,98000000000000000000','54,16993043478260000000','226,64698893913000000000','1,08695652173913000000','0,44000000000000000000','NA','13,00971014492750000000','6,22333333333333000000','0,48333333333333300000','4,45133333333333000000','6,89333333333333000000','0,09000000000000000000','15,37000000000000000000','0,17000000000000000000','Tr','197,58000000000000000000','0,04000000000000000000','0,13000000000000000000','NA','38,00000000000000000000','19,00000000000000000000','Tr','Tr','0,03000000000000000000','Tr','80,60166666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','201','Graviola, crua','82,15333333333330000000','61,62189837666360000000','257,82602280796000000000','0,84583333333333300000','0,21000000000000000000','NA','15,83950000000000000000','1,90900000000000000000','0,95133333333333300000','40,11800000000000000000','23,49933333333330000000','0,08466666666666670000','19,16900000000000000000','0,16966666666666700000','4,16000000000000000000','249,66566666666700000000','0,03933333333333330000','0,12600000000000000000','NA','','','0,16800000000000000000','0,12433333333333300000','0,03333333333333330000','Tr','19,13733333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','202','Graviola, polpa, congelada','89,16300000000000000000','38,27387000000000000000','160,13787208000000000000','0,56666666666666700000','0,13766666666666700000','NA','9,78266666666666000000','1,18766666666667000000','0,35000000000000000000','5,97866666666667000000','9,76000000000000000000','0,05600000000000000000','16,58833333333330000000','0,10266666666666700000','3,04633333333333000000','169,95666666666700000000','0,06166666666666670000','0,05366666666666670000','NA','','','Tr','0,09366666666666670000','Tr','Tr','10,47533333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','203','Jabuticaba, crua','83,64666666666670000000','58,05315000000000000000','242,89437960000000000000','0,61250000000000000000','0,12833333333333300000','NA','15,25583333333330000000','2,29900000000000000000','0,35666666666666700000','8,34800000000000000000','17,77966666666670000000','0,29700000000000000000','14,54966666666670000000','0,09466666666666670000','Tr','129,72433333333300000000','0,07166666666666670000','0,28333333333333300000','NA','','','0,06000000000000000000','Tr','Tr','Tr','16,17000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','204','Jaca, crua','75,07433333333330000000','87,92035000000000000000','367,85874440000000000000','1,40208333333333000000','0,26500000000000000000','NA','22,49758333333330000000','2,38600000000000000000','0,76100000000000000000','11,24500000000000000000','40,05233333333330000000','0,48466666666666700000','13,89933333333330000000','0,38266666666666700000','1,80166666666667000000','233,75233333333300000000','0,09333333333333330000','0,16666666666666700000','NA','','','0,10000000000000000000','0,03666666666666670000','0,04666666666666670000','Tr','14,81666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','205','Jambo, cru','92,10100000000000000000','26,91230000000000000000','112,60106320000000000000','0,88541666666666700000','0,06666666666666670000','NA','6,49425000000000000000','5,07433333333333000000','0,45266666666666700000','13,80000000000000000000','14,17833333333330000000','0,05233333333333330000','18,35833333333330000000','0,13666666666666700000','21,65600000000000000000','134,86900000000000000000','0,02233333333333330000','0,11400000000000000000','NA','','','0,07666666666666670000','Tr','Tr','1,18000000000000000000','3,77333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','206','Jamelão, cru','87,67433333333330000000','41,00970891670390000000','171,58462210748900000000','0,54583333333333300000','0,10966666666666700000','NA','10,62716666666670000000','1,77666666666667000000','1,04300000000000000000','3,09000000000000000000','2,16466666666667000000','Tr','4,11733333333333000000','0,04766666666666670000','1,36633333333333000000','394,34333333333300000000','0,03166666666666670000','0,04900000000000000000','NA','7,51944444444444000000','3,75972222222222000000','0,16666666666666700000','Tr','0,11666666666666700000','Tr','27,07000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','207','Kiwi, cru','85,87666666666670000000','51,13633043478260000000','213,95440653913100000000','1,33695652173913000000','0,62666666666666700000','NA','11,49971014492750000000','2,65333333333333000000','0,66000000000000000000','23,91333333333330000000','10,57666666666670000000','0,05333333333333330000','33,07666666666670000000','0,25333333333333300000','Tr','268,92333333333300000000','0,15000000000000000000','0,07000000000000000000','NA','5,41666666666667000000','2,70833333333333000000','Tr','Tr','0,06000000000000000000','Tr','70,77666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','208','Laranja, baía, crua','87,08000000000000000000','45,43811739130430000000','190,11308316521700000000','0,97826086956521700000','0,10333333333333300000','NA','11,46840579710150000000','1,12333333333333000000','0,37000000000000000000','35,40700000000000000000','9,21666666666667000000','0,04000000000000000000','23,80333333333330000000','0,13666666666666700000','Tr','174,14666666666700000000','0,04000000000000000000','0,06000000000000000000','NA','3,87500000000000000000','1,93750000000000000000','0,06333333333333330000','0,02000000000000000000','Tr','Tr','56,87000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','209','Laranja, baía, suco','90,24666666666670000000','36,64948260869560000000','153,34143523478200000000','0,65217391304347800000','Tr','NA','8,69782608695652000000','Tr','0,36000000000000000000','5,92666666666667000000','7,80000000000000000000','0,01666666666666670000','21,93000000000000000000','0,06333333333333330000','Tr','172,56000000000000000000','0,02000000000000000000','Tr','NA','4,00000000000000000000','2,00000000000000000000','0,02666666666666670000','Tr','0,02000000000000000000','Tr','94,48333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','210','Laranja, da terra, crua','85,37933333333340000000','51,47112863928080000000','215,35520222675100000000','1,07708333333333000000','0,18566666666666700000','NA','12,86058333333330000000','3,97700000000000000000','0,49733333333333300000','51,08233333333330000000','14,05666666666670000000','0,04100000000000000000','20,11566666666670000000','0,14666666666666700000','0,83000000000000000000','172,52000000000000000000','0,03766666666666670000','0,21833333333333300000','NA','','','0,07333333333333330000','0,09100000000000000000','0,03333333333333330000','Tr','34,67966666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','211','Laranja, da terra, suco','89,22000000000000000000','40,95600731086730000000','171,35993458866900000000','0,66666666666666700000','0,14200000000000000000','NA','9,57333333333334000000','1,03100000000000000000','0,39800000000000000000','13,38833333333330000000','10,10933333333330000000','0,02233333333333330000','14,88600000000000000000','0,08600000000000000000','Tr','145,24133333333300000000','0,02166666666666670000','0,07366666666666670000','NA','4,45833333333333000000','2,22916666666667000000','0,04000000000000000000','Tr','0,03666666666666670000','Tr','44,32000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','212','Laranja, lima, crua','86,97400000000000000000','45,70103878062960000000','191,21314625815400000000','1,05625000000000000000','0,07533333333333330000','NA','11,53375000000000000000','1,78200000000000000000','0,36066666666666700000','31,46666666666670000000','10,15766666666670000000','0,05133333333333330000','14,51033333333330000000','0,12000000000000000000','1,11100000000000000000','129,87000000000000000000','0,03200000000000000000','0,11700000000000000000','NA','','','0,09400000000000000000','0,05433333333333330000','0,04000000000000000000','Tr','43,45566666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','213','Laranja, lima, suco','89,68066666666670000000','39,33609394413240000000','164,58221706225000000000','0,71458333333333300000','0,11933333333333300000','NA','9,16741666666668000000','0,42400000000000000000','0,31800000000000000000','7,73633333333333000000','10,89266666666670000000','0,02066666666666670000','16,24366666666670000000','Tr','Tr','128,74466666666700000000','0,02300000000000000000','0,02933333333333330000','NA','','','0,10233000000000000000','0,03333000000000000000','0,04333333333333330000','Tr','41,30330000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','214','Laranja, pêra, crua','89,55000000000000000000','36,77376521739130000000','153,86143366956500000000','1,04347826086957000000','0,12666666666666700000','NA','8,94652173913044000000','0,76666666666666700000','0,33333333333333300000','21,88600000000000000000','8,61333333333333000000','0,05000000000000000000','22,68333333333330000000','0,09000000000000000000','Tr','162,82000000000000000000','0,03000000000000000000','0,06000000000000000000','NA','0,91666666666666700000','0,45833333333333300000','0,06666666666666670000','0,02000000000000000000','0,02000000000000000000','Tr','53,73333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','215','Laranja, pêra, suco','91,29333333333330000000','32,70975362318840000000','136,85760915942000000000','0,73913043478260900000','0,07333333333333330000','NA','7,55420289855072000000','Tr','0,34000000000000000000','7,36666666666667000000','7,58666666666667000000','0,03000000000000000000','14,01000000000000000000','Tr','Tr','148,75666666666700000000','0,01000000000000000000','Tr','NA','1,20833333333333000000','0,60416666666666700000','Tr','Tr','Tr','Tr','73,33666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','216','Laranja, valência, crua','86,94133333333330000000','46,10962878338500000000','192,92268682968300000000','0,76666666666666700000','0,15900000000000000000','NA','11,72300000000000000000','1,72766666666667000000','0,41000000000000000000','33,73600000000000000000','14,40266666666670000000','0,05600000000000000000','19,76600000000000000000','0,09100000000000000000','0,62900000000000000000','157,90333333333300000000','0,04233333333333330000','0,11200000000000000000','NA','','','0,06866666666666670000','0,03600000000000000000','0,03000000000000000000','Tr','47,84566666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','217','Laranja, valência, suco','90,53033333333330000000','36,19635058768590000000','151,44553085887800000000','0,48333333333333300000','0,12433333333333300000','NA','8,55400000000000000000','0,42200000000000000000','0,30800000000000000000','9,07633333333333000000','9,59266666666667000000','0,02933333333333330000','17,26533333333330000000','Tr','Tr','143,41800000000000000000','0,01966666666666670000','Tr','NA','2,00000000000000000000','1,00000000000000000000','*','*','0,03000000000000000000','Tr','*','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','218','Limão, cravo, suco','94,18900000000000000000','14,10373339931170000000','59,01002054272010000000','0,32500000000000000000','Tr','NA','5,24666666666666000000','Tr','0,23933333333333300000','10,18366666666670000000','8,85766666666667000000','0,03266666666666670000','11,13166666666670000000','0,07900000000000000000','Tr','119,87933333333300000000','0,02566666666666670000','','NA','31,41666666666670000000','15,70833333333330000000','Tr','Tr','Tr','Tr','32,78000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','219','Limão, galego, suco','91,79666666666670000000','22,22504347826090000000','92,98958191304360000000','0,56521739130434800000','0,06666666666666670000','NA','7,32144927536232000000','Tr','0,25000000000000000000','5,26333333333333000000','5,92000000000000000000','0,01000000000000000000','13,04000000000000000000','0,05333333333333330000','Tr','112,51000000000000000000','0,02000000000000000000','0,05333333333333330000','NA','','','Tr','Tr','0,03000000000000000000','Tr','34,49666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','220','Limão, tahiti, cru','87,42733333333330000000','31,81815343016390000000','133,12715395180600000000','0,93958333333333300000','0,14000000000000000000','NA','11,08441666666670000000','1,18166666666667000000','0,40866666666666700000','50,98366666666670000000','9,69600000000000000000','0,07233333333333330000','23,76133333333330000000','0,17966666666666700000','1,24833333333333000000','128,29333333333300000000','0,05833333333333330000','0,21100000000000000000','NA','','','0,30300000000000000000','0,03733333333333330000','Tr','Tr','38,23600000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','221','Maçã, Argentina, com casca, crua','82,64900000000000000000','62,53181836628910000000','261,63312804455400000000','0,22500000000000000000','0,24600000000000000000','NA','16,58800000000000000000','2,02633333333333000000','0,29200000000000000000','3,39233333333333000000','4,85766666666667000000','0,01200000000000000000','11,40366666666670000000','0,05333333333333330000','1,31800000000000000000','117,47700000000000000000','0,03100000000000000000','Tr','NA','','','0,05000000000000000000','Tr','Tr','Tr','1,48666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','222','Maçã, Fuji, com casca, crua','84,33666666666670000000','55,51520000000010000000','232,27559680000000000000','0,28666666666666700000','Tr','NA','15,15333333333330000000','1,34666666666667000000','0,22333333333333300000','1,92333333333333000000','2,04000000000000000000','0,03333333333333330000','9,07666666666667000000','0,09333333333333330000','Tr','74,71333333333330000000','0,06000000000000000000','Tr','NA','3,50000000000000000000','1,75000000000000000000','Tr','Tr','0,03000000000000000000','Tr','2,40666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','223','Macaúba, crua','41,52666666666670000000','404,28187666666700000000','1691,51537197333000000000','2,08290000000000000000','40,65666666666670000000','NA','13,94543333333330000000','13,44350000000000000000','1,78833333333333000000','66,53233333333330000000','66,05333333333330000000','0,07500000000000000000','43,86766666666670000000','0,80800000000000000000','0,65433333333333300000','305,81300000000000000000','0,35300000000000000000','0,66433333333333300000','NA','1020,00000000000000000000','510,00000000000000000000','0,11333333333333300000','0,11333333333333300000','0,03000000000000000000','Tr','13,44350000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','224',' Mamão, doce em calda, drenado','45,52900000000000000000','195,62747482178600000000','818,50535465435300000000','0,19375000000000000000','0,06733333333333330000','NA','54,00358333333330000000','1,31333333333333000000','0,20633333333333300000','20,01266666666670000000','5,81433333333333000000','0,02000000000000000000','4,48133333333333000000','0,10766666666666700000','2,91433333333333000000','68,23566666666670000000','0,01900000000000000000','0,06566666666666670000','NA','','','0,03000000000000000000','Tr','Tr','Tr','3,90000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','225','Mamão, Formosa, cru','86,92666666666670000000','45,34074782608690000000','189,70568890434800000000','0,81521739130434800000','0,12000000000000000000','NA','11,55478260869560000000','1,81333333333333000000','0,58333333333333300000','24,87333333333330000000','17,32333333333330000000','0,04000000000000000000','10,85666666666670000000','0,23333333333333300000','3,25666666666667000000','221,80333333333300000000','1,36000000000000000000','0,07000000000000000000','NA','148,00000000000000000000','74,00000000000000000000','0,03000000000000000000','0,03000000000000000000','Tr','Tr','78,52666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','226','Mamão, Papaia, cru','88,58300000000000000000','40,15676894229660000000','168,01592125456900000000','0,45625000000000000000','0,12433333333333300000','NA','10,43975000000000000000','1,04266666666667000000','0,39666666666666700000','22,41833333333330000000','22,17600000000000000000','0,01300000000000000000','10,66933333333330000000','0,19333333333333300000','1,63033333333333000000','126,14666666666700000000','0,02166666666666670000','0,07100000000000000000','NA','118,00000000000000000000','59,00000000000000000000','0,03433333333333330000','0,04333333333333330000','Tr','1,03333333333333000000','82,20666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','227',' Mamão verde, doce em calda, drenado','41,88066666666670000000','209,37625445890400000000','876,03024865605600000000','0,31666666666666700000','0,09800000000000000000','NA','57,63666666666670000000','1,23333333333333000000','0,06800000000000000000','12,43500000000000000000','4,54266666666667000000','0,03866666666666670000','3,23166666666667000000','0,15400000000000000000','4,74000000000000000000','8,67033333333333000000','0,01500000000000000000','0,02100000000000000000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','228','Manga, Haden, crua','82,28766666666670000000','63,50031833879150000000','265,68533192950400000000','0,40833333333333300000','0,25600000000000000000','NA','16,66266666666670000000','1,58200000000000000000','0,38533333333333300000','11,65966666666670000000','7,81533333333333000000','0,17333333333333300000','9,29600000000000000000','0,09600000000000000000','0,55133333333333300000','147,88333333333300000000','0,10266666666666700000','0,06633333333333330000','NA','162,00000000000000000000','81,00000000000000000000','0,01933333333333330000','0,06033333333333330000','0,05000000000000000000','Tr','17,41300000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','229','Manga, Palmer, crua','79,73566666666670000000','72,48673809168730000000','303,28451217562000000000','0,41041666666666700000','0,17200000000000000000','NA','19,35225000000000000000','1,63333333333333000000','0,32966666666666700000','11,63833333333330000000','8,72500000000000000000','0,04666666666666670000','14,01433333333330000000','0,09133333333333330000','1,86366666666667000000','156,53000000000000000000','0,08766666666666670000','0,08700000000000000000','NA','786,91666666666700000000','393,45833333333300000000','0,08666666666666670000','0,03000000000000000000','Tr','Tr','65,52333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','230','Manga, polpa, congelada','86,49833333333330000000','48,30588000000000000000','202,11180192000000000000','0,38125000000000000000','0,23400000000000000000','NA','12,51841666666670000000','1,07000000000000000000','0,36800000000000000000','7,12100000000000000000','9,49400000000000000000','0,11933333333333300000','9,11133333333333000000','0,08933333333333330000','6,73333333333333000000','131,37433333333300000000','0,05900000000000000000','0,06500000000000000000','NA','','','Tr','0,06600000000000000000','0,03000000000000000000','Tr','24,90233333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','231','Manga, Tommy Atkins, crua','85,81333333333340000000','50,69218260869560000000','212,09609203478300000000','0,85507246376811600000','0,22000000000000000000','NA','12,77159420289850000000','2,06666666666667000000','0,34000000000000000000','7,63666666666667000000','7,39666666666667000000','0,34000000000000000000','13,77666666666670000000','0,08000000000000000000','Tr','138,36666666666700000000','0,06000000000000000000','0,08000000000000000000','NA','118,00000000000000000000','59,00000000000000000000','Tr','0,04000000000000000000','0,03000000000000000000','Tr','7,93666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','232','Maracujá, cru','82,85333333333330000000','68,43950869565210000000','286,35090438260900000000','1,98913043478261000000','2,10333333333333000000','NA','12,26420289855070000000','1,13666666666667000000','0,79000000000000000000','5,39333333333333000000','27,96666666666670000000','0,12000000000000000000','50,69000000000000000000','0,56000000000000000000','1,58000000000000000000','338,42000000000000000000','0,18666666666666700000','0,39333333333333300000','NA','114,00000000000000000000','57,00000000000000000000','Tr','0,05000000000000000000','0,04666666666666670000','Tr','19,84000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','233','Maracujá, polpa, congelada','88,89533333333330000000','38,75970000000000000000','162,17058480000000000000','0,81250000000000000000','0,17666666666666700000','NA','9,59749999999999000000','0,50600000000000000000','0,51800000000000000000','4,60966666666667000000','9,70100000000000000000','0,07000000000000000000','15,25733333333330000000','0,29233333333333300000','8,09600000000000000000','227,90966666666700000000','0,05033333333333330000','0,18800000000000000000','NA','','','Tr','0,09066666666666670000','0,06000000000000000000','Tr','7,25700000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','234','Maracujá, suco concentrado, envasado','88,94200000000000000000','41,96732000000000000000','175,59126688000000000000','0,76666666666666700000','0,19333333333333300000','NA','9,63599999999999000000','0,35366666666666700000','0,46200000000000000000','4,15833333333333000000','4,15833333333333000000','0,07166666666666670000','13,90233333333330000000','0,34500000000000000000','21,69233333333330000000','200,69533333333300000000','0,05233333333333330000','0,13600000000000000000','NA','','','Tr','0,07833333333333330000','0,05000000000000000000','1,91666666666667000000','13,67933333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','235','Melancia, crua','90,66666666666670000000','32,60662608695650000000','136,42612354782600000000','0,88405797101449300000','Tr','NA','8,13927536231884000000','0,12333333333333300000','0,27000000000000000000','7,72000000000000000000','9,63000000000000000000','0,14000000000000000000','12,17666666666670000000','0,22666666666666700000','Tr','104,02666666666700000000','0,04000000000000000000','0,09666666666666670000','NA','61,00000000000000000000','30,50000000000000000000','Tr','Tr','Tr','Tr','6,14666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','236','Melão, cru','91,28000000000000000000','29,36939130434780000000','122,88153321739100000000','0,67753623188405800000','Tr','NA','7,52579710144927000000','0,25000000000000000000','0,51666666666666700000','2,85666666666667000000','5,95000000000000000000','0,04666666666666670000','10,14000000000000000000','0,23000000000000000000','11,16666666666670000000','216,00000000000000000000','0,04333333333333330000','0,09000000000000000000','NA','2,00000000000000000000','1,00000000000000000000','Tr','Tr','0,02000000000000000000','Tr','8,68000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','237','Mexerica, Murcote, crua','83,65200000000000000000','57,59277847464880000000','240,96818513793000000000','0,88333333333333300000','0,13400000000000000000','NA','14,86200000000000000000','3,07333333333333000000','0,46866666666666700000','33,07000000000000000000','12,30366666666670000000','0,05433333333333330000','19,49800000000000000000','0,06933333333333330000','1,16733333333333000000','158,53833333333300000000','0,06000000000000000000','0,10200000000000000000','NA','','','0,07900000000000000000','0,07366666666666670000','0,05000000000000000000','Tr','21,79566666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','238','Mexerica, Rio, crua','89,56933333333330000000','36,87135000000010000000','154,26972840000000000000','0,65000000000000000000','0,12833333333333300000','NA','9,33700000000001000000','2,73166666666667000000','0,31533333333333300000','17,18366666666670000000','8,21200000000000000000','0,04500000000000000000','13,70200000000000000000','0,08933333333333330000','1,82400000000000000000','124,98666666666700000000','0,07266666666666670000','0,15466666666666700000','NA','','','0,03333333333333330000','Tr','Tr','Tr','111,97000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','239','Morango, cru','91,52666666666670000000','30,14791739130440000000','126,13888636521700000000','0,89492753623188400000','0,31000000000000000000','NA','6,81840579710146000000','1,72333333333333000000','0,45000000000000000000','10,90000000000000000000','9,67333333333333000000','0,32666666666666700000','22,43333333333330000000','0,32000000000000000000','Tr','184,39666666666700000000','0,06000000000000000000','0,17666666666666700000','NA','','','Tr','0,03000000000000000000','0,03000000000000000000','Tr','63,59666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','240','Nêspera, crua','87,76433333333330000000','42,53919886819520000000','177,98400806452900000000','0,30833333333333300000','Tr','NA','11,52866666666670000000','2,95800000000000000000','0,39866666666666700000','19,68666666666670000000','9,72066666666667000000','0,07200000000000000000','10,07566666666670000000','0,14666666666666700000','Tr','112,85000000000000000000','0,12200000000000000000','0,12133333333333300000','NA','170,00000000000000000000','85,00000000000000000000','Tr','Tr','Tr','Tr','3,15666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','241','Pequi, cru','65,88866666666670000000','204,96677000000000000000','857,58096568000000000000','2,33541666666667000000','17,97100000000000000000','NA','12,97291666666670000000','19,04100000000000000000','0,83200000000000000000','32,44100000000000000000','29,77333333333330000000','0,63800000000000000000','33,74866666666670000000','0,27366666666666700000','Tr','297,79366666666700000000','0,20766666666666700000','0,95900000000000000000','NA','60,00000000000000000000','30,00000000000000000000','0,17000000000000000000','0,48000000000000000000','0,06333333333333330000','2,57333333333333000000','8,28333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','242','Pêra, Park, crua','83,18633333333330000000','60,58859000000000000000','253,50266056000000000000','0,23541666666666700000','0,23033333333333300000','NA','16,07491666666670000000','2,98266666666667000000','0,27300000000000000000','8,71200000000000000000','6,12400000000000000000','0,03533333333333330000','11,70700000000000000000','0,32133333333333300000','0,98166666666666700000','102,22333333333300000000','0,07833333333333330000','0,07266666666666670000','NA','','','0,06000000000000000000','Tr','Tr','Tr','2,36000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','243','Pêra, Williams, crua','85,03333333333330000000','53,30904782608690000000','223,04505610434800000000','0,56521739130434800000','0,11000000000000000000','NA','14,02478260869560000000','3,01333333333333000000','0,26666666666666700000','8,27666666666667000000','5,78000000000000000000','0,04000000000000000000','11,76666666666670000000','0,09333333333333330000','Tr','115,86666666666700000000','0,07000000000000000000','0,08000000000000000000','NA',' ',' ','Tr','Tr','Tr','Tr','2,83333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','244','Pêssego, Aurora, cru','89,32133333333330000000','36,32759902453420000000','151,99467431865100000000','0,82500000000000000000','Tr','NA','9,32100000000001000000','1,42166666666667000000','0,53266666666666700000','3,23233333333333000000','4,43766666666667000000','0,05400000000000000000','15,44200000000000000000','0,22366666666666700000','Tr','123,78766666666700000000','0,01900000000000000000','0,05700000000000000000','NA','','','0,05000000000000000000','Tr','Tr','Tr','3,25333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','245','Pêssego, enlatado, em calda','82,18666666666670000000','63,14243478260870000000','264,18794713043500000000','0,70652173913043500000','Tr','NA','16,88014492753620000000','1,01666666666667000000','0,22666666666666700000','4,09666666666667000000','4,03833333333333000000','0,02833333333333330000','8,81033333333333000000','0,60333333333333300000','3,20100000000000000000','94,71666666666670000000','0,03933333333333330000','0,09166666666666670000','NA','47,54166666666670000000','23,77083333333330000000','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','246','Pinha, crua','75,04966666666670000000','88,47352766686680000000','370,17323975817100000000','1,48541666666667000000','0,31900000000000000000','NA','22,44791666666670000000','3,35600000000000000000','0,69800000000000000000','20,88033333333330000000','30,53866666666670000000','0,14533333333333300000','34,39533333333330000000','0,21366666666666700000','1,33733333333333000000','283,04700000000000000000','0,10733333333333300000','0,24233333333333300000','NA','','','0,12000000000000000000','0,04333333333333330000','0,08666666666666670000','Tr','35,90333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','247','Pitanga, crua','88,29300000000000000000','41,41553000000000000000','173,28257752000000000000','0,92916666666666600000','0,16900000000000000000','NA','10,24416666666670000000','3,23733333333333000000','0,36466666666666700000','17,87900000000000000000','12,22533333333330000000','0,35833333333333300000','13,14300000000000000000','0,39633333333333300000','1,70400000000000000000','113,43900000000000000000','0,08433333333333330000','0,35200000000000000000','NA','154,00000000000000000000','77,00000000000000000000','0,02600000000000000000','0,09733333333333330000','Tr','Tr','24,87000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','248','Pitanga, polpa, congelada','94,57200000000000000000','19,10545950235920000000','79,93724255787100000000','0,28541666666666700000','0,12133333333333300000','NA','4,75858333333333000000','0,73666666666666700000','0,26266666666666700000','7,79500000000000000000','6,20300000000000000000','0,05300000000000000000','12,21833333333330000000','0,37233333333333300000','5,02900000000000000000','87,30866666666670000000','0,05900000000000000000','0,08733333333333330000','NA','145,54166666666700000000','72,77083333333330000000','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','249','Romã, crua','83,98666666666670000000','55,73900000000000000000','233,21197600000000000000','0,40416666666666700000','Tr','NA','15,10583333333330000000','0,43866666666666700000','0,50333333333333300000','4,75400000000000000000','12,70200000000000000000','0,13200000000000000000','40,26700000000000000000','0,25700000000000000000','0,59133333333333300000','484,57066666666700000000','0,18733333333333300000','0,67000000000000000000','NA','','','0,11833333333333300000','0,16926666666666700000','0,05000000000000000000','Tr','8,12333333333334000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','250','Tamarindo, cru','21,95000000000000000000','275,69564269441400000000','1153,51056903343000000000','3,20625000000000000000','0,45500000000000000000','NA','72,53175000000000000000','6,44666666666667000000','1,85700000000000000000','37,10433333333330000000','59,10900000000000000000','0,33533333333333300000','54,59166666666670000000','0,55333333333333300000','0,35533333333333300000','722,99266666666700000000','0,29466666666666700000','0,67300000000000000000','NA','','','0,31000000000000000000','Tr','0,10333333333333300000','Tr','7,24666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','251','Tangerina, Poncã, crua','89,22333333333330000000','37,83059999999990000000','158,21512215652200000000','0,84782608695652200000','0,07333333333333340000','NA','9,60999999999999000000','0,94000000000000000000','0,31333333333333300000','12,89000000000000000000','7,73333333333333000000','0,04000000000000000000','12,45333333333330000000','0,11333333333333300000','Tr','131,44333333333300000000','0,03000000000000000000','Tr','NA','47,37500000000000000000','23,68750000000000000000','0,06000000000000000000','0,02000000000000000000','0,02000000000000000000','Tr','48,81666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','252','Tangerina, Poncã, suco','90,44000000000000000000','36,10880000000000000000','150,98142274782600000000','0,52173913043478300000','Tr','NA','8,80000000000000000000','Tr','0,28000000000000000000','4,28333333333333000000','6,46000000000000000000','0,02000000000000000000','9,02000000000000000000','Tr','Tr','119,00333333333300000000','0,02000000000000000000','Tr','NA','51,16666666666670000000','25,58333333333330000000','0,06333333333333330000','Tr','0,03000000000000000000','Tr','41,75000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','253','Tucumã, cru','51,26033333333330000000','262,01519507239300000000','1096,27157618289000000000','2,09375000000000000000','19,07666666666670000000','NA','26,47458333333330000000','12,65333333333330000000','1,09466666666667000000','46,33833333333330000000','121,01133333333300000000','0,54866666666666700000','52,54866666666670000000','0,56600000000000000000','3,89300000000000000000','401,16966666666700000000','0,38966666666666700000','0,87366666666666700000','NA','2362,63888888889000000000','1181,31944444444000000000','0,03666666666666670000','Tr','0,11000000000000000000','Tr','17,99333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','254','Umbu, cru','89,25000000000000000000','37,01669000000000000000','154,87783096000000000000','0,84166666666666700000','Tr','NA','9,39533333333333000000','1,98200000000000000000','0,46933333333333300000','11,56100000000000000000','11,34900000000000000000','0,03300000000000000000','13,37500000000000000000','0,09200000000000000000','Tr','151,83233333333300000000','0,04066666666666670000','0,42166666666666700000','NA','','','0,05000000000000000000','0,05633333333333330000','0,03000000000000000000','Tr','24,05533333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','255','Umbu, polpa, congelada','90,18500000000000000000','33,94329000000000000000','142,01872536000000000000','0,51250000000000000000','0,07033333333333330000','NA','8,78683333333333000000','1,33633333333333000000','0,44533333333333300000','10,71033333333330000000','8,12100000000000000000','0,04866666666666670000','12,67700000000000000000','0,20900000000000000000','5,77100000000000000000','153,88433333333300000000','0,04300000000000000000','0,07266666666666670000','NA','','','Tr','0,06466666666666670000','Tr','Tr','3,95333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','256','Uva, Itália, crua','84,96666666666670000000','52,87310000000010000000','221,16109186087000000000','0,74637681159420300000','0,20333333333333300000','NA','13,57333333333330000000','0,92000000000000000000','0,57000000000000000000','6,66000000000000000000','4,98333333333333000000','0,12666666666666700000','12,11666666666670000000','0,14000000000000000000','Tr','161,93666666666700000000','0,10666666666666700000','Tr','NA','5,33333333333333000000','2,66666666666667000000','Tr','Tr','0,03000000000000000000','Tr','3,29333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','257','Uva, Rubi, crua','86,08400000000000000000','49,06129000000000000000','205,27243736000000000000','0,60833333333333300000','0,15700000000000000000','NA','12,69533333333330000000','0,93366666666666600000','0,45533333333333300000','7,61566666666667000000','5,82733333333333000000','0,07166666666666670000','22,78566666666670000000','0,17066666666666700000','7,91900000000000000000','158,89333333333300000000','0,04700000000000000000','Tr','NA','','','0,01700000000000000000','0,02200000000000000000','Tr','Tr','1,86300000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Frutas e derivados','258','Uva, suco concentrado, envasado','85,12966666666670000000','57,65536000000000000000','241,23002624000000000000','Tr','Tr','NA','14,70800000000000000000','0,23333333333333300000','0,16233333333333300000','9,31700000000000000000','7,05800000000000000000','0,19666666666666700000','10,02166666666670000000','0,12400000000000000000','9,58333333333333000000','53,72633333333330000000','0,13000000000000000000','0,05400000000000000000','NA','','','0,07166666666666670000','0,01700000000000000000','0,05000000000000000000','Tr','20,96766666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','259','Azeite, de dendê','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','260','Azeite, de oliva, extra virgem','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','261','Manteiga, com sal','15,78733333333330000000','725,96892684599900000000','3037,45398992366000000000','0,41470000743866000000','82,36100000000000000000','200,55000000000000000000','0,06329999256133290000','NA','1,37366666666667000000','9,42300000000000000000','1,46733333333333000000','Tr','27,70033333333330000000','0,15400000000000000000','578,69466666666700000000','14,78300000000000000000','Tr','Tr','923,54500000000000000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','262','Manteiga, sem sal','13,62733333333330000000','757,54046072599700000000','3169,54928767757000000000','0,39556000709533700000','86,03933333333330000000','213,95166666666700000000','0,00000000000000000000','NA','0,05000000000000000000','3,60800000000000000000','1,42900000000000000000','Tr','7,07166666666667000000','Tr','3,84866666666667000000','5,19833333333333000000','0,04133333333333330000','Tr','1013,09000000000000000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','263','Margarina, com óleo hidrogenado, com sal (65% de lipídeos)','32,23133333333330000000','596,11951695632900000000','2494,16405894528000000000','Tr','67,43433333333330000000','NA','0,00000000000000000000','NA','1,94233333333333000000','5,55600000000000000000','1,13066666666667000000','Tr','7,25800000000000000000','0,08733333333333330000','894,03866666666700000000','21,41966666666670000000','Tr','Tr','462,12333333333300000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','264','Margarina, com óleo hidrogenado, sem sal (80% de lipídeos)','19,58566666666670000000','722,52562580490100000000','3023,04721836771000000000','Tr','81,73366666666660000000','NA','0,00000000000000000000','NA','0,16066666666666700000','2,59700000000000000000','0,54300000000000000000','Tr','3,74900000000000000000','0,05266666666666670000','77,89100000000000000000','1,76966666666667000000','Tr','Tr','534,37666666666700000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','265','Margarina, com óleo interesterificado, com sal (65%de lipídeos)','31,96900000000000000000','594,45169333333300000000','2487,18588490667000000000','Tr','67,24566666666670000000','NA','0,00000000000000000000','NA','1,24966666666667000000','4,54333333333333000000','1,23366666666667000000','Tr','5,96533333333333000000','Tr','560,79766666666700000000','14,71133333333330000000','Tr','Tr','385,38666666666700000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','266','Margarina, com óleo interesterificado, sem sal (65% de lipídeos)','33,37000000000000000000','593,13749023819000000000','2481,68725915659000000000','Tr','67,09700000000000000000','NA','0,00000000000000000000','NA','0,09600000000000000000','4,96366666666667000000','1,14933333333333000000','Tr','7,16133333333333000000','0,07666666666666670000','33,19433333333330000000','4,73000000000000000000','Tr','Tr','245,10000000000000000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','267','Óleo, de babaçu','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','268','Óleo, de canola','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','269','Óleo, de girassol','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','270','Óleo, de milho','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','271','Óleo, de pequi','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Gorduras e óleos','272','Óleo, de soja','NA','884,00000000000000000000','3698,65606384277000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','273','Abadejo, filé, congelado, assado','74,32233333333330000000','111,61550345118800000000','466,99926643977200000000','23,52500000000000000000','1,23766666666667000000','102,79866666666700000000','0,00000000000000000000','NA','1,64833333333333000000','22,60700000000000000000','20,24566666666670000000','Tr','337,85733333333300000000','0,52600000000000000000','334,39133333333300000000','155,63600000000000000000','0,03400000000000000000','0,51333333333333300000','Tr','Tr','Tr','Tr','Tr','Tr','0,43666666666666700000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','274','Abadejo, filé, congelado,cozido','79,73366666666670000000','91,10354839555420000000','381,17724648699900000000','19,34583333333330000000','0,94200000000000000000','86,86033333333330000000','0,00000000000000000000','NA','0,88933333333333300000','16,73333333333330000000','15,74233333333330000000','Tr','350,69733333333300000000','0,32733333333333300000','189,33766666666700000000','145,67033333333300000000','0,02733333333333330000','0,43500000000000000000','Tr','Tr','Tr','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','275','Abadejo, filé, congelado, cru','86,41666666666670000000','59,11303324858350000000','247,32893111207300000000','13,08333333333330000000','0,36000000000000000000','31,40666666666670000000','0,00000000000000000000','NA','0,63000000000000000000','10,17466666666670000000','14,49733333333330000000','0,00533333333333333000','90,54000000000000000000','0,10600000000000000000','78,51500000000000000000','148,35133333333300000000','0,13533333333333300000','0,39066666666666700000','Tr','Tr','Tr','0,03666666666666670000','Tr','Tr','4,60000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','276','Abadejo, filé, congelado, grelhado','70,95700000000000000000','129,64352590286700000000','542,42851237759700000000','27,61041666666670000000','1,30233333333333000000','135,85300000000000000000','0,00000000000000000000','NA','1,59000000000000000000','20,17366666666670000000','22,11166666666670000000','Tr','581,13433333333300000000','0,32900000000000000000','305,09366666666700000000','278,63900000000000000000','Tr','0,43833333333333300000','5,68666666666667000000','5,68666666666667000000','5,68666666666667000000','0,03000000000000000000','Tr','Tr','0,43666666666666700000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','277','Atum, conserva em óleo','64,50000000000000000000','165,91056057890300000000','694,16978546212800000000','26,18750000000000000000','5,99666666666667000000','52,93866666666670000000','0,00000000000000000000','NA','1,53000000000000000000','6,51600000000000000000','29,48150000000000000000','Tr','211,00800000000000000000','1,22975000000000000000','362,14650000000000000000','279,86450000000000000000','0,03775000000000000000','0,58825000000000000000','Tr','Tr','Tr','0,15333333333333300000','0,03000000000000000000','Tr','3,16666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','278','Atum, fresco, cru','73,05333333333330000000','117,50100000000000000000','491,62418400000000000000','25,68000000000000000000','0,87000000000000000000','47,80000000000000000000','0,00000000000000000000','NA','1,30666666666667000000','6,69000000000000000000','32,22666666666670000000','Tr','253,85666666666700000000','1,27333333333333000000','30,30333333333330000000','307,76333333333300000000','0,08666666666666670000','0,40000000000000000000','20,30333333333330000000','20,30333333333330000000','20,00000000000000000000','Tr','0,04000000000000000000','Tr','5,94000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','279','Bacalhau, salgado, cru','47,88666666666670000000','135,89296666666700000000','568,57617253333300000000','29,03666666666670000000','1,32000000000000000000','138,88000000000000000000','0,00000000000000000000','NA','22,50000000000000000000','156,96666666666700000000','49,47333333333330000000','0,02533333333333330000','186,20666666666700000000','0,85333333333333300000','13585,05666666670000000000','433,89666666666700000000','0,09333333333333330000','0,67000000000000000000','Tr','Tr','Tr','Tr','0,21000000000000000000','Tr','*','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','280','Bacalhau, salgado, refogado','65,90900000000000000000','139,66070105354000000000','584,34037320801100000000','23,97916666666670000000','3,60666666666667000000','111,96833333333300000000','1,22416666666668000000','*','5,28100000000000000000','59,12366666666670000000','15,05650000000000000000','Tr','51,34233333333330000000','0,15266666666666700000','1256,27666666667000000000','50,22466666666670000000','0,04333333333333330000','0,55600000000000000000','Tr','Tr','Tr','0,03333333333333330000','0,05000000000000000000','Tr','5,16666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','281','Cação, posta, com farinha de trigo, frita','60,62333333333330000000','208,33274372597500000000','871,66419974948100000000','24,95208333333330000000','9,95433333333333000000','74,90733333333330000000','3,10058333333333000000','0,53666666666666700000','1,36966666666667000000','30,44200000000000000000','25,50700000000000000000','0,06233333333333330000','461,56933333333300000000','0,99833333333333300000','160,03166666666700000000','419,89033333333300000000','Tr','0,55400000000000000000','17,37666666666670000000','17,37666666666670000000','17,37666666666670000000','Tr','Tr','Tr','0,77000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','282','Cação, posta, cozida','75,92833333333330000000','116,01448068765800000000','485,40458719716100000000','25,58958333333330000000','0,74800000000000000000','83,25000000000000000000','0,00000000000000000000','NA','1,18000000000000000000','10,32466666666670000000','21,12266666666670000000','Tr','203,71200000000000000000','0,31700000000000000000','114,90533333333300000000','248,64000000000000000000','0,03033333333333330000','0,60566666666666700000','11,62333333333330000000','11,62333333333330000000','12,00000000000000000000','Tr','0,04000000000000000000','Tr','9,76666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','283','Cação, posta, crua','81,37666666666670000000','83,33302501956620000000','348,66537668186500000000','17,85416666666670000000','0,78666666666666700000','36,12866666666670000000','0,00000000000000000000','NA','1,24333333333333000000','8,70366666666667000000','19,29900000000000000000','0,03533333333333330000','181,45366666666700000000','0,20400000000000000000','176,02366666666700000000','299,02400000000000000000','0,12800000000000000000','0,31666666666666700000','5,99666666700000000000','5,99666666700000000000','5,99666666700000000000','0,03666666666666670000','Tr','Tr','1,31000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','284','Camarão, Rio Grande, grande, cozido','78,70700000000000000000','90,01368009630840000000','376,61723752295400000000','18,96666666666670000000','1,00066666666667000000','240,85466666666700000000','0,00000000000000000000','NA','1,73433333333333000000','89,74400000000000000000','18,91158333333330000000','0,05800000000000000000','265,85333333333300000000','1,27800000000000000000','366,55200000000000000000','101,73500000000000000000','0,16933333333333300000','1,23766666666667000000','Tr','Tr','Tr','Tr','Tr','Tr','1,06666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','285','Camarão, Rio Grande, grande, cru','89,13366666666670000000','47,18343670543040000000','197,41549917552100000000','9,99166666666667000000','0,50100000000000000000','123,98700000000000000000','0,00000000000000000000','NA','0,79733333333333300000','51,11633333333330000000','27,36700000000000000000','0,03533333333333330000','233,92250000000000000000','0,66866666666666700000','201,12800000000000000000','72,00533333333330000000','0,11166666666666700000','0,71366666666666700000','20,00000000000000000000','20,00000000000000000000','20,00000000000000000000','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','286','Camarão, Sete Barbas, sem cabeça, com casca, frito','61,03933333333330000000','231,24615385087300000000','967,53390771205400000000','18,38750000000000000000','15,62033333333330000000','283,13533333333300000000','2,87983333333333000000','NA','2,07300000000000000000','959,70133333333400000000','73,97166666666670000000','0,37933333333333300000','336,98933333333300000000','2,43900000000000000000','99,05500000000000000000','106,77366666666700000000','0,18766666666666700000','1,09800000000000000000','Tr','Tr','Tr','0,05333333333333330000','Tr','Tr','0,35000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','287','Caranguejo, cozido','76,99666666666670000000','82,72150150783860000000','346,10676230879700000000','18,47916666666670000000','0,42300000000000000000','84,60533333333330000000','0,00000000000000000000','NA','3,54533333333333000000','357,15266666666700000000','52,22533333333330000000','0,07266666666666670000','153,68933333333300000000','2,86166666666667000000','360,10566666666700000000','185,83133333333300000000','0,72000000000000000000','5,65000000000000000000','Tr','Tr','Tr','0,04000000000000000000','0,31000000000000000000','Tr','4,16666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','288','Corimba, cru','75,64333333333330000000','128,15540000000000000000','536,20219360000000000000','17,36666666666670000000','5,98666666666667000000','40,23000000000000000000','-0,02666666666666620000','NA','1,03000000000000000000','40,05333333333330000000','22,76666666666670000000','0,02000000000000000000','190,07000000000000000000','0,50333333333333300000','47,01000000000000000000','316,73666666666700000000','0,03333333333333330000','0,40000000000000000000','Tr','Tr','Tr','Tr','Tr','Tr','1,87333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','289','Corimbatá, assado','59,92666666666670000000','261,45243941056700000000','1093,91700649381000000000','19,89791666666670000000','19,56633333333330000000','80,09100000000000000000','0,00000000000000000000','NA','0,96000000000000000000','22,30433333333330000000','24,21200000000000000000','0,01333333333333330000','220,64133333333300000000','0,97133333333333300000','40,42600000000000000000','326,49733333333300000000','0,03166666666666670000','0,74766666666666700000','Tr','Tr','Tr','0,13333333333333300000','0,06000000000000000000','Tr','2,69666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','290','Corimbatá, cozido','64,56200000000000000000','238,69610486733900000000','998,70450276494700000000','20,13125000000000000000','16,93300000000000000000','74,61733333333330000000','0,00000000000000000000','NA','0,83766666666666700000','64,68566666666670000000','22,82900000000000000000','0,02133333333333330000','185,26500000000000000000','0,62266666666666700000','37,16566666666670000000','253,99200000000000000000','0,05233333333333330000','0,95400000000000000000','Tr','Tr','Tr','Tr','Tr','Tr','2,09333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','291','Corvina de água doce, crua','79,24666666666670000000','101,00903333333300000000','422,62179546666700000000','18,91666666666670000000','2,24333333333333000000','73,11000000000000000000','0,00000000000000000000','NA','1,02333333333333000000','39,43000000000000000000','24,50000000000000000000','0,02000000000000000000','153,82333333333300000000','0,25666666666666700000','45,09000000000000000000','293,02333333333300000000','0,02000000000000000000','0,36000000000000000000','8,12000000000000000000','8,12000000000000000000','8,12000000000000000000','Tr','0,08000000000000000000','Tr','*','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','292','Corvina do mar, crua','79,35333333333330000000','94,00000000000000000000','391,52017093333300000000','18,57000000000000000000','1,58333333333333000000','67,07000000000000000000','0,00000000000000000000','NA','1,08333333333333000000','*','23,75000000000000000000','0,01000000000000000000','183,08000000000000000000','0,37666666666666700000','67,97000000000000000000','338,70333333333300000000','0,02666666666666670000','0,35666666666666700000','65,01666666666670000000','65,01666666666670000000','65,01666666666670000000','0,12000000000000000000','0,05333333333333330000','Tr','2,62333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','293','Corvina grande, assada','69,02633333333330000000','146,52814112536100000000','613,07374246851100000000','26,76666666666670000000','3,57366666666667000000','117,05000000000000000000','0,00000000000000000000','NA','1,34700000000000000000','60,22500000000000000000','24,10133333333330000000','0,02500000000000000000','175,89800000000000000000','0,53833333333333300000','85,35200000000000000000','291,46000000000000000000','0,02033333333333330000','0,67466666666666700000','Tr','Tr','Tr','0,11333333333333300000','0,10000000000000000000','Tr','4,23333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','294','Corvina grande, cozida','73,60933333333330000000','100,07812455296500000000','418,72687312960600000000','23,43750000000000000000','2,56266666666667000000','122,55600000000000000000','0,00000000000000000000','NA','0,90400000000000000000','69,37366666666670000000','22,22266666666670000000','0,01866666666666670000','163,55500000000000000000','0,57866666666666700000','68,39000000000000000000','194,03533333333300000000','0,02533333333333330000','0,68866666666666700000','6,27666666666667000000','6,27666666666667000000','6,27666666666667000000','Tr','0,03333333333333330000','Tr','0,77000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','295','Dourada de água doce, fresca','76,16000000000000000000','131,20831472377000000000','548,97558880425300000000','18,81041666666670000000','5,64166666666667000000','51,98933333333330000000','0,00000000000000000000','NA','1,07100000000000000000','12,13300000000000000000','26,26266666666670000000','0,01033333333333330000','189,27166666666700000000','0,15200000000000000000','40,29766666666670000000','392,50566666666700000000','0,02033333333333330000','0,47700000000000000000','Tr','Tr','Tr','Tr','Tr','Tr','3,70333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','296','Lambari, congelado, cru','71,88666666666670000000','130,84031100948700000000','547,43586126369200000000','16,81250000000000000000','6,54666666666667000000','158,66133333333300000000','0,00000000000000000000','NA','3,57000000000000000000','1181,27700000000000000000','44,69300000000000000000','0,27800000000000000000','696,15166666666700000000','0,90566666666666700000','47,92000000000000000000','244,40133333333300000000','0,09400000000000000000','3,33666666666667000000','4,30666666666667000000','4,30666666666667000000','4,30666666666667000000','0,05333333333333330000','Tr','Tr','3,30000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','297','Lambari, congelado, frito','40,13800000000000000000','326,86839988660800000000','1367,61738512557000000000','28,42500000000000000000','22,78200000000000000000','246,32333333333300000000','0,00000000000000000000','NA','6,16700000000000000000','1881,03900000000000000000','66,29066666666670000000','0,33733333333333300000','1067,27766666667000000000','0,81333333333333300000','64,55166666666670000000','331,16900000000000000000','0,30633333333333300000','5,62500000000000000000','9,44666666666667000000','9,44666666666667000000','9,44666666666667000000','0,25333333333333300000','0,03000000000000000000','0,04000000000000000000','8,93333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','298','Lambari, fresco, cru','72,16566666666670000000','151,59834650321800000000','634,28748176946400000000','15,65208333333330000000','9,39733333333333000000','144,25466666666700000000','0,00000000000000000000','NA','2,21100000000000000000','590,27200000000000000000','31,60766666666670000000','0,41300000000000000000','440,93133333333300000000','0,63133333333333300000','41,10933333333330000000','207,35833333333300000000','0,05233333333333330000','2,41800000000000000000','Tr','Tr','Tr','Tr','0,03000000000000000000','0,07333333333333340000','1,85666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','299','Manjuba, com farinha de trigo, frita','41,30500000000000000000','343,55045872306800000000','1437,41511929732000000000','23,45000000000000000000','22,59300000000000000000','281,75500000000000000000','10,24033333333330000000','0,36333333333333300000','2,41166666666667000000','763,30733333333300000000','46,89666666666670000000','0,35566666666666700000','577,93500000000000000000','3,04133333333333000000','36,52000000000000000000','319,26500000000000000000','0,15400000000000000000','3,76733333333333000000','29,94333333333330000000','29,94333333333330000000','29,94333333333330000000','0,05000000000000000000','0,06666666666666670000','Tr','0,78666666666666700000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','300','Manjuba, frita','40,68066666666670000000','349,32523145536600000000','1461,57676840925000000000','30,13958333333330000000','24,46000000000000000000','270,34033333333300000000','0,00000000000000000000','NA','4,22533333333333000000','575,02900000000000000000','31,65800000000000000000','0,20733333333333300000','735,42633333333300000000','0,91633333333333300000','40,61000000000000000000','318,18000000000000000000','0,13766666666666700000','3,23500000000000000000','12,06666666666670000000','12,06666666666670000000','12,06666666666670000000','0,03000000000000000000','0,03333333333333330000','Tr','7,26666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','301','Merluza, filé, assado','70,72733333333330000000','121,91021833333300000000','510,07235350666700000000','26,60416666666670000000','0,92133333333333400000','90,97166666666660000000','0,00000000000000000000','NA','1,23933333333333000000','35,90566666666670000000','20,26833333333330000000','0,03166666666666670000','273,20300000000000000000','0,37133333333333300000','119,94866666666700000000','363,57000000000000000000','0,03100000000000000000','0,88733333333333300000','Tr','Tr','Tr','0,05000000000000000000','Tr','Tr','7,96666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','302','Merluza, filé, cru','82,07333333333330000000','89,13086666666670000000','372,92354613333300000000','16,60666666666670000000','2,02000000000000000000','57,18000000000000000000','0,00000000000000000000','NA','1,14333333333333000000','20,40000000000000000000','27,02000000000000000000','0,01000000000000000000','184,57000000000000000000','0,18666666666666700000','79,50333333333330000000','339,52666666666700000000','Tr','0,32666666666666700000','Tr','Tr','Tr','Tr','Tr','Tr','1,34333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','303','Merluza, filé, frito','63,46166666666670000000','191,62747837583200000000','801,76936952448200000000','26,92916666666670000000','8,49666666666667000000','109,10433333333300000000','0,00000000000000000000','NA','1,53133333333333000000','35,62766666666670000000','38,13600000000000000000','0,02333333333333330000','278,92733333333300000000','0,38333333333333300000','89,96133333333330000000','446,61933333333300000000','0,02700000000000000000','0,55733333333333300000','Tr','Tr','Tr','0,05000000000000000000','Tr','Tr','0,77000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','304','Pescada, branca, crua','79,57000000000000000000','110,87630000000000000000','463,90643920000000000000','16,26333333333330000000','4,59333333333333000000','50,77000000000000000000','0,00000000000000000000','NA','0,93666666666666700000','15,74000000000000000000','19,20333333333330000000','0,01000000000000000000','135,85333333333300000000','0,16333333333333300000','76,16666666666670000000','261,39666666666700000000','Tr','0,25000000000000000000','2,77000000000000000000','2,77000000000000000000','2,77000000000000000000','Tr','0,04000000000000000000','Tr','0,60333333333333300000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','305','Pescada, branca, frita','57,00333333333330000000','223,03973236930400000000','933,19824023316700000000','27,35625000000000000000','11,77700000000000000000','165,43966666666700000000','0,00000000000000000000','NA','3,23900000000000000000','378,27000000000000000000','30,07666666666670000000','0,05533333333333330000','504,10333333333300000000','0,50666666666666700000','107,23266666666700000000','355,14966666666700000000','0,08466666666666670000','1,12433333333333000000','39,35000000000000000000','39,35000000000000000000','39,35000000000000000000','0,08000000000000000000','0,11333333333333300000','Tr','8,06666666666666000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','306','Pescada, filé, com farinha de trigo, frito','53,20200000000000000000','283,42521443196100000000','1185,85109718333000000000','21,43541666666670000000','19,11500000000000000000','72,97133333333330000000','5,03325000000001000000','Tr','1,21433333333333000000','26,43433333333330000000','28,39700000000000000000','0,06633333333333330000','216,37433333333300000000','0,93733333333333300000','90,50666666666670000000','216,37433333333300000000','0,03100000000000000000','0,42966666666666700000','17,50000000000000000000','17,50000000000000000000','17,50000000000000000000','Tr','0,03000000000000000000','Tr','0,60333333333333300000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','307','Pescada, filé, cru','79,52000000000000000000','107,20556666666700000000','448,54809093333300000000','16,65000000000000000000','4,00333333333333000000','64,84000000000000000000','0,00000000000000000000','NA','0,90000000000000000000','13,54666666666670000000','22,80000000000000000000','0,01000000000000000000','141,25000000000000000000','0,17333333333333300000','77,49666666666670000000','253,05666666666700000000','Tr','0,25333333333333300000','47,86000000000000000000','47,86000000000000000000','47,86000000000000000000','Tr','0,04666666666666670000','Tr','3,10333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','308','Pescada, filé, frito','66,80400000000000000000','154,27002500000000000000','645,46578460000000000000','28,58750000000000000000','3,57000000000000000000','80,80533333333330000000','0,00000000000000000000','NA','1,65600000000000000000','10,32466666666670000000','21,12266666666670000000','Tr','203,71200000000000000000','0,32033333333333300000','114,90533333333300000000','248,64000000000000000000','0,03033333333333330000','0,60566666666666700000','4,21666666666667000000','4,21666666666667000000','4,21666666666667000000','0,14000000000000000000','Tr','Tr','8,86666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','309','Pescada, filé, molho escabeche','74,53233333333330000000','141,95832287502300000000','593,95362290909600000000','11,75000000000000000000','8,02400000000000000000','43,39533333333330000000','5,01533333333334000000','0,78000000000000000000','0,67833333333333300000','20,11633333333330000000','18,06300000000000000000','0,07633333333333330000','105,46433333333300000000','1,47433333333333000000','51,28766666666670000000','208,24300000000000000000','0,36466666666666700000','0,29000000000000000000','19,18666666666670000000','','','Tr','0,03000000000000000000','Tr','1,10333333333333000000','6,89333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','310','Pescadinha, crua','80,62333333333330000000','76,40890833333330000000','319,69487246666700000000','15,47916666666670000000','1,14333333333333000000','83,60700000000000000000','0,00000000000000000000','NA','2,02000000000000000000','331,59733333333300000000','33,77500000000000000000','0,06566666666666670000','326,81866666666700000000','0,54700000000000000000','120,33866666666700000000','303,83100000000000000000','0,10146666666666700000','0,55166666666666700000','Tr','Tr','Tr','0,08333333333333330000','Tr','Tr','6,60000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','311','Pintado, assado','56,98000000000000000000','191,55914112758600000000','801,48344647782100000000','36,45000000000000000000','3,98200000000000000000','125,95966666666700000000','0,00000000000000000000','NA','2,02666666666667000000','113,54200000000000000000','42,35766666666670000000','0,08133333333333330000','331,79700000000000000000','0,77700000000000000000','80,95266666666670000000','527,15300000000000000000','0,03633333333333330000','2,09900000000000000000','6,56666666666667000000','6,56666666666667000000','6,56666666666667000000','0,03000000000000000000','Tr','Tr','6,63333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','312','Pintado, cru','80,27000000000000000000','91,08323333333330000000','381,09224826666700000000','18,55666666666670000000','1,31333333333333000000','50,30000000000000000000','0,00000000000000000000','NA','1,08333333333333000000','12,00333333333330000000','23,69666666666670000000','0,01000000000000000000','174,47333333333300000000','0,21666666666666700000','43,33666666666670000000','293,64666666666700000000','0,03000000000000000000','0,39333333333333300000','Tr','Tr','Tr','Tr','Tr','Tr','4,95333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','313','Pintado, grelhado','65,49433333333330000000','152,19008833333300000000','636,76332958666700000000','30,79583333333330000000','2,29400000000000000000','99,30266666666670000000','0,00000000000000000000','NA','1,57366666666667000000','68,97633333333330000000','26,74033333333330000000','0,03033333333333330000','237,29366666666700000000','0,47533333333333300000','53,08866666666670000000','360,15333333333300000000','0,03766666666666670000','0,75633333333333300000','5,13333330000000000000','5,13333330000000000000','5,13333330000000000000','0,03000000000000000000','Tr','Tr','2,86666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','314','Porquinho, cru','79,16666666666670000000','93,02456666666670000000','389,21478693333300000000','20,49000000000000000000','0,61333333333333300000','48,61000000000000000000','0,00000000000000000000','NA','1,25666666666667000000','25,88333333333330000000','24,35000000000000000000','0,05333333333333330000','207,30333333333300000000','0,38666666666666700000','66,73000000000000000000','313,41666666666700000000','0,03666666666666670000','0,65666666666666700000','4,65333333333333000000','4,65333333333333000000','4,65333333333333000000','Tr','Tr','Tr','1,19333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','315','Salmão, filé, com pele, fresco,  grelhado','60,92733333333330000000','228,73177513531800000000','957,01374716617200000000','23,91875000000000000000','14,03533333333330000000','85,30966666666670000000','0,00000000000000000000','NA','1,29033333333333000000','28,75733333333330000000','27,78600000000000000000','0,01566666666666670000','299,72333333333300000000','0,54366666666666700000','85,13500000000000000000','383,93633333333300000000','0,04333333333333330000','0,55966666666666700000','Tr','Tr','Tr','0,12666666666666700000','0,06000000000000000000','Tr','5,34666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','316','Salmão, sem pele, fresco, cru','68,98400000000000000000','169,78157991055600000000','710,36613034576800000000','19,25208333333330000000','9,70900000000000000000','53,02700000000000000000','0,00000000000000000000','NA','1,22233333333333000000','8,74800000000000000000','27,42166666666670000000','Tr','258,79900000000000000000','0,24000000000000000000','64,24166666666670000000','376,49566666666700000000','0,02233333333333330000','0,34400000000000000000','Tr','Tr','Tr','0,19666666666666700000','0,03000000000000000000','Tr','3,21000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','317','Salmão, sem pele, fresco, grelhado','58,12800000000000000000','242,70656948709500000000','1015,48428673401000000000','26,14166666666670000000','14,53233333333330000000','72,81566666666670000000','0,00000000000000000000','NA','1,61366666666667000000','15,08600000000000000000','37,86033333333330000000','0,01266666666666670000','352,15833333333300000000','0,37266666666666700000','95,81133333333330000000','517,90200000000000000000','0,03666666666666670000','0,49733333333333300000','Tr','Tr','Tr','0,23333333333333300000','0,03000000000000000000','Tr','6,30333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','318','Sardinha, assada','60,08000000000000000000','164,35078833333300000000','687,64369838666700000000','32,17916666666670000000','2,98733333333333000000','108,98933333333300000000','0,00000000000000000000','NA','4,35233333333333000000','437,72733333333300000000','51,36133333333330000000','0,24200000000000000000','577,78033333333300000000','1,25100000000000000000','74,46833333333330000000','574,33866666666700000000','0,13733333333333300000','1,82033333333333000000','Tr','Tr','Tr','0,06333333333333330000','Tr','Tr','5,83333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','319','Sardinha, conserva em óleo','55,14266666666670000000','284,98100487124900000000','1192,36052438131000000000','15,93958333333330000000','24,04866666666670000000','72,56700000000000000000','0,00000000000000000000','NA','2,86466666666667000000','550,24333333333300000000','35,27000000000000000000','0,11266666666666700000','496,37333333333300000000','3,53733333333333000000','665,84033333333300000000','367,13366666666700000000','0,03366666666666670000','1,63833333333333000000','Tr','Tr','Tr','0,41666666666666700000','0,03666666666666670000','Tr','6,55333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','320','Sardinha, frita','48,48900000000000000000','257,04070000000000000000','1075,45828880000000000000','33,38333333333330000000','12,69333333333330000000','102,87466666666700000000','0,00000000000000000000','NA','4,30166666666667000000','482,07466666666700000000','38,83266666666670000000','0,24666666666666700000','628,76400000000000000000','1,12366666666667000000','60,09900000000000000000','459,94266666666700000000','0,14266666666666700000','1,64266666666667000000','Tr','Tr','Tr','0,06333333333333330000','Tr','Tr','7,10000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','321','Sardinha, inteira, crua','76,64000000000000000000','113,90036666666700000000','476,55913413333300000000','21,07666666666670000000','2,65000000000000000000','60,50000000000000000000','0,00000000000000000000','NA','1,60000000000000000000','167,33333333333300000000','28,52666666666670000000','0,09666666666666670000','293,89666666666700000000','1,33666666666667000000','60,38666666666670000000','312,37000000000000000000','0,13000000000000000000','1,29000000000000000000','Tr','Tr','Tr','Tr','0,07000000000000000000','Tr','7,70000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Pescados e frutos do mar','322','Tucunaré, filé, congelado, cru','79,88333333333330000000','87,68648354927700000000','366,88024717017500000000','17,95833333333330000000','1,22000000000000000000','46,89733333333330000000','-0,04500000000000790000','NA','0,98333333333333300000','19,22033333333330000000','25,64100000000000000000','0,01100000000000000000','167,86666666666700000000','0,26933333333333300000','56,55433333333330000000','288,06300000000000000000','0,09533333333333330000','0,44100000000000000000','Tr','Tr','Tr','Tr','0,05000000000000000000','Tr','0,90000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','323','Apresuntado','73,72000000000000000000','128,85725581200900000000','539,13875831744600000000','13,45000000000000000000','6,69066666666667000000','37,67100000000000000000','2,86200000000000000000','NA','3,27733333333333000000','22,57733333333330000000','15,26200000000000000000','0,03933333333333330000','225,38600000000000000000','0,87766666666666700000','942,93300000000000000000','270,07366666666700000000','0,02933333333333330000','1,64966666666667000000','Tr','','','0,62333333333333300000','0,03666666666666670000','Tr','0,69666666666666700000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','324','Caldo de carne, tablete','2,93000000000000000000','240,62333333333300000000','1006,76802666667000000000','7,82000000000000000000','16,57000000000000000000','Tr','15,05333333333330000000','0,57666666666666700000','57,62666666666670000000','129,03000000000000000000','22,06000000000000000000','0,02100000000000000000','123,04000000000000000000','Tr','22179,66666666670000000000','218,15333333333300000000','Tr','Tr','Tr',' ','','0,70333333333333300000','0,07000000000000000000','0,26666666666666700000','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','325','Caldo de galinha, tablete','3,38266666666667000000','251,44566666666700000000','1052,04866933333000000000','6,27916666666667000000','20,41633333333330000000','2,11266666666667000000','10,64550000000000000000','11,81066666666670000000','59,27633333333330000000','16,36000000000000000000','12,79066666666670000000','0,13000000000000000000','48,05733333333330000000','0,68933333333333300000','22299,90033333330000000000','68,02800000000000000000','Tr','0,25800000000000000000','Tr',' ',' ','0,05000000000000000000','0,03666666666666670000','Tr','*','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','326','Carne, bovina, acém, moído, cozido','61,62000000000000000000','212,42040000000000000000','888,76695360000000000000','26,68666666666670000000','10,91666666666670000000','103,13000000000000000000','0,00000000000000000000','NA','0,84000000000000000000','4,02666666666667000000','17,07000000000000000000','0,01300000000000000000','164,44333333333300000000','2,65333333333333000000','52,35666666666670000000','255,70666666666700000000','0,06333333333333330000','8,10000000000000000000','Tr','Tr','Tr','Tr','0,31666666666666700000','Tr','1,76333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','327','Carne, bovina, acém, moído, cru','72,70333333333330000000','136,56233333333300000000','571,37680266666700000000','19,42000000000000000000','5,94666666666667000000','57,94000000000000000000','0,00000000000000000000','NA','0,93333333333333300000','2,61000000000000000000','14,13666666666670000000','Tr','157,61333333333300000000','1,76333333333333000000','48,61333333333330000000','237,30333333333300000000','0,07566666666666670000','6,33333333333333000000','2,32000000000000000000','2,32000000000000000000','2,32000000000000000000','0,15333333333333300000','0,21333333333333300000','0,03000000000000000000','4,33000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','328','Carne, bovina, acém, sem gordura, cozido','60,38333333333330000000','214,61056666666700000000','897,93061093333300000000','27,27000000000000000000','10,88333333333330000000','106,75000000000000000000','0,00000000000000000000','NA','0,83000000000000000000','7,11000000000000000000','14,44000000000000000000','Tr','164,20000000000000000000','2,36666666666667000000','56,17333333333330000000','254,42333333333300000000','0,07333333333333340000','7,97000000000000000000','Tr','Tr','Tr','Tr','0,04000000000000000000','0,07000000000000000000','1,62666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','329','Carne, bovina, acém, sem gordura, cru','71,51666666666670000000','144,02943333333300000000','602,61914906666700000000','20,81666666666670000000','6,11333333333333000000','53,37000000000000000000','0,00000000000000000000','NA','0,96000000000000000000','4,71666666666667000000','13,27666666666670000000','Tr','144,18666666666700000000','1,51333333333333000000','49,84666666666670000000','233,65000000000000000000','0,03666666666666670000','5,21333333333333000000','2,17333333333333000000','2,17333333333333000000','2,17333333333333000000','0,11666666666666700000','0,11666666666666700000','Tr','2,33000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','330','Carne, bovina, almôndegas, cruas','64,28333333333330000000','189,25666666666700000000','791,84989333333300000000','12,31250000000000000000','11,20333333333330000000','33,59895000000000000000','9,79416666666666000000','*','2,40666666666667000000','22,23166666666670000000','23,75066666666670000000','0,16666666666666700000','144,92566666666700000000','1,56233333333333000000','621,25166666666700000000','328,24066666666700000000','0,14600000000000000000','2,33333333333333000000','Tr',' ',' ','0,11000000000000000000','0,04000000000000000000','Tr','2,20000000000000000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','331','Carne, bovina, almôndegas, fritas','48,08766666666670000000','271,81300000000000000000','1137,26559200000000000000','18,15625000000000000000','15,78233333333330000000','36,38066666666670000000','14,28675000000000000000','*','3,68700000000000000000','26,75933333333330000000','48,11966666666670000000','0,40733333333333300000','244,30333333333300000000','1,91166666666667000000','1030,25566666667000000000','536,09933333333400000000','0,18700000000000000000','2,60833333333333000000','Tr',' ',' ','0,13333333333333300000','0,07000000000000000000','Tr','6,60000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','332','Carne, bovina, bucho, cozido','74,12333333333330000000','133,02286666666700000000','556,56767413333300000000','21,64000000000000000000','4,50333333333333000000','245,46700000000000000000','0,00000000000000000000','NA','0,32000000000000000000','13,21000000000000000000','7,41333333333333000000','0,01000000000000000000','62,62666666666670000000','0,57666666666666700000','38,20333333333330000000','69,81000000000000000000','0,05000000000000000000','2,49333333333333000000','Tr','Tr','Tr','Tr','Tr','Tr','2,18000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','333','Carne, bovina, bucho, cru','74,96666666666670000000','137,30316666666700000000','574,47644933333300000000','20,53000000000000000000','5,50333333333333000000','144,90000000000000000000','0,00000000000000000000','NA','0,37000000000000000000','9,07333333333333000000','6,40333333333333000000','0,01000000000000000000','61,42333333333330000000','0,47333333333333300000','45,00333333333330000000','84,56666666666670000000','0,06000000000000000000','2,12666666666667000000','Tr','Tr','Tr','Tr','Tr','Tr','2,13333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','334','Carne, bovina, capa de contra-filé, com gordura, crua','64,77333333333330000000','216,90896666666700000000','907,54711653333400000000','19,19666666666670000000','14,96000000000000000000','62,81000000000000000000','0,00000000000000000000','NA','0,89666666666666700000','5,86000000000000000000','17,45333333333330000000','0,00600000000000000000','144,19000000000000000000','1,51000000000000000000','57,54000000000000000000','266,88666666666700000000','0,05766666666666670000','3,54333333333333000000','3,76333333333333000000','3,76333333333333000000','3,76333333333333000000','0,08666666666666670000','0,08700000000000000000','0,12000000000000000000','1,55000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','335','Carne, bovina, capa de contra-filé, com gordura, grelhada','47,88000000000000000000','311,70266666666700000000','1304,16395733333000000000','30,68666666666670000000','20,03000000000000000000','120,43000000000000000000','0,00000000000000000000','NA','1,13333333333333000000','7,25666666666667000000','18,38000000000000000000','Tr','213,62666666666700000000','2,59000000000000000000','80,51333333333330000000','323,45333333333300000000','0,12666666666666700000','6,19666666666667000000','Tr','Tr','Tr','Tr','0,06333333333333330000','Tr','1,74333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','336','Carne, bovina, capa de contra-filé, sem gordura, crua','72,98666666666670000000','131,06246666666700000000','548,36536053333300000000','21,54000000000000000000','4,33333333333333000000','58,35000000000000000000','0,00000000000000000000','NA','1,00000000000000000000','6,49666666666667000000','19,58666666666670000000','Tr','178,22666666666700000000','2,03666666666667000000','79,17333333333330000000','325,43000000000000000000','0,06000000000000000000','4,58666666666667000000','Tr','Tr','Tr','Tr','0,03666666666666670000','Tr','1,81000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','337','Carne, bovina, capa de contra-filé, sem gordura, grelhada','53,74333333333330000000','239,44363333333300000000','1001,83216186667000000000','35,06333333333330000000','9,95000000000000000000','80,29000000000000000000','-0,00666666666667481000','NA','1,25000000000000000000','8,84333333333333000000','25,61333333333330000000','0,01000000000000000000','287,37666666666700000000','2,84000000000000000000','82,75000000000000000000','384,84333333333300000000','0,12000000000000000000','7,63666666666667000000','Tr','Tr','Tr','0,02666666666666670000','0,07666666666666670000','Tr','1,85666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','338','Carne, bovina, charque, cozido','45,78900000000000000000','262,78014226218100000000','1099,47211522496000000000','36,36458333333330000000','11,91833333333330000000','113,43200000000000000000','0,00000000000000000000','NA','3,62933333333333000000','14,85166666666670000000','12,80733333333330000000','0,01733333333333330000','100,90100000000000000000','3,45166666666667000000','1442,70100000000000000000','89,56933333333340000000','0,06700000000000000000','6,08633333333333000000','Tr','Tr','Tr','0,05000000000000000000','0,07000000000000000000','Tr','1,50000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','339','Carne, bovina, charque, cru','44,46566666666670000000','248,86101810745400000000','1041,23449976159000000000','22,71458333333330000000','16,83700000000000000000','80,68566666666670000000','0,00000000000000000000','NA','14,48700000000000000000','15,17600000000000000000','13,36033333333330000000','Tr','122,29033333333300000000','1,52666666666667000000','5875,02900000000000000000','236,26366666666700000000','0,03333333333333330000','3,89233333333333000000','Tr','Tr','Tr','0,12000000000000000000','0,07000000000000000000','Tr','1,63333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','340','Carne, bovina, contra-filé, à milanesa','42,16466666666670000000','351,59265919899900000000','1471,06368608861000000000','20,61250000000000000000','23,99800000000000000000','99,36033333333330000000','12,17450000000000000000','0,37000000000000000000','1,05033333333333000000','14,67200000000000000000','27,03666666666670000000','0,27300000000000000000','202,95300000000000000000','2,89633333333333000000','77,09333333333330000000','270,96333333333300000000','0,09600000000000000000','2,85800000000000000000','15,08333333333330000000','','','0,07000000000000000000','0,04000000000000000000','Tr','3,01666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','341','Carne, bovina, contra-filé de costela, cru','66,38000000000000000000','202,43740000000000000000','846,99808160000000000000','19,80000000000000000000','13,07000000000000000000','52,31000000000000000000','0,00000000000000000000','NA','0,95333333333333300000','3,16000000000000000000','14,00333333333330000000','Tr','163,84666666666700000000','1,55666666666667000000','38,52333333333330000000','245,07000000000000000000','0,03900000000000000000','4,35000000000000000000','3,05333333333333000000','3,05333333333333000000','3,05333333333333000000','0,13666666666666700000','0,08000000000000000000','Tr','2,67666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','342','Carne, bovina, contra-filé de costela, grelhado','52,19333333333330000000','274,91426666666700000000','1150,24129173333000000000','29,88000000000000000000','16,33333333333330000000','97,87000000000000000000','0,00000000000000000000','NA','1,15333333333333000000','4,28666666666667000000','23,56666666666670000000','0,01000000000000000000','251,89000000000000000000','2,79333333333333000000','50,88333333333330000000','382,74000000000000000000','0,08000000000000000000','6,68000000000000000000','Tr','Tr','Tr','Tr','0,18666666666666700000','0,17330000000000000000','2,75333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','343','Carne, bovina, contra-filé, com gordura, cru','65,74700000000000000000','205,85670000000000000000','861,30443280000000000000','21,15000000000000000000','12,81000000000000000000','72,65000000000000000000','0,00000000000000000000','NA','0,92000000000000000000','3,67300000000000000000','18,15700000000000000000','0,00500000000000000000','164,20300000000000000000','1,31000000000000000000','44,13300000000000000000','284,65300000000000000000','0,03900000000000000000','2,79000000000000000000','3,58700000000000000000','3,58700000000000000000','3,58700000000000000000','0,11000000000000000000','0,08000000000000000000','0,03000000000000000000','3,79000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','344','Carne, bovina, contra-filé, com gordura, grelhado','51,70666666666670000000','278,05356666666700000000','1163,37612293333000000000','32,39666666666670000000','15,49000000000000000000','143,86000000000000000000','0,00000000000000000000','NA','1,21666666666667000000','4,46333333333333000000','18,66000000000000000000','Tr','218,53666666666700000000','2,35333333333333000000','57,06666666666670000000','351,86000000000000000000','0,09333333333333330000','4,78000000000000000000','Tr','Tr','Tr','Tr','0,18333333333333300000','0,13000000000000000000','4,91000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','345','Carne, bovina, contra-filé, sem gordura, cru','69,14333333333330000000','156,61583333333300000000','655,28064666666700000000','23,99666666666670000000','6,00333333333333000000','59,46000000000000000000','0,00000000000000000000','NA','0,98666666666666700000','4,19666666666667000000','20,62666666666670000000','Tr','183,82333333333300000000','1,68000000000000000000','52,89333333333330000000','334,61666666666700000000','0,04666666666666670000','3,24000000000000000000','Tr','Tr','Tr','Tr','0,20000000000000000000','Tr','4,64000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','346','Carne, bovina, contra-filé, sem gordura, grelhado','57,53333333333330000000','193,69156666666700000000','810,40551493333300000000','35,88333333333330000000','4,48666666666667000000','101,90000000000000000000','0,00000000000000000000','NA','1,27333333333333000000','4,99666666666667000000','21,06000000000000000000','Tr','240,60333333333300000000','2,35333333333333000000','57,51000000000000000000','386,47000000000000000000','0,09333333333333330000','5,13666666666667000000','Tr','Tr','Tr','Tr','0,16666666666666700000','0,16000000000000000000','4,93333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','347','Carne, bovina, costela, assada','43,18666666666670000000','373,03886666666700000000','1560,79461813333000000000','28,80666666666670000000','27,72000000000000000000','94,58700000000000000000','0,00000000000000000000','NA','0,98666666666666700000','28,00666666666670000000','19,54666666666670000000','Tr','179,05000000000000000000','2,18000000000000000000','91,86000000000000000000','270,00666666666700000000','0,08333333333333330000','5,45333333333333000000','Tr','Tr','Tr','Tr','0,08333333333333330000','0,35000000000000000000','0,55666666666666700000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','348','Carne, bovina, costela, crua','52,73000000000000000000','357,72246666666700000000','1496,71080053333000000000','16,70666666666670000000','31,75000000000000000000','44,19000000000000000000','0,00000000000000000000','NA','0,90000000000000000000','*','11,67666666666670000000','Tr','129,96666666666700000000','1,20333333333333000000','69,99666666666670000000','151,16000000000000000000','Tr','2,69666666666667000000','4,56666666666667000000','4,56666666666667000000','4,56666666666667000000','0,12000000000000000000','0,11000000000000000000','Tr','5,99000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','349','Carne, bovina, coxão duro, sem gordura, cozido','58,53333333333330000000','216,61606666666700000000','906,32162293333300000000','31,88000000000000000000','8,92333333333333000000','71,10000000000000000000','0,00000000000000000000','NA','0,88000000000000000000','3,98000000000000000000','13,79000000000000000000','Tr','188,96666666666700000000','1,70000000000000000000','41,10000000000000000000','251,66000000000000000000','0,07000000000000000000','4,97333333333333000000','2,06000000000000000000','2,06000000000000000000','2,06000000000000000000','Tr','Tr','Tr','3,26000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','350','Carne, bovina, coxão duro, sem gordura, cru','69,80333333333330000000','147,96633333333300000000','619,09113866666700000000','21,51333333333330000000','6,22000000000000000000','59,98000000000000000000','0,00000000000000000000','NA','1,09333333333333000000','2,95333333333333000000','21,11000000000000000000','Tr','188,51000000000000000000','1,89333333333333000000','48,54666666666670000000','357,87666666666700000000','0,05000000000000000000','2,80666666666667000000','2,06666666666667000000','2,06666666666667000000','2,06666666666667000000','0,11666666666666700000','0,20000000000000000000','Tr','4,37666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','351','Carne, bovina, coxão mole, sem gordura, cozido','58,04333333333330000000','218,67510000000000000000','914,93661840000000000000','32,38333333333330000000','8,91333333333333000000','84,15000000000000000000','0,00000000000000000000','NA','1,23000000000000000000','3,73333333333333000000','13,47000000000000000000','Tr','182,67333333333300000000','2,55666666666667000000','43,50333333333330000000','238,50666666666700000000','0,11333333333333300000','4,69666666666667000000','2,46666666666667000000','2,46666666666667000000','2,46666666666667000000','Tr','Tr','Tr','4,09000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','352','Carne, bovina, coxão mole, sem gordura, cru','68,59666666666670000000','169,06596666666700000000','707,37200453333300000000','21,23000000000000000000','8,69333333333333000000','83,82000000000000000000','0,00000000000000000000','NA','1,04333333333333000000','2,98666666666667000000','20,71666666666670000000','Tr','175,40333333333300000000','1,88666666666667000000','60,53333333333330000000','334,90333333333300000000','0,05000000000000000000','2,63333333333333000000','2,61000000000000000000','2,61000000000000000000','2,61000000000000000000','0,12000000000000000000','0,19333333333333300000','Tr','2,32000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','353','Carne, bovina, cupim, assado','48,41700000000000000000','330,10029083333300000000','1381,13961684667000000000','28,63125000000000000000','23,04266666666670000000','90,80000000000000000000','0,00000000000000000000','NA','0,95933333333333300000','7,62333333333333000000','18,20666666666670000000','Tr','212,27000000000000000000','2,70333333333333000000','71,58666666666670000000','321,07333333333300000000','0,08000000000000000000','5,28666666666667000000','Tr','Tr','Tr','Tr','0,07666666666666670000','0,14000000000000000000','2,16333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','354','Carne, bovina, cupim, cru','64,83000000000000000000','221,39750000000000000000','926,32714000000000000000','19,53666666666670000000','15,29666666666670000000','50,95000000000000000000','0,00000000000000000000','NA','0,88000000000000000000','3,56666666666667000000','12,76000000000000000000','Tr','220,12666666666700000000','1,13000000000000000000','46,86000000000000000000','150,58000000000000000000','0,02866666666666670000','2,42333333333333000000','2,70333333333333000000','2,70333333333333000000','2,70333333333333000000','0,11333333333333300000','0,05000000000000000000','0,03000000000000000000','3,33000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','355','Carne, bovina, fígado, cru','71,33000000000000000000','141,04586666666700000000','590,13590613333300000000','20,71333333333330000000','5,35666666666667000000','392,88300000000000000000','1,10666666666667000000','NA','1,49333333333333000000','4,15666666666667000000','12,42000000000000000000','0,26000000000000000000','334,16333333333300000000','5,62666666666667000000','75,92000000000000000000','264,50000000000000000000','9,00666666666667000000','3,46333333333333000000','7936,70000000000000000000','7936,70000000000000000000','7936,70000000000000000000','0,13666666666666700000','0,90333333333333300000','Tr','10,66000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','356','Carne, bovina, fígado, grelhado','54,97000000000000000000','225,02640000000000000000','941,51045760000000000000','29,86000000000000000000','9,01000000000000000000','601,47000000000000000000','4,20000000000000000000','NA','1,96000000000000000000','5,56000000000000000000','9,69666666666667000000','0,21666666666666700000','419,91666666666700000000','5,79000000000000000000','82,19000000000000000000','309,37000000000000000000','12,57666666666670000000','3,95000000000000000000','14574,00000000000000000000','14574,00000000000000000000','14574,00000000000000000000','0,21333333333333300000','2,69333333333333000000','Tr','11,92333333333330000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','357','Carne, bovina, filé mingnon, sem gordura, cru','71,89000000000000000000','142,86426666666700000000','597,74409173333300000000','21,60000000000000000000','5,61333333333333000000','54,76300000000000000000','0,00000000000000000000','NA','1,07333333333333000000','2,93000000000000000000','21,39000000000000000000','0,00800000000000000000','192,76000000000000000000','1,92000000000000000000','48,86000000000000000000','321,53333333333300000000','0,07966666666666670000','2,75333333333333000000','3,63000000000000000000','3,63000000000000000000','3,63000000000000000000','0,11666666666666700000','0,09666666666666670000','0,04000000000000000000','1,77666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','358','Carne, bovina, filé mingnon, sem gordura, grelhado','56,99666666666670000000','219,70260000000000000000','919,23567840000000000000','32,80000000000000000000','8,83000000000000000000','102,88000000000000000000','0,00000000000000000000','NA','1,32666666666667000000','4,31000000000000000000','28,26000000000000000000','0,02000000000000000000','308,13666666666700000000','2,87000000000000000000','57,90666666666670000000','325,98000000000000000000','0,14000000000000000000','4,13333333333333000000','Tr','Tr','Tr','0,03000000000000000000','0,08000000000000000000','0,04666666666666670000','4,26666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','359','Carne, bovina, flanco, sem gordura, cozido','61,98333333333330000000','195,57536666666700000000','818,28733413333400000000','29,37666666666670000000','7,77000000000000000000','62,00400000000000000000','0,00000000000000000000','NA','0,85666666666666600000','3,53333333333333000000','13,61333333333330000000','Tr','181,45000000000000000000','2,77000000000000000000','41,68000000000000000000','248,80000000000000000000','0,07333333333333340000','5,55333333333333000000','1,76000000000000000000','1,76000000000000000000','1,76000000000000000000','Tr','Tr','Tr','2,32000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','360','Carne, bovina, flanco, sem gordura, cru','72,07000000000000000000','141,46010000000000000000','591,86905840000000000000','19,99666666666670000000','6,21666666666667000000','50,30000000000000000000','0,00000000000000000000','NA','0,97000000000000000000','2,81333333333333000000','17,84666666666670000000','Tr','166,72666666666700000000','1,58000000000000000000','54,22333333333330000000','324,11000000000000000000','0,04666666666666670000','4,45000000000000000000','2,01666666666667000000','2,01666666666667000000','2,01666666666667000000','0,11000000000000000000','0,16333333333333300000','Tr','3,27666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','361','Carne, bovina, fraldinha, com gordura, cozida','49,72333333333330000000','338,44573333333300000000','1416,05694826667000000000','24,24000000000000000000','26,04666666666670000000','64,87000000000000000000','0,00000000000000000000','NA','0,74666666666666700000','3,21333333333333000000','14,47666666666670000000','Tr','160,58000000000000000000','2,03000000000000000000','38,78333333333330000000','206,76333333333300000000','0,07333333333333340000','6,50000000000000000000','Tr','Tr','Tr','Tr','0,05333333333333330000','0,07000000000000000000','1,60666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','362','Carne, bovina, fraldinha, com gordura, crua','65,44333333333330000000','220,72376666666700000000','923,50823973333300000000','17,58333333333330000000','16,14666666666670000000','54,34000000000000000000','0,00000000000000000000','NA','0,85666666666666600000','3,10666666666667000000','16,11666666666670000000','0,00400000000000000000','131,39666666666700000000','1,54333333333333000000','51,20000000000000000000','274,11666666666700000000','0,04466666666666670000','4,19333333333333000000','4,64333333333333000000','4,64333333333333000000','4,64333333333333000000','0,08333333333333330000','0,07333333333333340000','0,03000000000000000000','3,56333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','363','Carne, bovina, lagarto, cozido','57,63000000000000000000','222,46856666666700000000','930,80848293333300000000','32,86333333333330000000','9,10666666666667000000','55,70000000000000000000','0,00000000000000000000','NA','0,87666666666666700000','3,53333333333333000000','12,95666666666670000000','Tr','167,27333333333300000000','1,85000000000000000000','47,54333333333330000000','254,44000000000000000000','0,04666666666666670000','6,96000000000000000000','2,89666666666667000000','2,89666666666667000000','2,89666666666667000000','Tr','Tr','Tr','2,54666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','364','Carne, bovina, lagarto, cru','70,97333333333330000000','134,86456666666700000000','564,27334693333300000000','20,54333333333330000000','5,22666666666667000000','55,79000000000000000000','0,00000000000000000000','NA','1,12333333333333000000','2,59333333333333000000','19,67000000000000000000','Tr','184,72333333333300000000','1,32333333333333000000','53,55666666666670000000','361,84000000000000000000','0,05333333333333330000','2,39333333333333000000','1,99333333333333000000','1,99333333333333000000','1,99333333333333000000','0,10333333333333300000','0,13666666666666700000','0,03333333333333330000','2,19333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','365','Carne, bovina, língua, cozida','53,41333333333330000000','314,90160000000000000000','1317,54829440000000000000','21,36666666666670000000','24,79666666666670000000','105,07000000000000000000','0,00000000000000000000','NA','0,65666666666666700000','5,93000000000000000000','11,54000000000000000000','0,01000000000000000000','136,46333333333300000000','2,07000000000000000000','59,06333333333330000000','175,28666666666700000000','0,08333333333333330000','4,08666666666667000000','Tr','Tr','Tr','Tr','0,07666666666666670000','Tr','1,82666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','366','Carne, bovina, língua, crua','65,01666666666670000000','215,24976666666700000000','900,60502373333300000000','17,09000000000000000000','15,77333333333330000000','117,85000000000000000000','0,00000000000000000000','NA','0,78333333333333300000','5,04333333333333000000','15,30333333333330000000','0,02000000000000000000','163,56666666666700000000','1,70000000000000000000','73,05000000000000000000','250,71333333333300000000','0,09333333333333330000','2,87333333333333000000','Tr','Tr','Tr','0,04666666666666670000','0,04000000000000000000','Tr','1,17666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','367','Carne, bovina, maminha, crua','69,99000000000000000000','152,76586666666700000000','639,17238613333300000000','20,93333333333330000000','7,02666666666667000000','50,80000000000000000000','0,00000000000000000000','NA','1,01666666666667000000','2,83000000000000000000','15,65666666666670000000','Tr','181,32000000000000000000','1,14666666666667000000','37,41666666666670000000','273,65666666666700000000','0,03400000000000000000','3,48000000000000000000','3,17666666666667000000','3,17666666666667000000','3,17666666666667000000','0,11666666666666700000','0,07666666666666670000','0,03000000000000000000','4,27333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','368','Carne, bovina, maminha, grelhada','65,27966666666670000000','153,08967583333300000000','640,52720368666700000000','30,73541666666670000000','2,42233333333333000000','87,70000000000000000000','0,00000000000000000000','NA','1,38766666666667000000','4,17000000000000000000','20,89000000000000000000','Tr','237,48000000000000000000','2,43000000000000000000','58,12000000000000000000','386,41666666666700000000','0,08333333333333330000','5,58000000000000000000','Tr','Tr','Tr','Tr','0,04000000000000000000','0,13000000000000000000','1,45666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','369','Carne, bovina, miolo de alcatra, sem gordura, cru','69,49333333333330000000','162,87123333333300000000','681,45324026666700000000','21,61000000000000000000','7,82666666666667000000','60,37000000000000000000','0,00000000000000000000','NA','1,00666666666667000000','3,18666666666667000000','20,02000000000000000000','0,00766666666666667000','165,09333333333300000000','1,96666666666667000000','43,05333333333330000000','298,74333333333300000000','0,06466666666666670000','2,95666666666667000000','3,51666666666667000000','3,51666666666667000000','3,51666666666667000000','0,12333333333333300000','0,07000000000000000000','Tr','3,59000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','370','Carne, bovina, miolo de alcatra, sem gordura, grelhado','52,43000000000000000000','241,36396666666700000000','1009,86683653333000000000','31,93000000000000000000','11,64333333333330000000','92,20000000000000000000','0,00000000000000000000','NA','1,21666666666667000000','4,51000000000000000000','25,97000000000000000000','0,02000000000000000000','279,23666666666700000000','3,17333333333333000000','51,62000000000000000000','385,11000000000000000000','0,10666666666666700000','4,82333333333333000000','Tr','Tr','Tr','0,03000000000000000000','0,05000000000000000000','0,05000000000000000000','4,66333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','371','Carne, bovina, músculo, sem gordura, cozido','62,82000000000000000000','193,80033333333300000000','810,86059466666700000000','31,23333333333330000000','6,70000000000000000000','56,15000000000000000000','0,00000000000000000000','NA','0,87666666666666700000','4,98333333333333000000','13,41666666666670000000','Tr','175,70000000000000000000','2,36333333333333000000','61,79000000000000000000','252,55666666666700000000','0,08333333333333330000','6,44000000000000000000','1,90666666666667000000','1,90666666666667000000','1,90666666666667000000','Tr','Tr','Tr','1,97333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','372','Carne, bovina, músculo, sem gordura, cru','72,35333333333330000000','141,58100000000000000000','592,37490400000000000000','21,56000000000000000000','5,49000000000000000000','50,94000000000000000000','0,00000000000000000000','NA','0,98666666666666700000','3,64000000000000000000','17,45000000000000000000','Tr','162,18666666666700000000','1,86333333333333000000','66,08000000000000000000','295,83666666666700000000','0,05333333333333330000','3,65000000000000000000','1,91000000000000000000','1,91000000000000000000','1,91000000000000000000','0,09333333333333330000','0,18666666666666700000','0,04000000000000000000','2,78666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','373','Carne, bovina, paleta, com gordura, crua','70,62000000000000000000','158,70990000000000000000','664,04222160000000000000','21,41000000000000000000','7,46000000000000000000','58,26166666666670000000','0,00000000000000000000','NA','0,92000000000000000000','4,36000000000000000000','14,15000000000000000000','Tr','157,60000000000000000000','1,76000000000000000000','64,90000000000000000000','249,68000000000000000000','0,08000000000000000000','3,65000000000000000000','Tr','Tr','Tr','Tr','0,04000000000000000000',',0,02','0,91000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','374','Carne, bovina, paleta, sem gordura, cozida','62,94333333333330000000','193,65240000000000000000','810,24164160000000000000','29,72000000000000000000','7,40000000000000000000','55,61000000000000000000','0,00000000000000000000','NA','0,84666666666666700000','5,64333333333333000000','17,66000000000000000000','Tr','197,45000000000000000000','2,17000000000000000000','57,62333333333330000000','249,80666666666700000000','0,09666666666666670000','6,81666666666667000000','Tr','Tr','Tr','0,03333333333333330000','0,04333333333333330000','Tr','2,16333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','375','Carne, bovina, paleta, sem gordura, crua','72,08333333333330000000','140,94150000000000000000','589,69923600000000000000','21,03000000000000000000','5,67000000000000000000','42,25000000000000000000','0,00000000000000000000','NA','0,98000000000000000000','3,62000000000000000000','17,51333333333330000000','Tr','163,35666666666700000000','1,92666666666667000000','65,86000000000000000000','319,43000000000000000000','0,05000000000000000000','3,33666666666667000000','3,27000000000000000000','3,27000000000000000000','3,27000000000000000000','0,12666666666666700000','0,21333333333333300000','Tr','2,66666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','376','Carne, bovina, patinho, sem gordura, cru','72,90666666666670000000','133,46890000000000000000','558,43387760000000000000','21,72333333333330000000','4,51333333333333000000','55,61000000000000000000','0,00000000000000000000','NA','1,00666666666667000000','3,29666666666667000000','20,10333333333330000000','0,00833333333333333000','170,37000000000000000000','1,78000000000000000000','49,13000000000000000000','317,61333333333300000000','0,05266666666666670000','4,47000000000000000000','1,50666666666667000000','1,50666666666667000000','1,50666666666667000000','0,11333333333333300000','0,08333333333333330000','Tr','3,61000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','377','Carne, bovina, patinho, sem gordura, grelhado','55,15000000000000000000','219,25926666666700000000','917,38077173333300000000','35,90000000000000000000','7,31333333333333000000','125,68000000000000000000','0,00000000000000000000','NA','1,30333333333333000000','4,79666666666667000000','27,26333333333330000000','0,02000000000000000000','288,83666666666700000000','3,03333333333333000000','60,29333333333330000000','420,96000000000000000000','0,12333333333333300000','8,09333333333333000000','Tr','Tr','Tr','0,03666666666666670000','0,03000000000000000000','Tr','3,01000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','378','Carne, bovina, peito, sem gordura, cozido','51,17666666666670000000','338,47313333333300000000','1416,17158986667000000000','22,24666666666670000000','26,99333333333330000000','99,54000000000000000000','0,00000000000000000000','NA','0,72000000000000000000','4,02666666666667000000','13,87333333333330000000','Tr','135,96000000000000000000','1,60000000000000000000','55,70666666666670000000','204,49000000000000000000','0,05333333333333330000','3,89333333333333000000','Tr','Tr','Tr','Tr','0,30000000000000000000','Tr','4,53666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','379','Carne, bovina, peito, sem gordura, cru','61,48666666666670000000','259,27563333333300000000','1084,80924986667000000000','17,55666666666670000000','20,43333333333330000000','59,30000000000000000000','0,00000000000000000000','NA','0,85000000000000000000','3,94333333333333000000','15,32333333333330000000','Tr','124,36333333333300000000','1,31000000000000000000','63,76333333333330000000','241,40333333333300000000','0,06400000000000000000','2,63000000000000000000','4,25000000000000000000','4,25000000000000000000','4,25000000000000000000','0,10666666666666700000','0,06666666666666670000','0,03000000000000000000','3,91000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','380','Carne, bovina, picanha, com gordura, crua','65,64000000000000000000','212,87943333333300000000','890,68754906666700000000','18,82333333333330000000','14,69000000000000000000','59,55100000000000000000','0,00000000000000000000','NA','0,93333333333333300000','2,41666666666667000000','14,21666666666670000000','Tr','165,28666666666700000000','1,70666666666667000000','37,62333333333330000000','231,65000000000000000000','0,05966666666666670000','3,76666666666667000000','3,46000000000000000000','3,46000000000000000000','3,46000000000000000000','0,13000000000000000000','0,15666666666666700000','Tr','4,76666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','381','Carne, bovina, picanha, com gordura, grelhada','53,38733333333330000000','288,76709166666700000000','1208,20151153333000000000','26,42083333333330000000','19,50666666666670000000','91,76166666666670000000','0,00000000000000000000','NA','1,08700000000000000000','4,00000000000000000000','24,00000000000000000000','Tr','246,00000000000000000000','3,20000000000000000000','60,00000000000000000000','355,00000000000000000000','0,14000000000000000000','5,50000000000000000000','Tr','Tr','Tr','0,03000000000000000000','0,06000000000000000000','0,13000000000000000000','1,60000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','382','Carne, bovina, picanha, sem gordura, crua','72,42333333333330000000','133,52236666666700000000','558,65758213333300000000','21,25000000000000000000','4,74333333333333000000','75,23000000000000000000','0,00000000000000000000','NA','1,00666666666667000000','3,39333333333333000000','20,25000000000000000000','Tr','183,05333333333300000000','2,12666666666667000000','61,14666666666670000000','322,49666666666700000000','0,08000000000000000000','4,22666666666667000000','Tr','Tr','Tr','Tr','0,05000000000000000000','Tr','1,88666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','383','Carne, bovina, picanha, sem gordura, grelhada','54,63333333333330000000','238,46813333333300000000','997,75066986666700000000','31,90666666666670000000','11,33333333333330000000','99,71000000000000000000','0,00000000000000000000','NA','1,23000000000000000000','4,43000000000000000000','25,41666666666670000000','0,02000000000000000000','281,91000000000000000000','3,55333333333333000000','60,65666666666670000000','376,59666666666700000000','0,17333333333333300000','6,70000000000000000000','Tr','Tr','Tr','Tr','0,08333333333333330000','0,03000000000000000000','1,82333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','384','Carne, bovina, seca, cozida','47,19000000000000000000','312,79903369144600000000','1308,75115696501000000000','26,93125000000000000000','21,92933333333330000000','100,13600000000000000000','0,00000000000000000000','NA','4,71933333333333000000','12,76366666666670000000','11,90066666666670000000','0,01533333333333330000','82,37566666666670000000','1,88366666666667000000','1943,17933333333000000000','86,02633333333330000000','0,03300000000000000000','7,69800000000000000000','Tr','Tr','Tr','Tr','0,06333333333333330000','Tr','2,32000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','385','Carne, bovina, seca, crua','39,23600000000000000000','312,74842790365200000000','1308,53942234888000000000','19,65833333333330000000','25,36666666666670000000','91,54666666666670000000','0,00000000000000000000','NA','15,29400000000000000000','14,11000000000000000000','12,21966666666670000000','0,01200000000000000000','100,00166666666700000000','1,32966666666667000000','4439,55000000000000000000','190,15400000000000000000','Tr','3,65033333333333000000','Tr','Tr','Tr','Tr','0,07333333333333340000','Tr','2,83333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','386','Coxinha de frango, frita','42,21066666666670000000','283,04800000000000000000','1184,27283200000000000000','9,61041666666667000000','11,83600000000000000000','14,80633333333330000000','34,52058333333330000000','4,97033333333333000000','1,82233333333333000000','18,33333333333330000000','16,78266666666670000000','0,27633333333333300000','92,54233333333330000000','1,26166666666667000000','532,12933333333300000000','166,20500000000000000000','0,09466666666666670000','0,51300000000000000000','Tr','','','0,08666666666666670000','Tr','Tr','2,60000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','387','Croquete, de carne, cru','55,95566666666670000000','245,77192529714100000000','1028,30973544324000000000','12,04375000000000000000','15,56100000000000000000','29,85133333333330000000','13,94958333333330000000','','2,49000000000000000000','15,49666666666670000000','23,63500000000000000000','0,34000000000000000000','144,17633333333300000000','2,50800000000000000000','710,63733333333300000000','221,39633333333300000000','0,10200000000000000000','2,66500000000000000000','Tr','','','0,10666666666666700000','0,04000000000000000000','Tr','1,94666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','388','Croquete, de carne, frito','39,23500000000000000000','346,74201464740400000000','1450,76858928474000000000','16,86250000000000000000','22,67333333333330000000','38,10066666666670000000','18,14616666666670000000','','3,08300000000000000000','18,08800000000000000000','29,52166666666670000000','0,38566666666666700000','176,26000000000000000000','2,31100000000000000000','916,41100000000000000000','313,01900000000000000000','0,09033333333333330000','3,30466666666667000000','Tr','','','0,13666666666666700000','0,04333333333333330000','Tr','4,77333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','389','Empada de frango, pré-cozida, assada','28,19233333333330000000','358,19166666666700000000','1498,67393333333000000000','6,94375000000000000000','15,60500000000000000000','22,71966666666670000000','47,49291666666670000000','2,16433333333333000000','1,76600000000000000000','15,60933333333330000000','18,30466666666670000000','0,32333333333333300000','77,61800000000000000000','1,18533333333333000000','524,93333333333300000000','137,66366666666700000000','0,07200000000000000000','0,64300000000000000000','Tr','','','0,11666666666666700000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','390','Empada, de frango, pré-cozida','32,03133333333330000000','377,47966666666700000000','1579,37492533333000000000','7,34375000000000000000','22,88766666666670000000','23,28100000000000000000','35,52891666666670000000','2,22033333333333000000','2,20833333333333000000','13,56266666666670000000','17,33400000000000000000','0,25000000000000000000','77,93500000000000000000','0,74700000000000000000','770,72566666666700000000','156,35600000000000000000','0,08700000000000000000','0,50233333333333300000','Tr','','','0,10666666666666700000','Tr','0,03000000000000000000','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','391','Frango, asa, com pele, crua','67,47000000000000000000','213,18833333333300000000','891,97998666666700000000','18,10000000000000000000','15,06666666666670000000','113,45000000000000000000','0,00000000000000000000','NA','0,69000000000000000000','10,91666666666670000000','23,21666666666670000000','0,01000000000000000000','154,78666666666700000000','0,56666666666666700000','96,30000000000000000000','211,15666666666700000000','0,02333333333333330000','1,24666666666667000000','10,37333333333330000000','10,37333333333330000000','10,37333333333330000000','0,10666666666666700000','0,04333333333333330000','Tr','2,58333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','392','Frango, caipira, inteiro, com pele, cozido','59,68566666666670000000','242,88932666666700000000','1016,24894277333000000000','23,88333333333330000000','15,61566666666670000000','109,54933333333300000000','0,00000000000000000000','NA','0,80133333333333300000','16,76200000000000000000','18,34866666666670000000','0,01366666666666670000','161,94100000000000000000','1,66000000000000000000','56,09200000000000000000','210,00733333333300000000','0,07733333333333330000','1,69866666666667000000','16,16000000000000000000','16,16000000000000000000','16,16000000000000000000','0,03000000000000000000','Tr','Tr','6,33333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','393','Frango, caipira, inteiro, sem pele, cozido','61,41533333333330000000','195,76029666666700000000','819,06108125333300000000','29,57500000000000000000','7,70233333333333000000','105,52200000000000000000','0,00000000000000000000','NA','1,09333333333333000000','66,13866666666670000000','23,16633333333330000000','0,02166666666666670000','209,60366666666700000000','2,11500000000000000000','53,24333333333330000000','223,58600000000000000000','0,14566666666666700000','2,65800000000000000000','6,05333333333333000000','6,05333333333333000000','6,05333333333333000000','0,03000000000000000000','0,03000000000000000000','Tr','9,20000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','394','Frango, coração, cru','69,05000000000000000000','221,50283333333300000000','926,76785466666700000000','12,58333333333330000000','18,60000000000000000000','159,24000000000000000000','0,00000000000000000000','NA','0,77000000000000000000','5,50666666666667000000','19,83333333333330000000','0,05000000000000000000','193,39000000000000000000','4,09333333333333000000','95,06000000000000000000','220,07000000000000000000','0,19666666666666700000','2,00666666666667000000','9,38666666666667000000','9,38666666666667000000','9,38666666666667000000','0,22666666666666700000','0,35000000000000000000','Tr','3,38666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','395','Frango, coração, grelhado','63,51166666666670000000','207,27364333333300000000','867,23292370666600000000','22,43958333333330000000','12,09600000000000000000','280,35566666666700000000','0,60741666666665800000','NA','1,34533333333333000000','8,35166666666667000000','20,11900000000000000000','0,05866666666666670000','275,78000000000000000000','6,52633333333333000000','128,24200000000000000000','242,69466666666700000000','0,30400000000000000000','3,44800000000000000000','Tr','Tr','Tr','0,19666666666666700000','0,19333333333333300000','Tr','9,70000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','396','Frango, coxa, com pele, assada','59,79266666666670000000','215,11864753294000000000','900,05642127782000000000','28,49166666666670000000','10,36133333333330000000','145,48133333333300000000','0,05833333333334000000','NA','1,29600000000000000000','8,33633333333333000000','13,92766666666670000000','Tr','251,34666666666700000000','1,21600000000000000000','94,84233333333330000000','318,11000000000000000000','0,04666666666666670000','2,55166666666667000000','5,97333333333333000000','5,97333333333333000000','5,97333333333333000000','0,05000000000000000000','0,05333333333333330000','Tr','10,40000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','397','Frango, coxa, com pele, crua','72,85000000000000000000','161,47473333333300000000','675,61028426666700000000','17,09333333333330000000','9,81000000000000000000','97,40000000000000000000','0,00000000000000000000','NA','0,83000000000000000000','8,00000000000000000000','25,81333333333330000000','0,01666666666666670000','185,34000000000000000000','0,70333333333333300000','94,95666666666670000000','274,73333333333300000000','0,03000000000000000000','1,97333333333333000000','10,02333333333330000000','10,02333333333330000000','10,02333333333330000000','0,15666666666666700000','0,05333333333333330000','Tr','2,03666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','398','Frango, coxa, sem pele, cozida','66,65766666666670000000','167,42803216441500000000','700,51888657591100000000','26,85833333333330000000','5,84733333333333000000','132,91666666666700000000','0,00000000000000000000','NA','0,87400000000000000000','11,78100000000000000000','11,14366666666670000000','Tr','186,74333333333300000000','0,82633333333333300000','64,33933333333330000000','191,13666666666700000000','0,02733333333333330000','2,83333333333333000000','Tr','Tr','Tr','0,07333333333333340000','Tr','Tr','8,20000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','399','Frango, coxa, sem pele, crua','76,41666666666670000000','119,94746666666700000000','501,86020053333300000000','17,81333333333330000000','4,85666666666667000000','90,56000000000000000000','0,01999999999999700000','NA','0,89333333333333300000','7,97000000000000000000','27,23000000000000000000','0,02000000000000000000','196,48000000000000000000','0,77666666666666700000','98,36666666666670000000','291,19000000000000000000','0,03000000000000000000','2,24000000000000000000','11,66333333333330000000','11,66333333333330000000','11,66333333333330000000','0,16666666666666700000','0,04666666666666670000','Tr','3,53000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','400','Frango, fígado, cru','77,75000000000000000000','106,48456666666700000000','445,53142693333300000000','17,58666666666670000000','3,49000000000000000000','340,58000000000000000000','-0,02333333333333810000','NA','1,19666666666667000000','5,61000000000000000000','27,83000000000000000000','0,35000000000000000000','343,90333333333300000000','9,54000000000000000000','82,43333333333330000000','280,50000000000000000000','0,26000000000000000000','3,72666666666667000000','3863,33000000000000000000','3863,33000000000000000000','3863,33000000000000000000','0,61666666666666700000','0,55666666666666700000','Tr','6,36333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','401','Frango, filé, à milanesa','54,89000000000000000000','220,87278000000000000000','924,13171152000000000000','28,46041666666670000000','7,79066666666667000000','84,31566666666670000000','7,51291666666666000000','1,13033333333333000000','1,34600000000000000000','8,91200000000000000000','34,82600000000000000000','0,05700000000000000000','249,34533333333300000000','1,07766666666667000000','122,33233333333300000000','407,55900000000000000000','0,04666666666666670000','0,84233333333333300000','6,61000000000000000000','6,61000000000000000000','6,61000000000000000000','0,05333333333333330000','0,04000000000000000000','0,52000000000000000000','11,06666666666670000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','402','Frango, inteiro, com pele, cru','66,54000000000000000000','226,31916666666700000000','946,91939333333300000000','16,44333333333330000000','17,30666666666670000000','84,83700000000000000000','0,00000000000000000000','NA','0,74666666666666700000','6,30000000000000000000','24,30333333333330000000','0,01000000000000000000','173,55333333333300000000','0,62333333333333300000','62,87666666666670000000','217,24000000000000000000','0,04000000000000000000','1,12333333333333000000','7,00000000000000000000','7,00000000000000000000','7,00000000000000000000','0,08000000000000000000','0,03000000000000000000','Tr','3,27666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','403','Frango, inteiro, sem pele, assado','63,19733333333330000000','187,33779666666700000000','783,82134125333300000000','28,02500000000000000000','7,50233333333333000000','110,93533333333300000000','0,00000000000000000000','NA','1,15800000000000000000','9,06400000000000000000','13,88366666666670000000','Tr','232,94000000000000000000','0,55333333333333300000','70,27133333333330000000','283,27333333333300000000','0,02833333333333330000','1,58433333333333000000','Tr','Tr','Tr','0,09333333333333330000','Tr','Tr','11,20000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','404','Frango, inteiro, sem pele, cozido','67,45266666666670000000','170,38997583333300000000','712,91165888666700000000','24,98541666666670000000','7,06233333333333000000','98,92633333333330000000','0,00000000000000000000','NA','0,88866666666666700000','8,18333333333333000000','12,34633333333330000000','Tr','193,67333333333300000000','0,46200000000000000000','50,89033333333330000000','216,53333333333300000000','0,03966666666666670000','1,24166666666667000000','Tr','Tr','Tr','0,10000000000000000000','Tr','Tr','12,83333333333330000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','405','Frango, inteiro, sem pele, cru','74,85666666666670000000','129,09640000000000000000','540,13933760000000000000','20,58666666666670000000','4,56666666666667000000','78,24000000000000000000','0,00000000000000000000','NA','0,92666666666666700000','6,52333333333333000000','27,03666666666670000000','0,01000000000000000000','190,48000000000000000000','0,53666666666666700000','72,96000000000000000000','237,68000000000000000000','0,03000000000000000000','1,24000000000000000000','3,67000000000000000000','3,67000000000000000000','3,67000000000000000000','0,12000000000000000000','0,03000000000000000000','Tr','3,28333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','406','Frango, peito, com pele, assado','58,53666666666670000000','211,68314953072900000000','885,68229763656900000000','33,41666666666670000000','7,64900000000000000000','109,03266666666700000000','0,00000000000000000000','NA','1,49066666666667000000','8,25566666666667000000','18,14366666666670000000','0,01033333333333330000','297,02333333333300000000','0,48166666666666700000','55,70266666666670000000','380,31333333333300000000','0,01466666666666670000','0,95066666666666700000','6,22666666666667000000','6,22666666666667000000','6,22666666666667000000','0,12000000000000000000','Tr','Tr','15,80000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','407','Frango, peito, com pele, cru','71,94333333333330000000','149,46526666666700000000','625,36267573333300000000','20,78000000000000000000','6,73333333333333000000','79,93300000000000000000','0,00000000000000000000','NA','0,91000000000000000000','8,42000000000000000000','28,29000000000000000000','0,01000000000000000000','212,97000000000000000000','0,44333333333333300000','62,31333333333330000000','251,81666666666700000000','0,05000000000000000000','0,59666666666666700000','4,00000000000000000000','4,00000000000000000000','4,00000000000000000000','0,08666666666666670000','Tr','Tr','2,58333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','408','Frango, peito, sem pele, cozido','65,56900000000000000000','162,87476334631400000000','681,46800984098000000000','31,46875000000000000000','3,16000000000000000000','88,50800000000000000000','0,00000000000000000000','NA','0,98133333333333300000','6,44000000000000000000','13,76000000000000000000','Tr','224,42666666666700000000','0,33733333333333300000','36,16833333333330000000','231,05333333333300000000','0,01766666666666670000','0,94700000000000000000','Tr','Tr','Tr','0,09666666666666670000','Tr','Tr','7,60000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','409','Frango, peito, sem pele, cru','74,79333333333330000000','119,15926666666700000000','498,56237173333300000000','21,52666666666670000000','3,02000000000000000000','58,68300000000000000000','0,00000000000000000000','NA','0,97333333333333300000','7,36333333333333000000','31,26333333333330000000','0,01000000000000000000','222,03333333333300000000','0,43333333333333300000','56,14000000000000000000','267,08666666666700000000','0,03000000000000000000','0,66333333333333300000','2,00000000000000000000','2,00000000000000000000','2,00000000000000000000','0,10000000000000000000','Tr','Tr','5,85666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','410','Frango, peito, sem pele, grelhado','63,80933333333330000000','159,18500719261200000000','666,03007009388800000000','32,03333333333330000000','2,48366666666667000000','89,11733333333330000000','0,00000000000000000000','NA','1,44100000000000000000','5,34433333333333000000','18,27366666666670000000','Tr','295,01333333333300000000','0,32866666666666700000','50,24933333333330000000','387,37000000000000000000','0,01766666666666670000','0,77500000000000000000','Tr','Tr','Tr','0,11000000000000000000','Tr','Tr','24,83333333333330000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','411','Frango, sobrecoxa, com pele, assada','55,00433333333330000000','259,60476916666700000000','1086,18635419333000000000','28,70208333333330000000','15,19366666666670000000','158,25533333333300000000','0,00000000000000000000','NA','1,32600000000000000000','10,67533333333330000000','14,59500000000000000000','Tr','252,23333333333300000000','1,21333333333333000000','95,93533333333340000000','323,07333333333300000000','0,06066666666666670000','2,17133333333333000000','8,22000000000000000000','8,22000000000000000000','8,22000000000000000000','0,10333333333333300000','0,05000000000000000000','Tr','11,20000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','412','Frango, sobrecoxa, com pele, crua','63,58000000000000000000','254,53220000000000000000','1064,96272480000000000000','15,46000000000000000000','20,90000000000000000000','87,63000000000000000000','0,00000000000000000000','NA','0,75000000000000000000','7,09000000000000000000','21,50000000000000000000','0,01000000000000000000','154,18666666666700000000','0,71000000000000000000','68,26666666666670000000','190,19333333333300000000','0,04666666666666670000','1,30666666666667000000','6,58666666666667000000','6,58666666666667000000','6,58666666666667000000','0,09000000000000000000','0,06333333333333330000','Tr','3,39666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','413','Frango, sobrecoxa, sem pele, assada','55,63000000000000000000','232,88339666666700000000','974,38413165333300000000','29,17500000000000000000','12,00733333333330000000','145,10733333333300000000','0,00000000000000000000','NA','1,49200000000000000000','12,24933333333330000000','17,23400000000000000000','Tr','281,33666666666700000000','1,16933333333333000000','106,07966666666700000000','382,21000000000000000000','0,07166666666666670000','2,18166666666667000000','10,70000000000000000000','10,70000000000000000000','10,70000000000000000000','0,10000000000000000000','0,05000000000000000000','Tr','10,20000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','414','Frango, sobrecoxa, sem pele, crua','72,70666666666670000000','161,79630000000000000000','676,95571920000000000000','17,57000000000000000000','9,62000000000000000000','84,09000000000000000000','0,00000000000000000000','NA','0,88000000000000000000','6,29333333333333000000','26,33000000000000000000','0,02000000000000000000','187,28666666666700000000','0,90333333333333300000','79,74666666666670000000','241,08666666666700000000','0,05666666666666670000','1,67333333333333000000','3,92000000000000000000','3,92000000000000000000','3,92000000000000000000','0,11666666666666700000','0,06000000000000000000','Tr','4,06000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','415','Hambúrguer, bovino, cru','63,60466666666670000000','214,83600000000000000000','898,87382400000000000000','13,15625000000000000000','16,17733333333330000000','70,01200000000000000000','4,15375000000000000000','*','2,90800000000000000000','34,06233333333330000000','24,52300000000000000000','0,35733333333333300000','140,71700000000000000000','1,89133333333333000000','869,45900000000000000000','382,58700000000000000000','0,16200000000000000000','1,70166666666667000000','Tr','','','0,05666666666666670000','0,08333333333333330000','0,03666666666666670000','3,53333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','416','Hambúrguer, bovino, frito','52,45666666666670000000','258,28300000000000000000','1080,65607200000000000000','19,97291666666670000000','17,01233333333330000000','48,90133333333330000000','6,32008333333333000000','*','4,23800000000000000000','62,38566666666670000000','59,70166666666670000000','0,52166666666666700000','324,46000000000000000000','3,01666666666667000000','1251,80100000000000000000','660,09366666666700000000','0,17466666666666700000','3,18033333333333000000','Tr','','','0,13333333333333300000','0,05666666666666670000','Tr','2,73333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','417','Hambúrguer, bovino, grelhado','59,22766666666670000000','209,83166666666700000000','877,93569333333400000000','13,15625000000000000000','12,43033333333330000000','58,52700000000000000000','11,33341666666670000000','*','3,85233333333333000000','56,21366666666670000000','47,56666666666670000000','0,39766666666666700000','262,67000000000000000000','2,63900000000000000000','1090,33433333333000000000','537,56033333333300000000','0,18000000000000000000','3,01833333333333000000','Tr','','','0,17666666666666700000','0,05666666666666670000','Tr','5,76666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','418','Lingüiça, frango, crua','64,76066666666670000000','218,10881416666700000000','912,56727847333300000000','14,23958333333330000000','17,43966666666670000000','64,12633333333330000000','0,00000000000000000000','NA','3,28000000000000000000','10,83766666666670000000','18,96600000000000000000','0,05300000000000000000','181,50666666666700000000','0,46566666666666700000','1125,81133333333000000000','279,73200000000000000000','0,05433333333333330000','0,69400000000000000000','Tr','','','0,11000000000000000000','0,05333333333333330000','Tr','4,60000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','419','Lingüiça, frango, frita','59,57066666666670000000','245,46100666666700000000','1027,00885189333000000000','18,31666666666670000000','18,54200000000000000000','75,78600000000000000000','0,00000000000000000000','NA','3,79166666666667000000','15,48166666666670000000','29,19200000000000000000','0,10366666666666700000','262,06666666666700000000','0,78933333333333300000','1373,89366666667000000000','363,79366666666700000000','0,03766666666666670000','1,16466666666667000000','Tr','','','0,11000000000000000000','0,05000000000000000000','Tr','5,66666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','420','Lingüiça, frango, grelhada','58,58300000000000000000','243,65856750000000000000','1019,46744642000000000000','18,18958333333330000000','18,40233333333330000000','80,47833333333330000000','0,00000000000000000000','NA','3,82233333333333000000','13,92533333333330000000','21,10033333333330000000','0,09900000000000000000','228,01666666666700000000','0,72266666666666700000','1351,49366666667000000000','355,99700000000000000000','0,09300000000000000000','1,02966666666667000000','Tr','','','0,11666666666666700000','0,04000000000000000000','Tr','5,96666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','421','Lingüiça, porco, crua','62,48266666666670000000','227,20345083333300000000','950,61923828666700000000','16,06458333333330000000','17,58400000000000000000','52,92666666666670000000','0,00000000000000000000','NA','3,20666666666667000000','6,13366666666667000000','14,04733333333330000000','0,00600000000000000000','157,47666666666700000000','0,44433333333333300000','1175,72233333333000000000','316,32933333333300000000','0,04400000000000000000','1,35800000000000000000','Tr','','','0,49000000000000000000','0,05333333333333330000','Tr','2,60000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','422','Lingüiça, porco, frita','54,60933333333330000000','279,54358916666700000000','1169,61037707333000000000','20,45208333333330000000','21,30966666666670000000','74,70533333333330000000','0,00000000000000000000','NA','3,86300000000000000000','8,47566666666667000000','18,21766666666670000000','0,01100000000000000000','210,78000000000000000000','0,86866666666666700000','1431,59366666667000000000','408,94033333333300000000','0,06000000000000000000','3,08200000000000000000','Tr','','','0,41333333333333300000','0,06666666666666670000','Tr','5,83333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','423','Lingüiça, porco, grelhada','50,47933333333330000000','296,48960916666700000000','1240,51252475333000000000','23,16875000000000000000','21,90233333333330000000','81,70433333333330000000','0,00000000000000000000','NA','4,00333333333333000000','8,13866666666667000000','18,78500000000000000000','0,01200000000000000000','209,81333333333300000000','1,01133333333333000000','1455,86033333333000000000','426,60033333333300000000','0,07166666666666670000','3,47533333333333000000','Tr','','','0,39666666666666700000','0,07000000000000000000','Tr','6,60000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','424','Mortadela','56,43933333333330000000','268,81998901673200000000','1124,74283404601000000000','11,95208333333330000000','21,64933333333330000000','82,76066666666670000000','5,81591666666666000000','NA','4,14333333333333000000','66,54700000000000000000','19,14333333333330000000','0,11233333333333300000','215,67400000000000000000','1,46966666666667000000','1212,16700000000000000000','247,28200000000000000000','0,07766666666666670000','1,01933333333333000000','24,55333333333330000000','','','0,14333333333333300000','0,06333333333333330000','Tr','3,00333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','425','Peru, congelado, assado','65,32300000000000000000','163,07139793137700000000','682,29072894488200000000','26,20208333333330000000','5,67500000000000000000','91,23800000000000000000','0,00000000000000000000','NA','2,23333333333333000000','13,84100000000000000000','11,54333333333330000000','0,01833333333333330000','197,36133333333300000000','0,58666666666666700000','627,87566666666700000000','175,12400000000000000000','0,03066666666666670000','1,21133333333333000000','Tr','Tr','Tr','0,06000000000000000000','Tr','Tr','6,23333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','426','Peru, congelado, cru','78,17666666666670000000','93,72243382612860000000','392,13466312852200000000','18,08333333333330000000','1,83000000000000000000','68,16266666666670000000','0,00000000000000000000','NA','2,46000000000000000000','9,88133333333333000000','18,84333333333330000000','Tr','216,67033333333300000000','0,87400000000000000000','710,68300000000000000000','281,35400000000000000000','0,35700000000000000000','1,43633333333333000000','Tr','Tr','Tr','0,06333333333333330000','Tr','Tr','4,23333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','427','Porco, bisteca, crua','67,70333333333330000000','164,11533659299200000000','686,65856830507900000000','21,50000000000000000000','8,01666666666667000000','56,38333333333330000000','0,00000000000000000000','NA','0,99000000000000000000','6,11000000000000000000','24,07433333333330000000','Tr','195,16333333333300000000','0,53333333333333300000','54,29000000000000000000','334,99133333333300000000','0,07025000000000000000','1,43000000000000000000','Tr','Tr','Tr','0,89666666666666700000','Tr','Tr','2,64666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','428','Porco, bisteca, frita','47,32666666666670000000','311,16904533485600000000','1301,93128568104000000000','33,74791666666670000000','18,52166666666670000000','126,30233333333300000000','0,00000000000000000000','NA','1,55433333333333000000','69,14566666666670000000','29,12500000000000000000','0,00766666666666667000','289,87433333333300000000','0,82100000000000000000','63,02700000000000000000','403,51333333333300000000','0,06500000000000000000','2,16433333333333000000','9,74000000000000000000','9,74000000000000000000','9,74000000000000000000','0,33666666666666700000','Tr','Tr','3,24666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','429','Porco, bisteca, grelhada','51,84366666666670000000','280,08403490277100000000','1171,87160203320000000000','28,88958333333330000000','17,37533333333330000000','81,68266666666670000000','0,00000000000000000000','NA','1,24833333333333000000','34,31366666666670000000','24,74100000000000000000','Tr','229,43833333333300000000','0,86466666666666700000','51,44500000000000000000','366,41600000000000000000','0,05566666666666670000','2,34666666666667000000','Tr','Tr','Tr','0,76666666666666700000','0,13666666666666700000','0,03000000000000000000','1,92333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','430','Porco, costela, assada','36,92000000000000000000','402,16844745083700000000','1682,67278413430000000000','30,22291666666670000000','30,27900000000000000000','112,85633333333300000000','0,00000000000000000000','NA','1,37466666666667000000','16,77183333333330000000','14,04233333333330000000','Tr','200,78033333333300000000','1,03700000000000000000','62,67933333333330000000','245,97066666666700000000','0,07266666666666670000','3,09766666666667000000','Tr','Tr','Tr','0,71333333333333300000','0,05333333333333330000','Tr','10,63333333333330000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','431','Porco, costela, crua','61,21000000000000000000','255,60634206136100000000','1069,45693518473000000000','18,00000000000000000000','19,81666666666670000000','68,82500000000000000000','0,00000000000000000000','NA','0,92333333333333300000','14,52733333333330000000','17,96933333333330000000','Tr','159,08100000000000000000','0,89966666666666700000','87,98166666666670000000','248,22966666666700000000','0,05433333333333330000','2,27366666666667000000','Tr','Tr','Tr','0,62333333333333300000','Tr','Tr','8,26666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','432','Porco, lombo, assado','56,56066666666670000000','210,23466557963700000000','879,62184078520100000000','35,72500000000000000000','6,39566666666667000000','103,07700000000000000000','0,00000000000000000000','NA','1,36600000000000000000','19,51133333333330000000','18,14233333333330000000','Tr','238,36433333333300000000','0,45733333333333300000','38,92400000000000000000','311,13866666666700000000','0,02500000000000000000','1,75833333333333000000','Tr','Tr','Tr','0,74666666666666700000','0,06666666666666670000','0,10666666666666700000','12,43333333333330000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','433','Porco, lombo, cru','67,73333333333330000000','175,62519525011400000000','734,81581692647600000000','22,60416666666670000000','8,77000000000000000000','55,38733333333330000000','0,00000000000000000000','NA','1,02666666666667000000','4,15500000000000000000','23,91500000000000000000','Tr','194,52100000000000000000','0,47333333333333300000','53,06766666666670000000','334,38400000000000000000','0,00800000000000000000','0,93166666666666700000','Tr','Tr','Tr','0,94666666666666700000','Tr','Tr','13,83333333333330000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','434','Porco, orelha, salgada, crua','59,66666666666670000000','258,49175833333300000000','1081,52951686667000000000','18,52083333333330000000','19,89000000000000000000','83,00800000000000000000','0,00000000000000000000','NA','2,04333333333333000000','5,44266666666667000000','2,07066666666667000000','0,00533333333333333000','30,79100000000000000000','1,40766666666667000000','615,60200000000000000000','228,46433333333300000000','0,23133333333333300000','0,56866666666666700000','Tr','Tr','Tr','0,07333333333333340000','0,03000000000000000000','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','435','Porco, pernil, assado','49,25633333333330000000','262,25960666666700000000','1097,29419429333000000000','32,13333333333330000000','13,86366666666670000000','109,79833333333300000000','0,00000000000000000000','NA','1,44733333333333000000','17,58900000000000000000','27,34700000000000000000','0,01233333333333330000','247,08933333333300000000','1,25166666666667000000','62,40633333333330000000','395,19033333333300000000','0,09333333333333330000','3,25466666666667000000','Tr','Tr','Tr','0,77333333333333300000','0,09000000000000000000','Tr','6,56666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','436','Porco, pernil, cru','67,08000000000000000000','186,05575000000000000000','778,45725800000000000000','20,12500000000000000000','11,10000000000000000000','58,68633333333330000000','0,00000000000000000000','NA','1,02333333333333000000','12,93566666666670000000','22,88233333333330000000','Tr','192,47900000000000000000','0,88733333333333300000','101,89333333333300000000','255,58266666666700000000','0,16266666666666700000','1,73100000000000000000','Tr','Tr','Tr','1,06333333333333000000','0,05666666666666670000','Tr','5,66666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','437','Porco, rabo, salgado, cru','43,78966666666670000000','377,41525750000000000000','1579,10543738000000000000','15,58125000000000000000','34,46600000000000000000','89,09366666666670000000','0,00000000000000000000','NA','3,49933333333333000000','21,62900000000000000000','3,59533333333333000000','0,01200000000000000000','42,39400000000000000000','0,62333333333333300000','1157,66533333333000000000','23,76066666666670000000','0,04700000000000000000','1,41066666666667000000','Tr','Tr','Tr','0,20333333333333300000','0,05666666666666670000','Tr','1,43333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','438','Presunto, com capa de gordura','73,94633333333330000000','127,84921266563700000000','534,92110579302700000000','14,37083333333330000000','6,77133333333333000000','39,51233333333330000000','1,39750000000000000000','NA','3,51400000000000000000','12,48233333333330000000','17,04166666666670000000','0,03533333333333330000','273,87166666666700000000','0,67900000000000000000','1020,77166666667000000000','294,58000000000000000000','0,03500000000000000000','1,32466666666667000000','Tr',' ',' ','0,62333333333333300000','0,03333333333333330000','Tr','3,78000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','439','Presunto, sem capa de gordura','77,18100000000000000000','93,74328072086970000000','392,22188653611900000000','14,29166666666670000000','2,70666666666667000000','35,77333333333330000000','2,14566666666667000000','NA','3,67500000000000000000','23,27433333333330000000','17,51333333333330000000','0,04133333333333330000','244,06233333333300000000','0,82766666666666700000','1039,18500000000000000000','307,30166666666700000000','0,04266666666666670000','1,45900000000000000000','Tr',' ',' ','0,50333333333333300000','0,03000000000000000000','Tr','4,00333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','440','Quibe, assado','69,01800000000000000000','136,22887614158800000000','569,98161777640400000000','14,59375000000000000000','2,67633333333333000000','33,73200000000000000000','12,86125000000000000000','1,89666666666667000000','0,85066666666666700000','15,61800000000000000000','36,08000000000000000000','0,76466666666666700000','174,37000000000000000000','2,15266666666667000000','39,89300000000000000000','287,77800000000000000000','0,51066666666666700000','4,11633333333333000000','Tr','','','0,04333333333333330000','0,04000000000000000000','Tr','1,80666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','441','Quibe, cru','74,50900000000000000000','109,49066929475500000000','458,10896032925300000000','12,35416666666670000000','1,66766666666667000000','26,93433333333330000000','10,77416666666670000000','1,64666666666667000000','0,69500000000000000000','12,08800000000000000000','25,69433333333330000000','0,39000000000000000000','125,79000000000000000000','1,65400000000000000000','38,76600000000000000000','241,73966666666700000000','0,13200000000000000000','2,75333333333333000000','Tr','','','0,08666666666666670000','0,03000000000000000000','Tr','1,20333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','442','Quibe, frito','53,96366666666670000000','253,83130886964000000000','1062,03019631057000000000','14,88958333333330000000','15,79900000000000000000','37,77166666666670000000','12,33741666666670000000','','3,01033333333333000000','21,72566666666670000000','38,77266666666670000000','0,72000000000000000000','165,83400000000000000000','1,95266666666667000000','835,82500000000000000000','322,46733333333300000000','0,15800000000000000000','2,78200000000000000000','Tr','','','0,12333333333333300000','0,10333333333333300000','Tr','1,50333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','443','Salame','34,70333333333330000000','397,84250653493400000000','1664,57304734216000000000','25,81041666666670000000','30,64133333333330000000','85,08733333333330000000','2,90625000000001000000','NA','5,93866666666667000000','87,01833333333330000000','29,91500000000000000000','0,02866666666666670000','354,26800000000000000000','1,25300000000000000000','1574,16900000000000000000','547,99900000000000000000','0,04700000000000000000','3,15450000000000000000','Tr','','','0,88333333333333300000','0,23333333333333300000','Tr','12,48666666666670000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','444','Toucinho, cru','27,60666666666670000000','592,53117500000000000000','2479,15043620000000000000','11,47916666666670000000','60,25666666666670000000','73,08366666666670000000','0,00000000000000000000','NA','0,30333333333333300000','2,38600000000000000000','3,56800000000000000000','Tr','35,35866666666670000000','0,43933333333333300000','49,58666666666670000000','57,57000000000000000000','0,11233333333333300000','0,21066666666666700000','Tr','Tr','Tr','Tr','Tr','Tr','5,10000000000000000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Carnes e derivados','445','Toucinho, frito','6,32533333333333000000','696,56400666666700000000','2914,42380389333000000000','27,28333333333330000000','64,30866666666670000000','89,46366666666670000000','0,00000000000000000000','NA','0,73333333333333300000','9,44333333333333000000','9,46033333333333000000','0,01200000000000000000','94,71500000000000000000','0,86500000000000000000','124,85033333333300000000','170,85900000000000000000','0,09800000000000000000','0,84266666666666700000','Tr','Tr','Tr','Tr','Tr','Tr','5,03333333333333000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','446','Bebida láctea, pêssego','87,69333333333330000000','55,16483333333330000000','230,80966266666700000000','2,13333333333333000000','1,90666666666667000000','5,36975000000000000000','7,57000000000001000000','0,29333333333333300000','0,69666666666666700000','88,63266666666660000000','8,59333333333333000000','Tr','63,10466666666670000000','Tr','46,26300000000000000000','62,26366666666670000000','0,01966666666666670000','0,24366666666666700000','Tr','','','0,02666666666666670000','0,13666666666666700000','Tr','0,33000000000000000000','2,05333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','447','Creme de Leite','70,89266666666670000000','221,48354127513300000000','926,68713669515700000000','1,50780669371287000000','22,47933333333330000000','66,47566666666670000000','4,50952663962046000000','NA','0,61066666666666700000','82,73366666666660000000','7,54066666666667000000','0,00600000000000000000','118,45733333333300000000','0,30100000000000000000','51,72400000000000000000','118,65033333333300000000','0,01900000000000000000','0,29233333333333300000','127,66666666666700000000','','','Tr','0,10000000000000000000','Tr','0,00000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','448','Iogurte, natural','90,04000000000000000000','51,48953333333330000000','215,43220746666600000000','4,06333333333333000000','3,04000000000000000000','13,77750000000000000000','1,91666666666666000000','NA','0,94000000000000000000','143,10333333333300000000','11,25333333333330000000','Tr','119,03533333333300000000','Tr','51,61633333333330000000','71,27866666666670000000','0,01833333333333330000','0,44300000000000000000','22,50000000000000000000','','','0,03666666666666670000','0,22333333333333300000','Tr','Tr','0,92666666666666700000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','449','Iogurte, natural, desnatado','89,21633333333330000000','41,49271128155830000000','173,60550400204000000000','3,83438006877899000000','0,31566666666666700000','3,33166666666667000000','5,77395333333333000000','NA','0,85966666666666700000','156,96133333333300000000','11,98333333333330000000','Tr','109,68333333333300000000','Tr','59,64466666666670000000','182,12966666666700000000','Tr','0,51366666666666700000','*','','','Tr','0,21666666666666700000','Tr','Tr','0,34666666666666700000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','450','Iogurte, sabor abacaxi','*','*','*','*','*','5,63000000000000000000','*','*','*','*','*','*','*','*','*','*','*','*','*','','','*','*','*','*','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','451','Iogurte, sabor morango','84,63333333333330000000','69,56560000000000000000','291,06247040000000000000','2,71000000000000000000','2,33000000000000000000','7,49425000000000000000','9,69333333333334000000','0,21666666666666700000','0,63333333333333300000','101,03166666666700000000','8,04000000000000000000','Tr','73,48133333333330000000','Tr','37,66300000000000000000','52,35366666666670000000','0,01766666666666670000','0,30433333333333300000','27,02666666666670000000','','','0,03333333333333330000','0,12000000000000000000','0,02000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','452','Iogurte, sabor pêssego','85,05666666666670000000','67,84940000000000000000','283,88188960000000000000','2,53000000000000000000','2,33666666666667000000','8,40000000000000000000','9,43333333333334000000','0,71666666666666700000','0,64333333333333300000','95,05000000000000000000','7,95666666666667000000','Tr','65,55166666666670000000','0,05300000000000000000','36,96366666666670000000','52,09033333333330000000','0,01800000000000000000','0,30033333333333300000','21,27666666666670000000','','','0,02000000000000000000','0,10333333333333300000','Tr','0,38033333333333300000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','453','Leite, condensado','26,96000000000000000000','312,57260000000000000000','1307,80375840000000000000','7,67000000000000000000','6,74000000000000000000','27,63566666666670000000','56,99666666666670000000','NA','1,63333333333333000000','246,26666666666700000000','21,97666666666670000000','Tr','187,18333333333300000000','0,12666666666666700000','93,80333333333330000000','328,93000000000000000000','0,03333333333333330000','0,86000000000000000000','52,95333333333330000000','','','0,06000000000000000000','0,33000000000000000000','0,57333333333333300000','Tr','2,14333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','454','Leite, de cabra','87,07066666666670000000','66,41574188654330000000','277,88346405329700000000','3,07090672175090000000','3,75433333333333000000','13,99166666666670000000','5,24609333333333000000','NA','0,85800000000000000000','112,24733333333300000000','9,79866666666667000000','Tr','113,20333333333300000000','0,10300000000000000000','73,94700000000000000000','139,99400000000000000000','0,04066666666666670000','0,35466666666666700000','34,74000000000000000000','','','Tr','0,14400000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','455','Leite, de vaca, achocolatado','80,89366666666670000000','82,82099627199360000000','346,52304840202100000000','2,09902003765106000000','2,16900000000000000000','6,08133333333333000000','14,15831333333330000000','0,64566666666666700000','0,68000000000000000000','69,79100000000000000000','12,88066666666670000000','0,05000000000000000000','70,87400000000000000000','0,45766666666666700000','71,74166666666670000000','155,23966666666700000000','0,04466666666666670000','0,31100000000000000000','38,94333333333330000000','','','0,07366666666666670000','0,29033333333333300000','0,14000000000000000000','1,23000000000000000000','3,26166666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','456','Leite, de vaca, desnatado, pó','3,10000000000000000000','361,60800000000000000000','1512,96787200000000000000','34,69000000000000000000','0,93333333333333300000','24,78533333333330000000','53,04333333333330000000','NA','8,23333333333333000000','1363,17000000000000000000','108,70666666666700000000','Tr','1673,43333333333000000000','0,92666666666666700000','431,67333333333300000000','1555,66333333333000000000','0,15666666666666700000','3,84333333333333000000','299,45666666666700000000','','','0,31666666666666700000','1,20333333333333000000','Tr','0,80666666666666700000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','457','Leite, de vaca, desnatado, UHT','*','*','*','*','*','3,75433333333333000000','*','NA','0,82666666666666700000','133,80666666666700000000','10,23000000000000000000','Tr','85,37000000000000000000','Tr','51,14000000000000000000','140,02666666666700000000','0,02000000000000000000','0,38000000000000000000','Tr','','','0,04000000000000000000','0,26333333333333300000','Tr','1,49000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','458','Leite, de vaca, integral','*','*','*','*','*','10,49000000000000000000','*','NA','0,76000000000000000000','122,58000000000000000000','9,63666666666667000000','Tr','81,97666666666670000000','Tr','63,76000000000000000000','133,19000000000000000000','0,02000000000000000000','0,38000000000000000000','20,90333333333330000000','','','0,04000000000000000000','0,24000000000000000000','Tr','1,52000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','459','Leite, de vaca, integral, pó','2,70000000000000000000','496,65030000000000000000','2077,98485520000000000000','25,42000000000000000000','26,90333333333330000000','85,25533333333330000000','39,18000000000000000000','NA','5,79666666666667000000','890,27333333333300000000','77,42666666666670000000','Tr','1242,28333333333000000000','0,52333333333333300000','323,20333333333300000000','1131,66333333333000000000','0,11000000000000000000','2,72666666666667000000','361,05666666666700000000','','','0,24333333333333300000','1,02666666666667000000','Tr','Tr','*','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','460','Leite, fermentado','81,87933333333330000000','69,62147400000000000000','291,29624721600000000000','1,89486000000000000000','0,09900000000000000000','1,85166000000000000000','15,67447333333330000000','NA','0,45233333333333300000','71,52800000000000000000','6,23166666666667000000','0,01833333333333330000','62,81033333333330000000','Tr','33,43066666666670000000','94,48333333333330000000','0,01300000000000000000','0,26133333333333300000','Tr','','','0,07500000000000000000','0,10666666666666700000','Tr','Tr','0,49000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','461','Queijo, minas, frescal','56,12466666666670000000','264,27312800000000000000','1105,71876755200000000000','17,41102000000000000000','20,18066666666670000000','61,99633333333330000000','3,24031333333333000000','NA','3,04333333333333000000','579,25333333333400000000','6,88366666666667000000','0,01566666666666670000','123,30966666666700000000','0,93100000000000000000','31,22633333333330000000','104,84666666666700000000','Tr','0,29233333333333300000','160,50666666666700000000','','','Tr','0,25133333333333300000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','462','Queijo, minas, meia cura','47,11833333333330000000','320,72181773326000000000','1341,90008539596000000000','21,21137371381120000000','24,61000000000000000000','76,29866666666670000000','3,57295961952209000000','NA','3,48733333333333000000','695,91733333333300000000','27,07266666666670000000','0,02266666666666670000','402,53233333333300000000','0,21900000000000000000','501,16566666666700000000','119,97733333333300000000','0,06866666666666670000','2,68200000000000000000','111,33333333333300000000','','','0,03000000000000000000','0,32333333333333300000','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','463','Queijo, mozarela','45,33833333333330000000','329,87071842088700000000','1380,17908587299000000000','22,64900040626530000000','25,18300000000000000000','79,57900000000000000000','3,04933292706807000000','NA','3,78033333333333000000','875,03933333333300000000','23,57366666666670000000','0,02833333333333330000','469,99833333333300000000','0,30600000000000000000','581,35700000000000000000','61,89433333333330000000','0,08266666666666670000','3,52200000000000000000','109,00000000000000000000','','','Tr','0,20000000000000000000','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','464','Queijo, parmesão','21,24666666666670000000','452,96375533333300000000','1895,20035231467000000000','35,55361333333330000000','33,52933333333330000000','105,84400000000000000000','1,66072000000000000000','NA','8,00966666666667000000','991,96766666666700000000','33,36733333333330000000','0,04833333333333330000','744,62333333333300000000','0,53233333333333300000','1844,08100000000000000000','96,23700000000000000000','0,16866666666666700000','4,35866666666667000000','66,15333333333330000000','','','Tr','0,44166666666666700000','0,23333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','465','Queijo, pasteurizado','54,42133333333330000000','303,07980333333300000000','1268,08589714667000000000','9,35733333333333000000','27,43533333333330000000','82,15666666666670000000','5,67633333333333000000','NA','3,10966666666667000000','323,29933333333300000000','16,00166666666670000000','0,01300000000000000000','577,94333333333300000000','0,26533333333333300000','780,42600000000000000000','193,72100000000000000000','0,04533333333333330000','1,30466666666667000000','57,31333333333330000000','','','Tr','0,20000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','466','Queijo, petit suisse, morango','72,21500000000000000000','121,10595400000000000000','506,70731153600000000000','5,78666000000000000000','2,83833333333333000000','12,06933333333330000000','18,46200666666670000000','NA','0,69800000000000000000','730,93266666666700000000','26,50866666666670000000','0,02333333333333330000','448,45866666666700000000','0,14100000000000000000','412,46900000000000000000','121,46166666666700000000','0,01466666666666670000','2,66333333333333000000','272,65666666666700000000','','','0,22333333333333300000','0,26666666666666700000','0,21000000000000000000','2,68333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','467','Queijo, prato','42,44433333333330000000','359,88046240505500000000','1505,73985470275000000000','22,66176040649410000000','29,10633333333330000000','90,90233333333330000000','1,87857292683919000000','NA','3,90900000000000000000','939,99333333333300000000','28,27366666666670000000','0,03233333333333330000','460,83866666666700000000','0,28000000000000000000','579,77400000000000000000','73,47166666666670000000','0,09866666666666670000','3,46166666666667000000','122,66666666666700000000','','','Tr','0,22000000000000000000','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','468','Queijo, requeijão, cremoso','62,46633333333330000000','256,57814866666700000000','1073,52297402133000000000','9,62954666666667000000','23,44100000000000000000','73,66900000000000000000','2,43245333333333000000','NA','2,03066666666667000000','259,46666666666700000000','11,62833333333330000000','0,01533333333333330000','447,88033333333300000000','0,11500000000000000000','557,92466666666700000000','93,06433333333330000000','0,04500000000000000000','1,27700000000000000000','194,58666666666700000000','','','Tr','0,19066666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leite e derivados','469','Queijo, ricota','73,57066666666670000000','139,73178000000000000000','584,63776752000000000000','12,60050000000000000000','8,10866666666667000000','48,70333333333330000000','3,78616666666667000000','NA','1,93400000000000000000','253,23600000000000000000','11,80866666666670000000','Tr','161,51866666666700000000','0,13666666666666700000','282,57900000000000000000','112,37833333333300000000','Tr','0,46033333333333300000','52,84666666666670000000','','','Tr','0,14666666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','470','Bebida isotônica, sabores variados','93,50666666666670000000','25,61333333333330000000','107,16618666666700000000','0,00000000000000000000','0,00000000000000000000','NA','6,40333333333334000000','NA','0,09000000000000000000','1,23333333333333000000','Tr','Tr','8,97333333333333000000','0,67000000000000000000','44,08333333333330000000','13,02666666666670000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','471','Café, infusão 10%','97,37200000000000000000','9,07086859961352000000','37,95251422078300000000','0,71250000000000000000','0,06933333333333330000','NA','1,47866666666667000000','NA','0,36750000000000000000','3,15933333333333000000','9,66166666666667000000','0,03766666666666670000','9,49533333333333000000','Tr','1,02733333333333000000','155,70400000000000000000','0,00600000000000000000','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','472','Cana, aguardente 1','','215,66160000000000000000','902,32813440000000000000','','','NA','','NA','','Tr','Tr','Tr','Tr','Tr','3,14566666666667000000','Tr','0,06300000000000000000','Tr','NA','','','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','473','Cana, caldo de','81,72766666666670000000','65,34359826898570000000','273,39761515743600000000','Tr','Tr','NA','18,15100000000000000000','0,13633333333333300000','0,12133333333333300000','9,08300000000000000000','11,97400000000000000000','0,20600000000000000000','4,77866666666667000000','0,75266666666666700000','Tr','17,97300000000000000000','0,00700000000000000000','0,05066666666666670000','NA','','','Tr','Tr','0,03000000000000000000','Tr','2,77966600000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','474','Cerveja, pilsen 2','92,38000000000000000000','40,72018855062870000000','170,37326889583000000000','0,56250000000000000000','Tr','NA','3,31750000000000000000','NA','0,12000000000000000000','4,98500000000000000000','6,74366666666667000000','0,00533333333333333000','19,00266666666670000000','Tr','4,23033333333333000000','29,46666666666670000000','Tr','Tr','NA','','','Tr','Tr','0,14333333333333300000','2,91666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','475','Chá, erva-doce, infusão 5%','99,60866666666670000000','1,39705997387564000000','5,84529893069567000000','0,00000000000000000000','0,00000000000000000000','NA','0,39133333333332100000','NA','0,00000000000000000000','1,93100000000000000000','0,88100000000000000000','0,00633333333333333000','0,65100000000000000000','Tr','0,62533333333333300000','9,92900000000000000000','0,00600000000000000000','Tr','NA','','','1,23333333333333000000','0,22666666666666700000',' ',' ',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','476','Chá, mate, infusão 5%','99,30500000000000000000','2,73074995112414000000','11,42545779550340000000','0,00000000000000000000','0,05200000000000000000','NA','0,64299999999999300000','NA','0,00000000000000000000','0,64466666666666700000','2,03700000000000000000','0,27400000000000000000','Tr','Tr','Tr','5,33633333333333000000','Tr','Tr','NA','','','0,89333333333333300000','Tr',' ',' ',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','477','Chá, preto, infusão 5%','99,37033333333330000000','2,24790995796521000000','9,40525526412644000000','0,00000000000000000000','0,00000000000000000000','NA','0,62966666666666500000','NA','0,00000000000000000000','0,25233333333333300000','0,95600000000000000000','0,08866666666666670000','1,51133333333333000000','Tr','Tr','13,43766666666670000000','Tr','Tr','NA','','','3,11333333333333000000','0,48333333333333300000',' ',' ',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','478','Coco, água de','94,25200000000000000000','21,50859424050650000000','89,99195830227920000000','0,00000000000000000000','0,00000000000000000000','NA','5,28466666666667000000','0,13033333333333300000','0,46333333333333300000','18,83733333333330000000','5,15833333333333000000','0,25300000000000000000','3,75533333333333000000','Tr','1,78233333333333000000','161,65100000000000000000','Tr','Tr','NA','','','0,00500000000000000000','Tr','Tr','Tr','2,40866666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','479','Refrigerante, tipo água tônica','92,00666666666670000000','30,77940000000000000000','128,78100960000000000000','0,00000000000000000000','0,00000000000000000000','NA','7,95333333333334000000','NA','0,04000000000000000000','1,07533333333333000000','Tr','Tr','0,15166666666666700000','Tr','8,29033333333333000000','1,50566666666667000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','480','Refrigerante, tipo cola','91,27666666666670000000','33,51420000000000000000','140,22341280000000000000','0,00000000000000000000','0,00000000000000000000','NA','8,66000000000001000000','NA','0,06333333333333330000','1,37233333333333000000','Tr','Tr','16,67733333333330000000','Tr','7,11933333333333000000','0,90500000000000000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','481','Refrigerante, tipo guaraná','89,95666666666670000000','38,70000000000000000000','161,92080000000000000000','0,00000000000000000000','0,00000000000000000000','NA','10,00000000000000000000','NA','0,04333333333333330000','1,40766666666667000000','Tr','Tr','Tr','Tr','9,00966666666667000000','1,38133333333333000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','482','Refrigerante, tipo laranja','88,17333333333330000000','45,62730000000000000000','190,90462320000000000000','0,00000000000000000000','0,00000000000000000000','NA','11,79000000000000000000','NA','0,03666666666666670000','2,34433333333333000000','1,20766666666667000000','Tr','1,46700000000000000000','Tr','9,27166666666667000000','15,50433333333330000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Bebidas (alcoólicas e não alcoólicas)','483','Refrigerante, tipo limão','89,69000000000000000000','39,71910000000000000000','166,18471440000000000000','0,00000000000000000000','0,00000000000000000000','NA','10,26333333333330000000','NA','0,04666666666666670000','1,75066666666667000000','0,53100000000000000000','Tr','Tr','Tr','8,80333333333333000000','4,26900000000000000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Ovos e derivados','484','Omelete, de queijo','60,49166666666670000000','268,00677218242500000000','1121,34033481127000000000','15,57083333333330000000','22,00766666666670000000','383,82533333333300000000','0,43716666666666800000','NA','1,49266666666667000000','165,72733333333300000000','14,26766666666670000000','0,02566666666666670000','313,61133333333300000000','1,36966666666667000000','216,05100000000000000000','126,93100000000000000000','0,03166666666666670000','1,36066666666667000000','58,75333333333330000000','','','0,03000000000000000000','0,24333333333333300000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Ovos e derivados','485','Ovo, de codorna, inteiro, cru','71,67000000000000000000','176,89390000000000000000','740,12407760000000000000','13,68750000000000000000','12,68000000000000000000','568,00000000000000000000','0,77249999999999900000','NA','1,19000000000000000000','78,72933333333330000000','11,06300000000000000000','Tr','279,44366666666700000000','3,34866666666667000000','128,98700000000000000000','78,72933333333330000000','0,03533333333333330000','2,05433333333333000000','305,17333333333300000000','','','0,11000000000000000000','0,12333333333333300000','Tr','0,96666666666666700000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Ovos e derivados','486','Ovo, de galinha, clara, cozida/10minutos','85,22766666666670000000','59,43569666666670000000','248,67895485333300000000','13,44791666666670000000','0,08900000000000000000','NA','0,00000000000000000000','NA','0,66833333333333300000','6,23200000000000000000','11,00700000000000000000','Tr','15,42766666666670000000','0,07866666666666670000','180,53766666666700000000','145,87033333333300000000','0,02866666666666670000','Tr','NA','','','Tr','0,08000000000000000000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Ovos e derivados','487','Ovo, de galinha, gema, cozida/10minutos','50,02266666666670000000','352,67334000000000000000','1475,58525456000000000000','15,90000000000000000000','30,77700000000000000000','1272,37200000000000000000','1,56000000000001000000','NA','1,74033333333333000000','114,43100000000000000000','9,36733333333333000000','0,05933333333333330000','385,74700000000000000000','2,92333333333333000000','44,90866666666670000000','87,37733333333340000000','Tr','2,87366666666667000000','148,48000000000000000000','','','0,18000000000000000000','0,21666666666666700000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Ovos e derivados','488','Ovo, de galinha, inteiro, cozido/10minutos','75,76566666666670000000','145,70017000000000000000','609,60951128000000000000','13,29375000000000000000','9,47633333333333000000','396,57166666666700000000','0,61491666666667400000','NA','0,84933333333333300000','49,21833333333330000000','11,24433333333330000000','0,02366666666666670000','184,19033333333300000000','1,51533333333333000000','145,90100000000000000000','138,89700000000000000000','0,03966666666666670000','1,23600000000000000000','32,44000000000000000000','','','0,07666666666666670000','0,30000000000000000000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Ovos e derivados','489','Ovo, de galinha, inteiro, cru','75,60000000000000000000','143,11173333333300000000','598,77949226666700000000','13,03000000000000000000','8,90000000000000000000','355,94000000000000000000','1,63666666666667000000','NA','0,83333333333333300000','42,02333333333330000000','12,66000000000000000000','Tr','164,35000000000000000000','1,56333333333333000000','167,91000000000000000000','150,00000000000000000000','0,06000000000000000000','1,08333333333333000000','78,82666666666670000000','','','0,07000000000000000000','0,58000000000000000000','Tr','0,75000000000000000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Ovos e derivados','490','Ovo, de galinha, inteiro, frito','63,49733333333330000000','240,18722400911700000000','1004,94334525414000000000','15,61666666666670000000','18,59266666666670000000','516,26366666666700000000','1,19366666666666000000','NA','1,09966666666667000000','72,88733333333330000000','16,25033333333330000000','0,03433333333333330000','422,41066666666700000000','2,09666666666667000000','166,11233333333300000000','184,00700000000000000000','0,03866666666666670000','1,46133333333333000000','93,89333333333330000000','','','0,06333333333333330000','0,31666666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','491','Achocolatado, pó','1,10333333333333000000','401,02000000000000000000','1677,86768000000000000000','4,20333333333333000000','2,16666666666667000000','Tr','91,17666666666670000000','3,89000000000000000000','1,35000000000000000000','44,40333333333330000000','76,74333333333330000000','0,55066666666666700000','199,96666666666700000000','5,36000000000000000000','64,78666666666670000000','496,45000000000000000000','0,56000000000000000000','1,04000000000000000000','795,85000000000000000000','','','1,38000000000000000000','1,02000000000000000000','1,52333333333333000000','4,98666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','492','Açúcar, cristal','0,05000000000000000000','386,84572400000000000000','1619,20800000000000000000','0,32000000000000000000','Tr','NA','99,61000000000000000000','NA','Tr','7,58666666666667000000','1,00666666666667000000',' ','Tr','0,16333333333333300000','Tr','2,56000000000000000000',' Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','493','Açúcar, mascavo','3,32400000000000000000','368,55482252438900000000','1542,03337744204000000000','0,75833333333333300000','0,09200000000000000000','NA','94,45000000000000000000','NA','1,37566666666667000000','126,52900000000000000000','79,94666666666670000000','2,02600000000000000000','38,16000000000000000000','8,30366666666667000000','25,20400000000000000000','521,62666666666700000000','0,17133333333333300000','0,47766666666666700000','NA','','','Tr','0,03000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','494','Açúcar, refinado','0,12000000000000000000','386,57482400000000000000','1617,42906361600000000000','0,32000000000000000000','Tr','NA','99,54000000000000000000','NA','Tr','3,50000000000000000000','0,54666666666666700000',' ','Tr','0,10666666666666700000','12,16000000000000000000','6,35333333333333000000',' Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','495','Chocolate, ao leite','1,25666666666667000000','539,58666666666700000000','2257,63061333333000000000','7,22000000000000000000','30,26666666666670000000','16,51750000000000000000','59,57666666666670000000','2,17000000000000000000','1,68000000000000000000','191,19000000000000000000','57,10000000000000000000','0,30266666666666700000','212,11333333333300000000','1,57666666666667000000','77,10000000000000000000','354,51333333333300000000','0,31333333333333300000','1,06333333333333000000','Tr',' ',' ','0,05000000000000000000','0,21666666666666700000','0,59000000000000000000','0,63000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','496','Chocolate, ao leite, com castanha do Pará','1,21433333333333000000','558,87633333333300000000','2338,33857866667000000000','7,41250000000000000000','34,19100000000000000000','15,50133333333330000000','55,37683333333330000000','2,45800000000000000000','1,80533333333333000000','171,23266666666700000000','79,56600000000000000000','0,36366666666666700000','302,52200000000000000000','1,47100000000000000000','64,05000000000000000000','430,91566666666700000000','0,45200000000000000000','1,30400000000000000000','36,15333333333330000000','','','0,04000000000000000000','0,24333333333333300000','Tr','1,36666666666667000000','1,42000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','497','Chocolate, ao leite, dietético','1,73200000000000000000','556,82433333333300000000','2329,75301066667000000000','6,89791666666667000000','33,77100000000000000000','12,96033333333330000000','56,32341666666670000000','2,84666666666667000000','1,27566666666667000000','187,88566666666700000000','67,20633333333330000000','0,40666666666666700000','276,47100000000000000000','3,31066666666667000000','84,70833333333330000000','458,40166666666700000000','0,42533333333333300000','1,11566666666667000000','7,03666666666667000000','','','0,30666666666666700000','0,25000000000000000000','Tr','0,79000000000000000000','2,04666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','498','Chocolate, meio amargo','1,02166666666667000000','474,91776997327400000000','1987,05594956818000000000','4,86244343217214000000','29,85666666666670000000','2,22033333333333000000','62,42288990116120000000','4,94366666666667000000','1,83633333333333000000','44,66533333333330000000','107,36366666666700000000','0,83233333333333300000','219,97933333333300000000','3,61066666666667000000','8,86700000000000000000','431,69566666666700000000','0,76566666666666700000','1,52133333333333000000','Tr','','','0,20000000000000000000','0,03666666666666670000','Tr','1,06333333333333000000','2,09666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','499','Cocada branca','3,42366666666667000000','448,84545242331000000000','1877,96937293913000000000','1,12183337370555000000','13,58700000000000000000','NA','81,38316662629450000000','3,56900000000000000000','0,48433333333333300000','7,05733333333333000000','17,40866666666670000000','0,36066666666666700000','396,41000000000000000000','1,24300000000000000000','28,99233333333330000000','183,07300000000000000000','0,20233333333333300000','0,41200000000000000000','NA','','','Tr','Tr','0,16333333333333300000','0,46666666666666700000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','500','Doce, de abóbora, cremoso','43,88000000000000000000','198,93606304963400000000','832,34848779967000000000','0,91666666666666700000','0,20666666666666700000','NA','54,61333333333330000000','2,28000000000000000000','0,38333333333333300000','12,98666666666670000000','5,52100000000000000000','0,00800000000000000000','13,73566666666670000000','0,85333333333333300000','Tr','136,74633333333300000000','Tr','Tr','NA','','','0,07666666666666670000','Tr','0,04000000000000000000','Tr','0,11333333333333300000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','501','Doce, de leite, cremoso','27,50000000000000000000','306,31013023105900000000','1281,60158488675000000000','5,47829343159994000000','5,99300000000000000000','20,05866666666670000000','59,49337323506670000000','NA','1,53533333333333000000','195,10066666666700000000','16,26200000000000000000','0,01333333333333330000','140,78400000000000000000','0,06566666666666670000','120,08866666666700000000','259,46400000000000000000','0,02233333333333330000','0,52533333333333300000','35,63666666666670000000','35,63666666666670000000','35,63666666666670000000','0,05000000000000000000','0,25666666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','502','Geléia, mocotó, natural','73,48000000000000000000','106,08666666666700000000','443,86661333333300000000','2,12500000000000000000','0,07333333333333330000','Tr','24,23166666666670000000','NA','0,09000000000000000000','3,52333333333333000000','0,74633333333333300000','Tr','Tr','0,11633333333333300000','42,68033333333330000000','2,00500000000000000000','Tr','Tr','Tr',' ',' ','0,19000000000000000000','Tr','0,22333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','503','Glicose de milho','20,41333333333330000000','292,11840529918700000000','1222,22340777180000000000','0,00000000000000000000','0,00000000000000000000','NA','79,38000000000000000000','NA','0,20666666666666700000','5,66533333333333000000','1,89533333333333000000','Tr','4,77566666666667000000','0,05133333333333330000','58,92966666666670000000','5,05633333333333000000','Tr','Tr','NA','','',' ',' ',' ',' ',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','504','Maria mole','21,57166666666670000000','301,23588753700000000000','1260,37095345481000000000','3,81285013103485000000','0,19000000000000000000','NA','73,55348320229850000000','0,66666666666666700000','0,87200000000000000000','13,35766666666670000000','6,88666666666667000000','0,05800000000000000000','4,34766666666667000000','0,39466666666666700000','15,30933333333330000000','23,55933333333330000000','0,19500000000000000000','0,08533333333333330000','NA','','','0,04333333333333330000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','505','Maria mole, coco queimado','20,73166666666670000000','306,63189699701800000000','1282,94785703553000000000','3,93495013523102000000','0,08933333333333330000','NA','75,05938319810230000000','0,63666666666666700000','0,18466666666666700000','19,45633333333330000000','5,98766666666667000000','0,08500000000000000000','5,41666666666667000000','0,47133333333333300000','14,28733333333330000000','35,95900000000000000000','0,02666666666666670000','0,09466666666666670000','NA','','','0,03666666666666670000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','506','Marmelada','28,49866666666670000000','257,24147319380400000000','1076,29832384288000000000','0,40000000000000000000','0,13733333333333300000','NA','70,76333333333330000000','4,07000000000000000000','0,20066666666666700000','11,32466666666670000000','5,80333333333333000000','0,05500000000000000000','19,62066666666670000000','0,72900000000000000000','10,88366666666670000000','83,14666666666670000000','0,08866666666666670000','0,07766666666666670000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','507','Mel, de abelha','15,82333333333330000000','309,24266666666700000000','1293,87131733333000000000','0,00000000000000000000','0,00000000000000000000','NA','84,03333333333330000000','NA','0,14333333333333300000','10,20433333333330000000','5,51133333333333000000','0,38300000000000000000','3,88633333333333000000','0,25066666666666700000','6,04000000000000000000','99,32166666666670000000','Tr','0,17233333333333300000','NA','','','0,10666666666666700000','Tr','Tr','Tr','0,73666666666666700000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','508','Melado','22,08666666666670000000','296,50649123191800000000','1240,58315931435000000000','0,00000000000000000000','0,00000000000000000000','NA','76,61666666666670000000','NA','1,29666666666667000000','102,06333333333300000000','115,13666666666700000000','2,62333333333333000000','73,61333333333330000000','5,39166666666667000000','4,01000000000000000000','395,06000000000000000000','0,83633333333333300000','0,27333333333333300000','NA','','','Tr','0,05000000000000000000','0,20000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','509','Quindim','23,93000000000000000000','411,34872157084900000000','1721,08305105243000000000','4,73750000000000000000','24,42500000000000000000','271,01700000000000000000','46,29883333333330000000','3,22333333333333000000','0,60866666666666700000','37,17866666666670000000','14,90400000000000000000','0,24633333333333300000','167,91066666666700000000','1,38166666666667000000','27,36600000000000000000','111,00466666666700000000','0,10466666666666700000','1,10900000000000000000','75,97666666666670000000','','','Tr','0,04000000000000000000','0,04000000000000000000','1,14000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Produtos açucarados','510','Rapadura','7,09533333333333000000','351,95812210154500000000','1472,59278287287000000000','0,98958333333333300000','0,07066666666666670000','NA','90,79241666666670000000','NA','1,05200000000000000000','30,48633333333330000000','47,18033333333330000000','1,66300000000000000000','21,30066666666670000000','4,44133333333333000000','21,71066666666670000000','458,87400000000000000000','0,17333333333333300000','0,56233333333333300000','NA','','','Tr','Tr','0,03666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','511','Café, pó, torrado','2,93000000000000000000','418,61866666666700000000','1751,50050133333000000000','14,70000000000000000000','11,94666666666670000000','NA','65,75333333333330000000','51,22666666666670000000','4,67000000000000000000','106,89333333333300000000','165,12000000000000000000','2,57933333333333000000','169,48000000000000000000','8,13333333333333000000','1,13333333333333000000','1608,58000000000000000000','1,30333333333333000000','0,52333333333333300000','NA','','','Tr','Tr','Tr','11,88666666666670000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','512','Capuccino, pó','2,60333333333333000000','417,40666666666700000000','1746,42949333333000000000','11,31250000000000000000','8,63333333333333000000','28,90100000000000000000','73,61416666666670000000','2,44333333333333000000','3,83666666666667000000','466,59066666666700000000','70,84966666666670000000','0,17100000000000000000','357,60866666666700000000','2,27566666666667000000','382,28666666666700000000','885,79566666666700000000','Tr','1,14466666666667000000','51,53000000000000000000','','','Tr','1,41000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','513','Fermento em pó, químico','7,07666666666667000000','89,72206665112180000000','375,39712686829300000000','0,47533331871032700000','0,07333333333333330000','NA','43,91133334795630000000','NA','48,46333333333330000000',' ',' ',' ',' ',' ','10052,41133333330000000000',' ',' ',' ','NA','','',' ',' ',' ',' ',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','514','Fermento, biológico, levedura, tablete','71,90100000000000000000','89,79486703058890000000','375,70172365598400000000','16,95699947834010000000','1,51766666666667000000','NA','7,69866718832652000000','4,16566666666667000000','1,92566666666667000000','18,00866666666670000000','38,44866666666670000000','0,20300000000000000000','418,65666666666700000000','2,61800000000000000000','39,61066666666670000000','576,24433333333300000000','0,28800000000000000000','10,99966666666670000000','NA','','','0,30333333333333300000','0,35666666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','515','Gelatina, sabores variados, pó','1,24333333333333000000','380,22290000000000000000','1590,85261360000000000000','8,88666666666667000000','Tr','NA','89,22333333333330000000','NA','0,61666666666666700000','26,83666666666670000000','2,30666666666667000000','0,02633333333333330000','1,99000000000000000000','0,33333333333333300000','234,92333333333300000000','7,25000000000000000000','Tr','Tr','NA','','','Tr','Tr','Tr','Tr','39,99666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','516','Sal, dietético','0,59666666666666700000','NA','NA','NA','NA','NA','NA','NA','99,40333333333340000000','','','','','','23431,52166666670000000000','20467,63700000000000000000','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','517','Sal, grosso','0,41333333333333300000','NA','NA','NA','NA','NA','NA','NA','','','','','','','39943,20300000000000000000','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','518','Shoyu','70,62666666666670000000','60,92774987538660000000','254,92170547861700000000','3,31250000000000000000','0,32666666666666700000','NA','11,64750000000000000000','NA','14,08666666666670000000','14,52800000000000000000','23,62700000000000000000','0,06500000000000000000','47,04300000000000000000','0,49866666666666700000','5024,20833333333000000000','165,17733333333300000000','Tr','0,18600000000000000000','NA','','','0,82666666666666700000','0,06000000000000000000','0,15333333333333300000','2,10000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Miscelâneas','519','Tempero a base de sal','7,65000000000000000000','21,33000000000000000000','89,24472000000010000000','2,66666666666667000000','0,26333333333333300000','NA','2,07333333333334000000','0,55666666666666700000','87,34666666666670000000','','','','','','32560,00000000000000000000','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Outros alimentos industrializados','520','Azeitona, preta, conserva','68,46400000000000000000','194,15384702098400000000','812,33969593579600000000','1,16250000000000000000','20,34500000000000000000','NA','5,54450000000000000000','4,55500000000000000000','4,48400000000000000000','58,75066666666670000000','4,76200000000000000000','0,05500000000000000000','16,00266666666670000000','5,45000000000000000000','1566,66100000000000000000','78,57200000000000000000','0,25233333333333300000','0,29396666666666700000','NA','','','Tr','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Outros alimentos industrializados','521','Azeitona, verde, conserva','76,25900000000000000000','136,93643000000000000000','572,94202312000000000000','0,94791666666666600000','14,21566666666670000000','NA','4,10175000000000000000','3,84566666666667000000','4,47566666666667000000','45,63933333333330000000','3,93666666666667000000','0,02566666666666670000','5,36000000000000000000','0,17633333333333300000','1347,17766666667000000000','19,80533333333330000000','0,14100000000000000000','0,07733333333333330000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Outros alimentos industrializados','522','Chantilly, spray, com gordura vegetal','55,14266660000000000000','314,95600026666700000000','1317,77590511573000000000','0,52500000000000000000','27,27066666666670000000','Tr','16,85500006666670000000','NA','0,20666666666666700000','2,27433333333333000000','0,84633333333333300000','Tr','15,64633333333330000000','Tr','109,70366666666700000000','5,11133333333333000000','0,01433333333333330000','0,07400000000000000000','Tr',' ',' ','0,07000000000000000000','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Outros alimentos industrializados','523','Leite, de coco','77,98366666666670000000','166,16030161554600000000','695,21470195944600000000','1,01406670316060000000','18,36433333333330000000','NA','2,19459996350605000000','0,68366666666666700000','0,44333333333333300000','5,85033333333333000000','16,82533333333330000000','0,23833333333333300000','25,51900000000000000000','0,45566666666666700000','44,29466666666670000000','143,67300000000000000000','0,15533333333333300000','0,31566666666666700000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Outros alimentos industrializados','524','Maionese, tradicional com ovos','58,42366666666670000000','302,15267768782400000000','1264,20680344585000000000','0,58125000000000000000','30,49766666666670000000','42,46733333333330000000','7,89975000000000000000','NA','2,59766666666667000000','3,47833333333333000000','0,85533333333333300000','Tr','14,45333333333330000000','0,09700000000000000000','786,82733333333300000000','16,08800000000000000000','Tr','0,06000000000000000000','8,00000000000000000000','','','Tr','0,05333333333333330000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','525','Acarajé','50,46400000000000000000','289,21166666666700000000','1210,06161333333000000000','8,34583333333334000000','19,93033333333330000000','25,46433333333330000000','19,11383333333330000000','9,35833333333333000000','2,14600000000000000000','124,41933333333300000000','51,12433333333330000000','0,59466666666666700000','141,55666666666700000000','1,93300000000000000000','304,88866666666700000000','353,66033333333300000000','0,22566666666666700000','1,19366666666667000000','Tr','','','0,06333333333333330000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','526','Arroz carreteiro','68,03566666666670000000','153,77200000000000000000','643,38204800000000000000','10,82916666666670000000','7,12400000000000000000','36,08866666666670000000','11,58483333333330000000','1,50166666666667000000','2,42633333333333000000','13,25600000000000000000','9,29066666666667000000','0,18266666666666700000','47,63800000000000000000','0,95500000000000000000','1621,72800000000000000000','87,15000000000000000000','0,07800000000000000000','2,67066666666667000000','Tr','','','0,03000000000000000000','Tr','0,07333333333333340000','1,60333333333333000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','527','Baião de dois, arroz e feijão-de-corda','69,05133333333330000000','135,68133333333300000000','567,69069866666700000000','6,23958333333333000000','3,22800000000000000000','4,10333333333333000000','20,41775000000000000000','5,06900000000000000000','1,06333333333333000000','33,29666666666670000000','18,67766666666670000000','0,27233333333333300000','71,67600000000000000000','0,56233333333333300000','93,29966666666670000000','157,30866666666700000000','0,07533333333333330000','0,59900000000000000000','Tr','','','0,03666666666666670000','Tr','0,03666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','528','Barreado','71,16733333333330000000','164,97523404741300000000','690,25637925437600000000','18,26875000000000000000','9,53400000000000000000','60,11000000000000000000','0,23625000000000000000','0,14666666666666700000','0,79366666666666700000','14,51233333333330000000','21,37133333333330000000','0,05066666666666670000','169,31466666666700000000','2,44400000000000000000','47,62733333333330000000','294,55633333333300000000','0,16533333333333300000','4,82566666666667000000','Tr','','','0,03000000000000000000','0,04000000000000000000','Tr','2,09333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','529','Bife à cavalo, com contra filé','54,21200000000000000000','291,22950924495900000000','1218,50426668091000000000','23,66041666666670000000','21,14666666666670000000','256,63333333333300000000','0,00000000000000000000','NA','1,12133333333333000000','25,97933333333330000000','19,48733333333330000000','0,01533333333333330000','215,81700000000000000000','2,10333333333333000000','82,87466666666670000000','272,23333333333300000000','0,05666666666666670000','3,20866666666667000000','36,79666666666670000000','','','0,04666666666666670000','0,10333333333333300000','Tr','2,91666666666667000000','','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','530','Bolinho de arroz','41,50000000000000000000','273,51433333333300000000','1144,38397066667000000000','8,03958333333333000000','8,29166666666667000000','70,29566666666670000000','41,68275000000000000000','2,73733333333333000000','0,48600000000000000000','23,56966666666670000000','13,45266666666670000000','0,41566666666666700000','87,27166666666670000000','2,12266666666667000000','58,85733333333330000000','96,45366666666670000000','0,13133333333333300000','0,86033333333333300000','Tr','','','0,08333333333333330000','0,04666666666666670000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','531','Camarão à baiana','81,98933333333330000000','100,78304300403600000000','421,67625192888600000000','7,94166666666667000000','5,96766666666667000000','116,78233333333300000000','3,17366666666667000000','0,38666666666666700000','0,92766666666666700000','42,68066666666670000000','14,86400000000000000000','0,10833333333333300000','244,08666666666700000000','1,41800000000000000000','84,78666666666670000000','139,13800000000000000000','0,07300000000000000000','0,46866666666666700000','Tr','','','Tr','Tr','Tr','0,30666666666666700000','4,07000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','532','Charuto, de repolho','81,54866666666670000000','78,23472922221820000000','327,33410706576100000000','6,77916666666667000000','1,11666666666667000000','21,34266666666670000000','10,13316666666670000000','1,46000000000000000000','0,42233333333333300000','22,88733333333330000000','13,45966666666670000000','0,21966666666666700000','67,88566666666670000000','0,86200000000000000000','12,10066666666670000000','184,03366666666700000000','1,44666666666667000000','1,75033333333333000000','Tr','','','0,03000000000000000000','Tr','Tr','0,32000000000000000000','4,77333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','533','Cuscuz, de milho, cozido com sal','71,13700000000000000000','113,45948166666700000000','474,71447129333300000000','2,15625000000000000000','0,67966666666666700000','NA','25,28141666666670000000','2,05333333333333000000','0,74566666666666700000','1,54066666666667000000','2,71800000000000000000','0,02300000000000000000','23,18266666666670000000','0,17333333333333300000','247,66600000000000000000','10,85366666666670000000','Tr','0,20200000000000000000','Tr','','','Tr','Tr','0,06333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','534','Cuscuz, paulista','68,93666666666670000000','142,12300000000000000000','594,64263200000000000000','2,55833333333333000000','4,64833333333333000000','15,04866666666670000000','22,51366666666670000000','2,43266666666667000000','1,34300000000000000000','14,16133333333330000000','5,09600000000000000000','0,06266666666666670000','25,95233333333330000000','0,33000000000000000000','235,70966666666700000000','52,93266666666670000000','0,04900000000000000000','0,21000000000000000000','Tr','','','Tr','Tr','Tr','0,93333333333333300000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','535','Cuxá, molho','80,99400000000000000000','80,09161563650770000000','335,10331982314800000000','5,64375000000000000000','3,59266666666667000000','58,38633333333330000000','5,73891666666667000000','3,01666666666667000000','4,03066666666667000000','105,48066666666700000000','33,57933333333330000000','0,23433333333333300000','111,13466666666700000000','0,94400000000000000000','1344,29466666667000000000','124,05633333333300000000','0,17200000000000000000','0,57066666666666700000','Tr','32,58055555555560000000','16,29027777777780000000','0,04000000000000000000','Tr','0,03000000000000000000','1,09666666666667000000','10,28000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','536','Dobradinha','75,26700000000000000000','124,50020083333300000000','520,90884028666700000000','19,77291666666670000000','4,44233333333333000000','144,01800000000000000000','0,00000000000000000000','NA','0,29266666666666700000','11,33666666666670000000','8,25033333333333000000','0,10500000000000000000','57,11766666666670000000','1,01000000000000000000','28,77366666666670000000','57,57733333333330000000','0,05500000000000000000','2,72066666666667000000','Tr','','','Tr','Tr','Tr','4,26666666666667000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','537','Estrogonofe de carne','70,12833333333330000000','173,14136431801300000000','724,42346830656700000000','15,03125000000000000000','10,80300000000000000000','66,21600000000000000000','2,97541666666667000000','','1,06200000000000000000','28,31800000000000000000','21,51166666666670000000','0,03333333333333330000','185,57100000000000000000','2,69933333333333000000','122,84800000000000000000','322,31366666666700000000','0,14033333333333300000','2,04133333333333000000','27,63333333333330000000','','','0,06000000000000000000','0,05000000000000000000','Tr','3,25333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','538','Estrogonofe de frango','70,89233333333330000000','156,80610301323700000000','656,07673500738500000000','17,55208333333330000000','7,96233333333333000000','79,95933333333330000000','2,59391666666666000000','','0,99933333333333300000','26,04933333333330000000','24,76433333333330000000','0,02766666666666670000','195,15766666666700000000','1,52133333333333000000','99,45500000000000000000','307,08633333333300000000','0,12333333333333300000','0,58333333333333300000','28,22333333333330000000','','','0,07333333333333340000','0,04000000000000000000','0,03000000000000000000','3,36666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','539','Feijão tropeiro mineiro','61,66766666666670000000','151,56185683095500000000','634,13480898071400000000','10,17083333333330000000','6,79066666666667000000','67,87933333333330000000','19,58183333333330000000','3,57333333333333000000','1,78900000000000000000','41,19566666666670000000','36,10533333333330000000','0,38166666666666700000','199,25500000000000000000','2,16233333333333000000','365,07433333333300000000','348,92933333333300000000','0,21700000000000000000','1,44633333333333000000','8,77000000000000000000','','','Tr','Tr','Tr','1,43666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','540','Feijoada','71,80133333333330000000','116,93345731103400000000','489,24958538936700000000','8,67083333333333000000','6,47733333333333000000','21,96333333333330000000','11,64183333333330000000','5,09000000000000000000','1,40866666666667000000','32,38166666666670000000','31,84966666666670000000','0,24333333333333300000','105,46233333333300000000','1,34700000000000000000','278,22033333333300000000','303,49300000000000000000','0,15366666666666700000','0,83166666666666700000','Tr',' ',' ','0,07666666666666670000','0,03000000000000000000','Tr','0,93000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','541','Frango, com açafrão','79,52466666666670000000','112,78376884122700000000','471,88728883169300000000','9,69791666666667000000','6,17000000000000000000','50,41766666666670000000','4,06208333333333000000','0,22333333333333300000','0,54533333333333300000','12,98833333333330000000','16,08766666666670000000','0,08933333333333330000','166,84466666666700000000','0,83800000000000000000','28,81200000000000000000','256,37466666666700000000','0,02066666666666670000','0,50300000000000000000','8,08666666666667000000','','','0,03000000000000000000','Tr','Tr','1,64000000000000000000','5,28000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','542','Macarrão, molho bolognesa','71,41233333333330000000','119,53177144556000000000','500,12093172822300000000','4,93429983488719000000','0,88966666666666700000','6,92966666666667000000','22,52236683177950000000','0,77666666666666700000','0,24133333333333300000','10,54833333333330000000','9,98133333333333000000','0,22033333333333300000','53,96066666666670000000','1,38900000000000000000','8,93933333333333000000','83,57366666666670000000','0,08700000000000000000','0,75200000000000000000','Tr','','','0,03666666666666670000','Tr','Tr','1,43666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','543','Maniçoba','76,39533333333330000000','134,22289340098700000000','561,58858598972900000000','9,95833333333333000000','8,69933333333333000000','42,76633333333330000000','3,41933333333333000000','2,16000000000000000000','1,52766666666667000000','65,98066666666670000000','23,65233333333330000000','0,59600000000000000000','54,88266666666670000000','3,21533333333333000000','406,70433333333300000000','147,71266666666700000000','0,15966666666666700000','2,02533333333333000000','Tr','221,87500000000000000000','110,93750000000000000000','0,04333333333333330000','0,07000000000000000000','0,05000000000000000000','2,57666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','544','Quibebe','81,10600000000000000000','86,34923029959200000000','361,28517957349300000000','8,55625000000000000000','2,67200000000000000000','NA','6,64408333333332000000','1,66666666666667000000','1,02166666666667000000','7,68466666666667000000','10,39500000000000000000','0,05333333333333330000','42,52500000000000000000','0,77833333333333300000','246,61400000000000000000','152,81266666666700000000','0,60600000000000000000','1,63666666666667000000','Tr','104,91666670000000000000','52,45833335000000000000','Tr','0,03000000000000000000','0,03666666666666670000','','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','545','Salada, de legumes, com maionese','82,03733333333330000000','96,10358839845660000000','402,09741385914200000000','1,05000000000000000000','7,03900000000000000000','7,20133333333333000000','8,92399999999999000000','2,21666666666667000000','0,94966666666666600000','12,12833333333330000000','8,71433333333333000000','0,09666666666666670000','22,26500000000000000000','0,22900000000000000000','228,42566666666700000000','141,29433333333300000000','0,03500000000000000000','0,15633333333333300000','Tr','282,75000000000000000000','141,37500000000000000000','0,03666666666666670000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','546','Salada, de legumes, cozida no vapor','89,97900000000000000000','35,40810429847240000000','148,14750838480900000000','2,00625000000000000000','0,31166666666666700000','NA','7,08908333333334000000','2,51333333333333000000','0,61400000000000000000','32,89500000000000000000','18,57833333333330000000','0,23533333333333300000','44,79100000000000000000','0,44066666666666700000','2,50966666666667000000','244,30366666666700000000','0,17133333333333300000','0,30000000000000000000','NA','510,00000000000000000000','255,00000000000000000000','0,05000000000000000000','0,03000000000000000000','0,03333333333333330000','Tr','29,35000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','547','Salpicão, de frango','72,52766666666670000000','147,86459613402700000000','618,66547022476800000000','13,92500000000000000000','7,84066666666667000000','52,52366666666670000000','4,56899999999999000000','0,41000000000000000000','1,13766666666667000000','9,40900000000000000000','13,25400000000000000000','0,02700000000000000000','102,58300000000000000000','0,31833333333333300000','248,34566666666700000000','148,96800000000000000000','0,07766666666666670000','0,39266666666666700000','Tr','14,50000000000000000000','7,25000000000000000000','0,05000000000000000000','Tr','Tr','1,47666666666667000000','9,25666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','548','Sarapatel','74,95133333333330000000','122,98185821243100000000','514,55609476081300000000','18,47291666666670000000','4,42000000000000000000','315,35733333333300000000','1,09408333333334000000','','1,06166666666667000000','12,23433333333330000000','12,79700000000000000000','0,10366666666666700000','163,50200000000000000000','7,17633333333333000000','215,62266666666700000000','198,75700000000000000000','1,48333333333333000000','1,77033333333333000000','1463,66666666667000000000','','','Tr','0,11000000000000000000','Tr','3,83666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','549','Tabule','85,77000000000000000000','57,45347668848060000000','240,38534646460300000000','2,04632997322082000000','1,20800000000000000000','NA','10,58100336011250000000','2,08333333333333000000','0,39466666666666700000','18,84733333333330000000','17,97733333333330000000','0,36833333333333300000','35,47033333333330000000','0,55133333333333300000','1,19200000000000000000','187,62666666666700000000','0,12133333333333300000','0,57800000000000000000','NA','','','0,03000000000000000000','Tr','Tr','0,60000000000000000000','16,21666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','550','Tacacá','85,19300000000000000000','46,88917715120320000000','196,18431720063400000000','6,95833333333334000000','0,35966666666666700000','70,56200000000000000000','3,39000000000000000000','0,21333333333333300000','4,09900000000000000000','44,81866666666670000000','29,89900000000000000000','0,11533333333333300000','89,16800000000000000000','0,94933333333333300000','1349,06266666667000000000','240,18333333333300000000','0,21900000000000000000','0,79400000000000000000','Tr','35,36111111111110000000','17,68055555555560000000','0,04666666666666670000','Tr','Tr','','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','551','Tapioca, com manteiga','24,90233333333330000000','347,82655625782400000000','1455,30631138274000000000','0,08958333333333330000','10,90833333333330000000','31,19033333333330000000','63,59175000000000000000','Tr','0,50800000000000000000','30,02533333333330000000','3,21800000000000000000','0,06000000000000000000','8,42700000000000000000','0,24000000000000000000','157,52433333333300000000','19,30500000000000000000','0,00800000000000000000','0,03800000000000000000','75,26666666666670000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','552','Tucupi, com pimenta-de-cheiro','91,88433333333330000000','27,18379840272660000000','113,73701251700800000000','2,05625000000000000000','0,28366666666666700000','NA','4,73774999999999000000','0,22666666666666700000','1,03800000000000000000','28,25600000000000000000','42,48566666666670000000','0,52133333333333300000','30,80800000000000000000','1,14833333333333000000','5,13100000000000000000','390,83733333333300000000','0,11966666666666700000','0,85366666666666700000','NA','50,58333400000000000000','25,29166700000000000000','Tr','Tr','0,05333333333333330000','Tr','46,39666666666670000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','553','Vaca atolada','74,95133333333330000000','144,89697968479000000000','606,24896300116200000000','5,12291666666667000000','9,32200000000000000000','18,58633333333330000000','10,06141666666670000000','2,34333333333333000000','0,54233333333333300000','62,65900000000000000000','15,75433333333330000000','0,03900000000000000000','71,77000000000000000000','0,73000000000000000000','25,63366666666670000000','219,81133333333300000000','0,12033333333333300000','1,19600000000000000000','Tr','','','Tr','Tr','Tr','0,77000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','554','Vatapá','58,36233333333330000000','254,89328572415500000000','1066,47350746986000000000','5,99783354918162000000','23,22633333333330000000','44,44966666666670000000','9,74849978415172000000','1,69666666666667000000','2,66500000000000000000','46,81733333333330000000','39,31633333333330000000','0,48000000000000000000','108,44200000000000000000','1,44300000000000000000','879,85066666666700000000','209,40500000000000000000','0,27900000000000000000','0,85066666666666700000','Tr','','','Tr','Tr','Tr','1,79666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','555','Virado à paulista','48,59033333333330000000','306,94678645132000000000','1284,26535451232000000000','10,18125000000000000000','25,59066666666670000000','65,84266666666670000000','14,10908333333330000000','2,16333333333333000000','1,52866666666667000000','40,70666666666670000000','21,81033333333330000000','0,15400000000000000000','135,49400000000000000000','1,05100000000000000000','345,52600000000000000000','237,26166666666700000000','0,07200000000000000000','1,04100000000000000000','10,17333333333330000000','','','0,14000000000000000000','0,05000000000000000000','Tr','2,59666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Alimentos preparados','556','Yakisoba','69,37666666666670000000','112,80204125340800000000','471,96374060425800000000','7,51666666666667000000','2,60700000000000000000','NA','18,25133333333330000000','1,05666666666667000000','2,24833333333333000000','13,94700000000000000000','13,33500000000000000000','0,14700000000000000000','83,02566666666670000000','0,62233333333333300000','793,76200000000000000000','158,57133333333300000000','0,06100000000000000000','0,67966666666666700000','NA','62,00000000000000000000','31,00000000000000000000','0,16333333333333300000','Tr','Tr','2,09333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','557','Amendoim, grão, cru','6,42700000000000000000','544,05265579943300000000','2276,31631186483000000000','27,19080018997190000000','43,85000000000000000000','NA','20,31353333333330000000','8,03600000000000000000','2,21866666666667000000','Tr','170,51100000000000000000','1,95733333333333000000','407,20100000000000000000','2,53200000000000000000','Tr','580,43600000000000000000','0,78066666666666700000','3,16733333333333000000','NA','','','0,10000000000000000000','0,03000000000000000000','0,76333333333333300000','10,17666666666670000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','558','Amendoim, torrado, salgado','1,68666666666667000000','605,78109291701900000000','2534,58809276481000000000','22,47518015702570000000','53,96333333333330000000','NA','18,70248650964100000000','7,76333333333333000000','3,17233333333333000000','39,42566666666670000000','159,33633333333300000000','1,70100000000000000000','260,75566666666700000000','1,33266666666667000000','375,73266666666700000000','495,67100000000000000000','0,68166666666666700000','2,11600000000000000000','NA','','','0,08333333333333330000','Tr','0,21000000000000000000','7,47000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','559','Ervilha, em vagem','76,84133333333330000000','88,09358199977850000000','366,96718978666700000000','7,45208333333333000000','0,47100000000000000000','NA','14,22758333333330000000','9,72100000000000000000','1,00800000000000000000','24,44396666666670000000','41,75966666666670000000','0,40233333333333300000','151,97833333333300000000','1,43900000000000000000','Tr','310,97633333333300000000','0,19633333333333300000','1,23000000000000000000','NA','','','0,27333333333333300000','0,07000000000000000000','0,06000000000000000000','1,16333333333333000000','12,44333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','560','Ervilha, enlatada, drenada','80,14333333333330000000','73,84470434782610000000','308,96624299130400000000','4,59782608695652000000','0,38000000000000000000','NA','13,44217391304350000000','5,08000000000000000000','1,43666666666667000000','22,21500000000000000000','23,19033333333330000000','0,46033333333333300000','78,51033333333330000000','1,38533333333333000000','372,10966666666700000000','147,12333333333300000000','0,13766666666666700000','0,87833333333333300000','NA','9,16666666666667000000','4,58333333333333000000','0,06666666666666670000','0,03000000000000000000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','561','Feijão, carioca, cozido','80,35063333333330000000','76,42408566666670000000','319,75837442933300000000','4,77500000000000000000','0,54233333333333300000','NA','13,59103333333330000000','8,51033333333333000000','0,74100000000000000000','26,59466666666670000000','42,33966666666670000000','0,28433333333333300000','86,85433333333330000000','1,28900000000000000000','1,75900000000000000000','254,61666666666700000000','0,18833333333333300000','0,70000000000000000000','NA','','','0,04000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','562','Feijão, carioca, cru','13,99666666666670000000','329,02673623188400000000','1376,64786439420000000000','19,98188405797100000000','1,25666666666667000000','NA','61,22144927536230000000','18,42000000000000000000','3,54333333333333000000','122,57000000000000000000','209,94666666666700000000','1,02000000000000000000','385,37666666666700000000','7,98666666666667000000','Tr','1352,45666666667000000000','0,79000000000000000000','2,90333333333333000000','NA','','','0,16666666666666700000','Tr','0,65000000000000000000','4,02333333333333000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','563','Feijão, fradinho, cozido','80,00933333333330000000','78,00889666666670000000','326,38922365333300000000','5,09375000000000000000','0,64400000000000000000','NA','13,49958333333330000000','7,47200000000000000000','0,75333333333333300000','17,45333333333330000000','38,11833333333330000000','0,53000000000000000000','84,59266666666670000000','1,05966666666667000000','0,98200000000000000000','252,97633333333300000000','0,10266666666666700000','1,11533333333333000000','NA','','','0,12333333333333300000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','564','Feijão, fradinho, cru','12,69666666666670000000','339,16476666666700000000','1419,06538373333000000000','20,20833333333330000000','2,36500000000000000000','NA','61,24000000000000000000','23,59333333333330000000','3,49000000000000000000','77,52300000000000000000','178,39066666666700000000','1,42800000000000000000','354,51500000000000000000','5,12866666666667000000','10,31366666666670000000','1082,74333333333000000000','0,69866666666666700000','3,88266666666667000000','NA','','','0,13666666666666700000','0,03000000000000000000','0,26000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','565','Feijão, jalo, cozido','75,84233333333330000000','92,73992000000000000000','388,02382528000000000000','6,14375000000000000000','0,51200000000000000000','NA','16,49525000000000000000','13,86600000000000000000','1,00666666666667000000','29,40066666666670000000','44,10400000000000000000','0,32033333333333300000','121,00833333333300000000','1,92100000000000000000','0,52033333333333300000','347,72066666666700000000','0,23633333333333300000','1,01400000000000000000','NA','','','0,12666666666666700000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','566','Feijão, jalo, cru','13,53333333333330000000','327,90526666666700000000','1371,95563573333000000000','20,10416666666670000000','0,94666666666666700000','NA','61,47916666666670000000','30,32000000000000000000','3,93666666666667000000','97,97000000000000000000','169,90300000000000000000','0,99100000000000000000','427,18900000000000000000','7,02766666666667000000','24,58033333333330000000','1275,95133333333000000000','0,95100000000000000000','3,00600000000000000000','NA','','','0,10000000000000000000','Tr','0,12333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','567','Feijão, preto, cozido','80,21800000000000000000','77,02726666666670000000','322,28208373333300000000','4,47916666666667000000','0,53566666666666700000','NA','14,00516666666670000000','8,40233333333333000000','0,76200000000000000000','29,00433333333330000000','40,37133333333330000000','0,36533333333333300000','88,03066666666670000000','1,46566666666667000000','1,85400000000000000000','256,37333333333300000000','0,19766666666666700000','0,72100000000000000000','NA','','','0,06000000000000000000','Tr','0,03000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','568','Feijão, preto, cru','14,87666666666670000000','323,56571159420300000000','1353,79893731014000000000','21,34420289855070000000','1,24000000000000000000','NA','58,75246376811600000000','21,83333333333330000000','3,78666666666667000000','110,90333333333300000000','188,10666666666700000000','1,31600000000000000000','471,15666666666700000000','6,46333333333333000000','Tr','1415,68000000000000000000','0,82666666666666700000','2,85333333333333000000','NA','','','0,11666666666666700000','Tr','0,59000000000000000000','4,60000000000000000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','569','Feijão, rajado, cozido','77,86433333333330000000','84,70185273349290000000','354,39255183693400000000','5,53750000000000000000','0,40000000000000000000','NA','15,26750000000000000000','9,31800000000000000000','0,93066666666666700000','29,18966666666670000000','41,70733333333330000000','0,29433333333333300000','112,93166666666700000000','1,35733333333333000000','0,68700000000000000000','314,58400000000000000000','0,22700000000000000000','0,91900000000000000000','NA','','','0,09333333333333330000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','570','Feijão, rajado, cru','14,96333333333330000000','325,84441116273400000000','1363,33301630488000000000','17,27083333333330000000','1,17000000000000000000','NA','62,92916666666670000000','24,00666666666670000000','3,66666666666667000000','111,42533333333300000000','169,90033333333300000000','1,17000000000000000000','334,78833333333300000000','18,58166666666670000000','13,65033333333330000000','1134,54166666667000000000','0,84433333333333300000','2,59666666666667000000','NA','','','0,07000000000000000000','0,03000000000000000000','0,06666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','571','Feijão, rosinha, cozido','82,58100000000000000000','67,86622877142830000000','283,95230117965600000000','4,53958333333333000000','0,47733333333333300000','NA','11,82275000000000000000','4,76000000000000000000','0,57933333333333300000','19,24400000000000000000','42,95966666666670000000','0,46133333333333300000','89,50900000000000000000','1,18433333333333000000','2,08066666666667000000','240,56700000000000000000','0,09166666666666670000','1,30500000000000000000','NA','','','Tr','Tr','Tr','3,69000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','572','Feijão, rosinha, cru','11,95333333333330000000','336,96191112756700000000','1409,84863615774000000000','20,91666666666670000000','1,33000000000000000000','NA','62,22333333333330000000','20,62666666666670000000','3,57666666666667000000','67,66166666666670000000','184,49733333333300000000','1,07833333333333000000','393,58600000000000000000','5,32033333333333000000','24,11433333333330000000','1108,65966666667000000000','0,59533333333333300000','3,97800000000000000000','NA','','','0,16333333333333300000','0,03000000000000000000','Tr','3,92333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','573','Feijão, roxo, cozido','79,98600000000000000000','76,89338231790060000000','321,72191161809600000000','5,72083333333333000000','0,53833333333333300000','NA','12,90816666666670000000','11,51433333333330000000','0,84666666666666700000','22,53200000000000000000','34,39266666666670000000','0,32100000000000000000','106,32500000000000000000','1,41100000000000000000','1,45700000000000000000','268,08633333333300000000','0,22466666666666700000','1,00600000000000000000','NA','','','0,14666666666666700000','Tr','0,03000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','574','Feijão, roxo, cru','12,63666666666670000000','331,41497745672900000000','1386,64026567895000000000','22,16666666666670000000','1,23666666666667000000','NA','59,98666666666670000000','33,84333333333330000000','3,97333333333333000000','120,45766666666700000000','161,93533333333300000000','1,34066666666667000000','393,69833333333300000000','6,91733333333333000000','9,75766666666667000000','1221,39700000000000000000','1,03733333333333000000','3,29300000000000000000','NA','','','0,26333333333333300000','Tr','0,08000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','575','Grão-de-bico, cru','12,29000000000000000000','354,70287658910000000000','1484,07683564879000000000','21,22916666666670000000','5,43000000000000000000','NA','57,88416666666670000000','12,35666666666670000000','3,16666666666667000000','114,35933333333300000000','146,38700000000000000000','3,15666666666667000000','342,33533333333300000000','5,37766666666667000000','5,19400000000000000000','1115,70166666667000000000','0,67066666666666700000','3,19100000000000000000','NA','','','0,52000000000000000000','Tr','0,75333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','576','Guandu, cru','11,44900000000000000000','344,13365128499300000000','1439,85519697641000000000','18,96458333333330000000','2,13200000000000000000','NA','64,00041666666670000000','21,31366666666670000000','3,45400000000000000000','129,33766666666700000000','166,00000000000000000000','1,01566666666667000000','269,19433333333300000000','1,94333333333333000000','1,61700000000000000000','1214,79766666667000000000','0,57300000000000000000','2,01666666666667000000','NA','','','1,06333333333333000000','Tr','0,07000000000000000000','2,69333333333333000000','1,46666666666667000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','577','Lentilha, cozida','76,25066666666670000000','92,63876625229920000000','387,60059799962000000000','6,31041666666667000000','0,52466666666666700000','NA','16,30225000000000000000','7,86233333333333000000','0,61200000000000000000','16,10100000000000000000','21,64600000000000000000','0,28533333333333300000','103,74000000000000000000','1,47933333333333000000','1,17633333333333000000','219,90366666666700000000','0,17466666666666700000','1,13066666666667000000','NA','','','0,03000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','578','Lentilha, crua','11,46666666666670000000','339,14124020355300000000','1418,96694901167000000000','23,15217391304350000000','0,77000000000000000000','NA','62,00449275362320000000','16,93666666666670000000','2,60666666666667000000','53,52333333333330000000','93,53000000000000000000','1,08433333333333000000','367,73666666666700000000','7,04666666666667000000','Tr','886,88333333333300000000','0,83333333333333300000','3,48666666666667000000','NA',' ',' ','0,11333333333333300000','Tr','0,41666666666666700000','5,07333333333333000000',' ','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','579','Paçoca, amendoim','1,80100000000000000000','486,92708646452400000000','2037,30292976757000000000','15,99583333333330000000','26,07533333333330000000','NA','52,37616666666670000000','7,31900000000000000000','3,75166666666667000000','22,48133333333330000000','100,67466666666700000000','1,05500000000000000000','198,49666666666700000000','1,13466666666667000000','166,84066666666700000000','347,60100000000000000000','0,37933333333333300000','1,56000000000000000000','NA','','','Tr','Tr','1,19666666666667000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','580','Pé-de-moleque, amendoim','2,91000000000000000000','503,19036583995600000000','2105,34849067437000000000','13,16224009195960000000','28,04833333333330000000','NA','54,73042657470700000000','3,39333333333333000000','1,14900000000000000000','27,10800000000000000000','107,90366666666700000000','1,08900000000000000000','170,70833333333300000000','1,25666666666667000000','16,34533333333330000000','355,41466666666700000000','0,42700000000000000000','1,43100000000000000000','NA','','','0,04333333333333330000','0,03000000000000000000','0,11000000000000000000','5,94000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','581','Soja, farinha','5,75000000000000000000','403,95584581039900000000','1690,15125887071000000000','36,03010024070740000000','14,63333333333330000000','NA','38,43989975929260000000','20,18000000000000000000','5,14666666666667000000','206,02033333333300000000','241,90000000000000000000','2,87133333333333000000','539,24933333333300000000','13,05533333333330000000','5,75366666666667000000','1922,39166666667000000000','1,28700000000000000000','4,54000000000000000000','NA','','','0,20000000000000000000','0,03666666666666670000','0,03000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','582','Soja, extrato solúvel, natural, fluido','91,28400000000000000000','39,10485527535080000000','163,61471447206800000000','2,38107001590729000000','1,60600000000000000000','NA','4,27526333333334000000','0,36633333333333300000','0,45366666666666700000','16,51700000000000000000','15,45400000000000000000','0,14633333333333300000','52,89166666666670000000','0,43400000000000000000','56,52800000000000000000','121,04400000000000000000','0,08300000000000000000','0,27766666666666700000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','583','Soja, extrato solúvel, pó','4,46833333333333000000','458,89572943786800000000','1920,01973196804000000000','35,68750023841860000000','26,18100000000000000000','NA','28,48283333333330000000','7,31300000000000000000','5,18033333333333000000','359,03800000000000000000','215,61566666666700000000','2,67566666666667000000','646,55000000000000000000','7,00900000000000000000','83,47100000000000000000','1606,80066666667000000000','1,18533333333333000000','5,83766666666667000000','NA','','','Tr','0,10666666666666700000','0,35333333333333300000','Tr','9,21333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','584','Soja, queijo (tofu)','86,64600000000000000000','64,48509407389020000000','269,80563360515700000000','6,55317671044668000000','3,95333333333333000000','NA','2,12682333333333000000','0,75266666666666700000','0,72066666666666700000','80,75733333333330000000','38,20200000000000000000','0,33433333333333300000','129,51633333333300000000','1,43033333333333000000','1,21366666666667000000','181,69100000000000000000','0,17866666666666700000','0,89333333333333300000','NA','','','0,03666666666666670000','Tr','0,03333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','585','Tremoço, cru','9,69200000000000000000','381,27817396012900000000','1595,26787984918000000000','33,57500000000000000000','10,34200000000000000000','NA','43,78633333333330000000','32,30700000000000000000','2,60466666666667000000','176,74533333333300000000','121,43233333333300000000','*','264,68366666666700000000','2,78866666666667000000','3,29066666666667000000','708,32100000000000000000','0,79100000000000000000','4,23766666666667000000','NA','','','0,24000000000000000000','Tr','0,06666666666666670000','Tr','24,97333333333330000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Leguminosas e derivados','586','Tremoço, em conserva','67,68433333333330000000','120,64258534487100000000','504,76857708294000000000','11,10833333333330000000','3,78400000000000000000','NA','12,38933333333330000000','14,44000000000000000000','5,03400000000000000000','15,53733333333330000000','3,51700000000000000000','*','39,72466666666670000000','0,33800000000000000000','1808,75766666667000000000','5,20466666666667000000','0,26533333333333300000','0,63633333333333300000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','587','Amêndoa, torrada, salgada','3,10600000000000000000','580,74695455607000000000','2429,84525786260000000000','18,55475938510890000000','47,32433333333330000000','NA','29,54724000000000000000','11,64000000000000000000','1,46766666666667000000','236,70433333333300000000','222,09900000000000000000','1,94800000000000000000','493,05666666666700000000','3,05566666666667000000','278,52266666666700000000','639,60200000000000000000','0,93200000000000000000','2,57666666666667000000','NA','','','0,29000000000000000000','0,16333333333333300000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','588','Castanha-de-caju, torrada, salgada','3,46400000000000000000','570,16762650161900000000','2385,58134928277000000000','18,50936733277640000000','46,27966666666670000000','NA','29,13496600055700000000','3,66300000000000000000','2,61200000000000000000','32,58766666666670000000','236,61000000000000000000','1,59000000000000000000','594,22233333333300000000','5,22100000000000000000','125,00000000000000000000','671,46366666666700000000','1,91533333333333000000','4,71666666666667000000','NA','','','0,28666666666666700000','0,04666666666666670000','0,39333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','589','Castanha-do-Brasil, crua','3,52400000000000000000','642,96307168106900000000','2690,15749191359000000000','14,53634010156000000000','63,45900000000000000000','NA','15,07865989844000000000','7,93100000000000000000','3,40200000000000000000','146,33666666666700000000','365,12333333333300000000','1,10366666666667000000','853,28333333333300000000','2,31000000000000000000','0,65400000000000000000','650,99400000000000000000','1,78833333333333000000','4,21933333333333000000','NA','','','0,30333333333333300000','Tr','0,44000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','590','Coco, cru','42,96116666666670000000','406,48735310781000000000','1700,74308540308000000000','3,69183412310697000000','41,97633333333330000000','NA','10,40166587689300000000','5,37816666666667000000','0,96900000000000000000','6,48450000000000000000','51,45950000000000000000','0,99983333333333300000','117,54000000000000000000','1,75833333333333000000','15,32000000000000000000','354,14916666666700000000','0,45266666666666700000','0,94333333333333300000','NA','','','Tr','Tr','0,02500000000000000000','Tr','2,49333333333333000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','591','Coco,  verde, cru','*','*','*','*','*','*','*','*','*','*','*','*','*','*','*','*','*','*','NA','','','*','*','*','*','*','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','592','Farinha, de mesocarpo de babaçu, crua','15,82333333333330000000','328,77140024483400000000','1375,57953862438000000000','1,40626671727498000000','0,19800000000000000000','NA','79,17306661605840000000','17,86000000000000000000','3,39933333333333000000','60,95233333333330000000','39,34566666666670000000','0,38233333333333300000','25,56100000000000000000','18,33366666666670000000','12,46300000000000000000','362,07466666666700000000','0,22300000000000000000','0,34066666666666700000','NA','','','Tr','Tr','Tr','2,57666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','593','Gergelim, semente','3,85933333333333000000','583,54671475455000000000','2441,55945453303000000000','21,16466742833460000000','50,43266666666670000000','NA','21,61766590499880000000','11,86833333333330000000','2,92566666666667000000','825,44633333333300000000','360,68866666666700000000','2,67266666666667000000','740,70900000000000000000','5,44766666666667000000','2,57500000000000000000','546,28600000000000000000','1,50966666666667000000','5,23500000000000000000','NA','','','0,93666666666666700000','Tr','0,13000000000000000000','5,92333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','594','Linhaça, semente','6,68300000000000000000','495,09611384365100000000','2071,53491450499000000000','14,08386717351280000000','32,25293333333330000000','NA','43,31219949315390000000','33,50266666666670000000','3,66800000000000000000','211,49766666666700000000','346,92233333333300000000','2,81433333333333000000','615,18200000000000000000','4,69700000000000000000','8,67333333333333000000','869,28700000000000000000','1,08733333333333000000','4,38833333333333000000','NA','','','0,11666666666666700000','Tr','0,13333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','595','Pinhão, cozido','50,51333333333330000000','174,36990200000000000000','729,56366996800000000000','2,98036666666667000000','0,74700000000000000000','NA','43,91763333333330000000','15,60333333333330000000','1,84166666666667000000','15,76733333333330000000','52,97433333333330000000','0,40933333333333300000','165,84100000000000000000','0,75533333333333300000','0,86266666666666700000','727,00633333333300000000','0,18333333333333300000','0,82700000000000000000','NA','','','Tr','Tr','Tr','Tr','27,69000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','596','Pupunha, cozida','54,46000000000000000000','218,53388087660100000000','914,34575758769700000000','2,52291666666667000000','12,76166666666670000000','NA','29,56941666666670000000','4,25333333333333000000','0,68600000000000000000','27,58633333333330000000','25,28933333333330000000','0,12666666666666700000','48,77400000000000000000','0,51866666666666700000','0,90866666666666700000','303,35533333333300000000','0,28233333333333300000','0,29166666666666700000','NA','875,44444444444400000000','437,72222222222200000000','Tr','0,08666666666666670000','0,03000000000000000000','Tr','2,18000000000000000000','28/05/18 21:22','28/05/18 21:22');
-INSERT INTO CMVColtaco3 (id, categoria, numeroAlimento, descricaoAlimento, umidade, energiaKcal, energiaKj, proteina, lipideos, colesterol, carboidrato, fibraAlimentar, cinzas, calcio, magnesio, manganes, fosforo, ferro, sodio, potassio, cobre, zinco, retinol, re, rae, tiamina, riboflavina, piridoxina, niacina, vitaminaC, created_at, updated_at) VALUES ('','Nozes e sementes','597','Noz, crua','6,24466666666667000000','620,06001979056700000000','2594,33112280373000000000','13,97080050277710000000','59,35966666666670000000','NA','18,36386616388960000000','7,24966666666667000000','2,06100000000000000000','105,30633333333300000000','152,89066666666700000000','4,05266666666667000000','396,27666666666700000000','2,03500000000000000000','4,57066666666667000000','533,25500000000000000000','0,75433333333333300000','2,06433333333333000000','NA','','','0,37666666666666700000','Tr','0,13000000000000000000','1,08333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
+INSERT INTO `CMVColtaco3` (`categoria`, `numeroAlimento`, `descricaoAlimento`, `umidade`, `energiaKcal`, `energiaKj`, `proteina`, `lipideos`, `colesterol`, `carboidrato`, `fibraAlimentar`, `cinzas`, `calcio`, `magnesio`, `manganes`, `fosforo`, `ferro`, `sodio`, `potassio`, `cobre`, `zinco`, `retinol`, `re`, `rae`, `tiamina`, `riboflavina`, `piridoxina`, `niacina`, `vitaminaC`, `created_at`, `updated_at`) VALUES
+('Cereais e derivados','1','Arroz, integral, cozido','70,13866666666670000000','123,53489250000000000000','516,86999022000000000000','2,58825000000000000000','1,00033333333333000000','NA','25,80975000000000000000','2,74933333333333000000','0,46300000000000000000','5,20400000000000000000','58,70200000000000000000','0,62733333333333300000','105,85300000000000000000','0,26200000000000000000','1,24466666666667000000','75,15166666666670000000','0,02033333333333330000','0,68266666666666700000','NA','','','0,08000000000000000000','Tr','0,08000000000000000000','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','2','Arroz, integral, cru','12,17983333333330000000','359,67800203260900000000','1504,89276050444000000000','7,32328586956522000000','1,86483333333333000000','NA','77,45071413043480000000','4,81916666666667000000','1,18133333333333000000','7,81800000000000000000','109,71000000000000000000','2,99333333333333000000','250,86500000000000000000','0,94833333333333300000','1,64566666666667000000','173,34000000000000000000','0,07483333333333330000','1,39516666666667000000','NA','','','0,26166666666666700000','Tr','0,17500000000000000000','4,18333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','3','Arroz, tipo 1, cozido','69,11366666666670000000','128,25848566666700000000','536,63350402933300000000','2,52081666666667000000','0,22700000000000000000','NA','28,05985000000000000000','1,56100000000000000000','0,07866666666666670000','3,54433333333333000000','2,25333333333333000000','0,29666666666666700000','17,94500000000000000000','0,07666666666666670000','1,20066666666667000000','14,67366666666670000000','0,01500000000000000000','0,49133333333333300000','NA','','','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','4','Arroz, tipo 1, cru','13,22450000000000000000','357,78927311594200000000','1496,99031871710000000000','7,15853985507246000000','0,33500000000000000000','NA','78,75954347826090000000','1,63916666666667000000','0,52241666666666700000','4,41433333333333000000','30,38366666666670000000','1,03233333333333000000','104,20758333333300000000','0,67774750000000000000','1,01916666666667000000','62,49941666666670000000','0,11483333333333300000','1,22483333333333000000','NA','','','0,16333333333333300000','Tr','0,06916666666666670000','1,11666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','5','Arroz, tipo 2, cozido','68,72766666666670000000','130,11964833333300000000','544,42060862666700000000','2,56841666666667000000','0,36166666666666700000','NA','28,19258333333330000000','1,06966666666667000000','0,14966666666666700000','3,33366666666667000000','6,05333333333333000000','0,37100000000000000000','21,52133333333330000000','0,05033333333333330000','1,95966666666667000000','20,20333333333330000000','0,04100000000000000000','0,54933333333333300000','NA','','','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','6','Arroz, tipo 2, cru','13,16475000000000000000','358,11676145652200000000','1498,36052993409000000000','7,24188297101449000000','0,27550000000000000000','NA','78,88145036231880000000','1,71983333333333000000','0,43641666666666700000','4,83350000000000000000','29,23908333333330000000','0,82800000000000000000','82,04391666666670000000','0,59783333333333300000','0,56883333333333300000','57,28458333333330000000','0,05200000000000000000','1,27208333333333000000','NA','','','0,16333333333333300000','Tr','0,04916666666666670000','0,91833333333333300000','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','7','Aveia, flocos, crua','9,13333333333333000000','393,82268944927500000000','1647,75413265577000000000','13,92102608695650000000','8,49666666666667000000','NA','66,63564057971020000000','9,13000000000000000000','1,81333333333333000000','47,89000000000000000000','118,76233333333300000000','1,89466666666667000000','153,39666666666700000000','4,44666666666667000000','4,62666666666667000000','336,33333333333300000000','0,44000000000000000000','2,63000000000000000000','NA','','','0,55333333333333300000','0,03000000000000000000','Tr','4,47000000000000000000','1,35000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','8','Biscoito, doce, maisena','3,21666666666667000000','442,81939014492800000000','1852,75632836638000000000','8,07252173913043000000','11,96666666666670000000','NA','75,23414492753620000000','2,10000000000000000000','1,51000000000000000000','54,45000000000000000000','37,14333333333330000000','0,77833333333333300000','166,10333333333300000000','1,76000000000000000000','352,02666666666700000000','141,64000000000000000000','0,17000000000000000000','1,03000000000000000000','NA','','','1,01000000000000000000','0,41666666666666700000','0,23000000000000000000','3,90666666666667000000','6,21666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','9','Biscoito, doce, recheado com chocolate','2,18333333333333000000','471,82477971014500000000','1974,11487830725000000000','6,39721739130435000000','19,58333333333330000000','Tr','70,54944927536230000000','2,95666666666667000000','1,28666666666667000000','27,23000000000000000000','47,97666666666670000000','0,58800000000000000000','139,45000000000000000000','2,27000000000000000000','239,20000000000000000000','232,40000000000000000000','0,27333333333333300000','0,99333333333333300000','Tr',' ',' ','0,31666666666666700000','0,39333333333333300000','0,45666666666666700000','2,52333333333333000000','3,52666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','10','Biscoito, doce, recheado com morango','2,73333333333333000000','471,17473623188400000000','1971,39509639420000000000','5,71982608695652000000','19,57333333333330000000','Tr','71,01350724637680000000','1,53333333333333000000','0,96000000000000000000','35,78000000000000000000','27,10000000000000000000','0,65900000000000000000','137,74333333333300000000','1,48000000000000000000','229,81666666666700000000','113,01333333333300000000','0,12666666666666700000','0,72666666666666700000','Tr',' ',' ','0,89666666666666700000','0,42000000000000000000','0,21000000000000000000','1,49666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','11','Biscoito, doce, wafer, recheado de chocolate','1,17000000000000000000','502,45685797101400000000','2102,27949375072000000000','5,56452173913044000000','24,67333333333330000000','Tr','67,53547826086960000000','1,80333333333333000000','1,05666666666667000000','23,34333333333330000000','47,85333333333330000000','0,43500000000000000000','124,20333333333300000000','2,44333333333333000000','137,24000000000000000000','240,45333333333300000000','0,26333333333333300000','0,87333333333333300000','Tr',' ',' ','0,36666666666666700000','0,03000000000000000000','0,29666666666666700000','1,12000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','12','Biscoito, doce, wafer, recheado de morango','1,17333333333333000000','513,44618260869600000000','2148,25882803478000000000','4,51704347826087000000','26,40000000000000000000','1,26733333333333000000','67,35295652173910000000','0,82000000000000000000','0,55666666666666700000','13,70666666666670000000','18,54000000000000000000','0,27966666666666700000','73,16333333333330000000','1,09333333333333000000','119,90000000000000000000','74,84333333333330000000','0,08333333333333330000','0,51333333333333300000','Tr',' ',' ','0,35666666666666700000','Tr','0,94000000000000000000','0,37333333333333300000','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','13','Biscoito, salgado, cream cracker','4,05666666666667000000','431,73228115942000000000','1806,36786437101000000000','10,05513043478260000000','14,43666666666670000000','NA','68,73153623188410000000','2,51000000000000000000','2,72000000000000000000','20,00333333333330000000','39,74666666666670000000','0,68966666666666700000','148,26000000000000000000','2,20000000000000000000','854,35666666666700000000','180,61333333333300000000','0,18000000000000000000','1,13666666666667000000','NA','','','0,71000000000000000000','0,13000000000000000000','0,17000000000000000000','7,13666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','14','Bolo, mistura para','1,00000000000000000000','418,63333333333300000000','1751,56186666667000000000','6,15942028985507000000','6,12666666666667000000','Tr','84,71391304347830000000','1,70333333333333000000','2,00000000000000000000','58,87900000000000000000','27,92200000000000000000','0,46266666666666700000','332,65766666666700000000','1,21066666666667000000','462,88000000000000000000','75,36300000000000000000','0,15333333333333300000','0,58266666666666700000','NA','','','0,17666666666666700000','Tr','1,50333333333333000000','1,51666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','15','Bolo, pronto, aipim','34,13366666666670000000','323,85166666666700000000','1354,99537333333000000000','4,41666666666667000000','12,74766666666670000000','73,20400000000000000000','47,86400000000000000000','0,69066666666666700000','0,83800000000000000000','85,02233333333330000000','10,34400000000000000000','0,10700000000000000000','122,19400000000000000000','0,48900000000000000000','111,00833333333300000000','134,82266666666700000000','0,05166666666666670000','0,41566666666666700000','Tr',' ',' ','0,13000000000000000000','0,07000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','16','Bolo, pronto, chocolate','19,27633333333330000000','410,01366666666700000000','1715,49718133333000000000','6,22291666666667000000','18,47233333333330000000','76,79766666666670000000','54,71775000000000000000','1,43000000000000000000','1,31066666666667000000','74,58466666666670000000','27,68666666666670000000','0,37933333333333300000','196,97666666666700000000','2,13233333333333000000','283,30000000000000000000','211,76333333333300000000','0,04633333333333330000','0,71366666666666700000','Tr',' ',' ','0,13333333333333300000','0,09333333333333330000','0,05000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','17','Bolo, pronto, coco','29,32033333333330000000','333,43766666666700000000','1395,10319733333000000000','5,66666666666667000000','11,29633333333330000000','63,20766666666670000000','52,27600000000000000000','1,05500000000000000000','1,44066666666667000000','57,10533333333330000000','16,25166666666670000000','0,39900000000000000000','303,39633333333300000000','0,84800000000000000000','190,33866666666700000000','143,29400000000000000000','0,08900000000000000000','0,67566666666666700000','Tr','Tr','Tr','0,15333333333333300000','0,05666666666666670000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','18','Bolo, pronto, milho','36,68833333333330000000','311,38700000000000000000','1302,84320800000000000000','4,80416666666667000000','12,41500000000000000000','81,68733333333330000000','45,10883333333330000000','0,71000000000000000000','0,98366666666666700000','82,58466666666670000000','10,24900000000000000000','0,10766666666666700000','128,19633333333300000000','0,65000000000000000000','133,81100000000000000000','118,42733333333300000000','0,04000000000000000000','0,43500000000000000000','56,88666666666670000000','','','0,11000000000000000000','0,05000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','19','Canjica, branca, crua','13,55700000000000000000','357,60259000000000000000','1496,20923656000000000000','7,20000000000000000000','0,97100000000000000000','NA','78,06100000000000000000','5,49933333333333000000','0,21100000000000000000','1,96466666666667000000','12,32500000000000000000','0,08633333333333330000','48,49800000000000000000','0,32166666666666700000','0,78966666666666700000','92,94733333333330000000','0,04500000000000000000','0,36233333333333300000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','20','Canjica, com leite integral','72,49400000000000000000','112,45677722046500000000','470,51915589042700000000','2,36060004234314000000','1,24433333333333000000','1,35066666666667000000','23,62773329099020000000','1,21666666666667000000','0,27333333333333300000','42,56266666666670000000','5,83833333333333000000','0,02000000000000000000','40,58333333333330000000','0,05600000000000000000','27,58666666666670000000','69,80900000000000000000','0,02566666666666670000','0,27800000000000000000','Tr','','','Tr','0,04000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','21','Cereais, milho, flocos, com sal','9,29333333333334000000','369,59975000000000000000','1546,40535400000000000000','7,29166666666667000000','1,60333333333333000000','NA','80,83500000000000000000','5,29333333333333000000','0,97666666666666700000','1,81366666666667000000','20,09600000000000000000','Tr','90,77033333333330000000','0,52433333333333300000','271,73766666666700000000','68,66000000000000000000','Tr','0,61100000000000000000','NA','','','0,12000000000000000000','Tr','0,06000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','22','Cereais, milho, flocos, sem sal','11,22333333333330000000','363,33831666666700000000','1520,20751693333000000000','6,87500000000000000000','1,18333333333333000000','NA','80,44833333333330000000','1,83666666666667000000','0,27000000000000000000','1,97466666666667000000','16,54866666666670000000','Tr','58,35966666666670000000','1,69333333333333000000','30,97033333333330000000','28,69733333333330000000','0,24033333333333300000','0,32566666666666700000','NA','','','0,05000000000000000000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','23','Cereais, mingau, milho, infantil','4,70333333333333000000','394,42752173913000000000','1650,28475095652000000000','6,43115942028986000000','1,09333333333333000000','NA','87,26550724637680000000','3,21333333333333000000','0,50666666666666700000','218,80666666666700000000','16,03000000000000000000','0,10633333333333300000','169,16333333333300000000','3,03000000000000000000','399,40333333333300000000','82,01666666666670000000','0,04333333333333330000','0,36333333333333300000','21,41666666666670000000','','','3,72333333333333000000','0,46666666666666700000','5,07666666666667000000','24,16333333333330000000','109,36666666666700000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','24','Cereais, mistura para vitamina, trigo, cevada e aveia','4,36666666666667000000','381,13333333333300000000','1594,66186666667000000000','8,89583333333333000000','2,12000000000000000000','NA','81,61750000000000000000','4,98333333333333000000','3,00000000000000000000','584,25133333333300000000','72,26800000000000000000','2,28400000000000000000','515,03600000000000000000','12,64133333333330000000','1163,25700000000000000000','244,36100000000000000000','0,20633333333333300000','2,02233333333333000000','Tr','','','0,76000000000000000000','0,87666666666666700000','1,48666666666667000000','7,45666666666667000000','13,10666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','25','Cereal matinal, milho','5,52666666666667000000','365,35416376811600000000','1528,64182120580000000000','7,15579710144928000000','0,95666666666666700000','NA','83,82420289855070000000','4,11666666666667000000','2,53666666666667000000','142,92333333333300000000','10,93333333333330000000','0,05900000000000000000','100,80000000000000000000','3,05000000000000000000','654,54333333333300000000','83,08666666666670000000','0,06000000000000000000','7,63000000000000000000','NA','30,91666666666670000000','15,45833333333330000000','0,76000000000000000000','1,02000000000000000000','2,24666666666667000000','11,04000000000000000000','17,29333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','26','Cereal matinal, milho, açúcar','4,26666666666667000000','376,55525362318800000000','1575,50718115942000000000','4,74275362318841000000','0,66666666666666700000','NA','88,84057971014490000000','2,10666666666667000000','1,48333333333333000000','56,42333333333330000000','7,94000000000000000000','0,13433333333333300000','43,18000000000000000000','3,90333333333333000000','405,31333333333300000000','51,59666666666670000000','0,04000000000000000000','8,48000000000000000000','NA','30,91666666666670000000','15,45833333333330000000','0,72666666666666700000','1,11000000000000000000','0,78666666666666700000','10,13333333333330000000','14,55000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','27','Creme de arroz, pó','7,33300000000000000000','386,00119033639800000000','1615,02898036749000000000','7,02694977474213000000','1,22600000000000000000','NA','83,86938355859120000000','1,07133333333333000000','0,54466666666666700000','7,08533333333333000000','50,50333333333330000000','1,23733333333333000000','153,02000000000000000000','0,63233333333333300000','1,03033333333333000000','114,68033333333300000000','0,03800000000000000000','1,86366666666667000000','NA','','','0,21666666666666700000','Tr','0,05333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','28','Creme de milho, pó','5,65200000000000000000','333,03419267054400000000','1393,41506213356000000000','4,82083333333333000000','1,63933333333333000000','NA','86,14850000000000000000','3,72233333333333000000','1,73933333333333000000','323,16333333333300000000','30,06233333333330000000','0,20000000000000000000','303,26666666666700000000','4,25700000000000000000','593,79366666666700000000','165,72366666666700000000','0,04266666666666670000','0,78066666666666700000','NA','','','0,74000000000000000000','Tr','2,05333333333333000000','Tr','96,34000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','29','Curau, milho verde','81,56466666666670000000','78,43381831365590000000','328,16709582433600000000','2,36060004234314000000','1,63700000000000000000','4,74200000000000000000','13,94439995765690000000','0,45666666666666700000','0,49333333333333300000','52,59600000000000000000','15,96133333333330000000','0,05566666666666670000','74,65633333333330000000','0,44933333333333300000','20,51200000000000000000','161,84233333333300000000','0,02533333333333330000','0,40000000000000000000','12,07000000000000000000','20,07000000000000000000','16,07000000000000000000','0,03666666666666670000','0,07000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','30','Curau, milho verde, mistura para','3,91633333333333000000','402,28657743531500000000','1683,16703998936000000000','2,22291666666667000000','13,37133333333330000000','NA','79,81641666666670000000','2,52266666666667000000','0,67300000000000000000','30,87800000000000000000','8,50066666666667000000','0,05466666666666670000','44,61900000000000000000','0,86266666666666700000','222,92566666666700000000','55,33533333333330000000','0,02933333333333330000','0,24066666666666700000','NA','','','0,13333333333333300000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','31','Farinha, de arroz, enriquecida','12,69333333333330000000','363,05648018122300000000','1519,02831307824000000000','1,26933329264323000000','0,30000000000000000000','NA','85,50400004069010000000','0,58000000000000000000','0,23333333333333300000','1,12266666666667000000','4,30000000000000000000','0,04233333333333330000','35,95866666666670000000','31,38333333333330000000','17,10166666666670000000','12,54066666666670000000','Tr','8,48000000000000000000','NA','','','3,23333333333333000000','Tr','3,46666666666667000000','24,42333333333330000000','173,58666666666700000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','32','Farinha, de centeio, integral','10,77666666666670000000','335,77766279932700000000','1404,89374115238000000000','12,51506650288900000000','1,75333333333333000000','NA','73,29826683044430000000','15,48000000000000000000','1,65666666666667000000','33,91666666666670000000','120,23333333333300000000','3,85666666666667000000','339,98666666666700000000','4,73000000000000000000','41,37666666666670000000','333,62000000000000000000','0,56333333333333300000','2,66333333333333000000','NA','','','0,28666666666666700000','0,03000000000000000000','0,08000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','33','Farinha, de milho, amarela','11,77333333333330000000','350,58693322738000000000','1466,85572862336000000000','7,18750000000000000000','1,46666666666667000000','NA','79,07916666666670000000','5,49000000000000000000','0,49333333333333300000','1,28500000000000000000','30,95500000000000000000','Tr','84,22133333333330000000','2,25266666666667000000','44,93233333333330000000','57,85366666666670000000','0,26666666666666700000','0,59833333333333300000','NA','18,00000000000000000000','9,00000000000000000000','0,25333333333333300000','Tr','0,25333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','34','Farinha, de rosca','9,80666666666667000000','370,57809666666700000000','1550,49875645333000000000','11,38099961916610000000','1,46333333333333000000','NA','75,78566666666670000000','4,82333333333333000000','1,56333333333333000000','35,29933333333330000000','56,87966666666670000000','1,62066666666667000000','194,95833333333300000000','6,73366666666667000000','332,50000000000000000000','212,14400000000000000000','0,26300000000000000000','1,67133333333333000000','NA','','','0,25333333333333300000','Tr','0,09000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','35','Farinha, de trigo','12,98000000000000000000','360,47297855072500000000','1508,21894225623000000000','9,79078260869565000000','1,36666666666667000000','NA','75,09255072463770000000','2,34666666666667000000','0,77000000000000000000','17,86333333333330000000','31,00333333333330000000','0,46033333333333300000','114,74000000000000000000','0,95000000000000000000','0,73666666666666700000','151,36666666666700000000','0,15000000000000000000','0,82666666666666700000','NA','','','0,31333333333333300000','Tr','Tr','0,89000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','36','Farinha, láctea, de cereais','2,69666666666667000000','414,85051739130400000000','1735,73456476522000000000','11,87913043478260000000','5,79000000000000000000','11,27180000000000000000','77,77086956521740000000','1,94000000000000000000','1,86333333333333000000','196,06333333333300000000','57,68666666666670000000','1,48900000000000000000','296,44333333333300000000','8,72333333333333000000','125,07333333333300000000','365,60333333333300000000','0,19333333333333300000','1,72666666666667000000','492,24666666666700000000','','','1,43000000000000000000','1,13333333333333000000','1,13666666666667000000','9,50000000000000000000','24,31000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','37','Lasanha, massa fresca, cozida','59,64633333333330000000','163,76366666666700000000','685,18718133333300000000','5,81250000000000000000','1,15833333333333000000','NA','32,52216666666670000000','1,63633333333333000000','0,86066666666666700000','9,97166666666667000000','3,53900000000000000000','0,19500000000000000000','42,38400000000000000000','1,18866666666667000000','206,76933333333300000000','53,91466666666670000000','0,07066666666666670000','0,40500000000000000000','NA','','','0,04000000000000000000','Tr','Tr','3,96000000000000000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','38','Lasanha, massa fresca, crua','44,98566666666670000000','220,30566666666700000000','921,75890933333300000000','7,00833333333333000000','1,33766666666667000000','NA','45,05833333333330000000','1,60633333333333000000','1,61000000000000000000','16,54566666666670000000','12,59166666666670000000','0,34466666666666700000','81,96133333333330000000','1,87233333333333000000','666,71033333333300000000','136,60700000000000000000','0,09766666666666670000','0,75566666666666700000','NA','','','0,08000000000000000000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','39','Macarrão, instantâneo','5,97333333333333000000','435,86478053333300000000','1823,65824175147000000000','8,79168000000000000000','17,23666666666670000000','NA','62,43165333333330000000','5,61000000000000000000','5,56666666666667000000','17,62666666666670000000','19,36666666666670000000','0,25300000000000000000','112,15000000000000000000','0,80000000000000000000','1515,52666666667000000000','147,92000000000000000000','0,10333333333333300000','0,50333333333333300000','NA','','','1,18000000000000000000','0,04000000000000000000','0,53333333333333300000','9,36666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','40','Macarrão, trigo, cru','10,24333333333330000000','371,12261304347800000000','1552,77701297391000000000','9,99565217391304000000','1,30333333333333000000','NA','77,94434782608700000000','2,92666666666667000000','0,51333333333333300000','17,30000000000000000000','27,69000000000000000000','0,52833333333333300000','99,81000000000000000000','0,88000000000000000000','7,17000000000000000000','147,06000000000000000000','0,15000000000000000000','0,77666666666666700000','NA','','','0,17666666666666700000','0,02000000000000000000','Tr','3,56666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','41','Macarrão, trigo, cru, com ovos','10,56333333333330000000','370,56711333333300000000','1550,45280218667000000000','10,32080000000000000000','1,97000000000000000000','17,56800000000000000000','76,62253333333340000000','2,29666666666667000000','0,52333333333333300000','19,45333333333330000000','Tr','0,39700000000000000000','118,47666666666700000000','0,91666666666666700000','14,74000000000000000000','134,09666666666700000000','0,13666666666666700000','0,81333333333333300000','Tr','','','0,10666666666666700000','0,05000000000000000000','0,03000000000000000000','4,37000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','42','Milho, amido, cru','12,18333000000000000000','361,36682387826100000000','1511,95879110664000000000','0,59782608695652200000','Tr','NA','87,14884391304350000000','0,74333330000000000000','0,07000000000000000000','1,05766666666667000000','3,02766666666667000000','0,01833333333333330000','12,60300000000000000000','0,12766666666666700000','8,08300000000000000000','8,53500000000000000000','0,01533333333333330000','0,07966666666666670000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','43','Milho, fubá, cru','11,45333333333330000000','353,48226811594200000000','1478,96980979710000000000','7,21376811594203000000','1,90333333333333000000','NA','78,87289855072460000000','4,71333333333333000000','0,55666666666666700000','2,66666666666667000000','41,23000000000000000000','0,33866666666666700000','107,83666666666700000000','0,85000000000000000000','Tr','168,33333333333300000000','0,08000000000000000000','1,09333333333333000000','NA','26,00000000000000000000','13,00000000000000000000','0,25333333333333300000','Tr','Tr','0,74666666666666700000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','44','Milho, verde, cru','63,53833333333330000000','138,16656500000000000000','578,08890796000000000000','6,58958333333333000000','0,60900000000000000000','NA','28,55575000000000000000','3,91800000000000000000','0,70733333333333300000','1,61233333333333000000','32,57500000000000000000','0,11800000000000000000','112,70500000000000000000','0,41100000000000000000','1,11566666666667000000','184,82233333333300000000','0,05033333333333330000','0,51766666666666700000','NA','32,00000000000000000000','16,00000000000000000000','0,30000000000000000000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','45','Milho, verde, enlatado, drenado','76,22333333333330000000','97,56489420289850000000','408,21151734492700000000','3,22826086956522000000','2,35333333333333000000','NA','17,13507246376810000000','4,64333333333333000000','1,06000000000000000000','2,16733333333333000000','20,37633333333330000000','0,09300000000000000000','61,30733333333330000000','0,58566666666666700000','260,34990000000000000000','162,02333333333300000000','0,04566666666666670000','0,49833333333333300000','NA','48,00000000000000000000','24,00000000000000000000','Tr','0,05000000000000000000','Tr','3,73666666666667000000','1,74333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','46','Mingau tradicional, pó','8,14333333333333000000','373,42146666666700000000','1562,39541653333000000000','0,58333333333333300000','0,37000000000000000000','NA','89,33666666666670000000','0,88000000000000000000','1,56666666666667000000','522,04666666666700000000','4,28066666666667000000','Tr','273,31900000000000000000','41,99133333333330000000','14,85533333333330000000','Tr','Tr','15,20933333333330000000','1533,24333333333000000000','','','3,40666666666667000000','Tr','3,11000000000000000000','19,39333333333330000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','47','Pamonha, barra para cozimento, pré-cozida','61,30733333333330000000','171,21911166666700000000','716,38076321333300000000','2,55208333333333000000','4,84966666666667000000','NA','30,68491666666670000000','2,37100000000000000000','0,60600000000000000000','4,16433333333333000000','15,34700000000000000000','0,12466666666666700000','54,58500000000000000000','0,35666666666666700000','131,99300000000000000000','125,34933333333300000000','0,03400000000000000000','0,42366666666666700000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','48','Pão, aveia, forma','19,91666666666670000000','343,08536666666700000000','1435,46917413333000000000','12,35000000000000000000','5,69333333333333000000','Tr','59,56666666666670000000','5,98000000000000000000','2,47333333333333000000','108,69100000000000000000','56,68033333333330000000','1,08200000000000000000','182,19766666666700000000','4,73200000000000000000','605,76300000000000000000','210,08333333333300000000','0,13566666666666700000','1,73066666666667000000','Tr',' ',' ','0,08666666666666670000','0,03000000000000000000','0,08333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','49','Pão, de soja','26,03333333333330000000','308,72632333333300000000','1291,71093682667000000000','11,34300000000000000000','3,58000000000000000000','NA','56,51033333333330000000','5,70666666666667000000','2,53333333333333000000','90,23733333333330000000','48,31833333333330000000','0,56933333333333300000','153,18000000000000000000','3,33033333333333000000','662,54133333333300000000','296,34800000000000000000','0,16266666666666700000','1,45866666666667000000','NA','','','0,07000000000000000000','0,04000000000000000000','0,79333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','50','Pão, glúten, forma','40,67333333333330000000','252,99403000000000000000','1058,52702152000000000000','11,95099960009260000000','2,72666666666667000000','NA','44,11900000000000000000','2,48000000000000000000','0,53000000000000000000','155,72100000000000000000','24,24366666666670000000','0,51000000000000000000','105,26066666666700000000','5,71033333333333000000','22,04533333333330000000','64,73233333333330000000','0,06200000000000000000','1,28433333333333000000','NA','','','0,04333333333333330000','0,03000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','51','Pão, milho, forma','30,41666666666670000000','292,01349000000000000000','1221,78444216000000000000','8,30300000000000000000','3,11000000000000000000','5,68500000000000000000','56,39700000000000000000','4,29666666666667000000','1,77333333333333000000','77,84866666666670000000','29,41566666666670000000','0,36600000000000000000','110,09800000000000000000','3,04433333333333000000','506,64400000000000000000','89,02466666666670000000','0,09966666666666670000','0,81766666666666700000','Tr','','','0,08000000000000000000','Tr','0,08333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','52','Pão, trigo, forma, integral','34,72333333333330000000','253,19361833333300000000','1059,36209910667000000000','9,42516666666667000000','3,65333333333333000000','NA','49,94150000000000000000','6,88333333333333000000','2,25666666666667000000','131,75966666666700000000','60,42833333333330000000','1,61633333333333000000','193,43900000000000000000','2,98533333333333000000','506,10333333333300000000','162,87100000000000000000','0,14600000000000000000','1,58566666666667000000','NA','','','0,07666666666666670000','0,04000000000000000000','0,14666666666666700000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','53','Pão, trigo, francês','28,48333333333330000000','299,81015043478300000000','1254,40566941913000000000','7,95356521739130000000','3,10333333333333000000','NA','58,64643478260870000000','2,30666666666667000000','1,81333333333333000000','15,75333333333330000000','25,46333333333330000000','0,46333333333333300000','94,74000000000000000000','1,00000000000000000000','647,67333333333300000000','142,20000000000000000000','0,13000000000000000000','0,76333333333333300000','2,98666666666667000000','','','0,38666666666666700000','0,67000000000000000000','0,60000000000000000000','2,33666666666667000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','54','Pão, trigo, sovado','25,76333333333330000000','310,96494000000000000000','1301,07730896000000000000','8,39800000000000000000','2,84000000000000000000','16,56200000000000000000','61,45200000000000000000','2,43333333333333000000','1,54666666666667000000','51,61800000000000000000','22,22033333333330000000','0,31366666666666700000','100,66266666666700000000','2,26866666666667000000','430,79200000000000000000','91,16600000000000000000','Tr','2,66166666666667000000','Tr',' ',' ','0,08000000000000000000','0,04333333333333330000','0,14666666666666700000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','55','Pastel, de carne, cru','34,39833333333330000000','288,70207151599000000000','1207,92946722290000000000','10,74069964059190000000','8,79300000000000000000','18,20066666666670000000','42,01663369274140000000','1,04000000000000000000','4,05133333333333000000','16,69166666666670000000','17,70500000000000000000','0,34333333333333300000','117,37666666666700000000','1,99100000000000000000','1309,26500000000000000000','165,61033333333300000000','0,11000000000000000000','1,65900000000000000000','Tr','','','0,06000000000000000000','0,03000000000000000000','Tr','1,58000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','56','Pastel, de carne, frito','22,92333333333330000000','388,37465162496800000000','1624,95954239886000000000','10,10419966189070000000','20,13666666666670000000','25,33600000000000000000','43,76780033810930000000','0,98666666666666700000','3,06800000000000000000','12,55466666666670000000','14,44466666666670000000','0,21566666666666700000','90,03200000000000000000','2,50766666666667000000','1039,88866666667000000000','155,64300000000000000000','0,11600000000000000000','1,15000000000000000000','Tr','','','0,06333333333333330000','0,05000000000000000000','Tr','1,83000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','57','Pastel, de queijo, cru','31,28333333333330000000','308,47443388737400000000','1290,65703138477000000000','9,85339967028300000000','9,63466666666667000000','14,34900000000000000000','45,94793366305030000000','1,10666666666667000000','3,28066666666667000000','154,69800000000000000000','15,80533333333330000000','0,24466666666666700000','168,12333333333300000000','0,99066666666666700000','984,56966666666700000000','102,57833333333300000000','0,09933333333333330000','0,96633333333333300000','Tr','','','0,07333333333333340000','0,03333333333333330000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','58','Pastel, de queijo, frito','17,54100000000000000000','422,11208003931900000000','1766,11694288451000000000','8,70959970855713000000','22,67033333333330000000','15,37633333333330000000','48,13273362477620000000','0,94333333333333300000','2,94633333333333000000','126,12766666666700000000','14,73833333333330000000','0,20066666666666700000','123,80966666666700000000','1,34233333333333000000','821,38233333333300000000','123,75466666666700000000','0,09933333333333330000','0,76233333333333300000','17,58333333333330000000','','','0,09000000000000000000','0,04000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','59','Pastel, massa, crua','27,06600000000000000000','310,20251433333300000000','1297,88731997067000000000','6,90270000000000000000','5,47700000000000000000','NA','57,37963333333330000000','1,41333333333333000000','3,17466666666667000000','12,61400000000000000000','14,43066666666670000000','0,38266666666666700000','72,55100000000000000000','1,05533333333333000000','1344,20133333333000000000','166,68166666666700000000','0,10533333333333300000','0,60733333333333300000','NA','','','0,14666666666666700000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','60','Pastel, massa, frita','0,96900000000000000000','569,67245933333300000000','2383,50956985067000000000','6,01920000000000000000','40,86033333333330000000','NA','49,34313333333330000000','1,30933333333333000000','2,80833333333333000000','11,26566666666670000000','12,74033333333330000000','0,35633333333333300000','62,36233333333330000000','1,44666666666667000000','1174,66700000000000000000','142,55400000000000000000','0,07933333333333330000','0,52166666666666700000','NA','','','0,16333333333333300000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','61','Pipoca, com óleo de soja, sem sal','2,81900000000000000000','448,33426184719800000000','1875,83055156868000000000','9,92708333333334000000','15,94100000000000000000','NA','70,31258333333330000000','14,33666666666670000000','1,00033333333333000000','2,82533333333333000000','90,75733333333340000000','0,65366666666666700000','225,13466666666700000000','1,15733333333333000000','4,32033333333333000000','255,95666666666700000000','0,46066666666666700000','2,04633333333333000000','NA','','','0,03333333333333330000','0,03000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','62','Polenta, pré-cozida','72,74000000000000000000','102,74116666666700000000','429,86904133333300000000','2,29166666666667000000','0,30333333333333300000','NA','23,31166666666670000000','2,40333333333333000000','1,35333333333333000000','1,09400000000000000000','4,42900000000000000000','Tr','16,78600000000000000000','Tr','441,88933333333300000000','99,63700000000000000000','0,04400000000000000000','0,05066666666666670000','NA','','','0,04333333333333330000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Cereais e derivados','63','Torrada, pão francês','9,04700000000000000000','377,42228300000000000000','1579,13483207200000000000','10,52410000000000000000','3,30100000000000000000','NA','74,55590000000000000000','3,39500000000000000000','2,57200000000000000000','18,74466666666670000000','31,59733333333330000000','0,55333333333333300000','113,91666666666700000000','1,23866666666667000000','829,49233333333300000000','189,48933333333300000000','0,16100000000000000000','0,90500000000000000000','NA','','','0,37666666666666700000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','64','Abóbora, cabotian, cozida','86,35400000000000000000','48,04374250000000000000','201,01501862000000000000','1,44375000000000000000','0,72933333333333300000','NA','10,76091666666670000000','2,46266666666667000000','0,71200000000000000000','7,62566666666667000000','9,11100000000000000000','0,26066666666666700000','32,59500000000000000000','0,34533333333333300000','1,45166666666667000000','199,10233333333300000000','0,06133333333333330000','0,28633333333333300000','NA','','','0,07666666666666670000','Tr','0,07000000000000000000','Tr','7,46333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','65','Abóbora, cabotian, crua','88,52000000000000000000','38,59929420289860000000','161,49944694492800000000','1,74637681159420000000','0,53666666666666700000','NA','8,36028985507247000000','2,16666666666667000000','0,83666666666666700000','17,96333333333330000000','8,82000000000000000000','0,11000000000000000000','25,76666666666670000000','0,37333333333333300000','Tr','350,56000000000000000000','0,06000000000000000000','0,32000000000000000000','NA','446,00000000000000000000','223,00000000000000000000','Tr','Tr','0,10000000000000000000','Tr','5,09000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','66','Abóbora, menina brasileira, crua','95,69000000000000000000','13,60567391304350000000','56,92613965217390000000','0,60869565217391300000','Tr','NA','3,30130434782609000000','1,17000000000000000000','0,36000000000000000000','8,74000000000000000000','4,09000000000000000000','0,01000000000000000000','11,62000000000000000000','0,15000000000000000000','Tr','164,60000000000000000000','0,02000000000000000000','Tr','NA','1108,00000000000000000000','554,00000000000000000000','0,07000000000000000000','Tr','0,04000000000000000000','Tr','1,50000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','67','Abóbora, moranga, crua','95,87000000000000000000','12,36443623188400000000','51,73280119420280000000','0,96014492753623200000','0,06000000000000000000','NA','2,66652173913043000000','1,70333333333333000000','0,44333333333333300000','3,04766666666667000000','1,84766666666667000000','0,01000000000000000000','7,91466666666667000000','Tr','Tr','124,86533333333300000000','0,05000000000000000000','0,07000000000000000000','NA','278,00000000000000000000','139,00000000000000000000','Tr','Tr','0,06333333333333330000','Tr','9,64666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','68','Abóbora, moranga, refogada','92,45733333333330000000','29,00382203175620000000','121,35199138086800000000','0,39375000000000000000','0,79900000000000000000','NA','5,98191666666666000000','1,54666666666667000000','0,36800000000000000000','19,08000000000000000000','7,49233333333333000000','0,01600000000000000000','11,65066666666670000000','0,11300000000000000000','3,02766666666667000000','183,19333333333300000000','0,04266666666666670000','0,08266666666666670000','NA','95,33333333333330000000','47,66666666666670000000','0,05333333333333330000','Tr','0,05000000000000000000','Tr','6,72666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','69','Abóbora, pescoço, crua','92,49300000000000000000','24,46626794970040000000','102,36686510154600000000','0,67083333333333300000','0,11600000000000000000','NA','6,12283333333334000000','2,30033333333333000000','0,59733333333333300000','8,80800000000000000000','7,42100000000000000000','0,07133333333333330000','31,61933333333330000000','0,27500000000000000000','0,74500000000000000000','263,87600000000000000000','0,09133333333333330000','0,17666666666666700000','NA','','','Tr','Tr','0,06000000000000000000','Tr','2,09000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','70','Abobrinha, italiana, cozida','95,28233333333330000000','15,03852000000000000000','62,92116768000010000000','1,12500000000000000000','0,19900000000000000000','NA','2,97700000000001000000','1,58800000000000000000','0,41666666666666700000','16,72566666666670000000','16,85966666666670000000','0,10600000000000000000','22,48733333333330000000','0,15966666666666700000','0,83266666666666700000','125,87900000000000000000','0,01233333333333330000','0,25733333333333300000','NA','','','0,05000000000000000000','Tr','0,06000000000000000000','Tr','2,13000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','71','Abobrinha, italiana, crua','93,86333333333340000000','19,27912608695650000000','80,66386354782590000000','1,14130434782609000000','0,14000000000000000000','NA','4,29202898550724000000','1,35333333333333000000','0,56333333333333300000','15,12666666666670000000','19,94666666666670000000','0,09000000000000000000','32,01666666666670000000','0,24333333333333300000','Tr','253,38000000000000000000','0,04666666666666670000','0,16666666666666700000','NA','40,50000000000000000000','20,25000000000000000000','Tr','0,05666666666666670000','0,03000000000000000000','Tr','6,87333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','72','Abobrinha, italiana, refogada','93,49166666666670000000','24,42960218765340000000','102,21345555314200000000','1,06875000000000000000','0,82133333333333300000','NA','4,18691666666666000000','1,38000000000000000000','0,43133333333333300000','20,67200000000000000000','12,66700000000000000000','0,13533333333333300000','31,82833333333330000000','0,35800000000000000000','2,20900000000000000000','193,62666666666700000000','0,02266666666666670000','0,27200000000000000000','NA','41,58333333333330000000','20,79166666666670000000','0,04333333333333330000','Tr','Tr','Tr','7,53000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','73','Abobrinha, paulista, crua','90,85066666666670000000','30,81070222881630000000','128,91197812536800000000','0,63958333333333300000','0,13900000000000000000','NA','7,86742000000000000000','2,60500000000000000000','0,50333000000000000000','18,67000000000000000000','9,39000000000000000000','0,11100000000000000000','32,74566666666670000000','0,17000000000000000000','0,50066666666666700000','212,87133333333300000000','0,09566666666666670000','0,17700000000000000000','NA','','','Tr','Tr','0,03333333333333330000','Tr','17,54666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','74','Acelga, crua','93,18566666666670000000','20,94234249999990000000','87,62276101999980000000','1,44375000000000000000','0,10600000000000000000','NA','4,63091666666666000000','1,12200000000000000000','0,63366666666666700000','42,98500000000000000000','10,39533333333330000000','0,10700000000000000000','40,02600000000000000000','0,26933333333333300000','1,18066666666667000000','239,81666666666700000000','0,10433333333333300000','0,30633333333333300000','NA','','','0,04000000000000000000','Tr','0,15666666666666700000','Tr','22,55000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','75','Agrião, cru','93,94333333333330000000','16,57880144927530000000','69,36570526376800000000','2,68840579710145000000','0,23666666666666700000','NA','2,25159420289854000000','2,13666666666667000000','0,88000000000000000000','132,53000000000000000000','18,16333333333330000000','0,28000000000000000000','50,58666666666670000000','3,10666666666667000000','7,46233333333333000000','217,66000000000000000000','0,10333333333333300000','0,72333333333333300000','NA','458,00000000000000000000','229,00000000000000000000','0,10666666666666700000','0,23000000000000000000','0,09333333333333330000','1,19333333333333000000','60,10000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','76','Aipo, cru','93,82800000000000000000','19,09145664497060000000','79,87865460255710000000','0,75833333333333300000','0,06900000000000000000','NA','4,27233333333334000000','0,95700000000000000000','1,07233333333333000000','65,22466666666670000000','8,86033333333333000000','0,17800000000000000000','28,04566666666670000000','0,72033333333333300000','9,51566666666667000000','273,60366666666700000000','0,31433333333333300000','0,14266666666666700000','NA','916,00000000000000000000','458,00000000000000000000','Tr','Tr','0,18000000000000000000','Tr','5,88000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','77','Alface, americana, crua','97,16866666666660000000','8,79490323686605000000','36,79787514304760000000','0,60833333333333300000','0,12900000000000000000','NA','1,74533333333335000000','1,02166666666667000000','0,34866666666666700000','14,44466666666670000000','5,73666666666667000000','0,11766666666666700000','19,37700000000000000000','0,26666666666666700000','7,30833333333333000000','136,00300000000000000000','0,02166666666666670000','0,22633333333333300000','NA','','','0,03000000000000000000','Tr','0,03666666666666670000','Tr','10,96000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','78','Alface, crespa, crua','96,09333333333330000000','10,68085652173920000000','44,68870368695690000000','1,34782608695652000000','0,16000000000000000000','NA','1,69550724637683000000','1,82666666666667000000','0,70333333333333300000','37,98000000000000000000','10,97000000000000000000','0,20000000000000000000','25,80666666666670000000','0,39666666666666700000','3,38000000000000000000','267,13333333333300000000','0,03000000000000000000','0,25333333333333300000','NA','234,00000000000000000000','117,00000000000000000000','0,11000000000000000000','0,12333333333333300000','Tr','1,09333333333333000000','15,57666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','79','Alface, lisa, crua','95,00000000000000000000','13,82090144927530000000','57,82665166376800000000','1,68840579710145000000','0,12333333333333300000','NA','2,42826086956522000000','2,33000000000000000000','0,76000000000000000000','27,51333333333330000000','9,10666666666667000000','0,33366666666666700000','26,13333333333330000000','0,61000000000000000000','4,23333333333333000000','348,71000000000000000000','0,03333333333333330000','0,34666666666666700000','NA','368,00000000000000000000','184,00000000000000000000','0,08666666666666670000','0,08333333333333330000','0,07000000000000000000','0,75000000000000000000','21,39000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','80','Alface, roxa, crua','95,72833333333330000000','12,71699736346800000000','53,20791696875010000000','0,90625000000000000000','0,19166666666666700000','NA','2,49341666666666000000','2,01333333333333000000','0,68033333333333300000','33,82833333333330000000','9,31100000000000000000','0,11633333333333300000','51,12933333333330000000','2,47700000000000000000','7,12433333333333000000','308,43533333333300000000','0,03666666666666670000','0,23466666666666700000','NA','312,41666666666700000000','156,20833333333300000000','Tr','Tr','Tr','Tr','13,47333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','81','Alfavaca, crua','90,20766666666670000000','29,18361308105790000000','122,10423713114600000000','2,65833333333333000000','0,47633333333333300000','NA','5,24100000000000000000','4,14033333333333000000','1,41666666666667000000','258,49766666666700000000','84,23833333333330000000','0,14533333333333300000','49,74300000000000000000','1,25633333333333000000','4,55033333333333000000','260,71766666666700000000','0,15166666666666700000','0,70600000000000000000','NA','','','Tr','0,12000000000000000000','0,55666666666666700000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','82','Alho, cru','67,54666666666670000000','113,12987826087000000000','473,33541064347800000000','7,01086956521739000000','0,22000000000000000000','NA','23,90579710144930000000','4,32333333333333000000','1,31666666666667000000','13,56000000000000000000','21,29333333333330000000','0,24000000000000000000','149,09000000000000000000','0,80000000000000000000','5,36000000000000000000','534,88666666666700000000','0,15000000000000000000','0,82000000000000000000','NA','','','0,18333333333333300000','Tr','0,44333333333333300000','Tr','*','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','83','Alho-poró, cru','90,95200000000000000000','31,50791935324670000000','131,82913457398400000000','1,41250000000000000000','0,13966666666666700000','NA','6,87816666666667000000','2,50666666666667000000','0,61766666666666700000','33,61633333333330000000','10,69466666666670000000','0,10233333333333300000','36,48633333333330000000','0,64066666666666700000','1,76233333333333000000','224,46633333333300000000','0,28800000000000000000','0,24066666666666700000','NA','16,16666666666670000000','8,08333333333333000000','0,06333333333333330000','Tr','0,08333333333333330000','0,34000000000000000000','14,14666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','84','Almeirão, cru','93,67000000000000000000','18,03442898550720000000','75,45605087536230000000','1,76811594202899000000','0,21666666666666700000','NA','3,33521739130435000000','2,58666666666667000000','1,01000000000000000000','19,49533333333330000000','21,11000000000000000000','0,16666666666666700000','39,66000000000000000000','0,74333333333333300000','2,35066666666667000000','369,12000000000000000000','0,10000000000000000000','0,28666666666666700000','NA','566,00000000000000000000','283,00000000000000000000','0,09666666666666670000','0,17666666666666700000','Tr','0,62666666666666700000','1,68666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','85','Almeirão, refogado','86,54466666666670000000','65,08191082886850000000','272,30271490798600000000','1,70416666666667000000','4,84700000000000000000','NA','5,70149999999999000000','3,42766666666667000000','1,20266666666667000000','63,40366666666670000000','17,28400000000000000000','0,27866666666666700000','30,87166666666670000000','1,55066666666667000000','14,51500000000000000000','315,35566666666700000000','0,05800000000000000000','0,19100000000000000000','NA','','','0,03000000000000000000','0,06000000000000000000','0,04666666666666670000','4,03333333333333000000','1,47000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','86','Batata, baroa, cozida','79,26066666666670000000','80,11976250000000000000','335,22108630000000000000','0,85208333333333300000','0,16633333333333300000','NA','18,94758333333330000000','1,75800000000000000000','0,77333333333333300000','11,85000000000000000000','7,57600000000000000000','0,21800000000000000000','29,47500000000000000000','0,42366666666666700000','2,09800000000000000000','258,32666666666700000000','0,14700000000000000000','0,37866666666666700000','NA','','','0,06000000000000000000','Tr','Tr','1,98000000000000000000','17,10000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','87','Batata, baroa, crua','73,69000000000000000000','100,98492318840600000000','422,52091862029000000000','1,04710144927536000000','0,17000000000000000000','NA','23,98289855072460000000','2,06333333333333000000','1,11000000000000000000','17,12666666666670000000','11,99333333333330000000','0,06666666666666670000','45,20000000000000000000','0,30333333333333300000','Tr','505,18333333333300000000','0,04666666666666670000','0,20333333333333300000','NA','24,50000000000000000000','12,25000000000000000000','0,04666666666666670000','Tr','0,12333333333333300000','Tr','7,55000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','88','Batata, doce, cozida','80,42500000000000000000','76,75961050343520000000','321,16221034637300000000','0,64166666666666700000','0,08766666666666670000','NA','18,42233333333330000000','2,21200000000000000000','0,42333333333333300000','17,15300000000000000000','11,15966666666670000000','0,13933333333333300000','15,39400000000000000000','0,18700000000000000000','2,69900000000000000000','148,44000000000000000000','0,06000000000000000000','0,12333333333333300000','NA','','','0,08333333333333330000','Tr','0,05000000000000000000','2,57333333333333000000','23,78666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','89','Batata, doce, crua','69,51333333333330000000','118,24137536231900000000','494,72191451594200000000','1,25724637681159000000','0,13333333333333300000','NA','28,19608695652170000000','2,57333333333333000000','0,90000000000000000000','21,11000000000000000000','16,89333333333330000000','0,17666666666666700000','36,46000000000000000000','0,38666666666666700000','8,77333333333333000000','340,20333333333300000000','0,11000000000000000000','0,20000000000000000000','NA','','','0,05666666666666670000','Tr','0,10000000000000000000','Tr','16,48000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','90','Batata, frita, tipo chips, industrializada','2,69733333333333000000','542,73467338419000000000','2270,80187343945000000000','5,58333333333333000000','36,61500000000000000000','NA','51,22233333333330000000','2,45566666666667000000','3,88200000000000000000','11,59766666666670000000','24,23933333333330000000','0,23133333333333300000','96,49833333333330000000','0,69566666666666700000','607,39933333333300000000','1014,32500000000000000000','0,12100000000000000000','0,58766666666666700000','NA','','','0,19666666666666700000','Tr','0,13000000000000000000','2,61333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','91','Batata, inglesa, cozida','86,35966666666670000000','51,58847663627070000000','215,84618624615600000000','1,16458333333333000000','Tr','NA','11,94375000000000000000','1,34333333333333000000','0,50600000000000000000','3,52000000000000000000','5,42500000000000000000','0,06633333333333330000','24,34233333333330000000','0,19400000000000000000','2,29366666666667000000','161,33166666666700000000','0,05766666666666670000','0,18766666666666700000','NA','','','0,05000000000000000000','Tr','0,08333333333333330000','Tr','3,76000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','92','Batata, inglesa, crua','82,87000000000000000000','64,37022608695650000000','269,32502594782600000000','1,77173913043478000000','Tr','NA','14,68826086956520000000','1,16333333333333000000','0,64000000000000000000','3,55000000000000000000','14,58000000000000000000','0,10000000000000000000','38,53666666666670000000','0,36000000000000000000','Tr','302,05333333333300000000','0,09333333333333330000','0,24000000000000000000','NA','','','0,10000000000000000000','Tr','0,15000000000000000000','Tr','31,08333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','93','Batata, inglesa, frita','44,12100000000000000000','267,15742250204100000000','1117,78665574854000000000','4,96666666666667000000','13,10866666666670000000','NA','35,64033333333330000000','8,05933333333333000000','2,16333333333333000000','6,27633333333333000000','14,11433333333330000000','0,14766666666666700000','69,66766666666670000000','0,44433333333333300000','1,91300000000000000000','488,94166666666700000000','0,10333333333333300000','0,37600000000000000000','NA','','','0,17333333333333300000','Tr','0,10333333333333300000','2,50666666666667000000','16,34333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','94','Batata, inglesa, sauté','83,09100000000000000000','67,88793615063030000000','284,04312485423700000000','1,29166666666667000000','0,89633333333333300000','NA','14,09300000000000000000','1,37700000000000000000','0,62800000000000000000','4,18100000000000000000','6,45633333333333000000','0,08433333333333330000','31,96800000000000000000','0,25000000000000000000','8,18200000000000000000','199,48166666666700000000','0,05066666666666670000','0,20833333333333300000','NA','','','0,06666666666666670000','Tr','0,09333333333333330000','1,38333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','95','Berinjela, cozida','94,43166666666670000000','18,84528555681310000000','78,84867476970590000000','0,67708333333333300000','0,14833333333333300000','NA','4,46825000000000000000','2,52433333333333000000','0,27466666666666700000','10,77133333333330000000','8,81566666666667000000','0,11100000000000000000','15,02666666666670000000','0,22033333333333300000','1,32500000000000000000','105,48000000000000000000','0,04366666666666670000','0,13233333333333300000','NA','','','0,04000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','96','Berinjela, crua','93,80333333333330000000','19,62775362318840000000','82,12252115942020000000','1,22101449275362000000','0,10000000000000000000','NA','4,42898550724637000000','2,87333333333333000000','0,44666666666666700000','9,22000000000000000000','12,91333333333330000000','0,10000000000000000000','20,46333333333330000000','0,24666666666666700000','Tr','204,54666666666700000000','0,06333333333333330000','0,12000000000000000000','NA','24,00000000000000000000','12,00000000000000000000','0,04333333333333330000','0,04666666666666670000','Tr','Tr','3,01000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','97','Beterraba, cozida','90,57333333333330000000','32,15432433140280000000','134,53369300258900000000','1,29375000000000000000','0,09266666666666670000','NA','7,23491666666666000000','1,87866666666667000000','0,80533333333333300000','15,25533333333330000000','16,54166666666670000000','0,18866666666666700000','30,13066666666670000000','0,23866666666666700000','22,76166666666670000000','245,48333333333300000000','0,03900000000000000000','0,35366666666666700000','NA','','','0,09000000000000000000','Tr','Tr','Tr','1,24000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','98','Beterraba, crua','85,98333333333330000000','48,82850869565220000000','204,29848038260900000000','1,94565217391304000000','0,09000000000000000000','NA','11,11101449275360000000','3,37333333333333000000','0,87000000000000000000','18,11333333333330000000','24,43333333333330000000','1,23000000000000000000','19,38666666666670000000','0,32000000000000000000','9,72000000000000000000','375,07333333333300000000','0,07666666666666670000','0,51666666666666700000','NA','','','0,04000000000000000000','Tr','0,04333333333333330000','Tr','3,11666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','99','Biscoito, polvilho doce','5,43733333333333000000','437,54900000000000000000','1830,70501600000000000000','1,29166666666667000000','12,24900000000000000000','9,38500000000000000000','80,53533333333330000000','1,15900000000000000000','0,48666666666666700000','30,45433333333330000000','5,84500000000000000000','0,08133333333333330000','23,31900000000000000000','1,76633333333333000000','97,80133333333330000000','53,57933333333330000000','0,03500000000000000000','0,14500000000000000000','Tr','','','Tr','0,03000000000000000000','0,06666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','100','Brócolis, cozido','92,61700000000000000000','24,63616311136880000000','103,07770645796700000000','2,13333333333333000000','0,45900000000000000000','NA','4,36666666666666000000','3,41666666666667000000','0,42400000000000000000','50,75400000000000000000','14,54666666666670000000','0,11833333333333300000','33,15933333333330000000','0,53500000000000000000','2,12200000000000000000','118,54333333333300000000','0,07533333333333330000','0,23900000000000000000','NA','','','0,04333333333333330000','0,03000000000000000000','Tr','Tr','42,00333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','101','Brócolis, cru','91,22000000000000000000','25,49513188405800000000','106,67163180289900000000','3,64492753623188000000','0,26666666666666700000','NA','4,02507246376812000000','2,88000000000000000000','0,84333333333333300000','85,87000000000000000000','29,56666666666670000000','0,26000000000000000000','78,46000000000000000000','0,61000000000000000000','3,33333333333333000000','322,11000000000000000000','0,05666666666666670000','0,47666666666666700000','NA','279,33333333333300000000','139,66666666666700000000','0,11666666666666700000','0,18333333333333300000','0,07666666666666670000','1,39000000000000000000','34,28333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','102','Cará, cozido','78,88466666666670000000','77,58491333333340000000','324,61527738666700000000','1,52916666666667000000','0,11233333333333300000','NA','18,85250000000000000000','2,63466666666667000000','0,62133333333333300000','5,16833333333333000000','14,83866666666670000000','0,02166666666666670000','27,80133333333330000000','0,30833333333333300000','1,00633333333333000000','203,25233333333300000000','0,11266666666666700000','0,23766666666666700000','NA','','','0,11666666666666700000','Tr','0,12000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','103','Cará, cru','73,69333333333330000000','95,63313478260870000000','400,12903593043500000000','2,28260869565217000000','0,13666666666666700000','NA','22,95405797101450000000','7,27333333333333000000','0,93333333333333300000','3,91133333333333000000','11,46666666666670000000','0,01000000000000000000','34,72000000000000000000','0,21333333333333300000','Tr','211,66566666666700000000','0,06000000000000000000','0,18000000000000000000','NA','','','0,11333333333333300000','Tr','0,02000000000000000000','Tr','8,78666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','104','Caruru, cru','87,61833333333330000000','34,03162971735000000000','142,38833873739200000000','3,20000000000000000000','0,58500000000000000000','NA','5,97399999999999000000','4,46900000000000000000','2,62266666666667000000','455,30366666666700000000','197,43566666666700000000','0,89433333333333300000','77,26133333333330000000','4,46233333333333000000','13,66500000000000000000','278,97966666666700000000','0,37133333333333300000','6,03400000000000000000','NA','1906,00000000000000000000','953,00000000000000000000','Tr','0,10000000000000000000','0,11000000000000000000','Tr','5,35666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','105','Catalonha, crua','91,76266666666670000000','23,88841225737330000000','99,94911688484990000000','1,86875000000000000000','0,28233333333333300000','NA','4,75224999999999000000','2,04833333333333000000','1,33400000000000000000','56,79533333333330000000','17,29566666666670000000','0,33666666666666700000','32,00133333333330000000','3,07666666666667000000','9,39366666666667000000','411,79233333333300000000','0,27333333333333300000','0,48100000000000000000','NA','','','Tr','0,03000000000000000000','0,36000000000000000000','1,53666666666667000000','7,33333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','106','Catalonha, refogada','87,43266666666670000000','63,44926914882660000000','265,47174211869100000000','1,95000000000000000000','4,80566666666667000000','NA','4,80933333333334000000','3,65000000000000000000','1,00233333333333000000','63,22466666666670000000','16,34566666666670000000','0,63933333333333300000','35,36166666666670000000','1,17633333333333000000','24,71933333333330000000','452,28133333333300000000','0,17833333333333300000','0,44033333333333300000','NA','850,00000000000000000000','425,00000000000000000000','0,04333333333333330000','Tr','0,03000000000000000000','0,60000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','107','Cebola, crua','88,92000000000000000000','39,42004637681160000000','164,93347404058000000000','1,71014492753623000000','0,08000000000000000000','NA','8,85318840579710000000','2,18666666666667000000','0,43666666666666700000','14,00000000000000000000','11,91666667000000000000','0,13000000000000000000','37,86666666666670000000','0,20333333333333300000','0,59666666666666700000','176,11666666666700000000','0,05000000000000000000','0,17333333333333300000','NA','','','0,04333333333333330000','Tr','0,14333333333333300000','Tr','4,66666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','108','Cebolinha, crua','93,88000000000000000000','19,51588550724640000000','81,65446496231910000000','1,86594202898551000000','0,35000000000000000000','NA','3,37072463768116000000','3,55000000000000000000','0,53333333333333300000','79,85333333333330000000','24,59333333333330000000','0,12666666666666700000','26,89000000000000000000','0,64666666666666700000','1,60333333333333000000','206,43666666666700000000','0,04333333333333330000','0,30333333333333300000','NA','134,41666666666700000000','67,20833333333330000000','0,03333333333333330000','0,04333333333333330000','0,08333333333333330000','Tr','31,78000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','109','Cenoura, cozida','91,66300000000000000000','29,86177771015960000000','124,94167793930800000000','0,84791666666666700000','0,21833333333333300000','NA','6,68674999999999000000','2,62900000000000000000','0,58400000000000000000','25,61700000000000000000','14,47533333333330000000','0,04500000000000000000','26,74400000000000000000','0,09366666666666670000','7,88100000000000000000','175,50900000000000000000','0,01500000000000000000','0,23200000000000000000','NA','612,00000000000000000000','306,00000000000000000000','0,07000000000000000000','Tr','0,06000000000000000000','2,68333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','110','Cenoura, crua','90,08333333333330000000','34,13538840579710000000','142,82246508985500000000','1,32246376811594000000','0,17333333333333300000','NA','7,66000000000000000000','3,18333333333333000000','0,86666666666666700000','22,54000000000000000000','11,22666666666670000000','0,05000000000000000000','27,85000000000000000000','0,18333333333333300000','3,33333333333333000000','314,81333333333300000000','0,04666666666666670000','0,22333333333333300000','NA','1326,00000000000000000000','663,00000000000000000000','Tr','Tr','0,05000000000000000000','Tr','5,11666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','111','Chicória, crua','95,13666666666670000000','13,83712028985510000000','57,89451129275370000000','1,13768115942029000000','0,14333333333333300000','NA','2,85333333333334000000','2,20000000000000000000','0,82000000000000000000','44,82666666666670000000','14,13666666666670000000','0,13333333333333300000','13,37766666666670000000','0,45333333333333300000','13,52233333333330000000','424,89666666666700000000','0,04000000000000000000','0,09033333333333330000','NA','','','0,03000000000000000000','0,10333333333333300000','Tr','0,68333333333333300000','6,54333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','112','Chuchu, cozido','94,56166666666670000000','18,53979053137700000000','77,57048358328140000000','0,41458333333333300000','Tr','NA','4,79341666666667000000','1,03966666666667000000','0,18066666666666700000','7,82733333333333000000','6,93200000000000000000','0,06533333333333330000','12,80500000000000000000','0,06200000000000000000','1,80733333333333000000','54,35266666666670000000','Tr','0,09333333333333330000','NA','','','0,03000000000000000000','Tr','Tr','Tr','5,56666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','113','Chuchu, cru','94,83666666666670000000','16,97891884057970000000','71,03979642898560000000','0,69927536231884100000','0,06000000000000000000','NA','4,13739130434783000000','1,28000000000000000000','0,26666666666666700000','11,50666666666670000000','7,22666666666667000000','0,08000000000000000000','17,74333333333330000000','0,17000000000000000000','Tr','125,99000000000000000000','0,03000000000000000000','0,10333333333333300000','NA',' ',' ','Tr','Tr','Tr','Tr','10,61333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','114','Coentro, folhas desidratadas','10,63000000000000000000','309,07074680447600000000','1293,15200462993000000000','20,87500000000000000000','10,38666666666670000000','NA','47,95500000000000000000','37,29000000000000000000','10,15333333333330000000','783,81366666666700000000','392,78833333333300000000','10,47966666666670000000','388,06366666666700000000','81,43133333333340000000','18,25533333333330000000','3222,76566666667000000000','4,09333333333333000000','4,70066666666667000000','NA','','','0,09666666666666670000','0,11333333333333300000','0,09333333333333330000','Tr','40,77333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','115','Couve, manteiga, crua','90,90000000000000000000','27,05669710144930000000','113,20522067246400000000','2,87318840579710000000','0,54666666666666700000','NA','4,33347826086956000000','3,12000000000000000000','1,34666666666667000000','130,86600000000000000000','34,65666666666670000000','1,01666666666667000000','48,66700000000000000000','0,45366666666666700000','6,17100000000000000000','403,44666666666700000000','0,06000000000000000000','0,39666666666666700000','NA','496,00000000000000000000','248,00000000000000000000','0,20000000000000000000','0,31000000000000000000','0,06333333333333330000','2,29000000000000000000','96,68333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','116','Couve, manteiga, refogada ','81,52733333333330000000','90,34481542611120000000','378,00270774284900000000','1,66666666666667000000','6,59400000000000000000','NA','8,70766666666667000000','5,73633333333333000000','1,50433333333333000000','177,33233333333300000000','26,20466666666670000000','0,12333333333333300000','33,40666666666670000000','0,49533333333333300000','11,44666666666670000000','314,88900000000000000000','0,02033333333333330000','0,19366666666666700000','NA','384,00000000000000000000','192,00000000000000000000','Tr','0,05000000000000000000','0,07000000000000000000','Tr','76,94333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','117','Couve-flor, crua','92,77000000000000000000','22,56334927536230000000','94,40505336811580000000','1,90579710144928000000','0,21333333333333300000','NA','4,51753623188406000000','2,35000000000000000000','0,59333333333333300000','17,82000000000000000000','11,99333333333330000000','0,16000000000000000000','57,08000000000000000000','0,53333333333333300000','3,43666666666667000000','256,01333333333300000000','0,03000000000000000000','0,31333333333333300000','NA','2,00000000000000000000','1,00000000000000000000','0,03000000000000000000','0,09333333333333330000','0,10000000000000000000','Tr','36,05000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','118','Couve-flor, cozida','94,33833333333330000000','19,11414061472820000000','79,97356433202270000000','1,23958333333333000000','0,26933333333333300000','NA','3,87541666666668000000','2,13033333333333000000','0,27733333333333300000','16,14433333333330000000','5,44466666666667000000','0,10200000000000000000','25,43166666666670000000','0,13033333333333300000','1,78766666666667000000','80,49200000000000000000','Tr','0,25900000000000000000','NA','','','0,03666666666666670000','Tr','Tr','Tr','23,69666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','119','Espinafre, Nova Zelândia, cru','94,03000000000000000000','16,09569420289850000000','67,34438454492740000000','1,99637681159420000000','0,24333333333333300000','NA','2,57362318840580000000','2,10000000000000000000','1,15666666666667000000','97,50666666666670000000','81,64333333333330000000','0,71000000000000000000','25,43333333333330000000','0,35733333333333300000','17,09483333333330000000','336,00666666666700000000','0,06000000000000000000','0,27333333333333300000','NA','484,00000000000000000000','242,00000000000000000000','0,09666666666666670000','0,20666666666666700000','0,06000000000000000000','Tr','2,42000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','120','Espinafre, Nova Zelândia, refogado','86,57300000000000000000','67,25365175066400000000','281,38927892477800000000','2,71875000000000000000','5,43466666666667000000','NA','4,23858333333334000000','2,51833333333333000000','1,03500000000000000000','112,38233333333300000000','122,71233333333300000000','0,61333333333333300000','33,50566666666670000000','0,64933333333333300000','47,02433333333330000000','149,22566666666700000000','0,03666666666666670000','0,59266666666666700000','NA','623,83333333333300000000','311,91666666666700000000','0,08333333333333330000','0,12666666666666700000','0,13333333333333300000','Tr','5,26666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','121','Farinha, de mandioca, crua','9,38666666666667000000','360,86969855072500000000','1509,87881873623000000000','1,55434782608696000000','0,27666666666666700000','NA','87,89898550724640000000','6,39000000000000000000','0,88333333333333300000','64,87333333333330000000','37,00000000000000000000','Tr','41,61000000000000000000','1,09333333333333000000','1,02333333333333000000','340,13000000000000000000','0,08000000000000000000','0,39333333333333300000','NA','','','0,13666666666666700000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','122','Farinha, de mandioca, torrada','8,34000000000000000000','365,26897500000000000000','1528,28539140000000000000','1,22916666666667000000','0,28666666666666700000','NA','89,19416666666670000000','6,54000000000000000000','0,95000000000000000000','75,52733333333330000000','40,01266666666670000000','0,36633333333333300000','38,62600000000000000000','1,19366666666667000000','10,31000000000000000000','327,73500000000000000000','Tr','0,36000000000000000000','NA','','','Tr','Tr','0,80666666666666700000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','123','Farinha, de puba','9,80100000000000000000','360,17977487993200000000','1506,99217809764000000000','1,61666666666667000000','0,46900000000000000000','NA','87,28533333333340000000','4,24000000000000000000','0,82800000000000000000','41,39566666666670000000','27,48666666666670000000','0,16266666666666700000','32,63966666666670000000','1,43300000000000000000','3,60766666666667000000','337,76433333333300000000','0,06966666666666670000','0,33700000000000000000','NA','','','0,09333333333333330000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','124','Fécula, de mandioca','17,76666666666670000000','330,85055833333300000000','1384,27873606667000000000','0,52083333333333300000','0,28333333333333300000','NA','81,14916666666670000000','0,64666666666666700000','0,28000000000000000000','11,88900000000000000000','3,01700000000000000000','Tr','60,38500000000000000000','0,10700000000000000000','2,44900000000000000000','48,12700000000000000000','Tr','Tr','NA','','','0,03000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','125','Feijão, broto, cru','87,48133333333330000000','38,72323637541130000000','162,01802099472100000000','4,16666666666667000000','0,10266666666666700000','NA','7,75833333333333000000','1,96600000000000000000','0,49100000000000000000','14,48266666666670000000','25,12600000000000000000','0,18700000000000000000','74,75233333333330000000','0,82033333333333400000','1,79300000000000000000','189,21533333333300000000','0,17233333333333300000','0,57133333333333300000','NA','','','Tr','0,03666666666666670000','0,14666666666666700000','Tr','12,00000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','126','Inhame, cru','73,31333333333330000000','96,69983188405800000000','404,59209660289800000000','2,05072463768116000000','0,21333333333333300000','NA','23,23260869565220000000','1,65333333333333000000','1,19000000000000000000','11,79666666666670000000','28,76333333333330000000','0,15333333333333300000','64,72333333333330000000','0,36000000000000000000','Tr','567,74333333333300000000','0,17000000000000000000','0,30000000000000000000','NA','','','0,08000000000000000000','Tr','0,10666666666666700000','Tr','5,62333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','127','Jiló, cru','91,63000000000000000000','27,36514347826090000000','114,49576031304300000000','1,40217391304348000000','0,22000000000000000000','NA','6,19115942028986000000','4,82666666666667000000','0,55666666666666700000','19,97000000000000000000','20,62666666666670000000','0,14000000000000000000','29,02000000000000000000','0,33666666666666700000','Tr','212,95000000000000000000','0,07000000000000000000','0,14000000000000000000','NA','12,66666666666670000000','6,33333333333333000000','0,07000000000000000000','0,04000000000000000000','Tr','Tr','6,79333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','128','Jurubeba, crua','66,63533333333330000000','125,81163500000000000000','526,39588084000000000000','4,41250000000000000000','3,90966666666667000000','NA','23,05916666666670000000','23,92133333333330000000','1,98333333333333000000','151,01700000000000000000','65,32300000000000000000','0,52200000000000000000','155,12266666666700000000','0,94600000000000000000','0,77100000000000000000','619,39700000000000000000','1,16200000000000000000','0,63366666666666700000','NA','','','0,13000000000000000000','0,02000000000000000000','0,20333333333333300000','Tr','13,83333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','129','Mandioca, cozida','68,68666666666670000000','125,35825000000000000000','524,49891800000000000000','0,57500000000000000000','0,29833333333333300000','NA','30,09000000000000000000','1,55666666666667000000','0,35000000000000000000','18,62833333333330000000','26,81566666666670000000','0,06366666666666670000','22,41033333333330000000','0,07466666666666670000','0,90666666666666700000','100,36233333333300000000','0,01400000000000000000','0,17433333333333300000','NA','','','0,06000000000000000000','Tr','0,03000000000000000000','Tr','11,06666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','130','Mandioca, crua','61,84333333333330000000','151,41695652173900000000','633,52854608695600000000','1,13043478260870000000','0,30000000000000000000','NA','36,16956521739130000000','1,87666666666667000000','0,55666666666666700000','15,19000000000000000000','44,49666666666670000000','0,05000000000000000000','29,42666666666670000000','0,27000000000000000000','2,15000000000000000000','208,06000000000000000000','0,06666666666666670000','0,20333333333333300000','NA','','','Tr','Tr','0,04000000000000000000','Tr','16,52666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','131','Mandioca, farofa, temperada','6,42000000000000000000','405,69394166666700000000','1697,42345193333000000000','2,06250000000000000000','9,12000000000000000000','NA','80,30416666666670000000','7,81666666666667000000','2,09333333333333000000','65,69233333333330000000','34,33566666666670000000','0,28900000000000000000','44,51566666666670000000','1,35633333333333000000','574,50800000000000000000','201,37666666666700000000','Tr','0,17200000000000000000','NA','','','0,10000000000000000000','Tr','0,15333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','132','Mandioca, frita','36,56566666666670000000','300,05524338914900000000','1255,43113834020000000000','1,38125000000000000000','11,19500000000000000000','NA','50,25141666666670000000','1,87000000000000000000','0,60666666666666700000','23,05333333333330000000','94,86666666666670000000','0,18166666666666700000','56,54366666666670000000','0,32033333333333300000','8,93600000000000000000','176,06400000000000000000','0,12100000000000000000','0,43700000000000000000','NA','','','0,05333333333333330000','Tr','0,03666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','133','Manjericão, cru','92,95666666666670000000','21,14767681159420000000','88,48187977971020000000','1,98550724637681000000','0,39333333333333300000','NA','3,64449275362319000000','3,30666666666667000000','1,02000000000000000000','210,91666666666700000000','57,81333333333330000000','0,17333333333333300000','39,92333333333330000000','0,97333333333333300000','3,88666666666667000000','251,54666666666700000000','0,16333333333333300000','0,46333333333333300000','NA','1034,83333333333000000000','517,41666666666700000000','0,06000000000000000000','0,21000000000000000000','0,06000000000000000000','0,89666666666666700000','2,33666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','134','Maxixe, cru','95,06000000000000000000','13,74723608695650000000','57,51843578782610000000','1,39130434782609000000','0,07300000000000000000','NA','2,72869565217391000000','2,19300000000000000000','0,74700000000000000000','20,86700000000000000000','9,61300000000000000000','0,07000000000000000000','24,98300000000000000000','0,35000000000000000000','10,99300000000000000000','327,69700000000000000000','0,02000000000000000000','0,18000000000000000000','NA','5,50000000000000000000','2,75000000000000000000','0,05700000000000000000','0,02000000000000000000','0,04000000000000000000','Tr','9,63300000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','135','Mostarda, folha, crua','93,43000000000000000000','18,10738905217250000000','75,76131579428970000000','2,11041666666667000000','0,16766666666666700000','NA','3,23658333333333000000','1,89100000000000000000','1,05533333333333000000','68,17833333333330000000','15,61833333333330000000','0,13866666666666700000','58,39833333333330000000','1,09700000000000000000','2,87933333333333000000','363,56633333333300000000','0,04833333333333330000','0,28400000000000000000','NA','','','0,04666666666666670000','0,04000000000000000000','0,05000000000000000000','Tr','38,55333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','136','Nhoque, batata, cozido','54,95400000000000000000','180,77527399341300000000','756,36374638843800000000','5,85833333333333000000','1,94333333333333000000','15,07766666666670000000','36,78000000000000000000','1,78000000000000000000','0,46433333333333300000','11,42133333333330000000','17,89800000000000000000','0,29800000000000000000','68,37233333333330000000','1,64966666666667000000','7,06800000000000000000','163,70033333333300000000','0,10366666666666700000','0,48033333333333300000','15,47333333333330000000','','','0,07666666666666670000','Tr','0,03666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','137','Nabo, cru','93,84333333333330000000','18,18662463768120000000','76,09283748405820000000','1,20289855072464000000','0,05333333333333330000','NA','4,14710144927538000000','2,64333333333333000000','0,75333333333333300000','42,39333333333330000000','14,60000000000000000000','4,41666666666667000000','16,56666666666670000000','0,22333333333333300000','2,46000000000000000000','279,65333333333300000000','0,02000000000000000000','0,19000000000000000000','NA','','','0,06666666666666670000','Tr','0,03000000000000000000','Tr','9,55000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','138','Palmito, juçara, em conserva','91,36666666666670000000','23,19971643408130000000','97,06761356019640000000','1,79166666666667000000','0,40333333333333300000','NA','4,32833333333333000000','3,15000000000000000000','2,11000000000000000000','58,28900000000000000000','33,70266666666670000000','10,81900000000000000000','40,26466666666670000000','0,30333333333333300000','513,82033333333300000000','243,96933333333300000000','0,22733333333333300000','0,73166666666666700000','NA','','','0,06000000000000000000','0,04000000000000000000','Tr','Tr','1,98000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','139','Palmito, pupunha, em conserva','89,44400000000000000000','29,43196333333330000000','123,14333458666700000000','2,45833333333333000000','0,45000000000000000000','NA','5,50900000000000000000','2,55000000000000000000','2,13866666666667000000','32,43900000000000000000','25,49233333333330000000','0,14133333333333300000','54,96200000000000000000','0,17766666666666700000','562,68533333333300000000','206,41600000000000000000','0,07966666666666670000','0,35600000000000000000','NA','','','0,03000000000000000000','Tr','Tr','Tr','8,66333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','140','Pão, de queijo, assado','33,73600000000000000000','363,07791333333300000000','1519,11798938667000000000','5,12083333333333000000','24,56733333333330000000','67,72666666666670000000','34,24150000000000000000','0,55833333333333300000','2,33433333333333000000','102,49366666666700000000','8,23900000000000000000','0,03266666666666670000','93,73666666666670000000','0,27666666666666700000','773,49333333333300000000','93,09300000000000000000','0,00566666666666667000','0,63000000000000000000','61,31000000000000000000','','','0,03666666666666670000','0,09666666666666670000','0,03666666666666670000','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','141','Pão, de queijo, cru','41,83700000000000000000','294,53800000000000000000','1232,34699200000000000000','3,64800000000000000000','13,98866666666670000000','63,05433333333330000000','38,51200000000000000000','0,97633333333333300000','2,01433333333333000000','87,56366666666670000000','6,82566666666667000000','Tr','78,84266666666670000000','0,28766666666666700000','404,99400000000000000000','58,08033333333330000000','Tr','0,42666666666666700000','47,50333333333330000000','','','Tr','0,07666666666666670000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','142','Pepino, cru','96,78666666666670000000','9,53369130434782000000','39,88896441739130000000','0,86956521739130400000','Tr','NA','2,03710144927535000000','1,12000000000000000000','0,29000000000000000000','9,61666666666667000000','9,34000000000000000000','0,08333333333333330000','12,32333333333330000000','0,14666666666666700000','Tr','153,69333333333300000000','0,03666666666666670000','0,12666666666666700000','NA','3,58333333333333000000','1,79166666666667000000','Tr','0,03000000000000000000','Tr','Tr','4,98666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','143','Pimentão, amarelo, cru','91,87666666666670000000','27,92745942028980000000','116,84849021449300000000','1,22463768115942000000','0,43666666666666700000','NA','5,96202898550725000000','1,92000000000000000000','0,50000000000000000000','9,61000000000000000000','10,90000000000000000000','0,08333333333333330000','22,38333333333330000000','0,41333333333333300000','Tr','221,33333333333300000000','0,04000000000000000000','0,15000000000000000000','NA','40,00000000000000000000','20,00000000000000000000','0,04000000000000000000','0,03000000000000000000','0,06000000000000000000','Tr','201,36000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','144','Pimentão, verde, cru','93,52000000000000000000','21,28588115942030000000','89,06012677101450000000','1,05072463768116000000','0,15000000000000000000','NA','4,89260869565218000000','2,56333333333333000000','0,38666666666666700000','8,76333333333333000000','7,79000000000000000000','0,14333333333333300000','16,51333333333330000000','0,41000000000000000000','Tr','174,33000000000000000000','0,07000000000000000000','0,14000000000000000000','NA','46,00000000000000000000','23,00000000000000000000','Tr','Tr','Tr','Tr','100,21000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','145','Pimentão, vermelho, cru','92,90333333333330000000','23,28136376811600000000','97,40922600579740000000','1,03985507246377000000','0,14666666666666700000','NA','5,46681159420291000000','1,59333333333333000000','0,44333333333333300000','6,37000000000000000000','11,13000000000000000000','0,06333333333333330000','19,96000000000000000000','0,33333333333333300000','Tr','210,91666666666700000000','0,04333333333333330000','0,15333333333333300000','NA','86,00000000000000000000','43,00000000000000000000','0,04666666666666670000','0,05666666666666670000','0,02000000000000000000','Tr','158,21000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','146','Polvilho, doce','12,58333333333330000000','351,22673333333300000000','1469,53265226667000000000','0,43000000000000000000','Tr','NA','86,77333333333330000000','0,23666666666666700000','0,17333333333333300000','27,41333333333330000000','4,10000000000000000000','0,08766666666666670000','8,38000000000000000000','0,51000000000000000000','1,57666666666667000000','37,63333333333330000000','Tr','Tr','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','147','Quiabo, cru','90,57533333333330000000','29,93926215006910000000','125,26587283588900000000','1,91875000000000000000','0,29900000000000000000','NA','6,37391666666667000000','4,55333333333333000000','0,83300000000000000000','112,15966666666700000000','49,96900000000000000000','0,46400000000000000000','55,82500000000000000000','0,36900000000000000000','0,89100000000000000000','248,80433333333300000000','0,16666666666666700000','0,58900000000000000000','NA','49,30555555555560000000','24,65277777777780000000','0,10333333333333300000','Tr','0,03000000000000000000','Tr','5,59666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','148','Rabanete, cru','95,06333333333330000000','13,73812608695650000000','57,48031954782600000000','1,39130434782609000000','0,07333333333333340000','NA','2,72536231884058000000','2,19333333333333000000','0,74666666666666700000','20,86666666666670000000','9,61333333333333000000','0,07000000000000000000','24,98333333333330000000','0,35000000000000000000','10,99333333333330000000','327,69666666666700000000','0,02000000000000000000','0,18000000000000000000','NA','','','0,05666666666666670000','0,02000000000000000000','0,04000000000000000000','Tr','9,63333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','149','Repolho, branco, cru','94,72000000000000000000','17,11880289855070000000','71,62507132753620000000','0,87681159420289800000','0,14333333333333300000','NA','3,85985507246377000000','1,89000000000000000000','0,40000000000000000000','34,54666666666670000000','8,51333333333333000000','0,12666666666666700000','14,20000000000000000000','0,15000000000000000000','3,64333333333333000000','150,09000000000000000000','0,01666666666666670000','0,15000000000000000000','NA','6,00000000000000000000','3,00000000000000000000','Tr','0,03000000000000000000','0,05666666666666670000','Tr','18,71666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','150','Repolho, roxo, cru','90,08433333333330000000','30,90750295432410000000','129,31699236089200000000','1,90833333333333000000','0,06366666666666670000','NA','7,20400000000000000000','1,97333333333333000000','0,73966666666666700000','43,67033333333330000000','18,02433333333330000000','0,25266666666666700000','57,71233333333330000000','0,51633333333333300000','2,33766666666667000000','328,06866666666700000000','0,90166666666666700000','0,25466666666666700000','NA','','','0,07000000000000000000','Tr','0,09333333333333330000','Tr','43,20000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','151','Repolho, roxo, refogado','88,69900000000000000000','41,77352528971430000000','174,78042981216500000000','1,80208333333333000000','1,24033333333333000000','NA','7,56158333333333000000','1,75000000000000000000','0,69700000000000000000','42,58800000000000000000','17,24800000000000000000','0,26100000000000000000','59,38300000000000000000','0,46633333333333300000','3,41666666666667000000','321,45300000000000000000','0,02233333333333330000','0,25633333333333300000','NA','','','0,06666666666666670000','Tr','0,07333333333333340000','0,62600000000000000000','40,52000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','152','Rúcula, crua','94,81566666666670000000','13,13325660729410000000','54,94954564491840000000','1,76666666666667000000','0,10733333333333300000','NA','2,21966666666666000000','1,74000000000000000000','1,09066666666667000000','116,56333333333300000000','17,79066666666670000000','0,23566666666666700000','25,16566666666670000000','0,93900000000000000000','9,41800000000000000000','233,40033333333300000000','0,04100000000000000000','0,22866666666666700000','NA','532,75000000000000000000','266,37500000000000000000','0,04333333333333330000','Tr','Tr','0,35000000000000000000','46,29333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','153','Salsa, crua','88,65000000000000000000','33,42411159420290000000','139,84648291014500000000','3,25724637681159000000','0,61000000000000000000','NA','5,70608695652174000000','1,85000000000000000000','1,77666666666667000000','179,41333333333300000000','20,89666666700000000000','1,87666666666667000000','49,35000000000000000000','3,18000000000000000000','2,30000000000000000000','711,29666666666700000000','0,20000000000000000000','1,32333333333333000000','NA','1743,25000000000000000000','871,62500000000000000000','0,11666666666666700000','0,15000000000000000000','0,46666666666666700000','0,72000000000000000000','51,69333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','154','Seleta de legumes, enlatada','82,14666666666670000000','56,53377246376820000000','236,53730398840600000000','3,42028985507246000000','0,35333333333333300000','NA','12,66971014492750000000','3,09000000000000000000','1,41000000000000000000','16,15666666666670000000','15,61333333333330000000','0,13100000000000000000','49,03333333333330000000','1,06000000000000000000','398,13666666666700000000','122,21333333333300000000','0,08333333333333330000','0,52666666666666700000','NA','244,16666666666700000000','122,08333333333300000000','0,03000000000000000000','Tr','Tr','3,71666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','155','Serralha, crua','90,24833333333330000000','30,39793416666660000000','127,18495655333300000000','2,67291666666667000000','0,74266666666666700000','NA','4,94675000000000000000','3,51850000000000000000','1,38933333333333000000','126,02366666666700000000','29,55166666666670000000','0,23000000000000000000','48,25600000000000000000','1,26933333333333000000','19,34700000000000000000','265,26633333333300000000','0,20266666666666700000','1,33166666666667000000','NA','1134,00000000000000000000','567,00000000000000000000','Tr','0,11333333333333300000','0,08000000000000000000','Tr','1,51000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','156','Taioba, crua','89,24300000000000000000','34,20891833333330000000','143,13011430666700000000','2,89583333333333000000','0,92666666666666700000','NA','5,43049999999999000000','4,45366666666667000000','1,50400000000000000000','141,08700000000000000000','37,92266666666670000000','0,66166666666666700000','52,76333333333330000000','1,90666666666667000000','1,16066666666667000000','290,31966666666700000000','0,15866666666666700000','0,60633333333333300000','NA','1160,00000000000000000000','580,00000000000000000000','Tr','0,10333333333333300000','0,09666666666666670000','Tr','17,94000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','157','Tomate, com semente, cru','95,12666666666670000000','15,33515652173920000000','64,16229488695670000000','1,09782608695652000000','0,17333333333333300000','NA','3,13884057971015000000','1,17333333333333000000','0,46333333333333300000','6,94000000000000000000','10,54000000000000000000','0,06666666666666670000','20,19333333333330000000','0,23666666666666700000','1,02000000000000000000','222,38666666666700000000','0,03666666666666670000','0,13666666666666700000','NA','54,00000000000000000000','27,00000000000000000000','0,11666666666666700000','Tr','0,02333333333333330000','Tr','21,21333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','158','Tomate, extrato','79,66330000000000000000','60,93343365217390000000','254,94548640069600000000','2,43478260869565000000','0,19000000000000000000','NA','14,95861739130430000000','2,80333000000000000000','2,75330000000000000000','29,07660000000000000000','29,32660000000000000000','0,17700000000000000000','47,15666666666670000000','2,09333333333333000000','497,93333333333300000000','679,91000000000000000000','0,20333333333333300000','0,36666666666666700000','NA','166,00000000000000000000','83,00000000000000000000','Tr','Tr','0,11000000000000000000','2,42000000000000000000','18,01000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','159','Tomate, molho industrializado','88,13666666666670000000','38,44654946049060000000','160,86036294269300000000','1,37500000000000000000','0,90333333333333300000','NA','7,71166666666668000000','3,11666666666667000000','1,87333333333333000000','11,72933333333330000000','16,78933333333330000000','0,08266666666666670000','27,21033333333330000000','1,57733333333333000000','418,28066666666700000000','388,19500000000000000000','0,07766666666666670000','0,12900000000000000000','NA','76,00000000000000000000','38,00000000000000000000','Tr','Tr','0,06333333333333330000','Tr','2,70666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','160','Tomate, purê','90,79333333333330000000','27,93687971014490000000','116,88790470724600000000','1,36231884057971000000','Tr','NA','6,89434782608695000000','1,02666666666667000000','0,95000000000000000000','13,24333333333330000000','15,43666666666670000000',' ','30,01000000000000000000','1,25000000000000000000','103,93000000000000000000','308,24333333333300000000','0,09333333333333330000','0,33333333333333300000','NA','90,00000000000000000000','45,00000000000000000000','Tr','Tr','0,07000000000000000000','1,18000000000000000000','5,38333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','161','Tomate, salada','93,63200000000000000000','20,54690916666660000000','85,96826795333320000000','0,81041666666666700000','Tr','NA','5,11791666666666000000','2,26833333333333000000','0,40400000000000000000','6,94633333333333000000','9,50366666666667000000','0,04400000000000000000','23,37766666666670000000','0,29033333333333300000','5,24300000000000000000','161,15500000000000000000','0,07200000000000000000','0,17300000000000000000','NA','','','0,05733333333333330000','0,04233333333333330000','0,05000000000000000000','Tr','12,80400000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Verduras, hortaliças e derivados','162','Vagem, crua','92,16666666666670000000','24,89835797101450000000','104,17472975072500000000','1,78623188405797000000','0,17333333333333300000','NA','5,34710144927536000000','2,38333333333333000000','0,52666666666666700000','41,10000000000000000000','17,83333333333330000000','0,50000000000000000000','27,99000000000000000000','0,43000000000000000000','Tr','208,20333333333300000000','0,05666666666666670000','0,33000000000000000000','NA','32,08333333333330000000','16,04166666666670000000','Tr','0,08000000000000000000','Tr','Tr','1,15333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','163','Abacate, cru','83,78666666666670000000','96,15470869565220000000','402,31130118260900000000','1,23913043478261000000','8,39666666666667000000','NA','6,03086956521740000000','6,31333333333333000000','0,54666666666666700000','7,91666666666667000000','14,68333333333330000000','0,17333333333333300000','21,95333333333330000000','0,20666666666666700000','Tr','206,25666666666700000000','0,14666666666666700000','0,21666666666666700000','NA','','','Tr','0,04333333333333330000','Tr','Tr','8,66000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','164','Abacaxi, cru','86,31666666666670000000','48,32221304347820000000','202,18013937391300000000','0,85869565217391300000','0,12333333333333300000','NA','12,33463768115940000000','0,98666666666666700000','0,36666666666666700000','22,43333333333330000000','18,44000000000000000000','1,62333333333333000000','12,78000000000000000000','0,25666666666666700000','Tr','131,34000000000000000000','0,10666666666666700000','0,14333333333333300000','NA','','','0,17333333333333300000','0,02000000000000000000','Tr','Tr','34,62333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','165','Abacaxi, polpa, congelada','91,29466666666670000000','30,59179919433590000000','127,99608782910200000000','0,46666666666666700000','0,11333333333333300000','NA','7,79866666666666000000','0,32666666666666700000','0,32666666666666700000','13,53800000000000000000','10,07133333333330000000','1,02066666666667000000','7,62600000000000000000','0,35733333333333300000','1,23633333333333000000','106,68433333333300000000','0,03900000000000000000','0,06033333333333330000','NA','2,25555555555556000000','1,12777777777778000000','0,04666666666666670000','Tr','Tr','Tr','1,24666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','166','Abiu, cru','83,14433333333330000000','62,42409840854010000000','261,18242774133200000000','0,83333333333333300000','0,70333333333333300000','NA','14,92700000000000000000','1,69600000000000000000','0,39200000000000000000','5,78000000000000000000','9,29633333333334000000','0,08033333333333330000','20,28833333333330000000','0,15866666666666700000','Tr','128,33900000000000000000','0,09300000000000000000','0,09866666666666670000','NA','','','Tr','0,03666666666666670000','0,05000000000000000000','Tr','10,28333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','167','Açaí, polpa, com xarope de guaraná e glucose','73,87866666666670000000','110,29759000000000000000','461,48511656000000000000','0,72083333333333300000','3,66033333333333000000','NA','21,45516666666670000000','1,72333333333333000000','0,28500000000000000000','22,15900000000000000000','12,72633333333330000000','3,28566666666667000000','10,79233333333330000000','0,26833333333333300000','15,09866666666670000000','75,49433333333330000000','0,13966666666666700000','0,19400000000000000000','NA','','','Tr','Tr','0,07333333333333340000','Tr','10,27000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','168','Açaí, polpa, congelada','88,70033333333330000000','58,04536887282130000000','242,86182336388400000000','0,79791666666666700000','3,94433333333333000000','NA','6,20841666666667000000','2,55333333333333000000','0,34900000000000000000','35,18000000000000000000','17,04000000000000000000','6,16000000000000000000','16,42833333333330000000','0,43233333333333300000','5,17700000000000000000','123,61666666666700000000','0,18266666666666700000','0,26533333333333300000','NA','','','Tr','0,04000000000000000000','0,07000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','169','Acerola, crua','90,53066666666670000000','33,46227000000000000000','140,00613768000000000000','0,90625000000000000000','0,20766666666666700000','NA','7,96641666666667000000','1,51133333333333000000','0,38900000000000000000','12,55233333333330000000','13,13333333333330000000','0,07266666666666670000','9,23700000000000000000','0,22200000000000000000','Tr','164,98866666666700000000','0,06700000000000000000','0,14533333333333300000','NA','247,00000000000000000000','123,50000000000000000000','Tr','0,04100000000000000000','Tr','1,38333333333333000000','941,36966666666700000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','170','Acerola, polpa, congelada','93,60966666666670000000','21,93680000000000000000','91,78357119999990000000','0,59166666666666700000','Tr','NA','5,54133333333333000000','0,70333333333333300000','0,25733333333333300000','7,59333333333333000000','8,65800000000000000000','0,03366666666666670000','12,85700000000000000000','0,16733333333333300000','1,28000000000000000000','111,98566666666700000000','0,03933333333333330000','0,07266666666666670000','NA','192,00000000000000000000','96,00000000000000000000','Tr','0,09600000000000000000','Tr','Tr','623,23933333333300000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','171','Ameixa, calda, enlatada ','52,17400000000000000000','182,84662000000000000000','765,03025808000000000000','0,40833333333333300000','Tr','NA','46,89266666666670000000','0,51700000000000000000','0,52500000000000000000','13,15100000000000000000','9,96433333333333000000','0,10333333333333300000','20,93700000000000000000','2,15333333333333000000','2,70433333333333000000','221,19300000000000000000','0,02700000000000000000','0,13633333333333300000','NA','','','Tr','0,23300000000000000000','0,37000000000000000000','Tr','4,26966666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','172','Ameixa, crua','84,77000000000000000000','52,54248260869560000000','219,83774723478300000000','0,77173913043478300000','Tr','NA','13,85159420289860000000','2,43333333333333000000','0,59666666666666700000','5,72000000000000000000','5,47666666666667000000','0,03000000000000000000','13,91666666666670000000','0,10333333333333300000','Tr','134,05333333333300000000','0,05666666666666670000','0,05000000000000000000','NA','27,20833333333330000000','13,60416666666670000000','0,07000000000000000000','Tr','0,03000000000000000000','Tr','7,63000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','173','Ameixa, em calda, enlatada, drenada ','50,33933333333330000000','177,35918531537100000000','742,07083135951000000000','1,02500000000000000000','0,28033333333333300000','NA','47,65800000000000000000','4,54666666666667000000','0,69733333333333300000','39,23700000000000000000','14,49100000000000000000','0,19733333333333300000','26,07366666666670000000','2,69766666666667000000','2,79033333333333000000','263,26133333333300000000','0,16066666666666700000','0,20133333333333300000','NA','','','Tr','0,22333333333333300000','0,08333333333333330000','Tr','5,15166666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','174','Atemóia, crua','72,73600000000000000000','96,97158744792140000000','405,72912188210300000000','0,97083333333333300000','0,30033333333333300000','NA','25,33216666666670000000','2,13533333333333000000','0,66066666666666700000','22,76600000000000000000','24,83533333333330000000','0,15933333333333300000','23,36466666666670000000','0,16416666666666700000','0,78500000000000000000','300,01266666666700000000','0,17300000000000000000','0,18766666666666700000','NA','','','0,09333333333333330000','0,07000000000000000000','0,07000000000000000000','1,58000000000000000000','10,14666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','175','Banana, da terra, crua','63,87666666666670000000','128,02445217391300000000','535,65430789565200000000','1,43478260869565000000','0,24000000000000000000','NA','33,66521739130440000000','1,52666666666667000000','0,78333333333333300000','4,15100000000000000000','23,78666666666670000000','0,16333333333333300000','25,51666666666670000000','0,29333333333333300000','Tr','328,03000000000000000000','0,05333333333333330000','0,16000000000000000000','NA','238,83333333333300000000','119,41666666666700000000','0,03000000000000000000','0,02000000000000000000','0,14000000000000000000','Tr','15,74666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','176','Banana, doce em barra','21,12600000000000000000','280,10519255063900000000','1171,96012563188000000000','2,16875000000000000000','0,05000000000000000000','NA','75,66658333333330000000','3,83333333333333000000','0,98866666666666700000','11,95033333333330000000','49,19400000000000000000','0,83933333333333300000','36,87600000000000000000','0,61300000000000000000','9,88233333333333000000','518,25000000000000000000','0,16466666666666700000','0,30200000000000000000','NA','27,35555555555560000000','13,67777777777780000000','0,03000000000000000000','Tr','0,05666666666666670000','1,41000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','177','Banana, figo, crua','70,07400000000000000000','105,08265000000000000000','439,66580760000000000000','1,13125000000000000000','0,14166666666666700000','NA','27,80441666666670000000','2,80000000000000000000','0,84866666666666600000','6,35633333333333000000','30,16133333333330000000','0,21366666666666700000','15,82166666666670000000','0,19800000000000000000','Tr','386,59166666666700000000','0,06400000000000000000','0,12266666666666700000','NA','','','0,09000000000000000000','Tr','0,03000000000000000000','Tr','17,49666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','178','Banana, maçã, crua','75,23000000000000000000','86,80533043478260000000','363,19350253913000000000','1,75362318840580000000','0,06000000000000000000','NA','22,33637681159420000000','2,59333333333333000000','0,62000000000000000000','3,22000000000000000000','23,68666666666670000000','0,59666666666666700000','28,68333333333330000000','0,20333333333333300000','Tr','264,38666666666700000000','0,11000000000000000000','0,12000000000000000000','NA','6,41666666666667000000','3,20833333333333000000','Tr','Tr','0,14333333333333300000','Tr','10,46666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','179','Banana, nanica, crua','73,79666666666670000000','91,52884782608700000000','382,95669930434800000000','1,39855072463768000000','0,11666666666666700000','NA','23,84811594202900000000','1,94666666666667000000','0,84000000000000000000','3,41666666666667000000','27,79666666666670000000','0,14000000000000000000','26,72000000000000000000','0,34666666666666700000','Tr','376,47000000000000000000','0,10333333333333300000','0,17666666666666700000','NA','13,62500000000000000000','6,81250000000000000000','Tr','0,02000000000000000000','0,14333333333333300000','Tr','5,86000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','180','Banana, ouro, crua','68,17666666666670000000','112,36604782608700000000','470,13954410434800000000','1,48188405797101000000','0,21000000000000000000','NA','29,34144927536230000000','1,95333333333333000000','0,79000000000000000000','3,18666666666667000000','28,38333333333330000000','0,09000000000000000000','22,27000000000000000000','0,33666666666666700000','Tr','354,81000000000000000000','0,07666666666666670000','0,25666666666666700000','NA','49,70833333333330000000','24,85416666666670000000','Tr','Tr','0,14333333333333300000','Tr','7,55666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','181','Banana, pacova, crua','77,71066666666670000000','77,90952792507410000000','325,97346483851000000000','1,22708333333333000000','0,07900000000000000000','NA','20,31258333333330000000','2,03033333333333000000','0,67066666666666700000','5,49033333333333000000','30,41233333333330000000','0,40733333333333300000','19,75300000000000000000','0,37466666666666700000','0,93866666666666700000','267,35000000000000000000','0,06433333333333330000','0,13533333333333300000','NA','','','0,05000000000000000000','0,03000000000000000000','0,17000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','182','Banana, prata, crua','71,86333333333330000000','98,24970217391310000000','411,07675389565200000000','1,26811594202899000000','0,06500000000000000000','NA','25,95688405797100000000','2,04333333333333000000','0,84666666666666700000','7,56333333333333000000','26,29000000000000000000','0,41666666666666700000','22,19666666666670000000','0,38000000000000000000','Tr','357,67666666666700000000','0,05333333333333330000','0,14666666666666700000','NA','32,41666666666670000000','16,20833333333330000000','Tr','0,02000000000000000000','0,10000000000000000000','Tr','21,59000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','183','Cacau, cru','79,20866666666670000000','74,29148000000000000000','310,83555232000000000000','0,95416666666666600000','0,14400000000000000000','NA','19,41116666666670000000','2,18900000000000000000','0,28200000000000000000','12,10466666666670000000','24,61633333333330000000','0,03500000000000000000','9,33733333333333000000','0,25833333333333300000','0,70033333333333300000','71,64400000000000000000','0,14666666666666700000','0,58766666666666700000','NA','','','0,24666666666666700000','Tr','0,04000000000000000000','Tr','13,56333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','184','Cajá-Manga, cru','86,89433333333330000000','45,58096877372270000000','190,71077334925600000000','1,27916666666667000000','Tr','NA','11,43416666666670000000','2,57533333333333000000','0,37800000000000000000','12,74400000000000000000','11,28400000000000000000','0,04966666666666670000','24,46966666666670000000','0,15433333333333300000','1,43866666666667000000','119,39900000000000000000','0,02433333333333330000','0,18100000000000000000','NA','','','0,11000000000000000000','Tr','0,05000000000000000000','Tr','26,69666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','185','Cajá, polpa, congelada','92,44366666666670000000','26,33226931105060000000','110,17421479743600000000','0,58958333333333300000','0,16766666666666700000','NA','6,37441666666666000000','1,36000000000000000000','0,42466666666666700000','9,16066666666667000000','7,17133333333333000000','0,07000000000000000000','25,65500000000000000000','0,32233333333333300000','6,94500000000000000000','148,07500000000000000000','0,09866666666666670000','0,05400000000000000000','NA','106,00000000000000000000','53,00000000000000000000','0,04000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','186','Caju, cru','88,11333000000000000000','43,06506852173910000000','180,18424669495600000000','0,97101449275362300000','0,33000000000000000000','NA','10,28898884057970000000','1,68000000000000000000','0,29666666666666700000','1,41666666666667000000','10,11000000000000000000','0,12000000000000000000','15,63666666666670000000','0,15333333333333300000','2,96666666666667000000','123,86000000000000000000','0,07333333333333340000','0,09000000000000000000','NA','14,66600000000000000000','7,33300000000000000000','Tr','Tr','Tr','Tr','219,33333333333300000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','187','Caju, polpa, congelada','89,81700000000000000000','36,56868000000000000000','153,00335712000000000000','0,48125000000000000000','0,15400000000000000000','NA','9,35074999999999000000','0,81466666666666700000','0,19700000000000000000','0,83933333333333300000','7,07166666666667000000','0,05366666666666670000','9,77333333333333000000','0,14666666666666700000','4,16166666666667000000','87,66333333333330000000','0,06666666666666670000','0,08366666666666670000','NA','22,00000000000000000000','11,00000000000000000000','Tr','0,02300000000000000000','Tr','2,24666666666667000000','119,71933333333300000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','188','Caju, suco concentrado, envasado','88,36866666666670000000','45,10862666666670000000','188,73449397333300000000','0,40416666666666700000','0,20000000000000000000','NA','10,73383333333330000000','0,62600000000000000000','0,29333333333333300000','0,97566666666666700000','8,44700000000000000000','0,06466666666666670000','11,40033333333330000000','0,14600000000000000000','45,04433333333330000000','106,98700000000000000000','0,03766666666666670000','0,06500000000000000000','NA','10,00000000000000000000','5,00000000000000000000','Tr','0,03200000000000000000','Tr','Tr','138,69533333333300000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','189','Caqui, chocolate, cru','79,72400000000000000000','71,35001811164620000000','298,52847577912800000000','0,35625000000000000000','0,06933333333333330000','NA','19,32575000000000000000','6,51766666666667000000','0,52466666666666700000','17,84833333333330000000','8,54733333333333000000','0,39000000000000000000','18,42966666666670000000','0,09900000000000000000','2,18333333333333000000','163,54633333333300000000','Tr','0,18700000000000000000','NA','','','Tr','Tr','0,03000000000000000000','Tr','29,61333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','190','Carambola, crua','87,09600000000000000000','45,74088879342870000000','191,37987871170600000000','0,87083333333333300000','0,17700000000000000000','NA','11,48150000000000000000','2,03133333333333000000','0,37466666666666700000','4,78833333333333000000','7,36100000000000000000','0,12633333333333300000','10,74900000000000000000','0,19833333333333300000','4,09466666666667000000','132,57633333333300000000','0,07733333333333330000','0,24000000000000000000','NA','','','0,11666666666666700000','Tr','Tr','Tr','60,86666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','191','Ciriguela, crua','78,68500000000000000000','75,59411000000000000000','316,28575624000000000000','1,39791666666667000000','0,35966666666666700000','NA','18,85741666666670000000','3,90200000000000000000','0,70000000000000000000','27,41400000000000000000','17,96333333333330000000','0,05666666666666670000','48,59933333333330000000','0,35733333333333300000','1,68233333333333000000','248,01466666666700000000','0,12433333333333300000','0,53133333333333300000','NA','','','0,14333333333333300000','Tr','Tr','Tr','27,02666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','192','Cupuaçu, cru','86,23066666666670000000','49,42255877437190000000','206,78398591197200000000','1,16041666666667000000','0,95133333333333300000','NA','10,43358333333330000000','3,11600000000000000000','1,22400000000000000000','13,12033333333330000000','18,17133333333330000000','0,06700000000000000000','21,28150000000000000000','0,48566666666666700000','3,19600000000000000000','331,03333333333300000000','0,07400000000000000000','0,33666666666666700000','NA','','','0,36633333333333300000','0,03660000000000000000','0,07333333333333340000','4,34333333333333000000','24,51300000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','193','Cupuaçu, polpa, congelada','86,55300000000000000000','48,79689000000000000000','204,16618776000000000000','0,84375000000000000000','0,59366666666666700000','NA','11,38691666666670000000','1,59100000000000000000','0,62266666666666700000','5,49066666666667000000','13,91133333333330000000','0,16966666666666700000','14,19633333333330000000','0,25900000000000000000','0,68900000000000000000','291,09233333333300000000','0,13966666666666700000','0,15100000000000000000','NA','','','0,06666666666666670000','0,07100000000000000000','0,05000000000000000000','Tr','10,48900000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','194','Figo, cru','88,18666666666670000000','41,44712608695650000000','173,41477554782600000000','0,96739130434782600000','0,15666666666666700000','NA','10,24594202898550000000','1,79333333333333000000','0,44333333333333300000','27,39000000000000000000','11,31000000000000000000','0,06000000000000000000','14,57000000000000000000','0,20333333333333300000','Tr','174,42000000000000000000','0,13000000000000000000','0,09000000000000000000','NA','','','0,05000000000000000000','Tr','Tr','Tr','0,79000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','195','Figo, enlatado, em calda','48,77000000000000000000','184,36071739130400000000','771,36524156521700000000','0,56159420289855100000','0,15000000000000000000','NA','50,33840579710150000000','1,97666666666667000000','0,18000000000000000000','32,61666666666670000000','6,85000000000000000000','0,16033333333333300000','6,25333333333333000000','0,50333333333333300000','6,87000000000000000000','39,35000000000000000000','0,25000000000000000000','0,09000000000000000000','NA','','','Tr','Tr','Tr','Tr','5,24333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','196','Fruta-pão, crua','80,86900000000000000000','67,04562000000000000000','280,51887408000000000000','1,08125000000000000000','0,18933333333333300000','NA','17,17441666666670000000','5,54533333333333000000','0,68600000000000000000','33,67566666666670000000','24,03300000000000000000','0,04400000000000000000','27,39366666666670000000','0,23066666666666700000','0,79933333333333300000','188,12633333333300000000','0,07166666666666670000','0,12600000000000000000','NA','','','0,03000000000000000000','Tr','Tr','Tr','9,86666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','197','Goiaba, branca, com casca, crua','85,69000000000000000000','51,73774782608700000000','216,47073690434800000000','0,89855072463768100000','0,48666666666666700000','NA','12,40144927536230000000','6,33000000000000000000','0,52333333333333300000','5,00733333333333000000','7,04333333333333000000','0,07333333333333340000','16,40333333333330000000','0,17000000000000000000','Tr','219,77000000000000000000','0,04333333333333330000','0,15666666666666700000','NA','','','Tr','Tr','0,02666666666666670000','Tr','99,19500000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','198','Goiaba, doce em pasta','24,78000000000000000000','268,95982608695700000000','1125,32791234783000000000','0,57971014492753600000','0,00000000000000000000','NA','74,12362318840580000000','3,73333333333333000000','0,51666666666666700000','10,06000000000000000000','6,48666666666667000000','0,10833333333333300000','53,57000000000000000000','0,40000000000000000000','3,70000000000000000000','164,80666666666700000000','0,06000000000000000000','0,09000000000000000000','NA','136,41666666666700000000','68,20833333333330000000','0,07000000000000000000','Tr','Tr','Tr','23,05666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','199','Goiaba, doce, cascão','20,26066666666670000000','285,58779243900400000000','1194,89932356479000000000','0,41458333333333300000','0,10333333333333300000','NA','78,70275000000000000000','4,36666666666667000000','0,51866666666666700000','14,69900000000000000000','9,66833333333334000000','0,15866666666666700000','28,20433333333330000000','0,40233333333333300000','11,02933333333330000000','250,72333333333300000000','0,07866666666666670000','0,14000000000000000000','NA','50,33333333333330000000','25,16666666666670000000','Tr','Tr','Tr','1,40666666666667000000','34,32666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','200','Goiaba, vermelha, com casca, crua','84,98000000000000000000','54,16993043478260000000','226,64698893913000000000','1,08695652173913000000','0,44000000000000000000','NA','13,00971014492750000000','6,22333333333333000000','0,48333333333333300000','4,45133333333333000000','6,89333333333333000000','0,09000000000000000000','15,37000000000000000000','0,17000000000000000000','Tr','197,58000000000000000000','0,04000000000000000000','0,13000000000000000000','NA','38,00000000000000000000','19,00000000000000000000','Tr','Tr','0,03000000000000000000','Tr','80,60166666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','201','Graviola, crua','82,15333333333330000000','61,62189837666360000000','257,82602280796000000000','0,84583333333333300000','0,21000000000000000000','NA','15,83950000000000000000','1,90900000000000000000','0,95133333333333300000','40,11800000000000000000','23,49933333333330000000','0,08466666666666670000','19,16900000000000000000','0,16966666666666700000','4,16000000000000000000','249,66566666666700000000','0,03933333333333330000','0,12600000000000000000','NA','','','0,16800000000000000000','0,12433333333333300000','0,03333333333333330000','Tr','19,13733333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','202','Graviola, polpa, congelada','89,16300000000000000000','38,27387000000000000000','160,13787208000000000000','0,56666666666666700000','0,13766666666666700000','NA','9,78266666666666000000','1,18766666666667000000','0,35000000000000000000','5,97866666666667000000','9,76000000000000000000','0,05600000000000000000','16,58833333333330000000','0,10266666666666700000','3,04633333333333000000','169,95666666666700000000','0,06166666666666670000','0,05366666666666670000','NA','','','Tr','0,09366666666666670000','Tr','Tr','10,47533333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','203','Jabuticaba, crua','83,64666666666670000000','58,05315000000000000000','242,89437960000000000000','0,61250000000000000000','0,12833333333333300000','NA','15,25583333333330000000','2,29900000000000000000','0,35666666666666700000','8,34800000000000000000','17,77966666666670000000','0,29700000000000000000','14,54966666666670000000','0,09466666666666670000','Tr','129,72433333333300000000','0,07166666666666670000','0,28333333333333300000','NA','','','0,06000000000000000000','Tr','Tr','Tr','16,17000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','204','Jaca, crua','75,07433333333330000000','87,92035000000000000000','367,85874440000000000000','1,40208333333333000000','0,26500000000000000000','NA','22,49758333333330000000','2,38600000000000000000','0,76100000000000000000','11,24500000000000000000','40,05233333333330000000','0,48466666666666700000','13,89933333333330000000','0,38266666666666700000','1,80166666666667000000','233,75233333333300000000','0,09333333333333330000','0,16666666666666700000','NA','','','0,10000000000000000000','0,03666666666666670000','0,04666666666666670000','Tr','14,81666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','205','Jambo, cru','92,10100000000000000000','26,91230000000000000000','112,60106320000000000000','0,88541666666666700000','0,06666666666666670000','NA','6,49425000000000000000','5,07433333333333000000','0,45266666666666700000','13,80000000000000000000','14,17833333333330000000','0,05233333333333330000','18,35833333333330000000','0,13666666666666700000','21,65600000000000000000','134,86900000000000000000','0,02233333333333330000','0,11400000000000000000','NA','','','0,07666666666666670000','Tr','Tr','1,18000000000000000000','3,77333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','206','Jamelão, cru','87,67433333333330000000','41,00970891670390000000','171,58462210748900000000','0,54583333333333300000','0,10966666666666700000','NA','10,62716666666670000000','1,77666666666667000000','1,04300000000000000000','3,09000000000000000000','2,16466666666667000000','Tr','4,11733333333333000000','0,04766666666666670000','1,36633333333333000000','394,34333333333300000000','0,03166666666666670000','0,04900000000000000000','NA','7,51944444444444000000','3,75972222222222000000','0,16666666666666700000','Tr','0,11666666666666700000','Tr','27,07000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','207','Kiwi, cru','85,87666666666670000000','51,13633043478260000000','213,95440653913100000000','1,33695652173913000000','0,62666666666666700000','NA','11,49971014492750000000','2,65333333333333000000','0,66000000000000000000','23,91333333333330000000','10,57666666666670000000','0,05333333333333330000','33,07666666666670000000','0,25333333333333300000','Tr','268,92333333333300000000','0,15000000000000000000','0,07000000000000000000','NA','5,41666666666667000000','2,70833333333333000000','Tr','Tr','0,06000000000000000000','Tr','70,77666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','208','Laranja, baía, crua','87,08000000000000000000','45,43811739130430000000','190,11308316521700000000','0,97826086956521700000','0,10333333333333300000','NA','11,46840579710150000000','1,12333333333333000000','0,37000000000000000000','35,40700000000000000000','9,21666666666667000000','0,04000000000000000000','23,80333333333330000000','0,13666666666666700000','Tr','174,14666666666700000000','0,04000000000000000000','0,06000000000000000000','NA','3,87500000000000000000','1,93750000000000000000','0,06333333333333330000','0,02000000000000000000','Tr','Tr','56,87000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','209','Laranja, baía, suco','90,24666666666670000000','36,64948260869560000000','153,34143523478200000000','0,65217391304347800000','Tr','NA','8,69782608695652000000','Tr','0,36000000000000000000','5,92666666666667000000','7,80000000000000000000','0,01666666666666670000','21,93000000000000000000','0,06333333333333330000','Tr','172,56000000000000000000','0,02000000000000000000','Tr','NA','4,00000000000000000000','2,00000000000000000000','0,02666666666666670000','Tr','0,02000000000000000000','Tr','94,48333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','210','Laranja, da terra, crua','85,37933333333340000000','51,47112863928080000000','215,35520222675100000000','1,07708333333333000000','0,18566666666666700000','NA','12,86058333333330000000','3,97700000000000000000','0,49733333333333300000','51,08233333333330000000','14,05666666666670000000','0,04100000000000000000','20,11566666666670000000','0,14666666666666700000','0,83000000000000000000','172,52000000000000000000','0,03766666666666670000','0,21833333333333300000','NA','','','0,07333333333333330000','0,09100000000000000000','0,03333333333333330000','Tr','34,67966666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','211','Laranja, da terra, suco','89,22000000000000000000','40,95600731086730000000','171,35993458866900000000','0,66666666666666700000','0,14200000000000000000','NA','9,57333333333334000000','1,03100000000000000000','0,39800000000000000000','13,38833333333330000000','10,10933333333330000000','0,02233333333333330000','14,88600000000000000000','0,08600000000000000000','Tr','145,24133333333300000000','0,02166666666666670000','0,07366666666666670000','NA','4,45833333333333000000','2,22916666666667000000','0,04000000000000000000','Tr','0,03666666666666670000','Tr','44,32000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','212','Laranja, lima, crua','86,97400000000000000000','45,70103878062960000000','191,21314625815400000000','1,05625000000000000000','0,07533333333333330000','NA','11,53375000000000000000','1,78200000000000000000','0,36066666666666700000','31,46666666666670000000','10,15766666666670000000','0,05133333333333330000','14,51033333333330000000','0,12000000000000000000','1,11100000000000000000','129,87000000000000000000','0,03200000000000000000','0,11700000000000000000','NA','','','0,09400000000000000000','0,05433333333333330000','0,04000000000000000000','Tr','43,45566666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','213','Laranja, lima, suco','89,68066666666670000000','39,33609394413240000000','164,58221706225000000000','0,71458333333333300000','0,11933333333333300000','NA','9,16741666666668000000','0,42400000000000000000','0,31800000000000000000','7,73633333333333000000','10,89266666666670000000','0,02066666666666670000','16,24366666666670000000','Tr','Tr','128,74466666666700000000','0,02300000000000000000','0,02933333333333330000','NA','','','0,10233000000000000000','0,03333000000000000000','0,04333333333333330000','Tr','41,30330000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','214','Laranja, pêra, crua','89,55000000000000000000','36,77376521739130000000','153,86143366956500000000','1,04347826086957000000','0,12666666666666700000','NA','8,94652173913044000000','0,76666666666666700000','0,33333333333333300000','21,88600000000000000000','8,61333333333333000000','0,05000000000000000000','22,68333333333330000000','0,09000000000000000000','Tr','162,82000000000000000000','0,03000000000000000000','0,06000000000000000000','NA','0,91666666666666700000','0,45833333333333300000','0,06666666666666670000','0,02000000000000000000','0,02000000000000000000','Tr','53,73333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','215','Laranja, pêra, suco','91,29333333333330000000','32,70975362318840000000','136,85760915942000000000','0,73913043478260900000','0,07333333333333330000','NA','7,55420289855072000000','Tr','0,34000000000000000000','7,36666666666667000000','7,58666666666667000000','0,03000000000000000000','14,01000000000000000000','Tr','Tr','148,75666666666700000000','0,01000000000000000000','Tr','NA','1,20833333333333000000','0,60416666666666700000','Tr','Tr','Tr','Tr','73,33666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','216','Laranja, valência, crua','86,94133333333330000000','46,10962878338500000000','192,92268682968300000000','0,76666666666666700000','0,15900000000000000000','NA','11,72300000000000000000','1,72766666666667000000','0,41000000000000000000','33,73600000000000000000','14,40266666666670000000','0,05600000000000000000','19,76600000000000000000','0,09100000000000000000','0,62900000000000000000','157,90333333333300000000','0,04233333333333330000','0,11200000000000000000','NA','','','0,06866666666666670000','0,03600000000000000000','0,03000000000000000000','Tr','47,84566666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','217','Laranja, valência, suco','90,53033333333330000000','36,19635058768590000000','151,44553085887800000000','0,48333333333333300000','0,12433333333333300000','NA','8,55400000000000000000','0,42200000000000000000','0,30800000000000000000','9,07633333333333000000','9,59266666666667000000','0,02933333333333330000','17,26533333333330000000','Tr','Tr','143,41800000000000000000','0,01966666666666670000','Tr','NA','2,00000000000000000000','1,00000000000000000000','*','*','0,03000000000000000000','Tr','*','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','218','Limão, cravo, suco','94,18900000000000000000','14,10373339931170000000','59,01002054272010000000','0,32500000000000000000','Tr','NA','5,24666666666666000000','Tr','0,23933333333333300000','10,18366666666670000000','8,85766666666667000000','0,03266666666666670000','11,13166666666670000000','0,07900000000000000000','Tr','119,87933333333300000000','0,02566666666666670000','','NA','31,41666666666670000000','15,70833333333330000000','Tr','Tr','Tr','Tr','32,78000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','219','Limão, galego, suco','91,79666666666670000000','22,22504347826090000000','92,98958191304360000000','0,56521739130434800000','0,06666666666666670000','NA','7,32144927536232000000','Tr','0,25000000000000000000','5,26333333333333000000','5,92000000000000000000','0,01000000000000000000','13,04000000000000000000','0,05333333333333330000','Tr','112,51000000000000000000','0,02000000000000000000','0,05333333333333330000','NA','','','Tr','Tr','0,03000000000000000000','Tr','34,49666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','220','Limão, tahiti, cru','87,42733333333330000000','31,81815343016390000000','133,12715395180600000000','0,93958333333333300000','0,14000000000000000000','NA','11,08441666666670000000','1,18166666666667000000','0,40866666666666700000','50,98366666666670000000','9,69600000000000000000','0,07233333333333330000','23,76133333333330000000','0,17966666666666700000','1,24833333333333000000','128,29333333333300000000','0,05833333333333330000','0,21100000000000000000','NA','','','0,30300000000000000000','0,03733333333333330000','Tr','Tr','38,23600000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','221','Maçã, Argentina, com casca, crua','82,64900000000000000000','62,53181836628910000000','261,63312804455400000000','0,22500000000000000000','0,24600000000000000000','NA','16,58800000000000000000','2,02633333333333000000','0,29200000000000000000','3,39233333333333000000','4,85766666666667000000','0,01200000000000000000','11,40366666666670000000','0,05333333333333330000','1,31800000000000000000','117,47700000000000000000','0,03100000000000000000','Tr','NA','','','0,05000000000000000000','Tr','Tr','Tr','1,48666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','222','Maçã, Fuji, com casca, crua','84,33666666666670000000','55,51520000000010000000','232,27559680000000000000','0,28666666666666700000','Tr','NA','15,15333333333330000000','1,34666666666667000000','0,22333333333333300000','1,92333333333333000000','2,04000000000000000000','0,03333333333333330000','9,07666666666667000000','0,09333333333333330000','Tr','74,71333333333330000000','0,06000000000000000000','Tr','NA','3,50000000000000000000','1,75000000000000000000','Tr','Tr','0,03000000000000000000','Tr','2,40666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','223','Macaúba, crua','41,52666666666670000000','404,28187666666700000000','1691,51537197333000000000','2,08290000000000000000','40,65666666666670000000','NA','13,94543333333330000000','13,44350000000000000000','1,78833333333333000000','66,53233333333330000000','66,05333333333330000000','0,07500000000000000000','43,86766666666670000000','0,80800000000000000000','0,65433333333333300000','305,81300000000000000000','0,35300000000000000000','0,66433333333333300000','NA','1020,00000000000000000000','510,00000000000000000000','0,11333333333333300000','0,11333333333333300000','0,03000000000000000000','Tr','13,44350000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','224',' Mamão, doce em calda, drenado','45,52900000000000000000','195,62747482178600000000','818,50535465435300000000','0,19375000000000000000','0,06733333333333330000','NA','54,00358333333330000000','1,31333333333333000000','0,20633333333333300000','20,01266666666670000000','5,81433333333333000000','0,02000000000000000000','4,48133333333333000000','0,10766666666666700000','2,91433333333333000000','68,23566666666670000000','0,01900000000000000000','0,06566666666666670000','NA','','','0,03000000000000000000','Tr','Tr','Tr','3,90000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','225','Mamão, Formosa, cru','86,92666666666670000000','45,34074782608690000000','189,70568890434800000000','0,81521739130434800000','0,12000000000000000000','NA','11,55478260869560000000','1,81333333333333000000','0,58333333333333300000','24,87333333333330000000','17,32333333333330000000','0,04000000000000000000','10,85666666666670000000','0,23333333333333300000','3,25666666666667000000','221,80333333333300000000','1,36000000000000000000','0,07000000000000000000','NA','148,00000000000000000000','74,00000000000000000000','0,03000000000000000000','0,03000000000000000000','Tr','Tr','78,52666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','226','Mamão, Papaia, cru','88,58300000000000000000','40,15676894229660000000','168,01592125456900000000','0,45625000000000000000','0,12433333333333300000','NA','10,43975000000000000000','1,04266666666667000000','0,39666666666666700000','22,41833333333330000000','22,17600000000000000000','0,01300000000000000000','10,66933333333330000000','0,19333333333333300000','1,63033333333333000000','126,14666666666700000000','0,02166666666666670000','0,07100000000000000000','NA','118,00000000000000000000','59,00000000000000000000','0,03433333333333330000','0,04333333333333330000','Tr','1,03333333333333000000','82,20666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','227',' Mamão verde, doce em calda, drenado','41,88066666666670000000','209,37625445890400000000','876,03024865605600000000','0,31666666666666700000','0,09800000000000000000','NA','57,63666666666670000000','1,23333333333333000000','0,06800000000000000000','12,43500000000000000000','4,54266666666667000000','0,03866666666666670000','3,23166666666667000000','0,15400000000000000000','4,74000000000000000000','8,67033333333333000000','0,01500000000000000000','0,02100000000000000000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','228','Manga, Haden, crua','82,28766666666670000000','63,50031833879150000000','265,68533192950400000000','0,40833333333333300000','0,25600000000000000000','NA','16,66266666666670000000','1,58200000000000000000','0,38533333333333300000','11,65966666666670000000','7,81533333333333000000','0,17333333333333300000','9,29600000000000000000','0,09600000000000000000','0,55133333333333300000','147,88333333333300000000','0,10266666666666700000','0,06633333333333330000','NA','162,00000000000000000000','81,00000000000000000000','0,01933333333333330000','0,06033333333333330000','0,05000000000000000000','Tr','17,41300000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','229','Manga, Palmer, crua','79,73566666666670000000','72,48673809168730000000','303,28451217562000000000','0,41041666666666700000','0,17200000000000000000','NA','19,35225000000000000000','1,63333333333333000000','0,32966666666666700000','11,63833333333330000000','8,72500000000000000000','0,04666666666666670000','14,01433333333330000000','0,09133333333333330000','1,86366666666667000000','156,53000000000000000000','0,08766666666666670000','0,08700000000000000000','NA','786,91666666666700000000','393,45833333333300000000','0,08666666666666670000','0,03000000000000000000','Tr','Tr','65,52333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','230','Manga, polpa, congelada','86,49833333333330000000','48,30588000000000000000','202,11180192000000000000','0,38125000000000000000','0,23400000000000000000','NA','12,51841666666670000000','1,07000000000000000000','0,36800000000000000000','7,12100000000000000000','9,49400000000000000000','0,11933333333333300000','9,11133333333333000000','0,08933333333333330000','6,73333333333333000000','131,37433333333300000000','0,05900000000000000000','0,06500000000000000000','NA','','','Tr','0,06600000000000000000','0,03000000000000000000','Tr','24,90233333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','231','Manga, Tommy Atkins, crua','85,81333333333340000000','50,69218260869560000000','212,09609203478300000000','0,85507246376811600000','0,22000000000000000000','NA','12,77159420289850000000','2,06666666666667000000','0,34000000000000000000','7,63666666666667000000','7,39666666666667000000','0,34000000000000000000','13,77666666666670000000','0,08000000000000000000','Tr','138,36666666666700000000','0,06000000000000000000','0,08000000000000000000','NA','118,00000000000000000000','59,00000000000000000000','Tr','0,04000000000000000000','0,03000000000000000000','Tr','7,93666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','232','Maracujá, cru','82,85333333333330000000','68,43950869565210000000','286,35090438260900000000','1,98913043478261000000','2,10333333333333000000','NA','12,26420289855070000000','1,13666666666667000000','0,79000000000000000000','5,39333333333333000000','27,96666666666670000000','0,12000000000000000000','50,69000000000000000000','0,56000000000000000000','1,58000000000000000000','338,42000000000000000000','0,18666666666666700000','0,39333333333333300000','NA','114,00000000000000000000','57,00000000000000000000','Tr','0,05000000000000000000','0,04666666666666670000','Tr','19,84000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','233','Maracujá, polpa, congelada','88,89533333333330000000','38,75970000000000000000','162,17058480000000000000','0,81250000000000000000','0,17666666666666700000','NA','9,59749999999999000000','0,50600000000000000000','0,51800000000000000000','4,60966666666667000000','9,70100000000000000000','0,07000000000000000000','15,25733333333330000000','0,29233333333333300000','8,09600000000000000000','227,90966666666700000000','0,05033333333333330000','0,18800000000000000000','NA','','','Tr','0,09066666666666670000','0,06000000000000000000','Tr','7,25700000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','234','Maracujá, suco concentrado, envasado','88,94200000000000000000','41,96732000000000000000','175,59126688000000000000','0,76666666666666700000','0,19333333333333300000','NA','9,63599999999999000000','0,35366666666666700000','0,46200000000000000000','4,15833333333333000000','4,15833333333333000000','0,07166666666666670000','13,90233333333330000000','0,34500000000000000000','21,69233333333330000000','200,69533333333300000000','0,05233333333333330000','0,13600000000000000000','NA','','','Tr','0,07833333333333330000','0,05000000000000000000','1,91666666666667000000','13,67933333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','235','Melancia, crua','90,66666666666670000000','32,60662608695650000000','136,42612354782600000000','0,88405797101449300000','Tr','NA','8,13927536231884000000','0,12333333333333300000','0,27000000000000000000','7,72000000000000000000','9,63000000000000000000','0,14000000000000000000','12,17666666666670000000','0,22666666666666700000','Tr','104,02666666666700000000','0,04000000000000000000','0,09666666666666670000','NA','61,00000000000000000000','30,50000000000000000000','Tr','Tr','Tr','Tr','6,14666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','236','Melão, cru','91,28000000000000000000','29,36939130434780000000','122,88153321739100000000','0,67753623188405800000','Tr','NA','7,52579710144927000000','0,25000000000000000000','0,51666666666666700000','2,85666666666667000000','5,95000000000000000000','0,04666666666666670000','10,14000000000000000000','0,23000000000000000000','11,16666666666670000000','216,00000000000000000000','0,04333333333333330000','0,09000000000000000000','NA','2,00000000000000000000','1,00000000000000000000','Tr','Tr','0,02000000000000000000','Tr','8,68000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','237','Mexerica, Murcote, crua','83,65200000000000000000','57,59277847464880000000','240,96818513793000000000','0,88333333333333300000','0,13400000000000000000','NA','14,86200000000000000000','3,07333333333333000000','0,46866666666666700000','33,07000000000000000000','12,30366666666670000000','0,05433333333333330000','19,49800000000000000000','0,06933333333333330000','1,16733333333333000000','158,53833333333300000000','0,06000000000000000000','0,10200000000000000000','NA','','','0,07900000000000000000','0,07366666666666670000','0,05000000000000000000','Tr','21,79566666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','238','Mexerica, Rio, crua','89,56933333333330000000','36,87135000000010000000','154,26972840000000000000','0,65000000000000000000','0,12833333333333300000','NA','9,33700000000001000000','2,73166666666667000000','0,31533333333333300000','17,18366666666670000000','8,21200000000000000000','0,04500000000000000000','13,70200000000000000000','0,08933333333333330000','1,82400000000000000000','124,98666666666700000000','0,07266666666666670000','0,15466666666666700000','NA','','','0,03333333333333330000','Tr','Tr','Tr','111,97000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','239','Morango, cru','91,52666666666670000000','30,14791739130440000000','126,13888636521700000000','0,89492753623188400000','0,31000000000000000000','NA','6,81840579710146000000','1,72333333333333000000','0,45000000000000000000','10,90000000000000000000','9,67333333333333000000','0,32666666666666700000','22,43333333333330000000','0,32000000000000000000','Tr','184,39666666666700000000','0,06000000000000000000','0,17666666666666700000','NA','','','Tr','0,03000000000000000000','0,03000000000000000000','Tr','63,59666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','240','Nêspera, crua','87,76433333333330000000','42,53919886819520000000','177,98400806452900000000','0,30833333333333300000','Tr','NA','11,52866666666670000000','2,95800000000000000000','0,39866666666666700000','19,68666666666670000000','9,72066666666667000000','0,07200000000000000000','10,07566666666670000000','0,14666666666666700000','Tr','112,85000000000000000000','0,12200000000000000000','0,12133333333333300000','NA','170,00000000000000000000','85,00000000000000000000','Tr','Tr','Tr','Tr','3,15666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','241','Pequi, cru','65,88866666666670000000','204,96677000000000000000','857,58096568000000000000','2,33541666666667000000','17,97100000000000000000','NA','12,97291666666670000000','19,04100000000000000000','0,83200000000000000000','32,44100000000000000000','29,77333333333330000000','0,63800000000000000000','33,74866666666670000000','0,27366666666666700000','Tr','297,79366666666700000000','0,20766666666666700000','0,95900000000000000000','NA','60,00000000000000000000','30,00000000000000000000','0,17000000000000000000','0,48000000000000000000','0,06333333333333330000','2,57333333333333000000','8,28333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','242','Pêra, Park, crua','83,18633333333330000000','60,58859000000000000000','253,50266056000000000000','0,23541666666666700000','0,23033333333333300000','NA','16,07491666666670000000','2,98266666666667000000','0,27300000000000000000','8,71200000000000000000','6,12400000000000000000','0,03533333333333330000','11,70700000000000000000','0,32133333333333300000','0,98166666666666700000','102,22333333333300000000','0,07833333333333330000','0,07266666666666670000','NA','','','0,06000000000000000000','Tr','Tr','Tr','2,36000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','243','Pêra, Williams, crua','85,03333333333330000000','53,30904782608690000000','223,04505610434800000000','0,56521739130434800000','0,11000000000000000000','NA','14,02478260869560000000','3,01333333333333000000','0,26666666666666700000','8,27666666666667000000','5,78000000000000000000','0,04000000000000000000','11,76666666666670000000','0,09333333333333330000','Tr','115,86666666666700000000','0,07000000000000000000','0,08000000000000000000','NA',' ',' ','Tr','Tr','Tr','Tr','2,83333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','244','Pêssego, Aurora, cru','89,32133333333330000000','36,32759902453420000000','151,99467431865100000000','0,82500000000000000000','Tr','NA','9,32100000000001000000','1,42166666666667000000','0,53266666666666700000','3,23233333333333000000','4,43766666666667000000','0,05400000000000000000','15,44200000000000000000','0,22366666666666700000','Tr','123,78766666666700000000','0,01900000000000000000','0,05700000000000000000','NA','','','0,05000000000000000000','Tr','Tr','Tr','3,25333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','245','Pêssego, enlatado, em calda','82,18666666666670000000','63,14243478260870000000','264,18794713043500000000','0,70652173913043500000','Tr','NA','16,88014492753620000000','1,01666666666667000000','0,22666666666666700000','4,09666666666667000000','4,03833333333333000000','0,02833333333333330000','8,81033333333333000000','0,60333333333333300000','3,20100000000000000000','94,71666666666670000000','0,03933333333333330000','0,09166666666666670000','NA','47,54166666666670000000','23,77083333333330000000','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','246','Pinha, crua','75,04966666666670000000','88,47352766686680000000','370,17323975817100000000','1,48541666666667000000','0,31900000000000000000','NA','22,44791666666670000000','3,35600000000000000000','0,69800000000000000000','20,88033333333330000000','30,53866666666670000000','0,14533333333333300000','34,39533333333330000000','0,21366666666666700000','1,33733333333333000000','283,04700000000000000000','0,10733333333333300000','0,24233333333333300000','NA','','','0,12000000000000000000','0,04333333333333330000','0,08666666666666670000','Tr','35,90333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','247','Pitanga, crua','88,29300000000000000000','41,41553000000000000000','173,28257752000000000000','0,92916666666666600000','0,16900000000000000000','NA','10,24416666666670000000','3,23733333333333000000','0,36466666666666700000','17,87900000000000000000','12,22533333333330000000','0,35833333333333300000','13,14300000000000000000','0,39633333333333300000','1,70400000000000000000','113,43900000000000000000','0,08433333333333330000','0,35200000000000000000','NA','154,00000000000000000000','77,00000000000000000000','0,02600000000000000000','0,09733333333333330000','Tr','Tr','24,87000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','248','Pitanga, polpa, congelada','94,57200000000000000000','19,10545950235920000000','79,93724255787100000000','0,28541666666666700000','0,12133333333333300000','NA','4,75858333333333000000','0,73666666666666700000','0,26266666666666700000','7,79500000000000000000','6,20300000000000000000','0,05300000000000000000','12,21833333333330000000','0,37233333333333300000','5,02900000000000000000','87,30866666666670000000','0,05900000000000000000','0,08733333333333330000','NA','145,54166666666700000000','72,77083333333330000000','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','249','Romã, crua','83,98666666666670000000','55,73900000000000000000','233,21197600000000000000','0,40416666666666700000','Tr','NA','15,10583333333330000000','0,43866666666666700000','0,50333333333333300000','4,75400000000000000000','12,70200000000000000000','0,13200000000000000000','40,26700000000000000000','0,25700000000000000000','0,59133333333333300000','484,57066666666700000000','0,18733333333333300000','0,67000000000000000000','NA','','','0,11833333333333300000','0,16926666666666700000','0,05000000000000000000','Tr','8,12333333333334000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','250','Tamarindo, cru','21,95000000000000000000','275,69564269441400000000','1153,51056903343000000000','3,20625000000000000000','0,45500000000000000000','NA','72,53175000000000000000','6,44666666666667000000','1,85700000000000000000','37,10433333333330000000','59,10900000000000000000','0,33533333333333300000','54,59166666666670000000','0,55333333333333300000','0,35533333333333300000','722,99266666666700000000','0,29466666666666700000','0,67300000000000000000','NA','','','0,31000000000000000000','Tr','0,10333333333333300000','Tr','7,24666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','251','Tangerina, Poncã, crua','89,22333333333330000000','37,83059999999990000000','158,21512215652200000000','0,84782608695652200000','0,07333333333333340000','NA','9,60999999999999000000','0,94000000000000000000','0,31333333333333300000','12,89000000000000000000','7,73333333333333000000','0,04000000000000000000','12,45333333333330000000','0,11333333333333300000','Tr','131,44333333333300000000','0,03000000000000000000','Tr','NA','47,37500000000000000000','23,68750000000000000000','0,06000000000000000000','0,02000000000000000000','0,02000000000000000000','Tr','48,81666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','252','Tangerina, Poncã, suco','90,44000000000000000000','36,10880000000000000000','150,98142274782600000000','0,52173913043478300000','Tr','NA','8,80000000000000000000','Tr','0,28000000000000000000','4,28333333333333000000','6,46000000000000000000','0,02000000000000000000','9,02000000000000000000','Tr','Tr','119,00333333333300000000','0,02000000000000000000','Tr','NA','51,16666666666670000000','25,58333333333330000000','0,06333333333333330000','Tr','0,03000000000000000000','Tr','41,75000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','253','Tucumã, cru','51,26033333333330000000','262,01519507239300000000','1096,27157618289000000000','2,09375000000000000000','19,07666666666670000000','NA','26,47458333333330000000','12,65333333333330000000','1,09466666666667000000','46,33833333333330000000','121,01133333333300000000','0,54866666666666700000','52,54866666666670000000','0,56600000000000000000','3,89300000000000000000','401,16966666666700000000','0,38966666666666700000','0,87366666666666700000','NA','2362,63888888889000000000','1181,31944444444000000000','0,03666666666666670000','Tr','0,11000000000000000000','Tr','17,99333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','254','Umbu, cru','89,25000000000000000000','37,01669000000000000000','154,87783096000000000000','0,84166666666666700000','Tr','NA','9,39533333333333000000','1,98200000000000000000','0,46933333333333300000','11,56100000000000000000','11,34900000000000000000','0,03300000000000000000','13,37500000000000000000','0,09200000000000000000','Tr','151,83233333333300000000','0,04066666666666670000','0,42166666666666700000','NA','','','0,05000000000000000000','0,05633333333333330000','0,03000000000000000000','Tr','24,05533333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','255','Umbu, polpa, congelada','90,18500000000000000000','33,94329000000000000000','142,01872536000000000000','0,51250000000000000000','0,07033333333333330000','NA','8,78683333333333000000','1,33633333333333000000','0,44533333333333300000','10,71033333333330000000','8,12100000000000000000','0,04866666666666670000','12,67700000000000000000','0,20900000000000000000','5,77100000000000000000','153,88433333333300000000','0,04300000000000000000','0,07266666666666670000','NA','','','Tr','0,06466666666666670000','Tr','Tr','3,95333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','256','Uva, Itália, crua','84,96666666666670000000','52,87310000000010000000','221,16109186087000000000','0,74637681159420300000','0,20333333333333300000','NA','13,57333333333330000000','0,92000000000000000000','0,57000000000000000000','6,66000000000000000000','4,98333333333333000000','0,12666666666666700000','12,11666666666670000000','0,14000000000000000000','Tr','161,93666666666700000000','0,10666666666666700000','Tr','NA','5,33333333333333000000','2,66666666666667000000','Tr','Tr','0,03000000000000000000','Tr','3,29333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','257','Uva, Rubi, crua','86,08400000000000000000','49,06129000000000000000','205,27243736000000000000','0,60833333333333300000','0,15700000000000000000','NA','12,69533333333330000000','0,93366666666666600000','0,45533333333333300000','7,61566666666667000000','5,82733333333333000000','0,07166666666666670000','22,78566666666670000000','0,17066666666666700000','7,91900000000000000000','158,89333333333300000000','0,04700000000000000000','Tr','NA','','','0,01700000000000000000','0,02200000000000000000','Tr','Tr','1,86300000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Frutas e derivados','258','Uva, suco concentrado, envasado','85,12966666666670000000','57,65536000000000000000','241,23002624000000000000','Tr','Tr','NA','14,70800000000000000000','0,23333333333333300000','0,16233333333333300000','9,31700000000000000000','7,05800000000000000000','0,19666666666666700000','10,02166666666670000000','0,12400000000000000000','9,58333333333333000000','53,72633333333330000000','0,13000000000000000000','0,05400000000000000000','NA','','','0,07166666666666670000','0,01700000000000000000','0,05000000000000000000','Tr','20,96766666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','259','Azeite, de dendê','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','260','Azeite, de oliva, extra virgem','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','261','Manteiga, com sal','15,78733333333330000000','725,96892684599900000000','3037,45398992366000000000','0,41470000743866000000','82,36100000000000000000','200,55000000000000000000','0,06329999256133290000','NA','1,37366666666667000000','9,42300000000000000000','1,46733333333333000000','Tr','27,70033333333330000000','0,15400000000000000000','578,69466666666700000000','14,78300000000000000000','Tr','Tr','923,54500000000000000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','262','Manteiga, sem sal','13,62733333333330000000','757,54046072599700000000','3169,54928767757000000000','0,39556000709533700000','86,03933333333330000000','213,95166666666700000000','0,00000000000000000000','NA','0,05000000000000000000','3,60800000000000000000','1,42900000000000000000','Tr','7,07166666666667000000','Tr','3,84866666666667000000','5,19833333333333000000','0,04133333333333330000','Tr','1013,09000000000000000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','263','Margarina, com óleo hidrogenado, com sal (65% de lipídeos)','32,23133333333330000000','596,11951695632900000000','2494,16405894528000000000','Tr','67,43433333333330000000','NA','0,00000000000000000000','NA','1,94233333333333000000','5,55600000000000000000','1,13066666666667000000','Tr','7,25800000000000000000','0,08733333333333330000','894,03866666666700000000','21,41966666666670000000','Tr','Tr','462,12333333333300000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','264','Margarina, com óleo hidrogenado, sem sal (80% de lipídeos)','19,58566666666670000000','722,52562580490100000000','3023,04721836771000000000','Tr','81,73366666666660000000','NA','0,00000000000000000000','NA','0,16066666666666700000','2,59700000000000000000','0,54300000000000000000','Tr','3,74900000000000000000','0,05266666666666670000','77,89100000000000000000','1,76966666666667000000','Tr','Tr','534,37666666666700000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','265','Margarina, com óleo interesterificado, com sal (65%de lipídeos)','31,96900000000000000000','594,45169333333300000000','2487,18588490667000000000','Tr','67,24566666666670000000','NA','0,00000000000000000000','NA','1,24966666666667000000','4,54333333333333000000','1,23366666666667000000','Tr','5,96533333333333000000','Tr','560,79766666666700000000','14,71133333333330000000','Tr','Tr','385,38666666666700000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','266','Margarina, com óleo interesterificado, sem sal (65% de lipídeos)','33,37000000000000000000','593,13749023819000000000','2481,68725915659000000000','Tr','67,09700000000000000000','NA','0,00000000000000000000','NA','0,09600000000000000000','4,96366666666667000000','1,14933333333333000000','Tr','7,16133333333333000000','0,07666666666666670000','33,19433333333330000000','4,73000000000000000000','Tr','Tr','245,10000000000000000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','267','Óleo, de babaçu','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','268','Óleo, de canola','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','269','Óleo, de girassol','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','270','Óleo, de milho','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','271','Óleo, de pequi','NA','884,00000000000000000000','3698,65600000000000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Gorduras e óleos','272','Óleo, de soja','NA','884,00000000000000000000','3698,65606384277000000000','NA','100,00000000000000000000','NA','NA','NA','','','','','','','','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','273','Abadejo, filé, congelado, assado','74,32233333333330000000','111,61550345118800000000','466,99926643977200000000','23,52500000000000000000','1,23766666666667000000','102,79866666666700000000','0,00000000000000000000','NA','1,64833333333333000000','22,60700000000000000000','20,24566666666670000000','Tr','337,85733333333300000000','0,52600000000000000000','334,39133333333300000000','155,63600000000000000000','0,03400000000000000000','0,51333333333333300000','Tr','Tr','Tr','Tr','Tr','Tr','0,43666666666666700000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','274','Abadejo, filé, congelado,cozido','79,73366666666670000000','91,10354839555420000000','381,17724648699900000000','19,34583333333330000000','0,94200000000000000000','86,86033333333330000000','0,00000000000000000000','NA','0,88933333333333300000','16,73333333333330000000','15,74233333333330000000','Tr','350,69733333333300000000','0,32733333333333300000','189,33766666666700000000','145,67033333333300000000','0,02733333333333330000','0,43500000000000000000','Tr','Tr','Tr','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','275','Abadejo, filé, congelado, cru','86,41666666666670000000','59,11303324858350000000','247,32893111207300000000','13,08333333333330000000','0,36000000000000000000','31,40666666666670000000','0,00000000000000000000','NA','0,63000000000000000000','10,17466666666670000000','14,49733333333330000000','0,00533333333333333000','90,54000000000000000000','0,10600000000000000000','78,51500000000000000000','148,35133333333300000000','0,13533333333333300000','0,39066666666666700000','Tr','Tr','Tr','0,03666666666666670000','Tr','Tr','4,60000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','276','Abadejo, filé, congelado, grelhado','70,95700000000000000000','129,64352590286700000000','542,42851237759700000000','27,61041666666670000000','1,30233333333333000000','135,85300000000000000000','0,00000000000000000000','NA','1,59000000000000000000','20,17366666666670000000','22,11166666666670000000','Tr','581,13433333333300000000','0,32900000000000000000','305,09366666666700000000','278,63900000000000000000','Tr','0,43833333333333300000','5,68666666666667000000','5,68666666666667000000','5,68666666666667000000','0,03000000000000000000','Tr','Tr','0,43666666666666700000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','277','Atum, conserva em óleo','64,50000000000000000000','165,91056057890300000000','694,16978546212800000000','26,18750000000000000000','5,99666666666667000000','52,93866666666670000000','0,00000000000000000000','NA','1,53000000000000000000','6,51600000000000000000','29,48150000000000000000','Tr','211,00800000000000000000','1,22975000000000000000','362,14650000000000000000','279,86450000000000000000','0,03775000000000000000','0,58825000000000000000','Tr','Tr','Tr','0,15333333333333300000','0,03000000000000000000','Tr','3,16666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','278','Atum, fresco, cru','73,05333333333330000000','117,50100000000000000000','491,62418400000000000000','25,68000000000000000000','0,87000000000000000000','47,80000000000000000000','0,00000000000000000000','NA','1,30666666666667000000','6,69000000000000000000','32,22666666666670000000','Tr','253,85666666666700000000','1,27333333333333000000','30,30333333333330000000','307,76333333333300000000','0,08666666666666670000','0,40000000000000000000','20,30333333333330000000','20,30333333333330000000','20,00000000000000000000','Tr','0,04000000000000000000','Tr','5,94000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','279','Bacalhau, salgado, cru','47,88666666666670000000','135,89296666666700000000','568,57617253333300000000','29,03666666666670000000','1,32000000000000000000','138,88000000000000000000','0,00000000000000000000','NA','22,50000000000000000000','156,96666666666700000000','49,47333333333330000000','0,02533333333333330000','186,20666666666700000000','0,85333333333333300000','13585,05666666670000000000','433,89666666666700000000','0,09333333333333330000','0,67000000000000000000','Tr','Tr','Tr','Tr','0,21000000000000000000','Tr','*','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','280','Bacalhau, salgado, refogado','65,90900000000000000000','139,66070105354000000000','584,34037320801100000000','23,97916666666670000000','3,60666666666667000000','111,96833333333300000000','1,22416666666668000000','*','5,28100000000000000000','59,12366666666670000000','15,05650000000000000000','Tr','51,34233333333330000000','0,15266666666666700000','1256,27666666667000000000','50,22466666666670000000','0,04333333333333330000','0,55600000000000000000','Tr','Tr','Tr','0,03333333333333330000','0,05000000000000000000','Tr','5,16666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','281','Cação, posta, com farinha de trigo, frita','60,62333333333330000000','208,33274372597500000000','871,66419974948100000000','24,95208333333330000000','9,95433333333333000000','74,90733333333330000000','3,10058333333333000000','0,53666666666666700000','1,36966666666667000000','30,44200000000000000000','25,50700000000000000000','0,06233333333333330000','461,56933333333300000000','0,99833333333333300000','160,03166666666700000000','419,89033333333300000000','Tr','0,55400000000000000000','17,37666666666670000000','17,37666666666670000000','17,37666666666670000000','Tr','Tr','Tr','0,77000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','282','Cação, posta, cozida','75,92833333333330000000','116,01448068765800000000','485,40458719716100000000','25,58958333333330000000','0,74800000000000000000','83,25000000000000000000','0,00000000000000000000','NA','1,18000000000000000000','10,32466666666670000000','21,12266666666670000000','Tr','203,71200000000000000000','0,31700000000000000000','114,90533333333300000000','248,64000000000000000000','0,03033333333333330000','0,60566666666666700000','11,62333333333330000000','11,62333333333330000000','12,00000000000000000000','Tr','0,04000000000000000000','Tr','9,76666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','283','Cação, posta, crua','81,37666666666670000000','83,33302501956620000000','348,66537668186500000000','17,85416666666670000000','0,78666666666666700000','36,12866666666670000000','0,00000000000000000000','NA','1,24333333333333000000','8,70366666666667000000','19,29900000000000000000','0,03533333333333330000','181,45366666666700000000','0,20400000000000000000','176,02366666666700000000','299,02400000000000000000','0,12800000000000000000','0,31666666666666700000','5,99666666700000000000','5,99666666700000000000','5,99666666700000000000','0,03666666666666670000','Tr','Tr','1,31000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','284','Camarão, Rio Grande, grande, cozido','78,70700000000000000000','90,01368009630840000000','376,61723752295400000000','18,96666666666670000000','1,00066666666667000000','240,85466666666700000000','0,00000000000000000000','NA','1,73433333333333000000','89,74400000000000000000','18,91158333333330000000','0,05800000000000000000','265,85333333333300000000','1,27800000000000000000','366,55200000000000000000','101,73500000000000000000','0,16933333333333300000','1,23766666666667000000','Tr','Tr','Tr','Tr','Tr','Tr','1,06666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','285','Camarão, Rio Grande, grande, cru','89,13366666666670000000','47,18343670543040000000','197,41549917552100000000','9,99166666666667000000','0,50100000000000000000','123,98700000000000000000','0,00000000000000000000','NA','0,79733333333333300000','51,11633333333330000000','27,36700000000000000000','0,03533333333333330000','233,92250000000000000000','0,66866666666666700000','201,12800000000000000000','72,00533333333330000000','0,11166666666666700000','0,71366666666666700000','20,00000000000000000000','20,00000000000000000000','20,00000000000000000000','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','286','Camarão, Sete Barbas, sem cabeça, com casca, frito','61,03933333333330000000','231,24615385087300000000','967,53390771205400000000','18,38750000000000000000','15,62033333333330000000','283,13533333333300000000','2,87983333333333000000','NA','2,07300000000000000000','959,70133333333400000000','73,97166666666670000000','0,37933333333333300000','336,98933333333300000000','2,43900000000000000000','99,05500000000000000000','106,77366666666700000000','0,18766666666666700000','1,09800000000000000000','Tr','Tr','Tr','0,05333333333333330000','Tr','Tr','0,35000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','287','Caranguejo, cozido','76,99666666666670000000','82,72150150783860000000','346,10676230879700000000','18,47916666666670000000','0,42300000000000000000','84,60533333333330000000','0,00000000000000000000','NA','3,54533333333333000000','357,15266666666700000000','52,22533333333330000000','0,07266666666666670000','153,68933333333300000000','2,86166666666667000000','360,10566666666700000000','185,83133333333300000000','0,72000000000000000000','5,65000000000000000000','Tr','Tr','Tr','0,04000000000000000000','0,31000000000000000000','Tr','4,16666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','288','Corimba, cru','75,64333333333330000000','128,15540000000000000000','536,20219360000000000000','17,36666666666670000000','5,98666666666667000000','40,23000000000000000000','-0,02666666666666620000','NA','1,03000000000000000000','40,05333333333330000000','22,76666666666670000000','0,02000000000000000000','190,07000000000000000000','0,50333333333333300000','47,01000000000000000000','316,73666666666700000000','0,03333333333333330000','0,40000000000000000000','Tr','Tr','Tr','Tr','Tr','Tr','1,87333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','289','Corimbatá, assado','59,92666666666670000000','261,45243941056700000000','1093,91700649381000000000','19,89791666666670000000','19,56633333333330000000','80,09100000000000000000','0,00000000000000000000','NA','0,96000000000000000000','22,30433333333330000000','24,21200000000000000000','0,01333333333333330000','220,64133333333300000000','0,97133333333333300000','40,42600000000000000000','326,49733333333300000000','0,03166666666666670000','0,74766666666666700000','Tr','Tr','Tr','0,13333333333333300000','0,06000000000000000000','Tr','2,69666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','290','Corimbatá, cozido','64,56200000000000000000','238,69610486733900000000','998,70450276494700000000','20,13125000000000000000','16,93300000000000000000','74,61733333333330000000','0,00000000000000000000','NA','0,83766666666666700000','64,68566666666670000000','22,82900000000000000000','0,02133333333333330000','185,26500000000000000000','0,62266666666666700000','37,16566666666670000000','253,99200000000000000000','0,05233333333333330000','0,95400000000000000000','Tr','Tr','Tr','Tr','Tr','Tr','2,09333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','291','Corvina de água doce, crua','79,24666666666670000000','101,00903333333300000000','422,62179546666700000000','18,91666666666670000000','2,24333333333333000000','73,11000000000000000000','0,00000000000000000000','NA','1,02333333333333000000','39,43000000000000000000','24,50000000000000000000','0,02000000000000000000','153,82333333333300000000','0,25666666666666700000','45,09000000000000000000','293,02333333333300000000','0,02000000000000000000','0,36000000000000000000','8,12000000000000000000','8,12000000000000000000','8,12000000000000000000','Tr','0,08000000000000000000','Tr','*','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','292','Corvina do mar, crua','79,35333333333330000000','94,00000000000000000000','391,52017093333300000000','18,57000000000000000000','1,58333333333333000000','67,07000000000000000000','0,00000000000000000000','NA','1,08333333333333000000','*','23,75000000000000000000','0,01000000000000000000','183,08000000000000000000','0,37666666666666700000','67,97000000000000000000','338,70333333333300000000','0,02666666666666670000','0,35666666666666700000','65,01666666666670000000','65,01666666666670000000','65,01666666666670000000','0,12000000000000000000','0,05333333333333330000','Tr','2,62333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','293','Corvina grande, assada','69,02633333333330000000','146,52814112536100000000','613,07374246851100000000','26,76666666666670000000','3,57366666666667000000','117,05000000000000000000','0,00000000000000000000','NA','1,34700000000000000000','60,22500000000000000000','24,10133333333330000000','0,02500000000000000000','175,89800000000000000000','0,53833333333333300000','85,35200000000000000000','291,46000000000000000000','0,02033333333333330000','0,67466666666666700000','Tr','Tr','Tr','0,11333333333333300000','0,10000000000000000000','Tr','4,23333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','294','Corvina grande, cozida','73,60933333333330000000','100,07812455296500000000','418,72687312960600000000','23,43750000000000000000','2,56266666666667000000','122,55600000000000000000','0,00000000000000000000','NA','0,90400000000000000000','69,37366666666670000000','22,22266666666670000000','0,01866666666666670000','163,55500000000000000000','0,57866666666666700000','68,39000000000000000000','194,03533333333300000000','0,02533333333333330000','0,68866666666666700000','6,27666666666667000000','6,27666666666667000000','6,27666666666667000000','Tr','0,03333333333333330000','Tr','0,77000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','295','Dourada de água doce, fresca','76,16000000000000000000','131,20831472377000000000','548,97558880425300000000','18,81041666666670000000','5,64166666666667000000','51,98933333333330000000','0,00000000000000000000','NA','1,07100000000000000000','12,13300000000000000000','26,26266666666670000000','0,01033333333333330000','189,27166666666700000000','0,15200000000000000000','40,29766666666670000000','392,50566666666700000000','0,02033333333333330000','0,47700000000000000000','Tr','Tr','Tr','Tr','Tr','Tr','3,70333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','296','Lambari, congelado, cru','71,88666666666670000000','130,84031100948700000000','547,43586126369200000000','16,81250000000000000000','6,54666666666667000000','158,66133333333300000000','0,00000000000000000000','NA','3,57000000000000000000','1181,27700000000000000000','44,69300000000000000000','0,27800000000000000000','696,15166666666700000000','0,90566666666666700000','47,92000000000000000000','244,40133333333300000000','0,09400000000000000000','3,33666666666667000000','4,30666666666667000000','4,30666666666667000000','4,30666666666667000000','0,05333333333333330000','Tr','Tr','3,30000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','297','Lambari, congelado, frito','40,13800000000000000000','326,86839988660800000000','1367,61738512557000000000','28,42500000000000000000','22,78200000000000000000','246,32333333333300000000','0,00000000000000000000','NA','6,16700000000000000000','1881,03900000000000000000','66,29066666666670000000','0,33733333333333300000','1067,27766666667000000000','0,81333333333333300000','64,55166666666670000000','331,16900000000000000000','0,30633333333333300000','5,62500000000000000000','9,44666666666667000000','9,44666666666667000000','9,44666666666667000000','0,25333333333333300000','0,03000000000000000000','0,04000000000000000000','8,93333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','298','Lambari, fresco, cru','72,16566666666670000000','151,59834650321800000000','634,28748176946400000000','15,65208333333330000000','9,39733333333333000000','144,25466666666700000000','0,00000000000000000000','NA','2,21100000000000000000','590,27200000000000000000','31,60766666666670000000','0,41300000000000000000','440,93133333333300000000','0,63133333333333300000','41,10933333333330000000','207,35833333333300000000','0,05233333333333330000','2,41800000000000000000','Tr','Tr','Tr','Tr','0,03000000000000000000','0,07333333333333340000','1,85666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','299','Manjuba, com farinha de trigo, frita','41,30500000000000000000','343,55045872306800000000','1437,41511929732000000000','23,45000000000000000000','22,59300000000000000000','281,75500000000000000000','10,24033333333330000000','0,36333333333333300000','2,41166666666667000000','763,30733333333300000000','46,89666666666670000000','0,35566666666666700000','577,93500000000000000000','3,04133333333333000000','36,52000000000000000000','319,26500000000000000000','0,15400000000000000000','3,76733333333333000000','29,94333333333330000000','29,94333333333330000000','29,94333333333330000000','0,05000000000000000000','0,06666666666666670000','Tr','0,78666666666666700000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','300','Manjuba, frita','40,68066666666670000000','349,32523145536600000000','1461,57676840925000000000','30,13958333333330000000','24,46000000000000000000','270,34033333333300000000','0,00000000000000000000','NA','4,22533333333333000000','575,02900000000000000000','31,65800000000000000000','0,20733333333333300000','735,42633333333300000000','0,91633333333333300000','40,61000000000000000000','318,18000000000000000000','0,13766666666666700000','3,23500000000000000000','12,06666666666670000000','12,06666666666670000000','12,06666666666670000000','0,03000000000000000000','0,03333333333333330000','Tr','7,26666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','301','Merluza, filé, assado','70,72733333333330000000','121,91021833333300000000','510,07235350666700000000','26,60416666666670000000','0,92133333333333400000','90,97166666666660000000','0,00000000000000000000','NA','1,23933333333333000000','35,90566666666670000000','20,26833333333330000000','0,03166666666666670000','273,20300000000000000000','0,37133333333333300000','119,94866666666700000000','363,57000000000000000000','0,03100000000000000000','0,88733333333333300000','Tr','Tr','Tr','0,05000000000000000000','Tr','Tr','7,96666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','302','Merluza, filé, cru','82,07333333333330000000','89,13086666666670000000','372,92354613333300000000','16,60666666666670000000','2,02000000000000000000','57,18000000000000000000','0,00000000000000000000','NA','1,14333333333333000000','20,40000000000000000000','27,02000000000000000000','0,01000000000000000000','184,57000000000000000000','0,18666666666666700000','79,50333333333330000000','339,52666666666700000000','Tr','0,32666666666666700000','Tr','Tr','Tr','Tr','Tr','Tr','1,34333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','303','Merluza, filé, frito','63,46166666666670000000','191,62747837583200000000','801,76936952448200000000','26,92916666666670000000','8,49666666666667000000','109,10433333333300000000','0,00000000000000000000','NA','1,53133333333333000000','35,62766666666670000000','38,13600000000000000000','0,02333333333333330000','278,92733333333300000000','0,38333333333333300000','89,96133333333330000000','446,61933333333300000000','0,02700000000000000000','0,55733333333333300000','Tr','Tr','Tr','0,05000000000000000000','Tr','Tr','0,77000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','304','Pescada, branca, crua','79,57000000000000000000','110,87630000000000000000','463,90643920000000000000','16,26333333333330000000','4,59333333333333000000','50,77000000000000000000','0,00000000000000000000','NA','0,93666666666666700000','15,74000000000000000000','19,20333333333330000000','0,01000000000000000000','135,85333333333300000000','0,16333333333333300000','76,16666666666670000000','261,39666666666700000000','Tr','0,25000000000000000000','2,77000000000000000000','2,77000000000000000000','2,77000000000000000000','Tr','0,04000000000000000000','Tr','0,60333333333333300000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','305','Pescada, branca, frita','57,00333333333330000000','223,03973236930400000000','933,19824023316700000000','27,35625000000000000000','11,77700000000000000000','165,43966666666700000000','0,00000000000000000000','NA','3,23900000000000000000','378,27000000000000000000','30,07666666666670000000','0,05533333333333330000','504,10333333333300000000','0,50666666666666700000','107,23266666666700000000','355,14966666666700000000','0,08466666666666670000','1,12433333333333000000','39,35000000000000000000','39,35000000000000000000','39,35000000000000000000','0,08000000000000000000','0,11333333333333300000','Tr','8,06666666666666000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','306','Pescada, filé, com farinha de trigo, frito','53,20200000000000000000','283,42521443196100000000','1185,85109718333000000000','21,43541666666670000000','19,11500000000000000000','72,97133333333330000000','5,03325000000001000000','Tr','1,21433333333333000000','26,43433333333330000000','28,39700000000000000000','0,06633333333333330000','216,37433333333300000000','0,93733333333333300000','90,50666666666670000000','216,37433333333300000000','0,03100000000000000000','0,42966666666666700000','17,50000000000000000000','17,50000000000000000000','17,50000000000000000000','Tr','0,03000000000000000000','Tr','0,60333333333333300000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','307','Pescada, filé, cru','79,52000000000000000000','107,20556666666700000000','448,54809093333300000000','16,65000000000000000000','4,00333333333333000000','64,84000000000000000000','0,00000000000000000000','NA','0,90000000000000000000','13,54666666666670000000','22,80000000000000000000','0,01000000000000000000','141,25000000000000000000','0,17333333333333300000','77,49666666666670000000','253,05666666666700000000','Tr','0,25333333333333300000','47,86000000000000000000','47,86000000000000000000','47,86000000000000000000','Tr','0,04666666666666670000','Tr','3,10333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','308','Pescada, filé, frito','66,80400000000000000000','154,27002500000000000000','645,46578460000000000000','28,58750000000000000000','3,57000000000000000000','80,80533333333330000000','0,00000000000000000000','NA','1,65600000000000000000','10,32466666666670000000','21,12266666666670000000','Tr','203,71200000000000000000','0,32033333333333300000','114,90533333333300000000','248,64000000000000000000','0,03033333333333330000','0,60566666666666700000','4,21666666666667000000','4,21666666666667000000','4,21666666666667000000','0,14000000000000000000','Tr','Tr','8,86666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','309','Pescada, filé, molho escabeche','74,53233333333330000000','141,95832287502300000000','593,95362290909600000000','11,75000000000000000000','8,02400000000000000000','43,39533333333330000000','5,01533333333334000000','0,78000000000000000000','0,67833333333333300000','20,11633333333330000000','18,06300000000000000000','0,07633333333333330000','105,46433333333300000000','1,47433333333333000000','51,28766666666670000000','208,24300000000000000000','0,36466666666666700000','0,29000000000000000000','19,18666666666670000000','','','Tr','0,03000000000000000000','Tr','1,10333333333333000000','6,89333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','310','Pescadinha, crua','80,62333333333330000000','76,40890833333330000000','319,69487246666700000000','15,47916666666670000000','1,14333333333333000000','83,60700000000000000000','0,00000000000000000000','NA','2,02000000000000000000','331,59733333333300000000','33,77500000000000000000','0,06566666666666670000','326,81866666666700000000','0,54700000000000000000','120,33866666666700000000','303,83100000000000000000','0,10146666666666700000','0,55166666666666700000','Tr','Tr','Tr','0,08333333333333330000','Tr','Tr','6,60000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','311','Pintado, assado','56,98000000000000000000','191,55914112758600000000','801,48344647782100000000','36,45000000000000000000','3,98200000000000000000','125,95966666666700000000','0,00000000000000000000','NA','2,02666666666667000000','113,54200000000000000000','42,35766666666670000000','0,08133333333333330000','331,79700000000000000000','0,77700000000000000000','80,95266666666670000000','527,15300000000000000000','0,03633333333333330000','2,09900000000000000000','6,56666666666667000000','6,56666666666667000000','6,56666666666667000000','0,03000000000000000000','Tr','Tr','6,63333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','312','Pintado, cru','80,27000000000000000000','91,08323333333330000000','381,09224826666700000000','18,55666666666670000000','1,31333333333333000000','50,30000000000000000000','0,00000000000000000000','NA','1,08333333333333000000','12,00333333333330000000','23,69666666666670000000','0,01000000000000000000','174,47333333333300000000','0,21666666666666700000','43,33666666666670000000','293,64666666666700000000','0,03000000000000000000','0,39333333333333300000','Tr','Tr','Tr','Tr','Tr','Tr','4,95333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','313','Pintado, grelhado','65,49433333333330000000','152,19008833333300000000','636,76332958666700000000','30,79583333333330000000','2,29400000000000000000','99,30266666666670000000','0,00000000000000000000','NA','1,57366666666667000000','68,97633333333330000000','26,74033333333330000000','0,03033333333333330000','237,29366666666700000000','0,47533333333333300000','53,08866666666670000000','360,15333333333300000000','0,03766666666666670000','0,75633333333333300000','5,13333330000000000000','5,13333330000000000000','5,13333330000000000000','0,03000000000000000000','Tr','Tr','2,86666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','314','Porquinho, cru','79,16666666666670000000','93,02456666666670000000','389,21478693333300000000','20,49000000000000000000','0,61333333333333300000','48,61000000000000000000','0,00000000000000000000','NA','1,25666666666667000000','25,88333333333330000000','24,35000000000000000000','0,05333333333333330000','207,30333333333300000000','0,38666666666666700000','66,73000000000000000000','313,41666666666700000000','0,03666666666666670000','0,65666666666666700000','4,65333333333333000000','4,65333333333333000000','4,65333333333333000000','Tr','Tr','Tr','1,19333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','315','Salmão, filé, com pele, fresco,  grelhado','60,92733333333330000000','228,73177513531800000000','957,01374716617200000000','23,91875000000000000000','14,03533333333330000000','85,30966666666670000000','0,00000000000000000000','NA','1,29033333333333000000','28,75733333333330000000','27,78600000000000000000','0,01566666666666670000','299,72333333333300000000','0,54366666666666700000','85,13500000000000000000','383,93633333333300000000','0,04333333333333330000','0,55966666666666700000','Tr','Tr','Tr','0,12666666666666700000','0,06000000000000000000','Tr','5,34666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','316','Salmão, sem pele, fresco, cru','68,98400000000000000000','169,78157991055600000000','710,36613034576800000000','19,25208333333330000000','9,70900000000000000000','53,02700000000000000000','0,00000000000000000000','NA','1,22233333333333000000','8,74800000000000000000','27,42166666666670000000','Tr','258,79900000000000000000','0,24000000000000000000','64,24166666666670000000','376,49566666666700000000','0,02233333333333330000','0,34400000000000000000','Tr','Tr','Tr','0,19666666666666700000','0,03000000000000000000','Tr','3,21000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','317','Salmão, sem pele, fresco, grelhado','58,12800000000000000000','242,70656948709500000000','1015,48428673401000000000','26,14166666666670000000','14,53233333333330000000','72,81566666666670000000','0,00000000000000000000','NA','1,61366666666667000000','15,08600000000000000000','37,86033333333330000000','0,01266666666666670000','352,15833333333300000000','0,37266666666666700000','95,81133333333330000000','517,90200000000000000000','0,03666666666666670000','0,49733333333333300000','Tr','Tr','Tr','0,23333333333333300000','0,03000000000000000000','Tr','6,30333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','318','Sardinha, assada','60,08000000000000000000','164,35078833333300000000','687,64369838666700000000','32,17916666666670000000','2,98733333333333000000','108,98933333333300000000','0,00000000000000000000','NA','4,35233333333333000000','437,72733333333300000000','51,36133333333330000000','0,24200000000000000000','577,78033333333300000000','1,25100000000000000000','74,46833333333330000000','574,33866666666700000000','0,13733333333333300000','1,82033333333333000000','Tr','Tr','Tr','0,06333333333333330000','Tr','Tr','5,83333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','319','Sardinha, conserva em óleo','55,14266666666670000000','284,98100487124900000000','1192,36052438131000000000','15,93958333333330000000','24,04866666666670000000','72,56700000000000000000','0,00000000000000000000','NA','2,86466666666667000000','550,24333333333300000000','35,27000000000000000000','0,11266666666666700000','496,37333333333300000000','3,53733333333333000000','665,84033333333300000000','367,13366666666700000000','0,03366666666666670000','1,63833333333333000000','Tr','Tr','Tr','0,41666666666666700000','0,03666666666666670000','Tr','6,55333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','320','Sardinha, frita','48,48900000000000000000','257,04070000000000000000','1075,45828880000000000000','33,38333333333330000000','12,69333333333330000000','102,87466666666700000000','0,00000000000000000000','NA','4,30166666666667000000','482,07466666666700000000','38,83266666666670000000','0,24666666666666700000','628,76400000000000000000','1,12366666666667000000','60,09900000000000000000','459,94266666666700000000','0,14266666666666700000','1,64266666666667000000','Tr','Tr','Tr','0,06333333333333330000','Tr','Tr','7,10000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','321','Sardinha, inteira, crua','76,64000000000000000000','113,90036666666700000000','476,55913413333300000000','21,07666666666670000000','2,65000000000000000000','60,50000000000000000000','0,00000000000000000000','NA','1,60000000000000000000','167,33333333333300000000','28,52666666666670000000','0,09666666666666670000','293,89666666666700000000','1,33666666666667000000','60,38666666666670000000','312,37000000000000000000','0,13000000000000000000','1,29000000000000000000','Tr','Tr','Tr','Tr','0,07000000000000000000','Tr','7,70000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Pescados e frutos do mar','322','Tucunaré, filé, congelado, cru','79,88333333333330000000','87,68648354927700000000','366,88024717017500000000','17,95833333333330000000','1,22000000000000000000','46,89733333333330000000','-0,04500000000000790000','NA','0,98333333333333300000','19,22033333333330000000','25,64100000000000000000','0,01100000000000000000','167,86666666666700000000','0,26933333333333300000','56,55433333333330000000','288,06300000000000000000','0,09533333333333330000','0,44100000000000000000','Tr','Tr','Tr','Tr','0,05000000000000000000','Tr','0,90000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','323','Apresuntado','73,72000000000000000000','128,85725581200900000000','539,13875831744600000000','13,45000000000000000000','6,69066666666667000000','37,67100000000000000000','2,86200000000000000000','NA','3,27733333333333000000','22,57733333333330000000','15,26200000000000000000','0,03933333333333330000','225,38600000000000000000','0,87766666666666700000','942,93300000000000000000','270,07366666666700000000','0,02933333333333330000','1,64966666666667000000','Tr','','','0,62333333333333300000','0,03666666666666670000','Tr','0,69666666666666700000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','324','Caldo de carne, tablete','2,93000000000000000000','240,62333333333300000000','1006,76802666667000000000','7,82000000000000000000','16,57000000000000000000','Tr','15,05333333333330000000','0,57666666666666700000','57,62666666666670000000','129,03000000000000000000','22,06000000000000000000','0,02100000000000000000','123,04000000000000000000','Tr','22179,66666666670000000000','218,15333333333300000000','Tr','Tr','Tr',' ','','0,70333333333333300000','0,07000000000000000000','0,26666666666666700000','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','325','Caldo de galinha, tablete','3,38266666666667000000','251,44566666666700000000','1052,04866933333000000000','6,27916666666667000000','20,41633333333330000000','2,11266666666667000000','10,64550000000000000000','11,81066666666670000000','59,27633333333330000000','16,36000000000000000000','12,79066666666670000000','0,13000000000000000000','48,05733333333330000000','0,68933333333333300000','22299,90033333330000000000','68,02800000000000000000','Tr','0,25800000000000000000','Tr',' ',' ','0,05000000000000000000','0,03666666666666670000','Tr','*','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','326','Carne, bovina, acém, moído, cozido','61,62000000000000000000','212,42040000000000000000','888,76695360000000000000','26,68666666666670000000','10,91666666666670000000','103,13000000000000000000','0,00000000000000000000','NA','0,84000000000000000000','4,02666666666667000000','17,07000000000000000000','0,01300000000000000000','164,44333333333300000000','2,65333333333333000000','52,35666666666670000000','255,70666666666700000000','0,06333333333333330000','8,10000000000000000000','Tr','Tr','Tr','Tr','0,31666666666666700000','Tr','1,76333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','327','Carne, bovina, acém, moído, cru','72,70333333333330000000','136,56233333333300000000','571,37680266666700000000','19,42000000000000000000','5,94666666666667000000','57,94000000000000000000','0,00000000000000000000','NA','0,93333333333333300000','2,61000000000000000000','14,13666666666670000000','Tr','157,61333333333300000000','1,76333333333333000000','48,61333333333330000000','237,30333333333300000000','0,07566666666666670000','6,33333333333333000000','2,32000000000000000000','2,32000000000000000000','2,32000000000000000000','0,15333333333333300000','0,21333333333333300000','0,03000000000000000000','4,33000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','328','Carne, bovina, acém, sem gordura, cozido','60,38333333333330000000','214,61056666666700000000','897,93061093333300000000','27,27000000000000000000','10,88333333333330000000','106,75000000000000000000','0,00000000000000000000','NA','0,83000000000000000000','7,11000000000000000000','14,44000000000000000000','Tr','164,20000000000000000000','2,36666666666667000000','56,17333333333330000000','254,42333333333300000000','0,07333333333333340000','7,97000000000000000000','Tr','Tr','Tr','Tr','0,04000000000000000000','0,07000000000000000000','1,62666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','329','Carne, bovina, acém, sem gordura, cru','71,51666666666670000000','144,02943333333300000000','602,61914906666700000000','20,81666666666670000000','6,11333333333333000000','53,37000000000000000000','0,00000000000000000000','NA','0,96000000000000000000','4,71666666666667000000','13,27666666666670000000','Tr','144,18666666666700000000','1,51333333333333000000','49,84666666666670000000','233,65000000000000000000','0,03666666666666670000','5,21333333333333000000','2,17333333333333000000','2,17333333333333000000','2,17333333333333000000','0,11666666666666700000','0,11666666666666700000','Tr','2,33000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','330','Carne, bovina, almôndegas, cruas','64,28333333333330000000','189,25666666666700000000','791,84989333333300000000','12,31250000000000000000','11,20333333333330000000','33,59895000000000000000','9,79416666666666000000','*','2,40666666666667000000','22,23166666666670000000','23,75066666666670000000','0,16666666666666700000','144,92566666666700000000','1,56233333333333000000','621,25166666666700000000','328,24066666666700000000','0,14600000000000000000','2,33333333333333000000','Tr',' ',' ','0,11000000000000000000','0,04000000000000000000','Tr','2,20000000000000000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','331','Carne, bovina, almôndegas, fritas','48,08766666666670000000','271,81300000000000000000','1137,26559200000000000000','18,15625000000000000000','15,78233333333330000000','36,38066666666670000000','14,28675000000000000000','*','3,68700000000000000000','26,75933333333330000000','48,11966666666670000000','0,40733333333333300000','244,30333333333300000000','1,91166666666667000000','1030,25566666667000000000','536,09933333333400000000','0,18700000000000000000','2,60833333333333000000','Tr',' ',' ','0,13333333333333300000','0,07000000000000000000','Tr','6,60000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','332','Carne, bovina, bucho, cozido','74,12333333333330000000','133,02286666666700000000','556,56767413333300000000','21,64000000000000000000','4,50333333333333000000','245,46700000000000000000','0,00000000000000000000','NA','0,32000000000000000000','13,21000000000000000000','7,41333333333333000000','0,01000000000000000000','62,62666666666670000000','0,57666666666666700000','38,20333333333330000000','69,81000000000000000000','0,05000000000000000000','2,49333333333333000000','Tr','Tr','Tr','Tr','Tr','Tr','2,18000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','333','Carne, bovina, bucho, cru','74,96666666666670000000','137,30316666666700000000','574,47644933333300000000','20,53000000000000000000','5,50333333333333000000','144,90000000000000000000','0,00000000000000000000','NA','0,37000000000000000000','9,07333333333333000000','6,40333333333333000000','0,01000000000000000000','61,42333333333330000000','0,47333333333333300000','45,00333333333330000000','84,56666666666670000000','0,06000000000000000000','2,12666666666667000000','Tr','Tr','Tr','Tr','Tr','Tr','2,13333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','334','Carne, bovina, capa de contra-filé, com gordura, crua','64,77333333333330000000','216,90896666666700000000','907,54711653333400000000','19,19666666666670000000','14,96000000000000000000','62,81000000000000000000','0,00000000000000000000','NA','0,89666666666666700000','5,86000000000000000000','17,45333333333330000000','0,00600000000000000000','144,19000000000000000000','1,51000000000000000000','57,54000000000000000000','266,88666666666700000000','0,05766666666666670000','3,54333333333333000000','3,76333333333333000000','3,76333333333333000000','3,76333333333333000000','0,08666666666666670000','0,08700000000000000000','0,12000000000000000000','1,55000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','335','Carne, bovina, capa de contra-filé, com gordura, grelhada','47,88000000000000000000','311,70266666666700000000','1304,16395733333000000000','30,68666666666670000000','20,03000000000000000000','120,43000000000000000000','0,00000000000000000000','NA','1,13333333333333000000','7,25666666666667000000','18,38000000000000000000','Tr','213,62666666666700000000','2,59000000000000000000','80,51333333333330000000','323,45333333333300000000','0,12666666666666700000','6,19666666666667000000','Tr','Tr','Tr','Tr','0,06333333333333330000','Tr','1,74333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','336','Carne, bovina, capa de contra-filé, sem gordura, crua','72,98666666666670000000','131,06246666666700000000','548,36536053333300000000','21,54000000000000000000','4,33333333333333000000','58,35000000000000000000','0,00000000000000000000','NA','1,00000000000000000000','6,49666666666667000000','19,58666666666670000000','Tr','178,22666666666700000000','2,03666666666667000000','79,17333333333330000000','325,43000000000000000000','0,06000000000000000000','4,58666666666667000000','Tr','Tr','Tr','Tr','0,03666666666666670000','Tr','1,81000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','337','Carne, bovina, capa de contra-filé, sem gordura, grelhada','53,74333333333330000000','239,44363333333300000000','1001,83216186667000000000','35,06333333333330000000','9,95000000000000000000','80,29000000000000000000','-0,00666666666667481000','NA','1,25000000000000000000','8,84333333333333000000','25,61333333333330000000','0,01000000000000000000','287,37666666666700000000','2,84000000000000000000','82,75000000000000000000','384,84333333333300000000','0,12000000000000000000','7,63666666666667000000','Tr','Tr','Tr','0,02666666666666670000','0,07666666666666670000','Tr','1,85666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','338','Carne, bovina, charque, cozido','45,78900000000000000000','262,78014226218100000000','1099,47211522496000000000','36,36458333333330000000','11,91833333333330000000','113,43200000000000000000','0,00000000000000000000','NA','3,62933333333333000000','14,85166666666670000000','12,80733333333330000000','0,01733333333333330000','100,90100000000000000000','3,45166666666667000000','1442,70100000000000000000','89,56933333333340000000','0,06700000000000000000','6,08633333333333000000','Tr','Tr','Tr','0,05000000000000000000','0,07000000000000000000','Tr','1,50000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','339','Carne, bovina, charque, cru','44,46566666666670000000','248,86101810745400000000','1041,23449976159000000000','22,71458333333330000000','16,83700000000000000000','80,68566666666670000000','0,00000000000000000000','NA','14,48700000000000000000','15,17600000000000000000','13,36033333333330000000','Tr','122,29033333333300000000','1,52666666666667000000','5875,02900000000000000000','236,26366666666700000000','0,03333333333333330000','3,89233333333333000000','Tr','Tr','Tr','0,12000000000000000000','0,07000000000000000000','Tr','1,63333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','340','Carne, bovina, contra-filé, à milanesa','42,16466666666670000000','351,59265919899900000000','1471,06368608861000000000','20,61250000000000000000','23,99800000000000000000','99,36033333333330000000','12,17450000000000000000','0,37000000000000000000','1,05033333333333000000','14,67200000000000000000','27,03666666666670000000','0,27300000000000000000','202,95300000000000000000','2,89633333333333000000','77,09333333333330000000','270,96333333333300000000','0,09600000000000000000','2,85800000000000000000','15,08333333333330000000','','','0,07000000000000000000','0,04000000000000000000','Tr','3,01666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','341','Carne, bovina, contra-filé de costela, cru','66,38000000000000000000','202,43740000000000000000','846,99808160000000000000','19,80000000000000000000','13,07000000000000000000','52,31000000000000000000','0,00000000000000000000','NA','0,95333333333333300000','3,16000000000000000000','14,00333333333330000000','Tr','163,84666666666700000000','1,55666666666667000000','38,52333333333330000000','245,07000000000000000000','0,03900000000000000000','4,35000000000000000000','3,05333333333333000000','3,05333333333333000000','3,05333333333333000000','0,13666666666666700000','0,08000000000000000000','Tr','2,67666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','342','Carne, bovina, contra-filé de costela, grelhado','52,19333333333330000000','274,91426666666700000000','1150,24129173333000000000','29,88000000000000000000','16,33333333333330000000','97,87000000000000000000','0,00000000000000000000','NA','1,15333333333333000000','4,28666666666667000000','23,56666666666670000000','0,01000000000000000000','251,89000000000000000000','2,79333333333333000000','50,88333333333330000000','382,74000000000000000000','0,08000000000000000000','6,68000000000000000000','Tr','Tr','Tr','Tr','0,18666666666666700000','0,17330000000000000000','2,75333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','343','Carne, bovina, contra-filé, com gordura, cru','65,74700000000000000000','205,85670000000000000000','861,30443280000000000000','21,15000000000000000000','12,81000000000000000000','72,65000000000000000000','0,00000000000000000000','NA','0,92000000000000000000','3,67300000000000000000','18,15700000000000000000','0,00500000000000000000','164,20300000000000000000','1,31000000000000000000','44,13300000000000000000','284,65300000000000000000','0,03900000000000000000','2,79000000000000000000','3,58700000000000000000','3,58700000000000000000','3,58700000000000000000','0,11000000000000000000','0,08000000000000000000','0,03000000000000000000','3,79000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','344','Carne, bovina, contra-filé, com gordura, grelhado','51,70666666666670000000','278,05356666666700000000','1163,37612293333000000000','32,39666666666670000000','15,49000000000000000000','143,86000000000000000000','0,00000000000000000000','NA','1,21666666666667000000','4,46333333333333000000','18,66000000000000000000','Tr','218,53666666666700000000','2,35333333333333000000','57,06666666666670000000','351,86000000000000000000','0,09333333333333330000','4,78000000000000000000','Tr','Tr','Tr','Tr','0,18333333333333300000','0,13000000000000000000','4,91000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','345','Carne, bovina, contra-filé, sem gordura, cru','69,14333333333330000000','156,61583333333300000000','655,28064666666700000000','23,99666666666670000000','6,00333333333333000000','59,46000000000000000000','0,00000000000000000000','NA','0,98666666666666700000','4,19666666666667000000','20,62666666666670000000','Tr','183,82333333333300000000','1,68000000000000000000','52,89333333333330000000','334,61666666666700000000','0,04666666666666670000','3,24000000000000000000','Tr','Tr','Tr','Tr','0,20000000000000000000','Tr','4,64000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','346','Carne, bovina, contra-filé, sem gordura, grelhado','57,53333333333330000000','193,69156666666700000000','810,40551493333300000000','35,88333333333330000000','4,48666666666667000000','101,90000000000000000000','0,00000000000000000000','NA','1,27333333333333000000','4,99666666666667000000','21,06000000000000000000','Tr','240,60333333333300000000','2,35333333333333000000','57,51000000000000000000','386,47000000000000000000','0,09333333333333330000','5,13666666666667000000','Tr','Tr','Tr','Tr','0,16666666666666700000','0,16000000000000000000','4,93333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','347','Carne, bovina, costela, assada','43,18666666666670000000','373,03886666666700000000','1560,79461813333000000000','28,80666666666670000000','27,72000000000000000000','94,58700000000000000000','0,00000000000000000000','NA','0,98666666666666700000','28,00666666666670000000','19,54666666666670000000','Tr','179,05000000000000000000','2,18000000000000000000','91,86000000000000000000','270,00666666666700000000','0,08333333333333330000','5,45333333333333000000','Tr','Tr','Tr','Tr','0,08333333333333330000','0,35000000000000000000','0,55666666666666700000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','348','Carne, bovina, costela, crua','52,73000000000000000000','357,72246666666700000000','1496,71080053333000000000','16,70666666666670000000','31,75000000000000000000','44,19000000000000000000','0,00000000000000000000','NA','0,90000000000000000000','*','11,67666666666670000000','Tr','129,96666666666700000000','1,20333333333333000000','69,99666666666670000000','151,16000000000000000000','Tr','2,69666666666667000000','4,56666666666667000000','4,56666666666667000000','4,56666666666667000000','0,12000000000000000000','0,11000000000000000000','Tr','5,99000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','349','Carne, bovina, coxão duro, sem gordura, cozido','58,53333333333330000000','216,61606666666700000000','906,32162293333300000000','31,88000000000000000000','8,92333333333333000000','71,10000000000000000000','0,00000000000000000000','NA','0,88000000000000000000','3,98000000000000000000','13,79000000000000000000','Tr','188,96666666666700000000','1,70000000000000000000','41,10000000000000000000','251,66000000000000000000','0,07000000000000000000','4,97333333333333000000','2,06000000000000000000','2,06000000000000000000','2,06000000000000000000','Tr','Tr','Tr','3,26000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','350','Carne, bovina, coxão duro, sem gordura, cru','69,80333333333330000000','147,96633333333300000000','619,09113866666700000000','21,51333333333330000000','6,22000000000000000000','59,98000000000000000000','0,00000000000000000000','NA','1,09333333333333000000','2,95333333333333000000','21,11000000000000000000','Tr','188,51000000000000000000','1,89333333333333000000','48,54666666666670000000','357,87666666666700000000','0,05000000000000000000','2,80666666666667000000','2,06666666666667000000','2,06666666666667000000','2,06666666666667000000','0,11666666666666700000','0,20000000000000000000','Tr','4,37666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','351','Carne, bovina, coxão mole, sem gordura, cozido','58,04333333333330000000','218,67510000000000000000','914,93661840000000000000','32,38333333333330000000','8,91333333333333000000','84,15000000000000000000','0,00000000000000000000','NA','1,23000000000000000000','3,73333333333333000000','13,47000000000000000000','Tr','182,67333333333300000000','2,55666666666667000000','43,50333333333330000000','238,50666666666700000000','0,11333333333333300000','4,69666666666667000000','2,46666666666667000000','2,46666666666667000000','2,46666666666667000000','Tr','Tr','Tr','4,09000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','352','Carne, bovina, coxão mole, sem gordura, cru','68,59666666666670000000','169,06596666666700000000','707,37200453333300000000','21,23000000000000000000','8,69333333333333000000','83,82000000000000000000','0,00000000000000000000','NA','1,04333333333333000000','2,98666666666667000000','20,71666666666670000000','Tr','175,40333333333300000000','1,88666666666667000000','60,53333333333330000000','334,90333333333300000000','0,05000000000000000000','2,63333333333333000000','2,61000000000000000000','2,61000000000000000000','2,61000000000000000000','0,12000000000000000000','0,19333333333333300000','Tr','2,32000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','353','Carne, bovina, cupim, assado','48,41700000000000000000','330,10029083333300000000','1381,13961684667000000000','28,63125000000000000000','23,04266666666670000000','90,80000000000000000000','0,00000000000000000000','NA','0,95933333333333300000','7,62333333333333000000','18,20666666666670000000','Tr','212,27000000000000000000','2,70333333333333000000','71,58666666666670000000','321,07333333333300000000','0,08000000000000000000','5,28666666666667000000','Tr','Tr','Tr','Tr','0,07666666666666670000','0,14000000000000000000','2,16333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','354','Carne, bovina, cupim, cru','64,83000000000000000000','221,39750000000000000000','926,32714000000000000000','19,53666666666670000000','15,29666666666670000000','50,95000000000000000000','0,00000000000000000000','NA','0,88000000000000000000','3,56666666666667000000','12,76000000000000000000','Tr','220,12666666666700000000','1,13000000000000000000','46,86000000000000000000','150,58000000000000000000','0,02866666666666670000','2,42333333333333000000','2,70333333333333000000','2,70333333333333000000','2,70333333333333000000','0,11333333333333300000','0,05000000000000000000','0,03000000000000000000','3,33000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','355','Carne, bovina, fígado, cru','71,33000000000000000000','141,04586666666700000000','590,13590613333300000000','20,71333333333330000000','5,35666666666667000000','392,88300000000000000000','1,10666666666667000000','NA','1,49333333333333000000','4,15666666666667000000','12,42000000000000000000','0,26000000000000000000','334,16333333333300000000','5,62666666666667000000','75,92000000000000000000','264,50000000000000000000','9,00666666666667000000','3,46333333333333000000','7936,70000000000000000000','7936,70000000000000000000','7936,70000000000000000000','0,13666666666666700000','0,90333333333333300000','Tr','10,66000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','356','Carne, bovina, fígado, grelhado','54,97000000000000000000','225,02640000000000000000','941,51045760000000000000','29,86000000000000000000','9,01000000000000000000','601,47000000000000000000','4,20000000000000000000','NA','1,96000000000000000000','5,56000000000000000000','9,69666666666667000000','0,21666666666666700000','419,91666666666700000000','5,79000000000000000000','82,19000000000000000000','309,37000000000000000000','12,57666666666670000000','3,95000000000000000000','14574,00000000000000000000','14574,00000000000000000000','14574,00000000000000000000','0,21333333333333300000','2,69333333333333000000','Tr','11,92333333333330000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','357','Carne, bovina, filé mingnon, sem gordura, cru','71,89000000000000000000','142,86426666666700000000','597,74409173333300000000','21,60000000000000000000','5,61333333333333000000','54,76300000000000000000','0,00000000000000000000','NA','1,07333333333333000000','2,93000000000000000000','21,39000000000000000000','0,00800000000000000000','192,76000000000000000000','1,92000000000000000000','48,86000000000000000000','321,53333333333300000000','0,07966666666666670000','2,75333333333333000000','3,63000000000000000000','3,63000000000000000000','3,63000000000000000000','0,11666666666666700000','0,09666666666666670000','0,04000000000000000000','1,77666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','358','Carne, bovina, filé mingnon, sem gordura, grelhado','56,99666666666670000000','219,70260000000000000000','919,23567840000000000000','32,80000000000000000000','8,83000000000000000000','102,88000000000000000000','0,00000000000000000000','NA','1,32666666666667000000','4,31000000000000000000','28,26000000000000000000','0,02000000000000000000','308,13666666666700000000','2,87000000000000000000','57,90666666666670000000','325,98000000000000000000','0,14000000000000000000','4,13333333333333000000','Tr','Tr','Tr','0,03000000000000000000','0,08000000000000000000','0,04666666666666670000','4,26666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','359','Carne, bovina, flanco, sem gordura, cozido','61,98333333333330000000','195,57536666666700000000','818,28733413333400000000','29,37666666666670000000','7,77000000000000000000','62,00400000000000000000','0,00000000000000000000','NA','0,85666666666666600000','3,53333333333333000000','13,61333333333330000000','Tr','181,45000000000000000000','2,77000000000000000000','41,68000000000000000000','248,80000000000000000000','0,07333333333333340000','5,55333333333333000000','1,76000000000000000000','1,76000000000000000000','1,76000000000000000000','Tr','Tr','Tr','2,32000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','360','Carne, bovina, flanco, sem gordura, cru','72,07000000000000000000','141,46010000000000000000','591,86905840000000000000','19,99666666666670000000','6,21666666666667000000','50,30000000000000000000','0,00000000000000000000','NA','0,97000000000000000000','2,81333333333333000000','17,84666666666670000000','Tr','166,72666666666700000000','1,58000000000000000000','54,22333333333330000000','324,11000000000000000000','0,04666666666666670000','4,45000000000000000000','2,01666666666667000000','2,01666666666667000000','2,01666666666667000000','0,11000000000000000000','0,16333333333333300000','Tr','3,27666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','361','Carne, bovina, fraldinha, com gordura, cozida','49,72333333333330000000','338,44573333333300000000','1416,05694826667000000000','24,24000000000000000000','26,04666666666670000000','64,87000000000000000000','0,00000000000000000000','NA','0,74666666666666700000','3,21333333333333000000','14,47666666666670000000','Tr','160,58000000000000000000','2,03000000000000000000','38,78333333333330000000','206,76333333333300000000','0,07333333333333340000','6,50000000000000000000','Tr','Tr','Tr','Tr','0,05333333333333330000','0,07000000000000000000','1,60666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','362','Carne, bovina, fraldinha, com gordura, crua','65,44333333333330000000','220,72376666666700000000','923,50823973333300000000','17,58333333333330000000','16,14666666666670000000','54,34000000000000000000','0,00000000000000000000','NA','0,85666666666666600000','3,10666666666667000000','16,11666666666670000000','0,00400000000000000000','131,39666666666700000000','1,54333333333333000000','51,20000000000000000000','274,11666666666700000000','0,04466666666666670000','4,19333333333333000000','4,64333333333333000000','4,64333333333333000000','4,64333333333333000000','0,08333333333333330000','0,07333333333333340000','0,03000000000000000000','3,56333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','363','Carne, bovina, lagarto, cozido','57,63000000000000000000','222,46856666666700000000','930,80848293333300000000','32,86333333333330000000','9,10666666666667000000','55,70000000000000000000','0,00000000000000000000','NA','0,87666666666666700000','3,53333333333333000000','12,95666666666670000000','Tr','167,27333333333300000000','1,85000000000000000000','47,54333333333330000000','254,44000000000000000000','0,04666666666666670000','6,96000000000000000000','2,89666666666667000000','2,89666666666667000000','2,89666666666667000000','Tr','Tr','Tr','2,54666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','364','Carne, bovina, lagarto, cru','70,97333333333330000000','134,86456666666700000000','564,27334693333300000000','20,54333333333330000000','5,22666666666667000000','55,79000000000000000000','0,00000000000000000000','NA','1,12333333333333000000','2,59333333333333000000','19,67000000000000000000','Tr','184,72333333333300000000','1,32333333333333000000','53,55666666666670000000','361,84000000000000000000','0,05333333333333330000','2,39333333333333000000','1,99333333333333000000','1,99333333333333000000','1,99333333333333000000','0,10333333333333300000','0,13666666666666700000','0,03333333333333330000','2,19333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','365','Carne, bovina, língua, cozida','53,41333333333330000000','314,90160000000000000000','1317,54829440000000000000','21,36666666666670000000','24,79666666666670000000','105,07000000000000000000','0,00000000000000000000','NA','0,65666666666666700000','5,93000000000000000000','11,54000000000000000000','0,01000000000000000000','136,46333333333300000000','2,07000000000000000000','59,06333333333330000000','175,28666666666700000000','0,08333333333333330000','4,08666666666667000000','Tr','Tr','Tr','Tr','0,07666666666666670000','Tr','1,82666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','366','Carne, bovina, língua, crua','65,01666666666670000000','215,24976666666700000000','900,60502373333300000000','17,09000000000000000000','15,77333333333330000000','117,85000000000000000000','0,00000000000000000000','NA','0,78333333333333300000','5,04333333333333000000','15,30333333333330000000','0,02000000000000000000','163,56666666666700000000','1,70000000000000000000','73,05000000000000000000','250,71333333333300000000','0,09333333333333330000','2,87333333333333000000','Tr','Tr','Tr','0,04666666666666670000','0,04000000000000000000','Tr','1,17666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','367','Carne, bovina, maminha, crua','69,99000000000000000000','152,76586666666700000000','639,17238613333300000000','20,93333333333330000000','7,02666666666667000000','50,80000000000000000000','0,00000000000000000000','NA','1,01666666666667000000','2,83000000000000000000','15,65666666666670000000','Tr','181,32000000000000000000','1,14666666666667000000','37,41666666666670000000','273,65666666666700000000','0,03400000000000000000','3,48000000000000000000','3,17666666666667000000','3,17666666666667000000','3,17666666666667000000','0,11666666666666700000','0,07666666666666670000','0,03000000000000000000','4,27333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','368','Carne, bovina, maminha, grelhada','65,27966666666670000000','153,08967583333300000000','640,52720368666700000000','30,73541666666670000000','2,42233333333333000000','87,70000000000000000000','0,00000000000000000000','NA','1,38766666666667000000','4,17000000000000000000','20,89000000000000000000','Tr','237,48000000000000000000','2,43000000000000000000','58,12000000000000000000','386,41666666666700000000','0,08333333333333330000','5,58000000000000000000','Tr','Tr','Tr','Tr','0,04000000000000000000','0,13000000000000000000','1,45666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','369','Carne, bovina, miolo de alcatra, sem gordura, cru','69,49333333333330000000','162,87123333333300000000','681,45324026666700000000','21,61000000000000000000','7,82666666666667000000','60,37000000000000000000','0,00000000000000000000','NA','1,00666666666667000000','3,18666666666667000000','20,02000000000000000000','0,00766666666666667000','165,09333333333300000000','1,96666666666667000000','43,05333333333330000000','298,74333333333300000000','0,06466666666666670000','2,95666666666667000000','3,51666666666667000000','3,51666666666667000000','3,51666666666667000000','0,12333333333333300000','0,07000000000000000000','Tr','3,59000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','370','Carne, bovina, miolo de alcatra, sem gordura, grelhado','52,43000000000000000000','241,36396666666700000000','1009,86683653333000000000','31,93000000000000000000','11,64333333333330000000','92,20000000000000000000','0,00000000000000000000','NA','1,21666666666667000000','4,51000000000000000000','25,97000000000000000000','0,02000000000000000000','279,23666666666700000000','3,17333333333333000000','51,62000000000000000000','385,11000000000000000000','0,10666666666666700000','4,82333333333333000000','Tr','Tr','Tr','0,03000000000000000000','0,05000000000000000000','0,05000000000000000000','4,66333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','371','Carne, bovina, músculo, sem gordura, cozido','62,82000000000000000000','193,80033333333300000000','810,86059466666700000000','31,23333333333330000000','6,70000000000000000000','56,15000000000000000000','0,00000000000000000000','NA','0,87666666666666700000','4,98333333333333000000','13,41666666666670000000','Tr','175,70000000000000000000','2,36333333333333000000','61,79000000000000000000','252,55666666666700000000','0,08333333333333330000','6,44000000000000000000','1,90666666666667000000','1,90666666666667000000','1,90666666666667000000','Tr','Tr','Tr','1,97333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','372','Carne, bovina, músculo, sem gordura, cru','72,35333333333330000000','141,58100000000000000000','592,37490400000000000000','21,56000000000000000000','5,49000000000000000000','50,94000000000000000000','0,00000000000000000000','NA','0,98666666666666700000','3,64000000000000000000','17,45000000000000000000','Tr','162,18666666666700000000','1,86333333333333000000','66,08000000000000000000','295,83666666666700000000','0,05333333333333330000','3,65000000000000000000','1,91000000000000000000','1,91000000000000000000','1,91000000000000000000','0,09333333333333330000','0,18666666666666700000','0,04000000000000000000','2,78666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','373','Carne, bovina, paleta, com gordura, crua','70,62000000000000000000','158,70990000000000000000','664,04222160000000000000','21,41000000000000000000','7,46000000000000000000','58,26166666666670000000','0,00000000000000000000','NA','0,92000000000000000000','4,36000000000000000000','14,15000000000000000000','Tr','157,60000000000000000000','1,76000000000000000000','64,90000000000000000000','249,68000000000000000000','0,08000000000000000000','3,65000000000000000000','Tr','Tr','Tr','Tr','0,04000000000000000000',',0,02','0,91000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','374','Carne, bovina, paleta, sem gordura, cozida','62,94333333333330000000','193,65240000000000000000','810,24164160000000000000','29,72000000000000000000','7,40000000000000000000','55,61000000000000000000','0,00000000000000000000','NA','0,84666666666666700000','5,64333333333333000000','17,66000000000000000000','Tr','197,45000000000000000000','2,17000000000000000000','57,62333333333330000000','249,80666666666700000000','0,09666666666666670000','6,81666666666667000000','Tr','Tr','Tr','0,03333333333333330000','0,04333333333333330000','Tr','2,16333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','375','Carne, bovina, paleta, sem gordura, crua','72,08333333333330000000','140,94150000000000000000','589,69923600000000000000','21,03000000000000000000','5,67000000000000000000','42,25000000000000000000','0,00000000000000000000','NA','0,98000000000000000000','3,62000000000000000000','17,51333333333330000000','Tr','163,35666666666700000000','1,92666666666667000000','65,86000000000000000000','319,43000000000000000000','0,05000000000000000000','3,33666666666667000000','3,27000000000000000000','3,27000000000000000000','3,27000000000000000000','0,12666666666666700000','0,21333333333333300000','Tr','2,66666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','376','Carne, bovina, patinho, sem gordura, cru','72,90666666666670000000','133,46890000000000000000','558,43387760000000000000','21,72333333333330000000','4,51333333333333000000','55,61000000000000000000','0,00000000000000000000','NA','1,00666666666667000000','3,29666666666667000000','20,10333333333330000000','0,00833333333333333000','170,37000000000000000000','1,78000000000000000000','49,13000000000000000000','317,61333333333300000000','0,05266666666666670000','4,47000000000000000000','1,50666666666667000000','1,50666666666667000000','1,50666666666667000000','0,11333333333333300000','0,08333333333333330000','Tr','3,61000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','377','Carne, bovina, patinho, sem gordura, grelhado','55,15000000000000000000','219,25926666666700000000','917,38077173333300000000','35,90000000000000000000','7,31333333333333000000','125,68000000000000000000','0,00000000000000000000','NA','1,30333333333333000000','4,79666666666667000000','27,26333333333330000000','0,02000000000000000000','288,83666666666700000000','3,03333333333333000000','60,29333333333330000000','420,96000000000000000000','0,12333333333333300000','8,09333333333333000000','Tr','Tr','Tr','0,03666666666666670000','0,03000000000000000000','Tr','3,01000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','378','Carne, bovina, peito, sem gordura, cozido','51,17666666666670000000','338,47313333333300000000','1416,17158986667000000000','22,24666666666670000000','26,99333333333330000000','99,54000000000000000000','0,00000000000000000000','NA','0,72000000000000000000','4,02666666666667000000','13,87333333333330000000','Tr','135,96000000000000000000','1,60000000000000000000','55,70666666666670000000','204,49000000000000000000','0,05333333333333330000','3,89333333333333000000','Tr','Tr','Tr','Tr','0,30000000000000000000','Tr','4,53666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','379','Carne, bovina, peito, sem gordura, cru','61,48666666666670000000','259,27563333333300000000','1084,80924986667000000000','17,55666666666670000000','20,43333333333330000000','59,30000000000000000000','0,00000000000000000000','NA','0,85000000000000000000','3,94333333333333000000','15,32333333333330000000','Tr','124,36333333333300000000','1,31000000000000000000','63,76333333333330000000','241,40333333333300000000','0,06400000000000000000','2,63000000000000000000','4,25000000000000000000','4,25000000000000000000','4,25000000000000000000','0,10666666666666700000','0,06666666666666670000','0,03000000000000000000','3,91000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','380','Carne, bovina, picanha, com gordura, crua','65,64000000000000000000','212,87943333333300000000','890,68754906666700000000','18,82333333333330000000','14,69000000000000000000','59,55100000000000000000','0,00000000000000000000','NA','0,93333333333333300000','2,41666666666667000000','14,21666666666670000000','Tr','165,28666666666700000000','1,70666666666667000000','37,62333333333330000000','231,65000000000000000000','0,05966666666666670000','3,76666666666667000000','3,46000000000000000000','3,46000000000000000000','3,46000000000000000000','0,13000000000000000000','0,15666666666666700000','Tr','4,76666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','381','Carne, bovina, picanha, com gordura, grelhada','53,38733333333330000000','288,76709166666700000000','1208,20151153333000000000','26,42083333333330000000','19,50666666666670000000','91,76166666666670000000','0,00000000000000000000','NA','1,08700000000000000000','4,00000000000000000000','24,00000000000000000000','Tr','246,00000000000000000000','3,20000000000000000000','60,00000000000000000000','355,00000000000000000000','0,14000000000000000000','5,50000000000000000000','Tr','Tr','Tr','0,03000000000000000000','0,06000000000000000000','0,13000000000000000000','1,60000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','382','Carne, bovina, picanha, sem gordura, crua','72,42333333333330000000','133,52236666666700000000','558,65758213333300000000','21,25000000000000000000','4,74333333333333000000','75,23000000000000000000','0,00000000000000000000','NA','1,00666666666667000000','3,39333333333333000000','20,25000000000000000000','Tr','183,05333333333300000000','2,12666666666667000000','61,14666666666670000000','322,49666666666700000000','0,08000000000000000000','4,22666666666667000000','Tr','Tr','Tr','Tr','0,05000000000000000000','Tr','1,88666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','383','Carne, bovina, picanha, sem gordura, grelhada','54,63333333333330000000','238,46813333333300000000','997,75066986666700000000','31,90666666666670000000','11,33333333333330000000','99,71000000000000000000','0,00000000000000000000','NA','1,23000000000000000000','4,43000000000000000000','25,41666666666670000000','0,02000000000000000000','281,91000000000000000000','3,55333333333333000000','60,65666666666670000000','376,59666666666700000000','0,17333333333333300000','6,70000000000000000000','Tr','Tr','Tr','Tr','0,08333333333333330000','0,03000000000000000000','1,82333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','384','Carne, bovina, seca, cozida','47,19000000000000000000','312,79903369144600000000','1308,75115696501000000000','26,93125000000000000000','21,92933333333330000000','100,13600000000000000000','0,00000000000000000000','NA','4,71933333333333000000','12,76366666666670000000','11,90066666666670000000','0,01533333333333330000','82,37566666666670000000','1,88366666666667000000','1943,17933333333000000000','86,02633333333330000000','0,03300000000000000000','7,69800000000000000000','Tr','Tr','Tr','Tr','0,06333333333333330000','Tr','2,32000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','385','Carne, bovina, seca, crua','39,23600000000000000000','312,74842790365200000000','1308,53942234888000000000','19,65833333333330000000','25,36666666666670000000','91,54666666666670000000','0,00000000000000000000','NA','15,29400000000000000000','14,11000000000000000000','12,21966666666670000000','0,01200000000000000000','100,00166666666700000000','1,32966666666667000000','4439,55000000000000000000','190,15400000000000000000','Tr','3,65033333333333000000','Tr','Tr','Tr','Tr','0,07333333333333340000','Tr','2,83333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','386','Coxinha de frango, frita','42,21066666666670000000','283,04800000000000000000','1184,27283200000000000000','9,61041666666667000000','11,83600000000000000000','14,80633333333330000000','34,52058333333330000000','4,97033333333333000000','1,82233333333333000000','18,33333333333330000000','16,78266666666670000000','0,27633333333333300000','92,54233333333330000000','1,26166666666667000000','532,12933333333300000000','166,20500000000000000000','0,09466666666666670000','0,51300000000000000000','Tr','','','0,08666666666666670000','Tr','Tr','2,60000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','387','Croquete, de carne, cru','55,95566666666670000000','245,77192529714100000000','1028,30973544324000000000','12,04375000000000000000','15,56100000000000000000','29,85133333333330000000','13,94958333333330000000','','2,49000000000000000000','15,49666666666670000000','23,63500000000000000000','0,34000000000000000000','144,17633333333300000000','2,50800000000000000000','710,63733333333300000000','221,39633333333300000000','0,10200000000000000000','2,66500000000000000000','Tr','','','0,10666666666666700000','0,04000000000000000000','Tr','1,94666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','388','Croquete, de carne, frito','39,23500000000000000000','346,74201464740400000000','1450,76858928474000000000','16,86250000000000000000','22,67333333333330000000','38,10066666666670000000','18,14616666666670000000','','3,08300000000000000000','18,08800000000000000000','29,52166666666670000000','0,38566666666666700000','176,26000000000000000000','2,31100000000000000000','916,41100000000000000000','313,01900000000000000000','0,09033333333333330000','3,30466666666667000000','Tr','','','0,13666666666666700000','0,04333333333333330000','Tr','4,77333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','389','Empada de frango, pré-cozida, assada','28,19233333333330000000','358,19166666666700000000','1498,67393333333000000000','6,94375000000000000000','15,60500000000000000000','22,71966666666670000000','47,49291666666670000000','2,16433333333333000000','1,76600000000000000000','15,60933333333330000000','18,30466666666670000000','0,32333333333333300000','77,61800000000000000000','1,18533333333333000000','524,93333333333300000000','137,66366666666700000000','0,07200000000000000000','0,64300000000000000000','Tr','','','0,11666666666666700000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','390','Empada, de frango, pré-cozida','32,03133333333330000000','377,47966666666700000000','1579,37492533333000000000','7,34375000000000000000','22,88766666666670000000','23,28100000000000000000','35,52891666666670000000','2,22033333333333000000','2,20833333333333000000','13,56266666666670000000','17,33400000000000000000','0,25000000000000000000','77,93500000000000000000','0,74700000000000000000','770,72566666666700000000','156,35600000000000000000','0,08700000000000000000','0,50233333333333300000','Tr','','','0,10666666666666700000','Tr','0,03000000000000000000','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','391','Frango, asa, com pele, crua','67,47000000000000000000','213,18833333333300000000','891,97998666666700000000','18,10000000000000000000','15,06666666666670000000','113,45000000000000000000','0,00000000000000000000','NA','0,69000000000000000000','10,91666666666670000000','23,21666666666670000000','0,01000000000000000000','154,78666666666700000000','0,56666666666666700000','96,30000000000000000000','211,15666666666700000000','0,02333333333333330000','1,24666666666667000000','10,37333333333330000000','10,37333333333330000000','10,37333333333330000000','0,10666666666666700000','0,04333333333333330000','Tr','2,58333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','392','Frango, caipira, inteiro, com pele, cozido','59,68566666666670000000','242,88932666666700000000','1016,24894277333000000000','23,88333333333330000000','15,61566666666670000000','109,54933333333300000000','0,00000000000000000000','NA','0,80133333333333300000','16,76200000000000000000','18,34866666666670000000','0,01366666666666670000','161,94100000000000000000','1,66000000000000000000','56,09200000000000000000','210,00733333333300000000','0,07733333333333330000','1,69866666666667000000','16,16000000000000000000','16,16000000000000000000','16,16000000000000000000','0,03000000000000000000','Tr','Tr','6,33333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','393','Frango, caipira, inteiro, sem pele, cozido','61,41533333333330000000','195,76029666666700000000','819,06108125333300000000','29,57500000000000000000','7,70233333333333000000','105,52200000000000000000','0,00000000000000000000','NA','1,09333333333333000000','66,13866666666670000000','23,16633333333330000000','0,02166666666666670000','209,60366666666700000000','2,11500000000000000000','53,24333333333330000000','223,58600000000000000000','0,14566666666666700000','2,65800000000000000000','6,05333333333333000000','6,05333333333333000000','6,05333333333333000000','0,03000000000000000000','0,03000000000000000000','Tr','9,20000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','394','Frango, coração, cru','69,05000000000000000000','221,50283333333300000000','926,76785466666700000000','12,58333333333330000000','18,60000000000000000000','159,24000000000000000000','0,00000000000000000000','NA','0,77000000000000000000','5,50666666666667000000','19,83333333333330000000','0,05000000000000000000','193,39000000000000000000','4,09333333333333000000','95,06000000000000000000','220,07000000000000000000','0,19666666666666700000','2,00666666666667000000','9,38666666666667000000','9,38666666666667000000','9,38666666666667000000','0,22666666666666700000','0,35000000000000000000','Tr','3,38666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','395','Frango, coração, grelhado','63,51166666666670000000','207,27364333333300000000','867,23292370666600000000','22,43958333333330000000','12,09600000000000000000','280,35566666666700000000','0,60741666666665800000','NA','1,34533333333333000000','8,35166666666667000000','20,11900000000000000000','0,05866666666666670000','275,78000000000000000000','6,52633333333333000000','128,24200000000000000000','242,69466666666700000000','0,30400000000000000000','3,44800000000000000000','Tr','Tr','Tr','0,19666666666666700000','0,19333333333333300000','Tr','9,70000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','396','Frango, coxa, com pele, assada','59,79266666666670000000','215,11864753294000000000','900,05642127782000000000','28,49166666666670000000','10,36133333333330000000','145,48133333333300000000','0,05833333333334000000','NA','1,29600000000000000000','8,33633333333333000000','13,92766666666670000000','Tr','251,34666666666700000000','1,21600000000000000000','94,84233333333330000000','318,11000000000000000000','0,04666666666666670000','2,55166666666667000000','5,97333333333333000000','5,97333333333333000000','5,97333333333333000000','0,05000000000000000000','0,05333333333333330000','Tr','10,40000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','397','Frango, coxa, com pele, crua','72,85000000000000000000','161,47473333333300000000','675,61028426666700000000','17,09333333333330000000','9,81000000000000000000','97,40000000000000000000','0,00000000000000000000','NA','0,83000000000000000000','8,00000000000000000000','25,81333333333330000000','0,01666666666666670000','185,34000000000000000000','0,70333333333333300000','94,95666666666670000000','274,73333333333300000000','0,03000000000000000000','1,97333333333333000000','10,02333333333330000000','10,02333333333330000000','10,02333333333330000000','0,15666666666666700000','0,05333333333333330000','Tr','2,03666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','398','Frango, coxa, sem pele, cozida','66,65766666666670000000','167,42803216441500000000','700,51888657591100000000','26,85833333333330000000','5,84733333333333000000','132,91666666666700000000','0,00000000000000000000','NA','0,87400000000000000000','11,78100000000000000000','11,14366666666670000000','Tr','186,74333333333300000000','0,82633333333333300000','64,33933333333330000000','191,13666666666700000000','0,02733333333333330000','2,83333333333333000000','Tr','Tr','Tr','0,07333333333333340000','Tr','Tr','8,20000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','399','Frango, coxa, sem pele, crua','76,41666666666670000000','119,94746666666700000000','501,86020053333300000000','17,81333333333330000000','4,85666666666667000000','90,56000000000000000000','0,01999999999999700000','NA','0,89333333333333300000','7,97000000000000000000','27,23000000000000000000','0,02000000000000000000','196,48000000000000000000','0,77666666666666700000','98,36666666666670000000','291,19000000000000000000','0,03000000000000000000','2,24000000000000000000','11,66333333333330000000','11,66333333333330000000','11,66333333333330000000','0,16666666666666700000','0,04666666666666670000','Tr','3,53000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','400','Frango, fígado, cru','77,75000000000000000000','106,48456666666700000000','445,53142693333300000000','17,58666666666670000000','3,49000000000000000000','340,58000000000000000000','-0,02333333333333810000','NA','1,19666666666667000000','5,61000000000000000000','27,83000000000000000000','0,35000000000000000000','343,90333333333300000000','9,54000000000000000000','82,43333333333330000000','280,50000000000000000000','0,26000000000000000000','3,72666666666667000000','3863,33000000000000000000','3863,33000000000000000000','3863,33000000000000000000','0,61666666666666700000','0,55666666666666700000','Tr','6,36333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','401','Frango, filé, à milanesa','54,89000000000000000000','220,87278000000000000000','924,13171152000000000000','28,46041666666670000000','7,79066666666667000000','84,31566666666670000000','7,51291666666666000000','1,13033333333333000000','1,34600000000000000000','8,91200000000000000000','34,82600000000000000000','0,05700000000000000000','249,34533333333300000000','1,07766666666667000000','122,33233333333300000000','407,55900000000000000000','0,04666666666666670000','0,84233333333333300000','6,61000000000000000000','6,61000000000000000000','6,61000000000000000000','0,05333333333333330000','0,04000000000000000000','0,52000000000000000000','11,06666666666670000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','402','Frango, inteiro, com pele, cru','66,54000000000000000000','226,31916666666700000000','946,91939333333300000000','16,44333333333330000000','17,30666666666670000000','84,83700000000000000000','0,00000000000000000000','NA','0,74666666666666700000','6,30000000000000000000','24,30333333333330000000','0,01000000000000000000','173,55333333333300000000','0,62333333333333300000','62,87666666666670000000','217,24000000000000000000','0,04000000000000000000','1,12333333333333000000','7,00000000000000000000','7,00000000000000000000','7,00000000000000000000','0,08000000000000000000','0,03000000000000000000','Tr','3,27666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','403','Frango, inteiro, sem pele, assado','63,19733333333330000000','187,33779666666700000000','783,82134125333300000000','28,02500000000000000000','7,50233333333333000000','110,93533333333300000000','0,00000000000000000000','NA','1,15800000000000000000','9,06400000000000000000','13,88366666666670000000','Tr','232,94000000000000000000','0,55333333333333300000','70,27133333333330000000','283,27333333333300000000','0,02833333333333330000','1,58433333333333000000','Tr','Tr','Tr','0,09333333333333330000','Tr','Tr','11,20000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','404','Frango, inteiro, sem pele, cozido','67,45266666666670000000','170,38997583333300000000','712,91165888666700000000','24,98541666666670000000','7,06233333333333000000','98,92633333333330000000','0,00000000000000000000','NA','0,88866666666666700000','8,18333333333333000000','12,34633333333330000000','Tr','193,67333333333300000000','0,46200000000000000000','50,89033333333330000000','216,53333333333300000000','0,03966666666666670000','1,24166666666667000000','Tr','Tr','Tr','0,10000000000000000000','Tr','Tr','12,83333333333330000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','405','Frango, inteiro, sem pele, cru','74,85666666666670000000','129,09640000000000000000','540,13933760000000000000','20,58666666666670000000','4,56666666666667000000','78,24000000000000000000','0,00000000000000000000','NA','0,92666666666666700000','6,52333333333333000000','27,03666666666670000000','0,01000000000000000000','190,48000000000000000000','0,53666666666666700000','72,96000000000000000000','237,68000000000000000000','0,03000000000000000000','1,24000000000000000000','3,67000000000000000000','3,67000000000000000000','3,67000000000000000000','0,12000000000000000000','0,03000000000000000000','Tr','3,28333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','406','Frango, peito, com pele, assado','58,53666666666670000000','211,68314953072900000000','885,68229763656900000000','33,41666666666670000000','7,64900000000000000000','109,03266666666700000000','0,00000000000000000000','NA','1,49066666666667000000','8,25566666666667000000','18,14366666666670000000','0,01033333333333330000','297,02333333333300000000','0,48166666666666700000','55,70266666666670000000','380,31333333333300000000','0,01466666666666670000','0,95066666666666700000','6,22666666666667000000','6,22666666666667000000','6,22666666666667000000','0,12000000000000000000','Tr','Tr','15,80000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','407','Frango, peito, com pele, cru','71,94333333333330000000','149,46526666666700000000','625,36267573333300000000','20,78000000000000000000','6,73333333333333000000','79,93300000000000000000','0,00000000000000000000','NA','0,91000000000000000000','8,42000000000000000000','28,29000000000000000000','0,01000000000000000000','212,97000000000000000000','0,44333333333333300000','62,31333333333330000000','251,81666666666700000000','0,05000000000000000000','0,59666666666666700000','4,00000000000000000000','4,00000000000000000000','4,00000000000000000000','0,08666666666666670000','Tr','Tr','2,58333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','408','Frango, peito, sem pele, cozido','65,56900000000000000000','162,87476334631400000000','681,46800984098000000000','31,46875000000000000000','3,16000000000000000000','88,50800000000000000000','0,00000000000000000000','NA','0,98133333333333300000','6,44000000000000000000','13,76000000000000000000','Tr','224,42666666666700000000','0,33733333333333300000','36,16833333333330000000','231,05333333333300000000','0,01766666666666670000','0,94700000000000000000','Tr','Tr','Tr','0,09666666666666670000','Tr','Tr','7,60000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','409','Frango, peito, sem pele, cru','74,79333333333330000000','119,15926666666700000000','498,56237173333300000000','21,52666666666670000000','3,02000000000000000000','58,68300000000000000000','0,00000000000000000000','NA','0,97333333333333300000','7,36333333333333000000','31,26333333333330000000','0,01000000000000000000','222,03333333333300000000','0,43333333333333300000','56,14000000000000000000','267,08666666666700000000','0,03000000000000000000','0,66333333333333300000','2,00000000000000000000','2,00000000000000000000','2,00000000000000000000','0,10000000000000000000','Tr','Tr','5,85666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','410','Frango, peito, sem pele, grelhado','63,80933333333330000000','159,18500719261200000000','666,03007009388800000000','32,03333333333330000000','2,48366666666667000000','89,11733333333330000000','0,00000000000000000000','NA','1,44100000000000000000','5,34433333333333000000','18,27366666666670000000','Tr','295,01333333333300000000','0,32866666666666700000','50,24933333333330000000','387,37000000000000000000','0,01766666666666670000','0,77500000000000000000','Tr','Tr','Tr','0,11000000000000000000','Tr','Tr','24,83333333333330000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','411','Frango, sobrecoxa, com pele, assada','55,00433333333330000000','259,60476916666700000000','1086,18635419333000000000','28,70208333333330000000','15,19366666666670000000','158,25533333333300000000','0,00000000000000000000','NA','1,32600000000000000000','10,67533333333330000000','14,59500000000000000000','Tr','252,23333333333300000000','1,21333333333333000000','95,93533333333340000000','323,07333333333300000000','0,06066666666666670000','2,17133333333333000000','8,22000000000000000000','8,22000000000000000000','8,22000000000000000000','0,10333333333333300000','0,05000000000000000000','Tr','11,20000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','412','Frango, sobrecoxa, com pele, crua','63,58000000000000000000','254,53220000000000000000','1064,96272480000000000000','15,46000000000000000000','20,90000000000000000000','87,63000000000000000000','0,00000000000000000000','NA','0,75000000000000000000','7,09000000000000000000','21,50000000000000000000','0,01000000000000000000','154,18666666666700000000','0,71000000000000000000','68,26666666666670000000','190,19333333333300000000','0,04666666666666670000','1,30666666666667000000','6,58666666666667000000','6,58666666666667000000','6,58666666666667000000','0,09000000000000000000','0,06333333333333330000','Tr','3,39666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','413','Frango, sobrecoxa, sem pele, assada','55,63000000000000000000','232,88339666666700000000','974,38413165333300000000','29,17500000000000000000','12,00733333333330000000','145,10733333333300000000','0,00000000000000000000','NA','1,49200000000000000000','12,24933333333330000000','17,23400000000000000000','Tr','281,33666666666700000000','1,16933333333333000000','106,07966666666700000000','382,21000000000000000000','0,07166666666666670000','2,18166666666667000000','10,70000000000000000000','10,70000000000000000000','10,70000000000000000000','0,10000000000000000000','0,05000000000000000000','Tr','10,20000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','414','Frango, sobrecoxa, sem pele, crua','72,70666666666670000000','161,79630000000000000000','676,95571920000000000000','17,57000000000000000000','9,62000000000000000000','84,09000000000000000000','0,00000000000000000000','NA','0,88000000000000000000','6,29333333333333000000','26,33000000000000000000','0,02000000000000000000','187,28666666666700000000','0,90333333333333300000','79,74666666666670000000','241,08666666666700000000','0,05666666666666670000','1,67333333333333000000','3,92000000000000000000','3,92000000000000000000','3,92000000000000000000','0,11666666666666700000','0,06000000000000000000','Tr','4,06000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','415','Hambúrguer, bovino, cru','63,60466666666670000000','214,83600000000000000000','898,87382400000000000000','13,15625000000000000000','16,17733333333330000000','70,01200000000000000000','4,15375000000000000000','*','2,90800000000000000000','34,06233333333330000000','24,52300000000000000000','0,35733333333333300000','140,71700000000000000000','1,89133333333333000000','869,45900000000000000000','382,58700000000000000000','0,16200000000000000000','1,70166666666667000000','Tr','','','0,05666666666666670000','0,08333333333333330000','0,03666666666666670000','3,53333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','416','Hambúrguer, bovino, frito','52,45666666666670000000','258,28300000000000000000','1080,65607200000000000000','19,97291666666670000000','17,01233333333330000000','48,90133333333330000000','6,32008333333333000000','*','4,23800000000000000000','62,38566666666670000000','59,70166666666670000000','0,52166666666666700000','324,46000000000000000000','3,01666666666667000000','1251,80100000000000000000','660,09366666666700000000','0,17466666666666700000','3,18033333333333000000','Tr','','','0,13333333333333300000','0,05666666666666670000','Tr','2,73333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','417','Hambúrguer, bovino, grelhado','59,22766666666670000000','209,83166666666700000000','877,93569333333400000000','13,15625000000000000000','12,43033333333330000000','58,52700000000000000000','11,33341666666670000000','*','3,85233333333333000000','56,21366666666670000000','47,56666666666670000000','0,39766666666666700000','262,67000000000000000000','2,63900000000000000000','1090,33433333333000000000','537,56033333333300000000','0,18000000000000000000','3,01833333333333000000','Tr','','','0,17666666666666700000','0,05666666666666670000','Tr','5,76666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','418','Lingüiça, frango, crua','64,76066666666670000000','218,10881416666700000000','912,56727847333300000000','14,23958333333330000000','17,43966666666670000000','64,12633333333330000000','0,00000000000000000000','NA','3,28000000000000000000','10,83766666666670000000','18,96600000000000000000','0,05300000000000000000','181,50666666666700000000','0,46566666666666700000','1125,81133333333000000000','279,73200000000000000000','0,05433333333333330000','0,69400000000000000000','Tr','','','0,11000000000000000000','0,05333333333333330000','Tr','4,60000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','419','Lingüiça, frango, frita','59,57066666666670000000','245,46100666666700000000','1027,00885189333000000000','18,31666666666670000000','18,54200000000000000000','75,78600000000000000000','0,00000000000000000000','NA','3,79166666666667000000','15,48166666666670000000','29,19200000000000000000','0,10366666666666700000','262,06666666666700000000','0,78933333333333300000','1373,89366666667000000000','363,79366666666700000000','0,03766666666666670000','1,16466666666667000000','Tr','','','0,11000000000000000000','0,05000000000000000000','Tr','5,66666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','420','Lingüiça, frango, grelhada','58,58300000000000000000','243,65856750000000000000','1019,46744642000000000000','18,18958333333330000000','18,40233333333330000000','80,47833333333330000000','0,00000000000000000000','NA','3,82233333333333000000','13,92533333333330000000','21,10033333333330000000','0,09900000000000000000','228,01666666666700000000','0,72266666666666700000','1351,49366666667000000000','355,99700000000000000000','0,09300000000000000000','1,02966666666667000000','Tr','','','0,11666666666666700000','0,04000000000000000000','Tr','5,96666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','421','Lingüiça, porco, crua','62,48266666666670000000','227,20345083333300000000','950,61923828666700000000','16,06458333333330000000','17,58400000000000000000','52,92666666666670000000','0,00000000000000000000','NA','3,20666666666667000000','6,13366666666667000000','14,04733333333330000000','0,00600000000000000000','157,47666666666700000000','0,44433333333333300000','1175,72233333333000000000','316,32933333333300000000','0,04400000000000000000','1,35800000000000000000','Tr','','','0,49000000000000000000','0,05333333333333330000','Tr','2,60000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','422','Lingüiça, porco, frita','54,60933333333330000000','279,54358916666700000000','1169,61037707333000000000','20,45208333333330000000','21,30966666666670000000','74,70533333333330000000','0,00000000000000000000','NA','3,86300000000000000000','8,47566666666667000000','18,21766666666670000000','0,01100000000000000000','210,78000000000000000000','0,86866666666666700000','1431,59366666667000000000','408,94033333333300000000','0,06000000000000000000','3,08200000000000000000','Tr','','','0,41333333333333300000','0,06666666666666670000','Tr','5,83333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','423','Lingüiça, porco, grelhada','50,47933333333330000000','296,48960916666700000000','1240,51252475333000000000','23,16875000000000000000','21,90233333333330000000','81,70433333333330000000','0,00000000000000000000','NA','4,00333333333333000000','8,13866666666667000000','18,78500000000000000000','0,01200000000000000000','209,81333333333300000000','1,01133333333333000000','1455,86033333333000000000','426,60033333333300000000','0,07166666666666670000','3,47533333333333000000','Tr','','','0,39666666666666700000','0,07000000000000000000','Tr','6,60000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','424','Mortadela','56,43933333333330000000','268,81998901673200000000','1124,74283404601000000000','11,95208333333330000000','21,64933333333330000000','82,76066666666670000000','5,81591666666666000000','NA','4,14333333333333000000','66,54700000000000000000','19,14333333333330000000','0,11233333333333300000','215,67400000000000000000','1,46966666666667000000','1212,16700000000000000000','247,28200000000000000000','0,07766666666666670000','1,01933333333333000000','24,55333333333330000000','','','0,14333333333333300000','0,06333333333333330000','Tr','3,00333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','425','Peru, congelado, assado','65,32300000000000000000','163,07139793137700000000','682,29072894488200000000','26,20208333333330000000','5,67500000000000000000','91,23800000000000000000','0,00000000000000000000','NA','2,23333333333333000000','13,84100000000000000000','11,54333333333330000000','0,01833333333333330000','197,36133333333300000000','0,58666666666666700000','627,87566666666700000000','175,12400000000000000000','0,03066666666666670000','1,21133333333333000000','Tr','Tr','Tr','0,06000000000000000000','Tr','Tr','6,23333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','426','Peru, congelado, cru','78,17666666666670000000','93,72243382612860000000','392,13466312852200000000','18,08333333333330000000','1,83000000000000000000','68,16266666666670000000','0,00000000000000000000','NA','2,46000000000000000000','9,88133333333333000000','18,84333333333330000000','Tr','216,67033333333300000000','0,87400000000000000000','710,68300000000000000000','281,35400000000000000000','0,35700000000000000000','1,43633333333333000000','Tr','Tr','Tr','0,06333333333333330000','Tr','Tr','4,23333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','427','Porco, bisteca, crua','67,70333333333330000000','164,11533659299200000000','686,65856830507900000000','21,50000000000000000000','8,01666666666667000000','56,38333333333330000000','0,00000000000000000000','NA','0,99000000000000000000','6,11000000000000000000','24,07433333333330000000','Tr','195,16333333333300000000','0,53333333333333300000','54,29000000000000000000','334,99133333333300000000','0,07025000000000000000','1,43000000000000000000','Tr','Tr','Tr','0,89666666666666700000','Tr','Tr','2,64666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','428','Porco, bisteca, frita','47,32666666666670000000','311,16904533485600000000','1301,93128568104000000000','33,74791666666670000000','18,52166666666670000000','126,30233333333300000000','0,00000000000000000000','NA','1,55433333333333000000','69,14566666666670000000','29,12500000000000000000','0,00766666666666667000','289,87433333333300000000','0,82100000000000000000','63,02700000000000000000','403,51333333333300000000','0,06500000000000000000','2,16433333333333000000','9,74000000000000000000','9,74000000000000000000','9,74000000000000000000','0,33666666666666700000','Tr','Tr','3,24666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','429','Porco, bisteca, grelhada','51,84366666666670000000','280,08403490277100000000','1171,87160203320000000000','28,88958333333330000000','17,37533333333330000000','81,68266666666670000000','0,00000000000000000000','NA','1,24833333333333000000','34,31366666666670000000','24,74100000000000000000','Tr','229,43833333333300000000','0,86466666666666700000','51,44500000000000000000','366,41600000000000000000','0,05566666666666670000','2,34666666666667000000','Tr','Tr','Tr','0,76666666666666700000','0,13666666666666700000','0,03000000000000000000','1,92333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','430','Porco, costela, assada','36,92000000000000000000','402,16844745083700000000','1682,67278413430000000000','30,22291666666670000000','30,27900000000000000000','112,85633333333300000000','0,00000000000000000000','NA','1,37466666666667000000','16,77183333333330000000','14,04233333333330000000','Tr','200,78033333333300000000','1,03700000000000000000','62,67933333333330000000','245,97066666666700000000','0,07266666666666670000','3,09766666666667000000','Tr','Tr','Tr','0,71333333333333300000','0,05333333333333330000','Tr','10,63333333333330000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','431','Porco, costela, crua','61,21000000000000000000','255,60634206136100000000','1069,45693518473000000000','18,00000000000000000000','19,81666666666670000000','68,82500000000000000000','0,00000000000000000000','NA','0,92333333333333300000','14,52733333333330000000','17,96933333333330000000','Tr','159,08100000000000000000','0,89966666666666700000','87,98166666666670000000','248,22966666666700000000','0,05433333333333330000','2,27366666666667000000','Tr','Tr','Tr','0,62333333333333300000','Tr','Tr','8,26666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','432','Porco, lombo, assado','56,56066666666670000000','210,23466557963700000000','879,62184078520100000000','35,72500000000000000000','6,39566666666667000000','103,07700000000000000000','0,00000000000000000000','NA','1,36600000000000000000','19,51133333333330000000','18,14233333333330000000','Tr','238,36433333333300000000','0,45733333333333300000','38,92400000000000000000','311,13866666666700000000','0,02500000000000000000','1,75833333333333000000','Tr','Tr','Tr','0,74666666666666700000','0,06666666666666670000','0,10666666666666700000','12,43333333333330000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','433','Porco, lombo, cru','67,73333333333330000000','175,62519525011400000000','734,81581692647600000000','22,60416666666670000000','8,77000000000000000000','55,38733333333330000000','0,00000000000000000000','NA','1,02666666666667000000','4,15500000000000000000','23,91500000000000000000','Tr','194,52100000000000000000','0,47333333333333300000','53,06766666666670000000','334,38400000000000000000','0,00800000000000000000','0,93166666666666700000','Tr','Tr','Tr','0,94666666666666700000','Tr','Tr','13,83333333333330000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','434','Porco, orelha, salgada, crua','59,66666666666670000000','258,49175833333300000000','1081,52951686667000000000','18,52083333333330000000','19,89000000000000000000','83,00800000000000000000','0,00000000000000000000','NA','2,04333333333333000000','5,44266666666667000000','2,07066666666667000000','0,00533333333333333000','30,79100000000000000000','1,40766666666667000000','615,60200000000000000000','228,46433333333300000000','0,23133333333333300000','0,56866666666666700000','Tr','Tr','Tr','0,07333333333333340000','0,03000000000000000000','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','435','Porco, pernil, assado','49,25633333333330000000','262,25960666666700000000','1097,29419429333000000000','32,13333333333330000000','13,86366666666670000000','109,79833333333300000000','0,00000000000000000000','NA','1,44733333333333000000','17,58900000000000000000','27,34700000000000000000','0,01233333333333330000','247,08933333333300000000','1,25166666666667000000','62,40633333333330000000','395,19033333333300000000','0,09333333333333330000','3,25466666666667000000','Tr','Tr','Tr','0,77333333333333300000','0,09000000000000000000','Tr','6,56666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','436','Porco, pernil, cru','67,08000000000000000000','186,05575000000000000000','778,45725800000000000000','20,12500000000000000000','11,10000000000000000000','58,68633333333330000000','0,00000000000000000000','NA','1,02333333333333000000','12,93566666666670000000','22,88233333333330000000','Tr','192,47900000000000000000','0,88733333333333300000','101,89333333333300000000','255,58266666666700000000','0,16266666666666700000','1,73100000000000000000','Tr','Tr','Tr','1,06333333333333000000','0,05666666666666670000','Tr','5,66666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','437','Porco, rabo, salgado, cru','43,78966666666670000000','377,41525750000000000000','1579,10543738000000000000','15,58125000000000000000','34,46600000000000000000','89,09366666666670000000','0,00000000000000000000','NA','3,49933333333333000000','21,62900000000000000000','3,59533333333333000000','0,01200000000000000000','42,39400000000000000000','0,62333333333333300000','1157,66533333333000000000','23,76066666666670000000','0,04700000000000000000','1,41066666666667000000','Tr','Tr','Tr','0,20333333333333300000','0,05666666666666670000','Tr','1,43333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','438','Presunto, com capa de gordura','73,94633333333330000000','127,84921266563700000000','534,92110579302700000000','14,37083333333330000000','6,77133333333333000000','39,51233333333330000000','1,39750000000000000000','NA','3,51400000000000000000','12,48233333333330000000','17,04166666666670000000','0,03533333333333330000','273,87166666666700000000','0,67900000000000000000','1020,77166666667000000000','294,58000000000000000000','0,03500000000000000000','1,32466666666667000000','Tr',' ',' ','0,62333333333333300000','0,03333333333333330000','Tr','3,78000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','439','Presunto, sem capa de gordura','77,18100000000000000000','93,74328072086970000000','392,22188653611900000000','14,29166666666670000000','2,70666666666667000000','35,77333333333330000000','2,14566666666667000000','NA','3,67500000000000000000','23,27433333333330000000','17,51333333333330000000','0,04133333333333330000','244,06233333333300000000','0,82766666666666700000','1039,18500000000000000000','307,30166666666700000000','0,04266666666666670000','1,45900000000000000000','Tr',' ',' ','0,50333333333333300000','0,03000000000000000000','Tr','4,00333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','440','Quibe, assado','69,01800000000000000000','136,22887614158800000000','569,98161777640400000000','14,59375000000000000000','2,67633333333333000000','33,73200000000000000000','12,86125000000000000000','1,89666666666667000000','0,85066666666666700000','15,61800000000000000000','36,08000000000000000000','0,76466666666666700000','174,37000000000000000000','2,15266666666667000000','39,89300000000000000000','287,77800000000000000000','0,51066666666666700000','4,11633333333333000000','Tr','','','0,04333333333333330000','0,04000000000000000000','Tr','1,80666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','441','Quibe, cru','74,50900000000000000000','109,49066929475500000000','458,10896032925300000000','12,35416666666670000000','1,66766666666667000000','26,93433333333330000000','10,77416666666670000000','1,64666666666667000000','0,69500000000000000000','12,08800000000000000000','25,69433333333330000000','0,39000000000000000000','125,79000000000000000000','1,65400000000000000000','38,76600000000000000000','241,73966666666700000000','0,13200000000000000000','2,75333333333333000000','Tr','','','0,08666666666666670000','0,03000000000000000000','Tr','1,20333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','442','Quibe, frito','53,96366666666670000000','253,83130886964000000000','1062,03019631057000000000','14,88958333333330000000','15,79900000000000000000','37,77166666666670000000','12,33741666666670000000','','3,01033333333333000000','21,72566666666670000000','38,77266666666670000000','0,72000000000000000000','165,83400000000000000000','1,95266666666667000000','835,82500000000000000000','322,46733333333300000000','0,15800000000000000000','2,78200000000000000000','Tr','','','0,12333333333333300000','0,10333333333333300000','Tr','1,50333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','443','Salame','34,70333333333330000000','397,84250653493400000000','1664,57304734216000000000','25,81041666666670000000','30,64133333333330000000','85,08733333333330000000','2,90625000000001000000','NA','5,93866666666667000000','87,01833333333330000000','29,91500000000000000000','0,02866666666666670000','354,26800000000000000000','1,25300000000000000000','1574,16900000000000000000','547,99900000000000000000','0,04700000000000000000','3,15450000000000000000','Tr','','','0,88333333333333300000','0,23333333333333300000','Tr','12,48666666666670000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','444','Toucinho, cru','27,60666666666670000000','592,53117500000000000000','2479,15043620000000000000','11,47916666666670000000','60,25666666666670000000','73,08366666666670000000','0,00000000000000000000','NA','0,30333333333333300000','2,38600000000000000000','3,56800000000000000000','Tr','35,35866666666670000000','0,43933333333333300000','49,58666666666670000000','57,57000000000000000000','0,11233333333333300000','0,21066666666666700000','Tr','Tr','Tr','Tr','Tr','Tr','5,10000000000000000000','','28/05/18 21:22','28/05/18 21:22'),
+('Carnes e derivados','445','Toucinho, frito','6,32533333333333000000','696,56400666666700000000','2914,42380389333000000000','27,28333333333330000000','64,30866666666670000000','89,46366666666670000000','0,00000000000000000000','NA','0,73333333333333300000','9,44333333333333000000','9,46033333333333000000','0,01200000000000000000','94,71500000000000000000','0,86500000000000000000','124,85033333333300000000','170,85900000000000000000','0,09800000000000000000','0,84266666666666700000','Tr','Tr','Tr','Tr','Tr','Tr','5,03333333333333000000','','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','446','Bebida láctea, pêssego','87,69333333333330000000','55,16483333333330000000','230,80966266666700000000','2,13333333333333000000','1,90666666666667000000','5,36975000000000000000','7,57000000000001000000','0,29333333333333300000','0,69666666666666700000','88,63266666666660000000','8,59333333333333000000','Tr','63,10466666666670000000','Tr','46,26300000000000000000','62,26366666666670000000','0,01966666666666670000','0,24366666666666700000','Tr','','','0,02666666666666670000','0,13666666666666700000','Tr','0,33000000000000000000','2,05333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','447','Creme de Leite','70,89266666666670000000','221,48354127513300000000','926,68713669515700000000','1,50780669371287000000','22,47933333333330000000','66,47566666666670000000','4,50952663962046000000','NA','0,61066666666666700000','82,73366666666660000000','7,54066666666667000000','0,00600000000000000000','118,45733333333300000000','0,30100000000000000000','51,72400000000000000000','118,65033333333300000000','0,01900000000000000000','0,29233333333333300000','127,66666666666700000000','','','Tr','0,10000000000000000000','Tr','0,00000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','448','Iogurte, natural','90,04000000000000000000','51,48953333333330000000','215,43220746666600000000','4,06333333333333000000','3,04000000000000000000','13,77750000000000000000','1,91666666666666000000','NA','0,94000000000000000000','143,10333333333300000000','11,25333333333330000000','Tr','119,03533333333300000000','Tr','51,61633333333330000000','71,27866666666670000000','0,01833333333333330000','0,44300000000000000000','22,50000000000000000000','','','0,03666666666666670000','0,22333333333333300000','Tr','Tr','0,92666666666666700000','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','449','Iogurte, natural, desnatado','89,21633333333330000000','41,49271128155830000000','173,60550400204000000000','3,83438006877899000000','0,31566666666666700000','3,33166666666667000000','5,77395333333333000000','NA','0,85966666666666700000','156,96133333333300000000','11,98333333333330000000','Tr','109,68333333333300000000','Tr','59,64466666666670000000','182,12966666666700000000','Tr','0,51366666666666700000','*','','','Tr','0,21666666666666700000','Tr','Tr','0,34666666666666700000','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','450','Iogurte, sabor abacaxi','*','*','*','*','*','5,63000000000000000000','*','*','*','*','*','*','*','*','*','*','*','*','*','','','*','*','*','*','','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','451','Iogurte, sabor morango','84,63333333333330000000','69,56560000000000000000','291,06247040000000000000','2,71000000000000000000','2,33000000000000000000','7,49425000000000000000','9,69333333333334000000','0,21666666666666700000','0,63333333333333300000','101,03166666666700000000','8,04000000000000000000','Tr','73,48133333333330000000','Tr','37,66300000000000000000','52,35366666666670000000','0,01766666666666670000','0,30433333333333300000','27,02666666666670000000','','','0,03333333333333330000','0,12000000000000000000','0,02000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','452','Iogurte, sabor pêssego','85,05666666666670000000','67,84940000000000000000','283,88188960000000000000','2,53000000000000000000','2,33666666666667000000','8,40000000000000000000','9,43333333333334000000','0,71666666666666700000','0,64333333333333300000','95,05000000000000000000','7,95666666666667000000','Tr','65,55166666666670000000','0,05300000000000000000','36,96366666666670000000','52,09033333333330000000','0,01800000000000000000','0,30033333333333300000','21,27666666666670000000','','','0,02000000000000000000','0,10333333333333300000','Tr','0,38033333333333300000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','453','Leite, condensado','26,96000000000000000000','312,57260000000000000000','1307,80375840000000000000','7,67000000000000000000','6,74000000000000000000','27,63566666666670000000','56,99666666666670000000','NA','1,63333333333333000000','246,26666666666700000000','21,97666666666670000000','Tr','187,18333333333300000000','0,12666666666666700000','93,80333333333330000000','328,93000000000000000000','0,03333333333333330000','0,86000000000000000000','52,95333333333330000000','','','0,06000000000000000000','0,33000000000000000000','0,57333333333333300000','Tr','2,14333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','454','Leite, de cabra','87,07066666666670000000','66,41574188654330000000','277,88346405329700000000','3,07090672175090000000','3,75433333333333000000','13,99166666666670000000','5,24609333333333000000','NA','0,85800000000000000000','112,24733333333300000000','9,79866666666667000000','Tr','113,20333333333300000000','0,10300000000000000000','73,94700000000000000000','139,99400000000000000000','0,04066666666666670000','0,35466666666666700000','34,74000000000000000000','','','Tr','0,14400000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','455','Leite, de vaca, achocolatado','80,89366666666670000000','82,82099627199360000000','346,52304840202100000000','2,09902003765106000000','2,16900000000000000000','6,08133333333333000000','14,15831333333330000000','0,64566666666666700000','0,68000000000000000000','69,79100000000000000000','12,88066666666670000000','0,05000000000000000000','70,87400000000000000000','0,45766666666666700000','71,74166666666670000000','155,23966666666700000000','0,04466666666666670000','0,31100000000000000000','38,94333333333330000000','','','0,07366666666666670000','0,29033333333333300000','0,14000000000000000000','1,23000000000000000000','3,26166666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','456','Leite, de vaca, desnatado, pó','3,10000000000000000000','361,60800000000000000000','1512,96787200000000000000','34,69000000000000000000','0,93333333333333300000','24,78533333333330000000','53,04333333333330000000','NA','8,23333333333333000000','1363,17000000000000000000','108,70666666666700000000','Tr','1673,43333333333000000000','0,92666666666666700000','431,67333333333300000000','1555,66333333333000000000','0,15666666666666700000','3,84333333333333000000','299,45666666666700000000','','','0,31666666666666700000','1,20333333333333000000','Tr','0,80666666666666700000','','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','457','Leite, de vaca, desnatado, UHT','*','*','*','*','*','3,75433333333333000000','*','NA','0,82666666666666700000','133,80666666666700000000','10,23000000000000000000','Tr','85,37000000000000000000','Tr','51,14000000000000000000','140,02666666666700000000','0,02000000000000000000','0,38000000000000000000','Tr','','','0,04000000000000000000','0,26333333333333300000','Tr','1,49000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','458','Leite, de vaca, integral','*','*','*','*','*','10,49000000000000000000','*','NA','0,76000000000000000000','122,58000000000000000000','9,63666666666667000000','Tr','81,97666666666670000000','Tr','63,76000000000000000000','133,19000000000000000000','0,02000000000000000000','0,38000000000000000000','20,90333333333330000000','','','0,04000000000000000000','0,24000000000000000000','Tr','1,52000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','459','Leite, de vaca, integral, pó','2,70000000000000000000','496,65030000000000000000','2077,98485520000000000000','25,42000000000000000000','26,90333333333330000000','85,25533333333330000000','39,18000000000000000000','NA','5,79666666666667000000','890,27333333333300000000','77,42666666666670000000','Tr','1242,28333333333000000000','0,52333333333333300000','323,20333333333300000000','1131,66333333333000000000','0,11000000000000000000','2,72666666666667000000','361,05666666666700000000','','','0,24333333333333300000','1,02666666666667000000','Tr','Tr','*','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','460','Leite, fermentado','81,87933333333330000000','69,62147400000000000000','291,29624721600000000000','1,89486000000000000000','0,09900000000000000000','1,85166000000000000000','15,67447333333330000000','NA','0,45233333333333300000','71,52800000000000000000','6,23166666666667000000','0,01833333333333330000','62,81033333333330000000','Tr','33,43066666666670000000','94,48333333333330000000','0,01300000000000000000','0,26133333333333300000','Tr','','','0,07500000000000000000','0,10666666666666700000','Tr','Tr','0,49000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','461','Queijo, minas, frescal','56,12466666666670000000','264,27312800000000000000','1105,71876755200000000000','17,41102000000000000000','20,18066666666670000000','61,99633333333330000000','3,24031333333333000000','NA','3,04333333333333000000','579,25333333333400000000','6,88366666666667000000','0,01566666666666670000','123,30966666666700000000','0,93100000000000000000','31,22633333333330000000','104,84666666666700000000','Tr','0,29233333333333300000','160,50666666666700000000','','','Tr','0,25133333333333300000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','462','Queijo, minas, meia cura','47,11833333333330000000','320,72181773326000000000','1341,90008539596000000000','21,21137371381120000000','24,61000000000000000000','76,29866666666670000000','3,57295961952209000000','NA','3,48733333333333000000','695,91733333333300000000','27,07266666666670000000','0,02266666666666670000','402,53233333333300000000','0,21900000000000000000','501,16566666666700000000','119,97733333333300000000','0,06866666666666670000','2,68200000000000000000','111,33333333333300000000','','','0,03000000000000000000','0,32333333333333300000','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','463','Queijo, mozarela','45,33833333333330000000','329,87071842088700000000','1380,17908587299000000000','22,64900040626530000000','25,18300000000000000000','79,57900000000000000000','3,04933292706807000000','NA','3,78033333333333000000','875,03933333333300000000','23,57366666666670000000','0,02833333333333330000','469,99833333333300000000','0,30600000000000000000','581,35700000000000000000','61,89433333333330000000','0,08266666666666670000','3,52200000000000000000','109,00000000000000000000','','','Tr','0,20000000000000000000','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','464','Queijo, parmesão','21,24666666666670000000','452,96375533333300000000','1895,20035231467000000000','35,55361333333330000000','33,52933333333330000000','105,84400000000000000000','1,66072000000000000000','NA','8,00966666666667000000','991,96766666666700000000','33,36733333333330000000','0,04833333333333330000','744,62333333333300000000','0,53233333333333300000','1844,08100000000000000000','96,23700000000000000000','0,16866666666666700000','4,35866666666667000000','66,15333333333330000000','','','Tr','0,44166666666666700000','0,23333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','465','Queijo, pasteurizado','54,42133333333330000000','303,07980333333300000000','1268,08589714667000000000','9,35733333333333000000','27,43533333333330000000','82,15666666666670000000','5,67633333333333000000','NA','3,10966666666667000000','323,29933333333300000000','16,00166666666670000000','0,01300000000000000000','577,94333333333300000000','0,26533333333333300000','780,42600000000000000000','193,72100000000000000000','0,04533333333333330000','1,30466666666667000000','57,31333333333330000000','','','Tr','0,20000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','466','Queijo, petit suisse, morango','72,21500000000000000000','121,10595400000000000000','506,70731153600000000000','5,78666000000000000000','2,83833333333333000000','12,06933333333330000000','18,46200666666670000000','NA','0,69800000000000000000','730,93266666666700000000','26,50866666666670000000','0,02333333333333330000','448,45866666666700000000','0,14100000000000000000','412,46900000000000000000','121,46166666666700000000','0,01466666666666670000','2,66333333333333000000','272,65666666666700000000','','','0,22333333333333300000','0,26666666666666700000','0,21000000000000000000','2,68333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','467','Queijo, prato','42,44433333333330000000','359,88046240505500000000','1505,73985470275000000000','22,66176040649410000000','29,10633333333330000000','90,90233333333330000000','1,87857292683919000000','NA','3,90900000000000000000','939,99333333333300000000','28,27366666666670000000','0,03233333333333330000','460,83866666666700000000','0,28000000000000000000','579,77400000000000000000','73,47166666666670000000','0,09866666666666670000','3,46166666666667000000','122,66666666666700000000','','','Tr','0,22000000000000000000','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','468','Queijo, requeijão, cremoso','62,46633333333330000000','256,57814866666700000000','1073,52297402133000000000','9,62954666666667000000','23,44100000000000000000','73,66900000000000000000','2,43245333333333000000','NA','2,03066666666667000000','259,46666666666700000000','11,62833333333330000000','0,01533333333333330000','447,88033333333300000000','0,11500000000000000000','557,92466666666700000000','93,06433333333330000000','0,04500000000000000000','1,27700000000000000000','194,58666666666700000000','','','Tr','0,19066666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leite e derivados','469','Queijo, ricota','73,57066666666670000000','139,73178000000000000000','584,63776752000000000000','12,60050000000000000000','8,10866666666667000000','48,70333333333330000000','3,78616666666667000000','NA','1,93400000000000000000','253,23600000000000000000','11,80866666666670000000','Tr','161,51866666666700000000','0,13666666666666700000','282,57900000000000000000','112,37833333333300000000','Tr','0,46033333333333300000','52,84666666666670000000','','','Tr','0,14666666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','470','Bebida isotônica, sabores variados','93,50666666666670000000','25,61333333333330000000','107,16618666666700000000','0,00000000000000000000','0,00000000000000000000','NA','6,40333333333334000000','NA','0,09000000000000000000','1,23333333333333000000','Tr','Tr','8,97333333333333000000','0,67000000000000000000','44,08333333333330000000','13,02666666666670000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','471','Café, infusão 10%','97,37200000000000000000','9,07086859961352000000','37,95251422078300000000','0,71250000000000000000','0,06933333333333330000','NA','1,47866666666667000000','NA','0,36750000000000000000','3,15933333333333000000','9,66166666666667000000','0,03766666666666670000','9,49533333333333000000','Tr','1,02733333333333000000','155,70400000000000000000','0,00600000000000000000','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','472','Cana, aguardente 1','','215,66160000000000000000','902,32813440000000000000','','','NA','','NA','','Tr','Tr','Tr','Tr','Tr','3,14566666666667000000','Tr','0,06300000000000000000','Tr','NA','','','Tr','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','473','Cana, caldo de','81,72766666666670000000','65,34359826898570000000','273,39761515743600000000','Tr','Tr','NA','18,15100000000000000000','0,13633333333333300000','0,12133333333333300000','9,08300000000000000000','11,97400000000000000000','0,20600000000000000000','4,77866666666667000000','0,75266666666666700000','Tr','17,97300000000000000000','0,00700000000000000000','0,05066666666666670000','NA','','','Tr','Tr','0,03000000000000000000','Tr','2,77966600000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','474','Cerveja, pilsen 2','92,38000000000000000000','40,72018855062870000000','170,37326889583000000000','0,56250000000000000000','Tr','NA','3,31750000000000000000','NA','0,12000000000000000000','4,98500000000000000000','6,74366666666667000000','0,00533333333333333000','19,00266666666670000000','Tr','4,23033333333333000000','29,46666666666670000000','Tr','Tr','NA','','','Tr','Tr','0,14333333333333300000','2,91666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','475','Chá, erva-doce, infusão 5%','99,60866666666670000000','1,39705997387564000000','5,84529893069567000000','0,00000000000000000000','0,00000000000000000000','NA','0,39133333333332100000','NA','0,00000000000000000000','1,93100000000000000000','0,88100000000000000000','0,00633333333333333000','0,65100000000000000000','Tr','0,62533333333333300000','9,92900000000000000000','0,00600000000000000000','Tr','NA','','','1,23333333333333000000','0,22666666666666700000',' ',' ',' ','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','476','Chá, mate, infusão 5%','99,30500000000000000000','2,73074995112414000000','11,42545779550340000000','0,00000000000000000000','0,05200000000000000000','NA','0,64299999999999300000','NA','0,00000000000000000000','0,64466666666666700000','2,03700000000000000000','0,27400000000000000000','Tr','Tr','Tr','5,33633333333333000000','Tr','Tr','NA','','','0,89333333333333300000','Tr',' ',' ',' ','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','477','Chá, preto, infusão 5%','99,37033333333330000000','2,24790995796521000000','9,40525526412644000000','0,00000000000000000000','0,00000000000000000000','NA','0,62966666666666500000','NA','0,00000000000000000000','0,25233333333333300000','0,95600000000000000000','0,08866666666666670000','1,51133333333333000000','Tr','Tr','13,43766666666670000000','Tr','Tr','NA','','','3,11333333333333000000','0,48333333333333300000',' ',' ',' ','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','478','Coco, água de','94,25200000000000000000','21,50859424050650000000','89,99195830227920000000','0,00000000000000000000','0,00000000000000000000','NA','5,28466666666667000000','0,13033333333333300000','0,46333333333333300000','18,83733333333330000000','5,15833333333333000000','0,25300000000000000000','3,75533333333333000000','Tr','1,78233333333333000000','161,65100000000000000000','Tr','Tr','NA','','','0,00500000000000000000','Tr','Tr','Tr','2,40866666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','479','Refrigerante, tipo água tônica','92,00666666666670000000','30,77940000000000000000','128,78100960000000000000','0,00000000000000000000','0,00000000000000000000','NA','7,95333333333334000000','NA','0,04000000000000000000','1,07533333333333000000','Tr','Tr','0,15166666666666700000','Tr','8,29033333333333000000','1,50566666666667000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','480','Refrigerante, tipo cola','91,27666666666670000000','33,51420000000000000000','140,22341280000000000000','0,00000000000000000000','0,00000000000000000000','NA','8,66000000000001000000','NA','0,06333333333333330000','1,37233333333333000000','Tr','Tr','16,67733333333330000000','Tr','7,11933333333333000000','0,90500000000000000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','481','Refrigerante, tipo guaraná','89,95666666666670000000','38,70000000000000000000','161,92080000000000000000','0,00000000000000000000','0,00000000000000000000','NA','10,00000000000000000000','NA','0,04333333333333330000','1,40766666666667000000','Tr','Tr','Tr','Tr','9,00966666666667000000','1,38133333333333000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','482','Refrigerante, tipo laranja','88,17333333333330000000','45,62730000000000000000','190,90462320000000000000','0,00000000000000000000','0,00000000000000000000','NA','11,79000000000000000000','NA','0,03666666666666670000','2,34433333333333000000','1,20766666666667000000','Tr','1,46700000000000000000','Tr','9,27166666666667000000','15,50433333333330000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Bebidas (alcoólicas e não alcoólicas)','483','Refrigerante, tipo limão','89,69000000000000000000','39,71910000000000000000','166,18471440000000000000','0,00000000000000000000','0,00000000000000000000','NA','10,26333333333330000000','NA','0,04666666666666670000','1,75066666666667000000','0,53100000000000000000','Tr','Tr','Tr','8,80333333333333000000','4,26900000000000000000','Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Ovos e derivados','484','Omelete, de queijo','60,49166666666670000000','268,00677218242500000000','1121,34033481127000000000','15,57083333333330000000','22,00766666666670000000','383,82533333333300000000','0,43716666666666800000','NA','1,49266666666667000000','165,72733333333300000000','14,26766666666670000000','0,02566666666666670000','313,61133333333300000000','1,36966666666667000000','216,05100000000000000000','126,93100000000000000000','0,03166666666666670000','1,36066666666667000000','58,75333333333330000000','','','0,03000000000000000000','0,24333333333333300000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Ovos e derivados','485','Ovo, de codorna, inteiro, cru','71,67000000000000000000','176,89390000000000000000','740,12407760000000000000','13,68750000000000000000','12,68000000000000000000','568,00000000000000000000','0,77249999999999900000','NA','1,19000000000000000000','78,72933333333330000000','11,06300000000000000000','Tr','279,44366666666700000000','3,34866666666667000000','128,98700000000000000000','78,72933333333330000000','0,03533333333333330000','2,05433333333333000000','305,17333333333300000000','','','0,11000000000000000000','0,12333333333333300000','Tr','0,96666666666666700000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Ovos e derivados','486','Ovo, de galinha, clara, cozida/10minutos','85,22766666666670000000','59,43569666666670000000','248,67895485333300000000','13,44791666666670000000','0,08900000000000000000','NA','0,00000000000000000000','NA','0,66833333333333300000','6,23200000000000000000','11,00700000000000000000','Tr','15,42766666666670000000','0,07866666666666670000','180,53766666666700000000','145,87033333333300000000','0,02866666666666670000','Tr','NA','','','Tr','0,08000000000000000000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Ovos e derivados','487','Ovo, de galinha, gema, cozida/10minutos','50,02266666666670000000','352,67334000000000000000','1475,58525456000000000000','15,90000000000000000000','30,77700000000000000000','1272,37200000000000000000','1,56000000000001000000','NA','1,74033333333333000000','114,43100000000000000000','9,36733333333333000000','0,05933333333333330000','385,74700000000000000000','2,92333333333333000000','44,90866666666670000000','87,37733333333340000000','Tr','2,87366666666667000000','148,48000000000000000000','','','0,18000000000000000000','0,21666666666666700000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Ovos e derivados','488','Ovo, de galinha, inteiro, cozido/10minutos','75,76566666666670000000','145,70017000000000000000','609,60951128000000000000','13,29375000000000000000','9,47633333333333000000','396,57166666666700000000','0,61491666666667400000','NA','0,84933333333333300000','49,21833333333330000000','11,24433333333330000000','0,02366666666666670000','184,19033333333300000000','1,51533333333333000000','145,90100000000000000000','138,89700000000000000000','0,03966666666666670000','1,23600000000000000000','32,44000000000000000000','','','0,07666666666666670000','0,30000000000000000000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Ovos e derivados','489','Ovo, de galinha, inteiro, cru','75,60000000000000000000','143,11173333333300000000','598,77949226666700000000','13,03000000000000000000','8,90000000000000000000','355,94000000000000000000','1,63666666666667000000','NA','0,83333333333333300000','42,02333333333330000000','12,66000000000000000000','Tr','164,35000000000000000000','1,56333333333333000000','167,91000000000000000000','150,00000000000000000000','0,06000000000000000000','1,08333333333333000000','78,82666666666670000000','','','0,07000000000000000000','0,58000000000000000000','Tr','0,75000000000000000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Ovos e derivados','490','Ovo, de galinha, inteiro, frito','63,49733333333330000000','240,18722400911700000000','1004,94334525414000000000','15,61666666666670000000','18,59266666666670000000','516,26366666666700000000','1,19366666666666000000','NA','1,09966666666667000000','72,88733333333330000000','16,25033333333330000000','0,03433333333333330000','422,41066666666700000000','2,09666666666667000000','166,11233333333300000000','184,00700000000000000000','0,03866666666666670000','1,46133333333333000000','93,89333333333330000000','','','0,06333333333333330000','0,31666666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','491','Achocolatado, pó','1,10333333333333000000','401,02000000000000000000','1677,86768000000000000000','4,20333333333333000000','2,16666666666667000000','Tr','91,17666666666670000000','3,89000000000000000000','1,35000000000000000000','44,40333333333330000000','76,74333333333330000000','0,55066666666666700000','199,96666666666700000000','5,36000000000000000000','64,78666666666670000000','496,45000000000000000000','0,56000000000000000000','1,04000000000000000000','795,85000000000000000000','','','1,38000000000000000000','1,02000000000000000000','1,52333333333333000000','4,98666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','492','Açúcar, cristal','0,05000000000000000000','386,84572400000000000000','1619,20800000000000000000','0,32000000000000000000','Tr','NA','99,61000000000000000000','NA','Tr','7,58666666666667000000','1,00666666666667000000',' ','Tr','0,16333333333333300000','Tr','2,56000000000000000000',' Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','493','Açúcar, mascavo','3,32400000000000000000','368,55482252438900000000','1542,03337744204000000000','0,75833333333333300000','0,09200000000000000000','NA','94,45000000000000000000','NA','1,37566666666667000000','126,52900000000000000000','79,94666666666670000000','2,02600000000000000000','38,16000000000000000000','8,30366666666667000000','25,20400000000000000000','521,62666666666700000000','0,17133333333333300000','0,47766666666666700000','NA','','','Tr','0,03000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','494','Açúcar, refinado','0,12000000000000000000','386,57482400000000000000','1617,42906361600000000000','0,32000000000000000000','Tr','NA','99,54000000000000000000','NA','Tr','3,50000000000000000000','0,54666666666666700000',' ','Tr','0,10666666666666700000','12,16000000000000000000','6,35333333333333000000',' Tr','Tr','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','495','Chocolate, ao leite','1,25666666666667000000','539,58666666666700000000','2257,63061333333000000000','7,22000000000000000000','30,26666666666670000000','16,51750000000000000000','59,57666666666670000000','2,17000000000000000000','1,68000000000000000000','191,19000000000000000000','57,10000000000000000000','0,30266666666666700000','212,11333333333300000000','1,57666666666667000000','77,10000000000000000000','354,51333333333300000000','0,31333333333333300000','1,06333333333333000000','Tr',' ',' ','0,05000000000000000000','0,21666666666666700000','0,59000000000000000000','0,63000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','496','Chocolate, ao leite, com castanha do Pará','1,21433333333333000000','558,87633333333300000000','2338,33857866667000000000','7,41250000000000000000','34,19100000000000000000','15,50133333333330000000','55,37683333333330000000','2,45800000000000000000','1,80533333333333000000','171,23266666666700000000','79,56600000000000000000','0,36366666666666700000','302,52200000000000000000','1,47100000000000000000','64,05000000000000000000','430,91566666666700000000','0,45200000000000000000','1,30400000000000000000','36,15333333333330000000','','','0,04000000000000000000','0,24333333333333300000','Tr','1,36666666666667000000','1,42000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','497','Chocolate, ao leite, dietético','1,73200000000000000000','556,82433333333300000000','2329,75301066667000000000','6,89791666666667000000','33,77100000000000000000','12,96033333333330000000','56,32341666666670000000','2,84666666666667000000','1,27566666666667000000','187,88566666666700000000','67,20633333333330000000','0,40666666666666700000','276,47100000000000000000','3,31066666666667000000','84,70833333333330000000','458,40166666666700000000','0,42533333333333300000','1,11566666666667000000','7,03666666666667000000','','','0,30666666666666700000','0,25000000000000000000','Tr','0,79000000000000000000','2,04666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','498','Chocolate, meio amargo','1,02166666666667000000','474,91776997327400000000','1987,05594956818000000000','4,86244343217214000000','29,85666666666670000000','2,22033333333333000000','62,42288990116120000000','4,94366666666667000000','1,83633333333333000000','44,66533333333330000000','107,36366666666700000000','0,83233333333333300000','219,97933333333300000000','3,61066666666667000000','8,86700000000000000000','431,69566666666700000000','0,76566666666666700000','1,52133333333333000000','Tr','','','0,20000000000000000000','0,03666666666666670000','Tr','1,06333333333333000000','2,09666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','499','Cocada branca','3,42366666666667000000','448,84545242331000000000','1877,96937293913000000000','1,12183337370555000000','13,58700000000000000000','NA','81,38316662629450000000','3,56900000000000000000','0,48433333333333300000','7,05733333333333000000','17,40866666666670000000','0,36066666666666700000','396,41000000000000000000','1,24300000000000000000','28,99233333333330000000','183,07300000000000000000','0,20233333333333300000','0,41200000000000000000','NA','','','Tr','Tr','0,16333333333333300000','0,46666666666666700000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','500','Doce, de abóbora, cremoso','43,88000000000000000000','198,93606304963400000000','832,34848779967000000000','0,91666666666666700000','0,20666666666666700000','NA','54,61333333333330000000','2,28000000000000000000','0,38333333333333300000','12,98666666666670000000','5,52100000000000000000','0,00800000000000000000','13,73566666666670000000','0,85333333333333300000','Tr','136,74633333333300000000','Tr','Tr','NA','','','0,07666666666666670000','Tr','0,04000000000000000000','Tr','0,11333333333333300000','28/05/18 21:22','28/05/18 21:22');
+INSERT INTO `CMVColtaco3` (`categoria`, `numeroAlimento`, `descricaoAlimento`, `umidade`, `energiaKcal`, `energiaKj`, `proteina`, `lipideos`, `colesterol`, `carboidrato`, `fibraAlimentar`, `cinzas`, `calcio`, `magnesio`, `manganes`, `fosforo`, `ferro`, `sodio`, `potassio`, `cobre`, `zinco`, `retinol`, `re`, `rae`, `tiamina`, `riboflavina`, `piridoxina`, `niacina`, `vitaminaC`, `created_at`, `updated_at`) VALUES
+('Produtos açucarados','501','Doce, de leite, cremoso','27,50000000000000000000','306,31013023105900000000','1281,60158488675000000000','5,47829343159994000000','5,99300000000000000000','20,05866666666670000000','59,49337323506670000000','NA','1,53533333333333000000','195,10066666666700000000','16,26200000000000000000','0,01333333333333330000','140,78400000000000000000','0,06566666666666670000','120,08866666666700000000','259,46400000000000000000','0,02233333333333330000','0,52533333333333300000','35,63666666666670000000','35,63666666666670000000','35,63666666666670000000','0,05000000000000000000','0,25666666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','502','Geléia, mocotó, natural','73,48000000000000000000','106,08666666666700000000','443,86661333333300000000','2,12500000000000000000','0,07333333333333330000','Tr','24,23166666666670000000','NA','0,09000000000000000000','3,52333333333333000000','0,74633333333333300000','Tr','Tr','0,11633333333333300000','42,68033333333330000000','2,00500000000000000000','Tr','Tr','Tr',' ',' ','0,19000000000000000000','Tr','0,22333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','503','Glicose de milho','20,41333333333330000000','292,11840529918700000000','1222,22340777180000000000','0,00000000000000000000','0,00000000000000000000','NA','79,38000000000000000000','NA','0,20666666666666700000','5,66533333333333000000','1,89533333333333000000','Tr','4,77566666666667000000','0,05133333333333330000','58,92966666666670000000','5,05633333333333000000','Tr','Tr','NA','','',' ',' ',' ',' ',' ','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','504','Maria mole','21,57166666666670000000','301,23588753700000000000','1260,37095345481000000000','3,81285013103485000000','0,19000000000000000000','NA','73,55348320229850000000','0,66666666666666700000','0,87200000000000000000','13,35766666666670000000','6,88666666666667000000','0,05800000000000000000','4,34766666666667000000','0,39466666666666700000','15,30933333333330000000','23,55933333333330000000','0,19500000000000000000','0,08533333333333330000','NA','','','0,04333333333333330000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','505','Maria mole, coco queimado','20,73166666666670000000','306,63189699701800000000','1282,94785703553000000000','3,93495013523102000000','0,08933333333333330000','NA','75,05938319810230000000','0,63666666666666700000','0,18466666666666700000','19,45633333333330000000','5,98766666666667000000','0,08500000000000000000','5,41666666666667000000','0,47133333333333300000','14,28733333333330000000','35,95900000000000000000','0,02666666666666670000','0,09466666666666670000','NA','','','0,03666666666666670000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','506','Marmelada','28,49866666666670000000','257,24147319380400000000','1076,29832384288000000000','0,40000000000000000000','0,13733333333333300000','NA','70,76333333333330000000','4,07000000000000000000','0,20066666666666700000','11,32466666666670000000','5,80333333333333000000','0,05500000000000000000','19,62066666666670000000','0,72900000000000000000','10,88366666666670000000','83,14666666666670000000','0,08866666666666670000','0,07766666666666670000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','507','Mel, de abelha','15,82333333333330000000','309,24266666666700000000','1293,87131733333000000000','0,00000000000000000000','0,00000000000000000000','NA','84,03333333333330000000','NA','0,14333333333333300000','10,20433333333330000000','5,51133333333333000000','0,38300000000000000000','3,88633333333333000000','0,25066666666666700000','6,04000000000000000000','99,32166666666670000000','Tr','0,17233333333333300000','NA','','','0,10666666666666700000','Tr','Tr','Tr','0,73666666666666700000','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','508','Melado','22,08666666666670000000','296,50649123191800000000','1240,58315931435000000000','0,00000000000000000000','0,00000000000000000000','NA','76,61666666666670000000','NA','1,29666666666667000000','102,06333333333300000000','115,13666666666700000000','2,62333333333333000000','73,61333333333330000000','5,39166666666667000000','4,01000000000000000000','395,06000000000000000000','0,83633333333333300000','0,27333333333333300000','NA','','','Tr','0,05000000000000000000','0,20000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','509','Quindim','23,93000000000000000000','411,34872157084900000000','1721,08305105243000000000','4,73750000000000000000','24,42500000000000000000','271,01700000000000000000','46,29883333333330000000','3,22333333333333000000','0,60866666666666700000','37,17866666666670000000','14,90400000000000000000','0,24633333333333300000','167,91066666666700000000','1,38166666666667000000','27,36600000000000000000','111,00466666666700000000','0,10466666666666700000','1,10900000000000000000','75,97666666666670000000','','','Tr','0,04000000000000000000','0,04000000000000000000','1,14000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Produtos açucarados','510','Rapadura','7,09533333333333000000','351,95812210154500000000','1472,59278287287000000000','0,98958333333333300000','0,07066666666666670000','NA','90,79241666666670000000','NA','1,05200000000000000000','30,48633333333330000000','47,18033333333330000000','1,66300000000000000000','21,30066666666670000000','4,44133333333333000000','21,71066666666670000000','458,87400000000000000000','0,17333333333333300000','0,56233333333333300000','NA','','','Tr','Tr','0,03666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','511','Café, pó, torrado','2,93000000000000000000','418,61866666666700000000','1751,50050133333000000000','14,70000000000000000000','11,94666666666670000000','NA','65,75333333333330000000','51,22666666666670000000','4,67000000000000000000','106,89333333333300000000','165,12000000000000000000','2,57933333333333000000','169,48000000000000000000','8,13333333333333000000','1,13333333333333000000','1608,58000000000000000000','1,30333333333333000000','0,52333333333333300000','NA','','','Tr','Tr','Tr','11,88666666666670000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','512','Capuccino, pó','2,60333333333333000000','417,40666666666700000000','1746,42949333333000000000','11,31250000000000000000','8,63333333333333000000','28,90100000000000000000','73,61416666666670000000','2,44333333333333000000','3,83666666666667000000','466,59066666666700000000','70,84966666666670000000','0,17100000000000000000','357,60866666666700000000','2,27566666666667000000','382,28666666666700000000','885,79566666666700000000','Tr','1,14466666666667000000','51,53000000000000000000','','','Tr','1,41000000000000000000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','513','Fermento em pó, químico','7,07666666666667000000','89,72206665112180000000','375,39712686829300000000','0,47533331871032700000','0,07333333333333330000','NA','43,91133334795630000000','NA','48,46333333333330000000',' ',' ',' ',' ',' ','10052,41133333330000000000',' ',' ',' ','NA','','',' ',' ',' ',' ',' ','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','514','Fermento, biológico, levedura, tablete','71,90100000000000000000','89,79486703058890000000','375,70172365598400000000','16,95699947834010000000','1,51766666666667000000','NA','7,69866718832652000000','4,16566666666667000000','1,92566666666667000000','18,00866666666670000000','38,44866666666670000000','0,20300000000000000000','418,65666666666700000000','2,61800000000000000000','39,61066666666670000000','576,24433333333300000000','0,28800000000000000000','10,99966666666670000000','NA','','','0,30333333333333300000','0,35666666666666700000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','515','Gelatina, sabores variados, pó','1,24333333333333000000','380,22290000000000000000','1590,85261360000000000000','8,88666666666667000000','Tr','NA','89,22333333333330000000','NA','0,61666666666666700000','26,83666666666670000000','2,30666666666667000000','0,02633333333333330000','1,99000000000000000000','0,33333333333333300000','234,92333333333300000000','7,25000000000000000000','Tr','Tr','NA','','','Tr','Tr','Tr','Tr','39,99666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','516','Sal, dietético','0,59666666666666700000','NA','NA','NA','NA','NA','NA','NA','99,40333333333340000000','','','','','','23431,52166666670000000000','20467,63700000000000000000','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','517','Sal, grosso','0,41333333333333300000','NA','NA','NA','NA','NA','NA','NA','','','','','','','39943,20300000000000000000','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','518','Shoyu','70,62666666666670000000','60,92774987538660000000','254,92170547861700000000','3,31250000000000000000','0,32666666666666700000','NA','11,64750000000000000000','NA','14,08666666666670000000','14,52800000000000000000','23,62700000000000000000','0,06500000000000000000','47,04300000000000000000','0,49866666666666700000','5024,20833333333000000000','165,17733333333300000000','Tr','0,18600000000000000000','NA','','','0,82666666666666700000','0,06000000000000000000','0,15333333333333300000','2,10000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Miscelâneas','519','Tempero a base de sal','7,65000000000000000000','21,33000000000000000000','89,24472000000010000000','2,66666666666667000000','0,26333333333333300000','NA','2,07333333333334000000','0,55666666666666700000','87,34666666666670000000','','','','','','32560,00000000000000000000','','','','NA','','','','','','','','28/05/18 21:22','28/05/18 21:22'),
+('Outros alimentos industrializados','520','Azeitona, preta, conserva','68,46400000000000000000','194,15384702098400000000','812,33969593579600000000','1,16250000000000000000','20,34500000000000000000','NA','5,54450000000000000000','4,55500000000000000000','4,48400000000000000000','58,75066666666670000000','4,76200000000000000000','0,05500000000000000000','16,00266666666670000000','5,45000000000000000000','1566,66100000000000000000','78,57200000000000000000','0,25233333333333300000','0,29396666666666700000','NA','','','Tr','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Outros alimentos industrializados','521','Azeitona, verde, conserva','76,25900000000000000000','136,93643000000000000000','572,94202312000000000000','0,94791666666666600000','14,21566666666670000000','NA','4,10175000000000000000','3,84566666666667000000','4,47566666666667000000','45,63933333333330000000','3,93666666666667000000','0,02566666666666670000','5,36000000000000000000','0,17633333333333300000','1347,17766666667000000000','19,80533333333330000000','0,14100000000000000000','0,07733333333333330000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Outros alimentos industrializados','522','Chantilly, spray, com gordura vegetal','55,14266660000000000000','314,95600026666700000000','1317,77590511573000000000','0,52500000000000000000','27,27066666666670000000','Tr','16,85500006666670000000','NA','0,20666666666666700000','2,27433333333333000000','0,84633333333333300000','Tr','15,64633333333330000000','Tr','109,70366666666700000000','5,11133333333333000000','0,01433333333333330000','0,07400000000000000000','Tr',' ',' ','0,07000000000000000000','Tr','Tr','Tr','','28/05/18 21:22','28/05/18 21:22'),
+('Outros alimentos industrializados','523','Leite, de coco','77,98366666666670000000','166,16030161554600000000','695,21470195944600000000','1,01406670316060000000','18,36433333333330000000','NA','2,19459996350605000000','0,68366666666666700000','0,44333333333333300000','5,85033333333333000000','16,82533333333330000000','0,23833333333333300000','25,51900000000000000000','0,45566666666666700000','44,29466666666670000000','143,67300000000000000000','0,15533333333333300000','0,31566666666666700000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Outros alimentos industrializados','524','Maionese, tradicional com ovos','58,42366666666670000000','302,15267768782400000000','1264,20680344585000000000','0,58125000000000000000','30,49766666666670000000','42,46733333333330000000','7,89975000000000000000','NA','2,59766666666667000000','3,47833333333333000000','0,85533333333333300000','Tr','14,45333333333330000000','0,09700000000000000000','786,82733333333300000000','16,08800000000000000000','Tr','0,06000000000000000000','8,00000000000000000000','','','Tr','0,05333333333333330000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','525','Acarajé','50,46400000000000000000','289,21166666666700000000','1210,06161333333000000000','8,34583333333334000000','19,93033333333330000000','25,46433333333330000000','19,11383333333330000000','9,35833333333333000000','2,14600000000000000000','124,41933333333300000000','51,12433333333330000000','0,59466666666666700000','141,55666666666700000000','1,93300000000000000000','304,88866666666700000000','353,66033333333300000000','0,22566666666666700000','1,19366666666667000000','Tr','','','0,06333333333333330000','Tr','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','526','Arroz carreteiro','68,03566666666670000000','153,77200000000000000000','643,38204800000000000000','10,82916666666670000000','7,12400000000000000000','36,08866666666670000000','11,58483333333330000000','1,50166666666667000000','2,42633333333333000000','13,25600000000000000000','9,29066666666667000000','0,18266666666666700000','47,63800000000000000000','0,95500000000000000000','1621,72800000000000000000','87,15000000000000000000','0,07800000000000000000','2,67066666666667000000','Tr','','','0,03000000000000000000','Tr','0,07333333333333340000','1,60333333333333000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','527','Baião de dois, arroz e feijão-de-corda','69,05133333333330000000','135,68133333333300000000','567,69069866666700000000','6,23958333333333000000','3,22800000000000000000','4,10333333333333000000','20,41775000000000000000','5,06900000000000000000','1,06333333333333000000','33,29666666666670000000','18,67766666666670000000','0,27233333333333300000','71,67600000000000000000','0,56233333333333300000','93,29966666666670000000','157,30866666666700000000','0,07533333333333330000','0,59900000000000000000','Tr','','','0,03666666666666670000','Tr','0,03666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','528','Barreado','71,16733333333330000000','164,97523404741300000000','690,25637925437600000000','18,26875000000000000000','9,53400000000000000000','60,11000000000000000000','0,23625000000000000000','0,14666666666666700000','0,79366666666666700000','14,51233333333330000000','21,37133333333330000000','0,05066666666666670000','169,31466666666700000000','2,44400000000000000000','47,62733333333330000000','294,55633333333300000000','0,16533333333333300000','4,82566666666667000000','Tr','','','0,03000000000000000000','0,04000000000000000000','Tr','2,09333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','529','Bife à cavalo, com contra filé','54,21200000000000000000','291,22950924495900000000','1218,50426668091000000000','23,66041666666670000000','21,14666666666670000000','256,63333333333300000000','0,00000000000000000000','NA','1,12133333333333000000','25,97933333333330000000','19,48733333333330000000','0,01533333333333330000','215,81700000000000000000','2,10333333333333000000','82,87466666666670000000','272,23333333333300000000','0,05666666666666670000','3,20866666666667000000','36,79666666666670000000','','','0,04666666666666670000','0,10333333333333300000','Tr','2,91666666666667000000','','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','530','Bolinho de arroz','41,50000000000000000000','273,51433333333300000000','1144,38397066667000000000','8,03958333333333000000','8,29166666666667000000','70,29566666666670000000','41,68275000000000000000','2,73733333333333000000','0,48600000000000000000','23,56966666666670000000','13,45266666666670000000','0,41566666666666700000','87,27166666666670000000','2,12266666666667000000','58,85733333333330000000','96,45366666666670000000','0,13133333333333300000','0,86033333333333300000','Tr','','','0,08333333333333330000','0,04666666666666670000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','531','Camarão à baiana','81,98933333333330000000','100,78304300403600000000','421,67625192888600000000','7,94166666666667000000','5,96766666666667000000','116,78233333333300000000','3,17366666666667000000','0,38666666666666700000','0,92766666666666700000','42,68066666666670000000','14,86400000000000000000','0,10833333333333300000','244,08666666666700000000','1,41800000000000000000','84,78666666666670000000','139,13800000000000000000','0,07300000000000000000','0,46866666666666700000','Tr','','','Tr','Tr','Tr','0,30666666666666700000','4,07000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','532','Charuto, de repolho','81,54866666666670000000','78,23472922221820000000','327,33410706576100000000','6,77916666666667000000','1,11666666666667000000','21,34266666666670000000','10,13316666666670000000','1,46000000000000000000','0,42233333333333300000','22,88733333333330000000','13,45966666666670000000','0,21966666666666700000','67,88566666666670000000','0,86200000000000000000','12,10066666666670000000','184,03366666666700000000','1,44666666666667000000','1,75033333333333000000','Tr','','','0,03000000000000000000','Tr','Tr','0,32000000000000000000','4,77333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','533','Cuscuz, de milho, cozido com sal','71,13700000000000000000','113,45948166666700000000','474,71447129333300000000','2,15625000000000000000','0,67966666666666700000','NA','25,28141666666670000000','2,05333333333333000000','0,74566666666666700000','1,54066666666667000000','2,71800000000000000000','0,02300000000000000000','23,18266666666670000000','0,17333333333333300000','247,66600000000000000000','10,85366666666670000000','Tr','0,20200000000000000000','Tr','','','Tr','Tr','0,06333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','534','Cuscuz, paulista','68,93666666666670000000','142,12300000000000000000','594,64263200000000000000','2,55833333333333000000','4,64833333333333000000','15,04866666666670000000','22,51366666666670000000','2,43266666666667000000','1,34300000000000000000','14,16133333333330000000','5,09600000000000000000','0,06266666666666670000','25,95233333333330000000','0,33000000000000000000','235,70966666666700000000','52,93266666666670000000','0,04900000000000000000','0,21000000000000000000','Tr','','','Tr','Tr','Tr','0,93333333333333300000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','535','Cuxá, molho','80,99400000000000000000','80,09161563650770000000','335,10331982314800000000','5,64375000000000000000','3,59266666666667000000','58,38633333333330000000','5,73891666666667000000','3,01666666666667000000','4,03066666666667000000','105,48066666666700000000','33,57933333333330000000','0,23433333333333300000','111,13466666666700000000','0,94400000000000000000','1344,29466666667000000000','124,05633333333300000000','0,17200000000000000000','0,57066666666666700000','Tr','32,58055555555560000000','16,29027777777780000000','0,04000000000000000000','Tr','0,03000000000000000000','1,09666666666667000000','10,28000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','536','Dobradinha','75,26700000000000000000','124,50020083333300000000','520,90884028666700000000','19,77291666666670000000','4,44233333333333000000','144,01800000000000000000','0,00000000000000000000','NA','0,29266666666666700000','11,33666666666670000000','8,25033333333333000000','0,10500000000000000000','57,11766666666670000000','1,01000000000000000000','28,77366666666670000000','57,57733333333330000000','0,05500000000000000000','2,72066666666667000000','Tr','','','Tr','Tr','Tr','4,26666666666667000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','537','Estrogonofe de carne','70,12833333333330000000','173,14136431801300000000','724,42346830656700000000','15,03125000000000000000','10,80300000000000000000','66,21600000000000000000','2,97541666666667000000','','1,06200000000000000000','28,31800000000000000000','21,51166666666670000000','0,03333333333333330000','185,57100000000000000000','2,69933333333333000000','122,84800000000000000000','322,31366666666700000000','0,14033333333333300000','2,04133333333333000000','27,63333333333330000000','','','0,06000000000000000000','0,05000000000000000000','Tr','3,25333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','538','Estrogonofe de frango','70,89233333333330000000','156,80610301323700000000','656,07673500738500000000','17,55208333333330000000','7,96233333333333000000','79,95933333333330000000','2,59391666666666000000','','0,99933333333333300000','26,04933333333330000000','24,76433333333330000000','0,02766666666666670000','195,15766666666700000000','1,52133333333333000000','99,45500000000000000000','307,08633333333300000000','0,12333333333333300000','0,58333333333333300000','28,22333333333330000000','','','0,07333333333333340000','0,04000000000000000000','0,03000000000000000000','3,36666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','539','Feijão tropeiro mineiro','61,66766666666670000000','151,56185683095500000000','634,13480898071400000000','10,17083333333330000000','6,79066666666667000000','67,87933333333330000000','19,58183333333330000000','3,57333333333333000000','1,78900000000000000000','41,19566666666670000000','36,10533333333330000000','0,38166666666666700000','199,25500000000000000000','2,16233333333333000000','365,07433333333300000000','348,92933333333300000000','0,21700000000000000000','1,44633333333333000000','8,77000000000000000000','','','Tr','Tr','Tr','1,43666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','540','Feijoada','71,80133333333330000000','116,93345731103400000000','489,24958538936700000000','8,67083333333333000000','6,47733333333333000000','21,96333333333330000000','11,64183333333330000000','5,09000000000000000000','1,40866666666667000000','32,38166666666670000000','31,84966666666670000000','0,24333333333333300000','105,46233333333300000000','1,34700000000000000000','278,22033333333300000000','303,49300000000000000000','0,15366666666666700000','0,83166666666666700000','Tr',' ',' ','0,07666666666666670000','0,03000000000000000000','Tr','0,93000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','541','Frango, com açafrão','79,52466666666670000000','112,78376884122700000000','471,88728883169300000000','9,69791666666667000000','6,17000000000000000000','50,41766666666670000000','4,06208333333333000000','0,22333333333333300000','0,54533333333333300000','12,98833333333330000000','16,08766666666670000000','0,08933333333333330000','166,84466666666700000000','0,83800000000000000000','28,81200000000000000000','256,37466666666700000000','0,02066666666666670000','0,50300000000000000000','8,08666666666667000000','','','0,03000000000000000000','Tr','Tr','1,64000000000000000000','5,28000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','542','Macarrão, molho bolognesa','71,41233333333330000000','119,53177144556000000000','500,12093172822300000000','4,93429983488719000000','0,88966666666666700000','6,92966666666667000000','22,52236683177950000000','0,77666666666666700000','0,24133333333333300000','10,54833333333330000000','9,98133333333333000000','0,22033333333333300000','53,96066666666670000000','1,38900000000000000000','8,93933333333333000000','83,57366666666670000000','0,08700000000000000000','0,75200000000000000000','Tr','','','0,03666666666666670000','Tr','Tr','1,43666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','543','Maniçoba','76,39533333333330000000','134,22289340098700000000','561,58858598972900000000','9,95833333333333000000','8,69933333333333000000','42,76633333333330000000','3,41933333333333000000','2,16000000000000000000','1,52766666666667000000','65,98066666666670000000','23,65233333333330000000','0,59600000000000000000','54,88266666666670000000','3,21533333333333000000','406,70433333333300000000','147,71266666666700000000','0,15966666666666700000','2,02533333333333000000','Tr','221,87500000000000000000','110,93750000000000000000','0,04333333333333330000','0,07000000000000000000','0,05000000000000000000','2,57666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','544','Quibebe','81,10600000000000000000','86,34923029959200000000','361,28517957349300000000','8,55625000000000000000','2,67200000000000000000','NA','6,64408333333332000000','1,66666666666667000000','1,02166666666667000000','7,68466666666667000000','10,39500000000000000000','0,05333333333333330000','42,52500000000000000000','0,77833333333333300000','246,61400000000000000000','152,81266666666700000000','0,60600000000000000000','1,63666666666667000000','Tr','104,91666670000000000000','52,45833335000000000000','Tr','0,03000000000000000000','0,03666666666666670000','','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','545','Salada, de legumes, com maionese','82,03733333333330000000','96,10358839845660000000','402,09741385914200000000','1,05000000000000000000','7,03900000000000000000','7,20133333333333000000','8,92399999999999000000','2,21666666666667000000','0,94966666666666600000','12,12833333333330000000','8,71433333333333000000','0,09666666666666670000','22,26500000000000000000','0,22900000000000000000','228,42566666666700000000','141,29433333333300000000','0,03500000000000000000','0,15633333333333300000','Tr','282,75000000000000000000','141,37500000000000000000','0,03666666666666670000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','546','Salada, de legumes, cozida no vapor','89,97900000000000000000','35,40810429847240000000','148,14750838480900000000','2,00625000000000000000','0,31166666666666700000','NA','7,08908333333334000000','2,51333333333333000000','0,61400000000000000000','32,89500000000000000000','18,57833333333330000000','0,23533333333333300000','44,79100000000000000000','0,44066666666666700000','2,50966666666667000000','244,30366666666700000000','0,17133333333333300000','0,30000000000000000000','NA','510,00000000000000000000','255,00000000000000000000','0,05000000000000000000','0,03000000000000000000','0,03333333333333330000','Tr','29,35000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','547','Salpicão, de frango','72,52766666666670000000','147,86459613402700000000','618,66547022476800000000','13,92500000000000000000','7,84066666666667000000','52,52366666666670000000','4,56899999999999000000','0,41000000000000000000','1,13766666666667000000','9,40900000000000000000','13,25400000000000000000','0,02700000000000000000','102,58300000000000000000','0,31833333333333300000','248,34566666666700000000','148,96800000000000000000','0,07766666666666670000','0,39266666666666700000','Tr','14,50000000000000000000','7,25000000000000000000','0,05000000000000000000','Tr','Tr','1,47666666666667000000','9,25666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','548','Sarapatel','74,95133333333330000000','122,98185821243100000000','514,55609476081300000000','18,47291666666670000000','4,42000000000000000000','315,35733333333300000000','1,09408333333334000000','','1,06166666666667000000','12,23433333333330000000','12,79700000000000000000','0,10366666666666700000','163,50200000000000000000','7,17633333333333000000','215,62266666666700000000','198,75700000000000000000','1,48333333333333000000','1,77033333333333000000','1463,66666666667000000000','','','Tr','0,11000000000000000000','Tr','3,83666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','549','Tabule','85,77000000000000000000','57,45347668848060000000','240,38534646460300000000','2,04632997322082000000','1,20800000000000000000','NA','10,58100336011250000000','2,08333333333333000000','0,39466666666666700000','18,84733333333330000000','17,97733333333330000000','0,36833333333333300000','35,47033333333330000000','0,55133333333333300000','1,19200000000000000000','187,62666666666700000000','0,12133333333333300000','0,57800000000000000000','NA','','','0,03000000000000000000','Tr','Tr','0,60000000000000000000','16,21666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','550','Tacacá','85,19300000000000000000','46,88917715120320000000','196,18431720063400000000','6,95833333333334000000','0,35966666666666700000','70,56200000000000000000','3,39000000000000000000','0,21333333333333300000','4,09900000000000000000','44,81866666666670000000','29,89900000000000000000','0,11533333333333300000','89,16800000000000000000','0,94933333333333300000','1349,06266666667000000000','240,18333333333300000000','0,21900000000000000000','0,79400000000000000000','Tr','35,36111111111110000000','17,68055555555560000000','0,04666666666666670000','Tr','Tr','','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','551','Tapioca, com manteiga','24,90233333333330000000','347,82655625782400000000','1455,30631138274000000000','0,08958333333333330000','10,90833333333330000000','31,19033333333330000000','63,59175000000000000000','Tr','0,50800000000000000000','30,02533333333330000000','3,21800000000000000000','0,06000000000000000000','8,42700000000000000000','0,24000000000000000000','157,52433333333300000000','19,30500000000000000000','0,00800000000000000000','0,03800000000000000000','75,26666666666670000000','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','552','Tucupi, com pimenta-de-cheiro','91,88433333333330000000','27,18379840272660000000','113,73701251700800000000','2,05625000000000000000','0,28366666666666700000','NA','4,73774999999999000000','0,22666666666666700000','1,03800000000000000000','28,25600000000000000000','42,48566666666670000000','0,52133333333333300000','30,80800000000000000000','1,14833333333333000000','5,13100000000000000000','390,83733333333300000000','0,11966666666666700000','0,85366666666666700000','NA','50,58333400000000000000','25,29166700000000000000','Tr','Tr','0,05333333333333330000','Tr','46,39666666666670000000','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','553','Vaca atolada','74,95133333333330000000','144,89697968479000000000','606,24896300116200000000','5,12291666666667000000','9,32200000000000000000','18,58633333333330000000','10,06141666666670000000','2,34333333333333000000','0,54233333333333300000','62,65900000000000000000','15,75433333333330000000','0,03900000000000000000','71,77000000000000000000','0,73000000000000000000','25,63366666666670000000','219,81133333333300000000','0,12033333333333300000','1,19600000000000000000','Tr','','','Tr','Tr','Tr','0,77000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','554','Vatapá','58,36233333333330000000','254,89328572415500000000','1066,47350746986000000000','5,99783354918162000000','23,22633333333330000000','44,44966666666670000000','9,74849978415172000000','1,69666666666667000000','2,66500000000000000000','46,81733333333330000000','39,31633333333330000000','0,48000000000000000000','108,44200000000000000000','1,44300000000000000000','879,85066666666700000000','209,40500000000000000000','0,27900000000000000000','0,85066666666666700000','Tr','','','Tr','Tr','Tr','1,79666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','555','Virado à paulista','48,59033333333330000000','306,94678645132000000000','1284,26535451232000000000','10,18125000000000000000','25,59066666666670000000','65,84266666666670000000','14,10908333333330000000','2,16333333333333000000','1,52866666666667000000','40,70666666666670000000','21,81033333333330000000','0,15400000000000000000','135,49400000000000000000','1,05100000000000000000','345,52600000000000000000','237,26166666666700000000','0,07200000000000000000','1,04100000000000000000','10,17333333333330000000','','','0,14000000000000000000','0,05000000000000000000','Tr','2,59666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Alimentos preparados','556','Yakisoba','69,37666666666670000000','112,80204125340800000000','471,96374060425800000000','7,51666666666667000000','2,60700000000000000000','NA','18,25133333333330000000','1,05666666666667000000','2,24833333333333000000','13,94700000000000000000','13,33500000000000000000','0,14700000000000000000','83,02566666666670000000','0,62233333333333300000','793,76200000000000000000','158,57133333333300000000','0,06100000000000000000','0,67966666666666700000','NA','62,00000000000000000000','31,00000000000000000000','0,16333333333333300000','Tr','Tr','2,09333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','557','Amendoim, grão, cru','6,42700000000000000000','544,05265579943300000000','2276,31631186483000000000','27,19080018997190000000','43,85000000000000000000','NA','20,31353333333330000000','8,03600000000000000000','2,21866666666667000000','Tr','170,51100000000000000000','1,95733333333333000000','407,20100000000000000000','2,53200000000000000000','Tr','580,43600000000000000000','0,78066666666666700000','3,16733333333333000000','NA','','','0,10000000000000000000','0,03000000000000000000','0,76333333333333300000','10,17666666666670000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','558','Amendoim, torrado, salgado','1,68666666666667000000','605,78109291701900000000','2534,58809276481000000000','22,47518015702570000000','53,96333333333330000000','NA','18,70248650964100000000','7,76333333333333000000','3,17233333333333000000','39,42566666666670000000','159,33633333333300000000','1,70100000000000000000','260,75566666666700000000','1,33266666666667000000','375,73266666666700000000','495,67100000000000000000','0,68166666666666700000','2,11600000000000000000','NA','','','0,08333333333333330000','Tr','0,21000000000000000000','7,47000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','559','Ervilha, em vagem','76,84133333333330000000','88,09358199977850000000','366,96718978666700000000','7,45208333333333000000','0,47100000000000000000','NA','14,22758333333330000000','9,72100000000000000000','1,00800000000000000000','24,44396666666670000000','41,75966666666670000000','0,40233333333333300000','151,97833333333300000000','1,43900000000000000000','Tr','310,97633333333300000000','0,19633333333333300000','1,23000000000000000000','NA','','','0,27333333333333300000','0,07000000000000000000','0,06000000000000000000','1,16333333333333000000','12,44333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','560','Ervilha, enlatada, drenada','80,14333333333330000000','73,84470434782610000000','308,96624299130400000000','4,59782608695652000000','0,38000000000000000000','NA','13,44217391304350000000','5,08000000000000000000','1,43666666666667000000','22,21500000000000000000','23,19033333333330000000','0,46033333333333300000','78,51033333333330000000','1,38533333333333000000','372,10966666666700000000','147,12333333333300000000','0,13766666666666700000','0,87833333333333300000','NA','9,16666666666667000000','4,58333333333333000000','0,06666666666666670000','0,03000000000000000000','Tr','Tr',' ','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','561','Feijão, carioca, cozido','80,35063333333330000000','76,42408566666670000000','319,75837442933300000000','4,77500000000000000000','0,54233333333333300000','NA','13,59103333333330000000','8,51033333333333000000','0,74100000000000000000','26,59466666666670000000','42,33966666666670000000','0,28433333333333300000','86,85433333333330000000','1,28900000000000000000','1,75900000000000000000','254,61666666666700000000','0,18833333333333300000','0,70000000000000000000','NA','','','0,04000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','562','Feijão, carioca, cru','13,99666666666670000000','329,02673623188400000000','1376,64786439420000000000','19,98188405797100000000','1,25666666666667000000','NA','61,22144927536230000000','18,42000000000000000000','3,54333333333333000000','122,57000000000000000000','209,94666666666700000000','1,02000000000000000000','385,37666666666700000000','7,98666666666667000000','Tr','1352,45666666667000000000','0,79000000000000000000','2,90333333333333000000','NA','','','0,16666666666666700000','Tr','0,65000000000000000000','4,02333333333333000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','563','Feijão, fradinho, cozido','80,00933333333330000000','78,00889666666670000000','326,38922365333300000000','5,09375000000000000000','0,64400000000000000000','NA','13,49958333333330000000','7,47200000000000000000','0,75333333333333300000','17,45333333333330000000','38,11833333333330000000','0,53000000000000000000','84,59266666666670000000','1,05966666666667000000','0,98200000000000000000','252,97633333333300000000','0,10266666666666700000','1,11533333333333000000','NA','','','0,12333333333333300000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','564','Feijão, fradinho, cru','12,69666666666670000000','339,16476666666700000000','1419,06538373333000000000','20,20833333333330000000','2,36500000000000000000','NA','61,24000000000000000000','23,59333333333330000000','3,49000000000000000000','77,52300000000000000000','178,39066666666700000000','1,42800000000000000000','354,51500000000000000000','5,12866666666667000000','10,31366666666670000000','1082,74333333333000000000','0,69866666666666700000','3,88266666666667000000','NA','','','0,13666666666666700000','0,03000000000000000000','0,26000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','565','Feijão, jalo, cozido','75,84233333333330000000','92,73992000000000000000','388,02382528000000000000','6,14375000000000000000','0,51200000000000000000','NA','16,49525000000000000000','13,86600000000000000000','1,00666666666667000000','29,40066666666670000000','44,10400000000000000000','0,32033333333333300000','121,00833333333300000000','1,92100000000000000000','0,52033333333333300000','347,72066666666700000000','0,23633333333333300000','1,01400000000000000000','NA','','','0,12666666666666700000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','566','Feijão, jalo, cru','13,53333333333330000000','327,90526666666700000000','1371,95563573333000000000','20,10416666666670000000','0,94666666666666700000','NA','61,47916666666670000000','30,32000000000000000000','3,93666666666667000000','97,97000000000000000000','169,90300000000000000000','0,99100000000000000000','427,18900000000000000000','7,02766666666667000000','24,58033333333330000000','1275,95133333333000000000','0,95100000000000000000','3,00600000000000000000','NA','','','0,10000000000000000000','Tr','0,12333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','567','Feijão, preto, cozido','80,21800000000000000000','77,02726666666670000000','322,28208373333300000000','4,47916666666667000000','0,53566666666666700000','NA','14,00516666666670000000','8,40233333333333000000','0,76200000000000000000','29,00433333333330000000','40,37133333333330000000','0,36533333333333300000','88,03066666666670000000','1,46566666666667000000','1,85400000000000000000','256,37333333333300000000','0,19766666666666700000','0,72100000000000000000','NA','','','0,06000000000000000000','Tr','0,03000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','568','Feijão, preto, cru','14,87666666666670000000','323,56571159420300000000','1353,79893731014000000000','21,34420289855070000000','1,24000000000000000000','NA','58,75246376811600000000','21,83333333333330000000','3,78666666666667000000','110,90333333333300000000','188,10666666666700000000','1,31600000000000000000','471,15666666666700000000','6,46333333333333000000','Tr','1415,68000000000000000000','0,82666666666666700000','2,85333333333333000000','NA','','','0,11666666666666700000','Tr','0,59000000000000000000','4,60000000000000000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','569','Feijão, rajado, cozido','77,86433333333330000000','84,70185273349290000000','354,39255183693400000000','5,53750000000000000000','0,40000000000000000000','NA','15,26750000000000000000','9,31800000000000000000','0,93066666666666700000','29,18966666666670000000','41,70733333333330000000','0,29433333333333300000','112,93166666666700000000','1,35733333333333000000','0,68700000000000000000','314,58400000000000000000','0,22700000000000000000','0,91900000000000000000','NA','','','0,09333333333333330000','Tr','0,04000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','570','Feijão, rajado, cru','14,96333333333330000000','325,84441116273400000000','1363,33301630488000000000','17,27083333333330000000','1,17000000000000000000','NA','62,92916666666670000000','24,00666666666670000000','3,66666666666667000000','111,42533333333300000000','169,90033333333300000000','1,17000000000000000000','334,78833333333300000000','18,58166666666670000000','13,65033333333330000000','1134,54166666667000000000','0,84433333333333300000','2,59666666666667000000','NA','','','0,07000000000000000000','0,03000000000000000000','0,06666666666666670000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','571','Feijão, rosinha, cozido','82,58100000000000000000','67,86622877142830000000','283,95230117965600000000','4,53958333333333000000','0,47733333333333300000','NA','11,82275000000000000000','4,76000000000000000000','0,57933333333333300000','19,24400000000000000000','42,95966666666670000000','0,46133333333333300000','89,50900000000000000000','1,18433333333333000000','2,08066666666667000000','240,56700000000000000000','0,09166666666666670000','1,30500000000000000000','NA','','','Tr','Tr','Tr','3,69000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','572','Feijão, rosinha, cru','11,95333333333330000000','336,96191112756700000000','1409,84863615774000000000','20,91666666666670000000','1,33000000000000000000','NA','62,22333333333330000000','20,62666666666670000000','3,57666666666667000000','67,66166666666670000000','184,49733333333300000000','1,07833333333333000000','393,58600000000000000000','5,32033333333333000000','24,11433333333330000000','1108,65966666667000000000','0,59533333333333300000','3,97800000000000000000','NA','','','0,16333333333333300000','0,03000000000000000000','Tr','3,92333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','573','Feijão, roxo, cozido','79,98600000000000000000','76,89338231790060000000','321,72191161809600000000','5,72083333333333000000','0,53833333333333300000','NA','12,90816666666670000000','11,51433333333330000000','0,84666666666666700000','22,53200000000000000000','34,39266666666670000000','0,32100000000000000000','106,32500000000000000000','1,41100000000000000000','1,45700000000000000000','268,08633333333300000000','0,22466666666666700000','1,00600000000000000000','NA','','','0,14666666666666700000','Tr','0,03000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','574','Feijão, roxo, cru','12,63666666666670000000','331,41497745672900000000','1386,64026567895000000000','22,16666666666670000000','1,23666666666667000000','NA','59,98666666666670000000','33,84333333333330000000','3,97333333333333000000','120,45766666666700000000','161,93533333333300000000','1,34066666666667000000','393,69833333333300000000','6,91733333333333000000','9,75766666666667000000','1221,39700000000000000000','1,03733333333333000000','3,29300000000000000000','NA','','','0,26333333333333300000','Tr','0,08000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','575','Grão-de-bico, cru','12,29000000000000000000','354,70287658910000000000','1484,07683564879000000000','21,22916666666670000000','5,43000000000000000000','NA','57,88416666666670000000','12,35666666666670000000','3,16666666666667000000','114,35933333333300000000','146,38700000000000000000','3,15666666666667000000','342,33533333333300000000','5,37766666666667000000','5,19400000000000000000','1115,70166666667000000000','0,67066666666666700000','3,19100000000000000000','NA','','','0,52000000000000000000','Tr','0,75333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','576','Guandu, cru','11,44900000000000000000','344,13365128499300000000','1439,85519697641000000000','18,96458333333330000000','2,13200000000000000000','NA','64,00041666666670000000','21,31366666666670000000','3,45400000000000000000','129,33766666666700000000','166,00000000000000000000','1,01566666666667000000','269,19433333333300000000','1,94333333333333000000','1,61700000000000000000','1214,79766666667000000000','0,57300000000000000000','2,01666666666667000000','NA','','','1,06333333333333000000','Tr','0,07000000000000000000','2,69333333333333000000','1,46666666666667000000','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','577','Lentilha, cozida','76,25066666666670000000','92,63876625229920000000','387,60059799962000000000','6,31041666666667000000','0,52466666666666700000','NA','16,30225000000000000000','7,86233333333333000000','0,61200000000000000000','16,10100000000000000000','21,64600000000000000000','0,28533333333333300000','103,74000000000000000000','1,47933333333333000000','1,17633333333333000000','219,90366666666700000000','0,17466666666666700000','1,13066666666667000000','NA','','','0,03000000000000000000','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','578','Lentilha, crua','11,46666666666670000000','339,14124020355300000000','1418,96694901167000000000','23,15217391304350000000','0,77000000000000000000','NA','62,00449275362320000000','16,93666666666670000000','2,60666666666667000000','53,52333333333330000000','93,53000000000000000000','1,08433333333333000000','367,73666666666700000000','7,04666666666667000000','Tr','886,88333333333300000000','0,83333333333333300000','3,48666666666667000000','NA',' ',' ','0,11333333333333300000','Tr','0,41666666666666700000','5,07333333333333000000',' ','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','579','Paçoca, amendoim','1,80100000000000000000','486,92708646452400000000','2037,30292976757000000000','15,99583333333330000000','26,07533333333330000000','NA','52,37616666666670000000','7,31900000000000000000','3,75166666666667000000','22,48133333333330000000','100,67466666666700000000','1,05500000000000000000','198,49666666666700000000','1,13466666666667000000','166,84066666666700000000','347,60100000000000000000','0,37933333333333300000','1,56000000000000000000','NA','','','Tr','Tr','1,19666666666667000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','580','Pé-de-moleque, amendoim','2,91000000000000000000','503,19036583995600000000','2105,34849067437000000000','13,16224009195960000000','28,04833333333330000000','NA','54,73042657470700000000','3,39333333333333000000','1,14900000000000000000','27,10800000000000000000','107,90366666666700000000','1,08900000000000000000','170,70833333333300000000','1,25666666666667000000','16,34533333333330000000','355,41466666666700000000','0,42700000000000000000','1,43100000000000000000','NA','','','0,04333333333333330000','0,03000000000000000000','0,11000000000000000000','5,94000000000000000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','581','Soja, farinha','5,75000000000000000000','403,95584581039900000000','1690,15125887071000000000','36,03010024070740000000','14,63333333333330000000','NA','38,43989975929260000000','20,18000000000000000000','5,14666666666667000000','206,02033333333300000000','241,90000000000000000000','2,87133333333333000000','539,24933333333300000000','13,05533333333330000000','5,75366666666667000000','1922,39166666667000000000','1,28700000000000000000','4,54000000000000000000','NA','','','0,20000000000000000000','0,03666666666666670000','0,03000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','582','Soja, extrato solúvel, natural, fluido','91,28400000000000000000','39,10485527535080000000','163,61471447206800000000','2,38107001590729000000','1,60600000000000000000','NA','4,27526333333334000000','0,36633333333333300000','0,45366666666666700000','16,51700000000000000000','15,45400000000000000000','0,14633333333333300000','52,89166666666670000000','0,43400000000000000000','56,52800000000000000000','121,04400000000000000000','0,08300000000000000000','0,27766666666666700000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','583','Soja, extrato solúvel, pó','4,46833333333333000000','458,89572943786800000000','1920,01973196804000000000','35,68750023841860000000','26,18100000000000000000','NA','28,48283333333330000000','7,31300000000000000000','5,18033333333333000000','359,03800000000000000000','215,61566666666700000000','2,67566666666667000000','646,55000000000000000000','7,00900000000000000000','83,47100000000000000000','1606,80066666667000000000','1,18533333333333000000','5,83766666666667000000','NA','','','Tr','0,10666666666666700000','0,35333333333333300000','Tr','9,21333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','584','Soja, queijo (tofu)','86,64600000000000000000','64,48509407389020000000','269,80563360515700000000','6,55317671044668000000','3,95333333333333000000','NA','2,12682333333333000000','0,75266666666666700000','0,72066666666666700000','80,75733333333330000000','38,20200000000000000000','0,33433333333333300000','129,51633333333300000000','1,43033333333333000000','1,21366666666667000000','181,69100000000000000000','0,17866666666666700000','0,89333333333333300000','NA','','','0,03666666666666670000','Tr','0,03333333333333330000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','585','Tremoço, cru','9,69200000000000000000','381,27817396012900000000','1595,26787984918000000000','33,57500000000000000000','10,34200000000000000000','NA','43,78633333333330000000','32,30700000000000000000','2,60466666666667000000','176,74533333333300000000','121,43233333333300000000','*','264,68366666666700000000','2,78866666666667000000','3,29066666666667000000','708,32100000000000000000','0,79100000000000000000','4,23766666666667000000','NA','','','0,24000000000000000000','Tr','0,06666666666666670000','Tr','24,97333333333330000000','28/05/18 21:22','28/05/18 21:22'),
+('Leguminosas e derivados','586','Tremoço, em conserva','67,68433333333330000000','120,64258534487100000000','504,76857708294000000000','11,10833333333330000000','3,78400000000000000000','NA','12,38933333333330000000','14,44000000000000000000','5,03400000000000000000','15,53733333333330000000','3,51700000000000000000','*','39,72466666666670000000','0,33800000000000000000','1808,75766666667000000000','5,20466666666667000000','0,26533333333333300000','0,63633333333333300000','NA','','','Tr','Tr','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','587','Amêndoa, torrada, salgada','3,10600000000000000000','580,74695455607000000000','2429,84525786260000000000','18,55475938510890000000','47,32433333333330000000','NA','29,54724000000000000000','11,64000000000000000000','1,46766666666667000000','236,70433333333300000000','222,09900000000000000000','1,94800000000000000000','493,05666666666700000000','3,05566666666667000000','278,52266666666700000000','639,60200000000000000000','0,93200000000000000000','2,57666666666667000000','NA','','','0,29000000000000000000','0,16333333333333300000','Tr','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','588','Castanha-de-caju, torrada, salgada','3,46400000000000000000','570,16762650161900000000','2385,58134928277000000000','18,50936733277640000000','46,27966666666670000000','NA','29,13496600055700000000','3,66300000000000000000','2,61200000000000000000','32,58766666666670000000','236,61000000000000000000','1,59000000000000000000','594,22233333333300000000','5,22100000000000000000','125,00000000000000000000','671,46366666666700000000','1,91533333333333000000','4,71666666666667000000','NA','','','0,28666666666666700000','0,04666666666666670000','0,39333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','589','Castanha-do-Brasil, crua','3,52400000000000000000','642,96307168106900000000','2690,15749191359000000000','14,53634010156000000000','63,45900000000000000000','NA','15,07865989844000000000','7,93100000000000000000','3,40200000000000000000','146,33666666666700000000','365,12333333333300000000','1,10366666666667000000','853,28333333333300000000','2,31000000000000000000','0,65400000000000000000','650,99400000000000000000','1,78833333333333000000','4,21933333333333000000','NA','','','0,30333333333333300000','Tr','0,44000000000000000000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','590','Coco, cru','42,96116666666670000000','406,48735310781000000000','1700,74308540308000000000','3,69183412310697000000','41,97633333333330000000','NA','10,40166587689300000000','5,37816666666667000000','0,96900000000000000000','6,48450000000000000000','51,45950000000000000000','0,99983333333333300000','117,54000000000000000000','1,75833333333333000000','15,32000000000000000000','354,14916666666700000000','0,45266666666666700000','0,94333333333333300000','NA','','','Tr','Tr','0,02500000000000000000','Tr','2,49333333333333000000','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','591','Coco,  verde, cru','*','*','*','*','*','*','*','*','*','*','*','*','*','*','*','*','*','*','NA','','','*','*','*','*','*','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','592','Farinha, de mesocarpo de babaçu, crua','15,82333333333330000000','328,77140024483400000000','1375,57953862438000000000','1,40626671727498000000','0,19800000000000000000','NA','79,17306661605840000000','17,86000000000000000000','3,39933333333333000000','60,95233333333330000000','39,34566666666670000000','0,38233333333333300000','25,56100000000000000000','18,33366666666670000000','12,46300000000000000000','362,07466666666700000000','0,22300000000000000000','0,34066666666666700000','NA','','','Tr','Tr','Tr','2,57666666666667000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','593','Gergelim, semente','3,85933333333333000000','583,54671475455000000000','2441,55945453303000000000','21,16466742833460000000','50,43266666666670000000','NA','21,61766590499880000000','11,86833333333330000000','2,92566666666667000000','825,44633333333300000000','360,68866666666700000000','2,67266666666667000000','740,70900000000000000000','5,44766666666667000000','2,57500000000000000000','546,28600000000000000000','1,50966666666667000000','5,23500000000000000000','NA','','','0,93666666666666700000','Tr','0,13000000000000000000','5,92333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','594','Linhaça, semente','6,68300000000000000000','495,09611384365100000000','2071,53491450499000000000','14,08386717351280000000','32,25293333333330000000','NA','43,31219949315390000000','33,50266666666670000000','3,66800000000000000000','211,49766666666700000000','346,92233333333300000000','2,81433333333333000000','615,18200000000000000000','4,69700000000000000000','8,67333333333333000000','869,28700000000000000000','1,08733333333333000000','4,38833333333333000000','NA','','','0,11666666666666700000','Tr','0,13333333333333300000','Tr','Tr','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','595','Pinhão, cozido','50,51333333333330000000','174,36990200000000000000','729,56366996800000000000','2,98036666666667000000','0,74700000000000000000','NA','43,91763333333330000000','15,60333333333330000000','1,84166666666667000000','15,76733333333330000000','52,97433333333330000000','0,40933333333333300000','165,84100000000000000000','0,75533333333333300000','0,86266666666666700000','727,00633333333300000000','0,18333333333333300000','0,82700000000000000000','NA','','','Tr','Tr','Tr','Tr','27,69000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','596','Pupunha, cozida','54,46000000000000000000','218,53388087660100000000','914,34575758769700000000','2,52291666666667000000','12,76166666666670000000','NA','29,56941666666670000000','4,25333333333333000000','0,68600000000000000000','27,58633333333330000000','25,28933333333330000000','0,12666666666666700000','48,77400000000000000000','0,51866666666666700000','0,90866666666666700000','303,35533333333300000000','0,28233333333333300000','0,29166666666666700000','NA','875,44444444444400000000','437,72222222222200000000','Tr','0,08666666666666670000','0,03000000000000000000','Tr','2,18000000000000000000','28/05/18 21:22','28/05/18 21:22'),
+('Nozes e sementes','597','Noz, crua','6,24466666666667000000','620,06001979056700000000','2594,33112280373000000000','13,97080050277710000000','59,35966666666670000000','NA','18,36386616388960000000','7,24966666666667000000','2,06100000000000000000','105,30633333333300000000','152,89066666666700000000','4,05266666666667000000','396,27666666666700000000','2,03500000000000000000','4,57066666666667000000','533,25500000000000000000','0,75433333333333300000','2,06433333333333000000','NA','','','0,37666666666666700000','Tr','0,13000000000000000000','1,08333333333333000000','Tr','28/05/18 21:22','28/05/18 21:22');
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Conversor único das planilhas TACO (CSV separado por ';') para SQL
+Lê cada CSV linha a linha e grava INSERTs de várias linhas em lotes, a partir da
+especificação de colunas de cada tabela (TACO_TABLES). Também carrega as linhas direto
+em um banco SQLite (executemany, uma transação) ou grava TSV no formato do COPY do PostgreSQL.
+Com --typed, as colunas numéricas são convertidas (TypedTacoTable) e gravadas como números e NULL.
+Com --wide, as três tabelas são convertidas em paralelo e unidas por numeroAlimento em uma tabela larga
+"""
+
+import heapq
+import os
+import sqlite3
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Conversão numérica compartilhada com os extratores IBGE
+sys.path.insert(0, os.path.join(os.path.dirname(BASE_DIR), 'IBGE'))
+from ibge_numeric import NULL_TOKENS, DecimalParser  # noqa: E402
+
+# Na TACO, '*' marca valor não analisado; os demais marcadores (NA, Tr, vazio) são os dos extratores IBGE
+TACO_NULL_TOKENS = NULL_TOKENS | {'*'}
+
+
+class TacoDecimalParser(DecimalParser):
+    """DecimalParser em que qualquer campo com '*' (ex.: '0,5*') é ausente, não um número com ruído"""
+
+    def _parse_slow(self, token) -> Optional[float]:
+        if isinstance(token, str) and '*' in token:
+            return self.default
+        return super()._parse_slow(token)
+
+
+# Marcadores e campos com '*' viram None (ausência)
+TACO_PARSER = TacoDecimalParser(null_tokens=TACO_NULL_TOKENS, default=None)
+
+# Colunas que não são medidas numéricas; numeroAlimento é inteiro e o resto é float
+TEXT_COLUMNS = frozenset(['categoria', 'descricaoAlimento', 'created_at', 'updated_at'])
+INTEGER_COLUMNS = frozenset(['numeroAlimento'])
+
+# Linhas por INSERT
+DEFAULT_BATCH_SIZE = 500
+
+# Tabela larga: uma linha por alimento com as colunas das três tabelas TACO
+WIDE_TABLE = 'alimentosTaco3'
+# Ordem das tabelas na junção: a primeira com a linha do alimento fornece categoria e descrição
+WIDE_TABLE_KEYS = ('CMVCol', 'AG', 'Aminoacidos')
+
+
+@dataclass(frozen=True)
+class TacoTable:
+    """Tabela TACO: CSV de origem, arquivo SQL gerado e colunas na ordem do CSV (sem o id automático)"""
+    name: str
+    csv_file: str
+    sql_file: str
+    columns: Tuple[str, ...]
+
+    @property
+    def csv_path(self) -> str:
+        return os.path.join(BASE_DIR, self.csv_file)
+
+    @property
+    def sql_path(self) -> str:
+        return os.path.join(BASE_DIR, self.sql_file)
+
+    @property
+    def typed_sql_file(self) -> str:
+        """SQL tipado (--typed), gravado à parte para não substituir os INSERTs texto versionados"""
+        return os.path.splitext(self.sql_file)[0] + '_typed.sql'
+
+    @property
+    def tsv_file(self) -> str:
+        return f"copy_{self.name}.tsv"
+
+    @property
+    def numeric_columns(self) -> Tuple[str, ...]:
+        return tuple(column for column in self.columns
+                     if column not in TEXT_COLUMNS and column not in INTEGER_COLUMNS)
+
+
+TACO_TABLES = {
+    'AG': TacoTable(
+        name='AGtaco3',
+        csv_file='taco_AG.csv',
+        sql_file='insert_AGtaco3.sql',
+        columns=('categoria', 'numeroAlimento', 'descricaoAlimento', 'saturados', 'monoinsaturados',
+                 'poliinsaturados', '12_0', '14_0', '16_0', '18_0', '20_0', '22_0', '24_0', '14_1', '16_1',
+                 '18_1', '20_1', '18_2N_6', '18_3N_3', '20_4', '20_5', '22_5', '22_6', '18_1t', '18_2t',
+                 'created_at', 'updated_at')
+    ),
+    'Aminoacidos': TacoTable(
+        name='Aminoacidostaco3',
+        csv_file='taco_Aminoacidos.csv',
+        sql_file='insert_Aminoacidostaco3.sql',
+        columns=('numeroAlimento', 'descricaoAlimento', 'triptofano', 'treonina', 'isoleucina', 'leucina',
+                 'lisina', 'metionina', 'cistina', 'fenilalanina', 'tirosina', 'valina', 'arginina',
+                 'histidina', 'alanina', 'acidoAspartico', 'acidoClutamico', 'glicina', 'prolina', 'serina',
+                 'created_at', 'updated_at')
+    ),
+    'CMVCol': TacoTable(
+        name='CMVColtaco3',
+        csv_file='taco_CMVCol.csv',
+        sql_file='insert_CMVColtaco3.sql',
+        columns=('categoria', 'numeroAlimento', 'descricaoAlimento', 'umidade', 'energiaKcal', 'energiaKj',
+                 'proteina', 'lipideos', 'colesterol', 'carboidrato', 'fibraAlimentar', 'cinzas', 'calcio',
+                 'magnesio', 'manganes', 'fosforo', 'ferro', 'sodio', 'potassio', 'cobre', 'zinco', 'retinol',
+                 're', 'rae', 'tiamina', 'riboflavina', 'piridoxina', 'niacina', 'vitaminaC',
+                 'created_at', 'updated_at')
+    ),
+}
+
+
+def iter_csv_rows(table: TacoTable, csv_path: Optional[str] = None) -> Iterator[List[str]]:
+    """Campos de cada linha do CSV, lidos sob demanda; linhas em branco são ignoradas"""
+    with open(csv_path or table.csv_path, 'r', encoding='utf-8') as file:
+        for number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            fields = line.split(';')
+            if len(fields) != len(table.columns):
+                raise ValueError(f"{table.csv_file}, linha {number}: {len(fields)} campos para "
+                                 f"{len(table.columns)} colunas")
+            yield fields
+
+
+def iter_batches(rows: Iterator[Sequence], batch_size: int) -> Iterator[List[Sequence]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class TypedTacoTable:
+    """Linhas de uma tabela TACO em colunas tipadas: cada coluna numérica é um array('d') e as
+    ausências ficam em um bitmap por coluna (1 bit por linha), não em strings"""
+
+    def __init__(self, table: TacoTable):
+        self.table = table
+        self.row_count = 0
+        self.numeric_columns = table.numeric_columns
+        self.numeric_positions = [table.columns.index(column) for column in self.numeric_columns]
+        self.values: Dict[str, array] = {column: array('d') for column in self.numeric_columns}
+        self.null_bitmaps: Dict[str, bytearray] = {column: bytearray() for column in self.numeric_columns}
+        self.integers: Dict[str, array] = {column: array('q') for column in table.columns if column in INTEGER_COLUMNS}
+        self.texts: Dict[str, List[str]] = {column: [] for column in table.columns if column in TEXT_COLUMNS}
+
+    @classmethod
+    def from_csv(cls, table: TacoTable, csv_path: Optional[str] = None) -> "TypedTacoTable":
+        typed = cls(table)
+        for fields in iter_csv_rows(table, csv_path):
+            typed.append(fields)
+        return typed
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def append(self, fields: Sequence[str]):
+        row = self.row_count
+        byte, bit = row >> 3, 1 << (row & 7)
+        if bit == 1:
+            for bitmap in self.null_bitmaps.values():
+                bitmap.append(0)
+
+        parsed = TACO_PARSER.parse_row([fields[position] for position in self.numeric_positions])
+        for column, value in zip(self.numeric_columns, parsed):
+            if value is None:
+                self.values[column].append(0.0)
+                self.null_bitmaps[column][byte] |= bit
+            else:
+                self.values[column].append(value)
+
+        for column, values in self.integers.items():
+            values.append(int(fields[self.table.columns.index(column)]))
+        for column, values in self.texts.items():
+            values.append(fields[self.table.columns.index(column)])
+        self.row_count += 1
+
+    def is_null(self, row: int, column: str) -> bool:
+        return bool(self.null_bitmaps[column][row >> 3] & (1 << (row & 7)))
+
+    def null_count(self, column: str) -> int:
+        return sum(byte.bit_count() for byte in self.null_bitmaps[column])
+
+    def get(self, row: int, column: str) -> Any:
+        """Valor tipado (float, int ou str), ou None quando ausente"""
+        if column in self.values:
+            return None if self.is_null(row, column) else self.values[column][row]
+        if column in self.integers:
+            return self.integers[column][row]
+        return self.texts[column][row]
+
+    def row(self, row: int) -> Tuple[Any, ...]:
+        return tuple(self.get(row, column) for column in self.table.columns)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return (self.row(row) for row in range(self.row_count))
+
+    def iter_sorted(self, column: str = 'numeroAlimento') -> Iterator[Tuple[int, int]]:
+        """Pares (chave, linha) em ordem de chave; chaves repetidas são um erro do CSV"""
+        keys = self.integers[column]
+        previous = None
+        for row in sorted(range(self.row_count), key=keys.__getitem__):
+            if keys[row] == previous:
+                raise ValueError(f"{self.table.name}: {column} repetido ({previous})")
+            previous = keys[row]
+            yield previous, row
+
+
+def read_typed_table(key: str) -> TypedTacoTable:
+    """Tarefa de um worker: lê e converte uma tabela TACO inteira"""
+    return TypedTacoTable.from_csv(TACO_TABLES[key])
+
+
+def read_typed_tables(keys: Sequence[str], workers: Optional[int] = None) -> List[TypedTacoTable]:
+    """Converte as tabelas em processos separados, uma tabela por worker"""
+    with ProcessPoolExecutor(max_workers=workers or len(keys)) as executor:
+        return list(executor.map(read_typed_table, keys))
+
+
+def wide_columns(tables: Sequence[TypedTacoTable]) -> Tuple[str, ...]:
+    columns = ('numeroAlimento', 'categoria', 'descricaoAlimento')
+    for typed in tables:
+        columns += typed.numeric_columns
+    if len(set(columns)) != len(columns):
+        raise ValueError("Colunas numéricas repetidas entre as tabelas TACO")
+    return columns
+
+
+def tag_sorted_rows(typed: TypedTacoTable, position: int) -> Iterator[Tuple[int, int, int]]:
+    for key, row in typed.iter_sorted():
+        yield key, position, row
+
+
+def merge_wide_rows(tables: Sequence[TypedTacoTable]) -> Iterator[Tuple[Any, ...]]:
+    """Junção sort-merge (externa completa) por numeroAlimento: cada tabela é ordenada uma vez e
+    as sequências são intercaladas; colunas de tabelas sem a linha do alimento ficam None"""
+    streams = [tag_sorted_rows(typed, position) for position, typed in enumerate(tables)]
+    current = None
+    matched: Dict[int, int] = {}
+    for key, position, row in heapq.merge(*streams):
+        if key != current:
+            if current is not None:
+                yield wide_row(tables, current, matched)
+            current, matched = key, {}
+        matched[position] = row
+    if current is not None:
+        yield wide_row(tables, current, matched)
+
+
+def wide_row(tables: Sequence[TypedTacoTable], key: int, matched: Dict[int, int]) -> Tuple[Any, ...]:
+    category = description = None
+    values: List[Any] = []
+    for position, typed in enumerate(tables):
+        row = matched.get(position)
+        if row is None:
+            values.extend([None] * len(typed.numeric_columns))
+            continue
+        if category is None and 'categoria' in typed.texts:
+            category = typed.texts['categoria'][row]
+        if description is None:
+            description = typed.texts['descricaoAlimento'][row]
+        values.extend(typed.get(row, column) for column in typed.numeric_columns)
+    return (key, category, description, *values)
+
+
+def sql_literal(value: Any) -> str:
+    """Texto entre aspas; no modo tipado, números sem aspas e None como NULL"""
+    if value is None:
+        return 'NULL'
+    if not isinstance(value, str):
+        return repr(value)
+    return "'" + value.replace("'", "''") + "'"
+
+
+def insert_header(table: TacoTable) -> str:
+    """INSERT INTO ... VALUES; nomes entre crases (ex.: `12_0`), aceitos por MySQL e SQLite"""
+    return f"INSERT INTO `{table.name}` ({', '.join(f'`{column}`' for column in table.columns)}) VALUES\n"
+
+
+def print_progress(table: TacoTable, batch_number: int, batch_rows: int, total: int):
+    print(f"{table.name}: lote {batch_number} com {batch_rows} linhas ({total} no total)")
+
+
+def write_insert_sql(table: TacoTable, batch_size: int = DEFAULT_BATCH_SIZE, csv_path: Optional[str] = None,
+                     sql_path: Optional[str] = None,
+                     progress: Optional[Callable[[TacoTable, int, int, int], None]] = print_progress,
+                     typed: bool = False) -> int:
+    """Grava o SQL da tabela em INSERTs de até batch_size linhas; devolve o total de linhas.
+    typed grava números sem aspas e ausências como NULL, precedidos do CREATE TABLE tipado (MySQL)"""
+    if batch_size < 1:
+        raise ValueError(f"batch_size deve ser positivo, não {batch_size}")
+
+    header = insert_header(table)
+    total = 0
+    if typed:
+        rows = iter(TypedTacoTable.from_csv(table, csv_path))
+        default_path = os.path.join(BASE_DIR, table.typed_sql_file)
+    else:
+        rows = iter_csv_rows(table, csv_path)
+        default_path = table.sql_path
+    with open(sql_path or default_path, 'w', encoding='utf-8') as file:
+        if typed:
+            # createTabela_*.sql declara tudo VARCHAR NOT NULL, que não aceita os NULLs
+            file.write(f"DROP TABLE IF EXISTS `{table.name}`;\n")
+            file.write(create_table_sql(table, '`id` INT NOT NULL AUTO_INCREMENT PRIMARY KEY', 'DOUBLE', '`') + ';\n')
+        for batch_number, batch in enumerate(iter_batches(rows, batch_size), 1):
+            values = ',\n'.join('(' + ','.join(map(sql_literal, row)) + ')' for row in batch)
+            file.write(header + values + ';\n')
+            total += len(batch)
+            if progress:
+                progress(table, batch_number, len(batch), total)
+    return total
+
+
+def quoted_columns(table: TacoTable) -> str:
+    """Colunas entre aspas duplas (SQLite e PostgreSQL)"""
+    return ', '.join(f'"{column}"' for column in table.columns)
+
+
+def column_type(column: str, float_type: str) -> str:
+    """Tipo da coluna no modo tipado (float_type: REAL no SQLite, DOUBLE PRECISION no PostgreSQL, DOUBLE no MySQL)"""
+    if column in TEXT_COLUMNS:
+        return 'TEXT NOT NULL'
+    return 'INTEGER NOT NULL' if column in INTEGER_COLUMNS else float_type
+
+
+def create_table_sql(table: TacoTable, id_column: str, float_type: Optional[str] = None, quote: str = '"') -> str:
+    """CREATE TABLE com as colunas texto de createTabela_*.sql ou, com float_type, tipadas; id_column varia com o banco"""
+    columns = ', '.join(f'{quote}{column}{quote} {column_type(column, float_type) if float_type else "TEXT NOT NULL"}'
+                        for column in table.columns)
+    return f'CREATE TABLE IF NOT EXISTS {quote}{table.name}{quote} ({id_column}, {columns})'
+
+
+def load_sqlite(db_path: str, keys: Sequence[str], typed: bool = False) -> int:
+    """Carrega as tabelas direto no SQLite: executemany parametrizado, todas em uma única transação.
+    Tabelas existentes são recriadas. typed grava números como REAL/INTEGER e ausências como NULL."""
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    total = 0
+    try:
+        conn.execute('BEGIN')
+        for key in keys:
+            table = TACO_TABLES[key]
+            conn.execute(f'DROP TABLE IF EXISTS "{table.name}"')
+            conn.execute(create_table_sql(table, 'id INTEGER PRIMARY KEY AUTOINCREMENT', 'REAL' if typed else None))
+            cursor = conn.executemany(
+                f'INSERT INTO "{table.name}" ({quoted_columns(table)}) '
+                f'VALUES ({", ".join("?" * len(table.columns))})',
+                TypedTacoTable.from_csv(table) if typed else iter_csv_rows(table))
+            print(f"** {table.name}: {cursor.rowcount} linhas carregadas em {db_path} **")
+            total += cursor.rowcount
+        conn.execute('COMMIT')
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+    return total
+
+
+def load_wide_sqlite(db_path: str, keys: Sequence[str] = WIDE_TABLE_KEYS, workers: Optional[int] = None) -> int:
+    """Converte as tabelas em paralelo e grava a junção em uma tabela larga com numeroAlimento como
+    chave primária: a leitura de um alimento é uma única busca de linha"""
+    tables = read_typed_tables(keys, workers)
+    columns = wide_columns(tables)
+    definitions = ', '.join(
+        '"numeroAlimento" INTEGER PRIMARY KEY' if column == 'numeroAlimento'
+        else f'"{column}" TEXT' if column in TEXT_COLUMNS else f'"{column}" REAL'
+        for column in columns)
+    column_list = ', '.join(f'"{column}"' for column in columns)
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute('BEGIN')
+        conn.execute(f'DROP TABLE IF EXISTS "{WIDE_TABLE}"')
+        conn.execute(f'CREATE TABLE "{WIDE_TABLE}" ({definitions})')
+        cursor = conn.executemany(
+            f'INSERT INTO "{WIDE_TABLE}" ({column_list}) VALUES ({", ".join("?" * len(columns))})',
+            merge_wide_rows(tables))
+        conn.execute('COMMIT')
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+    print(f"** {WIDE_TABLE}: {cursor.rowcount} alimentos ({len(columns)} colunas) em {db_path} **")
+    return cursor.rowcount
+
+
+def copy_escape(value: Any) -> str:
+    """Campo no formato texto do COPY: barra invertida, tabulação e quebras de linha escapadas; None é \\N"""
+    if value is None:
+        return '\\N'
+    if not isinstance(value, str):
+        return repr(value)
+    return (value.replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def write_copy_tsv(table: TacoTable, tsv_path: Optional[str] = None, typed: bool = False) -> int:
+    """Grava as linhas em TSV para COPY ... FROM (formato texto padrão do PostgreSQL)"""
+    total = 0
+    rows = TypedTacoTable.from_csv(table) if typed else iter_csv_rows(table)
+    with open(tsv_path or os.path.join(BASE_DIR, table.tsv_file), 'w', encoding='utf-8', newline='\n') as file:
+        for row in rows:
+            file.write('\t'.join(map(copy_escape, row)) + '\n')
+            total += 1
+    return total
+
+
+def write_copy_files(keys: Sequence[str], script_file: str = 'copy_taco3.sql', typed: bool = False) -> int:
+    """TSV de cada tabela e um script psql que cria as tabelas e carrega os TSV com \\copy"""
+    total = 0
+    commands = []
+    for key in keys:
+        table = TACO_TABLES[key]
+        rows = write_copy_tsv(table, typed=typed)
+        print(f"** {table.name}: {rows} linhas gravadas em {table.tsv_file} **")
+        total += rows
+        commands.append(create_table_sql(table, 'id SERIAL PRIMARY KEY', 'DOUBLE PRECISION' if typed else None) + ';')
+        commands.append(f'\\copy "{table.name}" ({quoted_columns(table)}) FROM \'{table.tsv_file}\'')
+
+    with open(os.path.join(BASE_DIR, script_file), 'w', encoding='utf-8') as file:
+        file.write('-- Execute com: psql -d BANCO -f ' + script_file + ' (no diretório dos arquivos TSV)\n')
+        file.write('\n'.join(commands) + '\n')
+    print(f"Script psql: {script_file}")
+    return total
+
+
+def convert_tables(keys: Sequence[str], batch_size: int = DEFAULT_BATCH_SIZE, typed: bool = False) -> int:
+    total = 0
+    for key in keys:
+        table = TACO_TABLES[key]
+        rows = write_insert_sql(table, batch_size, typed=typed)
+        print(f"** {table.name}: {rows} linhas gravadas em {table.typed_sql_file if typed else table.sql_file} **")
+        total += rows
+    return total
+
+
+USAGE = ("Uso: taco_converter.py [AG|Aminoacidos|CMVCol ...] "
+         "[--batch-size N | --sqlite BANCO.db | --copy | --wide BANCO.db] [--typed]")
+
+
+def main():
+    """Função principal (opções em USAGE)"""
+    args = sys.argv[1:]
+    options = {}
+    for option, has_value in (('--batch-size', True), ('--sqlite', True), ('--copy', False), ('--typed', False),
+                              ('--wide', True)):
+        if option in args:
+            position = args.index(option)
+            if has_value and position + 1 >= len(args):
+                print(f"{option} precisa de um valor\n{USAGE}")
+                sys.exit(1)
+            options[option] = args[position + 1] if has_value else True
+            del args[position:position + (2 if has_value else 1)]
+
+    unknown = [key for key in args if key not in TACO_TABLES]
+    if unknown:
+        print(f"Tabelas desconhecidas: {', '.join(unknown)} (use {', '.join(TACO_TABLES)})")
+        sys.exit(1)
+
+    keys = args or list(TACO_TABLES)
+    typed = '--typed' in options
+    if '--wide' in options:
+        load_wide_sqlite(options['--wide'], [key for key in WIDE_TABLE_KEYS if key in keys])
+    elif '--sqlite' in options:
+        load_sqlite(options['--sqlite'], keys, typed)
+    elif '--copy' in options:
+        write_copy_files(keys, typed=typed)
+    else:
+        convert_tables(keys, int(options.get('--batch-size', DEFAULT_BATCH_SIZE)), typed)
+    print('** FINALIZADO! Favor, verifique o arquivo. **')
+
+
+if __name__ == "__main__":
+    main()
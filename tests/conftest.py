@@ -0,0 +1,22 @@
+"""
+Configuração dos testes: os módulos de IBGE/ e tacoSQL/ são scripts soltos (sem pacote),
+então as duas pastas entram no sys.path
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+for folder in ("IBGE", "tacoSQL"):
+    sys.path.insert(0, str(ROOT / folder))
+
+
+@pytest.fixture
+def sample_db(tmp_path):
+    """Base SQLite com a amostra IBGE_FOODS_SAMPLE, gatilhos e índices já criados"""
+    from create_ibge_foods_db import IBGEFoodsDatabase
+    db_path = str(tmp_path / "alimentos_ibge.db")
+    IBGEFoodsDatabase(db_path).update_database()
+    return db_path
@@ -0,0 +1,42 @@
+import json
+
+from ibge_dataset_diff import apply_diff, diff_datasets, iter_output_foods
+
+OLD = [
+    {"id": 7000, "codigo": "IBGE1_1", "nome": "Arroz", "energia_kcal": 128.0, "sodio_mg": 1.0},
+    {"id": 7001, "codigo": "IBGE2_1", "nome": "Feijão", "energia_kcal": 76.0},
+    {"id": 7002, "codigo": "IBGE3_1", "nome": "Leite", "energia_kcal": 61.0},
+]
+NEW = [
+    {"id": 7000, "codigo": "IBGE1_1", "nome": "Arroz", "energia_kcal": 130.0},
+    {"id": 7001, "codigo": "IBGE3_1", "nome": "Leite", "energia_kcal": 61.0},
+    {"id": 7002, "codigo": "IBGE4_1", "nome": "Ovo", "energia_kcal": 146.0},
+]
+
+
+def test_diff_reports_changes_and_ignores_positional_id():
+    diff = diff_datasets(OLD, NEW)
+    assert [food['codigo'] for food in diff.adicionados] == ["IBGE4_1"]
+    assert diff.removidos == ["IBGE2_1"]
+    assert diff.inalterados == 1
+    [change] = diff.alterados
+    assert change.codigo == "IBGE1_1"
+    assert change.campos == {"energia_kcal": 130.0}
+    assert change.deltas == {"energia_kcal": 2.0}
+    assert change.campos_removidos == ["sodio_mg"]
+
+
+def test_apply_diff_rebuilds_new_dataset():
+    changeset = json.loads(json.dumps(diff_datasets(OLD, NEW).to_dict()))
+    result = apply_diff(OLD, changeset)
+    expected = {food['codigo']: food for food in NEW}
+    assert result.keys() == expected.keys()
+    for code, food in result.items():
+        assert {k: v for k, v in food.items() if k != 'id'} == {k: v for k, v in expected[code].items() if k != 'id'}
+
+
+def test_identical_datasets_give_empty_diff(tmp_path):
+    path = tmp_path / 'foods.ndjson'
+    path.write_text('\n'.join(json.dumps(food) for food in OLD) + '\n' + json.dumps({"metadata": {}}) + '\n')
+    assert list(iter_output_foods(str(path))) == OLD
+    assert diff_datasets(OLD, iter_output_foods(str(path))).is_empty
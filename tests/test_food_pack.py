@@ -0,0 +1,42 @@
+import pytest
+
+from ibge_food_pack import FoodPack, write_food_pack
+from ibge_food_key import pack_food_key
+
+COLUMNS = ('energia_kcal', 'proteina_g')
+ROWS = [
+    (pack_food_key(6300101, 2), 'Arroz polido', 'Frito', 'Cereais', [150.5, 2.7]),
+    (pack_food_key(6300101, 1), 'Arroz polido', 'Cozido', 'Cereais', [128.0, 2.52]),
+    (pack_food_key(7101101, 0), 'Pão de queijo', '', 'Panificados', [363.0, 5.1]),
+]
+
+
+@pytest.mark.parametrize('dtype', ['d', 'f'])
+def test_round_trip(tmp_path, dtype):
+    path = str(tmp_path / 'foods.pack')
+    assert write_food_pack(path, COLUMNS, ROWS, dtype) == len(ROWS)
+
+    with FoodPack(path) as pack:
+        assert len(pack) == 3
+        assert pack.columns == COLUMNS
+        assert pack.dtype == dtype
+        food = pack.get(6300101, 1)
+        assert food['name'] == 'Arroz polido'
+        assert food['preparation'] == 'Cozido'
+        assert food['group'] == 'Cereais'
+        assert food['nutrients'] == pytest.approx({'energia_kcal': 128.0, 'proteina_g': 2.52})
+        assert pack.get(7101101, 0)['name'] == 'Pão de queijo'
+        assert pack.find_row(6300101, 2) == 0
+        assert pack.get(1, 1) is None
+        assert pack.value(2, 'proteina_g') == pytest.approx(5.1)
+
+
+def test_rejects_wrong_width_and_truncated_files(tmp_path):
+    path = tmp_path / 'foods.pack'
+    with pytest.raises(ValueError):
+        write_food_pack(str(path), COLUMNS, [(1, 'x', '', '', [1.0])])
+
+    write_food_pack(str(path), COLUMNS, ROWS)
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError):
+        FoodPack(str(path))
@@ -0,0 +1,35 @@
+import sqlite3
+
+from ibge_food_repository import FoodRepository, LRUCache
+
+
+def test_lru_cache_keeps_none_values():
+    cache = LRUCache(maxsize=2)
+    cache.put('k', None)
+    assert cache.get('k', 'ausente') is None
+    assert cache.get('outra', 'ausente') == 'ausente'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_write_from_another_connection_invalidates_cache(sample_db):
+    with FoodRepository(sample_db) as repository:
+        assert repository.get(10001, 0)['name'] == "Açúcar cristal"
+        assert repository.get(10001, 0)['name'] == "Açúcar cristal"
+        assert repository.cache.hits == 1
+
+        writer = sqlite3.connect(sample_db)
+        writer.execute("UPDATE foods SET name = 'Açúcar refinado' WHERE code = 10001")
+        writer.commit()
+        writer.close()
+
+        # PRAGMA data_version mudou: o resultado em cache é descartado e a consulta vai à base
+        assert repository.get(10001, 0)['name'] == "Açúcar refinado"
+        assert len(repository.cache) == 1
+
+
+def test_unchanged_database_is_served_from_cache(sample_db):
+    with FoodRepository(sample_db) as repository:
+        first = repository.by_group("Frutas")
+        assert [food['name'] for food in first][0] == "Banana prata"
+        assert repository.by_group("Frutas") is first
+        assert repository.get(99999, 0) is None
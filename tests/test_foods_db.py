@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+from create_ibge_foods_db import FOOD_COLUMNS, IBGEFoodsDatabase, sample_foods
+
+
+def food_group_stats(conn):
+    # Grupos que ficam vazios mantêm uma linha zerada; o recálculo completo só traz grupos com alimentos
+    return conn.execute("SELECT * FROM food_group_stats WHERE food_count > 0 ORDER BY group_key").fetchall()
+
+
+def foods_ranges(conn):
+    return conn.execute("SELECT * FROM foods_ranges ORDER BY id").fetchall()
+
+
+def assert_matches_rebuild(db, conn):
+    """As tabelas mantidas pelos gatilhos devem ser iguais às recalculadas do zero"""
+    stats, ranges = food_group_stats(conn), foods_ranges(conn)
+    db.rebuild_group_stats(conn)
+    db.rebuild_range_index(conn)
+    assert stats == [pytest.approx(row) for row in food_group_stats(conn)]
+    assert ranges == foods_ranges(conn)
+    assert conn.execute("SELECT COUNT(*) FROM foods_search").fetchone() == conn.execute(
+        "SELECT COUNT(*) FROM foods").fetchone()
+
+
+def test_triggers_follow_insert_or_replace_and_delete(sample_db):
+    db = IBGEFoodsDatabase(sample_db)
+    conn = db.connect()
+    columns = ', '.join(FOOD_COLUMNS[:5] + ('energy_kcal', 'protein_g', 'lipids_g', 'carbohydrates_g', 'sodium_mg'))
+    cereals = conn.execute("SELECT id FROM food_groups WHERE name = 'Cereais'").fetchone()[0]
+    fruits = conn.execute("SELECT id FROM food_groups WHERE name = 'Frutas'").fetchone()[0]
+
+    # Substitui um alimento existente (muda de grupo e de valores) e insere um novo
+    conn.execute(f"INSERT OR REPLACE INTO foods ({columns}) VALUES (20001, 0, 'Arroz', NULL, ?, 999, 50, 0, 1, 3)",
+                 (fruits,))
+    conn.execute(f"INSERT OR REPLACE INTO foods ({columns}) VALUES (20099, 0, 'Quinoa', NULL, ?, 1, NULL, 0, 2, 4)",
+                 (cereals,))
+    # Remove o extremo (máximo de energia) de um grupo
+    conn.execute("DELETE FROM foods WHERE code = 20003")
+    conn.commit()
+
+    assert_matches_rebuild(db, conn)
+    conn.close()
+
+
+def test_update_database_skips_unchanged_foods(sample_db):
+    db = IBGEFoodsDatabase(sample_db)
+    assert db.update_database() == 0
+
+    foods = sample_foods()
+    foods[0].nutrients["proteina_g"] = 1.0
+    assert db.update_database(foods) == 1
+
+    conn = db.connect()
+    assert conn.execute("SELECT protein_g FROM foods WHERE code = ?", (foods[0].code,)).fetchone() == (1.0,)
+    assert conn.execute("SELECT COUNT(*) FROM foods").fetchone() == (len(foods),)
+    assert_matches_rebuild(db, conn)
+    conn.close()
+
+
+def test_update_database_rebuilds_old_schema(tmp_path):
+    db_path = str(tmp_path / "antiga.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE foods (id INTEGER PRIMARY KEY, code INTEGER UNIQUE, name TEXT)")
+    conn.commit()
+    conn.close()
+
+    db = IBGEFoodsDatabase(db_path)
+    assert db.update_database() == len(sample_foods())
+    assert db.update_database() == 0
@@ -0,0 +1,45 @@
+from array import array
+
+import pytest
+
+from ibge_numeric import DECIMAL_PARSER, DecimalParser
+from taco_converter import TACO_PARSER
+
+
+def test_parse_comma_decimals():
+    assert DECIMAL_PARSER.parse('12,50') == 12.5
+    assert DECIMAL_PARSER.parse('0,05') == 0.05
+    assert DECIMAL_PARSER.parse('-1,5') == -1.5
+    assert DECIMAL_PARSER.parse('3') == 3.0
+
+
+@pytest.mark.parametrize('token', ['Tr', 'tr', '-', 'nd', 'NA', 'n.d.', '', '  Tr  '])
+def test_null_tokens_use_default(token):
+    assert DECIMAL_PARSER.parse(token) == 0.0
+    assert DecimalParser(default=None).parse(token) is None
+
+
+def test_noisy_and_invalid_tokens():
+    assert DECIMAL_PARSER.parse('12,5*') == 12.5
+    assert DECIMAL_PARSER.parse('abc') == 0.0
+    assert DECIMAL_PARSER.parse('inf') == 0.0
+    assert DECIMAL_PARSER.parse(None) == 0.0
+
+
+def test_parse_row_fast_and_slow_paths():
+    assert DECIMAL_PARSER.parse_row(['1,5', '2', '0,25']) == [1.5, 2.0, 0.25]
+    assert DECIMAL_PARSER.parse_row(['1,5', 'Tr', '-', '7,0']) == [1.5, 0.0, 0.0, 7.0]
+    # Um token com espaço interno não pode deslocar os valores seguintes
+    assert DECIMAL_PARSER.parse_row(['1 2', '3']) == [12.0, 3.0]
+
+
+def test_fill_row_writes_at_offset():
+    row = array('d', [0.0] * 4)
+    assert DECIMAL_PARSER.fill_row(['1,5', 'Tr'], row, offset=1) == 2
+    assert row.tolist() == [0.0, 1.5, 0.0, 0.0]
+    with pytest.raises(IndexError):
+        DECIMAL_PARSER.fill_row(['1', '2', '3'], row, offset=2)
+
+
+def test_taco_parser_treats_asterisk_as_missing():
+    assert TACO_PARSER.parse_row(['1,5', '*', '0,5*', 'Tr', 'NA', '']) == [1.5, None, None, None, None, None]
@@ -0,0 +1,66 @@
+import copy
+import pickle
+
+import pytest
+
+from ibge_nutrient_matrix import NutrientMatrix, NutrientRowView
+
+COLUMNS = ('energia_kcal', 'proteina_g', 'ferro_mg')
+
+
+@pytest.fixture
+def matrix():
+    matrix = NutrientMatrix(COLUMNS)
+    for values in ([128.0, 2.5, 0.0], [0.0, 0.0, 1.2], [52.0, 0.0, 0.0]):
+        matrix.write_row(matrix.add_row(), range(matrix.width), values)
+    return matrix
+
+
+def test_view_reads_and_writes_the_matrix(matrix):
+    view = matrix.view(0)
+    assert view.proteina_g == 2.5
+    view.proteina_g = 3.0
+    assert matrix.get(0, 'proteina_g') == 3.0
+    assert view.as_dict() == {'energia_kcal': 128.0, 'proteina_g': 3.0, 'ferro_mg': 0.0}
+    with pytest.raises(AttributeError):
+        view.sodio_mg
+    with pytest.raises(AttributeError):
+        view.sodio_mg = 1.0
+
+
+def test_columns_and_counts(matrix):
+    assert matrix.column('energia_kcal').tolist() == [128.0, 0.0, 52.0]
+    assert matrix.column('energia_kcal', rows=[2, 0]).tolist() == [52.0, 128.0]
+    assert matrix.count_positive(('energia_kcal',)) == 2
+    assert matrix.count_positive(('proteina_g', 'ferro_mg')) == 2
+    assert matrix.count_positive(('proteina_g', 'ferro_mg'), rows=[0]) == 1
+    matrix.derive_column('ferro_mg', 'energia_kcal', 0.5)
+    assert matrix.column('ferro_mg').tolist() == [64.0, 0.0, 26.0]
+
+
+def test_equality_is_by_value(matrix):
+    other = NutrientMatrix(COLUMNS)
+    other.write_row(other.add_row(), range(other.width), matrix.row_list(0))
+    assert matrix.view(0) == other.view(0)
+    assert matrix.view(0) != matrix.view(1)
+    assert matrix.view(0) != matrix.row_values(0)
+    with pytest.raises(TypeError):
+        hash(matrix.view(0))
+
+
+def test_copy_shares_row_and_deepcopy_detaches(matrix):
+    shallow = copy.copy(matrix.view(1))
+    assert shallow.matrix is matrix and shallow.row == 1
+
+    deep = copy.deepcopy(matrix.view(1))
+    assert deep == matrix.view(1)
+    assert len(deep.matrix) == 1
+    deep.ferro_mg = 9.0
+    assert matrix.get(1, 'ferro_mg') == 1.2
+
+
+def test_pickle_keeps_one_matrix_per_list(matrix):
+    views = pickle.loads(pickle.dumps([matrix.view(row) for row in range(len(matrix))]))
+    assert [view.as_dict() for view in views] == [matrix.row_values(row) for row in range(len(matrix))]
+    assert views[0].matrix is views[2].matrix
+    assert isinstance(views[0], NutrientRowView)
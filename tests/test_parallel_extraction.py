@@ -0,0 +1,53 @@
+import functools
+from pathlib import Path
+
+import pytest
+
+import ibge_extractor_expanded
+import ibge_extractor_fixed
+from ibge_extractor_complete import IBGECompleteExtractor
+from ibge_page_source import IBGEPageSource
+
+# PDF da POF 2008-2009; sem ele os testes deste módulo são pulados
+IBGE_PDF = Path(__file__).resolve().parent.parent / "taco-ibge-extractor/src/main/resources/META-INF/resources/taco/liv50002.pdf"
+
+pytestmark = pytest.mark.skipif(not IBGE_PDF.exists(), reason="PDF da POF 2008-2009 ausente")
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Cache de texto descartável, usado também pelas fontes de página que os extratores criam"""
+    path = str(tmp_path / "cache.sqlite")
+    page_source = functools.partial(IBGEPageSource, cache_path=path)
+    monkeypatch.setattr(ibge_extractor_fixed, "IBGEPageSource", page_source)
+    monkeypatch.setattr(ibge_extractor_expanded, "IBGEPageSource", page_source)
+    return path
+
+
+def extract_complete(cache_path, workers):
+    extractor = IBGECompleteExtractor(str(IBGE_PDF))
+    extractor.page_source.cache_path = cache_path
+    foods = extractor.extract_all_data(workers=workers)
+    return [(food.code, food.preparation_code, food.name, food.preparation, food.group, food.nutrients.as_dict())
+            for food in foods]
+
+
+def extract_fixed(cache_path, workers):
+    extractor = ibge_extractor_fixed.IBGEFixedExtractor()
+    extractor.pdf_path = str(IBGE_PDF)
+    foods = extractor.process_fixed_extraction(workers=workers)
+    return [(food.code, food.preparation_code, food.name, food.preparation, food.group, food.nutrients.as_dict())
+            for food in foods]
+
+
+def extract_expanded(cache_path, workers):
+    foods = ibge_extractor_expanded.IBGEExpandedExtractor(str(IBGE_PDF)).process_expanded_ranges(workers=workers)
+    return [(food.code, food.preparation_code, food.name, food.preparation, food.group, food.nutrients)
+            for food in foods]
+
+
+@pytest.mark.parametrize("extract", [extract_complete, extract_fixed, extract_expanded])
+def test_parallel_matches_serial(cache_path, extract):
+    serial = extract(cache_path, workers=1)
+    assert len(serial) > 1800
+    assert extract(cache_path, workers=4) == serial
@@ -0,0 +1,32 @@
+from ibge_line_filter import LineFilterStats
+from ibge_numeric import DECIMAL_PARSER
+from ibge_table_schema import TableSchema
+
+SCHEMA = TableSchema(name='Teste', columns=('energia_kcal', None, 'proteina_g'), creates_foods=True)
+
+PAGE = """Tabela 1 - Composição nutricional
+Código Descrição Preparação Energia Umidade Proteína
+6300101 Arroz polido 1 Cozido 128 69,1 2,52
+6300101 Arroz polido 2 Frito 150,5 - 2,7
+Fonte: IBGE
+1234567 Total sem valores
+"""
+
+
+def test_parse_page_maps_declared_columns():
+    stats = LineFilterStats()
+    rows = SCHEMA.parse_page(PAGE, DECIMAL_PARSER.parse_row, stats)
+    assert rows == [
+        (6300101, 'Arroz polido', 1, 'Cozido', [128.0, 2.52]),
+        (6300101, 'Arroz polido', 2, 'Frito', [150.5, 2.7]),
+    ]
+    assert SCHEMA.fields == ('energia_kcal', 'proteina_g')
+    assert stats.matched == 2
+    assert stats.pattern_rejected == 1
+    assert stats.lines == len(PAGE.split('\n'))
+
+
+def test_parse_page_skips_lines_with_missing_columns():
+    rows = SCHEMA.parse_page("6300101 Arroz polido 1 Cozido 128 69,1\n", DECIMAL_PARSER.parse_row,
+                             LineFilterStats())
+    assert rows == []
@@ -0,0 +1,103 @@
+import shutil
+import sqlite3
+import sys
+
+import pytest
+
+import taco_converter
+from taco_converter import (TACO_TABLES, WIDE_TABLE, TypedTacoTable, load_sqlite, load_wide_sqlite,
+                            write_copy_files, write_insert_sql)
+
+# Linha 82 do CMVCol (Alho, cru): vitaminaC '*', riboflavina 'Tr', retinol 'NA' e re vazio
+ALHO = 82
+
+
+@pytest.fixture
+def taco_dir(tmp_path, monkeypatch):
+    """Cópia dos CSV em um diretório temporário: as saídas não tocam os arquivos versionados"""
+    for table in TACO_TABLES.values():
+        shutil.copy(table.csv_path, tmp_path / table.csv_file)
+    monkeypatch.setattr(taco_converter, "BASE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_typed_table_keeps_nulls_in_bitmaps(taco_dir):
+    typed = TypedTacoTable.from_csv(TACO_TABLES['CMVCol'])
+    assert len(typed) == 597
+    row = next(row for key, row in typed.iter_sorted() if key == ALHO)
+    assert typed.get(row, 'descricaoAlimento') == 'Alho, cru'
+    assert typed.get(row, 'numeroAlimento') == ALHO
+    assert typed.get(row, 'energiaKcal') == pytest.approx(113.12987826087)
+    assert typed.get(row, 'vitaminaC') is None
+    assert typed.get(row, 'riboflavina') is None
+    assert typed.get(row, 'retinol') is None
+    assert typed.get(row, 're') is None
+    assert typed.get(row, 'tiamina') == pytest.approx(0.183333333333333)
+    assert typed.null_count('colesterol') == sum(typed.is_null(r, 'colesterol') for r in range(len(typed)))
+
+
+def test_typed_insert_sql(taco_dir):
+    sql_path = taco_dir / "insert_typed.sql"
+    assert write_insert_sql(TACO_TABLES['CMVCol'], batch_size=100, sql_path=str(sql_path),
+                            progress=None, typed=True) == 597
+    sql = sql_path.read_text(encoding='utf-8')
+    assert sql.startswith("DROP TABLE IF EXISTS `CMVColtaco3`;\nCREATE TABLE IF NOT EXISTS `CMVColtaco3`")
+    assert "`energiaKcal` DOUBLE" in sql
+    assert sql.count("INSERT INTO `CMVColtaco3`") == 6
+    alho = next(line for line in sql.splitlines() if "'Alho, cru'" in line)
+    assert alho.startswith("('Verduras, hortaliças e derivados',82,'Alho, cru',67.5466666666667,")
+    assert alho.count('NULL') == 7
+
+
+def test_text_insert_sql_is_unchanged_by_typed_mode(taco_dir):
+    sql_path = taco_dir / "insert.sql"
+    write_insert_sql(TACO_TABLES['Aminoacidos'], sql_path=str(sql_path), progress=None)
+    assert "('56','Pastel, de carne, frito','0,1183050267'," in sql_path.read_text(encoding='utf-8')
+
+
+def test_sqlite_load(taco_dir):
+    db_path = str(taco_dir / "taco.db")
+    assert load_sqlite(db_path, ['CMVCol', 'Aminoacidos'], typed=True) == 597 + 26
+    conn = sqlite3.connect(db_path)
+    assert conn.execute('SELECT typeof("numeroAlimento"), typeof("energiaKcal"), "vitaminaC" '
+                        'FROM "CMVColtaco3" WHERE "numeroAlimento" = ?', (ALHO,)).fetchone() == (
+                            'integer', 'real', None)
+    conn.close()
+
+    # Sem --typed as tabelas são recriadas com os campos como texto
+    assert load_sqlite(db_path, ['CMVCol']) == 597
+    conn = sqlite3.connect(db_path)
+    assert conn.execute('SELECT "vitaminaC" FROM "CMVColtaco3" WHERE "numeroAlimento" = ?',
+                        (str(ALHO),)).fetchone() == ('*',)
+    conn.close()
+
+
+def test_copy_files(taco_dir):
+    assert write_copy_files(['AG', 'Aminoacidos'], typed=True) == 423 + 26
+    script = (taco_dir / "copy_taco3.sql").read_text(encoding='utf-8')
+    assert '\\copy "AGtaco3"' in script and '\\copy "Aminoacidostaco3"' in script
+    assert '"saturados" DOUBLE PRECISION' in script
+    first = (taco_dir / TACO_TABLES['AG'].tsv_file).read_text(encoding='utf-8').splitlines()[0].split('\t')
+    assert first[:4] == ['Cereais e derivados', '1', 'Arroz, integral, cozido', '0.3']
+    assert first[6] == '\\N'
+
+
+def test_wide_table_joins_by_food_number(taco_dir):
+    db_path = str(taco_dir / "taco.db")
+    assert load_wide_sqlite(db_path, workers=2) == 597
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    pastel = conn.execute(f'SELECT * FROM "{WIDE_TABLE}" WHERE "numeroAlimento" = 56').fetchone()
+    assert pastel['triptofano'] == pytest.approx(0.1183050267)
+    assert pastel['energiaKcal'] is not None
+    alho = conn.execute(f'SELECT * FROM "{WIDE_TABLE}" WHERE "numeroAlimento" = ?', (ALHO,)).fetchone()
+    assert alho['descricaoAlimento'] == 'Alho, cru'
+    assert alho['triptofano'] is None
+    conn.close()
+
+
+def test_option_without_value_is_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["taco_converter.py", "--sqlite"])
+    with pytest.raises(SystemExit):
+        taco_converter.main()
+    assert "--sqlite precisa de um valor" in capsys.readouterr().out